@@ -1,10 +1,170 @@
 import traceback
 
 import regex
-from typing import Any, Self, Sequence
+from typing import Any, Callable, Self, Sequence
 from types import UnionType
 import time
 
+CACHE_DIR = ".cache"
+# Options (besides templates and parameters) that the generated code depends on, part of every cache key
+CACHE_SALT = ""
+
+# Templates read by the cached generations in progress, with the hashes of their content
+_dependencies: list[dict[str, str]] = []
+_file_hashes: dict[str, str] = {}
+
+
+def _hash(text: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(text.encode("utf8")).hexdigest()
+
+
+def _file_hash(path: str) -> str:
+    # Files don't change during a run
+    if path not in _file_hashes:
+        try:
+            with open(path, encoding="utf8") as f:
+                _file_hashes[path] = _hash(f.read())
+        except FileNotFoundError:
+            _file_hashes[path] = ""
+    return _file_hashes[path]
+
+
+def _generator_hash() -> str:
+    # Changing the generators themselves invalidates every cached result
+    import glob
+
+    return _hash("".join(_file_hash(path) for path in sorted(glob.glob("*.py"))))
+
+
+def read_template(template_file: str) -> str:
+    """Read a template, recording it as a dependency of the cached generations in progress."""
+    path = f"templates/{template_file}"
+    with open(path, encoding="utf8") as f:
+        template = f.read()
+    if _dependencies:
+        _dependencies[-1][path] = _file_hash(path)
+    return template
+
+
+def _cache_path(key) -> str:
+    import os
+
+    return os.path.join(
+        CACHE_DIR, _hash(repr((CACHE_SALT, _generator_hash(), key))) + ".json"
+    )
+
+
+def _cache_load(key) -> tuple[Any, dict[str, str]] | None:
+    import json
+    import os
+
+    path = _cache_path(key)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf8") as f:
+        entry = json.load(f)
+    if any(_file_hash(dep) != h for dep, h in entry["dependencies"].items()):
+        return None
+    return entry["result"], entry["dependencies"]
+
+
+def _cache_store(key, result, dependencies: dict[str, str]):
+    import json
+    import os
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(_cache_path(key), "w", encoding="utf8") as f:
+        json.dump({"dependencies": dependencies, "result": result}, f)
+
+
+def _add_dependencies(dependencies: dict[str, str]):
+    if _dependencies:
+        _dependencies[-1].update(dependencies)
+
+
+def cached(key, generate: Callable[[], Any]) -> Any:
+    """Return the result of `generate()`, reusing the result of the last call with the same key
+    if none of the templates it read have changed since."""
+    if (hit := _cache_load(key)) is not None:
+        result, dependencies = hit
+        _add_dependencies(dependencies)
+        return result
+
+    _dependencies.append({})
+    try:
+        result = generate()
+    finally:
+        dependencies = _dependencies.pop()
+    _add_dependencies(dependencies)
+    _cache_store(key, result, dependencies)
+    return result
+
+
+def _cached_call_worker(
+    func: Callable, args: tuple, salt: str
+) -> tuple[Any, dict[str, str]]:
+    global CACHE_SALT
+    CACHE_SALT = salt
+    _dependencies.append({})
+    try:
+        result = cached((func.__module__, func.__qualname__, args), lambda: func(*args))
+    finally:
+        dependencies = _dependencies.pop()
+    return result, dependencies
+
+
+def parallel_cached_map(
+    func: Callable,
+    args_list: Sequence[tuple],
+    initializer: Callable = None,
+    initargs: tuple = (),
+) -> list:
+    """`[func(*args) for args in args_list]` with every call cached, the uncached calls are run in a process pool.
+
+    `initializer(*initargs)` is called in every worker process, to pass on the state the generation depends on.
+    """
+    results = [None] * len(args_list)
+    missing = []
+    for i, args in enumerate(args_list):
+        if (hit := _cache_load((func.__module__, func.__qualname__, args))) is not None:
+            results[i], dependencies = hit
+            _add_dependencies(dependencies)
+        else:
+            missing.append(i)
+
+    if len(missing) == 1:
+        results[missing[0]], dependencies = _cached_call_worker(
+            func, args_list[missing[0]], CACHE_SALT
+        )
+        _add_dependencies(dependencies)
+    elif missing:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(initializer=initializer, initargs=initargs) as pool:
+            futures = {
+                i: pool.submit(_cached_call_worker, func, args_list[i], CACHE_SALT)
+                for i in missing
+            }
+            for i, future in futures.items():
+                results[i], dependencies = future.result()
+                _add_dependencies(dependencies)
+    return results
+
+
+def write_output(output_file: str, text: str):
+    """Write a file to the output directory, leaving it untouched (so that it isn't rebuilt) if nothing changed."""
+    import os
+
+    path = f"output/{output_file}"
+    if os.path.exists(path):
+        with open(path, encoding="utf8") as f:
+            if f.read() == text:
+                return
+    with open(path, "w", encoding="utf8") as output:
+        output.write(text)
+
 
 def from_template(template: str, params: dict[str, Any] = None, _globals=None) -> str:
     def apply_params(in_line: str) -> str:
@@ -151,6 +311,7 @@ class _Overload:
         self.name = name
         self._funcs: list[_Func] = []
         self._possible_param_types_cache = None
+        self.vectorcall = False
 
     def add(self, func: _Func):
         if len(self._funcs) > 0:
@@ -289,7 +450,7 @@ class _Overload:
         text += '")'
         return text
 
-    def _gen_type_cast(self, var_name: str, var_types: tuple):
+    def _gen_type_cast(self, var_name: str, var_types: tuple, c_type: str):
         multiple_type_err = "A branch should have only one general(cast-able) type!"
         if float in var_types and int in var_types:  # py_float
             assert len(var_types) == 2, multiple_type_err
@@ -298,6 +459,9 @@ class _Overload:
             return f"PyFloat_AsDouble({var_name})"
         elif int in var_types:  # py_int
             assert len(var_types) == 1, multiple_type_err
+            if c_type == "int":
+                # Range checked, a C int parameter would silently truncate a long long
+                return f"py_long_as_int({var_name})"
             return f"PyLong_AsLongLong({var_name})"
         else:
             assert len(var_types) == 1, multiple_type_err
@@ -327,7 +491,7 @@ class _Overload:
             out = [
                 f"{'self.' if self.is_method else ''}"
                 f"{func.name}"
-                f"({', '.join(self._gen_type_cast(pn, pts) for pts,pn in zip(params_types, self.param_names) if pn != 'self' and None not in pts)})"
+                f"({', '.join(self._gen_type_cast(pn, pts, ct) for pts,pn,ct in zip(params_types, self.param_names, func.c_params) if pn != 'self' and None not in pts)})"
             ]
             if func.ret is None:
                 out.append("return")
@@ -355,8 +519,12 @@ class _Overload:
                 else:
                     branches.append([t])
 
-            # Prioritize py_float and py_int branches
-            branches.sort(key=lambda ts: 0 if int in ts or float in ts else 1)
+            # Prioritize py_float and py_int branches, the catch-all object branch goes last
+            branches.sort(
+                key=lambda ts: (
+                    0 if int in ts or float in ts else 2 if "object" in ts else 1
+                )
+            )
 
             any_hit = False
             for i, t in enumerate(branches):
@@ -385,6 +553,74 @@ class _Overload:
 
             return out, any_hit
 
+    @staticmethod
+    def _exact_type_check_expression(*types):
+        out = []
+        for t in types:
+            if t is float:
+                out.append("PyFloat_CheckExact({value})")
+            elif t is int:
+                out.append("PyLong_CheckExact({value})")
+            elif t is None:
+                out.append("{value} is None")
+            elif type(t) is str:
+                out.append(f"type({{value}}) is {t}")
+            else:
+                assert False
+        if len(out) == 1:
+            return out[0]
+        return f"({' or '.join(out)})"
+
+    def _gen_exact_dispatch_tree(self, params_types: tuple = None) -> Sequence[str]:
+        """Generate the exact-type fast path dispatch tree recursively.
+
+        Only exact types are matched (a pointer comparison on the type), branches without a match fall
+        through to the subclass-aware dispatch tree instead of raising.
+        """
+        if params_types is None:
+            params_types = ((Self,),) if self._funcs[0].params[0] is Self else ()
+        params_first_types = tuple(ps[0] for ps in params_types)
+
+        if len(params_types) == self.max_params:
+            funcs = self._func_from_params(params_first_types)
+            if len(funcs) != 1:
+                return []
+            out, _ = self._gen_dispatch_tree(params_types)
+            return out
+
+        if len(self._func_from_params(params_first_types)) == 0:
+            return []
+
+        # Same branching as the general tree, but the catch-all object type can't be matched exactly
+        branches = []
+        for t in self.possible_param_types[len(params_types)]:
+            if t == "object":
+                continue
+            matches = self._func_from_params(params_first_types + (t,))
+            if len(matches) == 0:
+                continue
+            for branch in branches:
+                if set(matches) == set(
+                    self._func_from_params(params_first_types + (branch[0],))
+                ):
+                    branch.append(t)
+                    break
+            else:
+                branches.append([t])
+        branches.sort(key=lambda ts: 0 if int in ts or float in ts else 1)
+
+        out = []
+        for t in branches:
+            dt = self._gen_exact_dispatch_tree(params_types + (tuple(t),))
+            if len(dt) == 0:
+                continue
+            out.append(
+                f"{'if' if len(out) == 0 else 'elif'} "
+                f"{self._exact_type_check_expression(*t).format(value=self.param_names[len(params_types)])}:"
+            )
+            out += [f"    {l}" for l in dt]
+        return out
+
     def gen_dispatcher(self) -> Sequence[str]:
         params = self.param_names
         param_strs = []
@@ -397,15 +633,61 @@ class _Overload:
                 else:
                     param_strs.append(param)
 
-        ret_types = list(set(_Overload._type_str(f.ret) for f in self._funcs))
+        # Deduplicated in declaration order, so that the output is reproducible
+        ret_types = list(dict.fromkeys(_Overload._type_str(f.ret) for f in self._funcs))
 
-        lines = [
-            f"def {self.name}({', '.join(('object ' if i > 0 else '') + p for i,p in enumerate(param_strs))}, /) -> {' | '.join(ret_types)}:"
-        ]
+        lines = []
+        if self.vectorcall:
+            # The dispatch tree goes into a cdef method shared with the vectorcall constructor
+            lines.append(
+                f"cdef inline object {self.dispatch_name}({', '.join(('object ' if i > 0 else '') + p for i,p in enumerate(params))}):"
+            )
+        else:
+            lines.append(
+                f"def {self.name}({', '.join(('object ' if i > 0 else '') + p for i,p in enumerate(param_strs))}, /) -> {' | '.join(ret_types)}:"
+            )
+        # Exact types first, they only cost a pointer comparison each
+        lines += [f"    {dl}" for dl in self._gen_exact_dispatch_tree()]
         disp_lines, _ = self._gen_dispatch_tree()
         lines += [f"    {dl}" for dl in disp_lines]
+
+        if self.vectorcall:
+            lines += [
+                "",
+                f"def {self.name}({', '.join(('object ' if i > 0 else '') + p for i,p in enumerate(param_strs))}, /) -> {' | '.join(ret_types)}:",
+                f"    {'return ' if ret_types != ['None'] else ''}self.{self.dispatch_name}({', '.join(params[1:])})",
+            ]
         return lines
 
+    @property
+    def dispatch_name(self) -> str:
+        return f"_{self.name}_dispatch"
+
+    def gen_vectorcall(self, class_name: str) -> Sequence[str]:
+        """Generate a vectorcall constructor, calling `class_name(...)` allocates and dispatches directly to the
+        `__init__` overloads, without packing an argument tuple and running `tp_init`.
+        """
+        assert self.is_method and self.name == "__init__"
+        params = self.param_names[1:]
+        required = sum(1 for ts in self.possible_param_types[1:] if None not in ts)
+        func_name = f"_{class_name}_vectorcall"
+        args = ", ".join(
+            f"<object> args[{i}] if nargs > {i} else None" for i in range(len(params))
+        )
+        return [
+            f"cdef object {func_name}(PyObject* cls, PyObject** args, size_t nargsf, PyObject* kwnames):",
+            "    cdef Py_ssize_t nargs = PyVectorcall_NARGS(nargsf)",
+            "    if kwnames != NULL and len(<tuple> kwnames) != 0:",
+            f'        raise TypeError("{class_name}() takes no keyword arguments")',
+            f"    if {f'nargs < {required} or ' if required > 0 else ''}nargs > {len(params)}:",
+            f'        raise TypeError(f"{class_name}() takes from {required} to {len(params)} positional arguments but {{nargs}} were given")',
+            f"    cdef {class_name} self = {class_name}.__new__({class_name})",
+            f"    self.{self.dispatch_name}({args})",
+            "    return self",
+            "",
+            f"(<PyVectorcallTypeObject*> {class_name}).tp_vectorcall = <vectorcallfunc> {func_name}",
+        ]
+
 
 def process_overloads(file: str) -> str:
     import regex
@@ -447,6 +729,16 @@ def process_overloads(file: str) -> str:
 
     lines = [line for line in lines if "<OVERLOAD>" not in line]
 
+    for i, line in enumerate(lines):
+        if "<OVERLOAD_VECTORCALL>:" in line:
+            m = regex.match(
+                r"(?P<prefix>\s*)#(?:\s|#)*<OVERLOAD_VECTORCALL>:(?P<name>\w+):(?P<class_name>\w+)",
+                line,
+            )
+            assert m is not None
+            assert m.group("name") in overloads
+            overloads[m.group("name")].vectorcall = True
+
     while True:
         for i, line in enumerate(lines):
             if "<OVERLOAD_DISPATCHER>:" in line:
@@ -462,6 +754,17 @@ def process_overloads(file: str) -> str:
                 disp_lines = [prefix + disp_line for disp_line in disp_lines]
                 lines[i : i + 1] = disp_lines
                 break
+            if "<OVERLOAD_VECTORCALL>:" in line:
+                m = regex.match(
+                    r"(?P<prefix>\s*)#(?:\s|#)*<OVERLOAD_VECTORCALL>:(?P<name>\w+):(?P<class_name>\w+)",
+                    line,
+                )
+                prefix = m.group("prefix")
+                vc_lines = overloads[m.group("name")].gen_vectorcall(
+                    m.group("class_name")
+                )
+                lines[i : i + 1] = [prefix + vc_line for vc_line in vc_lines]
+                break
         else:
             break
 
@@ -486,40 +789,58 @@ def step_generate(
     if not os.path.exists("output"):
         os.mkdir("output")
 
-    template = open(f"templates/{template_file}", encoding="utf8").read()
+    def generate() -> str:
+        template = read_template(template_file)
+        if _globals is not None:
+            old_globals = globals().copy()
+            globals().update(_globals)
+        result = from_template(template, params)
+        if _globals is not None:
+            globals().clear()
+            # noinspection PyUnboundLocalVariable
+            globals().update(old_globals)
+        for i, line in enumerate(result.splitlines(keepends=False)):
+            if "<ERR>" in line:
+                raise Exception(f"Unresolved generation error in line {i+1}: {line}")
+        if overload:
+            result = process_overloads(result)
+        return result
+
     t = time.perf_counter()
-    if _globals is not None:
-        old_globals = globals().copy()
-        globals().update(_globals)
-    result = from_template(template, params)
-    if _globals is not None:
-        globals().clear()
-        # noinspection PyUnboundLocalVariable
-        globals().update(old_globals)
-    for i, line in enumerate(result.splitlines(keepends=False)):
-        if "<ERR>" in line:
-            raise Exception(f"Unresolved generation error in line {i+1}: {line}")
-    if overload:
-        result = process_overloads(result)
+    result = cached(
+        ("step_generate", template_file, params, _globals is not None, overload),
+        generate,
+    )
     print(f"Step Generate: {template_file} completed in {time.perf_counter() - t:.3f}s")
     if write_file:
-        with open(f"output/{output_file}", "w", encoding="utf8") as output:
-            output.write(result)
+        write_output(output_file, result)
     else:
         return result
 
 
-def step_gen_stub(source_file: str, output_file: str):
+def step_gen_stub(source: str, output_file: str):
     import stub_generator
 
-    source = open(f"output/{source_file}", encoding="utf8").read()
     t = time.perf_counter()
-    result = stub_generator.gen_stub(source)
-    print(
-        f"Step Gen Stub: {source_file} -> {output_file} completed in {time.perf_counter() - t:.3f}s"
+    result = cached(
+        ("step_gen_stub", _hash(source)), lambda: stub_generator.gen_stub(source)
     )
-    with open(f"output/{output_file}", "w", encoding="utf8") as output:
-        output.write(result)
+    print(f"Step Gen Stub: {output_file} completed in {time.perf_counter() - t:.3f}s")
+    write_output(output_file, result)
+
+
+def step_gen_pxd(source: str, output_file: str) -> str:
+    """Generate the pxd of a module, and return the module source with the attribute declarations
+    (that are in the pxd only) removed."""
+    import pxd_generator
+
+    t = time.perf_counter()
+    result, source = cached(
+        ("step_gen_pxd", _hash(source)), lambda: pxd_generator.gen_pxd(source)
+    )
+    print(f"Step Gen Pxd: {output_file} completed in {time.perf_counter() - t:.3f}s")
+    write_output(output_file, result)
+    return source
 
 
 def step_cythonize(file: str):
@@ -541,6 +862,7 @@ def step_cythonize(file: str):
 
 
 def step_move_to_dest(final_dest: str, file_prefix: str, file_suffix: str):
+    import filecmp
     import os
     import shutil
 
@@ -548,5 +870,8 @@ def step_move_to_dest(final_dest: str, file_prefix: str, file_suffix: str):
         if file.startswith(file_prefix) and file.endswith(file_suffix):
             path = os.path.join("output", file)
             dest = os.path.join(final_dest, file)
+            # Unchanged files are left untouched so that they aren't rebuilt
+            if os.path.exists(dest) and filecmp.cmp(path, dest, shallow=False):
+                continue
             shutil.copy(path, dest)
             print(f"Coping {file} to {dest}")
@@ -1,22 +1,40 @@
 import codegen_helper as codegen
 
+# The extension modules, each built separately
+MODULES = ("_vector", "_vector_int", "_transform", "_spatial", "_expr", "_loaders")
+# The modules whose extension types are cimported by the other modules
+CIMPORTED_MODULES = ("_vector", "_vector_int", "_transform")
+
 
 def main():
+    import sys
     import vector_codegen
 
-    codegen.step_generate(
-        "_spatium.pyx",
-        write_file=True,
-        _globals={vector_codegen.__name__: vector_codegen},
-    )
-    codegen.step_gen_stub("_spatium.pyx", "_spatium.pyi")
-
-    import sys
+    # Slim build: only compile the hot swizzles (or the given ones), the rest are resolved on first use
+    if "--slim" in sys.argv:
+        vector_codegen.SWIZZLE_SET = set(vector_codegen.HOT_SWIZZLES)
+    for arg in sys.argv:
+        if arg.startswith("--swizzles="):
+            vector_codegen.SWIZZLE_SET = set(arg.removeprefix("--swizzles=").split(","))
+
+    swizzle_set = vector_codegen.SWIZZLE_SET
+    codegen.CACHE_SALT = repr(None if swizzle_set is None else sorted(swizzle_set))
+
+    codegen.step_generate("_common.pxd", write_file=True)
+    for module in MODULES:
+        source = codegen.step_generate(
+            f"{module}.pyx",
+            _globals={vector_codegen.__name__: vector_codegen},
+        )
+        codegen.step_gen_stub(source, f"{module}.pyi")
+        if module in CIMPORTED_MODULES:
+            source = codegen.step_gen_pxd(source, f"{module}.pxd")
+        codegen.write_output(f"{module}.pyx", source)
 
     if "--install" in sys.argv:
         print("#" * 15 + " Install " + "#" * 15)
-        codegen.step_move_to_dest("../src/spatium/", "_spatium", ".pyx")
-        codegen.step_move_to_dest("../src/spatium/", "_spatium", ".pyi")
+        for suffix in (".pyx", ".pxd", ".pyi"):
+            codegen.step_move_to_dest("../src/spatium/", "_", suffix)
 
         import sys
         import subprocess
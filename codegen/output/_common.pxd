@@ -0,0 +1,9 @@
+# Types shared by the declarations of all modules
+
+ctypedef long long py_int
+ctypedef long double py_float
+
+ctypedef fused buffer_float:
+    float
+    double
+    py_float
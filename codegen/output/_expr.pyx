@@ -0,0 +1,550 @@
+#cython: language_level=3
+#cython: binding=False
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: nonecheck=False
+#cython: cdivision=True
+#cython: always_allow_keywords=True
+#cython: optimize.use_switch=True
+#cython: embedsignature=False
+
+cimport cython
+
+
+########## common_utils.pyx ##########
+from libc.math cimport fabsl, floorl, isfinite, INFINITY
+
+from cpython.float cimport PyFloat_CheckExact, PyFloat_AS_DOUBLE, PyFloat_Check, PyFloat_AsDouble
+from cpython.long cimport PyLong_CheckExact, PyLong_AsLongLong, PyLong_AsDouble, PyLong_Check
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free, PyMem_RawMalloc, PyMem_RawRealloc, PyMem_RawFree
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_SIMPLE, PyBUF_WRITABLE, PyBUF_C_CONTIGUOUS, PyObject_GetBuffer, PyBuffer_Release
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from cpython.bytearray cimport PyByteArray_FromStringAndSize, PyByteArray_AS_STRING
+from cpython.object cimport PyObject
+from cpython.pyport cimport PY_SSIZE_T_MAX
+from cpython.ref cimport Py_INCREF, Py_DECREF
+from cpython.pycapsule cimport PyCapsule_New, PyCapsule_IsValid, PyCapsule_GetPointer
+from libc.string cimport memcpy, memset, memcmp
+from libc.limits cimport INT_MIN, INT_MAX
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t, uint64_t
+from spatium._common cimport py_int, py_float, buffer_float
+
+import sys
+from array import array
+
+cdef extern from "Python.h":
+    # Constructing through the `tp_vectorcall` slot of a type skips the argument tuple and `tp_init`
+    ctypedef object (*vectorcallfunc)(PyObject* callable, PyObject** args, size_t nargsf, PyObject* kwnames)
+    ctypedef struct PyVectorcallTypeObject "PyTypeObject":
+        vectorcallfunc tp_vectorcall
+    Py_ssize_t PyVectorcall_NARGS(size_t nargsf)
+
+DEF DEFAULT_RELATIVE_TOLERANCE = 1e-09
+DEF DEFAULT_ABSOLUTE_TOLERANCE = 1e-15
+
+# Number of points kept hot in the cache by the tiled all-pairs loops
+DEF PAIRWISE_TILE_SIZE = 256
+# Maximum number of points in a k-d tree leaf
+DEF KDTREE_LEAF_SIZE = 8
+
+cdef inline bint is_close(py_float a, py_float b, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) noexcept:
+    cdef py_float diff = fabsl(a - b)
+    if a == b:
+        return True
+    if not isfinite(a) or not isfinite(b):
+        return False
+    return diff <= fabsl(rel_tol * a) or diff <= fabsl(rel_tol * b) or diff <= fabsl(abs_tol)
+
+cdef inline int py_long_as_int(object value) except? -1:
+    # Convert an int for the parameters of the int32 family, raising OverflowError outside of the C int range
+    cdef py_int result = PyLong_AsLongLong(value)
+    if not INT_MIN <= result <= INT_MAX:
+        raise OverflowError(f"Python int out of the C int range: {value}")
+    return <int> result
+
+
+cdef union _bitcaster:
+    double f
+    py_int i
+
+cdef inline py_int bitcast_float(py_float f) noexcept nogil:
+    # Bits of the value as a double, with -0.0 folded into 0.0 since they compare equal
+    return _bitcaster(f=(<double> f) + 0.0).i
+
+cdef inline uint64_t mix64(uint64_t x) noexcept nogil:
+    # The splitmix64 finalizer, every input bit affects every output bit
+    x ^= x >> 30
+    x *= 0xbf58476d1ce4e5b9ULL
+    x ^= x >> 27
+    x *= 0x94d049bb133111ebULL
+    x ^= x >> 31
+    return x
+
+cdef inline uint64_t hash_combine(uint64_t h, uint64_t value) noexcept nogil:
+    return mix64(h + value + 0x9e3779b97f4a7c15ULL)
+
+cdef inline py_int hash_finish(uint64_t h) noexcept nogil:
+    # -1 is reserved for errors by `__hash__()`, same as CPython's own hashes
+    return -2 if <py_int> h == -1 else <py_int> h
+
+
+cdef inline void export_buffer(Py_buffer* buffer, int flags, object obj, void* data, Py_ssize_t itemsize, char* format, int ndim, Py_ssize_t* shape, Py_ssize_t* strides) noexcept:
+    cdef Py_ssize_t length = itemsize
+    cdef int i
+    for i in range(ndim):
+        length *= shape[i]
+    buffer.buf = data
+    buffer.obj = obj
+    buffer.len = length
+    buffer.readonly = 0
+    buffer.itemsize = itemsize
+    buffer.format = format if flags & PyBUF_FORMAT == PyBUF_FORMAT else NULL
+    buffer.ndim = ndim
+    buffer.shape = shape if flags & PyBUF_ND == PyBUF_ND else NULL
+    buffer.strides = strides if flags & PyBUF_STRIDES == PyBUF_STRIDES else NULL
+    buffer.suboffsets = NULL
+    buffer.internal = NULL
+
+cdef struct IndexList:
+    # Growable list of indices that can be appended to without the GIL
+    Py_ssize_t* data
+    Py_ssize_t size
+    Py_ssize_t capacity
+    bint failed
+
+cdef inline void index_list_append(IndexList* lst, Py_ssize_t index) noexcept nogil:
+    cdef void* data
+    if lst.size == lst.capacity:
+        data = PyMem_RawRealloc(lst.data, max(16, lst.capacity * 2) * sizeof(Py_ssize_t))
+        if data == NULL:
+            lst.failed = True
+            return
+        lst.data = <Py_ssize_t*> data
+        lst.capacity = max(16, lst.capacity * 2)
+    lst.data[lst.size] = index
+    lst.size += 1
+
+cdef inline object new_scalar_array(str typecode, Py_ssize_t length):
+    return array(typecode, [0]) * length
+
+cdef inline str buffer_format(object obj):
+    return memoryview(obj).format.lstrip("@=")
+
+cdef inline object new_float_buffer(str typecode, Py_ssize_t rows, Py_ssize_t cols):
+    return memoryview(new_scalar_array(typecode, rows * cols)).cast("B").cast(typecode, (rows, cols))
+
+
+cdef packed struct PackHeader:
+    # Header of the blocks written by `pack_many()`, followed by `count` items in native byte order
+    char magic[4]
+    char format
+    unsigned char itemsize
+    unsigned short elements
+    uint64_t count
+
+cdef inline bytes new_pack_block(Py_ssize_t count, char format, Py_ssize_t itemsize, Py_ssize_t elements):
+    # The items of the returned block are left uninitialized for the caller to fill in
+    cdef bytes block = PyBytes_FromStringAndSize(NULL, sizeof(PackHeader) + count * elements * itemsize)
+    cdef PackHeader header
+    memcpy(header.magic, b"SPTM", 4)
+    header.format = format
+    header.itemsize = <unsigned char> itemsize
+    header.elements = <unsigned short> elements
+    header.count = count
+    memcpy(PyBytes_AS_STRING(block), &header, sizeof(PackHeader))
+    return block
+
+cdef inline char* pack_block_items(bytes block) noexcept:
+    return PyBytes_AS_STRING(block) + sizeof(PackHeader)
+
+cdef inline Py_ssize_t open_pack_block(object data, Py_buffer* view, char format, Py_ssize_t itemsize, Py_ssize_t elements, const char** items) except -1:
+    # Acquire the buffer of a block written by `pack_many()` and check its header, returns the number of items
+    PyObject_GetBuffer(data, view, PyBUF_SIMPLE)
+    cdef PackHeader header
+    try:
+        if view.len < <Py_ssize_t> sizeof(PackHeader):
+            raise ValueError(f"Packed block too short: {view.len} bytes")
+        memcpy(&header, view.buf, sizeof(PackHeader))
+        if memcmp(header.magic, b"SPTM", 4) != 0:
+            raise ValueError("Not a packed block")
+        if header.format != format or header.itemsize != itemsize or header.elements != elements:
+            raise ValueError(f"Packed items have {header.elements} elements of format {chr(header.format)!r} ({header.itemsize} bytes), "
+                             f"expected {elements} elements of format {chr(format)!r} ({itemsize} bytes)")
+        # Divided rather than multiplied, a forged count could overflow the size of the items
+        if (header.count > <uint64_t> (view.len - sizeof(PackHeader)) // (elements * itemsize)
+                or <uint64_t> (view.len - sizeof(PackHeader)) != header.count * elements * itemsize):
+            raise ValueError(f"Packed block size mismatch: {header.count} items in {view.len} bytes")
+    except:
+        PyBuffer_Release(view)
+        raise
+    items[0] = <const char*> view.buf + sizeof(PackHeader)
+    return <Py_ssize_t> header.count
+
+cdef inline Py_ssize_t open_raw_buffer(object data, Py_buffer* view, Py_ssize_t item_size) except -1:
+    # Acquire a buffer of whole items without a header, returns the number of items
+    PyObject_GetBuffer(data, view, PyBUF_SIMPLE)
+    if view.len % item_size != 0:
+        PyBuffer_Release(view)
+        raise ValueError(f"Expected a multiple of {item_size} bytes, got {view.len}")
+    return view.len // item_size
+
+cdef inline int read_bytes(object data, void* out, Py_ssize_t size) except -1:
+    # Copy exactly `size` bytes from a buffer, used by `from_bytes()`
+    cdef Py_buffer view
+    PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+    if view.len != size:
+        PyBuffer_Release(&view)
+        raise ValueError(f"Expected {size} bytes, got {view.len}")
+    memcpy(out, view.buf, size)
+    PyBuffer_Release(&view)
+    return 0
+
+
+# Byte order prefix of the native `struct` and numpy type strings
+NATIVE_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+cdef inline dict array_interface(void* data, char kind, Py_ssize_t itemsize, int ndim, Py_ssize_t* shape):
+    # Version 3 of numpy's `__array_interface__`, for C-contiguous writable numbers of `kind` ("f" or "i")
+    return {
+        "version": 3,
+        "shape": tuple([shape[i] for i in range(ndim)]),
+        "typestr": f"{NATIVE_BYTE_ORDER}{chr(kind)}{itemsize}",
+        "data": (<size_t> data, False),
+        "strides": None,
+    }
+
+cdef inline Py_ssize_t open_item_buffer(object data, Py_buffer* view, char kind, Py_ssize_t itemsize, Py_ssize_t elements) except -1:
+    # Acquire a writable C-contiguous buffer of items of `elements` numbers, returns the number of items.
+    # The numbers must be native `kind` ("f" or "i") numbers of `itemsize` bytes, or untyped bytes.
+    # Multidimensional buffers must have `elements` numbers per index of their first dimension.
+    PyObject_GetBuffer(data, view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS | PyBUF_FORMAT)
+    cdef str format = "B" if view.format == NULL else view.format.decode("ascii").lstrip("@=" + NATIVE_BYTE_ORDER)
+    cdef Py_ssize_t per_index = 1
+    cdef int i
+    try:
+        if format not in ("B", "c"):
+            if view.itemsize != itemsize or len(format) != 1 or format not in ("fdg" if kind == b"f" else "bhilqn"):
+                raise ValueError(f"Expected a buffer of {itemsize}-byte {'float' if kind == b'f' else 'signed integer'} numbers "
+                                 f"or untyped bytes, got format {format!r} ({view.itemsize} bytes)")
+            for i in range(1, view.ndim):
+                per_index *= view.shape[i]
+            if view.ndim > 1 and per_index != elements:
+                raise ValueError(f"Expected {elements} numbers per item, got shape {tuple([view.shape[i] for i in range(view.ndim)])}")
+        if view.len % (itemsize * elements) != 0:
+            raise ValueError(f"Expected a multiple of {itemsize * elements} bytes, got {view.len}")
+        if <size_t> view.buf % itemsize != 0:
+            raise ValueError(f"Buffer not aligned to {itemsize} bytes")
+    except:
+        PyBuffer_Release(view)
+        raise
+    return view.len // (itemsize * elements)
+
+
+# DLPack (https://dmlc.github.io/dlpack/latest/) ABI, for `__dlpack__()`
+DEF DLPACK_CPU = 1
+DEF DLPACK_INT = 0
+DEF DLPACK_FLOAT = 2
+DEF DLPACK_FLAG_IS_COPIED = 2
+
+cdef struct DLDevice:
+    int device_type
+    int device_id
+
+cdef struct DLDataType:
+    uint8_t code
+    uint8_t bits
+    uint16_t lanes
+
+cdef struct DLTensor:
+    void* data
+    DLDevice device
+    int ndim
+    DLDataType dtype
+    int64_t* shape
+    int64_t* strides
+    uint64_t byte_offset
+
+cdef struct DLManagedTensor:
+    DLTensor dl_tensor
+    void* manager_ctx
+    void (*deleter)(DLManagedTensor*) noexcept nogil
+
+cdef struct DLPackVersion:
+    uint32_t major
+    uint32_t minor
+
+cdef struct DLManagedTensorVersioned:
+    DLPackVersion version
+    void* manager_ctx
+    void (*deleter)(DLManagedTensorVersioned*) noexcept nogil
+    uint64_t flags
+    DLTensor dl_tensor
+
+cdef struct DLPackExport:
+    # One allocation for the tensor of either version and its shape, the `manager_ctx` of the tensor
+    DLManagedTensor tensor
+    DLManagedTensorVersioned versioned
+    PyObject* owner
+    int64_t[3] shape
+    int64_t[3] strides
+
+cdef void _dlpack_free(DLPackExport* export) noexcept nogil:
+    # Called by the consumer once it's done with the tensor, maybe without the GIL
+    with gil:
+        Py_DECREF(<object> export.owner)
+    PyMem_RawFree(export)
+
+cdef void _dlpack_deleter(DLManagedTensor* tensor) noexcept nogil:
+    _dlpack_free(<DLPackExport*> tensor.manager_ctx)
+
+cdef void _dlpack_versioned_deleter(DLManagedTensorVersioned* tensor) noexcept nogil:
+    _dlpack_free(<DLPackExport*> tensor.manager_ctx)
+
+cdef void _dlpack_capsule_destructor(object capsule) noexcept:
+    # A consumed capsule is renamed to "used_dltensor", and the consumer calls the deleter itself
+    cdef DLManagedTensor* tensor
+    if PyCapsule_IsValid(capsule, b"dltensor"):
+        tensor = <DLManagedTensor*> PyCapsule_GetPointer(capsule, b"dltensor")
+        tensor.deleter(tensor)
+
+cdef void _dlpack_versioned_capsule_destructor(object capsule) noexcept:
+    cdef DLManagedTensorVersioned* tensor
+    if PyCapsule_IsValid(capsule, b"dltensor_versioned"):
+        tensor = <DLManagedTensorVersioned*> PyCapsule_GetPointer(capsule, b"dltensor_versioned")
+        tensor.deleter(tensor)
+
+cdef inline tuple dlpack_device():
+    return DLPACK_CPU, 0
+
+cdef inline object export_dlpack(object owner, void* data, char kind, Py_ssize_t itemsize, int ndim, Py_ssize_t* shape, object stream, object max_version, object dl_device, object copy):
+    # Wrap C-contiguous numbers of `kind` ("f" or "i") in a DLPack capsule, which keeps `owner` alive until it's deleted.
+    # The capsule is of DLPack 1.0 if the consumer supports it (`max_version`), otherwise of the older unversioned ABI.
+    # `copy` follows the array API: always copy if True, never if False, and only when needed if None.
+    if stream is not None:
+        raise BufferError(f"Only stream=None is supported for CPU data, got {stream!r}")
+    if dl_device is not None and tuple(dl_device) != dlpack_device():
+        raise BufferError(f"Can't export to device {dl_device!r}, only to the CPU")
+    cdef Py_ssize_t count = 1
+    cdef int i
+    for i in range(ndim):
+        count *= shape[i]
+    cdef bint copied = False
+    cdef double* doubles
+    cdef Py_ssize_t j
+    if kind == b"f" and itemsize != sizeof(float) and itemsize != sizeof(double):
+        # DLPack has no long double type, so they're exported as a copy of doubles
+        if copy is not None and not copy:
+            raise BufferError(f"DLPack has no {itemsize * 8}-bit long double type, the numbers can only be exported as a copy of doubles")
+        owner = PyByteArray_FromStringAndSize(NULL, count * sizeof(double))
+        doubles = <double*> PyByteArray_AS_STRING(owner)
+        for j in range(count):
+            doubles[j] = <double> (<py_float*> data)[j]
+        data = doubles
+        itemsize = sizeof(double)
+        copied = True
+    elif copy:
+        owner = PyByteArray_FromStringAndSize(<char*> data, count * itemsize)
+        data = PyByteArray_AS_STRING(owner)
+        copied = True
+    cdef bint versioned = max_version is not None and tuple(max_version) >= (1, 0)
+    cdef DLPackExport* export = <DLPackExport*> PyMem_RawMalloc(sizeof(DLPackExport))
+    if export == NULL:
+        raise MemoryError()
+    cdef DLTensor* tensor = &export.versioned.dl_tensor if versioned else &export.tensor.dl_tensor
+    for i in reversed(range(ndim)):
+        export.shape[i] = shape[i]
+        export.strides[i] = 1 if i == ndim - 1 else export.strides[i + 1] * shape[i + 1]
+    tensor.data = data
+    tensor.device.device_type = DLPACK_CPU
+    tensor.device.device_id = 0
+    tensor.ndim = ndim
+    tensor.dtype.code = DLPACK_FLOAT if kind == b"f" else DLPACK_INT
+    tensor.dtype.bits = <uint8_t> (itemsize * 8)
+    tensor.dtype.lanes = 1
+    tensor.shape = export.shape
+    tensor.strides = export.strides
+    tensor.byte_offset = 0
+    Py_INCREF(owner)
+    export.owner = <PyObject*> owner
+    try:
+        if versioned:
+            export.versioned.version.major = 1
+            export.versioned.version.minor = 0
+            export.versioned.manager_ctx = export
+            export.versioned.deleter = _dlpack_versioned_deleter
+            export.versioned.flags = DLPACK_FLAG_IS_COPIED if copied else 0
+            return PyCapsule_New(&export.versioned, b"dltensor_versioned", _dlpack_versioned_capsule_destructor)
+        export.tensor.manager_ctx = export
+        export.tensor.deleter = _dlpack_deleter
+        return PyCapsule_New(&export.tensor, b"dltensor", _dlpack_capsule_destructor)
+    except:
+        _dlpack_free(export)
+        raise
+
+
+########## expr_vm.pyx ##########
+from libc.math cimport sqrtl
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_C_CONTIGUOUS, PyBUF_WRITABLE
+
+# Number of elements processed by each instruction of an expression program at a time,
+# so that the registers stay in the cache no matter how many elements are evaluated
+DEF EXPR_BLOCK_SIZE = 256
+
+# Opcodes of the expression programs, keep in sync with `spatium/expr.py`
+cdef enum:
+    EXPR_LOAD = 0
+    EXPR_CONST = 1
+    EXPR_ADD = 2
+    EXPR_SUB = 3
+    EXPR_MUL = 4
+    EXPR_DIV = 5
+    EXPR_NEG = 6
+    EXPR_SQRT = 7
+    EXPR_MULADD = 8
+    EXPR_STORE = 9
+
+cdef struct ExprBuffer:
+    char* data
+    Py_ssize_t row_stride  # 0 for inputs broadcast to every element
+    Py_ssize_t itemsize
+    char format
+
+cdef inline void _expr_load(ExprBuffer* b, Py_ssize_t start, Py_ssize_t count, Py_ssize_t col, py_float* dst) noexcept nogil:
+    cdef char* p = b.data + start * b.row_stride + col * b.itemsize
+    cdef Py_ssize_t j
+    if b.format == b"g":
+        for j in range(count):
+            dst[j] = (<py_float*> (p + j * b.row_stride))[0]
+    elif b.format == b"d":
+        for j in range(count):
+            dst[j] = (<double*> (p + j * b.row_stride))[0]
+    elif b.format == b"f":
+        for j in range(count):
+            dst[j] = (<float*> (p + j * b.row_stride))[0]
+    elif b.format == b"q":
+        for j in range(count):
+            dst[j] = (<long long*> (p + j * b.row_stride))[0]
+    elif b.format == b"l":
+        for j in range(count):
+            dst[j] = (<long*> (p + j * b.row_stride))[0]
+    elif b.format == b"i":
+        for j in range(count):
+            dst[j] = (<int*> (p + j * b.row_stride))[0]
+
+cdef inline void _expr_store(ExprBuffer* b, Py_ssize_t start, Py_ssize_t count, Py_ssize_t col, py_float* src) noexcept nogil:
+    cdef char* p = b.data + start * b.row_stride + col * b.itemsize
+    cdef Py_ssize_t j
+    if b.format == b"g":
+        for j in range(count):
+            (<py_float*> (p + j * b.row_stride))[0] = src[j]
+    elif b.format == b"d":
+        for j in range(count):
+            (<double*> (p + j * b.row_stride))[0] = <double> src[j]
+    elif b.format == b"f":
+        for j in range(count):
+            (<float*> (p + j * b.row_stride))[0] = <float> src[j]
+    # Only integer expressions are stored into integer outputs, so the values are already integers
+    elif b.format == b"q":
+        for j in range(count):
+            (<long long*> (p + j * b.row_stride))[0] = <long long> src[j]
+    elif b.format == b"l":
+        for j in range(count):
+            (<long*> (p + j * b.row_stride))[0] = <long> src[j]
+    elif b.format == b"i":
+        for j in range(count):
+            (<int*> (p + j * b.row_stride))[0] = <int> src[j]
+
+cdef inline int _expr_get_buffer(object obj, Py_buffer* view, ExprBuffer* b, bint broadcast, bint writable) except -1:
+    PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | (PyBUF_WRITABLE if writable else 0))
+    cdef str fmt = (<bytes> view.format).decode("ascii").lstrip("@=") if view.format != NULL else "B"
+    cdef Py_ssize_t itemsize = 0
+    if fmt == "g":
+        itemsize = sizeof(py_float)
+    elif fmt == "d":
+        itemsize = sizeof(double)
+    elif fmt == "f":
+        itemsize = sizeof(float)
+    elif fmt == "q":
+        itemsize = sizeof(long long)
+    elif fmt == "l":
+        itemsize = sizeof(long)
+    elif fmt == "i":
+        itemsize = sizeof(int)
+    if itemsize == 0 or itemsize != view.itemsize:
+        PyBuffer_Release(view)
+        raise TypeError(f"Unsupported {'output' if writable else 'input'} buffer format: {fmt!r}")
+    b.data = <char*> view.buf
+    b.itemsize = itemsize
+    b.format = ord(fmt)
+    b.row_stride = 0 if broadcast or view.ndim == 0 or view.shape[0] == 0 else view.len // view.shape[0]
+    return 0
+
+def _expr_eval(const int[::1] program, const double[::1] consts, list buffers, list broadcast, Py_ssize_t n, int registers) -> None:
+    # Run an expression program compiled by `spatium.expr` over `n` elements.
+    # Each instruction is (opcode, dst, a, b, c), the last buffer is the (writable) output.
+    cdef Py_ssize_t count = len(buffers)
+    cdef Py_buffer* views = <Py_buffer*> PyMem_Malloc(count * sizeof(Py_buffer))
+    cdef ExprBuffer* bufs = <ExprBuffer*> PyMem_Malloc(count * sizeof(ExprBuffer))
+    cdef py_float* regs = <py_float*> PyMem_Malloc(max(registers, 1) * EXPR_BLOCK_SIZE * sizeof(py_float))
+    cdef Py_ssize_t acquired = 0
+    cdef Py_ssize_t start, size, pc, j
+    cdef int op
+    cdef py_float value
+    cdef py_float* dst
+    cdef py_float* ra
+    cdef py_float* rb
+    cdef py_float* rc
+    cdef const int* prog = &program[0]
+    cdef Py_ssize_t length = program.shape[0]
+    try:
+        if views == NULL or bufs == NULL or regs == NULL:
+            raise MemoryError()
+        for acquired in range(count):
+            _expr_get_buffer(buffers[acquired], &views[acquired], &bufs[acquired], broadcast[acquired], acquired == count - 1)
+        acquired = count
+
+        with nogil:
+            for start in range(0, n, EXPR_BLOCK_SIZE):
+                size = min(EXPR_BLOCK_SIZE, n - start)
+                for pc in range(0, length, 5):
+                    op = prog[pc]
+                    dst = regs + prog[pc + 1] * EXPR_BLOCK_SIZE
+                    ra = regs + prog[pc + 2] * EXPR_BLOCK_SIZE
+                    rb = regs + prog[pc + 3] * EXPR_BLOCK_SIZE
+                    rc = regs + prog[pc + 4] * EXPR_BLOCK_SIZE
+                    if op == EXPR_LOAD:
+                        _expr_load(&bufs[prog[pc + 2]], start, size, prog[pc + 3], dst)
+                    elif op == EXPR_CONST:
+                        value = consts[prog[pc + 2]]
+                        for j in range(size):
+                            dst[j] = value
+                    elif op == EXPR_ADD:
+                        for j in range(size):
+                            dst[j] = ra[j] + rb[j]
+                    elif op == EXPR_SUB:
+                        for j in range(size):
+                            dst[j] = ra[j] - rb[j]
+                    elif op == EXPR_MUL:
+                        for j in range(size):
+                            dst[j] = ra[j] * rb[j]
+                    elif op == EXPR_DIV:
+                        for j in range(size):
+                            dst[j] = ra[j] / rb[j]
+                    elif op == EXPR_NEG:
+                        for j in range(size):
+                            dst[j] = -ra[j]
+                    elif op == EXPR_SQRT:
+                        for j in range(size):
+                            dst[j] = sqrtl(ra[j])
+                    elif op == EXPR_MULADD:
+                        for j in range(size):
+                            dst[j] = ra[j] * rb[j] + rc[j]
+                    elif op == EXPR_STORE:
+                        # dst is the register to store
+                        _expr_store(&bufs[prog[pc + 2]], start, size, prog[pc + 3], dst)
+    finally:
+        for j in range(acquired):
+            PyBuffer_Release(&views[j])
+        PyMem_Free(views)
+        PyMem_Free(bufs)
+        PyMem_Free(regs)
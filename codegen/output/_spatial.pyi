@@ -0,0 +1,431 @@
+# noinspection PyUnresolvedReferences
+from typing import overload, Self, Any, Union, Iterator
+from array import array
+from spatium._common import py_int, py_float, buffer_float
+from spatium._vector import Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector import Vec2Array, Vec3Array, Vec4Array
+from spatium._vector_int import Vec2i, Vec3i, Vec4i, Vec2i32, Vec3i32, Vec4i32
+from spatium._vector_int import Vec2iArray, Vec3iArray, Vec4iArray
+from spatium._transform import Transform2D, Transform3D
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class KDTree2D:
+    """A k-d tree over a set of `Vec2`s, for nearest neighbour and radius queries.
+    
+    The points are copied when the tree is built, query results refer to them by their index in the original sequence.
+    """
+
+
+    def query_radius_many(self, points: "Vec2Array", radius: (float | int), /) -> "list[array]":
+        """Find the indices of all the points within `radius` (inclusive) of every vector of `points`."""
+        ...
+    def query_radius(self, point: "Vec2", radius: (float | int), /) -> "array":
+        """Find the indices of all the points within `radius` (inclusive) of `point`, in no particular order."""
+        ...
+    def query_many(self, points: "Vec2Array", k: int = 1, /) -> "tuple[memoryview, memoryview]":
+        """Find the k nearest points for every vector of `points` in one pass.
+    
+        Returns their indices and (Euclidean) distances as two (len(points), k) `memoryview`s,
+        every row is in ascending order of distance.
+        """
+        ...
+    def query(self, point: "Vec2", k: int = 1, /) -> "tuple[array, array]":
+        """Find the k nearest points.
+    
+        Returns their indices and (Euclidean) distances as two `array`s, in ascending order of distance.
+        """
+        ...
+    def __len__(self) -> int:
+        """The number of points."""
+        ...
+    def __init__(self, points: Any, /) -> Any:
+        """Build a tree from a `Vec2Array` or an iterable of `Vec2`s."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class KDTree3D:
+    """A k-d tree over a set of `Vec3`s, for nearest neighbour and radius queries.
+    
+    The points are copied when the tree is built, query results refer to them by their index in the original sequence.
+    """
+
+
+    def query_radius_many(self, points: "Vec3Array", radius: (float | int), /) -> "list[array]":
+        """Find the indices of all the points within `radius` (inclusive) of every vector of `points`."""
+        ...
+    def query_radius(self, point: "Vec3", radius: (float | int), /) -> "array":
+        """Find the indices of all the points within `radius` (inclusive) of `point`, in no particular order."""
+        ...
+    def query_many(self, points: "Vec3Array", k: int = 1, /) -> "tuple[memoryview, memoryview]":
+        """Find the k nearest points for every vector of `points` in one pass.
+    
+        Returns their indices and (Euclidean) distances as two (len(points), k) `memoryview`s,
+        every row is in ascending order of distance.
+        """
+        ...
+    def query(self, point: "Vec3", k: int = 1, /) -> "tuple[array, array]":
+        """Find the k nearest points.
+    
+        Returns their indices and (Euclidean) distances as two `array`s, in ascending order of distance.
+        """
+        ...
+    def __len__(self) -> int:
+        """The number of points."""
+        ...
+    def __init__(self, points: Any, /) -> Any:
+        """Build a tree from a `Vec3Array` or an iterable of `Vec3`s."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class SpatialHash2D:
+    """A uniform grid of cells for broad-phase queries over moving `Vec2` positions.
+    
+    Every inserted position gets an integer handle, which stays valid until it is removed (and may be reused after that).
+    Cells are keyed by their integer coordinates in an open addressing table, so queries never create vector objects.
+    """
+
+    @property
+    def cell_size(self) -> (float | int):
+        """The edge length of the cells."""
+        ...
+
+    def query_cell(self, cell: "Vec2i", /) -> "array":
+        """The handles of all the entries in a cell."""
+        ...
+    def query_box(self, lo: "Vec2", hi: "Vec2", /) -> "array":
+        """The handles of all the entries inside the axis-aligned box between the `lo` and `hi` corners (inclusive)."""
+        ...
+    def query_radius(self, center: "Vec2", radius: (float | int), /) -> "array":
+        """The handles of all the entries within `radius` (inclusive) of `center`, in no particular order."""
+        ...
+    def __contains__(self, handle: int) -> "bool":
+        """If the handle refers to an entry."""
+        ...
+    def __len__(self) -> int:
+        """The number of entries."""
+        ...
+    def cell_of(self, position: "Vec2", /) -> "Vec2i":
+        """The integer coordinates of the cell containing the position."""
+        ...
+    def position(self, handle: int, /) -> "Vec2":
+        """Get the position of an entry."""
+        ...
+    def remove(self, handle: int, /) -> None:
+        """Remove an entry, its handle may be reused by a later `insert()`."""
+        ...
+    def move(self, handle: int, position: "Vec2", /) -> None:
+        """Change the position of an entry, relinking it only if it changes cell."""
+        ...
+    def insert(self, position: "Vec2", /) -> int:
+        """Insert a position, return its handle."""
+        ...
+    def __init__(self, cell_size: (float | int), /) -> Any:
+        """Create an empty spatial hash with cubic cells of the given size."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class SpatialHash3D:
+    """A uniform grid of cells for broad-phase queries over moving `Vec3` positions.
+    
+    Every inserted position gets an integer handle, which stays valid until it is removed (and may be reused after that).
+    Cells are keyed by their integer coordinates in an open addressing table, so queries never create vector objects.
+    """
+
+    @property
+    def cell_size(self) -> (float | int):
+        """The edge length of the cells."""
+        ...
+
+    def query_cell(self, cell: "Vec3i", /) -> "array":
+        """The handles of all the entries in a cell."""
+        ...
+    def query_box(self, lo: "Vec3", hi: "Vec3", /) -> "array":
+        """The handles of all the entries inside the axis-aligned box between the `lo` and `hi` corners (inclusive)."""
+        ...
+    def query_radius(self, center: "Vec3", radius: (float | int), /) -> "array":
+        """The handles of all the entries within `radius` (inclusive) of `center`, in no particular order."""
+        ...
+    def __contains__(self, handle: int) -> "bool":
+        """If the handle refers to an entry."""
+        ...
+    def __len__(self) -> int:
+        """The number of entries."""
+        ...
+    def cell_of(self, position: "Vec3", /) -> "Vec3i":
+        """The integer coordinates of the cell containing the position."""
+        ...
+    def position(self, handle: int, /) -> "Vec3":
+        """Get the position of an entry."""
+        ...
+    def remove(self, handle: int, /) -> None:
+        """Remove an entry, its handle may be reused by a later `insert()`."""
+        ...
+    def move(self, handle: int, position: "Vec3", /) -> None:
+        """Change the position of an entry, relinking it only if it changes cell."""
+        ...
+    def insert(self, position: "Vec3", /) -> int:
+        """Insert a position, return its handle."""
+        ...
+    def __init__(self, cell_size: (float | int), /) -> Any:
+        """Create an empty spatial hash with cubic cells of the given size."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec2Store:
+    """A file of float64 or float32 `Vec2`s mapped into memory with `mmap`, for point sets larger than the memory.
+    
+    Nothing is read up front: indexing and slicing copy single vectors or chunks out of the mapping,
+    and the batch operations stream through it without any intermediate copies.
+    """
+
+    @property
+    def format(self) -> "str":
+        """The buffer format of the elements in the file, "d" (float64) or "f" (float32)."""
+        ...
+    @property
+    def writable(self) -> "bool":
+        """If the file can be modified through this store."""
+        ...
+    @property
+    def closed(self) -> "bool":
+        """If the store has been closed."""
+        ...
+
+    def query_radius(self, center: "Vec2", radius: (float | int), /) -> "array":
+        """The indices of all the vectors within `radius` (inclusive) of `center`, in ascending order."""
+        ...
+    def query_box(self, lo: "Vec2", hi: "Vec2", /) -> "array":
+        """The indices of all the vectors inside the axis-aligned box between the `lo` and `hi` corners (inclusive), in ascending order."""
+        ...
+    def transform_ip(self, transform: "Transform2D", /) -> Self:
+        """Apply `transform` to every vector inplace."""
+        ...
+    def transform_into(self, transform: "Transform2D", out: "Vec2Store", /) -> "Vec2Store":
+        """Apply `transform` to every vector and write the results into `out` (which can be `self`), then return `out`.
+    
+        Both stores must have the same length and format.
+        """
+        ...
+    def bounds(self) -> "tuple[Vec2, Vec2]":
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        ...
+    def chunks(self, size: int = 65536, /) -> "Iterator[Vec2Array]":
+        """Read the vectors in consecutive `Vec2Array`s of (up to) `size` vectors."""
+        ...
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Write the n-th vector, or write a `Vec2Array` to a slice of the same length."""
+        ...
+    def __getitem__(self, key: Any) -> Union["Vec2", "Vec2Array"]:
+        """Read the n-th vector, or read a slice of vectors into a `Vec2Array`."""
+        ...
+    def __len__(self) -> int:
+        """The number of vectors in the file."""
+        ...
+    def __repr__(self) -> "str": ...
+    def __enter__(self) -> Self: ...
+    def flush(self) -> None:
+        """Write the changes back to the file."""
+        ...
+    def close(self) -> None:
+        """Flush the changes and unmap the file, the store can't be used afterwards."""
+        ...
+    @staticmethod
+    def create(path: "str", size: int, /, format: "str" = "d") -> "Vec2Store":
+        """Create (or overwrite) a file of `size` zero vectors and map it writable."""
+        ...
+    def __init__(self, path: "str", /, format: "str" = "d", writable: bool = False) -> Any:
+        """Map an existing file of contiguous `format` ("d" for float64 or "f" for float32) vectors in native byte order.
+    
+        The file is only modified through the store if `writable` is True.
+        """
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec3Store:
+    """A file of float64 or float32 `Vec3`s mapped into memory with `mmap`, for point sets larger than the memory.
+    
+    Nothing is read up front: indexing and slicing copy single vectors or chunks out of the mapping,
+    and the batch operations stream through it without any intermediate copies.
+    """
+
+    @property
+    def format(self) -> "str":
+        """The buffer format of the elements in the file, "d" (float64) or "f" (float32)."""
+        ...
+    @property
+    def writable(self) -> "bool":
+        """If the file can be modified through this store."""
+        ...
+    @property
+    def closed(self) -> "bool":
+        """If the store has been closed."""
+        ...
+
+    def query_radius(self, center: "Vec3", radius: (float | int), /) -> "array":
+        """The indices of all the vectors within `radius` (inclusive) of `center`, in ascending order."""
+        ...
+    def query_box(self, lo: "Vec3", hi: "Vec3", /) -> "array":
+        """The indices of all the vectors inside the axis-aligned box between the `lo` and `hi` corners (inclusive), in ascending order."""
+        ...
+    def transform_ip(self, transform: "Transform3D", /) -> Self:
+        """Apply `transform` to every vector inplace."""
+        ...
+    def transform_into(self, transform: "Transform3D", out: "Vec3Store", /) -> "Vec3Store":
+        """Apply `transform` to every vector and write the results into `out` (which can be `self`), then return `out`.
+    
+        Both stores must have the same length and format.
+        """
+        ...
+    def bounds(self) -> "tuple[Vec3, Vec3]":
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        ...
+    def chunks(self, size: int = 65536, /) -> "Iterator[Vec3Array]":
+        """Read the vectors in consecutive `Vec3Array`s of (up to) `size` vectors."""
+        ...
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Write the n-th vector, or write a `Vec3Array` to a slice of the same length."""
+        ...
+    def __getitem__(self, key: Any) -> Union["Vec3", "Vec3Array"]:
+        """Read the n-th vector, or read a slice of vectors into a `Vec3Array`."""
+        ...
+    def __len__(self) -> int:
+        """The number of vectors in the file."""
+        ...
+    def __repr__(self) -> "str": ...
+    def __enter__(self) -> Self: ...
+    def flush(self) -> None:
+        """Write the changes back to the file."""
+        ...
+    def close(self) -> None:
+        """Flush the changes and unmap the file, the store can't be used afterwards."""
+        ...
+    @staticmethod
+    def create(path: "str", size: int, /, format: "str" = "d") -> "Vec3Store":
+        """Create (or overwrite) a file of `size` zero vectors and map it writable."""
+        ...
+    def __init__(self, path: "str", /, format: "str" = "d", writable: bool = False) -> Any:
+        """Map an existing file of contiguous `format` ("d" for float64 or "f" for float32) vectors in native byte order.
+    
+        The file is only modified through the store if `writable` is True.
+        """
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class VoxelMap:
+    """A mapping from `Vec3i` voxel coordinates to objects, stored compactly.
+    
+    Coordinates are packed into 64-bit integers (21 bits per axis, so every component must be in [-2**20, 2**20))
+    in an open addressing table, keys can be given as `Vec3i`s or (x, y, z) tuples.
+    """
+
+
+    def items(self) -> "list":
+        """A list of all the (`Vec3i` key, value) pairs."""
+        ...
+    def values(self) -> "list":
+        """A list of all the values, in the same order as iterating over the keys."""
+        ...
+    def pop(self, key: Any, /) -> Any:
+        """Remove a key and return its value, raise `KeyError` if it's not present."""
+        ...
+    def get(self, key: Any, default: Any = None, /) -> Any:
+        """Get the value of a key, or `default` if it's not present."""
+        ...
+    def __delitem__(self, key: Any) -> None: ...
+    def __setitem__(self, key: Any, value: Any) -> None: ...
+    def __getitem__(self, key: Any) -> Any: ...
+    def neighbors(self, key: Any, connectivity: int = 6, /) -> "tuple[Vec3iArray, list]":
+        """The neighbors of a voxel (6: faces, 18: faces and edges, 26: faces, edges and corners) that are in the map.
+    
+        Returns their keys as a `Vec3iArray` and a list of their values.
+        """
+        ...
+    def chunks(self, size: int = 4096, /) -> "_VoxelMap_chunk_iterator":
+        """Iterate over the entries in chunks of up to `size`, each one as a `Vec3iArray` of keys and a list of the values."""
+        ...
+    def clear(self) -> None:
+        """Remove all the keys."""
+        ...
+    def __iter__(self) -> "_VoxelMap_iterator":
+        """Iterate over the keys as `Vec3i`s, in no particular order."""
+        ...
+    def __contains__(self, key: Any) -> "bool":
+        """If the key is in this container, out of range keys are never contained."""
+        ...
+    def __bool__(self) -> "bool":
+        """If there are any keys."""
+        ...
+    def __len__(self) -> int:
+        """The number of keys."""
+        ...
+    def __init__(self, items: Any = None, /) -> Any:
+        """Create a map, optionally from a mapping or an iterable of (key, value) pairs."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _VoxelMap_iterator:
+
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "Vec3i": ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _VoxelMap_chunk_iterator:
+
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "tuple[Vec3iArray, list]": ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class VoxelSet:
+    """A set of `Vec3i` voxel coordinates, stored compactly.
+    
+    Coordinates are packed into 64-bit integers (21 bits per axis, so every component must be in [-2**20, 2**20))
+    in an open addressing table, keys can be given as `Vec3i`s or (x, y, z) tuples.
+    """
+
+
+    def remove(self, key: Any, /) -> None:
+        """Remove a key, raise `KeyError` if it's not present."""
+        ...
+    def discard(self, key: Any, /) -> None:
+        """Remove a key if it is present."""
+        ...
+    def add(self, key: Any, /) -> None:
+        """Add a key."""
+        ...
+    def neighbors(self, key: Any, connectivity: int = 6, /) -> "Vec3iArray":
+        """The neighbors of a voxel (6: faces, 18: faces and edges, 26: faces, edges and corners) that are in the set."""
+        ...
+    def chunks(self, size: int = 4096, /) -> "_VoxelSet_chunk_iterator":
+        """Iterate over the keys in chunks of up to `size`, each one as a `Vec3iArray`."""
+        ...
+    def clear(self) -> None:
+        """Remove all the keys."""
+        ...
+    def __iter__(self) -> "_VoxelSet_iterator":
+        """Iterate over the keys as `Vec3i`s, in no particular order."""
+        ...
+    def __contains__(self, key: Any) -> "bool":
+        """If the key is in this container, out of range keys are never contained."""
+        ...
+    def __bool__(self) -> "bool":
+        """If there are any keys."""
+        ...
+    def __len__(self) -> int:
+        """The number of keys."""
+        ...
+    def __init__(self, keys: Any = None, /) -> Any:
+        """Create a set, optionally from an iterable of keys."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _VoxelSet_iterator:
+
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "Vec3i": ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _VoxelSet_chunk_iterator:
+
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "Vec3iArray": ...
+
@@ -0,0 +1,2933 @@
+#cython: language_level=3
+#cython: binding=False
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: nonecheck=False
+#cython: cdivision=True
+#cython: always_allow_keywords=True
+#cython: optimize.use_switch=True
+#cython: embedsignature=False
+
+cimport cython
+
+
+########## common_utils.pyx ##########
+from libc.math cimport fabsl, floorl, isfinite, INFINITY
+
+from cpython.float cimport PyFloat_CheckExact, PyFloat_AS_DOUBLE, PyFloat_Check, PyFloat_AsDouble
+from cpython.long cimport PyLong_CheckExact, PyLong_AsLongLong, PyLong_AsDouble, PyLong_Check
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free, PyMem_RawMalloc, PyMem_RawRealloc, PyMem_RawFree
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_SIMPLE, PyBUF_WRITABLE, PyBUF_C_CONTIGUOUS, PyObject_GetBuffer, PyBuffer_Release
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from cpython.bytearray cimport PyByteArray_FromStringAndSize, PyByteArray_AS_STRING
+from cpython.object cimport PyObject
+from cpython.pyport cimport PY_SSIZE_T_MAX
+from cpython.ref cimport Py_INCREF, Py_DECREF
+from cpython.pycapsule cimport PyCapsule_New, PyCapsule_IsValid, PyCapsule_GetPointer
+from libc.string cimport memcpy, memset, memcmp
+from libc.limits cimport INT_MIN, INT_MAX
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t, uint64_t
+from spatium._common cimport py_int, py_float, buffer_float
+
+import sys
+from array import array
+
+cdef extern from "Python.h":
+    # Constructing through the `tp_vectorcall` slot of a type skips the argument tuple and `tp_init`
+    ctypedef object (*vectorcallfunc)(PyObject* callable, PyObject** args, size_t nargsf, PyObject* kwnames)
+    ctypedef struct PyVectorcallTypeObject "PyTypeObject":
+        vectorcallfunc tp_vectorcall
+    Py_ssize_t PyVectorcall_NARGS(size_t nargsf)
+
+DEF DEFAULT_RELATIVE_TOLERANCE = 1e-09
+DEF DEFAULT_ABSOLUTE_TOLERANCE = 1e-15
+
+# Number of points kept hot in the cache by the tiled all-pairs loops
+DEF PAIRWISE_TILE_SIZE = 256
+# Maximum number of points in a k-d tree leaf
+DEF KDTREE_LEAF_SIZE = 8
+
+cdef inline bint is_close(py_float a, py_float b, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) noexcept:
+    cdef py_float diff = fabsl(a - b)
+    if a == b:
+        return True
+    if not isfinite(a) or not isfinite(b):
+        return False
+    return diff <= fabsl(rel_tol * a) or diff <= fabsl(rel_tol * b) or diff <= fabsl(abs_tol)
+
+cdef inline int py_long_as_int(object value) except? -1:
+    # Convert an int for the parameters of the int32 family, raising OverflowError outside of the C int range
+    cdef py_int result = PyLong_AsLongLong(value)
+    if not INT_MIN <= result <= INT_MAX:
+        raise OverflowError(f"Python int out of the C int range: {value}")
+    return <int> result
+
+
+cdef union _bitcaster:
+    double f
+    py_int i
+
+cdef inline py_int bitcast_float(py_float f) noexcept nogil:
+    # Bits of the value as a double, with -0.0 folded into 0.0 since they compare equal
+    return _bitcaster(f=(<double> f) + 0.0).i
+
+cdef inline uint64_t mix64(uint64_t x) noexcept nogil:
+    # The splitmix64 finalizer, every input bit affects every output bit
+    x ^= x >> 30
+    x *= 0xbf58476d1ce4e5b9ULL
+    x ^= x >> 27
+    x *= 0x94d049bb133111ebULL
+    x ^= x >> 31
+    return x
+
+cdef inline uint64_t hash_combine(uint64_t h, uint64_t value) noexcept nogil:
+    return mix64(h + value + 0x9e3779b97f4a7c15ULL)
+
+cdef inline py_int hash_finish(uint64_t h) noexcept nogil:
+    # -1 is reserved for errors by `__hash__()`, same as CPython's own hashes
+    return -2 if <py_int> h == -1 else <py_int> h
+
+
+cdef inline void export_buffer(Py_buffer* buffer, int flags, object obj, void* data, Py_ssize_t itemsize, char* format, int ndim, Py_ssize_t* shape, Py_ssize_t* strides) noexcept:
+    cdef Py_ssize_t length = itemsize
+    cdef int i
+    for i in range(ndim):
+        length *= shape[i]
+    buffer.buf = data
+    buffer.obj = obj
+    buffer.len = length
+    buffer.readonly = 0
+    buffer.itemsize = itemsize
+    buffer.format = format if flags & PyBUF_FORMAT == PyBUF_FORMAT else NULL
+    buffer.ndim = ndim
+    buffer.shape = shape if flags & PyBUF_ND == PyBUF_ND else NULL
+    buffer.strides = strides if flags & PyBUF_STRIDES == PyBUF_STRIDES else NULL
+    buffer.suboffsets = NULL
+    buffer.internal = NULL
+
+cdef struct IndexList:
+    # Growable list of indices that can be appended to without the GIL
+    Py_ssize_t* data
+    Py_ssize_t size
+    Py_ssize_t capacity
+    bint failed
+
+cdef inline void index_list_append(IndexList* lst, Py_ssize_t index) noexcept nogil:
+    cdef void* data
+    if lst.size == lst.capacity:
+        data = PyMem_RawRealloc(lst.data, max(16, lst.capacity * 2) * sizeof(Py_ssize_t))
+        if data == NULL:
+            lst.failed = True
+            return
+        lst.data = <Py_ssize_t*> data
+        lst.capacity = max(16, lst.capacity * 2)
+    lst.data[lst.size] = index
+    lst.size += 1
+
+cdef inline object new_scalar_array(str typecode, Py_ssize_t length):
+    return array(typecode, [0]) * length
+
+cdef inline str buffer_format(object obj):
+    return memoryview(obj).format.lstrip("@=")
+
+cdef inline object new_float_buffer(str typecode, Py_ssize_t rows, Py_ssize_t cols):
+    return memoryview(new_scalar_array(typecode, rows * cols)).cast("B").cast(typecode, (rows, cols))
+
+
+cdef packed struct PackHeader:
+    # Header of the blocks written by `pack_many()`, followed by `count` items in native byte order
+    char magic[4]
+    char format
+    unsigned char itemsize
+    unsigned short elements
+    uint64_t count
+
+cdef inline bytes new_pack_block(Py_ssize_t count, char format, Py_ssize_t itemsize, Py_ssize_t elements):
+    # The items of the returned block are left uninitialized for the caller to fill in
+    cdef bytes block = PyBytes_FromStringAndSize(NULL, sizeof(PackHeader) + count * elements * itemsize)
+    cdef PackHeader header
+    memcpy(header.magic, b"SPTM", 4)
+    header.format = format
+    header.itemsize = <unsigned char> itemsize
+    header.elements = <unsigned short> elements
+    header.count = count
+    memcpy(PyBytes_AS_STRING(block), &header, sizeof(PackHeader))
+    return block
+
+cdef inline char* pack_block_items(bytes block) noexcept:
+    return PyBytes_AS_STRING(block) + sizeof(PackHeader)
+
+cdef inline Py_ssize_t open_pack_block(object data, Py_buffer* view, char format, Py_ssize_t itemsize, Py_ssize_t elements, const char** items) except -1:
+    # Acquire the buffer of a block written by `pack_many()` and check its header, returns the number of items
+    PyObject_GetBuffer(data, view, PyBUF_SIMPLE)
+    cdef PackHeader header
+    try:
+        if view.len < <Py_ssize_t> sizeof(PackHeader):
+            raise ValueError(f"Packed block too short: {view.len} bytes")
+        memcpy(&header, view.buf, sizeof(PackHeader))
+        if memcmp(header.magic, b"SPTM", 4) != 0:
+            raise ValueError("Not a packed block")
+        if header.format != format or header.itemsize != itemsize or header.elements != elements:
+            raise ValueError(f"Packed items have {header.elements} elements of format {chr(header.format)!r} ({header.itemsize} bytes), "
+                             f"expected {elements} elements of format {chr(format)!r} ({itemsize} bytes)")
+        # Divided rather than multiplied, a forged count could overflow the size of the items
+        if (header.count > <uint64_t> (view.len - sizeof(PackHeader)) // (elements * itemsize)
+                or <uint64_t> (view.len - sizeof(PackHeader)) != header.count * elements * itemsize):
+            raise ValueError(f"Packed block size mismatch: {header.count} items in {view.len} bytes")
+    except:
+        PyBuffer_Release(view)
+        raise
+    items[0] = <const char*> view.buf + sizeof(PackHeader)
+    return <Py_ssize_t> header.count
+
+cdef inline Py_ssize_t open_raw_buffer(object data, Py_buffer* view, Py_ssize_t item_size) except -1:
+    # Acquire a buffer of whole items without a header, returns the number of items
+    PyObject_GetBuffer(data, view, PyBUF_SIMPLE)
+    if view.len % item_size != 0:
+        PyBuffer_Release(view)
+        raise ValueError(f"Expected a multiple of {item_size} bytes, got {view.len}")
+    return view.len // item_size
+
+cdef inline int read_bytes(object data, void* out, Py_ssize_t size) except -1:
+    # Copy exactly `size` bytes from a buffer, used by `from_bytes()`
+    cdef Py_buffer view
+    PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+    if view.len != size:
+        PyBuffer_Release(&view)
+        raise ValueError(f"Expected {size} bytes, got {view.len}")
+    memcpy(out, view.buf, size)
+    PyBuffer_Release(&view)
+    return 0
+
+
+# Byte order prefix of the native `struct` and numpy type strings
+NATIVE_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+cdef inline dict array_interface(void* data, char kind, Py_ssize_t itemsize, int ndim, Py_ssize_t* shape):
+    # Version 3 of numpy's `__array_interface__`, for C-contiguous writable numbers of `kind` ("f" or "i")
+    return {
+        "version": 3,
+        "shape": tuple([shape[i] for i in range(ndim)]),
+        "typestr": f"{NATIVE_BYTE_ORDER}{chr(kind)}{itemsize}",
+        "data": (<size_t> data, False),
+        "strides": None,
+    }
+
+cdef inline Py_ssize_t open_item_buffer(object data, Py_buffer* view, char kind, Py_ssize_t itemsize, Py_ssize_t elements) except -1:
+    # Acquire a writable C-contiguous buffer of items of `elements` numbers, returns the number of items.
+    # The numbers must be native `kind` ("f" or "i") numbers of `itemsize` bytes, or untyped bytes.
+    # Multidimensional buffers must have `elements` numbers per index of their first dimension.
+    PyObject_GetBuffer(data, view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS | PyBUF_FORMAT)
+    cdef str format = "B" if view.format == NULL else view.format.decode("ascii").lstrip("@=" + NATIVE_BYTE_ORDER)
+    cdef Py_ssize_t per_index = 1
+    cdef int i
+    try:
+        if format not in ("B", "c"):
+            if view.itemsize != itemsize or len(format) != 1 or format not in ("fdg" if kind == b"f" else "bhilqn"):
+                raise ValueError(f"Expected a buffer of {itemsize}-byte {'float' if kind == b'f' else 'signed integer'} numbers "
+                                 f"or untyped bytes, got format {format!r} ({view.itemsize} bytes)")
+            for i in range(1, view.ndim):
+                per_index *= view.shape[i]
+            if view.ndim > 1 and per_index != elements:
+                raise ValueError(f"Expected {elements} numbers per item, got shape {tuple([view.shape[i] for i in range(view.ndim)])}")
+        if view.len % (itemsize * elements) != 0:
+            raise ValueError(f"Expected a multiple of {itemsize * elements} bytes, got {view.len}")
+        if <size_t> view.buf % itemsize != 0:
+            raise ValueError(f"Buffer not aligned to {itemsize} bytes")
+    except:
+        PyBuffer_Release(view)
+        raise
+    return view.len // (itemsize * elements)
+
+
+# DLPack (https://dmlc.github.io/dlpack/latest/) ABI, for `__dlpack__()`
+DEF DLPACK_CPU = 1
+DEF DLPACK_INT = 0
+DEF DLPACK_FLOAT = 2
+DEF DLPACK_FLAG_IS_COPIED = 2
+
+cdef struct DLDevice:
+    int device_type
+    int device_id
+
+cdef struct DLDataType:
+    uint8_t code
+    uint8_t bits
+    uint16_t lanes
+
+cdef struct DLTensor:
+    void* data
+    DLDevice device
+    int ndim
+    DLDataType dtype
+    int64_t* shape
+    int64_t* strides
+    uint64_t byte_offset
+
+cdef struct DLManagedTensor:
+    DLTensor dl_tensor
+    void* manager_ctx
+    void (*deleter)(DLManagedTensor*) noexcept nogil
+
+cdef struct DLPackVersion:
+    uint32_t major
+    uint32_t minor
+
+cdef struct DLManagedTensorVersioned:
+    DLPackVersion version
+    void* manager_ctx
+    void (*deleter)(DLManagedTensorVersioned*) noexcept nogil
+    uint64_t flags
+    DLTensor dl_tensor
+
+cdef struct DLPackExport:
+    # One allocation for the tensor of either version and its shape, the `manager_ctx` of the tensor
+    DLManagedTensor tensor
+    DLManagedTensorVersioned versioned
+    PyObject* owner
+    int64_t[3] shape
+    int64_t[3] strides
+
+cdef void _dlpack_free(DLPackExport* export) noexcept nogil:
+    # Called by the consumer once it's done with the tensor, maybe without the GIL
+    with gil:
+        Py_DECREF(<object> export.owner)
+    PyMem_RawFree(export)
+
+cdef void _dlpack_deleter(DLManagedTensor* tensor) noexcept nogil:
+    _dlpack_free(<DLPackExport*> tensor.manager_ctx)
+
+cdef void _dlpack_versioned_deleter(DLManagedTensorVersioned* tensor) noexcept nogil:
+    _dlpack_free(<DLPackExport*> tensor.manager_ctx)
+
+cdef void _dlpack_capsule_destructor(object capsule) noexcept:
+    # A consumed capsule is renamed to "used_dltensor", and the consumer calls the deleter itself
+    cdef DLManagedTensor* tensor
+    if PyCapsule_IsValid(capsule, b"dltensor"):
+        tensor = <DLManagedTensor*> PyCapsule_GetPointer(capsule, b"dltensor")
+        tensor.deleter(tensor)
+
+cdef void _dlpack_versioned_capsule_destructor(object capsule) noexcept:
+    cdef DLManagedTensorVersioned* tensor
+    if PyCapsule_IsValid(capsule, b"dltensor_versioned"):
+        tensor = <DLManagedTensorVersioned*> PyCapsule_GetPointer(capsule, b"dltensor_versioned")
+        tensor.deleter(tensor)
+
+cdef inline tuple dlpack_device():
+    return DLPACK_CPU, 0
+
+cdef inline object export_dlpack(object owner, void* data, char kind, Py_ssize_t itemsize, int ndim, Py_ssize_t* shape, object stream, object max_version, object dl_device, object copy):
+    # Wrap C-contiguous numbers of `kind` ("f" or "i") in a DLPack capsule, which keeps `owner` alive until it's deleted.
+    # The capsule is of DLPack 1.0 if the consumer supports it (`max_version`), otherwise of the older unversioned ABI.
+    # `copy` follows the array API: always copy if True, never if False, and only when needed if None.
+    if stream is not None:
+        raise BufferError(f"Only stream=None is supported for CPU data, got {stream!r}")
+    if dl_device is not None and tuple(dl_device) != dlpack_device():
+        raise BufferError(f"Can't export to device {dl_device!r}, only to the CPU")
+    cdef Py_ssize_t count = 1
+    cdef int i
+    for i in range(ndim):
+        count *= shape[i]
+    cdef bint copied = False
+    cdef double* doubles
+    cdef Py_ssize_t j
+    if kind == b"f" and itemsize != sizeof(float) and itemsize != sizeof(double):
+        # DLPack has no long double type, so they're exported as a copy of doubles
+        if copy is not None and not copy:
+            raise BufferError(f"DLPack has no {itemsize * 8}-bit long double type, the numbers can only be exported as a copy of doubles")
+        owner = PyByteArray_FromStringAndSize(NULL, count * sizeof(double))
+        doubles = <double*> PyByteArray_AS_STRING(owner)
+        for j in range(count):
+            doubles[j] = <double> (<py_float*> data)[j]
+        data = doubles
+        itemsize = sizeof(double)
+        copied = True
+    elif copy:
+        owner = PyByteArray_FromStringAndSize(<char*> data, count * itemsize)
+        data = PyByteArray_AS_STRING(owner)
+        copied = True
+    cdef bint versioned = max_version is not None and tuple(max_version) >= (1, 0)
+    cdef DLPackExport* export = <DLPackExport*> PyMem_RawMalloc(sizeof(DLPackExport))
+    if export == NULL:
+        raise MemoryError()
+    cdef DLTensor* tensor = &export.versioned.dl_tensor if versioned else &export.tensor.dl_tensor
+    for i in reversed(range(ndim)):
+        export.shape[i] = shape[i]
+        export.strides[i] = 1 if i == ndim - 1 else export.strides[i + 1] * shape[i + 1]
+    tensor.data = data
+    tensor.device.device_type = DLPACK_CPU
+    tensor.device.device_id = 0
+    tensor.ndim = ndim
+    tensor.dtype.code = DLPACK_FLOAT if kind == b"f" else DLPACK_INT
+    tensor.dtype.bits = <uint8_t> (itemsize * 8)
+    tensor.dtype.lanes = 1
+    tensor.shape = export.shape
+    tensor.strides = export.strides
+    tensor.byte_offset = 0
+    Py_INCREF(owner)
+    export.owner = <PyObject*> owner
+    try:
+        if versioned:
+            export.versioned.version.major = 1
+            export.versioned.version.minor = 0
+            export.versioned.manager_ctx = export
+            export.versioned.deleter = _dlpack_versioned_deleter
+            export.versioned.flags = DLPACK_FLAG_IS_COPIED if copied else 0
+            return PyCapsule_New(&export.versioned, b"dltensor_versioned", _dlpack_versioned_capsule_destructor)
+        export.tensor.manager_ctx = export
+        export.tensor.deleter = _dlpack_deleter
+        return PyCapsule_New(&export.tensor, b"dltensor", _dlpack_capsule_destructor)
+    except:
+        _dlpack_free(export)
+        raise
+from libc.math cimport sqrtl
+from spatium._vector cimport Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector cimport Vec2Array, Vec3Array, Vec4Array
+from spatium._vector_int cimport Vec2i, Vec3i, Vec4i, Vec2i32, Vec3i32, Vec4i32
+from spatium._vector_int cimport Vec2iArray, Vec3iArray, Vec4iArray
+from spatium._transform cimport Transform2D, Transform3D
+
+import os
+import mmap
+
+
+########## kdtree_class.pyx ##########
+cdef struct _KDTree2DHeap:
+    # Max-heap of the k best (squared distance, row) pairs found so far
+    py_float* dist
+    Py_ssize_t* rows
+    Py_ssize_t size
+    Py_ssize_t k
+
+cdef inline void _kdtree2d_heap_sift_down(_KDTree2DHeap* heap, Py_ssize_t size) noexcept nogil:
+    # Restore the heap order of the first `size` entries after the root has been replaced
+    cdef py_float d = heap.dist[0]
+    cdef Py_ssize_t row = heap.rows[0]
+    cdef Py_ssize_t i = 0, child
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap.dist[child + 1] > heap.dist[child]:
+            child += 1
+        if heap.dist[child] <= d:
+            break
+        heap.dist[i], heap.rows[i] = heap.dist[child], heap.rows[child]
+        i = child
+    heap.dist[i], heap.rows[i] = d, row
+
+cdef inline void _kdtree2d_heap_push(_KDTree2DHeap* heap, py_float d, Py_ssize_t row) noexcept nogil:
+    cdef Py_ssize_t i
+    if heap.size < heap.k:
+        i = heap.size
+        heap.size += 1
+        while i > 0 and heap.dist[(i - 1) // 2] < d:
+            heap.dist[i], heap.rows[i] = heap.dist[(i - 1) // 2], heap.rows[(i - 1) // 2]
+            i = (i - 1) // 2
+        heap.dist[i], heap.rows[i] = d, row
+    elif d < heap.dist[0]:
+        heap.dist[0], heap.rows[0] = d, row
+        _kdtree2d_heap_sift_down(heap, heap.size)
+
+cdef inline void _kdtree2d_heap_sort(_KDTree2DHeap* heap) noexcept nogil:
+    # Sort the entries in ascending order of distance, the heap is no longer valid afterwards
+    cdef Py_ssize_t end
+    for end in range(heap.size - 1, 0, -1):
+        heap.dist[0], heap.dist[end] = heap.dist[end], heap.dist[0]
+        heap.rows[0], heap.rows[end] = heap.rows[end], heap.rows[0]
+        _kdtree2d_heap_sift_down(heap, end)
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class KDTree2D:
+    """A k-d tree over a set of `Vec2`s, for nearest neighbour and radius queries.
+
+    The points are copied when the tree is built, query results refer to them by their index in the original sequence.
+    """
+
+    cdef py_float* points
+    cdef Py_ssize_t* indices
+    cdef unsigned char* axes
+    cdef Py_ssize_t size
+
+
+    def __cinit__(self):
+        self.points = NULL
+        self.indices = NULL
+        self.axes = NULL
+        self.size = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.points)
+        PyMem_Free(self.indices)
+        PyMem_Free(self.axes)
+
+    def __init__(self, object points, /):
+        """Build a tree from a `Vec2Array` or an iterable of `Vec2`s."""
+        cdef Vec2Array arr = points if isinstance(points, Vec2Array) else Vec2Array(points)
+        self.points = <py_float*> PyMem_Malloc(arr.size * 2 * sizeof(py_float))
+        self.indices = <Py_ssize_t*> PyMem_Malloc(arr.size * sizeof(Py_ssize_t))
+        self.axes = <unsigned char*> PyMem_Malloc(arr.size * sizeof(unsigned char))
+        if self.points == NULL or self.indices == NULL or self.axes == NULL:
+            raise MemoryError()
+        self.size = arr.size
+        memcpy(self.points, arr.data, arr.size * 2 * sizeof(py_float))
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self.indices[i] = i
+            self._build(0, self.size)
+
+    cdef inline void _swap(self, Py_ssize_t a, Py_ssize_t b) noexcept nogil:
+        cdef py_float* p = self.points + a * 2
+        cdef py_float* q = self.points + b * 2
+        p[0], q[0] = q[0], p[0]
+        p[1], q[1] = q[1], p[1]
+        self.indices[a], self.indices[b] = self.indices[b], self.indices[a]
+
+    cdef inline void _select(self, Py_ssize_t lo, Py_ssize_t hi, Py_ssize_t k, int axis) noexcept nogil:
+        # Partially sort the rows [lo, hi] so that row k is the one it would be if they were sorted along the axis
+        cdef Py_ssize_t i, j
+        cdef py_float a, b, c, pivot
+        while lo < hi:
+            a = self.points[lo * 2 + axis]
+            b = self.points[((lo + hi) // 2) * 2 + axis]
+            c = self.points[hi * 2 + axis]
+            pivot = max(min(a, b), min(max(a, b), c))
+            i, j = lo, hi
+            while i <= j:
+                while self.points[i * 2 + axis] < pivot:
+                    i += 1
+                while self.points[j * 2 + axis] > pivot:
+                    j -= 1
+                if i <= j:
+                    self._swap(i, j)
+                    i += 1
+                    j -= 1
+            if k <= j:
+                hi = j
+            elif k >= i:
+                lo = i
+            else:
+                break
+
+    cdef void _build(self, Py_ssize_t lo, Py_ssize_t hi) noexcept nogil:
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            return
+        # Split along the axis with the largest spread
+        cdef py_float[2] lows, highs
+        cdef Py_ssize_t i
+        cdef int d, axis = 0
+        for d in range(2):
+            lows[d] = highs[d] = self.points[lo * 2 + d]
+        for i in range(lo + 1, hi):
+            for d in range(2):
+                lows[d] = min(lows[d], self.points[i * 2 + d])
+                highs[d] = max(highs[d], self.points[i * 2 + d])
+        for d in range(1, 2):
+            if highs[d] - lows[d] > highs[axis] - lows[axis]:
+                axis = d
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        self._select(lo, hi - 1, mid, axis)
+        self.axes[mid] = axis
+        self._build(lo, mid)
+        self._build(mid + 1, hi)
+
+    cdef inline py_float _distance_sqr(self, const py_float* q, Py_ssize_t row) noexcept nogil:
+        cdef py_float* p = self.points + row * 2
+        return (p[0] - q[0]) * (p[0] - q[0]) + (p[1] - q[1]) * (p[1] - q[1])
+
+    cdef void _knn(self, const py_float* q, Py_ssize_t lo, Py_ssize_t hi, _KDTree2DHeap* heap) noexcept nogil:
+        cdef Py_ssize_t i
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            for i in range(lo, hi):
+                _kdtree2d_heap_push(heap, self._distance_sqr(q, i), i)
+            return
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        cdef py_float diff = q[self.axes[mid]] - self.points[mid * 2 + self.axes[mid]]
+        if diff < 0:
+            self._knn(q, lo, mid, heap)
+        else:
+            self._knn(q, mid + 1, hi, heap)
+        _kdtree2d_heap_push(heap, self._distance_sqr(q, mid), mid)
+        if heap.size < heap.k or diff * diff < heap.dist[0]:
+            if diff < 0:
+                self._knn(q, mid + 1, hi, heap)
+            else:
+                self._knn(q, lo, mid, heap)
+
+    cdef void _radius(self, const py_float* q, py_float radius_sqr, Py_ssize_t lo, Py_ssize_t hi, IndexList* rows) noexcept nogil:
+        cdef Py_ssize_t i
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            for i in range(lo, hi):
+                if self._distance_sqr(q, i) <= radius_sqr:
+                    index_list_append(rows, i)
+            return
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        cdef py_float diff = q[self.axes[mid]] - self.points[mid * 2 + self.axes[mid]]
+        if diff <= 0 or diff * diff <= radius_sqr:
+            self._radius(q, radius_sqr, lo, mid, rows)
+        if self._distance_sqr(q, mid) <= radius_sqr:
+            index_list_append(rows, mid)
+        if diff >= 0 or diff * diff <= radius_sqr:
+            self._radius(q, radius_sqr, mid + 1, hi, rows)
+
+    cdef inline int _check_k(self, Py_ssize_t k) except -1:
+        if not 0 < k <= self.size:
+            raise ValueError(f"k must be between 1 and the number of points ({self.size}), got {k}")
+        return 0
+
+    cdef inline object _found_indices(self, IndexList* rows):
+        if rows.failed:
+            raise MemoryError()
+        cdef object result = new_scalar_array("q", rows.size)
+        cdef py_int[::1] out = result
+        cdef Py_ssize_t i
+        for i in range(rows.size):
+            out[i] = self.indices[rows.data[i]]
+        return result
+
+
+    def __len__(self) -> int:
+        """The number of points."""
+        return self.size
+
+    def query(self, Vec2 point, Py_ssize_t k = 1, /) -> tuple[array, array]:
+        """Find the k nearest points.
+
+        Returns their indices and (Euclidean) distances as two `array`s, in ascending order of distance.
+        """
+        self._check_k(k)
+        cdef py_float[2] q
+        q[0] = point.x
+        q[1] = point.y
+        cdef object indices = new_scalar_array("q", k)
+        cdef object distances = new_scalar_array("d", k)
+        cdef py_int[::1] out_i = indices
+        cdef double[::1] out_d = distances
+        cdef _KDTree2DHeap heap
+        heap.dist = <py_float*> PyMem_Malloc(k * sizeof(py_float))
+        heap.rows = <Py_ssize_t*> PyMem_Malloc(k * sizeof(Py_ssize_t))
+        heap.size, heap.k = 0, k
+        cdef Py_ssize_t i
+        try:
+            if heap.dist == NULL or heap.rows == NULL:
+                raise MemoryError()
+            with nogil:
+                self._knn(q, 0, self.size, &heap)
+                _kdtree2d_heap_sort(&heap)
+                for i in range(k):
+                    out_i[i] = self.indices[heap.rows[i]]
+                    out_d[i] = sqrtl(heap.dist[i])
+        finally:
+            PyMem_Free(heap.dist)
+            PyMem_Free(heap.rows)
+        return indices, distances
+
+    def query_many(self, Vec2Array points, Py_ssize_t k = 1, /) -> tuple[memoryview, memoryview]:
+        """Find the k nearest points for every vector of `points` in one pass.
+
+        Returns their indices and (Euclidean) distances as two (len(points), k) `memoryview`s,
+        every row is in ascending order of distance.
+        """
+        self._check_k(k)
+        cdef object indices = new_float_buffer("q", points.size, k)
+        cdef object distances = new_float_buffer("d", points.size, k)
+        cdef py_int[:, ::1] out_i = indices
+        cdef double[:, ::1] out_d = distances
+        cdef _KDTree2DHeap heap
+        heap.dist = <py_float*> PyMem_Malloc(k * sizeof(py_float))
+        heap.rows = <Py_ssize_t*> PyMem_Malloc(k * sizeof(Py_ssize_t))
+        cdef Py_ssize_t i, j
+        try:
+            if heap.dist == NULL or heap.rows == NULL:
+                raise MemoryError()
+            with nogil:
+                for i in range(points.size):
+                    heap.size, heap.k = 0, k
+                    self._knn(points.data + i * 2, 0, self.size, &heap)
+                    _kdtree2d_heap_sort(&heap)
+                    for j in range(k):
+                        out_i[i, j] = self.indices[heap.rows[j]]
+                        out_d[i, j] = sqrtl(heap.dist[j])
+        finally:
+            PyMem_Free(heap.dist)
+            PyMem_Free(heap.rows)
+        return indices, distances
+
+    def query_radius(self, Vec2 point, py_float radius, /) -> array:
+        """Find the indices of all the points within `radius` (inclusive) of `point`, in no particular order."""
+        cdef py_float[2] q
+        q[0] = point.x
+        q[1] = point.y
+        cdef IndexList rows = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._radius(q, radius * radius, 0, self.size, &rows)
+            return self._found_indices(&rows)
+        finally:
+            PyMem_RawFree(rows.data)
+
+    def query_radius_many(self, Vec2Array points, py_float radius, /) -> list[array]:
+        """Find the indices of all the points within `radius` (inclusive) of every vector of `points`."""
+        cdef list results = []
+        cdef IndexList rows = IndexList(NULL, 0, 0, False)
+        cdef Py_ssize_t i
+        try:
+            for i in range(points.size):
+                rows.size = 0
+                with nogil:
+                    self._radius(points.data + i * 2, radius * radius, 0, self.size, &rows)
+                results.append(self._found_indices(&rows))
+        finally:
+            PyMem_RawFree(rows.data)
+        return results
+
+cdef struct _KDTree3DHeap:
+    # Max-heap of the k best (squared distance, row) pairs found so far
+    py_float* dist
+    Py_ssize_t* rows
+    Py_ssize_t size
+    Py_ssize_t k
+
+cdef inline void _kdtree3d_heap_sift_down(_KDTree3DHeap* heap, Py_ssize_t size) noexcept nogil:
+    # Restore the heap order of the first `size` entries after the root has been replaced
+    cdef py_float d = heap.dist[0]
+    cdef Py_ssize_t row = heap.rows[0]
+    cdef Py_ssize_t i = 0, child
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap.dist[child + 1] > heap.dist[child]:
+            child += 1
+        if heap.dist[child] <= d:
+            break
+        heap.dist[i], heap.rows[i] = heap.dist[child], heap.rows[child]
+        i = child
+    heap.dist[i], heap.rows[i] = d, row
+
+cdef inline void _kdtree3d_heap_push(_KDTree3DHeap* heap, py_float d, Py_ssize_t row) noexcept nogil:
+    cdef Py_ssize_t i
+    if heap.size < heap.k:
+        i = heap.size
+        heap.size += 1
+        while i > 0 and heap.dist[(i - 1) // 2] < d:
+            heap.dist[i], heap.rows[i] = heap.dist[(i - 1) // 2], heap.rows[(i - 1) // 2]
+            i = (i - 1) // 2
+        heap.dist[i], heap.rows[i] = d, row
+    elif d < heap.dist[0]:
+        heap.dist[0], heap.rows[0] = d, row
+        _kdtree3d_heap_sift_down(heap, heap.size)
+
+cdef inline void _kdtree3d_heap_sort(_KDTree3DHeap* heap) noexcept nogil:
+    # Sort the entries in ascending order of distance, the heap is no longer valid afterwards
+    cdef Py_ssize_t end
+    for end in range(heap.size - 1, 0, -1):
+        heap.dist[0], heap.dist[end] = heap.dist[end], heap.dist[0]
+        heap.rows[0], heap.rows[end] = heap.rows[end], heap.rows[0]
+        _kdtree3d_heap_sift_down(heap, end)
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class KDTree3D:
+    """A k-d tree over a set of `Vec3`s, for nearest neighbour and radius queries.
+
+    The points are copied when the tree is built, query results refer to them by their index in the original sequence.
+    """
+
+    cdef py_float* points
+    cdef Py_ssize_t* indices
+    cdef unsigned char* axes
+    cdef Py_ssize_t size
+
+
+    def __cinit__(self):
+        self.points = NULL
+        self.indices = NULL
+        self.axes = NULL
+        self.size = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.points)
+        PyMem_Free(self.indices)
+        PyMem_Free(self.axes)
+
+    def __init__(self, object points, /):
+        """Build a tree from a `Vec3Array` or an iterable of `Vec3`s."""
+        cdef Vec3Array arr = points if isinstance(points, Vec3Array) else Vec3Array(points)
+        self.points = <py_float*> PyMem_Malloc(arr.size * 3 * sizeof(py_float))
+        self.indices = <Py_ssize_t*> PyMem_Malloc(arr.size * sizeof(Py_ssize_t))
+        self.axes = <unsigned char*> PyMem_Malloc(arr.size * sizeof(unsigned char))
+        if self.points == NULL or self.indices == NULL or self.axes == NULL:
+            raise MemoryError()
+        self.size = arr.size
+        memcpy(self.points, arr.data, arr.size * 3 * sizeof(py_float))
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self.indices[i] = i
+            self._build(0, self.size)
+
+    cdef inline void _swap(self, Py_ssize_t a, Py_ssize_t b) noexcept nogil:
+        cdef py_float* p = self.points + a * 3
+        cdef py_float* q = self.points + b * 3
+        p[0], q[0] = q[0], p[0]
+        p[1], q[1] = q[1], p[1]
+        p[2], q[2] = q[2], p[2]
+        self.indices[a], self.indices[b] = self.indices[b], self.indices[a]
+
+    cdef inline void _select(self, Py_ssize_t lo, Py_ssize_t hi, Py_ssize_t k, int axis) noexcept nogil:
+        # Partially sort the rows [lo, hi] so that row k is the one it would be if they were sorted along the axis
+        cdef Py_ssize_t i, j
+        cdef py_float a, b, c, pivot
+        while lo < hi:
+            a = self.points[lo * 3 + axis]
+            b = self.points[((lo + hi) // 2) * 3 + axis]
+            c = self.points[hi * 3 + axis]
+            pivot = max(min(a, b), min(max(a, b), c))
+            i, j = lo, hi
+            while i <= j:
+                while self.points[i * 3 + axis] < pivot:
+                    i += 1
+                while self.points[j * 3 + axis] > pivot:
+                    j -= 1
+                if i <= j:
+                    self._swap(i, j)
+                    i += 1
+                    j -= 1
+            if k <= j:
+                hi = j
+            elif k >= i:
+                lo = i
+            else:
+                break
+
+    cdef void _build(self, Py_ssize_t lo, Py_ssize_t hi) noexcept nogil:
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            return
+        # Split along the axis with the largest spread
+        cdef py_float[3] lows, highs
+        cdef Py_ssize_t i
+        cdef int d, axis = 0
+        for d in range(3):
+            lows[d] = highs[d] = self.points[lo * 3 + d]
+        for i in range(lo + 1, hi):
+            for d in range(3):
+                lows[d] = min(lows[d], self.points[i * 3 + d])
+                highs[d] = max(highs[d], self.points[i * 3 + d])
+        for d in range(1, 3):
+            if highs[d] - lows[d] > highs[axis] - lows[axis]:
+                axis = d
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        self._select(lo, hi - 1, mid, axis)
+        self.axes[mid] = axis
+        self._build(lo, mid)
+        self._build(mid + 1, hi)
+
+    cdef inline py_float _distance_sqr(self, const py_float* q, Py_ssize_t row) noexcept nogil:
+        cdef py_float* p = self.points + row * 3
+        return (p[0] - q[0]) * (p[0] - q[0]) + (p[1] - q[1]) * (p[1] - q[1]) + (p[2] - q[2]) * (p[2] - q[2])
+
+    cdef void _knn(self, const py_float* q, Py_ssize_t lo, Py_ssize_t hi, _KDTree3DHeap* heap) noexcept nogil:
+        cdef Py_ssize_t i
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            for i in range(lo, hi):
+                _kdtree3d_heap_push(heap, self._distance_sqr(q, i), i)
+            return
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        cdef py_float diff = q[self.axes[mid]] - self.points[mid * 3 + self.axes[mid]]
+        if diff < 0:
+            self._knn(q, lo, mid, heap)
+        else:
+            self._knn(q, mid + 1, hi, heap)
+        _kdtree3d_heap_push(heap, self._distance_sqr(q, mid), mid)
+        if heap.size < heap.k or diff * diff < heap.dist[0]:
+            if diff < 0:
+                self._knn(q, mid + 1, hi, heap)
+            else:
+                self._knn(q, lo, mid, heap)
+
+    cdef void _radius(self, const py_float* q, py_float radius_sqr, Py_ssize_t lo, Py_ssize_t hi, IndexList* rows) noexcept nogil:
+        cdef Py_ssize_t i
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            for i in range(lo, hi):
+                if self._distance_sqr(q, i) <= radius_sqr:
+                    index_list_append(rows, i)
+            return
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        cdef py_float diff = q[self.axes[mid]] - self.points[mid * 3 + self.axes[mid]]
+        if diff <= 0 or diff * diff <= radius_sqr:
+            self._radius(q, radius_sqr, lo, mid, rows)
+        if self._distance_sqr(q, mid) <= radius_sqr:
+            index_list_append(rows, mid)
+        if diff >= 0 or diff * diff <= radius_sqr:
+            self._radius(q, radius_sqr, mid + 1, hi, rows)
+
+    cdef inline int _check_k(self, Py_ssize_t k) except -1:
+        if not 0 < k <= self.size:
+            raise ValueError(f"k must be between 1 and the number of points ({self.size}), got {k}")
+        return 0
+
+    cdef inline object _found_indices(self, IndexList* rows):
+        if rows.failed:
+            raise MemoryError()
+        cdef object result = new_scalar_array("q", rows.size)
+        cdef py_int[::1] out = result
+        cdef Py_ssize_t i
+        for i in range(rows.size):
+            out[i] = self.indices[rows.data[i]]
+        return result
+
+
+    def __len__(self) -> int:
+        """The number of points."""
+        return self.size
+
+    def query(self, Vec3 point, Py_ssize_t k = 1, /) -> tuple[array, array]:
+        """Find the k nearest points.
+
+        Returns their indices and (Euclidean) distances as two `array`s, in ascending order of distance.
+        """
+        self._check_k(k)
+        cdef py_float[3] q
+        q[0] = point.x
+        q[1] = point.y
+        q[2] = point.z
+        cdef object indices = new_scalar_array("q", k)
+        cdef object distances = new_scalar_array("d", k)
+        cdef py_int[::1] out_i = indices
+        cdef double[::1] out_d = distances
+        cdef _KDTree3DHeap heap
+        heap.dist = <py_float*> PyMem_Malloc(k * sizeof(py_float))
+        heap.rows = <Py_ssize_t*> PyMem_Malloc(k * sizeof(Py_ssize_t))
+        heap.size, heap.k = 0, k
+        cdef Py_ssize_t i
+        try:
+            if heap.dist == NULL or heap.rows == NULL:
+                raise MemoryError()
+            with nogil:
+                self._knn(q, 0, self.size, &heap)
+                _kdtree3d_heap_sort(&heap)
+                for i in range(k):
+                    out_i[i] = self.indices[heap.rows[i]]
+                    out_d[i] = sqrtl(heap.dist[i])
+        finally:
+            PyMem_Free(heap.dist)
+            PyMem_Free(heap.rows)
+        return indices, distances
+
+    def query_many(self, Vec3Array points, Py_ssize_t k = 1, /) -> tuple[memoryview, memoryview]:
+        """Find the k nearest points for every vector of `points` in one pass.
+
+        Returns their indices and (Euclidean) distances as two (len(points), k) `memoryview`s,
+        every row is in ascending order of distance.
+        """
+        self._check_k(k)
+        cdef object indices = new_float_buffer("q", points.size, k)
+        cdef object distances = new_float_buffer("d", points.size, k)
+        cdef py_int[:, ::1] out_i = indices
+        cdef double[:, ::1] out_d = distances
+        cdef _KDTree3DHeap heap
+        heap.dist = <py_float*> PyMem_Malloc(k * sizeof(py_float))
+        heap.rows = <Py_ssize_t*> PyMem_Malloc(k * sizeof(Py_ssize_t))
+        cdef Py_ssize_t i, j
+        try:
+            if heap.dist == NULL or heap.rows == NULL:
+                raise MemoryError()
+            with nogil:
+                for i in range(points.size):
+                    heap.size, heap.k = 0, k
+                    self._knn(points.data + i * 3, 0, self.size, &heap)
+                    _kdtree3d_heap_sort(&heap)
+                    for j in range(k):
+                        out_i[i, j] = self.indices[heap.rows[j]]
+                        out_d[i, j] = sqrtl(heap.dist[j])
+        finally:
+            PyMem_Free(heap.dist)
+            PyMem_Free(heap.rows)
+        return indices, distances
+
+    def query_radius(self, Vec3 point, py_float radius, /) -> array:
+        """Find the indices of all the points within `radius` (inclusive) of `point`, in no particular order."""
+        cdef py_float[3] q
+        q[0] = point.x
+        q[1] = point.y
+        q[2] = point.z
+        cdef IndexList rows = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._radius(q, radius * radius, 0, self.size, &rows)
+            return self._found_indices(&rows)
+        finally:
+            PyMem_RawFree(rows.data)
+
+    def query_radius_many(self, Vec3Array points, py_float radius, /) -> list[array]:
+        """Find the indices of all the points within `radius` (inclusive) of every vector of `points`."""
+        cdef list results = []
+        cdef IndexList rows = IndexList(NULL, 0, 0, False)
+        cdef Py_ssize_t i
+        try:
+            for i in range(points.size):
+                rows.size = 0
+                with nogil:
+                    self._radius(points.data + i * 3, radius * radius, 0, self.size, &rows)
+                results.append(self._found_indices(&rows))
+        finally:
+            PyMem_RawFree(rows.data)
+        return results
+
+
+########## spatial_hash_class.pyx ##########
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class SpatialHash2D:
+    """A uniform grid of cells for broad-phase queries over moving `Vec2` positions.
+
+    Every inserted position gets an integer handle, which stays valid until it is removed (and may be reused after that).
+    Cells are keyed by their integer coordinates in an open addressing table, so queries never create vector objects.
+    """
+
+    # Cells: keys of `2` integers, the head of the list of the entries in each cell,
+    # -1 for a cell that has become empty and -2 for an unused slot
+    cdef py_int* cell_keys
+    cdef Py_ssize_t* cell_heads
+    cdef Py_ssize_t cell_capacity
+    cdef Py_ssize_t cell_used
+    # Entries: doubly linked lists per cell, removed entries are chained by `next` in the free list
+    cdef py_float* positions
+    cdef py_int* keys
+    cdef Py_ssize_t* next
+    cdef Py_ssize_t* prev
+    cdef unsigned char* alive
+    cdef Py_ssize_t capacity
+    cdef Py_ssize_t end
+    cdef Py_ssize_t count
+    cdef Py_ssize_t free_head
+    cdef py_float _cell_size
+
+
+    def __cinit__(self):
+        self.cell_keys = NULL
+        self.cell_heads = NULL
+        self.cell_capacity = self.cell_used = 0
+        self.positions = NULL
+        self.keys = NULL
+        self.next = self.prev = NULL
+        self.alive = NULL
+        self.capacity = self.end = self.count = 0
+        self.free_head = -1
+
+    def __dealloc__(self):
+        PyMem_Free(self.cell_keys)
+        PyMem_Free(self.cell_heads)
+        PyMem_Free(self.positions)
+        PyMem_Free(self.keys)
+        PyMem_Free(self.next)
+        PyMem_Free(self.prev)
+        PyMem_Free(self.alive)
+
+    def __init__(self, py_float cell_size, /):
+        """Create an empty spatial hash with cubic cells of the given size."""
+        if not cell_size > 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+        self._cell_size = cell_size
+        self._rehash(16)
+
+    @property
+    def cell_size(self) -> float:
+        """The edge length of the cells."""
+        return self._cell_size
+
+
+    cdef inline void _key_of(self, const py_float* position, py_int* key) noexcept nogil:
+        cdef int d
+        for d in range(2):
+            key[d] = <py_int> floorl(position[d] / self._cell_size)
+
+    cdef inline Py_ssize_t _probe(self, const py_int* key) noexcept nogil:
+        # The slot of the cell, or the unused slot where it would be inserted
+        cdef uint64_t h = 0
+        cdef int d
+        for d in range(2):
+            h = hash_combine(h, <uint64_t> key[d])
+        cdef Py_ssize_t mask = self.cell_capacity - 1
+        cdef Py_ssize_t slot = <Py_ssize_t> (h & <uint64_t> mask)
+        cdef py_int* k
+        while self.cell_heads[slot] != -2:
+            k = self.cell_keys + slot * 2
+            if k[0] == key[0] and k[1] == key[1]:
+                return slot
+            slot = (slot + 1) & mask
+        return slot
+
+    cdef int _rehash(self, Py_ssize_t capacity) except -1:
+        # Rebuild the cell table, dropping the cells that have become empty
+        cdef py_int* old_keys = self.cell_keys
+        cdef Py_ssize_t* old_heads = self.cell_heads
+        cdef Py_ssize_t old_capacity = self.cell_capacity
+        self.cell_keys = <py_int*> PyMem_Malloc(capacity * 2 * sizeof(py_int))
+        self.cell_heads = <Py_ssize_t*> PyMem_Malloc(capacity * sizeof(Py_ssize_t))
+        if self.cell_keys == NULL or self.cell_heads == NULL:
+            PyMem_Free(self.cell_keys)
+            PyMem_Free(self.cell_heads)
+            self.cell_keys, self.cell_heads = old_keys, old_heads
+            raise MemoryError()
+        self.cell_capacity = capacity
+        self.cell_used = 0
+        cdef Py_ssize_t i, slot
+        for i in range(capacity):
+            self.cell_heads[i] = -2
+        for i in range(old_capacity):
+            if old_heads[i] >= 0:
+                slot = self._probe(old_keys + i * 2)
+                memcpy(self.cell_keys + slot * 2, old_keys + i * 2, 2 * sizeof(py_int))
+                self.cell_heads[slot] = old_heads[i]
+                self.cell_used += 1
+        PyMem_Free(old_keys)
+        PyMem_Free(old_heads)
+        return 0
+
+    cdef int _reserve(self) except -1:
+        # Make room for one more entry
+        if self.free_head >= 0 or self.end < self.capacity:
+            return 0
+        cdef Py_ssize_t capacity = max(16, self.capacity * 2)
+        cdef void* positions = PyMem_Realloc(self.positions, capacity * 2 * sizeof(py_float))
+        if positions != NULL:
+            self.positions = <py_float*> positions
+        cdef void* keys = PyMem_Realloc(self.keys, capacity * 2 * sizeof(py_int))
+        if keys != NULL:
+            self.keys = <py_int*> keys
+        cdef void* next = PyMem_Realloc(self.next, capacity * sizeof(Py_ssize_t))
+        if next != NULL:
+            self.next = <Py_ssize_t*> next
+        cdef void* prev = PyMem_Realloc(self.prev, capacity * sizeof(Py_ssize_t))
+        if prev != NULL:
+            self.prev = <Py_ssize_t*> prev
+        cdef void* alive = PyMem_Realloc(self.alive, capacity * sizeof(unsigned char))
+        if alive != NULL:
+            self.alive = <unsigned char*> alive
+        if positions == NULL or keys == NULL or next == NULL or prev == NULL or alive == NULL:
+            raise MemoryError()
+        self.capacity = capacity
+        return 0
+
+    cdef int _link(self, Py_ssize_t entry) except -1:
+        cdef py_int* key = self.keys + entry * 2
+        cdef Py_ssize_t slot = self._probe(key)
+        if self.cell_heads[slot] == -2:
+            # Keep the table at most half full, counting the empty cells that are kept for probing
+            if (self.cell_used + 1) * 2 > self.cell_capacity:
+                self._rehash(max(16, self.cell_capacity * 2 if self.count * 4 > self.cell_capacity else self.cell_capacity))
+                slot = self._probe(key)
+            memcpy(self.cell_keys + slot * 2, key, 2 * sizeof(py_int))
+            self.cell_heads[slot] = -1
+            self.cell_used += 1
+        self.next[entry] = self.cell_heads[slot]
+        self.prev[entry] = -1
+        if self.next[entry] >= 0:
+            self.prev[self.next[entry]] = entry
+        self.cell_heads[slot] = entry
+        return 0
+
+    cdef inline void _unlink(self, Py_ssize_t entry) noexcept nogil:
+        if self.prev[entry] >= 0:
+            self.next[self.prev[entry]] = self.next[entry]
+        else:
+            self.cell_heads[self._probe(self.keys + entry * 2)] = self.next[entry]
+        if self.next[entry] >= 0:
+            self.prev[self.next[entry]] = self.prev[entry]
+
+    cdef inline Py_ssize_t _entry(self, Py_ssize_t handle) except -1:
+        if not (0 <= handle < self.end and self.alive[handle]):
+            raise KeyError(handle)
+        return handle
+
+    cdef inline void _check(self, Py_ssize_t entry, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+        cdef py_float* p = self.positions + entry * 2
+        cdef py_float dist
+        if center != NULL:
+            dist = (p[0] - center[0]) * (p[0] - center[0]) + (p[1] - center[1]) * (p[1] - center[1])
+            if dist <= radius_sqr:
+                index_list_append(found, entry)
+        elif lo[0] <= p[0] <= hi[0] and lo[1] <= p[1] <= hi[1]:
+            index_list_append(found, entry)
+
+    cdef inline void _collect(self, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+        # Entries inside the box [lo, hi], and also within the radius of the center if it's not NULL
+        cdef py_int[2] klo, khi, key
+        cdef Py_ssize_t slot, entry
+        cdef int d
+        cdef py_float cells = 1
+        self._key_of(lo, klo)
+        self._key_of(hi, khi)
+        for d in range(2):
+            if klo[d] > khi[d]:
+                return
+            cells *= <py_float> (khi[d] - klo[d] + 1)
+        if cells > self.count:
+            # Visiting the cells of a large range would be slower than checking every entry
+            for entry in range(self.end):
+                if self.alive[entry]:
+                    self._check(entry, lo, hi, center, radius_sqr, found)
+            return
+        memcpy(key, klo, 2 * sizeof(py_int))
+        while True:
+            slot = self._probe(key)
+            entry = self.cell_heads[slot] if self.cell_heads[slot] != -2 else -1
+            while entry >= 0:
+                self._check(entry, lo, hi, center, radius_sqr, found)
+                entry = self.next[entry]
+            # Advance to the next cell of the range, like an odometer
+            d = 0
+            while d < 2 and key[d] == khi[d]:
+                key[d] = klo[d]
+                d += 1
+            if d == 2:
+                break
+            key[d] += 1
+
+    cdef inline object _found(self, IndexList* found):
+        if found.failed:
+            raise MemoryError()
+        cdef object result = new_scalar_array("q", found.size)
+        cdef py_int[::1] out = result
+        cdef Py_ssize_t i
+        for i in range(found.size):
+            out[i] = found.data[i]
+        return result
+
+
+    def insert(self, Vec2 position, /) -> int:
+        """Insert a position, return its handle."""
+        self._reserve()
+        cdef Py_ssize_t entry = self.free_head if self.free_head >= 0 else self.end
+        cdef Py_ssize_t free_next = self.next[entry] if self.free_head >= 0 else -1
+        cdef py_float* p = self.positions + entry * 2
+        p[0] = position.x
+        p[1] = position.y
+        self._key_of(p, self.keys + entry * 2)
+        self._link(entry)
+        if entry == self.end:
+            self.end += 1
+        else:
+            self.free_head = free_next
+        self.alive[entry] = True
+        self.count += 1
+        return entry
+
+    def move(self, Py_ssize_t handle, Vec2 position, /) -> None:
+        """Change the position of an entry, relinking it only if it changes cell."""
+        cdef Py_ssize_t entry = self._entry(handle)
+        cdef py_float* p = self.positions + entry * 2
+        p[0] = position.x
+        p[1] = position.y
+        cdef py_int[2] key
+        self._key_of(p, key)
+        cdef py_int* old = self.keys + entry * 2
+        if key[0] == old[0] and key[1] == old[1]:
+            return
+        self._unlink(entry)
+        memcpy(old, key, 2 * sizeof(py_int))
+        self._link(entry)
+
+    def remove(self, Py_ssize_t handle, /) -> None:
+        """Remove an entry, its handle may be reused by a later `insert()`."""
+        cdef Py_ssize_t entry = self._entry(handle)
+        self._unlink(entry)
+        self.alive[entry] = False
+        self.next[entry] = self.free_head
+        self.free_head = entry
+        self.count -= 1
+
+    def position(self, Py_ssize_t handle, /) -> Vec2:
+        """Get the position of an entry."""
+        cdef py_float* p = self.positions + self._entry(handle) * 2
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+        vec.x = p[0]
+        vec.y = p[1]
+        return vec
+
+    def cell_of(self, Vec2 position, /) -> Vec2i:
+        """The integer coordinates of the cell containing the position."""
+        cdef py_float[2] p
+        p[0] = position.x
+        p[1] = position.y
+        cdef py_int[2] key
+        self._key_of(p, key)
+        cdef Vec2i vec = Vec2i.__new__(Vec2i)
+        vec.x = key[0]
+        vec.y = key[1]
+        return vec
+
+    def __len__(self) -> int:
+        """The number of entries."""
+        return self.count
+
+    def __contains__(self, Py_ssize_t handle) -> bool:
+        """If the handle refers to an entry."""
+        return 0 <= handle < self.end and self.alive[handle]
+
+    def query_radius(self, Vec2 center, py_float radius, /) -> array:
+        """The handles of all the entries within `radius` (inclusive) of `center`, in no particular order."""
+        cdef py_float[2] c, lo, hi
+        c[0] = center.x
+        c[1] = center.y
+        lo[0] = center.x - radius
+        lo[1] = center.y - radius
+        hi[0] = center.x + radius
+        hi[1] = center.y + radius
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._collect(lo, hi, c, radius * radius, &found)
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_box(self, Vec2 lo, Vec2 hi, /) -> array:
+        """The handles of all the entries inside the axis-aligned box between the `lo` and `hi` corners (inclusive)."""
+        cdef py_float[2] l, h
+        l[0] = lo.x
+        l[1] = lo.y
+        h[0] = hi.x
+        h[1] = hi.y
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._collect(l, h, NULL, 0, &found)
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_cell(self, Vec2i cell, /) -> array:
+        """The handles of all the entries in a cell."""
+        cdef py_int[2] key
+        key[0] = cell.x
+        key[1] = cell.y
+        cdef Py_ssize_t slot = self._probe(key)
+        cdef Py_ssize_t entry = self.cell_heads[slot] if self.cell_heads[slot] != -2 else -1
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            while entry >= 0:
+                index_list_append(&found, entry)
+                entry = self.next[entry]
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class SpatialHash3D:
+    """A uniform grid of cells for broad-phase queries over moving `Vec3` positions.
+
+    Every inserted position gets an integer handle, which stays valid until it is removed (and may be reused after that).
+    Cells are keyed by their integer coordinates in an open addressing table, so queries never create vector objects.
+    """
+
+    # Cells: keys of `3` integers, the head of the list of the entries in each cell,
+    # -1 for a cell that has become empty and -2 for an unused slot
+    cdef py_int* cell_keys
+    cdef Py_ssize_t* cell_heads
+    cdef Py_ssize_t cell_capacity
+    cdef Py_ssize_t cell_used
+    # Entries: doubly linked lists per cell, removed entries are chained by `next` in the free list
+    cdef py_float* positions
+    cdef py_int* keys
+    cdef Py_ssize_t* next
+    cdef Py_ssize_t* prev
+    cdef unsigned char* alive
+    cdef Py_ssize_t capacity
+    cdef Py_ssize_t end
+    cdef Py_ssize_t count
+    cdef Py_ssize_t free_head
+    cdef py_float _cell_size
+
+
+    def __cinit__(self):
+        self.cell_keys = NULL
+        self.cell_heads = NULL
+        self.cell_capacity = self.cell_used = 0
+        self.positions = NULL
+        self.keys = NULL
+        self.next = self.prev = NULL
+        self.alive = NULL
+        self.capacity = self.end = self.count = 0
+        self.free_head = -1
+
+    def __dealloc__(self):
+        PyMem_Free(self.cell_keys)
+        PyMem_Free(self.cell_heads)
+        PyMem_Free(self.positions)
+        PyMem_Free(self.keys)
+        PyMem_Free(self.next)
+        PyMem_Free(self.prev)
+        PyMem_Free(self.alive)
+
+    def __init__(self, py_float cell_size, /):
+        """Create an empty spatial hash with cubic cells of the given size."""
+        if not cell_size > 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+        self._cell_size = cell_size
+        self._rehash(16)
+
+    @property
+    def cell_size(self) -> float:
+        """The edge length of the cells."""
+        return self._cell_size
+
+
+    cdef inline void _key_of(self, const py_float* position, py_int* key) noexcept nogil:
+        cdef int d
+        for d in range(3):
+            key[d] = <py_int> floorl(position[d] / self._cell_size)
+
+    cdef inline Py_ssize_t _probe(self, const py_int* key) noexcept nogil:
+        # The slot of the cell, or the unused slot where it would be inserted
+        cdef uint64_t h = 0
+        cdef int d
+        for d in range(3):
+            h = hash_combine(h, <uint64_t> key[d])
+        cdef Py_ssize_t mask = self.cell_capacity - 1
+        cdef Py_ssize_t slot = <Py_ssize_t> (h & <uint64_t> mask)
+        cdef py_int* k
+        while self.cell_heads[slot] != -2:
+            k = self.cell_keys + slot * 3
+            if k[0] == key[0] and k[1] == key[1] and k[2] == key[2]:
+                return slot
+            slot = (slot + 1) & mask
+        return slot
+
+    cdef int _rehash(self, Py_ssize_t capacity) except -1:
+        # Rebuild the cell table, dropping the cells that have become empty
+        cdef py_int* old_keys = self.cell_keys
+        cdef Py_ssize_t* old_heads = self.cell_heads
+        cdef Py_ssize_t old_capacity = self.cell_capacity
+        self.cell_keys = <py_int*> PyMem_Malloc(capacity * 3 * sizeof(py_int))
+        self.cell_heads = <Py_ssize_t*> PyMem_Malloc(capacity * sizeof(Py_ssize_t))
+        if self.cell_keys == NULL or self.cell_heads == NULL:
+            PyMem_Free(self.cell_keys)
+            PyMem_Free(self.cell_heads)
+            self.cell_keys, self.cell_heads = old_keys, old_heads
+            raise MemoryError()
+        self.cell_capacity = capacity
+        self.cell_used = 0
+        cdef Py_ssize_t i, slot
+        for i in range(capacity):
+            self.cell_heads[i] = -2
+        for i in range(old_capacity):
+            if old_heads[i] >= 0:
+                slot = self._probe(old_keys + i * 3)
+                memcpy(self.cell_keys + slot * 3, old_keys + i * 3, 3 * sizeof(py_int))
+                self.cell_heads[slot] = old_heads[i]
+                self.cell_used += 1
+        PyMem_Free(old_keys)
+        PyMem_Free(old_heads)
+        return 0
+
+    cdef int _reserve(self) except -1:
+        # Make room for one more entry
+        if self.free_head >= 0 or self.end < self.capacity:
+            return 0
+        cdef Py_ssize_t capacity = max(16, self.capacity * 2)
+        cdef void* positions = PyMem_Realloc(self.positions, capacity * 3 * sizeof(py_float))
+        if positions != NULL:
+            self.positions = <py_float*> positions
+        cdef void* keys = PyMem_Realloc(self.keys, capacity * 3 * sizeof(py_int))
+        if keys != NULL:
+            self.keys = <py_int*> keys
+        cdef void* next = PyMem_Realloc(self.next, capacity * sizeof(Py_ssize_t))
+        if next != NULL:
+            self.next = <Py_ssize_t*> next
+        cdef void* prev = PyMem_Realloc(self.prev, capacity * sizeof(Py_ssize_t))
+        if prev != NULL:
+            self.prev = <Py_ssize_t*> prev
+        cdef void* alive = PyMem_Realloc(self.alive, capacity * sizeof(unsigned char))
+        if alive != NULL:
+            self.alive = <unsigned char*> alive
+        if positions == NULL or keys == NULL or next == NULL or prev == NULL or alive == NULL:
+            raise MemoryError()
+        self.capacity = capacity
+        return 0
+
+    cdef int _link(self, Py_ssize_t entry) except -1:
+        cdef py_int* key = self.keys + entry * 3
+        cdef Py_ssize_t slot = self._probe(key)
+        if self.cell_heads[slot] == -2:
+            # Keep the table at most half full, counting the empty cells that are kept for probing
+            if (self.cell_used + 1) * 2 > self.cell_capacity:
+                self._rehash(max(16, self.cell_capacity * 2 if self.count * 4 > self.cell_capacity else self.cell_capacity))
+                slot = self._probe(key)
+            memcpy(self.cell_keys + slot * 3, key, 3 * sizeof(py_int))
+            self.cell_heads[slot] = -1
+            self.cell_used += 1
+        self.next[entry] = self.cell_heads[slot]
+        self.prev[entry] = -1
+        if self.next[entry] >= 0:
+            self.prev[self.next[entry]] = entry
+        self.cell_heads[slot] = entry
+        return 0
+
+    cdef inline void _unlink(self, Py_ssize_t entry) noexcept nogil:
+        if self.prev[entry] >= 0:
+            self.next[self.prev[entry]] = self.next[entry]
+        else:
+            self.cell_heads[self._probe(self.keys + entry * 3)] = self.next[entry]
+        if self.next[entry] >= 0:
+            self.prev[self.next[entry]] = self.prev[entry]
+
+    cdef inline Py_ssize_t _entry(self, Py_ssize_t handle) except -1:
+        if not (0 <= handle < self.end and self.alive[handle]):
+            raise KeyError(handle)
+        return handle
+
+    cdef inline void _check(self, Py_ssize_t entry, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+        cdef py_float* p = self.positions + entry * 3
+        cdef py_float dist
+        if center != NULL:
+            dist = (p[0] - center[0]) * (p[0] - center[0]) + (p[1] - center[1]) * (p[1] - center[1]) + (p[2] - center[2]) * (p[2] - center[2])
+            if dist <= radius_sqr:
+                index_list_append(found, entry)
+        elif lo[0] <= p[0] <= hi[0] and lo[1] <= p[1] <= hi[1] and lo[2] <= p[2] <= hi[2]:
+            index_list_append(found, entry)
+
+    cdef inline void _collect(self, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+        # Entries inside the box [lo, hi], and also within the radius of the center if it's not NULL
+        cdef py_int[3] klo, khi, key
+        cdef Py_ssize_t slot, entry
+        cdef int d
+        cdef py_float cells = 1
+        self._key_of(lo, klo)
+        self._key_of(hi, khi)
+        for d in range(3):
+            if klo[d] > khi[d]:
+                return
+            cells *= <py_float> (khi[d] - klo[d] + 1)
+        if cells > self.count:
+            # Visiting the cells of a large range would be slower than checking every entry
+            for entry in range(self.end):
+                if self.alive[entry]:
+                    self._check(entry, lo, hi, center, radius_sqr, found)
+            return
+        memcpy(key, klo, 3 * sizeof(py_int))
+        while True:
+            slot = self._probe(key)
+            entry = self.cell_heads[slot] if self.cell_heads[slot] != -2 else -1
+            while entry >= 0:
+                self._check(entry, lo, hi, center, radius_sqr, found)
+                entry = self.next[entry]
+            # Advance to the next cell of the range, like an odometer
+            d = 0
+            while d < 3 and key[d] == khi[d]:
+                key[d] = klo[d]
+                d += 1
+            if d == 3:
+                break
+            key[d] += 1
+
+    cdef inline object _found(self, IndexList* found):
+        if found.failed:
+            raise MemoryError()
+        cdef object result = new_scalar_array("q", found.size)
+        cdef py_int[::1] out = result
+        cdef Py_ssize_t i
+        for i in range(found.size):
+            out[i] = found.data[i]
+        return result
+
+
+    def insert(self, Vec3 position, /) -> int:
+        """Insert a position, return its handle."""
+        self._reserve()
+        cdef Py_ssize_t entry = self.free_head if self.free_head >= 0 else self.end
+        cdef Py_ssize_t free_next = self.next[entry] if self.free_head >= 0 else -1
+        cdef py_float* p = self.positions + entry * 3
+        p[0] = position.x
+        p[1] = position.y
+        p[2] = position.z
+        self._key_of(p, self.keys + entry * 3)
+        self._link(entry)
+        if entry == self.end:
+            self.end += 1
+        else:
+            self.free_head = free_next
+        self.alive[entry] = True
+        self.count += 1
+        return entry
+
+    def move(self, Py_ssize_t handle, Vec3 position, /) -> None:
+        """Change the position of an entry, relinking it only if it changes cell."""
+        cdef Py_ssize_t entry = self._entry(handle)
+        cdef py_float* p = self.positions + entry * 3
+        p[0] = position.x
+        p[1] = position.y
+        p[2] = position.z
+        cdef py_int[3] key
+        self._key_of(p, key)
+        cdef py_int* old = self.keys + entry * 3
+        if key[0] == old[0] and key[1] == old[1] and key[2] == old[2]:
+            return
+        self._unlink(entry)
+        memcpy(old, key, 3 * sizeof(py_int))
+        self._link(entry)
+
+    def remove(self, Py_ssize_t handle, /) -> None:
+        """Remove an entry, its handle may be reused by a later `insert()`."""
+        cdef Py_ssize_t entry = self._entry(handle)
+        self._unlink(entry)
+        self.alive[entry] = False
+        self.next[entry] = self.free_head
+        self.free_head = entry
+        self.count -= 1
+
+    def position(self, Py_ssize_t handle, /) -> Vec3:
+        """Get the position of an entry."""
+        cdef py_float* p = self.positions + self._entry(handle) * 3
+        cdef Vec3 vec = Vec3.__new__(Vec3)
+        vec.x = p[0]
+        vec.y = p[1]
+        vec.z = p[2]
+        return vec
+
+    def cell_of(self, Vec3 position, /) -> Vec3i:
+        """The integer coordinates of the cell containing the position."""
+        cdef py_float[3] p
+        p[0] = position.x
+        p[1] = position.y
+        p[2] = position.z
+        cdef py_int[3] key
+        self._key_of(p, key)
+        cdef Vec3i vec = Vec3i.__new__(Vec3i)
+        vec.x = key[0]
+        vec.y = key[1]
+        vec.z = key[2]
+        return vec
+
+    def __len__(self) -> int:
+        """The number of entries."""
+        return self.count
+
+    def __contains__(self, Py_ssize_t handle) -> bool:
+        """If the handle refers to an entry."""
+        return 0 <= handle < self.end and self.alive[handle]
+
+    def query_radius(self, Vec3 center, py_float radius, /) -> array:
+        """The handles of all the entries within `radius` (inclusive) of `center`, in no particular order."""
+        cdef py_float[3] c, lo, hi
+        c[0] = center.x
+        c[1] = center.y
+        c[2] = center.z
+        lo[0] = center.x - radius
+        lo[1] = center.y - radius
+        lo[2] = center.z - radius
+        hi[0] = center.x + radius
+        hi[1] = center.y + radius
+        hi[2] = center.z + radius
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._collect(lo, hi, c, radius * radius, &found)
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_box(self, Vec3 lo, Vec3 hi, /) -> array:
+        """The handles of all the entries inside the axis-aligned box between the `lo` and `hi` corners (inclusive)."""
+        cdef py_float[3] l, h
+        l[0] = lo.x
+        l[1] = lo.y
+        l[2] = lo.z
+        h[0] = hi.x
+        h[1] = hi.y
+        h[2] = hi.z
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._collect(l, h, NULL, 0, &found)
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_cell(self, Vec3i cell, /) -> array:
+        """The handles of all the entries in a cell."""
+        cdef py_int[3] key
+        key[0] = cell.x
+        key[1] = cell.y
+        key[2] = cell.z
+        cdef Py_ssize_t slot = self._probe(key)
+        cdef Py_ssize_t entry = self.cell_heads[slot] if self.cell_heads[slot] != -2 else -1
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            while entry >= 0:
+                index_list_append(&found, entry)
+                entry = self.next[entry]
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+
+
+########## vec_store_class.pyx ##########
+cdef inline void _vec2d_store_bounds(const buffer_float* p, Py_ssize_t size, py_float* lo, py_float* hi) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef int d
+    cdef py_float v
+    for d in range(2):
+        lo[d] = hi[d] = p[d]
+    for i in range(2, size * 2, 2):
+        for d in range(2):
+            v = p[i + d]
+            if v < lo[d]:
+                lo[d] = v
+            elif v > hi[d]:
+                hi[d] = v
+
+cdef inline void _vec2d_store_transform(const buffer_float* p, buffer_float* out, Py_ssize_t size, const py_float* t) noexcept nogil:
+    # Same as `Transform2D.__call__()` for every vector, `out` may alias `p`
+    cdef Py_ssize_t i
+    cdef py_float x, y
+    for i in range(0, size * 2, 2):
+        x = p[i + 0]
+        y = p[i + 1]
+        out[i + 0] = <buffer_float> (x * t[0] + y * t[2] + t[4])
+        out[i + 1] = <buffer_float> (x * t[1] + y * t[3] + t[5])
+
+cdef inline void _vec2d_store_select(const buffer_float* p, Py_ssize_t size, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+    # Indices of the vectors inside the box [lo, hi], or within the radius of the center if it's not NULL
+    cdef Py_ssize_t i
+    cdef const buffer_float* q
+    cdef py_float dist
+    for i in range(size):
+        q = p + i * 2
+        if center != NULL:
+            dist = (q[0] - center[0]) * (q[0] - center[0]) + (q[1] - center[1]) * (q[1] - center[1])
+            if dist <= radius_sqr:
+                index_list_append(found, i)
+        elif lo[0] <= q[0] <= hi[0] and lo[1] <= q[1] <= hi[1]:
+            index_list_append(found, i)
+
+cdef inline int _vec2d_store_check_format(str format) except -1:
+    if format not in ("d", "f"):
+        raise ValueError(f"Expected format 'd' (float64) or 'f' (float32), got {format!r}")
+    return 0
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Vec2Store:
+    """A file of float64 or float32 `Vec2`s mapped into memory with `mmap`, for point sets larger than the memory.
+
+    Nothing is read up front: indexing and slicing copy single vectors or chunks out of the mapping,
+    and the batch operations stream through it without any intermediate copies.
+    """
+
+    cdef object mapping
+    cdef Py_buffer view
+    cdef char* data
+    cdef Py_ssize_t size
+    cdef bint is_double
+    cdef bint is_writable
+    cdef bint is_closed
+
+
+    def __cinit__(self):
+        self.mapping = None
+        self.data = NULL
+        self.size = 0
+        self.is_closed = True
+
+    def __dealloc__(self):
+        if self.data != NULL:
+            PyBuffer_Release(&self.view)
+
+    def __init__(self, str path, /, str format = "d", bint writable = False):
+        """Map an existing file of contiguous `format` ("d" for float64 or "f" for float32) vectors in native byte order.
+
+        The file is only modified through the store if `writable` is True.
+        """
+        _vec2d_store_check_format(format)
+        self.is_double = format == "d"
+        self.is_writable = writable
+        cdef Py_ssize_t stride = self._stride()
+        with open(path, "r+b" if writable else "rb") as file:
+            length = os.fstat(file.fileno()).st_size
+            if length % stride != 0:
+                raise ValueError(f"File size {length} is not a multiple of the {stride} bytes of a vector")
+            # Empty files can't be mapped
+            if length != 0:
+                self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        if self.mapping is not None:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # Reading ahead of the batch operations matters more than the random access
+                self.mapping.madvise(mmap.MADV_SEQUENTIAL)
+            PyObject_GetBuffer(self.mapping, &self.view, PyBUF_SIMPLE | (PyBUF_WRITABLE if writable else 0))
+            self.data = <char*> self.view.buf
+            self.size = length // stride
+        self.is_closed = False
+
+    @staticmethod
+    def create(str path, Py_ssize_t size, /, str format = "d") -> Vec2Store:
+        """Create (or overwrite) a file of `size` zero vectors and map it writable."""
+        if size < 0:
+            raise ValueError(f"Negative Vec2Store size: {size}")
+        _vec2d_store_check_format(format)
+        with open(path, "wb") as file:
+            file.truncate(size * 2 * (8 if format == "d" else 4))
+        return Vec2Store(path, format, True)
+
+    cdef inline Py_ssize_t _stride(self) noexcept:
+        return 2 * (sizeof(double) if self.is_double else sizeof(float))
+
+    cdef inline int _check_open(self) except -1:
+        if self.is_closed:
+            raise ValueError("I/O operation on a closed Vec2Store")
+        return 0
+
+    cdef inline int _check_writable(self) except -1:
+        self._check_open()
+        if not self.is_writable:
+            raise TypeError("Vec2Store is read-only")
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Vec2Store index out of range: {index}")
+        return index
+
+    cdef inline void _read(self, Py_ssize_t index, py_float* out) noexcept nogil:
+        cdef const double* pd
+        cdef const float* pf
+        if self.is_double:
+            pd = <const double*> self.data + index * 2
+            out[0] = pd[0]
+            out[1] = pd[1]
+        else:
+            pf = <const float*> self.data + index * 2
+            out[0] = pf[0]
+            out[1] = pf[1]
+
+    cdef inline void _write(self, Py_ssize_t index, const py_float* value) noexcept nogil:
+        cdef double* pd
+        cdef float* pf
+        if self.is_double:
+            pd = <double*> self.data + index * 2
+            pd[0] = <double> value[0]
+            pd[1] = <double> value[1]
+        else:
+            pf = <float*> self.data + index * 2
+            pf[0] = <float> value[0]
+            pf[1] = <float> value[1]
+
+    def close(self) -> None:
+        """Flush the changes and unmap the file, the store can't be used afterwards."""
+        if self.is_closed:
+            return
+        if self.data != NULL:
+            PyBuffer_Release(&self.view)
+            self.data = NULL
+        if self.mapping is not None:
+            if self.is_writable:
+                self.mapping.flush()
+            self.mapping.close()
+            self.mapping = None
+        self.is_closed = True
+
+    def flush(self) -> None:
+        """Write the changes back to the file."""
+        self._check_open()
+        if self.mapping is not None and self.is_writable:
+            self.mapping.flush()
+
+    def __enter__(self) -> Vec2Store:
+        #<RETURN_SELF>
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Vec2Store({self.size} vectors, format={self.format!r}{', closed' if self.is_closed else ''})"
+
+    @property
+    def format(self) -> str:
+        """The buffer format of the elements in the file, "d" (float64) or "f" (float32)."""
+        return "d" if self.is_double else "f"
+
+    @property
+    def writable(self) -> bool:
+        """If the file can be modified through this store."""
+        return self.is_writable
+
+    @property
+    def closed(self) -> bool:
+        """If the store has been closed."""
+        return self.is_closed
+
+
+    def __len__(self) -> int:
+        """The number of vectors in the file."""
+        return self.size
+
+    def __getitem__(self, object key) -> Vec2 | Vec2Array:
+        """Read the n-th vector, or read a slice of vectors into a `Vec2Array`."""
+        self._check_open()
+        cdef Vec2 vec
+        cdef py_float[2] value
+        if not isinstance(key, slice):
+            self._read(self._index(key), value)
+            vec = Vec2.__new__(Vec2)
+            vec.x = value[0]
+            vec.y = value[1]
+            return vec
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        cdef Vec2Array arr = Vec2Array(len(range(start, stop, step)))
+        with nogil:
+            for i in range(arr.size):
+                self._read(start + i * step, arr.data + i * 2)
+        return arr
+
+    def __setitem__(self, object key, object value) -> None:
+        """Write the n-th vector, or write a `Vec2Array` to a slice of the same length."""
+        self._check_writable()
+        cdef Vec2 vec
+        cdef Vec2Array arr
+        cdef py_float[2] v
+        if not isinstance(key, slice):
+            vec = <Vec2?> value
+            v[0] = vec.x
+            v[1] = vec.y
+            self._write(self._index(key), v)
+            return
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        arr = <Vec2Array?> value
+        if arr.size != len(range(start, stop, step)):
+            raise ValueError(f"Vec2Store slice size mismatch: {len(range(start, stop, step))} and {arr.size}")
+        with nogil:
+            for i in range(arr.size):
+                self._write(start + i * step, arr.data + i * 2)
+
+    def chunks(self, Py_ssize_t size = 65536, /) -> Iterator[Vec2Array]:
+        """Read the vectors in consecutive `Vec2Array`s of (up to) `size` vectors."""
+        if size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {size}")
+        self._check_open()
+        return (self[start:start + size] for start in range(0, self.size, size))
+
+
+    def bounds(self) -> tuple[Vec2, Vec2]:
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        self._check_open()
+        if self.size == 0:
+            raise ValueError("Reduction of an empty Vec2Store")
+        cdef py_float[2] lo, hi
+        with nogil:
+            if self.is_double:
+                _vec2d_store_bounds(<const double*> self.data, self.size, lo, hi)
+            else:
+                _vec2d_store_bounds(<const float*> self.data, self.size, lo, hi)
+        cdef Vec2 vmin = Vec2.__new__(Vec2)
+        cdef Vec2 vmax = Vec2.__new__(Vec2)
+        vmin.x = lo[0]
+        vmin.y = lo[1]
+        vmax.x = hi[0]
+        vmax.y = hi[1]
+        return vmin, vmax
+
+    def transform_into(self, Transform2D transform, Vec2Store out, /) -> Vec2Store:
+        """Apply `transform` to every vector and write the results into `out` (which can be `self`), then return `out`.
+
+        Both stores must have the same length and format.
+        """
+        self._check_open()
+        out._check_writable()
+        if out.size != self.size or out.is_double != self.is_double:
+            raise ValueError(f"Vec2Store mismatch: {self!r} and {out!r}")
+        cdef const py_float* t = &transform.xx
+        with nogil:
+            if self.is_double:
+                _vec2d_store_transform(<const double*> self.data, <double*> out.data, self.size, t)
+            else:
+                _vec2d_store_transform(<const float*> self.data, <float*> out.data, self.size, t)
+        return out
+
+    def transform_ip(self, Transform2D transform, /) -> Vec2Store:
+        #<RETURN_SELF>
+        """Apply `transform` to every vector inplace."""
+        return self.transform_into(transform, self)
+
+    cdef inline object _select(self, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr):
+        self._check_open()
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        cdef object result
+        cdef py_int[::1] out
+        cdef Py_ssize_t i
+        try:
+            with nogil:
+                if self.is_double:
+                    _vec2d_store_select(<const double*> self.data, self.size, lo, hi, center, radius_sqr, &found)
+                else:
+                    _vec2d_store_select(<const float*> self.data, self.size, lo, hi, center, radius_sqr, &found)
+            if found.failed:
+                raise MemoryError()
+            result = new_scalar_array("q", found.size)
+            out = result
+            for i in range(found.size):
+                out[i] = found.data[i]
+            return result
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_box(self, Vec2 lo, Vec2 hi, /) -> array:
+        """The indices of all the vectors inside the axis-aligned box between the `lo` and `hi` corners (inclusive), in ascending order."""
+        cdef py_float[2] l, h
+        l[0] = lo.x
+        l[1] = lo.y
+        h[0] = hi.x
+        h[1] = hi.y
+        return self._select(l, h, NULL, 0)
+
+    def query_radius(self, Vec2 center, py_float radius, /) -> array:
+        """The indices of all the vectors within `radius` (inclusive) of `center`, in ascending order."""
+        cdef py_float[2] c
+        c[0] = center.x
+        c[1] = center.y
+        return self._select(NULL, NULL, c, radius * radius)
+
+cdef inline void _vec3d_store_bounds(const buffer_float* p, Py_ssize_t size, py_float* lo, py_float* hi) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef int d
+    cdef py_float v
+    for d in range(3):
+        lo[d] = hi[d] = p[d]
+    for i in range(3, size * 3, 3):
+        for d in range(3):
+            v = p[i + d]
+            if v < lo[d]:
+                lo[d] = v
+            elif v > hi[d]:
+                hi[d] = v
+
+cdef inline void _vec3d_store_transform(const buffer_float* p, buffer_float* out, Py_ssize_t size, const py_float* t) noexcept nogil:
+    # Same as `Transform3D.__call__()` for every vector, `out` may alias `p`
+    cdef Py_ssize_t i
+    cdef py_float x, y, z
+    for i in range(0, size * 3, 3):
+        x = p[i + 0]
+        y = p[i + 1]
+        z = p[i + 2]
+        out[i + 0] = <buffer_float> (x * t[0] + y * t[3] + z * t[6] + t[9])
+        out[i + 1] = <buffer_float> (x * t[1] + y * t[4] + z * t[7] + t[10])
+        out[i + 2] = <buffer_float> (x * t[2] + y * t[5] + z * t[8] + t[11])
+
+cdef inline void _vec3d_store_select(const buffer_float* p, Py_ssize_t size, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+    # Indices of the vectors inside the box [lo, hi], or within the radius of the center if it's not NULL
+    cdef Py_ssize_t i
+    cdef const buffer_float* q
+    cdef py_float dist
+    for i in range(size):
+        q = p + i * 3
+        if center != NULL:
+            dist = (q[0] - center[0]) * (q[0] - center[0]) + (q[1] - center[1]) * (q[1] - center[1]) + (q[2] - center[2]) * (q[2] - center[2])
+            if dist <= radius_sqr:
+                index_list_append(found, i)
+        elif lo[0] <= q[0] <= hi[0] and lo[1] <= q[1] <= hi[1] and lo[2] <= q[2] <= hi[2]:
+            index_list_append(found, i)
+
+cdef inline int _vec3d_store_check_format(str format) except -1:
+    if format not in ("d", "f"):
+        raise ValueError(f"Expected format 'd' (float64) or 'f' (float32), got {format!r}")
+    return 0
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Vec3Store:
+    """A file of float64 or float32 `Vec3`s mapped into memory with `mmap`, for point sets larger than the memory.
+
+    Nothing is read up front: indexing and slicing copy single vectors or chunks out of the mapping,
+    and the batch operations stream through it without any intermediate copies.
+    """
+
+    cdef object mapping
+    cdef Py_buffer view
+    cdef char* data
+    cdef Py_ssize_t size
+    cdef bint is_double
+    cdef bint is_writable
+    cdef bint is_closed
+
+
+    def __cinit__(self):
+        self.mapping = None
+        self.data = NULL
+        self.size = 0
+        self.is_closed = True
+
+    def __dealloc__(self):
+        if self.data != NULL:
+            PyBuffer_Release(&self.view)
+
+    def __init__(self, str path, /, str format = "d", bint writable = False):
+        """Map an existing file of contiguous `format` ("d" for float64 or "f" for float32) vectors in native byte order.
+
+        The file is only modified through the store if `writable` is True.
+        """
+        _vec3d_store_check_format(format)
+        self.is_double = format == "d"
+        self.is_writable = writable
+        cdef Py_ssize_t stride = self._stride()
+        with open(path, "r+b" if writable else "rb") as file:
+            length = os.fstat(file.fileno()).st_size
+            if length % stride != 0:
+                raise ValueError(f"File size {length} is not a multiple of the {stride} bytes of a vector")
+            # Empty files can't be mapped
+            if length != 0:
+                self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        if self.mapping is not None:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # Reading ahead of the batch operations matters more than the random access
+                self.mapping.madvise(mmap.MADV_SEQUENTIAL)
+            PyObject_GetBuffer(self.mapping, &self.view, PyBUF_SIMPLE | (PyBUF_WRITABLE if writable else 0))
+            self.data = <char*> self.view.buf
+            self.size = length // stride
+        self.is_closed = False
+
+    @staticmethod
+    def create(str path, Py_ssize_t size, /, str format = "d") -> Vec3Store:
+        """Create (or overwrite) a file of `size` zero vectors and map it writable."""
+        if size < 0:
+            raise ValueError(f"Negative Vec3Store size: {size}")
+        _vec3d_store_check_format(format)
+        with open(path, "wb") as file:
+            file.truncate(size * 3 * (8 if format == "d" else 4))
+        return Vec3Store(path, format, True)
+
+    cdef inline Py_ssize_t _stride(self) noexcept:
+        return 3 * (sizeof(double) if self.is_double else sizeof(float))
+
+    cdef inline int _check_open(self) except -1:
+        if self.is_closed:
+            raise ValueError("I/O operation on a closed Vec3Store")
+        return 0
+
+    cdef inline int _check_writable(self) except -1:
+        self._check_open()
+        if not self.is_writable:
+            raise TypeError("Vec3Store is read-only")
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Vec3Store index out of range: {index}")
+        return index
+
+    cdef inline void _read(self, Py_ssize_t index, py_float* out) noexcept nogil:
+        cdef const double* pd
+        cdef const float* pf
+        if self.is_double:
+            pd = <const double*> self.data + index * 3
+            out[0] = pd[0]
+            out[1] = pd[1]
+            out[2] = pd[2]
+        else:
+            pf = <const float*> self.data + index * 3
+            out[0] = pf[0]
+            out[1] = pf[1]
+            out[2] = pf[2]
+
+    cdef inline void _write(self, Py_ssize_t index, const py_float* value) noexcept nogil:
+        cdef double* pd
+        cdef float* pf
+        if self.is_double:
+            pd = <double*> self.data + index * 3
+            pd[0] = <double> value[0]
+            pd[1] = <double> value[1]
+            pd[2] = <double> value[2]
+        else:
+            pf = <float*> self.data + index * 3
+            pf[0] = <float> value[0]
+            pf[1] = <float> value[1]
+            pf[2] = <float> value[2]
+
+    def close(self) -> None:
+        """Flush the changes and unmap the file, the store can't be used afterwards."""
+        if self.is_closed:
+            return
+        if self.data != NULL:
+            PyBuffer_Release(&self.view)
+            self.data = NULL
+        if self.mapping is not None:
+            if self.is_writable:
+                self.mapping.flush()
+            self.mapping.close()
+            self.mapping = None
+        self.is_closed = True
+
+    def flush(self) -> None:
+        """Write the changes back to the file."""
+        self._check_open()
+        if self.mapping is not None and self.is_writable:
+            self.mapping.flush()
+
+    def __enter__(self) -> Vec3Store:
+        #<RETURN_SELF>
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Vec3Store({self.size} vectors, format={self.format!r}{', closed' if self.is_closed else ''})"
+
+    @property
+    def format(self) -> str:
+        """The buffer format of the elements in the file, "d" (float64) or "f" (float32)."""
+        return "d" if self.is_double else "f"
+
+    @property
+    def writable(self) -> bool:
+        """If the file can be modified through this store."""
+        return self.is_writable
+
+    @property
+    def closed(self) -> bool:
+        """If the store has been closed."""
+        return self.is_closed
+
+
+    def __len__(self) -> int:
+        """The number of vectors in the file."""
+        return self.size
+
+    def __getitem__(self, object key) -> Vec3 | Vec3Array:
+        """Read the n-th vector, or read a slice of vectors into a `Vec3Array`."""
+        self._check_open()
+        cdef Vec3 vec
+        cdef py_float[3] value
+        if not isinstance(key, slice):
+            self._read(self._index(key), value)
+            vec = Vec3.__new__(Vec3)
+            vec.x = value[0]
+            vec.y = value[1]
+            vec.z = value[2]
+            return vec
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        cdef Vec3Array arr = Vec3Array(len(range(start, stop, step)))
+        with nogil:
+            for i in range(arr.size):
+                self._read(start + i * step, arr.data + i * 3)
+        return arr
+
+    def __setitem__(self, object key, object value) -> None:
+        """Write the n-th vector, or write a `Vec3Array` to a slice of the same length."""
+        self._check_writable()
+        cdef Vec3 vec
+        cdef Vec3Array arr
+        cdef py_float[3] v
+        if not isinstance(key, slice):
+            vec = <Vec3?> value
+            v[0] = vec.x
+            v[1] = vec.y
+            v[2] = vec.z
+            self._write(self._index(key), v)
+            return
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        arr = <Vec3Array?> value
+        if arr.size != len(range(start, stop, step)):
+            raise ValueError(f"Vec3Store slice size mismatch: {len(range(start, stop, step))} and {arr.size}")
+        with nogil:
+            for i in range(arr.size):
+                self._write(start + i * step, arr.data + i * 3)
+
+    def chunks(self, Py_ssize_t size = 65536, /) -> Iterator[Vec3Array]:
+        """Read the vectors in consecutive `Vec3Array`s of (up to) `size` vectors."""
+        if size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {size}")
+        self._check_open()
+        return (self[start:start + size] for start in range(0, self.size, size))
+
+
+    def bounds(self) -> tuple[Vec3, Vec3]:
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        self._check_open()
+        if self.size == 0:
+            raise ValueError("Reduction of an empty Vec3Store")
+        cdef py_float[3] lo, hi
+        with nogil:
+            if self.is_double:
+                _vec3d_store_bounds(<const double*> self.data, self.size, lo, hi)
+            else:
+                _vec3d_store_bounds(<const float*> self.data, self.size, lo, hi)
+        cdef Vec3 vmin = Vec3.__new__(Vec3)
+        cdef Vec3 vmax = Vec3.__new__(Vec3)
+        vmin.x = lo[0]
+        vmin.y = lo[1]
+        vmin.z = lo[2]
+        vmax.x = hi[0]
+        vmax.y = hi[1]
+        vmax.z = hi[2]
+        return vmin, vmax
+
+    def transform_into(self, Transform3D transform, Vec3Store out, /) -> Vec3Store:
+        """Apply `transform` to every vector and write the results into `out` (which can be `self`), then return `out`.
+
+        Both stores must have the same length and format.
+        """
+        self._check_open()
+        out._check_writable()
+        if out.size != self.size or out.is_double != self.is_double:
+            raise ValueError(f"Vec3Store mismatch: {self!r} and {out!r}")
+        cdef const py_float* t = &transform.xx
+        with nogil:
+            if self.is_double:
+                _vec3d_store_transform(<const double*> self.data, <double*> out.data, self.size, t)
+            else:
+                _vec3d_store_transform(<const float*> self.data, <float*> out.data, self.size, t)
+        return out
+
+    def transform_ip(self, Transform3D transform, /) -> Vec3Store:
+        #<RETURN_SELF>
+        """Apply `transform` to every vector inplace."""
+        return self.transform_into(transform, self)
+
+    cdef inline object _select(self, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr):
+        self._check_open()
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        cdef object result
+        cdef py_int[::1] out
+        cdef Py_ssize_t i
+        try:
+            with nogil:
+                if self.is_double:
+                    _vec3d_store_select(<const double*> self.data, self.size, lo, hi, center, radius_sqr, &found)
+                else:
+                    _vec3d_store_select(<const float*> self.data, self.size, lo, hi, center, radius_sqr, &found)
+            if found.failed:
+                raise MemoryError()
+            result = new_scalar_array("q", found.size)
+            out = result
+            for i in range(found.size):
+                out[i] = found.data[i]
+            return result
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_box(self, Vec3 lo, Vec3 hi, /) -> array:
+        """The indices of all the vectors inside the axis-aligned box between the `lo` and `hi` corners (inclusive), in ascending order."""
+        cdef py_float[3] l, h
+        l[0] = lo.x
+        l[1] = lo.y
+        l[2] = lo.z
+        h[0] = hi.x
+        h[1] = hi.y
+        h[2] = hi.z
+        return self._select(l, h, NULL, 0)
+
+    def query_radius(self, Vec3 center, py_float radius, /) -> array:
+        """The indices of all the vectors within `radius` (inclusive) of `center`, in ascending order."""
+        cdef py_float[3] c
+        c[0] = center.x
+        c[1] = center.y
+        c[2] = center.z
+        return self._select(NULL, NULL, c, radius * radius)
+
+
+########## voxel_container_class.pyx ##########
+# Voxel coordinates are packed into 21 bits per axis, so packed keys never have the highest bit set
+DEF VOXEL_BITS = 21
+DEF VOXEL_OFFSET = 1 << 20
+DEF VOXEL_MASK = (1 << 21) - 1
+# Markers of the unused and the removed slots of the voxel tables, larger than any packed key
+cdef uint64_t VOXEL_EMPTY = 0xFFFFFFFFFFFFFFFFULL
+cdef uint64_t VOXEL_TOMBSTONE = 0xFFFFFFFFFFFFFFFEULL
+
+cdef inline bint voxel_in_range(py_int x, py_int y, py_int z) noexcept nogil:
+    return -VOXEL_OFFSET <= x < VOXEL_OFFSET and -VOXEL_OFFSET <= y < VOXEL_OFFSET and -VOXEL_OFFSET <= z < VOXEL_OFFSET
+
+cdef inline uint64_t pack_voxel_xyz(py_int x, py_int y, py_int z) noexcept nogil:
+    return (<uint64_t> (x + VOXEL_OFFSET) << (2 * VOXEL_BITS)) | (<uint64_t> (y + VOXEL_OFFSET) << VOXEL_BITS) | <uint64_t> (z + VOXEL_OFFSET)
+
+cdef inline py_int unpack_voxel_x(uint64_t key) noexcept nogil:
+    return <py_int> ((key >> (2 * VOXEL_BITS)) & VOXEL_MASK) - VOXEL_OFFSET
+
+cdef inline py_int unpack_voxel_y(uint64_t key) noexcept nogil:
+    return <py_int> ((key >> VOXEL_BITS) & VOXEL_MASK) - VOXEL_OFFSET
+
+cdef inline py_int unpack_voxel_z(uint64_t key) noexcept nogil:
+    return <py_int> (key & VOXEL_MASK) - VOXEL_OFFSET
+
+cdef inline int pack_voxel(object key, uint64_t* out) except -1:
+    # Pack a `Vec3i` or an (x, y, z) sequence of integers
+    cdef py_int x, y, z
+    cdef Vec3i vec
+    cdef object ox, oy, oz
+    if isinstance(key, Vec3i):
+        vec = <Vec3i> key
+        x, y, z = vec.x, vec.y, vec.z
+    else:
+        ox, oy, oz = key
+        if not (PyLong_Check(ox) and PyLong_Check(oy) and PyLong_Check(oz)):
+            raise TypeError(f"Expected a Vec3i or an (x, y, z) sequence of ints, got {key!r}")
+        x, y, z = ox, oy, oz
+    if not voxel_in_range(x, y, z):
+        raise OverflowError(f"Voxel coordinates out of range [-2**20, 2**20): {key!r}")
+    out[0] = pack_voxel_xyz(x, y, z)
+    return 0
+
+cdef inline Vec3i unpack_voxel(uint64_t key):
+    cdef Vec3i vec = Vec3i.__new__(Vec3i)
+    vec.x = unpack_voxel_x(key)
+    vec.y = unpack_voxel_y(key)
+    vec.z = unpack_voxel_z(key)
+    return vec
+
+# noinspection SpellCheckingInspection
+@cython.final
+cdef class VoxelMap:
+    """A mapping from `Vec3i` voxel coordinates to objects, stored compactly.
+
+    Coordinates are packed into 64-bit integers (21 bits per axis, so every component must be in [-2**20, 2**20))
+    in an open addressing table, keys can be given as `Vec3i`s or (x, y, z) tuples.
+    """
+
+    cdef uint64_t* keys
+    cdef list _values
+    cdef Py_ssize_t capacity
+    cdef Py_ssize_t size
+    cdef Py_ssize_t used
+    cdef Py_ssize_t version
+
+
+    def __cinit__(self):
+        self.keys = NULL
+        self.capacity = self.size = self.used = self.version = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.keys)
+
+    def __init__(self, object items = None, /):
+        """Create a map, optionally from a mapping or an iterable of (key, value) pairs."""
+        self._rehash(16)
+        if items is not None:
+            if hasattr(items, "items"):
+                items = items.items()
+            for key, value in items:
+                self[key] = value
+
+
+    cdef int _rehash(self, Py_ssize_t capacity) except -1:
+        cdef uint64_t* old_keys = self.keys
+        cdef Py_ssize_t old_capacity = self.capacity
+        self.keys = <uint64_t*> PyMem_Malloc(capacity * sizeof(uint64_t))
+        if self.keys == NULL:
+            self.keys = old_keys
+            raise MemoryError()
+        memset(self.keys, 0xFF, capacity * sizeof(uint64_t))
+        cdef list old_values = self._values
+        self._values = [None] * capacity
+        self.capacity = capacity
+        self.used = self.size
+        cdef Py_ssize_t i, slot
+        for i in range(old_capacity):
+            if old_keys[i] < VOXEL_TOMBSTONE:
+                slot = self._probe(old_keys[i], True)
+                self.keys[slot] = old_keys[i]
+                self._values[slot] = old_values[i]
+        PyMem_Free(old_keys)
+        return 0
+
+    cdef inline Py_ssize_t _probe(self, uint64_t key, bint insert) noexcept nogil:
+        # The slot of the key, -1 if it's not found (or where to insert it if `insert`)
+        cdef Py_ssize_t mask = self.capacity - 1
+        cdef Py_ssize_t slot = <Py_ssize_t> (mix64(key) & <uint64_t> mask)
+        cdef Py_ssize_t free = -1
+        while self.keys[slot] != VOXEL_EMPTY:
+            if self.keys[slot] == key:
+                return slot
+            if self.keys[slot] == VOXEL_TOMBSTONE and free == -1:
+                free = slot
+            slot = (slot + 1) & mask
+        if not insert:
+            return -1
+        return slot if free == -1 else free
+
+    cdef Py_ssize_t _insert(self, uint64_t key) except -1:
+        # The slot of the key, adding it if needed
+        cdef Py_ssize_t slot = self._probe(key, False)
+        if slot != -1:
+            return slot
+        # Keep the table at most 2/3 full, counting tombstones
+        if (self.used + 1) * 3 > self.capacity * 2:
+            self._rehash(self.capacity * 2 if (self.size + 1) * 3 > self.capacity else self.capacity)
+        slot = self._probe(key, True)
+        if self.keys[slot] == VOXEL_EMPTY:
+            self.used += 1
+        self.keys[slot] = key
+        self.size += 1
+        self.version += 1
+        return slot
+
+    cdef inline void _remove_slot(self, Py_ssize_t slot):
+        self.keys[slot] = VOXEL_TOMBSTONE
+        self._values[slot] = None
+        self.size -= 1
+        self.version += 1
+
+    cdef inline Vec3iArray _neighbors(self, object key, int connectivity):
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef py_int x = unpack_voxel_x(packed), y = unpack_voxel_y(packed), z = unpack_voxel_z(packed)
+        cdef int dx, dy, dz, n
+        cdef Py_ssize_t count = 0
+        cdef py_int[26 * 3] found
+        if connectivity != 6 and connectivity != 18 and connectivity != 26:
+            raise ValueError(f"Connectivity must be 6, 18 or 26, got {connectivity}")
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                for dz in range(-1, 2):
+                    n = (dx != 0) + (dy != 0) + (dz != 0)
+                    if n == 0 or (n == 3 and connectivity < 26) or (n == 2 and connectivity < 18):
+                        continue
+                    if not voxel_in_range(x + dx, y + dy, z + dz):
+                        continue
+                    if self._probe(pack_voxel_xyz(x + dx, y + dy, z + dz), False) != -1:
+                        found[count * 3], found[count * 3 + 1], found[count * 3 + 2] = x + dx, y + dy, z + dz
+                        count += 1
+        cdef Vec3iArray arr = Vec3iArray.__new__(Vec3iArray)
+        arr._alloc(count)
+        memcpy(arr.data, found, count * 3 * sizeof(py_int))
+        return arr
+
+
+    def __len__(self) -> int:
+        """The number of keys."""
+        return self.size
+
+    def __bool__(self) -> bool:
+        """If there are any keys."""
+        return self.size != 0
+
+    def __contains__(self, object key) -> bool:
+        """If the key is in this container, out of range keys are never contained."""
+        cdef uint64_t packed
+        try:
+            pack_voxel(key, &packed)
+        except OverflowError:
+            return False
+        return self._probe(packed, False) != -1
+
+    def __iter__(self) -> _VoxelMap_iterator:
+        """Iterate over the keys as `Vec3i`s, in no particular order."""
+        cdef _VoxelMap_iterator iterator = _VoxelMap_iterator.__new__(_VoxelMap_iterator)
+        iterator.container = self
+        iterator.slot = 0
+        iterator.version = self.version
+        return iterator
+
+    def clear(self) -> None:
+        """Remove all the keys."""
+        PyMem_Free(self.keys)
+        self.keys = NULL
+        self.capacity = self.size = self.used = 0
+        self._rehash(16)
+        self.version += 1
+
+    def chunks(self, Py_ssize_t size = 4096, /) -> _VoxelMap_chunk_iterator:
+        """Iterate over the entries in chunks of up to `size`, each one as a `Vec3iArray` of keys and a list of the values."""
+        if size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {size}")
+        cdef _VoxelMap_chunk_iterator iterator = _VoxelMap_chunk_iterator.__new__(_VoxelMap_chunk_iterator)
+        iterator.container = self
+        iterator.slot = 0
+        iterator.chunk_size = size
+        iterator.version = self.version
+        return iterator
+
+    def neighbors(self, object key, int connectivity = 6, /) -> tuple[Vec3iArray, list]:
+        """The neighbors of a voxel (6: faces, 18: faces and edges, 26: faces, edges and corners) that are in the map.
+
+        Returns their keys as a `Vec3iArray` and a list of their values.
+        """
+        cdef Vec3iArray arr = self._neighbors(key, connectivity)
+        cdef list values = []
+        cdef Py_ssize_t i
+        for i in range(arr.size):
+            values.append(self._values[self._probe(pack_voxel_xyz(arr.data[i * 3], arr.data[i * 3 + 1], arr.data[i * 3 + 2]), False)])
+        return arr, values
+
+    def __getitem__(self, object key) -> object:
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot == -1:
+            raise KeyError(key)
+        return self._values[slot]
+
+    def __setitem__(self, object key, object value) -> None:
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        self._values[self._insert(packed)] = value
+
+    def __delitem__(self, object key) -> None:
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot == -1:
+            raise KeyError(key)
+        self._remove_slot(slot)
+
+    def get(self, object key, object default = None, /) -> object:
+        """Get the value of a key, or `default` if it's not present."""
+        cdef uint64_t packed
+        try:
+            pack_voxel(key, &packed)
+        except OverflowError:
+            return default
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        return default if slot == -1 else self._values[slot]
+
+    def pop(self, object key, /) -> object:
+        """Remove a key and return its value, raise `KeyError` if it's not present."""
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot == -1:
+            raise KeyError(key)
+        cdef object value = self._values[slot]
+        self._remove_slot(slot)
+        return value
+
+    def values(self) -> list:
+        """A list of all the values, in the same order as iterating over the keys."""
+        cdef list values = []
+        cdef Py_ssize_t i
+        for i in range(self.capacity):
+            if self.keys[i] < VOXEL_TOMBSTONE:
+                values.append(self._values[i])
+        return values
+
+    def items(self) -> list:
+        """A list of all the (`Vec3i` key, value) pairs."""
+        cdef list items = []
+        cdef Py_ssize_t i
+        for i in range(self.capacity):
+            if self.keys[i] < VOXEL_TOMBSTONE:
+                items.append((unpack_voxel(self.keys[i]), self._values[i]))
+        return items
+
+
+@cython.no_gc
+@cython.final
+@cython.freelist(8)
+cdef class _VoxelMap_iterator:
+    cdef VoxelMap container
+    cdef Py_ssize_t slot
+    cdef Py_ssize_t version
+
+    def __next__(self) -> Vec3i:
+        if self.version != self.container.version:
+            raise RuntimeError("VoxelMap changed size during iteration")
+        while self.slot < self.container.capacity:
+            self.slot += 1
+            if self.container.keys[self.slot - 1] < VOXEL_TOMBSTONE:
+                return unpack_voxel(self.container.keys[self.slot - 1])
+        raise StopIteration
+
+    def __iter__(self) -> _VoxelMap_iterator:
+        #<RETURN_SELF>
+        return self
+
+
+@cython.no_gc
+@cython.final
+cdef class _VoxelMap_chunk_iterator:
+    cdef VoxelMap container
+    cdef Py_ssize_t slot
+    cdef Py_ssize_t chunk_size
+    cdef Py_ssize_t version
+
+    def __next__(self) -> tuple[Vec3iArray, list]:
+        if self.version != self.container.version:
+            raise RuntimeError("VoxelMap changed size during iteration")
+        cdef Py_ssize_t start = self.slot, count = 0
+        cdef uint64_t* keys = self.container.keys
+        while self.slot < self.container.capacity and count < self.chunk_size:
+            if keys[self.slot] < VOXEL_TOMBSTONE:
+                count += 1
+            self.slot += 1
+        if count == 0:
+            raise StopIteration
+        cdef Vec3iArray arr = Vec3iArray.__new__(Vec3iArray)
+        arr._alloc(count)
+        cdef list values = []
+        cdef Py_ssize_t i, j = 0
+        for i in range(start, self.slot):
+            if keys[i] < VOXEL_TOMBSTONE:
+                arr.data[j * 3] = unpack_voxel_x(keys[i])
+                arr.data[j * 3 + 1] = unpack_voxel_y(keys[i])
+                arr.data[j * 3 + 2] = unpack_voxel_z(keys[i])
+                j += 1
+                values.append(self.container._values[i])
+        return arr, values
+
+    def __iter__(self) -> _VoxelMap_chunk_iterator:
+        #<RETURN_SELF>
+        return self
+
+# noinspection SpellCheckingInspection
+@cython.final
+cdef class VoxelSet:
+    """A set of `Vec3i` voxel coordinates, stored compactly.
+
+    Coordinates are packed into 64-bit integers (21 bits per axis, so every component must be in [-2**20, 2**20))
+    in an open addressing table, keys can be given as `Vec3i`s or (x, y, z) tuples.
+    """
+
+    cdef uint64_t* keys
+    cdef Py_ssize_t capacity
+    cdef Py_ssize_t size
+    cdef Py_ssize_t used
+    cdef Py_ssize_t version
+
+
+    def __cinit__(self):
+        self.keys = NULL
+        self.capacity = self.size = self.used = self.version = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.keys)
+
+    def __init__(self, object keys = None, /):
+        """Create a set, optionally from an iterable of keys."""
+        self._rehash(16)
+        if keys is not None:
+            for key in keys:
+                self.add(key)
+
+
+    cdef int _rehash(self, Py_ssize_t capacity) except -1:
+        cdef uint64_t* old_keys = self.keys
+        cdef Py_ssize_t old_capacity = self.capacity
+        self.keys = <uint64_t*> PyMem_Malloc(capacity * sizeof(uint64_t))
+        if self.keys == NULL:
+            self.keys = old_keys
+            raise MemoryError()
+        memset(self.keys, 0xFF, capacity * sizeof(uint64_t))
+        self.capacity = capacity
+        self.used = self.size
+        cdef Py_ssize_t i, slot
+        for i in range(old_capacity):
+            if old_keys[i] < VOXEL_TOMBSTONE:
+                slot = self._probe(old_keys[i], True)
+                self.keys[slot] = old_keys[i]
+        PyMem_Free(old_keys)
+        return 0
+
+    cdef inline Py_ssize_t _probe(self, uint64_t key, bint insert) noexcept nogil:
+        # The slot of the key, -1 if it's not found (or where to insert it if `insert`)
+        cdef Py_ssize_t mask = self.capacity - 1
+        cdef Py_ssize_t slot = <Py_ssize_t> (mix64(key) & <uint64_t> mask)
+        cdef Py_ssize_t free = -1
+        while self.keys[slot] != VOXEL_EMPTY:
+            if self.keys[slot] == key:
+                return slot
+            if self.keys[slot] == VOXEL_TOMBSTONE and free == -1:
+                free = slot
+            slot = (slot + 1) & mask
+        if not insert:
+            return -1
+        return slot if free == -1 else free
+
+    cdef Py_ssize_t _insert(self, uint64_t key) except -1:
+        # The slot of the key, adding it if needed
+        cdef Py_ssize_t slot = self._probe(key, False)
+        if slot != -1:
+            return slot
+        # Keep the table at most 2/3 full, counting tombstones
+        if (self.used + 1) * 3 > self.capacity * 2:
+            self._rehash(self.capacity * 2 if (self.size + 1) * 3 > self.capacity else self.capacity)
+        slot = self._probe(key, True)
+        if self.keys[slot] == VOXEL_EMPTY:
+            self.used += 1
+        self.keys[slot] = key
+        self.size += 1
+        self.version += 1
+        return slot
+
+    cdef inline void _remove_slot(self, Py_ssize_t slot):
+        self.keys[slot] = VOXEL_TOMBSTONE
+        self.size -= 1
+        self.version += 1
+
+    cdef inline Vec3iArray _neighbors(self, object key, int connectivity):
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef py_int x = unpack_voxel_x(packed), y = unpack_voxel_y(packed), z = unpack_voxel_z(packed)
+        cdef int dx, dy, dz, n
+        cdef Py_ssize_t count = 0
+        cdef py_int[26 * 3] found
+        if connectivity != 6 and connectivity != 18 and connectivity != 26:
+            raise ValueError(f"Connectivity must be 6, 18 or 26, got {connectivity}")
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                for dz in range(-1, 2):
+                    n = (dx != 0) + (dy != 0) + (dz != 0)
+                    if n == 0 or (n == 3 and connectivity < 26) or (n == 2 and connectivity < 18):
+                        continue
+                    if not voxel_in_range(x + dx, y + dy, z + dz):
+                        continue
+                    if self._probe(pack_voxel_xyz(x + dx, y + dy, z + dz), False) != -1:
+                        found[count * 3], found[count * 3 + 1], found[count * 3 + 2] = x + dx, y + dy, z + dz
+                        count += 1
+        cdef Vec3iArray arr = Vec3iArray.__new__(Vec3iArray)
+        arr._alloc(count)
+        memcpy(arr.data, found, count * 3 * sizeof(py_int))
+        return arr
+
+
+    def __len__(self) -> int:
+        """The number of keys."""
+        return self.size
+
+    def __bool__(self) -> bool:
+        """If there are any keys."""
+        return self.size != 0
+
+    def __contains__(self, object key) -> bool:
+        """If the key is in this container, out of range keys are never contained."""
+        cdef uint64_t packed
+        try:
+            pack_voxel(key, &packed)
+        except OverflowError:
+            return False
+        return self._probe(packed, False) != -1
+
+    def __iter__(self) -> _VoxelSet_iterator:
+        """Iterate over the keys as `Vec3i`s, in no particular order."""
+        cdef _VoxelSet_iterator iterator = _VoxelSet_iterator.__new__(_VoxelSet_iterator)
+        iterator.container = self
+        iterator.slot = 0
+        iterator.version = self.version
+        return iterator
+
+    def clear(self) -> None:
+        """Remove all the keys."""
+        PyMem_Free(self.keys)
+        self.keys = NULL
+        self.capacity = self.size = self.used = 0
+        self._rehash(16)
+        self.version += 1
+
+    def chunks(self, Py_ssize_t size = 4096, /) -> _VoxelSet_chunk_iterator:
+        """Iterate over the keys in chunks of up to `size`, each one as a `Vec3iArray`."""
+        if size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {size}")
+        cdef _VoxelSet_chunk_iterator iterator = _VoxelSet_chunk_iterator.__new__(_VoxelSet_chunk_iterator)
+        iterator.container = self
+        iterator.slot = 0
+        iterator.chunk_size = size
+        iterator.version = self.version
+        return iterator
+
+    def neighbors(self, object key, int connectivity = 6, /) -> Vec3iArray:
+        """The neighbors of a voxel (6: faces, 18: faces and edges, 26: faces, edges and corners) that are in the set."""
+        return self._neighbors(key, connectivity)
+
+    def add(self, object key, /) -> None:
+        """Add a key."""
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        self._insert(packed)
+
+    def discard(self, object key, /) -> None:
+        """Remove a key if it is present."""
+        cdef uint64_t packed
+        try:
+            pack_voxel(key, &packed)
+        except OverflowError:
+            return
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot != -1:
+            self._remove_slot(slot)
+
+    def remove(self, object key, /) -> None:
+        """Remove a key, raise `KeyError` if it's not present."""
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot == -1:
+            raise KeyError(key)
+        self._remove_slot(slot)
+
+
+@cython.no_gc
+@cython.final
+@cython.freelist(8)
+cdef class _VoxelSet_iterator:
+    cdef VoxelSet container
+    cdef Py_ssize_t slot
+    cdef Py_ssize_t version
+
+    def __next__(self) -> Vec3i:
+        if self.version != self.container.version:
+            raise RuntimeError("VoxelSet changed size during iteration")
+        while self.slot < self.container.capacity:
+            self.slot += 1
+            if self.container.keys[self.slot - 1] < VOXEL_TOMBSTONE:
+                return unpack_voxel(self.container.keys[self.slot - 1])
+        raise StopIteration
+
+    def __iter__(self) -> _VoxelSet_iterator:
+        #<RETURN_SELF>
+        return self
+
+
+@cython.no_gc
+@cython.final
+cdef class _VoxelSet_chunk_iterator:
+    cdef VoxelSet container
+    cdef Py_ssize_t slot
+    cdef Py_ssize_t chunk_size
+    cdef Py_ssize_t version
+
+    def __next__(self) -> Vec3iArray:
+        if self.version != self.container.version:
+            raise RuntimeError("VoxelSet changed size during iteration")
+        cdef Py_ssize_t start = self.slot, count = 0
+        cdef uint64_t* keys = self.container.keys
+        while self.slot < self.container.capacity and count < self.chunk_size:
+            if keys[self.slot] < VOXEL_TOMBSTONE:
+                count += 1
+            self.slot += 1
+        if count == 0:
+            raise StopIteration
+        cdef Vec3iArray arr = Vec3iArray.__new__(Vec3iArray)
+        arr._alloc(count)
+        cdef Py_ssize_t i, j = 0
+        for i in range(start, self.slot):
+            if keys[i] < VOXEL_TOMBSTONE:
+                arr.data[j * 3] = unpack_voxel_x(keys[i])
+                arr.data[j * 3 + 1] = unpack_voxel_y(keys[i])
+                arr.data[j * 3 + 2] = unpack_voxel_z(keys[i])
+                j += 1
+        return arr
+
+    def __iter__(self) -> _VoxelSet_chunk_iterator:
+        #<RETURN_SELF>
+        return self
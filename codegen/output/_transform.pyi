@@ -0,0 +1,1831 @@
+# noinspection PyUnresolvedReferences
+from typing import overload, Self, Any, Union, Iterator
+from array import array
+from spatium._common import py_int, py_float, buffer_float
+from spatium._vector import Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector import Vec2Array, Vec3Array, Vec4Array
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform2D:
+    """2D linear transformation (2*3 matrix)."""
+
+    @property
+    def x(self) -> "Vec2":
+        """Base vector X."""
+        ...
+    @x.setter
+    def x(self, value: "Vec2") -> None:
+        """Set the X base of the matrix."""
+        ...
+    @property
+    def y(self) -> "Vec2":
+        """Base vector Y."""
+        ...
+    @y.setter
+    def y(self, value: "Vec2") -> None:
+        """Set the Y base of the matrix."""
+        ...
+    @property
+    def origin(self) -> "Vec2":
+        """Origin vector."""
+        ...
+    @origin.setter
+    def origin(self, value: "Vec2") -> None:
+        """Set the origin."""
+        ...
+    @property
+    def determinant(self) -> (float | int):
+        """Compute the determinant of the matrix."""
+        ...
+    @property
+    def rotation(self) -> (float | int):
+        """Get the rotation angle this transform represents."""
+        ...
+    @rotation.setter
+    def rotation(self, value: (float | int)) -> None:
+        """Set the rotation angle this transform represents.
+    
+        See Also: `Transform2D.rotating()`
+        """
+        ...
+    @property
+    def scale(self) -> "Vec2":
+        """Get the scaling transformation this transform represents."""
+        ...
+    @scale.setter
+    def scale(self, value: "Vec2") -> None:
+        """Set the scaling transformation this transform represents.
+    
+        See Also: `Transform2D.scaling()`
+        """
+        ...
+
+    def scale_into(self, scale: "Vec2", out: "Transform2D", /) -> "Transform2D":
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def scaled(self, scale: "Vec2", /) -> "Transform2D":
+        """Apply scaling to a copy of this transform."""
+        ...
+    def scale_ip(self, scale: "Vec2", /) -> Self:
+        """Apply scaling to this transform inplace."""
+        ...
+    def rotate_into(self, rotation: (float | int), out: "Transform2D", /) -> "Transform2D":
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def rotated(self, rotation: (float | int), /) -> "Transform2D":
+        """Apply rotation to a copy of this transform."""
+        ...
+    def rotate_ip(self, rotation: (float | int), /) -> Self:
+        """Apply rotation to this transform inplace."""
+        ...
+    def translate_into(self, translation: "Vec2", out: "Transform2D", /) -> "Transform2D":
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def translated(self, translation: "Vec2", /) -> "Transform2D":
+        """Apply translation to a copy of this transform."""
+        ...
+    def translate_ip(self, translation: "Vec2", /) -> Self:
+        """Apply translation to this transform inplace."""
+        ...
+    def __invert__(self) -> "Transform2D":
+        """Get the invert transform.
+    
+        See Also: `Vec2.__mul__()`
+        """
+        ...
+    def __imatmul__(self, other: "Transform2D") -> Self:
+        """Transform this `Transform2D` inplace with the other `Transform2D`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform2D") -> "Transform2D":
+        """Transform a copy of the `Transform2D` on the right."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform2DArray") -> "Transform2DArray":
+        """Transform a copy of every transform of the `Transform2DArray` on the right (e.g. `parent @ children`)."""
+        ...
+    def apply_inverse_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 2) float buffer using the *INVERSE* of the transform.
+    
+        This is the batched version of `vector * transform`, see `Transform2D.apply_many()` for the buffer semantics.
+    
+        See Also: `Vec2.__mul__()`
+        """
+        ...
+    def apply_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 2) float buffer (e.g. a `Vec2Array`) in one pass.
+    
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec2Array` is created for long double buffers,
+        or a new (N, 2) memoryview of the same format for float and double buffers.
+    
+        See Also: `Transform2D.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Vec2", out: "Vec2") -> "Vec2":
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+    
+        See Also: `Transform2D.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Transform2D", out: "Transform2D") -> "Transform2D":
+        """Transform the passed in `Transform2D`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        ...
+    @overload
+    def __call__(self, other: "Vec2") -> "Vec2":
+        """Transform a copy of the vector.
+        
+        See Also: `Vec2.__mul__()`
+        """
+        ...
+    @overload
+    def __call__(self, other: "Transform2D") -> "Transform2D":
+        """Transform a copy of the passed in `Transform2D`."""
+        ...
+    def __rmul__(self, other: "Vec2") -> "Vec2":
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+    
+        See Also: `Vec2.__mul__()`
+        """
+        ...
+    def __mul__(self, other: "Vec2") -> "Vec2":
+        """Transform a copy of the vector.
+    
+        See Also: `Vec2.__mul__()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Transform2D]":
+        """Read the transforms of a block written by `Transform2D.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(transforms: Any, /) -> "bytes":
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform2D.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Transform2D":
+        """Create a transform from the bytes written by `Transform2D.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        ...
+    def __len__(self) -> int:
+        """The amount of columns. Is always 3 for `Transform2D`s."""
+        ...
+    def __setitem__(self, key: int, value: "Vec2") -> None:
+        """Set a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        ...
+    def __getitem__(self, item: int) -> "Vec2":
+        """Get a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        ...
+    def __hash__(self) -> int: ...
+    def is_close(self, other: "Transform2D", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two transforms are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform2D.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform2D.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @staticmethod
+    def scaling(scale: "Vec2", /, origin: "Vec2" = None) -> "Transform2D":
+        """Create a scale transform."""
+        ...
+    @staticmethod
+    def rotating(rotation: (float | int), /, origin: "Vec2" = None) -> "Transform2D":
+        """Create a rotation transform."""
+        ...
+    @staticmethod
+    def translating(translation: "Vec2", /) -> "Transform2D":
+        """Create a translation transform."""
+        ...
+    @overload
+    def __init__(self) -> None:
+        """Create an identity transform."""
+        ...
+    @overload
+    def __init__(self, xx: (float | int), xy: (float | int), yx: (float | int), yy: (float | int), ox: (float | int), oy: (float | int)) -> None:
+        """Create a transform from all the matrix elements."""
+        ...
+    @overload
+    def __init__(self, x: "Vec2", y: "Vec2", origin: "Vec2") -> None:
+        """Create a transform using two base vectors and the origin vector."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2D") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2Dd") -> None:
+        """Convert a double precision transform to a floating-point transform."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2Df") -> None:
+        """Convert a single precision transform to a floating-point transform."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform2Dd:
+    """2D linear transformation (2*3 matrix) of `double`s."""
+
+    @property
+    def x(self) -> "Vec2d":
+        """Base vector X."""
+        ...
+    @x.setter
+    def x(self, value: "Vec2d") -> None:
+        """Set the X base of the matrix."""
+        ...
+    @property
+    def y(self) -> "Vec2d":
+        """Base vector Y."""
+        ...
+    @y.setter
+    def y(self, value: "Vec2d") -> None:
+        """Set the Y base of the matrix."""
+        ...
+    @property
+    def origin(self) -> "Vec2d":
+        """Origin vector."""
+        ...
+    @origin.setter
+    def origin(self, value: "Vec2d") -> None:
+        """Set the origin."""
+        ...
+    @property
+    def determinant(self) -> (float | int):
+        """Compute the determinant of the matrix."""
+        ...
+    @property
+    def rotation(self) -> (float | int):
+        """Get the rotation angle this transform represents."""
+        ...
+    @rotation.setter
+    def rotation(self, value: (float | int)) -> None:
+        """Set the rotation angle this transform represents.
+    
+        See Also: `Transform2Dd.rotating()`
+        """
+        ...
+    @property
+    def scale(self) -> "Vec2d":
+        """Get the scaling transformation this transform represents."""
+        ...
+    @scale.setter
+    def scale(self, value: "Vec2d") -> None:
+        """Set the scaling transformation this transform represents.
+    
+        See Also: `Transform2Dd.scaling()`
+        """
+        ...
+
+    def scale_into(self, scale: "Vec2d", out: "Transform2Dd", /) -> "Transform2Dd":
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def scaled(self, scale: "Vec2d", /) -> "Transform2Dd":
+        """Apply scaling to a copy of this transform."""
+        ...
+    def scale_ip(self, scale: "Vec2d", /) -> Self:
+        """Apply scaling to this transform inplace."""
+        ...
+    def rotate_into(self, rotation: (float | int), out: "Transform2Dd", /) -> "Transform2Dd":
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def rotated(self, rotation: (float | int), /) -> "Transform2Dd":
+        """Apply rotation to a copy of this transform."""
+        ...
+    def rotate_ip(self, rotation: (float | int), /) -> Self:
+        """Apply rotation to this transform inplace."""
+        ...
+    def translate_into(self, translation: "Vec2d", out: "Transform2Dd", /) -> "Transform2Dd":
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def translated(self, translation: "Vec2d", /) -> "Transform2Dd":
+        """Apply translation to a copy of this transform."""
+        ...
+    def translate_ip(self, translation: "Vec2d", /) -> Self:
+        """Apply translation to this transform inplace."""
+        ...
+    def __invert__(self) -> "Transform2Dd":
+        """Get the invert transform.
+    
+        See Also: `Vec2d.__mul__()`
+        """
+        ...
+    def __imatmul__(self, other: "Transform2Dd") -> Self:
+        """Transform this `Transform2Dd` inplace with the other `Transform2Dd`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform2Dd") -> "Transform2Dd":
+        """Transform a copy of the `Transform2Dd` on the right."""
+        ...
+    def apply_inverse_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 2) float buffer using the *INVERSE* of the transform.
+    
+        This is the batched version of `vector * transform`, see `Transform2Dd.apply_many()` for the buffer semantics.
+    
+        See Also: `Vec2d.__mul__()`
+        """
+        ...
+    def apply_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 2) float buffer (e.g. a `Vec2Array`) in one pass.
+    
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec2Array` is created for long double buffers,
+        or a new (N, 2) memoryview of the same format for float and double buffers.
+    
+        See Also: `Transform2Dd.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Vec2d", out: "Vec2d") -> "Vec2d":
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+    
+        See Also: `Transform2Dd.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Transform2Dd", out: "Transform2Dd") -> "Transform2Dd":
+        """Transform the passed in `Transform2Dd`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        ...
+    @overload
+    def __call__(self, other: "Vec2d") -> "Vec2d":
+        """Transform a copy of the vector.
+        
+        See Also: `Vec2d.__mul__()`
+        """
+        ...
+    @overload
+    def __call__(self, other: "Transform2Dd") -> "Transform2Dd":
+        """Transform a copy of the passed in `Transform2Dd`."""
+        ...
+    def __rmul__(self, other: "Vec2d") -> "Vec2d":
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+    
+        See Also: `Vec2d.__mul__()`
+        """
+        ...
+    def __mul__(self, other: "Vec2d") -> "Vec2d":
+        """Transform a copy of the vector.
+    
+        See Also: `Vec2d.__mul__()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Transform2Dd]":
+        """Read the transforms of a block written by `Transform2Dd.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(transforms: Any, /) -> "bytes":
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform2Dd.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Transform2Dd":
+        """Create a transform from the bytes written by `Transform2Dd.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        ...
+    def __len__(self) -> int:
+        """The amount of columns. Is always 3 for `Transform2Dd`s."""
+        ...
+    def __setitem__(self, key: int, value: "Vec2d") -> None:
+        """Set a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        ...
+    def __getitem__(self, item: int) -> "Vec2d":
+        """Get a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        ...
+    def __hash__(self) -> int: ...
+    def is_close(self, other: "Transform2Dd", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two transforms are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform2Dd.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform2Dd.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @staticmethod
+    def scaling(scale: "Vec2d", /, origin: "Vec2d" = None) -> "Transform2Dd":
+        """Create a scale transform."""
+        ...
+    @staticmethod
+    def rotating(rotation: (float | int), /, origin: "Vec2d" = None) -> "Transform2Dd":
+        """Create a rotation transform."""
+        ...
+    @staticmethod
+    def translating(translation: "Vec2d", /) -> "Transform2Dd":
+        """Create a translation transform."""
+        ...
+    @overload
+    def __init__(self) -> None:
+        """Create an identity transform."""
+        ...
+    @overload
+    def __init__(self, xx: (float | int), xy: (float | int), yx: (float | int), yy: (float | int), ox: (float | int), oy: (float | int)) -> None:
+        """Create a transform from all the matrix elements."""
+        ...
+    @overload
+    def __init__(self, x: "Vec2d", y: "Vec2d", origin: "Vec2d") -> None:
+        """Create a transform using two base vectors and the origin vector."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2Dd") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2D") -> None:
+        """Convert a floating-point transform to a double precision transform."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2Df") -> None:
+        """Convert a single precision transform to a double precision transform."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform2Df:
+    """2D linear transformation (2*3 matrix) of `float`s."""
+
+    @property
+    def x(self) -> "Vec2f":
+        """Base vector X."""
+        ...
+    @x.setter
+    def x(self, value: "Vec2f") -> None:
+        """Set the X base of the matrix."""
+        ...
+    @property
+    def y(self) -> "Vec2f":
+        """Base vector Y."""
+        ...
+    @y.setter
+    def y(self, value: "Vec2f") -> None:
+        """Set the Y base of the matrix."""
+        ...
+    @property
+    def origin(self) -> "Vec2f":
+        """Origin vector."""
+        ...
+    @origin.setter
+    def origin(self, value: "Vec2f") -> None:
+        """Set the origin."""
+        ...
+    @property
+    def determinant(self) -> (float | int):
+        """Compute the determinant of the matrix."""
+        ...
+    @property
+    def rotation(self) -> (float | int):
+        """Get the rotation angle this transform represents."""
+        ...
+    @rotation.setter
+    def rotation(self, value: (float | int)) -> None:
+        """Set the rotation angle this transform represents.
+    
+        See Also: `Transform2Df.rotating()`
+        """
+        ...
+    @property
+    def scale(self) -> "Vec2f":
+        """Get the scaling transformation this transform represents."""
+        ...
+    @scale.setter
+    def scale(self, value: "Vec2f") -> None:
+        """Set the scaling transformation this transform represents.
+    
+        See Also: `Transform2Df.scaling()`
+        """
+        ...
+
+    def scale_into(self, scale: "Vec2f", out: "Transform2Df", /) -> "Transform2Df":
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def scaled(self, scale: "Vec2f", /) -> "Transform2Df":
+        """Apply scaling to a copy of this transform."""
+        ...
+    def scale_ip(self, scale: "Vec2f", /) -> Self:
+        """Apply scaling to this transform inplace."""
+        ...
+    def rotate_into(self, rotation: (float | int), out: "Transform2Df", /) -> "Transform2Df":
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def rotated(self, rotation: (float | int), /) -> "Transform2Df":
+        """Apply rotation to a copy of this transform."""
+        ...
+    def rotate_ip(self, rotation: (float | int), /) -> Self:
+        """Apply rotation to this transform inplace."""
+        ...
+    def translate_into(self, translation: "Vec2f", out: "Transform2Df", /) -> "Transform2Df":
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def translated(self, translation: "Vec2f", /) -> "Transform2Df":
+        """Apply translation to a copy of this transform."""
+        ...
+    def translate_ip(self, translation: "Vec2f", /) -> Self:
+        """Apply translation to this transform inplace."""
+        ...
+    def __invert__(self) -> "Transform2Df":
+        """Get the invert transform.
+    
+        See Also: `Vec2f.__mul__()`
+        """
+        ...
+    def __imatmul__(self, other: "Transform2Df") -> Self:
+        """Transform this `Transform2Df` inplace with the other `Transform2Df`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform2Df") -> "Transform2Df":
+        """Transform a copy of the `Transform2Df` on the right."""
+        ...
+    def apply_inverse_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 2) float buffer using the *INVERSE* of the transform.
+    
+        This is the batched version of `vector * transform`, see `Transform2Df.apply_many()` for the buffer semantics.
+    
+        See Also: `Vec2f.__mul__()`
+        """
+        ...
+    def apply_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 2) float buffer (e.g. a `Vec2Array`) in one pass.
+    
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec2Array` is created for long double buffers,
+        or a new (N, 2) memoryview of the same format for float and double buffers.
+    
+        See Also: `Transform2Df.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Vec2f", out: "Vec2f") -> "Vec2f":
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+    
+        See Also: `Transform2Df.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Transform2Df", out: "Transform2Df") -> "Transform2Df":
+        """Transform the passed in `Transform2Df`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        ...
+    @overload
+    def __call__(self, other: "Vec2f") -> "Vec2f":
+        """Transform a copy of the vector.
+        
+        See Also: `Vec2f.__mul__()`
+        """
+        ...
+    @overload
+    def __call__(self, other: "Transform2Df") -> "Transform2Df":
+        """Transform a copy of the passed in `Transform2Df`."""
+        ...
+    def __rmul__(self, other: "Vec2f") -> "Vec2f":
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+    
+        See Also: `Vec2f.__mul__()`
+        """
+        ...
+    def __mul__(self, other: "Vec2f") -> "Vec2f":
+        """Transform a copy of the vector.
+    
+        See Also: `Vec2f.__mul__()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Transform2Df]":
+        """Read the transforms of a block written by `Transform2Df.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(transforms: Any, /) -> "bytes":
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform2Df.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Transform2Df":
+        """Create a transform from the bytes written by `Transform2Df.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        ...
+    def __len__(self) -> int:
+        """The amount of columns. Is always 3 for `Transform2Df`s."""
+        ...
+    def __setitem__(self, key: int, value: "Vec2f") -> None:
+        """Set a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        ...
+    def __getitem__(self, item: int) -> "Vec2f":
+        """Get a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        ...
+    def __hash__(self) -> int: ...
+    def is_close(self, other: "Transform2Df", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two transforms are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform2Df.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform2Df.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @staticmethod
+    def scaling(scale: "Vec2f", /, origin: "Vec2f" = None) -> "Transform2Df":
+        """Create a scale transform."""
+        ...
+    @staticmethod
+    def rotating(rotation: (float | int), /, origin: "Vec2f" = None) -> "Transform2Df":
+        """Create a rotation transform."""
+        ...
+    @staticmethod
+    def translating(translation: "Vec2f", /) -> "Transform2Df":
+        """Create a translation transform."""
+        ...
+    @overload
+    def __init__(self) -> None:
+        """Create an identity transform."""
+        ...
+    @overload
+    def __init__(self, xx: (float | int), xy: (float | int), yx: (float | int), yy: (float | int), ox: (float | int), oy: (float | int)) -> None:
+        """Create a transform from all the matrix elements."""
+        ...
+    @overload
+    def __init__(self, x: "Vec2f", y: "Vec2f", origin: "Vec2f") -> None:
+        """Create a transform using two base vectors and the origin vector."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2Df") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2D") -> None:
+        """Convert a floating-point transform to a single precision transform."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform2Dd") -> None:
+        """Convert a double precision transform to a single precision transform."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform3D:
+    """3D linear transformation (3*4 matrix)."""
+
+    @property
+    def x(self) -> "Vec3":
+        """Base vector X."""
+        ...
+    @x.setter
+    def x(self, value: "Vec3") -> None:
+        """Set the X base of the matrix."""
+        ...
+    @property
+    def y(self) -> "Vec3":
+        """Base vector Y."""
+        ...
+    @y.setter
+    def y(self, value: "Vec3") -> None:
+        """Set the Y base of the matrix."""
+        ...
+    @property
+    def z(self) -> "Vec3":
+        """Base vector Z."""
+        ...
+    @z.setter
+    def z(self, value: "Vec3") -> None:
+        """Set the Z base of the matrix."""
+        ...
+    @property
+    def origin(self) -> "Vec3":
+        """Origin vector."""
+        ...
+    @origin.setter
+    def origin(self, value: "Vec3") -> None:
+        """Set the origin."""
+        ...
+    @property
+    def determinant(self) -> (float | int):
+        """Compute the determinant of the matrix."""
+        ...
+
+    def scale_into(self, scale: "Vec3", out: "Transform3D", /) -> "Transform3D":
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def scaled(self, scale: "Vec3", /) -> "Transform3D":
+        """Apply scaling to a copy of this transform."""
+        ...
+    def scale_ip(self, scale: "Vec3", /) -> Self:
+        """Apply scaling to this transform inplace."""
+        ...
+    def rotate_into(self, axis: "Vec3", angle: (float | int), out: "Transform3D", /) -> "Transform3D":
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def rotated(self, axis: "Vec3", angle: (float | int), /) -> "Transform3D":
+        """Apply rotation to a copy of this transform."""
+        ...
+    def rotate_ip(self, axis: "Vec3", angle: (float | int), /) -> Self:
+        """Apply rotation to this transform inplace."""
+        ...
+    def translate_into(self, translation: "Vec3", out: "Transform3D", /) -> "Transform3D":
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def translated(self, translation: "Vec3", /) -> "Transform3D":
+        """Apply translation to a copy of this transform."""
+        ...
+    def translate_ip(self, translation: "Vec3", /) -> Self:
+        """Apply translation to this transform inplace."""
+        ...
+    def __invert__(self) -> "Transform3D":
+        """Get the invert transform.
+    
+        See Also: `Vec3.__mul__()`
+        """
+        ...
+    def __imatmul__(self, other: "Transform3D") -> Self:
+        """Transform this `Transform3D` inplace with the other `Transform3D`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform3D") -> "Transform3D":
+        """Transform a copy of the `Transform3D` on the right."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform3DArray") -> "Transform3DArray":
+        """Transform a copy of every transform of the `Transform3DArray` on the right (e.g. `parent @ children`)."""
+        ...
+    def apply_inverse_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 3) float buffer using the *INVERSE* of the transform.
+    
+        This is the batched version of `vector * transform`, see `Transform3D.apply_many()` for the buffer semantics.
+    
+        See Also: `Vec3.__mul__()`
+        """
+        ...
+    def apply_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 3) float buffer (e.g. a `Vec3Array`) in one pass.
+    
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec3Array` is created for long double buffers,
+        or a new (N, 3) memoryview of the same format for float and double buffers.
+    
+        See Also: `Transform3D.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Vec3", out: "Vec3") -> "Vec3":
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+    
+        See Also: `Transform3D.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Transform3D", out: "Transform3D") -> "Transform3D":
+        """Transform the passed in `Transform3D`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        ...
+    @overload
+    def __call__(self, other: "Vec3") -> "Vec3":
+        """Transform a copy of the vector.
+        
+        See Also: `Vec3.__mul__()`
+        """
+        ...
+    @overload
+    def __call__(self, other: "Transform3D") -> "Transform3D":
+        """Transform a copy of the passed in `Transform3D`."""
+        ...
+    def __rmul__(self, other: "Vec3") -> "Vec3":
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+    
+        See Also: `Vec3.__mul__()`
+        """
+        ...
+    def __mul__(self, other: "Vec3") -> "Vec3":
+        """Transform a copy of the vector.
+    
+        See Also: `Vec3.__mul__()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Transform3D]":
+        """Read the transforms of a block written by `Transform3D.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(transforms: Any, /) -> "bytes":
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform3D.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Transform3D":
+        """Create a transform from the bytes written by `Transform3D.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        ...
+    def __len__(self) -> int:
+        """The amount of columns. Is always 4 for `Transform3D`s."""
+        ...
+    def __setitem__(self, key: int, value: "Vec3") -> None:
+        """Set a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        ...
+    def __getitem__(self, item: int) -> "Vec3":
+        """Get a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        ...
+    def __hash__(self) -> int: ...
+    def is_close(self, other: "Transform3D", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two transforms are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform3D.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform3D.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @staticmethod
+    def scaling(scale: "Vec3", /, origin: "Vec3" = None) -> "Transform3D":
+        """Create a scale transform."""
+        ...
+    @staticmethod
+    def rotating(axis: "Vec3", angle: (float | int), /, origin: "Vec3" = None) -> "Transform3D":
+        """Create a rotation transform."""
+        ...
+    @staticmethod
+    def translating(translation: "Vec3", /) -> "Transform3D":
+        """Create a translation transform."""
+        ...
+    @overload
+    def __init__(self) -> None:
+        """Create an identity transform."""
+        ...
+    @overload
+    def __init__(self, xx: (float | int), xy: (float | int), xz: (float | int), yx: (float | int), yy: (float | int), yz: (float | int), zx: (float | int), zy: (float | int), zz: (float | int), ox: (float | int), oy: (float | int), oz: (float | int)) -> None:
+        """Create a transform from all the matrix elements."""
+        ...
+    @overload
+    def __init__(self, x: "Vec3", y: "Vec3", z: "Vec3", origin: "Vec3") -> None:
+        """Create a transform using three base vectors and the origin vector."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3D") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3Dd") -> None:
+        """Convert a double precision transform to a floating-point transform."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3Df") -> None:
+        """Convert a single precision transform to a floating-point transform."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform3Dd:
+    """3D linear transformation (3*4 matrix) of `double`s."""
+
+    @property
+    def x(self) -> "Vec3d":
+        """Base vector X."""
+        ...
+    @x.setter
+    def x(self, value: "Vec3d") -> None:
+        """Set the X base of the matrix."""
+        ...
+    @property
+    def y(self) -> "Vec3d":
+        """Base vector Y."""
+        ...
+    @y.setter
+    def y(self, value: "Vec3d") -> None:
+        """Set the Y base of the matrix."""
+        ...
+    @property
+    def z(self) -> "Vec3d":
+        """Base vector Z."""
+        ...
+    @z.setter
+    def z(self, value: "Vec3d") -> None:
+        """Set the Z base of the matrix."""
+        ...
+    @property
+    def origin(self) -> "Vec3d":
+        """Origin vector."""
+        ...
+    @origin.setter
+    def origin(self, value: "Vec3d") -> None:
+        """Set the origin."""
+        ...
+    @property
+    def determinant(self) -> (float | int):
+        """Compute the determinant of the matrix."""
+        ...
+
+    def scale_into(self, scale: "Vec3d", out: "Transform3Dd", /) -> "Transform3Dd":
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def scaled(self, scale: "Vec3d", /) -> "Transform3Dd":
+        """Apply scaling to a copy of this transform."""
+        ...
+    def scale_ip(self, scale: "Vec3d", /) -> Self:
+        """Apply scaling to this transform inplace."""
+        ...
+    def rotate_into(self, axis: "Vec3d", angle: (float | int), out: "Transform3Dd", /) -> "Transform3Dd":
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def rotated(self, axis: "Vec3d", angle: (float | int), /) -> "Transform3Dd":
+        """Apply rotation to a copy of this transform."""
+        ...
+    def rotate_ip(self, axis: "Vec3d", angle: (float | int), /) -> Self:
+        """Apply rotation to this transform inplace."""
+        ...
+    def translate_into(self, translation: "Vec3d", out: "Transform3Dd", /) -> "Transform3Dd":
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def translated(self, translation: "Vec3d", /) -> "Transform3Dd":
+        """Apply translation to a copy of this transform."""
+        ...
+    def translate_ip(self, translation: "Vec3d", /) -> Self:
+        """Apply translation to this transform inplace."""
+        ...
+    def __invert__(self) -> "Transform3Dd":
+        """Get the invert transform.
+    
+        See Also: `Vec3d.__mul__()`
+        """
+        ...
+    def __imatmul__(self, other: "Transform3Dd") -> Self:
+        """Transform this `Transform3Dd` inplace with the other `Transform3Dd`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform3Dd") -> "Transform3Dd":
+        """Transform a copy of the `Transform3Dd` on the right."""
+        ...
+    def apply_inverse_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 3) float buffer using the *INVERSE* of the transform.
+    
+        This is the batched version of `vector * transform`, see `Transform3Dd.apply_many()` for the buffer semantics.
+    
+        See Also: `Vec3d.__mul__()`
+        """
+        ...
+    def apply_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 3) float buffer (e.g. a `Vec3Array`) in one pass.
+    
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec3Array` is created for long double buffers,
+        or a new (N, 3) memoryview of the same format for float and double buffers.
+    
+        See Also: `Transform3Dd.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Vec3d", out: "Vec3d") -> "Vec3d":
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+    
+        See Also: `Transform3Dd.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Transform3Dd", out: "Transform3Dd") -> "Transform3Dd":
+        """Transform the passed in `Transform3Dd`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        ...
+    @overload
+    def __call__(self, other: "Vec3d") -> "Vec3d":
+        """Transform a copy of the vector.
+        
+        See Also: `Vec3d.__mul__()`
+        """
+        ...
+    @overload
+    def __call__(self, other: "Transform3Dd") -> "Transform3Dd":
+        """Transform a copy of the passed in `Transform3Dd`."""
+        ...
+    def __rmul__(self, other: "Vec3d") -> "Vec3d":
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+    
+        See Also: `Vec3d.__mul__()`
+        """
+        ...
+    def __mul__(self, other: "Vec3d") -> "Vec3d":
+        """Transform a copy of the vector.
+    
+        See Also: `Vec3d.__mul__()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Transform3Dd]":
+        """Read the transforms of a block written by `Transform3Dd.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(transforms: Any, /) -> "bytes":
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform3Dd.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Transform3Dd":
+        """Create a transform from the bytes written by `Transform3Dd.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        ...
+    def __len__(self) -> int:
+        """The amount of columns. Is always 4 for `Transform3Dd`s."""
+        ...
+    def __setitem__(self, key: int, value: "Vec3d") -> None:
+        """Set a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        ...
+    def __getitem__(self, item: int) -> "Vec3d":
+        """Get a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        ...
+    def __hash__(self) -> int: ...
+    def is_close(self, other: "Transform3Dd", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two transforms are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform3Dd.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform3Dd.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @staticmethod
+    def scaling(scale: "Vec3d", /, origin: "Vec3d" = None) -> "Transform3Dd":
+        """Create a scale transform."""
+        ...
+    @staticmethod
+    def rotating(axis: "Vec3d", angle: (float | int), /, origin: "Vec3d" = None) -> "Transform3Dd":
+        """Create a rotation transform."""
+        ...
+    @staticmethod
+    def translating(translation: "Vec3d", /) -> "Transform3Dd":
+        """Create a translation transform."""
+        ...
+    @overload
+    def __init__(self) -> None:
+        """Create an identity transform."""
+        ...
+    @overload
+    def __init__(self, xx: (float | int), xy: (float | int), xz: (float | int), yx: (float | int), yy: (float | int), yz: (float | int), zx: (float | int), zy: (float | int), zz: (float | int), ox: (float | int), oy: (float | int), oz: (float | int)) -> None:
+        """Create a transform from all the matrix elements."""
+        ...
+    @overload
+    def __init__(self, x: "Vec3d", y: "Vec3d", z: "Vec3d", origin: "Vec3d") -> None:
+        """Create a transform using three base vectors and the origin vector."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3Dd") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3D") -> None:
+        """Convert a floating-point transform to a double precision transform."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3Df") -> None:
+        """Convert a single precision transform to a double precision transform."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform3Df:
+    """3D linear transformation (3*4 matrix) of `float`s."""
+
+    @property
+    def x(self) -> "Vec3f":
+        """Base vector X."""
+        ...
+    @x.setter
+    def x(self, value: "Vec3f") -> None:
+        """Set the X base of the matrix."""
+        ...
+    @property
+    def y(self) -> "Vec3f":
+        """Base vector Y."""
+        ...
+    @y.setter
+    def y(self, value: "Vec3f") -> None:
+        """Set the Y base of the matrix."""
+        ...
+    @property
+    def z(self) -> "Vec3f":
+        """Base vector Z."""
+        ...
+    @z.setter
+    def z(self, value: "Vec3f") -> None:
+        """Set the Z base of the matrix."""
+        ...
+    @property
+    def origin(self) -> "Vec3f":
+        """Origin vector."""
+        ...
+    @origin.setter
+    def origin(self, value: "Vec3f") -> None:
+        """Set the origin."""
+        ...
+    @property
+    def determinant(self) -> (float | int):
+        """Compute the determinant of the matrix."""
+        ...
+
+    def scale_into(self, scale: "Vec3f", out: "Transform3Df", /) -> "Transform3Df":
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def scaled(self, scale: "Vec3f", /) -> "Transform3Df":
+        """Apply scaling to a copy of this transform."""
+        ...
+    def scale_ip(self, scale: "Vec3f", /) -> Self:
+        """Apply scaling to this transform inplace."""
+        ...
+    def rotate_into(self, axis: "Vec3f", angle: (float | int), out: "Transform3Df", /) -> "Transform3Df":
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def rotated(self, axis: "Vec3f", angle: (float | int), /) -> "Transform3Df":
+        """Apply rotation to a copy of this transform."""
+        ...
+    def rotate_ip(self, axis: "Vec3f", angle: (float | int), /) -> Self:
+        """Apply rotation to this transform inplace."""
+        ...
+    def translate_into(self, translation: "Vec3f", out: "Transform3Df", /) -> "Transform3Df":
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        ...
+    def translated(self, translation: "Vec3f", /) -> "Transform3Df":
+        """Apply translation to a copy of this transform."""
+        ...
+    def translate_ip(self, translation: "Vec3f", /) -> Self:
+        """Apply translation to this transform inplace."""
+        ...
+    def __invert__(self) -> "Transform3Df":
+        """Get the invert transform.
+    
+        See Also: `Vec3f.__mul__()`
+        """
+        ...
+    def __imatmul__(self, other: "Transform3Df") -> Self:
+        """Transform this `Transform3Df` inplace with the other `Transform3Df`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform3Df") -> "Transform3Df":
+        """Transform a copy of the `Transform3Df` on the right."""
+        ...
+    def apply_inverse_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 3) float buffer using the *INVERSE* of the transform.
+    
+        This is the batched version of `vector * transform`, see `Transform3Df.apply_many()` for the buffer semantics.
+    
+        See Also: `Vec3f.__mul__()`
+        """
+        ...
+    def apply_many(self, src: Any, /, out: Any = None) -> Any:
+        """Transform every vector of a contiguous (N, 3) float buffer (e.g. a `Vec3Array`) in one pass.
+    
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec3Array` is created for long double buffers,
+        or a new (N, 3) memoryview of the same format for float and double buffers.
+    
+        See Also: `Transform3Df.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Vec3f", out: "Vec3f") -> "Vec3f":
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+    
+        See Also: `Transform3Df.__call__()`
+        """
+        ...
+    @overload
+    def apply_into(self, other: "Transform3Df", out: "Transform3Df") -> "Transform3Df":
+        """Transform the passed in `Transform3Df`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        ...
+    @overload
+    def __call__(self, other: "Vec3f") -> "Vec3f":
+        """Transform a copy of the vector.
+        
+        See Also: `Vec3f.__mul__()`
+        """
+        ...
+    @overload
+    def __call__(self, other: "Transform3Df") -> "Transform3Df":
+        """Transform a copy of the passed in `Transform3Df`."""
+        ...
+    def __rmul__(self, other: "Vec3f") -> "Vec3f":
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+    
+        See Also: `Vec3f.__mul__()`
+        """
+        ...
+    def __mul__(self, other: "Vec3f") -> "Vec3f":
+        """Transform a copy of the vector.
+    
+        See Also: `Vec3f.__mul__()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Transform3Df]":
+        """Read the transforms of a block written by `Transform3Df.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(transforms: Any, /) -> "bytes":
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform3Df.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Transform3Df":
+        """Create a transform from the bytes written by `Transform3Df.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        ...
+    def __len__(self) -> int:
+        """The amount of columns. Is always 4 for `Transform3Df`s."""
+        ...
+    def __setitem__(self, key: int, value: "Vec3f") -> None:
+        """Set a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        ...
+    def __getitem__(self, item: int) -> "Vec3f":
+        """Get a column of the transformation matrix.
+    
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        ...
+    def __hash__(self) -> int: ...
+    def is_close(self, other: "Transform3Df", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two transforms are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform3Df.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform3Df.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @staticmethod
+    def scaling(scale: "Vec3f", /, origin: "Vec3f" = None) -> "Transform3Df":
+        """Create a scale transform."""
+        ...
+    @staticmethod
+    def rotating(axis: "Vec3f", angle: (float | int), /, origin: "Vec3f" = None) -> "Transform3Df":
+        """Create a rotation transform."""
+        ...
+    @staticmethod
+    def translating(translation: "Vec3f", /) -> "Transform3Df":
+        """Create a translation transform."""
+        ...
+    @overload
+    def __init__(self) -> None:
+        """Create an identity transform."""
+        ...
+    @overload
+    def __init__(self, xx: (float | int), xy: (float | int), xz: (float | int), yx: (float | int), yy: (float | int), yz: (float | int), zx: (float | int), zy: (float | int), zz: (float | int), ox: (float | int), oy: (float | int), oz: (float | int)) -> None:
+        """Create a transform from all the matrix elements."""
+        ...
+    @overload
+    def __init__(self, x: "Vec3f", y: "Vec3f", z: "Vec3f", origin: "Vec3f") -> None:
+        """Create a transform using three base vectors and the origin vector."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3Df") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3D") -> None:
+        """Convert a floating-point transform to a single precision transform."""
+        ...
+    @overload
+    def __init__(self, transform: "Transform3Dd") -> None:
+        """Convert a double precision transform to a single precision transform."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform2DArray:
+    """Contiguous array of `Transform2D`s."""
+
+    @property
+    def __array_interface__(self) -> "dict":
+        """The transforms as a C-contiguous (len, 3, 2) array of native `long double` numbers, for numpy without copying.
+    
+        Each transform is its 3 columns in order: the axes, then the origin.
+        """
+        ...
+    @property
+    def determinant(self) -> "array":
+        """Compute the determinants of the matrices."""
+        ...
+
+    def scaled(self, scale: Any, /) -> "Transform2DArray":
+        """Apply scaling to a copy of this array, see `Transform2DArray.scale_ip()`."""
+        ...
+    @overload
+    def scale_ip(self, scale: "Vec2") -> Self:
+        """Apply the same scaling to all the transforms inplace, see `Transform2D.scale_ip()`."""
+        ...
+    @overload
+    def scale_ip(self, scales: "Vec2Array") -> Self:
+        """Apply the scaling at the same index to each transform inplace, see `Transform2D.scale_ip()`."""
+        ...
+    def rotated(self, rotation: (float | int), /) -> "Transform2DArray":
+        """Apply rotation to a copy of this array, see `Transform2D.rotate_ip()`."""
+        ...
+    def rotate_ip(self, rotation: (float | int), /) -> Self:
+        """Apply the same rotation to all the transforms inplace, see `Transform2D.rotate_ip()`."""
+        ...
+    def translated(self, translation: Any, /) -> "Transform2DArray":
+        """Apply translation to a copy of this array, see `Transform2DArray.translate_ip()`."""
+        ...
+    @overload
+    def translate_ip(self, translation: "Vec2") -> Self:
+        """Apply the same translation to all the transforms inplace, see `Transform2D.translate_ip()`."""
+        ...
+    @overload
+    def translate_ip(self, translations: "Vec2Array") -> Self:
+        """Apply the translation at the same index to each transform inplace, see `Transform2D.translate_ip()`."""
+        ...
+    def __invert__(self) -> "Transform2DArray":
+        """Get the invert transforms.
+    
+        See Also: `Transform2D.__invert__()`
+        """
+        ...
+    @overload
+    def __imatmul__(self, other: "Transform2DArray") -> Self:
+        """Transform every transform inplace with the other transform at the same index, see `Transform2D.__imatmul__()`."""
+        ...
+    @overload
+    def __imatmul__(self, other: "Transform2D") -> Self:
+        """Transform every transform inplace with the same `Transform2D`, see `Transform2D.__imatmul__()`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform2DArray") -> "Transform2DArray":
+        """Compose the transforms element-wise, see `Transform2D.__matmul__()`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform2D") -> "Transform2DArray":
+        """Compose every transform with the same `Transform2D` on the right."""
+        ...
+    def __dlpack_device__(self) -> "tuple[int, int]": ...
+    def __dlpack__(self, *, stream: Any = None, max_version: Any = None, dl_device: Any = None, copy: Any = None) -> Any:
+        """Export the transforms as a DLPack tensor, same layout as `__array_interface__`, copied if `copy` is True.
+    
+        DLPack has no long double type, so unless it's the same as double they're exported as a copy of doubles,
+        which raises `BufferError` if `copy` is False.
+        """
+        ...
+    @staticmethod
+    def from_buffer(data: Any, /) -> "Transform2DArray":
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, 3, 2)), without copying.
+    
+        The buffer must be C-contiguous, of 6 native `long double` numbers per transform, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Transform2DArray":
+        """Create an array from a block written by `Transform2DArray.to_bytes()` or `Transform2D.pack_many()`."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """Pack the transforms into one block with a small header, the same as `Transform2D.pack_many()`."""
+        ...
+    def tolist(self) -> "list":
+        """Convert this array to a list of `Transform2D`s."""
+        ...
+    def __iter__(self) -> "_Transform2DArray_iterator":
+        """Create an iterator that yields copies of all the transforms of this array in sequence."""
+        ...
+    def __setitem__(self, key: int, value: "Transform2D") -> None:
+        """Set the n-th transform of this array."""
+        ...
+    def __getitem__(self, key: Any) -> Union["Transform2D", "Transform2DArray"]:
+        """Get a copy of the n-th transform, or a copy of a slice of this array."""
+        ...
+    def __len__(self) -> int:
+        """The number of transforms in this array."""
+        ...
+    def __bool__(self) -> "bool":
+        """If the array is not empty."""
+        ...
+    def is_close(self, other: "Transform2DArray", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if all the transforms of the two arrays are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform2DArray.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform2DArray.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create an empty array."""
+        ...
+    @overload
+    def __init__(self, size: int) -> None:
+        """Create an array of `size` identity transforms."""
+        ...
+    @overload
+    def __init__(self, other: "Transform2DArray") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, transforms: Any) -> None:
+        """Create an array from an iterable of `Transform2D`s."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Transform2DArray_iterator:
+    """Internal iterator class for Transform2DArray."""
+
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "Transform2D": ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform3DArray:
+    """Contiguous array of `Transform3D`s."""
+
+    @property
+    def __array_interface__(self) -> "dict":
+        """The transforms as a C-contiguous (len, 4, 3) array of native `long double` numbers, for numpy without copying.
+    
+        Each transform is its 4 columns in order: the axes, then the origin.
+        """
+        ...
+    @property
+    def determinant(self) -> "array":
+        """Compute the determinants of the matrices."""
+        ...
+
+    def scaled(self, scale: Any, /) -> "Transform3DArray":
+        """Apply scaling to a copy of this array, see `Transform3DArray.scale_ip()`."""
+        ...
+    @overload
+    def scale_ip(self, scale: "Vec3") -> Self:
+        """Apply the same scaling to all the transforms inplace, see `Transform3D.scale_ip()`."""
+        ...
+    @overload
+    def scale_ip(self, scales: "Vec3Array") -> Self:
+        """Apply the scaling at the same index to each transform inplace, see `Transform3D.scale_ip()`."""
+        ...
+    def rotated(self, axis: "Vec3", angle: (float | int), /) -> "Transform3DArray":
+        """Apply rotation to a copy of this array, see `Transform3D.rotate_ip()`."""
+        ...
+    def rotate_ip(self, axis: "Vec3", angle: (float | int), /) -> Self:
+        """Apply the same rotation to all the transforms inplace, see `Transform3D.rotate_ip()`."""
+        ...
+    def translated(self, translation: Any, /) -> "Transform3DArray":
+        """Apply translation to a copy of this array, see `Transform3DArray.translate_ip()`."""
+        ...
+    @overload
+    def translate_ip(self, translation: "Vec3") -> Self:
+        """Apply the same translation to all the transforms inplace, see `Transform3D.translate_ip()`."""
+        ...
+    @overload
+    def translate_ip(self, translations: "Vec3Array") -> Self:
+        """Apply the translation at the same index to each transform inplace, see `Transform3D.translate_ip()`."""
+        ...
+    def __invert__(self) -> "Transform3DArray":
+        """Get the invert transforms.
+    
+        See Also: `Transform3D.__invert__()`
+        """
+        ...
+    @overload
+    def __imatmul__(self, other: "Transform3DArray") -> Self:
+        """Transform every transform inplace with the other transform at the same index, see `Transform3D.__imatmul__()`."""
+        ...
+    @overload
+    def __imatmul__(self, other: "Transform3D") -> Self:
+        """Transform every transform inplace with the same `Transform3D`, see `Transform3D.__imatmul__()`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform3DArray") -> "Transform3DArray":
+        """Compose the transforms element-wise, see `Transform3D.__matmul__()`."""
+        ...
+    @overload
+    def __matmul__(self, other: "Transform3D") -> "Transform3DArray":
+        """Compose every transform with the same `Transform3D` on the right."""
+        ...
+    def __dlpack_device__(self) -> "tuple[int, int]": ...
+    def __dlpack__(self, *, stream: Any = None, max_version: Any = None, dl_device: Any = None, copy: Any = None) -> Any:
+        """Export the transforms as a DLPack tensor, same layout as `__array_interface__`, copied if `copy` is True.
+    
+        DLPack has no long double type, so unless it's the same as double they're exported as a copy of doubles,
+        which raises `BufferError` if `copy` is False.
+        """
+        ...
+    @staticmethod
+    def from_buffer(data: Any, /) -> "Transform3DArray":
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, 4, 3)), without copying.
+    
+        The buffer must be C-contiguous, of 12 native `long double` numbers per transform, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Transform3DArray":
+        """Create an array from a block written by `Transform3DArray.to_bytes()` or `Transform3D.pack_many()`."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """Pack the transforms into one block with a small header, the same as `Transform3D.pack_many()`."""
+        ...
+    def tolist(self) -> "list":
+        """Convert this array to a list of `Transform3D`s."""
+        ...
+    def __iter__(self) -> "_Transform3DArray_iterator":
+        """Create an iterator that yields copies of all the transforms of this array in sequence."""
+        ...
+    def __setitem__(self, key: int, value: "Transform3D") -> None:
+        """Set the n-th transform of this array."""
+        ...
+    def __getitem__(self, key: Any) -> Union["Transform3D", "Transform3DArray"]:
+        """Get a copy of the n-th transform, or a copy of a slice of this array."""
+        ...
+    def __len__(self) -> int:
+        """The number of transforms in this array."""
+        ...
+    def __bool__(self) -> "bool":
+        """If the array is not empty."""
+        ...
+    def is_close(self, other: "Transform3DArray", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if all the transforms of the two arrays are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform3DArray.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Transform3DArray.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create an empty array."""
+        ...
+    @overload
+    def __init__(self, size: int) -> None:
+        """Create an array of `size` identity transforms."""
+        ...
+    @overload
+    def __init__(self, other: "Transform3DArray") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, transforms: Any) -> None:
+        """Create an array from an iterable of `Transform3D`s."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Transform3DArray_iterator:
+    """Internal iterator class for Transform3DArray."""
+
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "Transform3D": ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform2DHierarchy:
+    """A hierarchy of `Transform2D`s with incrementally updated world transforms.
+    
+    Nodes are referred to by their index, and a node's parent must be added before the node itself,
+    so the nodes are always in topological order.
+    Setting a local transform only marks the node dirty, `update()` then recomputes the world transforms
+    of the dirty nodes and their descendants, leaving the rest of the hierarchy alone.
+    """
+
+    @property
+    def is_dirty(self) -> "bool":
+        """If any world transform is out of date."""
+        ...
+    @property
+    def locals(self) -> "Transform2DArray":
+        """A copy of the local transforms of all the nodes."""
+        ...
+    @property
+    def worlds(self) -> "Transform2DArray":
+        """A copy of the world transforms of all the nodes, updating the hierarchy first if needed."""
+        ...
+
+    def update(self) -> None:
+        """Recompute the world transforms of the dirty nodes and their descendants."""
+        ...
+    def world(self, index: int, /) -> "Transform2D":
+        """Get a copy of the world transform of a node, updating the hierarchy first if needed."""
+        ...
+    def set_local(self, index: int, local: "Transform2D", /) -> None:
+        """Set the local transform of a node, its world transform and those of its descendants are updated lazily."""
+        ...
+    def local(self, index: int, /) -> "Transform2D":
+        """Get a copy of the local transform of a node."""
+        ...
+    def parent(self, index: int, /) -> int:
+        """The index of the parent of a node, -1 for root nodes."""
+        ...
+    def __len__(self) -> int:
+        """The number of nodes."""
+        ...
+    def add(self, local: "Transform2D", parent: int = -1) -> int:
+        """Add a node with the local transform under `parent` (-1 for a root node), return the index of the new node."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Transform3DHierarchy:
+    """A hierarchy of `Transform3D`s with incrementally updated world transforms.
+    
+    Nodes are referred to by their index, and a node's parent must be added before the node itself,
+    so the nodes are always in topological order.
+    Setting a local transform only marks the node dirty, `update()` then recomputes the world transforms
+    of the dirty nodes and their descendants, leaving the rest of the hierarchy alone.
+    """
+
+    @property
+    def is_dirty(self) -> "bool":
+        """If any world transform is out of date."""
+        ...
+    @property
+    def locals(self) -> "Transform3DArray":
+        """A copy of the local transforms of all the nodes."""
+        ...
+    @property
+    def worlds(self) -> "Transform3DArray":
+        """A copy of the world transforms of all the nodes, updating the hierarchy first if needed."""
+        ...
+
+    def update(self) -> None:
+        """Recompute the world transforms of the dirty nodes and their descendants."""
+        ...
+    def world(self, index: int, /) -> "Transform3D":
+        """Get a copy of the world transform of a node, updating the hierarchy first if needed."""
+        ...
+    def set_local(self, index: int, local: "Transform3D", /) -> None:
+        """Set the local transform of a node, its world transform and those of its descendants are updated lazily."""
+        ...
+    def local(self, index: int, /) -> "Transform3D":
+        """Get a copy of the local transform of a node."""
+        ...
+    def parent(self, index: int, /) -> int:
+        """The index of the parent of a node, -1 for root nodes."""
+        ...
+    def __len__(self) -> int:
+        """The number of nodes."""
+        ...
+    def add(self, local: "Transform3D", parent: int = -1) -> int:
+        """Add a node with the local transform under `parent` (-1 for a root node), return the index of the new node."""
+        ...
+
@@ -0,0 +1,651 @@
+# Declarations of the extension types, generated from the module
+cimport cython
+from libc.math cimport fabsl, floorl, isfinite, INFINITY
+from cpython.float cimport PyFloat_CheckExact, PyFloat_AS_DOUBLE, PyFloat_Check, PyFloat_AsDouble
+from cpython.long cimport PyLong_CheckExact, PyLong_AsLongLong, PyLong_AsDouble, PyLong_Check
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free, PyMem_RawMalloc, PyMem_RawRealloc, PyMem_RawFree
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_SIMPLE, PyBUF_WRITABLE, PyBUF_C_CONTIGUOUS, PyObject_GetBuffer, PyBuffer_Release
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from cpython.bytearray cimport PyByteArray_FromStringAndSize, PyByteArray_AS_STRING
+from cpython.object cimport PyObject
+from cpython.pyport cimport PY_SSIZE_T_MAX
+from cpython.ref cimport Py_INCREF, Py_DECREF
+from cpython.pycapsule cimport PyCapsule_New, PyCapsule_IsValid, PyCapsule_GetPointer
+from libc.string cimport memcpy, memset, memcmp
+from libc.limits cimport INT_MIN, INT_MAX
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t, uint64_t
+from spatium._common cimport py_int, py_float, buffer_float
+from libc.math cimport sqrt, sqrtf, sqrtl, atan2, atan2f, atan2l
+
+
+@cython.final
+cdef class Vec2:
+    cdef public py_float x, y
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, py_float value) noexcept
+    cdef void ___init___2(self, Vec2 xy) noexcept
+    cdef void ___init___3(self, py_float x, py_float y) noexcept
+    cdef void ___init___4(self, Vec2d vec) noexcept
+    cdef void ___init___5(self, Vec2f vec) noexcept
+    cdef void ___init___6(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1)
+    cdef Vec2 ___add___0(self, Vec2 other)
+    cdef Vec2 ___add___1(self, py_float other)
+    cdef Vec2 ___iadd___0(self, Vec2 other)
+    cdef Vec2 ___iadd___1(self, py_float other)
+    cdef Vec2 _add_into_0(self, Vec2 other, Vec2 out)
+    cdef Vec2 _add_into_1(self, py_float other, Vec2 out)
+    cdef Vec2 ___sub___0(self, Vec2 other)
+    cdef Vec2 ___sub___1(self, py_float other)
+    cdef Vec2 ___isub___0(self, Vec2 other)
+    cdef Vec2 ___isub___1(self, py_float other)
+    cdef Vec2 _sub_into_0(self, Vec2 other, Vec2 out)
+    cdef Vec2 _sub_into_1(self, py_float other, Vec2 out)
+    cdef Vec2 ___mul___0(self, Vec2 other)
+    cdef Vec2 ___mul___1(self, py_float other)
+    cdef Vec2 ___imul___0(self, Vec2 other)
+    cdef Vec2 ___imul___1(self, py_float other)
+    cdef Vec2 _mul_into_0(self, Vec2 other, Vec2 out)
+    cdef Vec2 _mul_into_1(self, py_float other, Vec2 out)
+    cdef object ___mul___2(self, object other)
+    cdef Vec2 ___truediv___0(self, Vec2 other)
+    cdef Vec2 ___truediv___1(self, py_float other)
+    cdef Vec2 ___itruediv___0(self, Vec2 other)
+    cdef Vec2 ___itruediv___1(self, py_float other)
+    cdef Vec2 _truediv_into_0(self, Vec2 other, Vec2 out)
+    cdef Vec2 _truediv_into_1(self, py_float other, Vec2 out)
+    cdef Vec2 _mul_add_0(self, Vec2 multiplier, Vec2 addend)
+    cdef Vec2 _mul_add_1(self, py_float multiplier, Vec2 addend)
+    cdef Vec2 _mul_add_ip_0(self, Vec2 multiplier, Vec2 addend)
+    cdef Vec2 _mul_add_ip_1(self, py_float multiplier, Vec2 addend)
+    cdef Vec2 _clamp_0(self, Vec2 low, Vec2 high)
+    cdef Vec2 _clamp_1(self, py_float low, py_float high)
+    cdef Vec2 _clamp_ip_0(self, Vec2 low, Vec2 high)
+    cdef Vec2 _clamp_ip_1(self, py_float low, py_float high)
+
+@cython.final
+cdef class _Vec2iterator:
+    cdef public py_float x, y
+    cdef short index
+
+@cython.final
+cdef class Vec3:
+    cdef public py_float x, y, z
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, py_float value) noexcept
+    cdef void ___init___2(self, Vec3 xyz) noexcept
+    cdef void ___init___3(self, py_float x, Vec2 yz) noexcept
+    cdef void ___init___4(self, Vec2 xy, py_float z) noexcept
+    cdef void ___init___5(self, py_float x, py_float y, py_float z) noexcept
+    cdef void ___init___6(self, Vec3d vec) noexcept
+    cdef void ___init___7(self, Vec3f vec) noexcept
+    cdef void ___init___8(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1, object p2)
+    cdef Vec3 ___add___0(self, Vec3 other)
+    cdef Vec3 ___add___1(self, py_float other)
+    cdef Vec3 ___iadd___0(self, Vec3 other)
+    cdef Vec3 ___iadd___1(self, py_float other)
+    cdef Vec3 _add_into_0(self, Vec3 other, Vec3 out)
+    cdef Vec3 _add_into_1(self, py_float other, Vec3 out)
+    cdef Vec3 ___sub___0(self, Vec3 other)
+    cdef Vec3 ___sub___1(self, py_float other)
+    cdef Vec3 ___isub___0(self, Vec3 other)
+    cdef Vec3 ___isub___1(self, py_float other)
+    cdef Vec3 _sub_into_0(self, Vec3 other, Vec3 out)
+    cdef Vec3 _sub_into_1(self, py_float other, Vec3 out)
+    cdef Vec3 ___mul___0(self, Vec3 other)
+    cdef Vec3 ___mul___1(self, py_float other)
+    cdef Vec3 ___imul___0(self, Vec3 other)
+    cdef Vec3 ___imul___1(self, py_float other)
+    cdef Vec3 _mul_into_0(self, Vec3 other, Vec3 out)
+    cdef Vec3 _mul_into_1(self, py_float other, Vec3 out)
+    cdef object ___mul___2(self, object other)
+    cdef Vec3 ___truediv___0(self, Vec3 other)
+    cdef Vec3 ___truediv___1(self, py_float other)
+    cdef Vec3 ___itruediv___0(self, Vec3 other)
+    cdef Vec3 ___itruediv___1(self, py_float other)
+    cdef Vec3 _truediv_into_0(self, Vec3 other, Vec3 out)
+    cdef Vec3 _truediv_into_1(self, py_float other, Vec3 out)
+    cdef Vec3 _mul_add_0(self, Vec3 multiplier, Vec3 addend)
+    cdef Vec3 _mul_add_1(self, py_float multiplier, Vec3 addend)
+    cdef Vec3 _mul_add_ip_0(self, Vec3 multiplier, Vec3 addend)
+    cdef Vec3 _mul_add_ip_1(self, py_float multiplier, Vec3 addend)
+    cdef Vec3 _clamp_0(self, Vec3 low, Vec3 high)
+    cdef Vec3 _clamp_1(self, py_float low, py_float high)
+    cdef Vec3 _clamp_ip_0(self, Vec3 low, Vec3 high)
+    cdef Vec3 _clamp_ip_1(self, py_float low, py_float high)
+
+@cython.final
+cdef class _Vec3iterator:
+    cdef public py_float x, y, z
+    cdef short index
+
+@cython.final
+cdef class Vec4:
+    cdef public py_float x, y, z, w
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, py_float value) noexcept
+    cdef void ___init___2(self, Vec4 xyzw) noexcept
+    cdef void ___init___3(self, py_float x, Vec3 yzw) noexcept
+    cdef void ___init___4(self, Vec2 xy, Vec2 zw) noexcept
+    cdef void ___init___5(self, Vec3 xyz, py_float w) noexcept
+    cdef void ___init___6(self, py_float x, py_float y, Vec2 zw) noexcept
+    cdef void ___init___7(self, py_float x, Vec2 yz, py_float w) noexcept
+    cdef void ___init___8(self, Vec2 xy, py_float z, py_float w) noexcept
+    cdef void ___init___9(self, py_float x, py_float y, py_float z, py_float w) noexcept
+    cdef void ___init___10(self, Vec4d vec) noexcept
+    cdef void ___init___11(self, Vec4f vec) noexcept
+    cdef void ___init___12(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3)
+    cdef Vec4 ___add___0(self, Vec4 other)
+    cdef Vec4 ___add___1(self, py_float other)
+    cdef Vec4 ___iadd___0(self, Vec4 other)
+    cdef Vec4 ___iadd___1(self, py_float other)
+    cdef Vec4 _add_into_0(self, Vec4 other, Vec4 out)
+    cdef Vec4 _add_into_1(self, py_float other, Vec4 out)
+    cdef Vec4 ___sub___0(self, Vec4 other)
+    cdef Vec4 ___sub___1(self, py_float other)
+    cdef Vec4 ___isub___0(self, Vec4 other)
+    cdef Vec4 ___isub___1(self, py_float other)
+    cdef Vec4 _sub_into_0(self, Vec4 other, Vec4 out)
+    cdef Vec4 _sub_into_1(self, py_float other, Vec4 out)
+    cdef Vec4 ___mul___0(self, Vec4 other)
+    cdef Vec4 ___mul___1(self, py_float other)
+    cdef Vec4 ___imul___0(self, Vec4 other)
+    cdef Vec4 ___imul___1(self, py_float other)
+    cdef Vec4 _mul_into_0(self, Vec4 other, Vec4 out)
+    cdef Vec4 _mul_into_1(self, py_float other, Vec4 out)
+    cdef Vec4 ___truediv___0(self, Vec4 other)
+    cdef Vec4 ___truediv___1(self, py_float other)
+    cdef Vec4 ___itruediv___0(self, Vec4 other)
+    cdef Vec4 ___itruediv___1(self, py_float other)
+    cdef Vec4 _truediv_into_0(self, Vec4 other, Vec4 out)
+    cdef Vec4 _truediv_into_1(self, py_float other, Vec4 out)
+    cdef Vec4 _mul_add_0(self, Vec4 multiplier, Vec4 addend)
+    cdef Vec4 _mul_add_1(self, py_float multiplier, Vec4 addend)
+    cdef Vec4 _mul_add_ip_0(self, Vec4 multiplier, Vec4 addend)
+    cdef Vec4 _mul_add_ip_1(self, py_float multiplier, Vec4 addend)
+    cdef Vec4 _clamp_0(self, Vec4 low, Vec4 high)
+    cdef Vec4 _clamp_1(self, py_float low, py_float high)
+    cdef Vec4 _clamp_ip_0(self, Vec4 low, Vec4 high)
+    cdef Vec4 _clamp_ip_1(self, py_float low, py_float high)
+
+@cython.final
+cdef class _Vec4iterator:
+    cdef public py_float x, y, z, w
+    cdef short index
+
+@cython.final
+cdef class Vec2d:
+    cdef public double x, y
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, double value) noexcept
+    cdef void ___init___2(self, Vec2d xy) noexcept
+    cdef void ___init___3(self, double x, double y) noexcept
+    cdef void ___init___4(self, Vec2 vec) noexcept
+    cdef void ___init___5(self, Vec2f vec) noexcept
+    cdef void ___init___6(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1)
+    cdef Vec2d ___add___0(self, Vec2d other)
+    cdef Vec2d ___add___1(self, double other)
+    cdef Vec2d ___iadd___0(self, Vec2d other)
+    cdef Vec2d ___iadd___1(self, double other)
+    cdef Vec2d _add_into_0(self, Vec2d other, Vec2d out)
+    cdef Vec2d _add_into_1(self, double other, Vec2d out)
+    cdef Vec2d ___sub___0(self, Vec2d other)
+    cdef Vec2d ___sub___1(self, double other)
+    cdef Vec2d ___isub___0(self, Vec2d other)
+    cdef Vec2d ___isub___1(self, double other)
+    cdef Vec2d _sub_into_0(self, Vec2d other, Vec2d out)
+    cdef Vec2d _sub_into_1(self, double other, Vec2d out)
+    cdef Vec2d ___mul___0(self, Vec2d other)
+    cdef Vec2d ___mul___1(self, double other)
+    cdef Vec2d ___imul___0(self, Vec2d other)
+    cdef Vec2d ___imul___1(self, double other)
+    cdef Vec2d _mul_into_0(self, Vec2d other, Vec2d out)
+    cdef Vec2d _mul_into_1(self, double other, Vec2d out)
+    cdef object ___mul___2(self, object other)
+    cdef Vec2d ___truediv___0(self, Vec2d other)
+    cdef Vec2d ___truediv___1(self, double other)
+    cdef Vec2d ___itruediv___0(self, Vec2d other)
+    cdef Vec2d ___itruediv___1(self, double other)
+    cdef Vec2d _truediv_into_0(self, Vec2d other, Vec2d out)
+    cdef Vec2d _truediv_into_1(self, double other, Vec2d out)
+    cdef Vec2d _mul_add_0(self, Vec2d multiplier, Vec2d addend)
+    cdef Vec2d _mul_add_1(self, double multiplier, Vec2d addend)
+    cdef Vec2d _mul_add_ip_0(self, Vec2d multiplier, Vec2d addend)
+    cdef Vec2d _mul_add_ip_1(self, double multiplier, Vec2d addend)
+    cdef Vec2d _clamp_0(self, Vec2d low, Vec2d high)
+    cdef Vec2d _clamp_1(self, double low, double high)
+    cdef Vec2d _clamp_ip_0(self, Vec2d low, Vec2d high)
+    cdef Vec2d _clamp_ip_1(self, double low, double high)
+
+@cython.final
+cdef class _Vec2diterator:
+    cdef public double x, y
+    cdef short index
+
+@cython.final
+cdef class Vec3d:
+    cdef public double x, y, z
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, double value) noexcept
+    cdef void ___init___2(self, Vec3d xyz) noexcept
+    cdef void ___init___3(self, double x, Vec2d yz) noexcept
+    cdef void ___init___4(self, Vec2d xy, double z) noexcept
+    cdef void ___init___5(self, double x, double y, double z) noexcept
+    cdef void ___init___6(self, Vec3 vec) noexcept
+    cdef void ___init___7(self, Vec3f vec) noexcept
+    cdef void ___init___8(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1, object p2)
+    cdef Vec3d ___add___0(self, Vec3d other)
+    cdef Vec3d ___add___1(self, double other)
+    cdef Vec3d ___iadd___0(self, Vec3d other)
+    cdef Vec3d ___iadd___1(self, double other)
+    cdef Vec3d _add_into_0(self, Vec3d other, Vec3d out)
+    cdef Vec3d _add_into_1(self, double other, Vec3d out)
+    cdef Vec3d ___sub___0(self, Vec3d other)
+    cdef Vec3d ___sub___1(self, double other)
+    cdef Vec3d ___isub___0(self, Vec3d other)
+    cdef Vec3d ___isub___1(self, double other)
+    cdef Vec3d _sub_into_0(self, Vec3d other, Vec3d out)
+    cdef Vec3d _sub_into_1(self, double other, Vec3d out)
+    cdef Vec3d ___mul___0(self, Vec3d other)
+    cdef Vec3d ___mul___1(self, double other)
+    cdef Vec3d ___imul___0(self, Vec3d other)
+    cdef Vec3d ___imul___1(self, double other)
+    cdef Vec3d _mul_into_0(self, Vec3d other, Vec3d out)
+    cdef Vec3d _mul_into_1(self, double other, Vec3d out)
+    cdef object ___mul___2(self, object other)
+    cdef Vec3d ___truediv___0(self, Vec3d other)
+    cdef Vec3d ___truediv___1(self, double other)
+    cdef Vec3d ___itruediv___0(self, Vec3d other)
+    cdef Vec3d ___itruediv___1(self, double other)
+    cdef Vec3d _truediv_into_0(self, Vec3d other, Vec3d out)
+    cdef Vec3d _truediv_into_1(self, double other, Vec3d out)
+    cdef Vec3d _mul_add_0(self, Vec3d multiplier, Vec3d addend)
+    cdef Vec3d _mul_add_1(self, double multiplier, Vec3d addend)
+    cdef Vec3d _mul_add_ip_0(self, Vec3d multiplier, Vec3d addend)
+    cdef Vec3d _mul_add_ip_1(self, double multiplier, Vec3d addend)
+    cdef Vec3d _clamp_0(self, Vec3d low, Vec3d high)
+    cdef Vec3d _clamp_1(self, double low, double high)
+    cdef Vec3d _clamp_ip_0(self, Vec3d low, Vec3d high)
+    cdef Vec3d _clamp_ip_1(self, double low, double high)
+
+@cython.final
+cdef class _Vec3diterator:
+    cdef public double x, y, z
+    cdef short index
+
+@cython.final
+cdef class Vec4d:
+    cdef public double x, y, z, w
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, double value) noexcept
+    cdef void ___init___2(self, Vec4d xyzw) noexcept
+    cdef void ___init___3(self, double x, Vec3d yzw) noexcept
+    cdef void ___init___4(self, Vec2d xy, Vec2d zw) noexcept
+    cdef void ___init___5(self, Vec3d xyz, double w) noexcept
+    cdef void ___init___6(self, double x, double y, Vec2d zw) noexcept
+    cdef void ___init___7(self, double x, Vec2d yz, double w) noexcept
+    cdef void ___init___8(self, Vec2d xy, double z, double w) noexcept
+    cdef void ___init___9(self, double x, double y, double z, double w) noexcept
+    cdef void ___init___10(self, Vec4 vec) noexcept
+    cdef void ___init___11(self, Vec4f vec) noexcept
+    cdef void ___init___12(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3)
+    cdef Vec4d ___add___0(self, Vec4d other)
+    cdef Vec4d ___add___1(self, double other)
+    cdef Vec4d ___iadd___0(self, Vec4d other)
+    cdef Vec4d ___iadd___1(self, double other)
+    cdef Vec4d _add_into_0(self, Vec4d other, Vec4d out)
+    cdef Vec4d _add_into_1(self, double other, Vec4d out)
+    cdef Vec4d ___sub___0(self, Vec4d other)
+    cdef Vec4d ___sub___1(self, double other)
+    cdef Vec4d ___isub___0(self, Vec4d other)
+    cdef Vec4d ___isub___1(self, double other)
+    cdef Vec4d _sub_into_0(self, Vec4d other, Vec4d out)
+    cdef Vec4d _sub_into_1(self, double other, Vec4d out)
+    cdef Vec4d ___mul___0(self, Vec4d other)
+    cdef Vec4d ___mul___1(self, double other)
+    cdef Vec4d ___imul___0(self, Vec4d other)
+    cdef Vec4d ___imul___1(self, double other)
+    cdef Vec4d _mul_into_0(self, Vec4d other, Vec4d out)
+    cdef Vec4d _mul_into_1(self, double other, Vec4d out)
+    cdef Vec4d ___truediv___0(self, Vec4d other)
+    cdef Vec4d ___truediv___1(self, double other)
+    cdef Vec4d ___itruediv___0(self, Vec4d other)
+    cdef Vec4d ___itruediv___1(self, double other)
+    cdef Vec4d _truediv_into_0(self, Vec4d other, Vec4d out)
+    cdef Vec4d _truediv_into_1(self, double other, Vec4d out)
+    cdef Vec4d _mul_add_0(self, Vec4d multiplier, Vec4d addend)
+    cdef Vec4d _mul_add_1(self, double multiplier, Vec4d addend)
+    cdef Vec4d _mul_add_ip_0(self, Vec4d multiplier, Vec4d addend)
+    cdef Vec4d _mul_add_ip_1(self, double multiplier, Vec4d addend)
+    cdef Vec4d _clamp_0(self, Vec4d low, Vec4d high)
+    cdef Vec4d _clamp_1(self, double low, double high)
+    cdef Vec4d _clamp_ip_0(self, Vec4d low, Vec4d high)
+    cdef Vec4d _clamp_ip_1(self, double low, double high)
+
+@cython.final
+cdef class _Vec4diterator:
+    cdef public double x, y, z, w
+    cdef short index
+
+@cython.final
+cdef class Vec2f:
+    cdef public float x, y
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, float value) noexcept
+    cdef void ___init___2(self, Vec2f xy) noexcept
+    cdef void ___init___3(self, float x, float y) noexcept
+    cdef void ___init___4(self, Vec2 vec) noexcept
+    cdef void ___init___5(self, Vec2d vec) noexcept
+    cdef void ___init___6(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1)
+    cdef Vec2f ___add___0(self, Vec2f other)
+    cdef Vec2f ___add___1(self, float other)
+    cdef Vec2f ___iadd___0(self, Vec2f other)
+    cdef Vec2f ___iadd___1(self, float other)
+    cdef Vec2f _add_into_0(self, Vec2f other, Vec2f out)
+    cdef Vec2f _add_into_1(self, float other, Vec2f out)
+    cdef Vec2f ___sub___0(self, Vec2f other)
+    cdef Vec2f ___sub___1(self, float other)
+    cdef Vec2f ___isub___0(self, Vec2f other)
+    cdef Vec2f ___isub___1(self, float other)
+    cdef Vec2f _sub_into_0(self, Vec2f other, Vec2f out)
+    cdef Vec2f _sub_into_1(self, float other, Vec2f out)
+    cdef Vec2f ___mul___0(self, Vec2f other)
+    cdef Vec2f ___mul___1(self, float other)
+    cdef Vec2f ___imul___0(self, Vec2f other)
+    cdef Vec2f ___imul___1(self, float other)
+    cdef Vec2f _mul_into_0(self, Vec2f other, Vec2f out)
+    cdef Vec2f _mul_into_1(self, float other, Vec2f out)
+    cdef object ___mul___2(self, object other)
+    cdef Vec2f ___truediv___0(self, Vec2f other)
+    cdef Vec2f ___truediv___1(self, float other)
+    cdef Vec2f ___itruediv___0(self, Vec2f other)
+    cdef Vec2f ___itruediv___1(self, float other)
+    cdef Vec2f _truediv_into_0(self, Vec2f other, Vec2f out)
+    cdef Vec2f _truediv_into_1(self, float other, Vec2f out)
+    cdef Vec2f _mul_add_0(self, Vec2f multiplier, Vec2f addend)
+    cdef Vec2f _mul_add_1(self, float multiplier, Vec2f addend)
+    cdef Vec2f _mul_add_ip_0(self, Vec2f multiplier, Vec2f addend)
+    cdef Vec2f _mul_add_ip_1(self, float multiplier, Vec2f addend)
+    cdef Vec2f _clamp_0(self, Vec2f low, Vec2f high)
+    cdef Vec2f _clamp_1(self, float low, float high)
+    cdef Vec2f _clamp_ip_0(self, Vec2f low, Vec2f high)
+    cdef Vec2f _clamp_ip_1(self, float low, float high)
+
+@cython.final
+cdef class _Vec2fiterator:
+    cdef public float x, y
+    cdef short index
+
+@cython.final
+cdef class Vec3f:
+    cdef public float x, y, z
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, float value) noexcept
+    cdef void ___init___2(self, Vec3f xyz) noexcept
+    cdef void ___init___3(self, float x, Vec2f yz) noexcept
+    cdef void ___init___4(self, Vec2f xy, float z) noexcept
+    cdef void ___init___5(self, float x, float y, float z) noexcept
+    cdef void ___init___6(self, Vec3 vec) noexcept
+    cdef void ___init___7(self, Vec3d vec) noexcept
+    cdef void ___init___8(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1, object p2)
+    cdef Vec3f ___add___0(self, Vec3f other)
+    cdef Vec3f ___add___1(self, float other)
+    cdef Vec3f ___iadd___0(self, Vec3f other)
+    cdef Vec3f ___iadd___1(self, float other)
+    cdef Vec3f _add_into_0(self, Vec3f other, Vec3f out)
+    cdef Vec3f _add_into_1(self, float other, Vec3f out)
+    cdef Vec3f ___sub___0(self, Vec3f other)
+    cdef Vec3f ___sub___1(self, float other)
+    cdef Vec3f ___isub___0(self, Vec3f other)
+    cdef Vec3f ___isub___1(self, float other)
+    cdef Vec3f _sub_into_0(self, Vec3f other, Vec3f out)
+    cdef Vec3f _sub_into_1(self, float other, Vec3f out)
+    cdef Vec3f ___mul___0(self, Vec3f other)
+    cdef Vec3f ___mul___1(self, float other)
+    cdef Vec3f ___imul___0(self, Vec3f other)
+    cdef Vec3f ___imul___1(self, float other)
+    cdef Vec3f _mul_into_0(self, Vec3f other, Vec3f out)
+    cdef Vec3f _mul_into_1(self, float other, Vec3f out)
+    cdef object ___mul___2(self, object other)
+    cdef Vec3f ___truediv___0(self, Vec3f other)
+    cdef Vec3f ___truediv___1(self, float other)
+    cdef Vec3f ___itruediv___0(self, Vec3f other)
+    cdef Vec3f ___itruediv___1(self, float other)
+    cdef Vec3f _truediv_into_0(self, Vec3f other, Vec3f out)
+    cdef Vec3f _truediv_into_1(self, float other, Vec3f out)
+    cdef Vec3f _mul_add_0(self, Vec3f multiplier, Vec3f addend)
+    cdef Vec3f _mul_add_1(self, float multiplier, Vec3f addend)
+    cdef Vec3f _mul_add_ip_0(self, Vec3f multiplier, Vec3f addend)
+    cdef Vec3f _mul_add_ip_1(self, float multiplier, Vec3f addend)
+    cdef Vec3f _clamp_0(self, Vec3f low, Vec3f high)
+    cdef Vec3f _clamp_1(self, float low, float high)
+    cdef Vec3f _clamp_ip_0(self, Vec3f low, Vec3f high)
+    cdef Vec3f _clamp_ip_1(self, float low, float high)
+
+@cython.final
+cdef class _Vec3fiterator:
+    cdef public float x, y, z
+    cdef short index
+
+@cython.final
+cdef class Vec4f:
+    cdef public float x, y, z, w
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, float value) noexcept
+    cdef void ___init___2(self, Vec4f xyzw) noexcept
+    cdef void ___init___3(self, float x, Vec3f yzw) noexcept
+    cdef void ___init___4(self, Vec2f xy, Vec2f zw) noexcept
+    cdef void ___init___5(self, Vec3f xyz, float w) noexcept
+    cdef void ___init___6(self, float x, float y, Vec2f zw) noexcept
+    cdef void ___init___7(self, float x, Vec2f yz, float w) noexcept
+    cdef void ___init___8(self, Vec2f xy, float z, float w) noexcept
+    cdef void ___init___9(self, float x, float y, float z, float w) noexcept
+    cdef void ___init___10(self, Vec4 vec) noexcept
+    cdef void ___init___11(self, Vec4d vec) noexcept
+    cdef void ___init___12(self, object vec)
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3)
+    cdef Vec4f ___add___0(self, Vec4f other)
+    cdef Vec4f ___add___1(self, float other)
+    cdef Vec4f ___iadd___0(self, Vec4f other)
+    cdef Vec4f ___iadd___1(self, float other)
+    cdef Vec4f _add_into_0(self, Vec4f other, Vec4f out)
+    cdef Vec4f _add_into_1(self, float other, Vec4f out)
+    cdef Vec4f ___sub___0(self, Vec4f other)
+    cdef Vec4f ___sub___1(self, float other)
+    cdef Vec4f ___isub___0(self, Vec4f other)
+    cdef Vec4f ___isub___1(self, float other)
+    cdef Vec4f _sub_into_0(self, Vec4f other, Vec4f out)
+    cdef Vec4f _sub_into_1(self, float other, Vec4f out)
+    cdef Vec4f ___mul___0(self, Vec4f other)
+    cdef Vec4f ___mul___1(self, float other)
+    cdef Vec4f ___imul___0(self, Vec4f other)
+    cdef Vec4f ___imul___1(self, float other)
+    cdef Vec4f _mul_into_0(self, Vec4f other, Vec4f out)
+    cdef Vec4f _mul_into_1(self, float other, Vec4f out)
+    cdef Vec4f ___truediv___0(self, Vec4f other)
+    cdef Vec4f ___truediv___1(self, float other)
+    cdef Vec4f ___itruediv___0(self, Vec4f other)
+    cdef Vec4f ___itruediv___1(self, float other)
+    cdef Vec4f _truediv_into_0(self, Vec4f other, Vec4f out)
+    cdef Vec4f _truediv_into_1(self, float other, Vec4f out)
+    cdef Vec4f _mul_add_0(self, Vec4f multiplier, Vec4f addend)
+    cdef Vec4f _mul_add_1(self, float multiplier, Vec4f addend)
+    cdef Vec4f _mul_add_ip_0(self, Vec4f multiplier, Vec4f addend)
+    cdef Vec4f _mul_add_ip_1(self, float multiplier, Vec4f addend)
+    cdef Vec4f _clamp_0(self, Vec4f low, Vec4f high)
+    cdef Vec4f _clamp_1(self, float low, float high)
+    cdef Vec4f _clamp_ip_0(self, Vec4f low, Vec4f high)
+    cdef Vec4f _clamp_ip_1(self, float low, float high)
+
+@cython.final
+cdef class _Vec4fiterator:
+    cdef public float x, y, z, w
+    cdef short index
+
+@cython.final
+cdef class Vec2Array:
+    cdef py_float* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[2] shape
+    cdef Py_ssize_t[2] strides
+    cdef Py_buffer view
+    cdef bint is_view
+    cdef int _alloc(self, Py_ssize_t size) except -1
+    cdef void _set_size(self, Py_ssize_t size) noexcept
+    cdef int _check_size(self, Vec2Array other) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef Vec2 _get(self, Py_ssize_t index)
+    cdef void _set(self, Py_ssize_t index, Vec2 vec) noexcept
+    cdef void ___init___0(self)
+    cdef void ___init___1(self, py_int size)
+    cdef void ___init___2(self, Vec2Array other)
+    cdef void ___init___3(self, object vectors)
+    cdef Vec2Array ___add___0(self, Vec2Array other)
+    cdef Vec2Array ___add___1(self, Vec2 other)
+    cdef Vec2Array ___add___2(self, py_float other)
+    cdef Vec2Array ___iadd___0(self, Vec2Array other)
+    cdef Vec2Array ___iadd___1(self, Vec2 other)
+    cdef Vec2Array ___iadd___2(self, py_float other)
+    cdef Vec2Array ___sub___0(self, Vec2Array other)
+    cdef Vec2Array ___sub___1(self, Vec2 other)
+    cdef Vec2Array ___sub___2(self, py_float other)
+    cdef Vec2Array ___isub___0(self, Vec2Array other)
+    cdef Vec2Array ___isub___1(self, Vec2 other)
+    cdef Vec2Array ___isub___2(self, py_float other)
+    cdef Vec2Array ___mul___0(self, Vec2Array other)
+    cdef Vec2Array ___mul___1(self, Vec2 other)
+    cdef Vec2Array ___mul___2(self, py_float other)
+    cdef Vec2Array ___imul___0(self, Vec2Array other)
+    cdef Vec2Array ___imul___1(self, Vec2 other)
+    cdef Vec2Array ___imul___2(self, py_float other)
+    cdef Vec2Array ___truediv___0(self, Vec2Array other)
+    cdef Vec2Array ___truediv___1(self, Vec2 other)
+    cdef Vec2Array ___truediv___2(self, py_float other)
+    cdef Vec2Array ___itruediv___0(self, Vec2Array other)
+    cdef Vec2Array ___itruediv___1(self, Vec2 other)
+    cdef Vec2Array ___itruediv___2(self, py_float other)
+    cdef object _distances(self, object other, bint squared)
+    cdef int _distance_matrix(self, Vec2Array other, buffer_float[:, ::1] out, bint squared) except -1
+    cdef int _check_not_empty(self) except -1
+    cdef void _bounds(self, py_float* lo, py_float* hi) noexcept nogil
+    cdef Py_ssize_t _arg_length_sqr(self, bint largest) noexcept nogil
+
+@cython.final
+cdef class _Vec2Array_iterator:
+    cdef Vec2Array array
+    cdef Py_ssize_t index
+
+@cython.final
+cdef class Vec3Array:
+    cdef py_float* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[2] shape
+    cdef Py_ssize_t[2] strides
+    cdef Py_buffer view
+    cdef bint is_view
+    cdef int _alloc(self, Py_ssize_t size) except -1
+    cdef void _set_size(self, Py_ssize_t size) noexcept
+    cdef int _check_size(self, Vec3Array other) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef Vec3 _get(self, Py_ssize_t index)
+    cdef void _set(self, Py_ssize_t index, Vec3 vec) noexcept
+    cdef void ___init___0(self)
+    cdef void ___init___1(self, py_int size)
+    cdef void ___init___2(self, Vec3Array other)
+    cdef void ___init___3(self, object vectors)
+    cdef Vec3Array ___add___0(self, Vec3Array other)
+    cdef Vec3Array ___add___1(self, Vec3 other)
+    cdef Vec3Array ___add___2(self, py_float other)
+    cdef Vec3Array ___iadd___0(self, Vec3Array other)
+    cdef Vec3Array ___iadd___1(self, Vec3 other)
+    cdef Vec3Array ___iadd___2(self, py_float other)
+    cdef Vec3Array ___sub___0(self, Vec3Array other)
+    cdef Vec3Array ___sub___1(self, Vec3 other)
+    cdef Vec3Array ___sub___2(self, py_float other)
+    cdef Vec3Array ___isub___0(self, Vec3Array other)
+    cdef Vec3Array ___isub___1(self, Vec3 other)
+    cdef Vec3Array ___isub___2(self, py_float other)
+    cdef Vec3Array ___mul___0(self, Vec3Array other)
+    cdef Vec3Array ___mul___1(self, Vec3 other)
+    cdef Vec3Array ___mul___2(self, py_float other)
+    cdef Vec3Array ___imul___0(self, Vec3Array other)
+    cdef Vec3Array ___imul___1(self, Vec3 other)
+    cdef Vec3Array ___imul___2(self, py_float other)
+    cdef Vec3Array ___truediv___0(self, Vec3Array other)
+    cdef Vec3Array ___truediv___1(self, Vec3 other)
+    cdef Vec3Array ___truediv___2(self, py_float other)
+    cdef Vec3Array ___itruediv___0(self, Vec3Array other)
+    cdef Vec3Array ___itruediv___1(self, Vec3 other)
+    cdef Vec3Array ___itruediv___2(self, py_float other)
+    cdef Vec3Array ___xor___0(self, Vec3Array other)
+    cdef Vec3Array ___xor___1(self, Vec3 other)
+    cdef object _distances(self, object other, bint squared)
+    cdef int _distance_matrix(self, Vec3Array other, buffer_float[:, ::1] out, bint squared) except -1
+    cdef int _check_not_empty(self) except -1
+    cdef void _bounds(self, py_float* lo, py_float* hi) noexcept nogil
+    cdef Py_ssize_t _arg_length_sqr(self, bint largest) noexcept nogil
+
+@cython.final
+cdef class _Vec3Array_iterator:
+    cdef Vec3Array array
+    cdef Py_ssize_t index
+
+@cython.final
+cdef class Vec4Array:
+    cdef py_float* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[2] shape
+    cdef Py_ssize_t[2] strides
+    cdef Py_buffer view
+    cdef bint is_view
+    cdef int _alloc(self, Py_ssize_t size) except -1
+    cdef void _set_size(self, Py_ssize_t size) noexcept
+    cdef int _check_size(self, Vec4Array other) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef Vec4 _get(self, Py_ssize_t index)
+    cdef void _set(self, Py_ssize_t index, Vec4 vec) noexcept
+    cdef void ___init___0(self)
+    cdef void ___init___1(self, py_int size)
+    cdef void ___init___2(self, Vec4Array other)
+    cdef void ___init___3(self, object vectors)
+    cdef Vec4Array ___add___0(self, Vec4Array other)
+    cdef Vec4Array ___add___1(self, Vec4 other)
+    cdef Vec4Array ___add___2(self, py_float other)
+    cdef Vec4Array ___iadd___0(self, Vec4Array other)
+    cdef Vec4Array ___iadd___1(self, Vec4 other)
+    cdef Vec4Array ___iadd___2(self, py_float other)
+    cdef Vec4Array ___sub___0(self, Vec4Array other)
+    cdef Vec4Array ___sub___1(self, Vec4 other)
+    cdef Vec4Array ___sub___2(self, py_float other)
+    cdef Vec4Array ___isub___0(self, Vec4Array other)
+    cdef Vec4Array ___isub___1(self, Vec4 other)
+    cdef Vec4Array ___isub___2(self, py_float other)
+    cdef Vec4Array ___mul___0(self, Vec4Array other)
+    cdef Vec4Array ___mul___1(self, Vec4 other)
+    cdef Vec4Array ___mul___2(self, py_float other)
+    cdef Vec4Array ___imul___0(self, Vec4Array other)
+    cdef Vec4Array ___imul___1(self, Vec4 other)
+    cdef Vec4Array ___imul___2(self, py_float other)
+    cdef Vec4Array ___truediv___0(self, Vec4Array other)
+    cdef Vec4Array ___truediv___1(self, Vec4 other)
+    cdef Vec4Array ___truediv___2(self, py_float other)
+    cdef Vec4Array ___itruediv___0(self, Vec4Array other)
+    cdef Vec4Array ___itruediv___1(self, Vec4 other)
+    cdef Vec4Array ___itruediv___2(self, py_float other)
+    cdef object _distances(self, object other, bint squared)
+    cdef int _distance_matrix(self, Vec4Array other, buffer_float[:, ::1] out, bint squared) except -1
+    cdef int _check_not_empty(self) except -1
+    cdef void _bounds(self, py_float* lo, py_float* hi) noexcept nogil
+    cdef Py_ssize_t _arg_length_sqr(self, bint largest) noexcept nogil
+
+@cython.final
+cdef class _Vec4Array_iterator:
+    cdef Vec4Array array
+    cdef Py_ssize_t index
@@ -0,0 +1,506 @@
+# Declarations of the extension types, generated from the module
+cimport cython
+from libc.math cimport fabsl, floorl, isfinite, INFINITY
+from cpython.float cimport PyFloat_CheckExact, PyFloat_AS_DOUBLE, PyFloat_Check, PyFloat_AsDouble
+from cpython.long cimport PyLong_CheckExact, PyLong_AsLongLong, PyLong_AsDouble, PyLong_Check
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free, PyMem_RawMalloc, PyMem_RawRealloc, PyMem_RawFree
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_SIMPLE, PyBUF_WRITABLE, PyBUF_C_CONTIGUOUS, PyObject_GetBuffer, PyBuffer_Release
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from cpython.bytearray cimport PyByteArray_FromStringAndSize, PyByteArray_AS_STRING
+from cpython.object cimport PyObject
+from cpython.pyport cimport PY_SSIZE_T_MAX
+from cpython.ref cimport Py_INCREF, Py_DECREF
+from cpython.pycapsule cimport PyCapsule_New, PyCapsule_IsValid, PyCapsule_GetPointer
+from libc.string cimport memcpy, memset, memcmp
+from libc.limits cimport INT_MIN, INT_MAX
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t, uint64_t
+from spatium._common cimport py_int, py_float, buffer_float
+from spatium._vector cimport Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector cimport Vec2Array, Vec3Array, Vec4Array
+from spatium._transform cimport Transform2D, Transform3D, Transform2Dd, Transform3Dd, Transform2Df, Transform3Df
+from libc.math cimport sqrt, sqrtf, sqrtl, atan2, atan2f, atan2l
+
+
+@cython.final
+cdef class Vec2i:
+    cdef public py_int x, y
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, py_int value) noexcept
+    cdef void ___init___2(self, Vec2i xy) noexcept
+    cdef void ___init___3(self, py_int x, py_int y) noexcept
+    cdef void ___init___4(self, Vec2 vec) noexcept
+    cdef void ___init___5(self, Vec2d vec) noexcept
+    cdef void ___init___6(self, Vec2f vec) noexcept
+    cdef void ___init___7(self, Vec2i32 vec) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1)
+    cdef Vec2i ___add___0(self, Vec2i other)
+    cdef Vec2i ___add___1(self, py_int other)
+    cdef Vec2i ___iadd___0(self, Vec2i other)
+    cdef Vec2i ___iadd___1(self, py_int other)
+    cdef Vec2i _add_into_0(self, Vec2i other, Vec2i out)
+    cdef Vec2i _add_into_1(self, py_int other, Vec2i out)
+    cdef Vec2i ___sub___0(self, Vec2i other)
+    cdef Vec2i ___sub___1(self, py_int other)
+    cdef Vec2i ___isub___0(self, Vec2i other)
+    cdef Vec2i ___isub___1(self, py_int other)
+    cdef Vec2i _sub_into_0(self, Vec2i other, Vec2i out)
+    cdef Vec2i _sub_into_1(self, py_int other, Vec2i out)
+    cdef Vec2i ___mul___0(self, Vec2i other)
+    cdef Vec2i ___mul___1(self, py_int other)
+    cdef Vec2i ___imul___0(self, Vec2i other)
+    cdef Vec2i ___imul___1(self, py_int other)
+    cdef Vec2i _mul_into_0(self, Vec2i other, Vec2i out)
+    cdef Vec2i _mul_into_1(self, py_int other, Vec2i out)
+    cdef Vec2 ___mul___2(self, Transform2D t)
+    cdef Vec2i ___truediv___0(self, Vec2i other)
+    cdef Vec2i ___truediv___1(self, py_int other)
+    cdef Vec2i ___itruediv___0(self, Vec2i other)
+    cdef Vec2i ___itruediv___1(self, py_int other)
+    cdef Vec2i _truediv_into_0(self, Vec2i other, Vec2i out)
+    cdef Vec2i _truediv_into_1(self, py_int other, Vec2i out)
+    cdef Vec2i _mul_add_0(self, Vec2i multiplier, Vec2i addend)
+    cdef Vec2i _mul_add_1(self, py_int multiplier, Vec2i addend)
+    cdef Vec2i _mul_add_ip_0(self, Vec2i multiplier, Vec2i addend)
+    cdef Vec2i _mul_add_ip_1(self, py_int multiplier, Vec2i addend)
+    cdef Vec2i _clamp_0(self, Vec2i low, Vec2i high)
+    cdef Vec2i _clamp_1(self, py_int low, py_int high)
+    cdef Vec2i _clamp_ip_0(self, Vec2i low, Vec2i high)
+    cdef Vec2i _clamp_ip_1(self, py_int low, py_int high)
+
+@cython.final
+cdef class _Vec2iiterator:
+    cdef public py_int x, y
+    cdef short index
+
+@cython.final
+cdef class Vec3i:
+    cdef public py_int x, y, z
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, py_int value) noexcept
+    cdef void ___init___2(self, Vec3i xyz) noexcept
+    cdef void ___init___3(self, py_int x, Vec2i yz) noexcept
+    cdef void ___init___4(self, Vec2i xy, py_int z) noexcept
+    cdef void ___init___5(self, py_int x, py_int y, py_int z) noexcept
+    cdef void ___init___6(self, Vec3 vec) noexcept
+    cdef void ___init___7(self, Vec3d vec) noexcept
+    cdef void ___init___8(self, Vec3f vec) noexcept
+    cdef void ___init___9(self, Vec3i32 vec) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2)
+    cdef Vec3i ___add___0(self, Vec3i other)
+    cdef Vec3i ___add___1(self, py_int other)
+    cdef Vec3i ___iadd___0(self, Vec3i other)
+    cdef Vec3i ___iadd___1(self, py_int other)
+    cdef Vec3i _add_into_0(self, Vec3i other, Vec3i out)
+    cdef Vec3i _add_into_1(self, py_int other, Vec3i out)
+    cdef Vec3i ___sub___0(self, Vec3i other)
+    cdef Vec3i ___sub___1(self, py_int other)
+    cdef Vec3i ___isub___0(self, Vec3i other)
+    cdef Vec3i ___isub___1(self, py_int other)
+    cdef Vec3i _sub_into_0(self, Vec3i other, Vec3i out)
+    cdef Vec3i _sub_into_1(self, py_int other, Vec3i out)
+    cdef Vec3i ___mul___0(self, Vec3i other)
+    cdef Vec3i ___mul___1(self, py_int other)
+    cdef Vec3i ___imul___0(self, Vec3i other)
+    cdef Vec3i ___imul___1(self, py_int other)
+    cdef Vec3i _mul_into_0(self, Vec3i other, Vec3i out)
+    cdef Vec3i _mul_into_1(self, py_int other, Vec3i out)
+    cdef Vec3 ___mul___2(self, Transform3D t)
+    cdef Vec3i ___truediv___0(self, Vec3i other)
+    cdef Vec3i ___truediv___1(self, py_int other)
+    cdef Vec3i ___itruediv___0(self, Vec3i other)
+    cdef Vec3i ___itruediv___1(self, py_int other)
+    cdef Vec3i _truediv_into_0(self, Vec3i other, Vec3i out)
+    cdef Vec3i _truediv_into_1(self, py_int other, Vec3i out)
+    cdef Vec3i _mul_add_0(self, Vec3i multiplier, Vec3i addend)
+    cdef Vec3i _mul_add_1(self, py_int multiplier, Vec3i addend)
+    cdef Vec3i _mul_add_ip_0(self, Vec3i multiplier, Vec3i addend)
+    cdef Vec3i _mul_add_ip_1(self, py_int multiplier, Vec3i addend)
+    cdef Vec3i _clamp_0(self, Vec3i low, Vec3i high)
+    cdef Vec3i _clamp_1(self, py_int low, py_int high)
+    cdef Vec3i _clamp_ip_0(self, Vec3i low, Vec3i high)
+    cdef Vec3i _clamp_ip_1(self, py_int low, py_int high)
+
+@cython.final
+cdef class _Vec3iiterator:
+    cdef public py_int x, y, z
+    cdef short index
+
+@cython.final
+cdef class Vec4i:
+    cdef public py_int x, y, z, w
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, py_int value) noexcept
+    cdef void ___init___2(self, Vec4i xyzw) noexcept
+    cdef void ___init___3(self, py_int x, Vec3i yzw) noexcept
+    cdef void ___init___4(self, Vec2i xy, Vec2i zw) noexcept
+    cdef void ___init___5(self, Vec3i xyz, py_int w) noexcept
+    cdef void ___init___6(self, py_int x, py_int y, Vec2i zw) noexcept
+    cdef void ___init___7(self, py_int x, Vec2i yz, py_int w) noexcept
+    cdef void ___init___8(self, Vec2i xy, py_int z, py_int w) noexcept
+    cdef void ___init___9(self, py_int x, py_int y, py_int z, py_int w) noexcept
+    cdef void ___init___10(self, Vec4 vec) noexcept
+    cdef void ___init___11(self, Vec4d vec) noexcept
+    cdef void ___init___12(self, Vec4f vec) noexcept
+    cdef void ___init___13(self, Vec4i32 vec) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3)
+    cdef Vec4i ___add___0(self, Vec4i other)
+    cdef Vec4i ___add___1(self, py_int other)
+    cdef Vec4i ___iadd___0(self, Vec4i other)
+    cdef Vec4i ___iadd___1(self, py_int other)
+    cdef Vec4i _add_into_0(self, Vec4i other, Vec4i out)
+    cdef Vec4i _add_into_1(self, py_int other, Vec4i out)
+    cdef Vec4i ___sub___0(self, Vec4i other)
+    cdef Vec4i ___sub___1(self, py_int other)
+    cdef Vec4i ___isub___0(self, Vec4i other)
+    cdef Vec4i ___isub___1(self, py_int other)
+    cdef Vec4i _sub_into_0(self, Vec4i other, Vec4i out)
+    cdef Vec4i _sub_into_1(self, py_int other, Vec4i out)
+    cdef Vec4i ___mul___0(self, Vec4i other)
+    cdef Vec4i ___mul___1(self, py_int other)
+    cdef Vec4i ___imul___0(self, Vec4i other)
+    cdef Vec4i ___imul___1(self, py_int other)
+    cdef Vec4i _mul_into_0(self, Vec4i other, Vec4i out)
+    cdef Vec4i _mul_into_1(self, py_int other, Vec4i out)
+    cdef Vec4i ___truediv___0(self, Vec4i other)
+    cdef Vec4i ___truediv___1(self, py_int other)
+    cdef Vec4i ___itruediv___0(self, Vec4i other)
+    cdef Vec4i ___itruediv___1(self, py_int other)
+    cdef Vec4i _truediv_into_0(self, Vec4i other, Vec4i out)
+    cdef Vec4i _truediv_into_1(self, py_int other, Vec4i out)
+    cdef Vec4i _mul_add_0(self, Vec4i multiplier, Vec4i addend)
+    cdef Vec4i _mul_add_1(self, py_int multiplier, Vec4i addend)
+    cdef Vec4i _mul_add_ip_0(self, Vec4i multiplier, Vec4i addend)
+    cdef Vec4i _mul_add_ip_1(self, py_int multiplier, Vec4i addend)
+    cdef Vec4i _clamp_0(self, Vec4i low, Vec4i high)
+    cdef Vec4i _clamp_1(self, py_int low, py_int high)
+    cdef Vec4i _clamp_ip_0(self, Vec4i low, Vec4i high)
+    cdef Vec4i _clamp_ip_1(self, py_int low, py_int high)
+
+@cython.final
+cdef class _Vec4iiterator:
+    cdef public py_int x, y, z, w
+    cdef short index
+
+@cython.final
+cdef class Vec2i32:
+    cdef public int x, y
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, int value) noexcept
+    cdef void ___init___2(self, Vec2i32 xy) noexcept
+    cdef void ___init___3(self, int x, int y) noexcept
+    cdef void ___init___4(self, Vec2 vec) noexcept
+    cdef void ___init___5(self, Vec2i vec) noexcept
+    cdef void ___init___6(self, Vec2d vec) noexcept
+    cdef void ___init___7(self, Vec2f vec) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1)
+    cdef Vec2i32 ___add___0(self, Vec2i32 other)
+    cdef Vec2i32 ___add___1(self, int other)
+    cdef Vec2i32 ___iadd___0(self, Vec2i32 other)
+    cdef Vec2i32 ___iadd___1(self, int other)
+    cdef Vec2i32 _add_into_0(self, Vec2i32 other, Vec2i32 out)
+    cdef Vec2i32 _add_into_1(self, int other, Vec2i32 out)
+    cdef Vec2i32 ___sub___0(self, Vec2i32 other)
+    cdef Vec2i32 ___sub___1(self, int other)
+    cdef Vec2i32 ___isub___0(self, Vec2i32 other)
+    cdef Vec2i32 ___isub___1(self, int other)
+    cdef Vec2i32 _sub_into_0(self, Vec2i32 other, Vec2i32 out)
+    cdef Vec2i32 _sub_into_1(self, int other, Vec2i32 out)
+    cdef Vec2i32 ___mul___0(self, Vec2i32 other)
+    cdef Vec2i32 ___mul___1(self, int other)
+    cdef Vec2i32 ___imul___0(self, Vec2i32 other)
+    cdef Vec2i32 ___imul___1(self, int other)
+    cdef Vec2i32 _mul_into_0(self, Vec2i32 other, Vec2i32 out)
+    cdef Vec2i32 _mul_into_1(self, int other, Vec2i32 out)
+    cdef Vec2d ___mul___2(self, Transform2Dd t)
+    cdef Vec2i32 ___truediv___0(self, Vec2i32 other)
+    cdef Vec2i32 ___truediv___1(self, int other)
+    cdef Vec2i32 ___itruediv___0(self, Vec2i32 other)
+    cdef Vec2i32 ___itruediv___1(self, int other)
+    cdef Vec2i32 _truediv_into_0(self, Vec2i32 other, Vec2i32 out)
+    cdef Vec2i32 _truediv_into_1(self, int other, Vec2i32 out)
+    cdef Vec2i32 _mul_add_0(self, Vec2i32 multiplier, Vec2i32 addend)
+    cdef Vec2i32 _mul_add_1(self, int multiplier, Vec2i32 addend)
+    cdef Vec2i32 _mul_add_ip_0(self, Vec2i32 multiplier, Vec2i32 addend)
+    cdef Vec2i32 _mul_add_ip_1(self, int multiplier, Vec2i32 addend)
+    cdef Vec2i32 _clamp_0(self, Vec2i32 low, Vec2i32 high)
+    cdef Vec2i32 _clamp_1(self, int low, int high)
+    cdef Vec2i32 _clamp_ip_0(self, Vec2i32 low, Vec2i32 high)
+    cdef Vec2i32 _clamp_ip_1(self, int low, int high)
+
+@cython.final
+cdef class _Vec2i32iterator:
+    cdef public int x, y
+    cdef short index
+
+@cython.final
+cdef class Vec3i32:
+    cdef public int x, y, z
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, int value) noexcept
+    cdef void ___init___2(self, Vec3i32 xyz) noexcept
+    cdef void ___init___3(self, int x, Vec2i32 yz) noexcept
+    cdef void ___init___4(self, Vec2i32 xy, int z) noexcept
+    cdef void ___init___5(self, int x, int y, int z) noexcept
+    cdef void ___init___6(self, Vec3 vec) noexcept
+    cdef void ___init___7(self, Vec3i vec) noexcept
+    cdef void ___init___8(self, Vec3d vec) noexcept
+    cdef void ___init___9(self, Vec3f vec) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2)
+    cdef Vec3i32 ___add___0(self, Vec3i32 other)
+    cdef Vec3i32 ___add___1(self, int other)
+    cdef Vec3i32 ___iadd___0(self, Vec3i32 other)
+    cdef Vec3i32 ___iadd___1(self, int other)
+    cdef Vec3i32 _add_into_0(self, Vec3i32 other, Vec3i32 out)
+    cdef Vec3i32 _add_into_1(self, int other, Vec3i32 out)
+    cdef Vec3i32 ___sub___0(self, Vec3i32 other)
+    cdef Vec3i32 ___sub___1(self, int other)
+    cdef Vec3i32 ___isub___0(self, Vec3i32 other)
+    cdef Vec3i32 ___isub___1(self, int other)
+    cdef Vec3i32 _sub_into_0(self, Vec3i32 other, Vec3i32 out)
+    cdef Vec3i32 _sub_into_1(self, int other, Vec3i32 out)
+    cdef Vec3i32 ___mul___0(self, Vec3i32 other)
+    cdef Vec3i32 ___mul___1(self, int other)
+    cdef Vec3i32 ___imul___0(self, Vec3i32 other)
+    cdef Vec3i32 ___imul___1(self, int other)
+    cdef Vec3i32 _mul_into_0(self, Vec3i32 other, Vec3i32 out)
+    cdef Vec3i32 _mul_into_1(self, int other, Vec3i32 out)
+    cdef Vec3d ___mul___2(self, Transform3Dd t)
+    cdef Vec3i32 ___truediv___0(self, Vec3i32 other)
+    cdef Vec3i32 ___truediv___1(self, int other)
+    cdef Vec3i32 ___itruediv___0(self, Vec3i32 other)
+    cdef Vec3i32 ___itruediv___1(self, int other)
+    cdef Vec3i32 _truediv_into_0(self, Vec3i32 other, Vec3i32 out)
+    cdef Vec3i32 _truediv_into_1(self, int other, Vec3i32 out)
+    cdef Vec3i32 _mul_add_0(self, Vec3i32 multiplier, Vec3i32 addend)
+    cdef Vec3i32 _mul_add_1(self, int multiplier, Vec3i32 addend)
+    cdef Vec3i32 _mul_add_ip_0(self, Vec3i32 multiplier, Vec3i32 addend)
+    cdef Vec3i32 _mul_add_ip_1(self, int multiplier, Vec3i32 addend)
+    cdef Vec3i32 _clamp_0(self, Vec3i32 low, Vec3i32 high)
+    cdef Vec3i32 _clamp_1(self, int low, int high)
+    cdef Vec3i32 _clamp_ip_0(self, Vec3i32 low, Vec3i32 high)
+    cdef Vec3i32 _clamp_ip_1(self, int low, int high)
+
+@cython.final
+cdef class _Vec3i32iterator:
+    cdef public int x, y, z
+    cdef short index
+
+@cython.final
+cdef class Vec4i32:
+    cdef public int x, y, z, w
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, int value) noexcept
+    cdef void ___init___2(self, Vec4i32 xyzw) noexcept
+    cdef void ___init___3(self, int x, Vec3i32 yzw) noexcept
+    cdef void ___init___4(self, Vec2i32 xy, Vec2i32 zw) noexcept
+    cdef void ___init___5(self, Vec3i32 xyz, int w) noexcept
+    cdef void ___init___6(self, int x, int y, Vec2i32 zw) noexcept
+    cdef void ___init___7(self, int x, Vec2i32 yz, int w) noexcept
+    cdef void ___init___8(self, Vec2i32 xy, int z, int w) noexcept
+    cdef void ___init___9(self, int x, int y, int z, int w) noexcept
+    cdef void ___init___10(self, Vec4 vec) noexcept
+    cdef void ___init___11(self, Vec4i vec) noexcept
+    cdef void ___init___12(self, Vec4d vec) noexcept
+    cdef void ___init___13(self, Vec4f vec) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3)
+    cdef Vec4i32 ___add___0(self, Vec4i32 other)
+    cdef Vec4i32 ___add___1(self, int other)
+    cdef Vec4i32 ___iadd___0(self, Vec4i32 other)
+    cdef Vec4i32 ___iadd___1(self, int other)
+    cdef Vec4i32 _add_into_0(self, Vec4i32 other, Vec4i32 out)
+    cdef Vec4i32 _add_into_1(self, int other, Vec4i32 out)
+    cdef Vec4i32 ___sub___0(self, Vec4i32 other)
+    cdef Vec4i32 ___sub___1(self, int other)
+    cdef Vec4i32 ___isub___0(self, Vec4i32 other)
+    cdef Vec4i32 ___isub___1(self, int other)
+    cdef Vec4i32 _sub_into_0(self, Vec4i32 other, Vec4i32 out)
+    cdef Vec4i32 _sub_into_1(self, int other, Vec4i32 out)
+    cdef Vec4i32 ___mul___0(self, Vec4i32 other)
+    cdef Vec4i32 ___mul___1(self, int other)
+    cdef Vec4i32 ___imul___0(self, Vec4i32 other)
+    cdef Vec4i32 ___imul___1(self, int other)
+    cdef Vec4i32 _mul_into_0(self, Vec4i32 other, Vec4i32 out)
+    cdef Vec4i32 _mul_into_1(self, int other, Vec4i32 out)
+    cdef Vec4i32 ___truediv___0(self, Vec4i32 other)
+    cdef Vec4i32 ___truediv___1(self, int other)
+    cdef Vec4i32 ___itruediv___0(self, Vec4i32 other)
+    cdef Vec4i32 ___itruediv___1(self, int other)
+    cdef Vec4i32 _truediv_into_0(self, Vec4i32 other, Vec4i32 out)
+    cdef Vec4i32 _truediv_into_1(self, int other, Vec4i32 out)
+    cdef Vec4i32 _mul_add_0(self, Vec4i32 multiplier, Vec4i32 addend)
+    cdef Vec4i32 _mul_add_1(self, int multiplier, Vec4i32 addend)
+    cdef Vec4i32 _mul_add_ip_0(self, Vec4i32 multiplier, Vec4i32 addend)
+    cdef Vec4i32 _mul_add_ip_1(self, int multiplier, Vec4i32 addend)
+    cdef Vec4i32 _clamp_0(self, Vec4i32 low, Vec4i32 high)
+    cdef Vec4i32 _clamp_1(self, int low, int high)
+    cdef Vec4i32 _clamp_ip_0(self, Vec4i32 low, Vec4i32 high)
+    cdef Vec4i32 _clamp_ip_1(self, int low, int high)
+
+@cython.final
+cdef class _Vec4i32iterator:
+    cdef public int x, y, z, w
+    cdef short index
+
+@cython.final
+cdef class Vec2iArray:
+    cdef py_int* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[2] shape
+    cdef Py_ssize_t[2] strides
+    cdef Py_buffer view
+    cdef bint is_view
+    cdef int _alloc(self, Py_ssize_t size) except -1
+    cdef void _set_size(self, Py_ssize_t size) noexcept
+    cdef int _check_size(self, Vec2iArray other) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef Vec2i _get(self, Py_ssize_t index)
+    cdef void _set(self, Py_ssize_t index, Vec2i vec) noexcept
+    cdef void ___init___0(self)
+    cdef void ___init___1(self, py_int size)
+    cdef void ___init___2(self, Vec2iArray other)
+    cdef void ___init___3(self, Vec2Array other)
+    cdef void ___init___4(self, object vectors)
+    cdef Vec2iArray ___add___0(self, Vec2iArray other)
+    cdef Vec2iArray ___add___1(self, Vec2i other)
+    cdef Vec2iArray ___add___2(self, py_int other)
+    cdef Vec2iArray ___iadd___0(self, Vec2iArray other)
+    cdef Vec2iArray ___iadd___1(self, Vec2i other)
+    cdef Vec2iArray ___iadd___2(self, py_int other)
+    cdef Vec2iArray ___sub___0(self, Vec2iArray other)
+    cdef Vec2iArray ___sub___1(self, Vec2i other)
+    cdef Vec2iArray ___sub___2(self, py_int other)
+    cdef Vec2iArray ___isub___0(self, Vec2iArray other)
+    cdef Vec2iArray ___isub___1(self, Vec2i other)
+    cdef Vec2iArray ___isub___2(self, py_int other)
+    cdef Vec2iArray ___mul___0(self, Vec2iArray other)
+    cdef Vec2iArray ___mul___1(self, Vec2i other)
+    cdef Vec2iArray ___mul___2(self, py_int other)
+    cdef Vec2iArray ___imul___0(self, Vec2iArray other)
+    cdef Vec2iArray ___imul___1(self, Vec2i other)
+    cdef Vec2iArray ___imul___2(self, py_int other)
+    cdef Vec2iArray ___truediv___0(self, Vec2iArray other)
+    cdef Vec2iArray ___truediv___1(self, Vec2i other)
+    cdef Vec2iArray ___truediv___2(self, py_int other)
+    cdef Vec2iArray ___itruediv___0(self, Vec2iArray other)
+    cdef Vec2iArray ___itruediv___1(self, Vec2i other)
+    cdef Vec2iArray ___itruediv___2(self, py_int other)
+    cdef object _distances(self, object other, bint squared)
+    cdef int _distance_matrix(self, Vec2iArray other, buffer_float[:, ::1] out, bint squared) except -1
+    cdef int _check_not_empty(self) except -1
+    cdef void _bounds(self, py_int* lo, py_int* hi) noexcept nogil
+    cdef Py_ssize_t _arg_length_sqr(self, bint largest) noexcept nogil
+
+@cython.final
+cdef class _Vec2iArray_iterator:
+    cdef Vec2iArray array
+    cdef Py_ssize_t index
+
+@cython.final
+cdef class Vec3iArray:
+    cdef py_int* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[2] shape
+    cdef Py_ssize_t[2] strides
+    cdef Py_buffer view
+    cdef bint is_view
+    cdef int _alloc(self, Py_ssize_t size) except -1
+    cdef void _set_size(self, Py_ssize_t size) noexcept
+    cdef int _check_size(self, Vec3iArray other) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef Vec3i _get(self, Py_ssize_t index)
+    cdef void _set(self, Py_ssize_t index, Vec3i vec) noexcept
+    cdef void ___init___0(self)
+    cdef void ___init___1(self, py_int size)
+    cdef void ___init___2(self, Vec3iArray other)
+    cdef void ___init___3(self, Vec3Array other)
+    cdef void ___init___4(self, object vectors)
+    cdef Vec3iArray ___add___0(self, Vec3iArray other)
+    cdef Vec3iArray ___add___1(self, Vec3i other)
+    cdef Vec3iArray ___add___2(self, py_int other)
+    cdef Vec3iArray ___iadd___0(self, Vec3iArray other)
+    cdef Vec3iArray ___iadd___1(self, Vec3i other)
+    cdef Vec3iArray ___iadd___2(self, py_int other)
+    cdef Vec3iArray ___sub___0(self, Vec3iArray other)
+    cdef Vec3iArray ___sub___1(self, Vec3i other)
+    cdef Vec3iArray ___sub___2(self, py_int other)
+    cdef Vec3iArray ___isub___0(self, Vec3iArray other)
+    cdef Vec3iArray ___isub___1(self, Vec3i other)
+    cdef Vec3iArray ___isub___2(self, py_int other)
+    cdef Vec3iArray ___mul___0(self, Vec3iArray other)
+    cdef Vec3iArray ___mul___1(self, Vec3i other)
+    cdef Vec3iArray ___mul___2(self, py_int other)
+    cdef Vec3iArray ___imul___0(self, Vec3iArray other)
+    cdef Vec3iArray ___imul___1(self, Vec3i other)
+    cdef Vec3iArray ___imul___2(self, py_int other)
+    cdef Vec3iArray ___truediv___0(self, Vec3iArray other)
+    cdef Vec3iArray ___truediv___1(self, Vec3i other)
+    cdef Vec3iArray ___truediv___2(self, py_int other)
+    cdef Vec3iArray ___itruediv___0(self, Vec3iArray other)
+    cdef Vec3iArray ___itruediv___1(self, Vec3i other)
+    cdef Vec3iArray ___itruediv___2(self, py_int other)
+    cdef Vec3iArray ___xor___0(self, Vec3iArray other)
+    cdef Vec3iArray ___xor___1(self, Vec3i other)
+    cdef object _distances(self, object other, bint squared)
+    cdef int _distance_matrix(self, Vec3iArray other, buffer_float[:, ::1] out, bint squared) except -1
+    cdef int _check_not_empty(self) except -1
+    cdef void _bounds(self, py_int* lo, py_int* hi) noexcept nogil
+    cdef Py_ssize_t _arg_length_sqr(self, bint largest) noexcept nogil
+
+@cython.final
+cdef class _Vec3iArray_iterator:
+    cdef Vec3iArray array
+    cdef Py_ssize_t index
+
+@cython.final
+cdef class Vec4iArray:
+    cdef py_int* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[2] shape
+    cdef Py_ssize_t[2] strides
+    cdef Py_buffer view
+    cdef bint is_view
+    cdef int _alloc(self, Py_ssize_t size) except -1
+    cdef void _set_size(self, Py_ssize_t size) noexcept
+    cdef int _check_size(self, Vec4iArray other) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef Vec4i _get(self, Py_ssize_t index)
+    cdef void _set(self, Py_ssize_t index, Vec4i vec) noexcept
+    cdef void ___init___0(self)
+    cdef void ___init___1(self, py_int size)
+    cdef void ___init___2(self, Vec4iArray other)
+    cdef void ___init___3(self, Vec4Array other)
+    cdef void ___init___4(self, object vectors)
+    cdef Vec4iArray ___add___0(self, Vec4iArray other)
+    cdef Vec4iArray ___add___1(self, Vec4i other)
+    cdef Vec4iArray ___add___2(self, py_int other)
+    cdef Vec4iArray ___iadd___0(self, Vec4iArray other)
+    cdef Vec4iArray ___iadd___1(self, Vec4i other)
+    cdef Vec4iArray ___iadd___2(self, py_int other)
+    cdef Vec4iArray ___sub___0(self, Vec4iArray other)
+    cdef Vec4iArray ___sub___1(self, Vec4i other)
+    cdef Vec4iArray ___sub___2(self, py_int other)
+    cdef Vec4iArray ___isub___0(self, Vec4iArray other)
+    cdef Vec4iArray ___isub___1(self, Vec4i other)
+    cdef Vec4iArray ___isub___2(self, py_int other)
+    cdef Vec4iArray ___mul___0(self, Vec4iArray other)
+    cdef Vec4iArray ___mul___1(self, Vec4i other)
+    cdef Vec4iArray ___mul___2(self, py_int other)
+    cdef Vec4iArray ___imul___0(self, Vec4iArray other)
+    cdef Vec4iArray ___imul___1(self, Vec4i other)
+    cdef Vec4iArray ___imul___2(self, py_int other)
+    cdef Vec4iArray ___truediv___0(self, Vec4iArray other)
+    cdef Vec4iArray ___truediv___1(self, Vec4i other)
+    cdef Vec4iArray ___truediv___2(self, py_int other)
+    cdef Vec4iArray ___itruediv___0(self, Vec4iArray other)
+    cdef Vec4iArray ___itruediv___1(self, Vec4i other)
+    cdef Vec4iArray ___itruediv___2(self, py_int other)
+    cdef object _distances(self, object other, bint squared)
+    cdef int _distance_matrix(self, Vec4iArray other, buffer_float[:, ::1] out, bint squared) except -1
+    cdef int _check_not_empty(self) except -1
+    cdef void _bounds(self, py_int* lo, py_int* hi) noexcept nogil
+    cdef Py_ssize_t _arg_length_sqr(self, bint largest) noexcept nogil
+
+@cython.final
+cdef class _Vec4iArray_iterator:
+    cdef Vec4iArray array
+    cdef Py_ssize_t index
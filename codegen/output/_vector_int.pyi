@@ -0,0 +1,13765 @@
+# noinspection PyUnresolvedReferences
+from typing import overload, Self, Any, Union, Iterator
+from array import array
+from spatium._common import py_int, py_float, buffer_float
+from spatium._vector import Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector import Vec2Array, Vec3Array, Vec4Array
+from spatium._transform import Transform2D, Transform3D, Transform2Dd, Transform3Dd, Transform2Df, Transform3Df
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec2i:
+    """2D integer vector."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def length(self) -> (float | int):
+        """The (Euclidean) length of this vector."""
+        ...
+    @property
+    def length_sqr(self) -> (float | int):
+        """The squared Euclidean length of this vector."""
+        ...
+    @property
+    def xx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the Y element of this vector."""
+        ...
+    @xy.setter
+    def xy(self, value: "Vec2i") -> None:
+        """Set the value of the X and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and a zero."""
+        ...
+    @property
+    def xl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and a one."""
+        ...
+    @property
+    def yx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the X element of this vector."""
+        ...
+    @yx.setter
+    def yx(self, value: "Vec2i") -> None:
+        """Set the value of the Y and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and a one."""
+        ...
+    @property
+    def ox(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the X element of this vector."""
+        ...
+    @property
+    def oy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the X element of this vector."""
+        ...
+    @property
+    def ly(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the Y element of this vector."""
+        ...
+    @property
+    def xxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xoy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xoo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xlx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xlo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def yxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yoy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yoo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def ylx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def ylo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def oxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def oyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def ooy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def olx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def oly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def lyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def loy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def llx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def lly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def xyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def xoxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xoxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xoxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xoxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def xoyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xoyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xoyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xoyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xoox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def xool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def xolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def xoly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def xoll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def xlxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xlxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def xlyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xlyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xlox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def xlol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def xllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def xlly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def xlll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def yxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def yxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def yyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def yylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def yoxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yoxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yoxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yoxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def yoyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yoyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yoyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yoyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yoox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def yool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def yolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def yoly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def yoll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def ylxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ylxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def ylyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ylyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ylox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def ylol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def yllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def ylly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def ylll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def oxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def oxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def oxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def oxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def oxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def oxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def oxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def oyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def oyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def oyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def oylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def oyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def oylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def oyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def ooxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ooxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ooxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ooxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def ooyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ooyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ooyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ooyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ooox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def ooly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def olxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def olxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def olyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def olyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def olox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def ollx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def olly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def lyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def loxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def loxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def loxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def loxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def loyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def loyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def loyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def loyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def loox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def looy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def loly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def llxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def llxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def llyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def llyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def llox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def llly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the Y element of this vector."""
+        ...
+
+    def swizzle_into(self, swizzle: "str", out: Any, /) -> Any:
+        """Write the elements picked by a swizzle pattern (e.g. "zxy" or "xyol") into the vector `out` of matching size and return it.
+    
+        This is the allocation-free version of swizzle properties, e.g. `vec.swizzle_into("zxy", out)` is equivalent to `out.xyz = vec.zxy`.
+        """
+        ...
+    def angle_to(self, other: "Vec2i", /) -> (float | int):
+        """The (unsigned) angle between two vectors in radians, in the range [0, pi]."""
+        ...
+    def slide(self, normal: "Vec2i", /) -> "Vec2":
+        """Remove the component of this vector along the given normal, same as `v - n * (v @ n)`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def reflect(self, normal: "Vec2i", /) -> "Vec2":
+        """Reflect this vector off the plane (or line) with the given normal, same as `v - n * (2 * (v @ n))`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def project_onto(self, other: "Vec2i", /) -> "Vec2":
+        """Project this vector onto the other vector, same as `b * ((a @ b) / (b @ b))`."""
+        ...
+    def move_toward(self, to: "Vec2i", delta: (float | int), /) -> "Vec2":
+        """Move this vector toward `to` by at most `delta`, without overshooting it."""
+        ...
+    def lerp(self, other: "Vec2i", weight: (float | int), /) -> "Vec2":
+        """Linearly interpolate from this vector (weight 0) to the other vector (weight 1), same as `a + (b - a) * weight`."""
+        ...
+    @overload
+    def clamp_ip(self, low: "Vec2i", high: "Vec2i") -> Self:
+        """Inplace version of `Vec2i.clamp()`."""
+        ...
+    @overload
+    def clamp_ip(self, low: int, high: int) -> Self:
+        """Inplace version of `Vec2i.clamp()` with the same bounds for all elements."""
+        ...
+    @overload
+    def clamp(self, low: "Vec2i", high: "Vec2i") -> "Vec2i":
+        """Clamp every element between the elements of `low` and `high`."""
+        ...
+    @overload
+    def clamp(self, low: int, high: int) -> "Vec2i":
+        """Clamp every element between `low` and `high`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: "Vec2i", addend: "Vec2i") -> Self:
+        """Inplace version of `Vec2i.mul_add()`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: int, addend: "Vec2i") -> Self:
+        """Inplace version of `Vec2i.mul_add()` with the same multiplier for all elements."""
+        ...
+    @overload
+    def mul_add(self, multiplier: "Vec2i", addend: "Vec2i") -> "Vec2i":
+        """Fused `self * multiplier + addend`, without intermediate vectors."""
+        ...
+    @overload
+    def mul_add(self, multiplier: int, addend: "Vec2i") -> "Vec2i":
+        """Fused `self * multiplier + addend` with the same multiplier for all elements, without intermediate vectors."""
+        ...
+    def distance_sqr_to(self, other: "Vec2i", /) -> (float | int):
+        """The squared Euclidean distance between two vectors."""
+        ...
+    def distance_to(self, other: "Vec2i", /) -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    def __or__(self, other: "Vec2i") -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    @staticmethod
+    def hash_many(vectors: Any, /) -> "array":
+        """The hashes of an iterable of vectors, same as `hash()` of each one but in one pass.
+    
+        The vectors are converted to a `Vec2iArray` first, unless they already are one.
+        See Also: `Vec2iArray.hash_many()`
+        """
+        ...
+    @staticmethod
+    def argmax_length_many(vectors: Any, /) -> int:
+        """The index of the longest of an iterable of vectors (the first one on ties).
+    
+        The vectors are converted to a `Vec2iArray` first, unless they already are one.
+        See Also: `Vec2iArray.argmax_length()`
+        """
+        ...
+    @staticmethod
+    def argmin_length_many(vectors: Any, /) -> int:
+        """The index of the shortest of an iterable of vectors (the first one on ties).
+    
+        The vectors are converted to a `Vec2iArray` first, unless they already are one.
+        See Also: `Vec2iArray.argmin_length()`
+        """
+        ...
+    @staticmethod
+    def bounds_many(vectors: Any, /) -> "tuple[Vec2i, Vec2i]":
+        """The axis-aligned bounding box of an iterable of vectors, as the (min, max) corners.
+    
+        The vectors are converted to a `Vec2iArray` first, unless they already are one.
+        See Also: `Vec2iArray.bounds()`
+        """
+        ...
+    @staticmethod
+    def max_many(vectors: Any, /) -> "Vec2i":
+        """The component-wise maximum of an iterable of vectors.
+    
+        The vectors are converted to a `Vec2iArray` first, unless they already are one.
+        See Also: `Vec2iArray.max()`
+        """
+        ...
+    @staticmethod
+    def min_many(vectors: Any, /) -> "Vec2i":
+        """The component-wise minimum of an iterable of vectors.
+    
+        The vectors are converted to a `Vec2iArray` first, unless they already are one.
+        See Also: `Vec2iArray.min()`
+        """
+        ...
+    @staticmethod
+    def mean_many(vectors: Any, /) -> "Vec2":
+        """The mean of an iterable of vectors (the centroid).
+    
+        The vectors are converted to a `Vec2iArray` first, unless they already are one.
+        See Also: `Vec2iArray.mean()`
+        """
+        ...
+    @staticmethod
+    def sum_many(vectors: Any, /) -> "Vec2i":
+        """The sum of an iterable of vectors, the zero vector if it's empty.
+    
+        The vectors are converted to a `Vec2iArray` first, unless they already are one.
+        See Also: `Vec2iArray.sum()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Vec2i]":
+        """Read the vectors of a block written by `Vec2i.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(vectors: Any, /) -> "bytes":
+        """Pack an iterable of vectors into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the vectors one by one.
+        See Also: `Vec2i.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec2i":
+        """Create a vector from the bytes written by `Vec2i.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this vector as raw bytes in native byte order."""
+        ...
+    def __iter__(self) -> "_Vec2iiterator":
+        """Create an iterator that yields all the elements of the vector in sequence.
+    
+        This creates a copy of all the elements of this vector,
+        so modifying the vector won't affect already created iterators.
+        """
+        ...
+    def __setitem__(self, key: int, value: int) -> None:
+        """Set the n-th element of this vector."""
+        ...
+    def __getitem__(self, key: int) -> int:
+        """Get the n-th element of this vector."""
+        ...
+    def __len__(self) -> int:
+        """The number of dimensions (elements) of this vector."""
+        ...
+    def __matmul__(self, other: "Vec2i") -> int:
+        """Dot product."""
+        ...
+    @overload
+    def truediv_into(self, other: "Vec2i", out: "Vec2i") -> "Vec2i":
+        """Element-wise division, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def truediv_into(self, other: int, out: "Vec2i") -> "Vec2i":
+        """Element-wise division with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec2i") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec2i") -> "Vec2i":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec2i":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def mul_into(self, other: "Vec2i", out: "Vec2i") -> "Vec2i":
+        """Element-wise multiplication, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def mul_into(self, other: int, out: "Vec2i") -> "Vec2i":
+        """Element-wise multiplication with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec2i") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec2i") -> "Vec2i":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec2i":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def sub_into(self, other: "Vec2i", out: "Vec2i") -> "Vec2i":
+        """Element-wise subtraction, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def sub_into(self, other: int, out: "Vec2i") -> "Vec2i":
+        """Element-wise subtraction with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec2i") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec2i") -> "Vec2i":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec2i":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def add_into(self, other: "Vec2i", out: "Vec2i") -> "Vec2i":
+        """Element-wise addition, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def add_into(self, other: int, out: "Vec2i") -> "Vec2i":
+        """Element-wise addition with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec2i") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec2i") -> "Vec2i":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec2i":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def neg_ip(self) -> Self:
+        """Inverse this vector inplace."""
+        ...
+    def neg_into(self, out: "Vec2i", /) -> "Vec2i":
+        """Write the inverse of this vector into `out` (which can be `self`) and return it."""
+        ...
+    def copy_into(self, out: "Vec2i", /) -> "Vec2i":
+        """Copy the elements of this vector into `out` and return it, the allocation-free version of `+vec`."""
+        ...
+    def __neg__(self) -> "Vec2i":
+        """Return the inverse vector."""
+        ...
+    def __pos__(self) -> "Vec2i":
+        """Return a copy of this vector."""
+        ...
+    def __hash__(self) -> int: ...
+    def __bool__(self) -> "bool":
+        """If the vector is a zero vector."""
+        ...
+    def is_close(self, other: "Vec2i", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two vectors are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec2i.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec2i.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create a zero vector."""
+        ...
+    @overload
+    def __init__(self, value: int) -> None:
+        """Create a vector with the same value for all elements."""
+        ...
+    @overload
+    def __init__(self, xy: "Vec2i") -> None:
+        """Create a 2D vector from a 2D vector."""
+        ...
+    @overload
+    def __init__(self, x: int, y: int) -> None:
+        """Create a 2D vector from a number and a number."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec2") -> None:
+        """Convert a floating-point vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec2d") -> None:
+        """Convert a double precision vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec2f") -> None:
+        """Convert a single precision vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec2i32") -> None:
+        """Convert a 32-bit integer vector to a integer vector."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec2iiterator:
+    """Internal iterator class for Vec2i."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> int: ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec3i:
+    """3D integer vector."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+    @property
+    def length(self) -> (float | int):
+        """The (Euclidean) length of this vector."""
+        ...
+    @property
+    def length_sqr(self) -> (float | int):
+        """The squared Euclidean length of this vector."""
+        ...
+    @property
+    def xx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and a zero."""
+        ...
+    @property
+    def xl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and a one."""
+        ...
+    @property
+    def yx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and a one."""
+        ...
+    @property
+    def zx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and a one."""
+        ...
+    @property
+    def ox(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the X element of this vector."""
+        ...
+    @property
+    def oy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the X element of this vector."""
+        ...
+    @property
+    def ly(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the Y element of this vector."""
+        ...
+    @property
+    def lz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the Z element of this vector."""
+        ...
+    @property
+    def xxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @xyz.setter
+    def xyz(self, value: "Vec3i") -> None:
+        """Set the value of the X, Y and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @xzy.setter
+    def xzy(self, value: "Vec3i") -> None:
+        """Set the value of the X, Z and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xoy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xoz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xoo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xlx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xlz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xlo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def yxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @yxz.setter
+    def yxz(self, value: "Vec3i") -> None:
+        """Set the value of the Y, X and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @yzx.setter
+    def yzx(self, value: "Vec3i") -> None:
+        """Set the value of the Y, Z and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yoy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yoz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yoo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def ylx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def ylz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def ylo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def zxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @zxy.setter
+    def zxy(self, value: "Vec3i") -> None:
+        """Set the value of the Z, X and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @zyx.setter
+    def zyx(self, value: "Vec3i") -> None:
+        """Set the value of the Z, Y and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zoy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zoz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zoo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zlx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zlz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zlo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def oxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def oyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ozx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def ozl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def oox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def ooy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def ooz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def olx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def oly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def olz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def lyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def loy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def loz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def llx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def lly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def llz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def xyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def xzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def xoxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xoxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xoxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xoxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xoxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def xoyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xoyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xoyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xoyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xoyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xoox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def xool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def xolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def xoly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def xoll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def xlxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xlxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xlxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def xlyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xlyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xlyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xlzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xlzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xlzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xlox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def xlol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def xllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def xlly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def xlll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def yxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def yxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def yyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def yylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def yzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def yzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def yoxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yoxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yoxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yoxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yoxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def yoyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yoyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yoyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yoyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yoyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yoox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def yool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def yolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def yoly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def yoll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def ylxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ylxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ylxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def ylyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ylyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ylyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ylzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ylzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def ylzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def ylox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def ylol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def yllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def ylly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def ylll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def zxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def zyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def zzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def zoxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zoxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zoxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zoxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zoxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def zoyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zoyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zoyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zoyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zoyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zoox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def zool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def zolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def zoly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def zoll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def zlxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zlxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zlxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zlxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zlxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def zlyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zlyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zlyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zlyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zlyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zlzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zlzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zlzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zlzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zlzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zlox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def zlol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def zllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def zlly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def zlll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def oxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def oxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def oxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def oxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def oxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def oxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def oxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def oxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def oxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def oxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def oxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def oyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def oyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def oyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def oyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def oyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def oyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def oylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def oyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def oylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def oylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def oyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def ozxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ozxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def ozyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ozyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ozzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def ozzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def ozox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def ozoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def ozoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def ozoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def ozol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def ozlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def ozly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def ozlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def ozlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def ozll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def ooxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ooxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ooxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ooxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ooxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def ooyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ooyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ooyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ooyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ooyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def oozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def ooox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def oolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def ooly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def oolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def olxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def olxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def olxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def olyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def olyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def olyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def olzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def olzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def olzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def olox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def ollx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def olly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def ollz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def lyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def lzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def loxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def loxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def loxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def loxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def loxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def loyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def loyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def loyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def loyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def loyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def loox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def looy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def looz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def loly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def llxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def llxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def llxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def llyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def llyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def llyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def llzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def llzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def llzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def llox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def llly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the Z element of this vector."""
+        ...
+
+    def swizzle_into(self, swizzle: "str", out: Any, /) -> Any:
+        """Write the elements picked by a swizzle pattern (e.g. "zxy" or "xyol") into the vector `out` of matching size and return it.
+    
+        This is the allocation-free version of swizzle properties, e.g. `vec.swizzle_into("zxy", out)` is equivalent to `out.xyz = vec.zxy`.
+        """
+        ...
+    def angle_to(self, other: "Vec3i", /) -> (float | int):
+        """The (unsigned) angle between two vectors in radians, in the range [0, pi]."""
+        ...
+    def slide(self, normal: "Vec3i", /) -> "Vec3":
+        """Remove the component of this vector along the given normal, same as `v - n * (v @ n)`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def reflect(self, normal: "Vec3i", /) -> "Vec3":
+        """Reflect this vector off the plane (or line) with the given normal, same as `v - n * (2 * (v @ n))`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def project_onto(self, other: "Vec3i", /) -> "Vec3":
+        """Project this vector onto the other vector, same as `b * ((a @ b) / (b @ b))`."""
+        ...
+    def move_toward(self, to: "Vec3i", delta: (float | int), /) -> "Vec3":
+        """Move this vector toward `to` by at most `delta`, without overshooting it."""
+        ...
+    def lerp(self, other: "Vec3i", weight: (float | int), /) -> "Vec3":
+        """Linearly interpolate from this vector (weight 0) to the other vector (weight 1), same as `a + (b - a) * weight`."""
+        ...
+    @overload
+    def clamp_ip(self, low: "Vec3i", high: "Vec3i") -> Self:
+        """Inplace version of `Vec3i.clamp()`."""
+        ...
+    @overload
+    def clamp_ip(self, low: int, high: int) -> Self:
+        """Inplace version of `Vec3i.clamp()` with the same bounds for all elements."""
+        ...
+    @overload
+    def clamp(self, low: "Vec3i", high: "Vec3i") -> "Vec3i":
+        """Clamp every element between the elements of `low` and `high`."""
+        ...
+    @overload
+    def clamp(self, low: int, high: int) -> "Vec3i":
+        """Clamp every element between `low` and `high`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: "Vec3i", addend: "Vec3i") -> Self:
+        """Inplace version of `Vec3i.mul_add()`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: int, addend: "Vec3i") -> Self:
+        """Inplace version of `Vec3i.mul_add()` with the same multiplier for all elements."""
+        ...
+    @overload
+    def mul_add(self, multiplier: "Vec3i", addend: "Vec3i") -> "Vec3i":
+        """Fused `self * multiplier + addend`, without intermediate vectors."""
+        ...
+    @overload
+    def mul_add(self, multiplier: int, addend: "Vec3i") -> "Vec3i":
+        """Fused `self * multiplier + addend` with the same multiplier for all elements, without intermediate vectors."""
+        ...
+    def distance_sqr_to(self, other: "Vec3i", /) -> (float | int):
+        """The squared Euclidean distance between two vectors."""
+        ...
+    def distance_to(self, other: "Vec3i", /) -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    def __or__(self, other: "Vec3i") -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    @staticmethod
+    def hash_many(vectors: Any, /) -> "array":
+        """The hashes of an iterable of vectors, same as `hash()` of each one but in one pass.
+    
+        The vectors are converted to a `Vec3iArray` first, unless they already are one.
+        See Also: `Vec3iArray.hash_many()`
+        """
+        ...
+    @staticmethod
+    def argmax_length_many(vectors: Any, /) -> int:
+        """The index of the longest of an iterable of vectors (the first one on ties).
+    
+        The vectors are converted to a `Vec3iArray` first, unless they already are one.
+        See Also: `Vec3iArray.argmax_length()`
+        """
+        ...
+    @staticmethod
+    def argmin_length_many(vectors: Any, /) -> int:
+        """The index of the shortest of an iterable of vectors (the first one on ties).
+    
+        The vectors are converted to a `Vec3iArray` first, unless they already are one.
+        See Also: `Vec3iArray.argmin_length()`
+        """
+        ...
+    @staticmethod
+    def bounds_many(vectors: Any, /) -> "tuple[Vec3i, Vec3i]":
+        """The axis-aligned bounding box of an iterable of vectors, as the (min, max) corners.
+    
+        The vectors are converted to a `Vec3iArray` first, unless they already are one.
+        See Also: `Vec3iArray.bounds()`
+        """
+        ...
+    @staticmethod
+    def max_many(vectors: Any, /) -> "Vec3i":
+        """The component-wise maximum of an iterable of vectors.
+    
+        The vectors are converted to a `Vec3iArray` first, unless they already are one.
+        See Also: `Vec3iArray.max()`
+        """
+        ...
+    @staticmethod
+    def min_many(vectors: Any, /) -> "Vec3i":
+        """The component-wise minimum of an iterable of vectors.
+    
+        The vectors are converted to a `Vec3iArray` first, unless they already are one.
+        See Also: `Vec3iArray.min()`
+        """
+        ...
+    @staticmethod
+    def mean_many(vectors: Any, /) -> "Vec3":
+        """The mean of an iterable of vectors (the centroid).
+    
+        The vectors are converted to a `Vec3iArray` first, unless they already are one.
+        See Also: `Vec3iArray.mean()`
+        """
+        ...
+    @staticmethod
+    def sum_many(vectors: Any, /) -> "Vec3i":
+        """The sum of an iterable of vectors, the zero vector if it's empty.
+    
+        The vectors are converted to a `Vec3iArray` first, unless they already are one.
+        See Also: `Vec3iArray.sum()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Vec3i]":
+        """Read the vectors of a block written by `Vec3i.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(vectors: Any, /) -> "bytes":
+        """Pack an iterable of vectors into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the vectors one by one.
+        See Also: `Vec3i.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec3i":
+        """Create a vector from the bytes written by `Vec3i.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this vector as raw bytes in native byte order."""
+        ...
+    def __iter__(self) -> "_Vec3iiterator":
+        """Create an iterator that yields all the elements of the vector in sequence.
+    
+        This creates a copy of all the elements of this vector,
+        so modifying the vector won't affect already created iterators.
+        """
+        ...
+    def __setitem__(self, key: int, value: int) -> None:
+        """Set the n-th element of this vector."""
+        ...
+    def __getitem__(self, key: int) -> int:
+        """Get the n-th element of this vector."""
+        ...
+    def __len__(self) -> int:
+        """The number of dimensions (elements) of this vector."""
+        ...
+    def __xor__(self, other: "Vec3i") -> "Vec3i":
+        """Cross product."""
+        ...
+    def __matmul__(self, other: "Vec3i") -> int:
+        """Dot product."""
+        ...
+    @overload
+    def truediv_into(self, other: "Vec3i", out: "Vec3i") -> "Vec3i":
+        """Element-wise division, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def truediv_into(self, other: int, out: "Vec3i") -> "Vec3i":
+        """Element-wise division with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec3i") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec3i") -> "Vec3i":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec3i":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def mul_into(self, other: "Vec3i", out: "Vec3i") -> "Vec3i":
+        """Element-wise multiplication, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def mul_into(self, other: int, out: "Vec3i") -> "Vec3i":
+        """Element-wise multiplication with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec3i") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec3i") -> "Vec3i":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec3i":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def sub_into(self, other: "Vec3i", out: "Vec3i") -> "Vec3i":
+        """Element-wise subtraction, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def sub_into(self, other: int, out: "Vec3i") -> "Vec3i":
+        """Element-wise subtraction with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec3i") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec3i") -> "Vec3i":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec3i":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def add_into(self, other: "Vec3i", out: "Vec3i") -> "Vec3i":
+        """Element-wise addition, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def add_into(self, other: int, out: "Vec3i") -> "Vec3i":
+        """Element-wise addition with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec3i") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec3i") -> "Vec3i":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec3i":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def neg_ip(self) -> Self:
+        """Inverse this vector inplace."""
+        ...
+    def neg_into(self, out: "Vec3i", /) -> "Vec3i":
+        """Write the inverse of this vector into `out` (which can be `self`) and return it."""
+        ...
+    def copy_into(self, out: "Vec3i", /) -> "Vec3i":
+        """Copy the elements of this vector into `out` and return it, the allocation-free version of `+vec`."""
+        ...
+    def __neg__(self) -> "Vec3i":
+        """Return the inverse vector."""
+        ...
+    def __pos__(self) -> "Vec3i":
+        """Return a copy of this vector."""
+        ...
+    def __hash__(self) -> int: ...
+    def __bool__(self) -> "bool":
+        """If the vector is a zero vector."""
+        ...
+    def is_close(self, other: "Vec3i", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two vectors are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec3i.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec3i.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create a zero vector."""
+        ...
+    @overload
+    def __init__(self, value: int) -> None:
+        """Create a vector with the same value for all elements."""
+        ...
+    @overload
+    def __init__(self, xyz: "Vec3i") -> None:
+        """Create a 3D vector from a 3D vector."""
+        ...
+    @overload
+    def __init__(self, x: int, yz: "Vec2i") -> None:
+        """Create a 3D vector from a number and a 2D vector."""
+        ...
+    @overload
+    def __init__(self, xy: "Vec2i", z: int) -> None:
+        """Create a 3D vector from a 2D vector and a number."""
+        ...
+    @overload
+    def __init__(self, x: int, y: int, z: int) -> None:
+        """Create a 3D vector from a number, a number and a number."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec3") -> None:
+        """Convert a floating-point vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec3d") -> None:
+        """Convert a double precision vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec3f") -> None:
+        """Convert a single precision vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec3i32") -> None:
+        """Convert a 32-bit integer vector to a integer vector."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec3iiterator:
+    """Internal iterator class for Vec3i."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> int: ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec4i:
+    """4D integer vector."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+    @property
+    def w(self) -> int: ...
+    @w.setter
+    def w(self, value: int) -> None: ...
+    @property
+    def length(self) -> (float | int):
+        """The (Euclidean) length of this vector."""
+        ...
+    @property
+    def length_sqr(self) -> (float | int):
+        """The squared Euclidean length of this vector."""
+        ...
+    @property
+    def xx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xw(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and a zero."""
+        ...
+    @property
+    def xl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the X element of this vector, and a one."""
+        ...
+    @property
+    def yx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yw(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Y element of this vector, and a one."""
+        ...
+    @property
+    def zx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zw(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the Z element of this vector, and a one."""
+        ...
+    @property
+    def wx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ww(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wo(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the W element of this vector, and a zero."""
+        ...
+    @property
+    def wl(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being the W element of this vector, and a one."""
+        ...
+    @property
+    def ox(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the X element of this vector."""
+        ...
+    @property
+    def oy(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the Z element of this vector."""
+        ...
+    @property
+    def ow(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a zero, and the W element of this vector."""
+        ...
+    @property
+    def lx(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the X element of this vector."""
+        ...
+    @property
+    def ly(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the Y element of this vector."""
+        ...
+    @property
+    def lz(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the Z element of this vector."""
+        ...
+    @property
+    def lw(self) -> "Vec2i":
+        """Create a `Vec2i` with its elements being a one, and the W element of this vector."""
+        ...
+    @property
+    def xxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xyw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xwx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xwy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xwz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xww(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xwo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def xwl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def xox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xoy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xoz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xow(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def xoo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xlx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xlz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xlw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def xlo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def yxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yxw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def ywx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ywy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ywz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yww(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ywo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def ywl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def yox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yoy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yoz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yow(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def yoo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def ylx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def ylz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def ylw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def ylo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def zxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zwx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zwy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zwz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zww(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zwo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def zwl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def zox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zoy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zoz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zow(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def zoo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zlx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zlz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zlw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def zlo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def wxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wxw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def wxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def wyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wyw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def wyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def wzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wzw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def wzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def wwx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wwy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wwz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def www(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wwo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def wwl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def wox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def woy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def woz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def wow(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def woo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def wol(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a zero, and a one."""
+        ...
+    @property
+    def wlx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def wly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def wlz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def wlw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def wlo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a one, and a zero."""
+        ...
+    @property
+    def wll(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being the W element of this vector, a one, and a one."""
+        ...
+    @property
+    def oxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def oyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ozx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ozo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def ozl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def owx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def owy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def owz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oww(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def owo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the W element of this vector, and a zero."""
+        ...
+    @property
+    def owl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, the W element of this vector, and a one."""
+        ...
+    @property
+    def oox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def ooy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def ooz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def oow(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a zero, and the W element of this vector."""
+        ...
+    @property
+    def olx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def oly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def olz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def olw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a zero, a one, and the W element of this vector."""
+        ...
+    @property
+    def lxx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lxo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lxl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def lyx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lyo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lyl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lzx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lzo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lzl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lwx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lwy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lwz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lww(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lwo(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the W element of this vector, and a zero."""
+        ...
+    @property
+    def lwl(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, the W element of this vector, and a one."""
+        ...
+    @property
+    def lox(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def loy(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def loz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def low(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a zero, and the W element of this vector."""
+        ...
+    @property
+    def llx(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def lly(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def llz(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def llw(self) -> "Vec3i":
+        """Create a `Vec3i` with its elements being a one, a one, and the W element of this vector."""
+        ...
+    @property
+    def xxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xxwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xxwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xxwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xxww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xxwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def xxwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def xxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xxow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def xxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xxlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def xxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def xyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xyxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xyyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xyzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @xyzw.setter
+    def xyzw(self, value: "Vec4i") -> None:
+        """Set the value of the X, Y, Z and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xywx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xywy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xywz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @xywz.setter
+    def xywz(self, value: "Vec4i") -> None:
+        """Set the value of the X, Y, W and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xyww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xywo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def xywl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def xyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xyow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def xyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xylw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def xylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def xzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @xzyw.setter
+    def xzyw(self, value: "Vec4i") -> None:
+        """Set the value of the X, Z, Y and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xzwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xzwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @xzwy.setter
+    def xzwy(self, value: "Vec4i") -> None:
+        """Set the value of the X, Z, W and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xzwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xzww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xzwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def xzwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def xzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xzow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def xzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xzlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def xzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def xwxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xwxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xwxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xwxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xwxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xwxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def xwyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xwyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xwyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @xwyz.setter
+    def xwyz(self, value: "Vec4i") -> None:
+        """Set the value of the X, W, Y and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xwyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xwyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xwyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xwzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xwzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @xwzy.setter
+    def xwzy(self, value: "Vec4i") -> None:
+        """Set the value of the X, W, Z and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xwzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xwzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xwzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xwzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xwwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xwwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xwwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xwww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xwwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def xwwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def xwox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xwoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xwoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xwow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def xwoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def xwol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a zero, and a one."""
+        ...
+    @property
+    def xwlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def xwly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xwlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xwlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def xwlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a one, and a zero."""
+        ...
+    @property
+    def xwll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, the W element of this vector, a one, and a one."""
+        ...
+    @property
+    def xoxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xoxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xoxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xoxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xoxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xoxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def xoyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xoyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xoyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xoyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xoyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xoyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xozw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xowx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xowy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xowz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xoww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xowo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the W element of this vector, and a zero."""
+        ...
+    @property
+    def xowl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, the W element of this vector, and a one."""
+        ...
+    @property
+    def xoox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xoow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and the W element of this vector."""
+        ...
+    @property
+    def xooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def xool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def xolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def xoly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xolw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and the W element of this vector."""
+        ...
+    @property
+    def xolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def xoll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def xlxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xlxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xlxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def xlxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def xlyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xlyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xlyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xlyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xlzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xlzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xlzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xlzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xlwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def xlwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xlwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def xlww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def xlwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the W element of this vector, and a zero."""
+        ...
+    @property
+    def xlwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, the W element of this vector, and a one."""
+        ...
+    @property
+    def xlox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def xloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def xlow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and the W element of this vector."""
+        ...
+    @property
+    def xloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def xlol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def xllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def xlly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def xllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def xllw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and the W element of this vector."""
+        ...
+    @property
+    def xllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def xlll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the X element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def yxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yxxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yxyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yxzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @yxzw.setter
+    def yxzw(self, value: "Vec4i") -> None:
+        """Set the value of the Y, X, Z and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yxwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yxwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yxwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @yxwz.setter
+    def yxwz(self, value: "Vec4i") -> None:
+        """Set the value of the Y, X, W and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yxww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yxwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def yxwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def yxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yxow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def yxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def yxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yxlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def yxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def yyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yywx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yywy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yywz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yyww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yywo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def yywl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def yyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yyow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def yyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def yylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yylw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def yylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def yzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @yzxw.setter
+    def yzxw(self, value: "Vec4i") -> None:
+        """Set the value of the Y, Z, X and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def yzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yzwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @yzwx.setter
+    def yzwx(self, value: "Vec4i") -> None:
+        """Set the value of the Y, Z, W and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yzwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yzwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yzww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yzwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def yzwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def yzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yzow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def yzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def yzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def yzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def yzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yzlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def yzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def yzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def ywxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ywxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ywxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @ywxz.setter
+    def ywxz(self, value: "Vec4i") -> None:
+        """Set the value of the Y, W, X and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def ywxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ywxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ywxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def ywyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ywyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ywyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ywyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ywyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ywyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ywzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @ywzx.setter
+    def ywzx(self, value: "Vec4i") -> None:
+        """Set the value of the Y, W, Z and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def ywzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ywzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ywzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ywzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def ywzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def ywwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ywwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ywwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ywww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ywwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def ywwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def ywox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def ywoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def ywoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def ywow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def ywoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def ywol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a zero, and a one."""
+        ...
+    @property
+    def ywlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def ywly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def ywlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def ywlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def ywlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a one, and a zero."""
+        ...
+    @property
+    def ywll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, the W element of this vector, a one, and a one."""
+        ...
+    @property
+    def yoxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yoxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yoxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yoxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yoxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def yoxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def yoyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yoyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yoyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yoyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yoyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def yoyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def yozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yozw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def yozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def yowx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yowy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def yowz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yoww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def yowo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the W element of this vector, and a zero."""
+        ...
+    @property
+    def yowl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, the W element of this vector, and a one."""
+        ...
+    @property
+    def yoox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def yoow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and the W element of this vector."""
+        ...
+    @property
+    def yooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def yool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def yolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def yoly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yolw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and the W element of this vector."""
+        ...
+    @property
+    def yolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def yoll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def ylxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ylxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ylxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ylxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def ylyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ylyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ylyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ylyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ylzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ylzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ylzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def ylzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def ylwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ylwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ylwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ylww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ylwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the W element of this vector, and a zero."""
+        ...
+    @property
+    def ylwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, the W element of this vector, and a one."""
+        ...
+    @property
+    def ylox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def yloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def ylow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and the W element of this vector."""
+        ...
+    @property
+    def yloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def ylol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def yllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def ylly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def yllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def yllw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and the W element of this vector."""
+        ...
+    @property
+    def yllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def ylll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Y element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def zxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @zxyw.setter
+    def zxyw(self, value: "Vec4i") -> None:
+        """Set the value of the Z, X, Y and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zxwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zxwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @zxwy.setter
+    def zxwy(self, value: "Vec4i") -> None:
+        """Set the value of the Z, X, W and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zxwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zxww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zxwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def zxwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def zxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zxow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def zxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zxlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def zxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def zyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @zyxw.setter
+    def zyxw(self, value: "Vec4i") -> None:
+        """Set the value of the Z, Y, X and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zywx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @zywx.setter
+    def zywx(self, value: "Vec4i") -> None:
+        """Set the value of the Z, Y, W and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zywy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zywz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zyww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zywo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def zywl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def zyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zyow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def zyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zylw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def zylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def zzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zzwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zzwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zzwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zzww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zzwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def zzwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def zzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zzow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def zzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zzlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def zzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def zwxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zwxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @zwxy.setter
+    def zwxy(self, value: "Vec4i") -> None:
+        """Set the value of the Z, W, X and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zwxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zwxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zwxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zwxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def zwyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @zwyx.setter
+    def zwyx(self, value: "Vec4i") -> None:
+        """Set the value of the Z, W, Y and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zwyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zwyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zwyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zwyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zwyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zwzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zwzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zwzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zwzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zwzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zwzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zwwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zwwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zwwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zwww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zwwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def zwwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def zwox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zwoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zwoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zwow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def zwoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def zwol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a zero, and a one."""
+        ...
+    @property
+    def zwlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def zwly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zwlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zwlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def zwlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a one, and a zero."""
+        ...
+    @property
+    def zwll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, the W element of this vector, a one, and a one."""
+        ...
+    @property
+    def zoxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zoxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zoxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zoxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zoxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zoxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def zoyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zoyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zoyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zoyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zoyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zoyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zozw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zowx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zowy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zowz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zoww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zowo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the W element of this vector, and a zero."""
+        ...
+    @property
+    def zowl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, the W element of this vector, and a one."""
+        ...
+    @property
+    def zoox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zoow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and the W element of this vector."""
+        ...
+    @property
+    def zooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def zool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def zolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def zoly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zolw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and the W element of this vector."""
+        ...
+    @property
+    def zolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def zoll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def zlxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zlxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zlxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zlxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zlxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def zlxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def zlyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zlyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zlyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zlyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zlyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def zlyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def zlzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zlzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zlzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zlzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zlzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def zlzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def zlwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zlwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def zlwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zlww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def zlwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the W element of this vector, and a zero."""
+        ...
+    @property
+    def zlwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, the W element of this vector, and a one."""
+        ...
+    @property
+    def zlox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def zloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def zloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def zlow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and the W element of this vector."""
+        ...
+    @property
+    def zloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def zlol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def zllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def zlly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def zllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def zllw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and the W element of this vector."""
+        ...
+    @property
+    def zllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def zlll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the Z element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def wxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wxxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def wxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def wxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @wxyz.setter
+    def wxyz(self, value: "Vec4i") -> None:
+        """Set the value of the W, X, Y and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wxyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def wxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def wxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @wxzy.setter
+    def wxzy(self, value: "Vec4i") -> None:
+        """Set the value of the W, X, Z and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wxzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def wxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def wxwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wxwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wxwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wxww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wxwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def wxwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def wxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def wxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def wxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def wxow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def wxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def wxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def wxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def wxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def wxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def wxlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def wxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def wxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def wyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @wyxz.setter
+    def wyxz(self, value: "Vec4i") -> None:
+        """Set the value of the W, Y, X and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wyxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def wyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def wyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wyyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def wyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def wyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @wyzx.setter
+    def wyzx(self, value: "Vec4i") -> None:
+        """Set the value of the W, Y, Z and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wyzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def wyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def wywx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wywy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wywz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wyww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wywo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def wywl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def wyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def wyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def wyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def wyow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def wyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def wyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def wylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def wyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def wylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def wylw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def wylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def wyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def wzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @wzxy.setter
+    def wzxy(self, value: "Vec4i") -> None:
+        """Set the value of the W, Z, X and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wzxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def wzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def wzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @wzyx.setter
+    def wzyx(self, value: "Vec4i") -> None:
+        """Set the value of the W, Z, Y and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wzyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def wzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def wzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wzzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def wzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def wzwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wzwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wzwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wzww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wzwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def wzwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def wzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def wzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def wzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def wzow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def wzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def wzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def wzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def wzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def wzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def wzlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def wzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def wzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def wwxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wwxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wwxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wwxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wwxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def wwxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def wwyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wwyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wwyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wwyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wwyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def wwyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def wwzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wwzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wwzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wwzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wwzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def wwzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def wwwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wwwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wwwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wwww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wwwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def wwwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def wwox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def wwoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def wwoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def wwow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def wwoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def wwol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a zero, and a one."""
+        ...
+    @property
+    def wwlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def wwly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def wwlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def wwlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def wwlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a one, and a zero."""
+        ...
+    @property
+    def wwll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, the W element of this vector, a one, and a one."""
+        ...
+    @property
+    def woxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def woxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def woxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def woxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def woxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def woxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def woyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def woyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def woyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def woyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def woyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def woyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def wozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wozw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def wozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def wowx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wowy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wowz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def woww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wowo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the W element of this vector, and a zero."""
+        ...
+    @property
+    def wowl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, the W element of this vector, and a one."""
+        ...
+    @property
+    def woox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def wooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def wooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def woow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a zero, and the W element of this vector."""
+        ...
+    @property
+    def wooo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a zero, and a zero."""
+        ...
+    @property
+    def wool(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a zero, and a one."""
+        ...
+    @property
+    def wolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def woly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def wolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def wolw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a one, and the W element of this vector."""
+        ...
+    @property
+    def wolo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a one, and a zero."""
+        ...
+    @property
+    def woll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a zero, a one, and a one."""
+        ...
+    @property
+    def wlxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wlxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wlxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wlxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wlxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def wlxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def wlyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wlyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wlyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wlyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wlyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def wlyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def wlzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wlzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wlzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wlzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wlzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def wlzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def wlwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def wlwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def wlwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def wlww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def wlwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the W element of this vector, and a zero."""
+        ...
+    @property
+    def wlwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, the W element of this vector, and a one."""
+        ...
+    @property
+    def wlox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def wloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def wloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def wlow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a zero, and the W element of this vector."""
+        ...
+    @property
+    def wloo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a zero, and a zero."""
+        ...
+    @property
+    def wlol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a zero, and a one."""
+        ...
+    @property
+    def wllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def wlly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def wllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def wllw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a one, and the W element of this vector."""
+        ...
+    @property
+    def wllo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a one, and a zero."""
+        ...
+    @property
+    def wlll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being the W element of this vector, a one, a one, and a one."""
+        ...
+    @property
+    def oxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def oxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def oxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def oxwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oxwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oxwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oxww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oxwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def oxwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def oxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def oxow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def oxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def oxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def oxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def oxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def oxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def oxlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def oxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def oxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def oyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def oyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def oyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def oyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def oyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def oywx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oywy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oywz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oyww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oywo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def oywl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def oyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def oyow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def oyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def oyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def oylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def oyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def oylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def oylw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def oylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def oyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def ozxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ozxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ozxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def ozyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ozyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ozyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def ozzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ozzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def ozzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def ozwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ozwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ozwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ozww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ozwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def ozwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def ozox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def ozoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def ozoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def ozow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def ozoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def ozol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def ozlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def ozly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def ozlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def ozlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def ozlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def ozll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def owxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def owxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def owxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def owxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def owxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def owxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def owyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def owyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def owyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def owyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def owyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def owyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def owzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def owzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def owzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def owzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def owzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def owzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def owwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def owwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def owwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def owww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def owwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def owwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def owox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def owoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def owoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def owow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def owoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def owol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a zero, and a one."""
+        ...
+    @property
+    def owlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def owly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def owlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def owlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def owlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a one, and a zero."""
+        ...
+    @property
+    def owll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, the W element of this vector, a one, and a one."""
+        ...
+    @property
+    def ooxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ooxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ooxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ooxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ooxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def ooxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def ooyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def ooyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def ooyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ooyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def ooyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def ooyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def oozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def oozw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def oozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def oowx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def oowy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def oowz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def ooww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def oowo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the W element of this vector, and a zero."""
+        ...
+    @property
+    def oowl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, the W element of this vector, and a one."""
+        ...
+    @property
+    def ooox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oooy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oooz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def ooow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a zero, and the W element of this vector."""
+        ...
+    @property
+    def oolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def ooly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def oolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def oolw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a zero, a one, and the W element of this vector."""
+        ...
+    @property
+    def olxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def olxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def olxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def olxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def olyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def olyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def olyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def olyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def olzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def olzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def olzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def olzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def olwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def olwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def olwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def olww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def olwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the W element of this vector, and a zero."""
+        ...
+    @property
+    def olwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, the W element of this vector, and a one."""
+        ...
+    @property
+    def olox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def oloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def oloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def olow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a zero, and the W element of this vector."""
+        ...
+    @property
+    def ollx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def olly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def ollz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def ollw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a zero, a one, a one, and the W element of this vector."""
+        ...
+    @property
+    def lxxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lxxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lxxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lxyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lxyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lxyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lxzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lxzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lxzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lxwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lxwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lxwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lxww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lxwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def lxwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def lxox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lxoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lxoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lxow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def lxoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lxol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lxlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lxly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lxlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lxlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def lxlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lxll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the X element of this vector, a one, and a one."""
+        ...
+    @property
+    def lyxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lyxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lyxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lyyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lyyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lyyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lyzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lyzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lyzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lyzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lyzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lywx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lywy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lywz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lyww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lywo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def lywl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def lyox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lyoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lyoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lyow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def lyoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lyol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lylx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lyly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lylz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lylw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def lylo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lyll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Y element of this vector, a one, and a one."""
+        ...
+    @property
+    def lzxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lzxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lzxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lzyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lzyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lzyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lzzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lzzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lzzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lzwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lzwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lzwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lzww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lzwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def lzwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def lzox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lzoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lzoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lzow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def lzoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lzol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lzlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lzly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lzlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lzlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def lzlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lzll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the Z element of this vector, a one, and a one."""
+        ...
+    @property
+    def lwxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lwxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lwxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lwxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lwxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the X element of this vector, and a zero."""
+        ...
+    @property
+    def lwxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the X element of this vector, and a one."""
+        ...
+    @property
+    def lwyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lwyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lwyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lwyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lwyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def lwyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lwzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lwzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lwzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lwzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lwzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lwzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lwwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lwwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lwwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lwww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lwwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the W element of this vector, and a zero."""
+        ...
+    @property
+    def lwwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, the W element of this vector, and a one."""
+        ...
+    @property
+    def lwox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lwoy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lwoz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def lwow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a zero, and the W element of this vector."""
+        ...
+    @property
+    def lwoo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a zero, and a zero."""
+        ...
+    @property
+    def lwol(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a zero, and a one."""
+        ...
+    @property
+    def lwlx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a one, and the X element of this vector."""
+        ...
+    @property
+    def lwly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lwlz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lwlw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a one, and the W element of this vector."""
+        ...
+    @property
+    def lwlo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a one, and a zero."""
+        ...
+    @property
+    def lwll(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, the W element of this vector, a one, and a one."""
+        ...
+    @property
+    def loxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def loxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def loxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def loxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def loxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and a zero."""
+        ...
+    @property
+    def loxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the X element of this vector, and a one."""
+        ...
+    @property
+    def loyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def loyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def loyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def loyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def loyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def loyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Y element of this vector, and a one."""
+        ...
+    @property
+    def lozx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lozy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lozz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def lozw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lozo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def lozl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the Z element of this vector, and a one."""
+        ...
+    @property
+    def lowx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def lowy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def lowz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def loww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def lowo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the W element of this vector, and a zero."""
+        ...
+    @property
+    def lowl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, the W element of this vector, and a one."""
+        ...
+    @property
+    def loox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the X element of this vector."""
+        ...
+    @property
+    def looy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def looz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def loow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a zero, and the W element of this vector."""
+        ...
+    @property
+    def lolx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the X element of this vector."""
+        ...
+    @property
+    def loly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lolz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lolw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a zero, a one, and the W element of this vector."""
+        ...
+    @property
+    def llxx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llxy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llxz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def llxw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def llxo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and a zero."""
+        ...
+    @property
+    def llxl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the X element of this vector, and a one."""
+        ...
+    @property
+    def llyx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llyy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llyz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def llyw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def llyo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def llyl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Y element of this vector, and a one."""
+        ...
+    @property
+    def llzx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llzy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llzz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def llzw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def llzo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def llzl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the Z element of this vector, and a one."""
+        ...
+    @property
+    def llwx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the W element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def llwy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the W element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def llwz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the W element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def llww(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the W element of this vector, and the W element of this vector."""
+        ...
+    @property
+    def llwo(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the W element of this vector, and a zero."""
+        ...
+    @property
+    def llwl(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, the W element of this vector, and a one."""
+        ...
+    @property
+    def llox(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the X element of this vector."""
+        ...
+    @property
+    def lloy(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def lloz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the Z element of this vector."""
+        ...
+    @property
+    def llow(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a zero, and the W element of this vector."""
+        ...
+    @property
+    def lllx(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the X element of this vector."""
+        ...
+    @property
+    def llly(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the Y element of this vector."""
+        ...
+    @property
+    def lllz(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the Z element of this vector."""
+        ...
+    @property
+    def lllw(self) -> "Vec4i":
+        """Create a `Vec4i` with its elements being a one, a one, a one, and the W element of this vector."""
+        ...
+
+    def swizzle_into(self, swizzle: "str", out: Any, /) -> Any:
+        """Write the elements picked by a swizzle pattern (e.g. "zxy" or "xyol") into the vector `out` of matching size and return it.
+    
+        This is the allocation-free version of swizzle properties, e.g. `vec.swizzle_into("zxy", out)` is equivalent to `out.xyz = vec.zxy`.
+        """
+        ...
+    def angle_to(self, other: "Vec4i", /) -> (float | int):
+        """The (unsigned) angle between two vectors in radians, in the range [0, pi]."""
+        ...
+    def slide(self, normal: "Vec4i", /) -> "Vec4":
+        """Remove the component of this vector along the given normal, same as `v - n * (v @ n)`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def reflect(self, normal: "Vec4i", /) -> "Vec4":
+        """Reflect this vector off the plane (or line) with the given normal, same as `v - n * (2 * (v @ n))`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def project_onto(self, other: "Vec4i", /) -> "Vec4":
+        """Project this vector onto the other vector, same as `b * ((a @ b) / (b @ b))`."""
+        ...
+    def move_toward(self, to: "Vec4i", delta: (float | int), /) -> "Vec4":
+        """Move this vector toward `to` by at most `delta`, without overshooting it."""
+        ...
+    def lerp(self, other: "Vec4i", weight: (float | int), /) -> "Vec4":
+        """Linearly interpolate from this vector (weight 0) to the other vector (weight 1), same as `a + (b - a) * weight`."""
+        ...
+    @overload
+    def clamp_ip(self, low: "Vec4i", high: "Vec4i") -> Self:
+        """Inplace version of `Vec4i.clamp()`."""
+        ...
+    @overload
+    def clamp_ip(self, low: int, high: int) -> Self:
+        """Inplace version of `Vec4i.clamp()` with the same bounds for all elements."""
+        ...
+    @overload
+    def clamp(self, low: "Vec4i", high: "Vec4i") -> "Vec4i":
+        """Clamp every element between the elements of `low` and `high`."""
+        ...
+    @overload
+    def clamp(self, low: int, high: int) -> "Vec4i":
+        """Clamp every element between `low` and `high`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: "Vec4i", addend: "Vec4i") -> Self:
+        """Inplace version of `Vec4i.mul_add()`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: int, addend: "Vec4i") -> Self:
+        """Inplace version of `Vec4i.mul_add()` with the same multiplier for all elements."""
+        ...
+    @overload
+    def mul_add(self, multiplier: "Vec4i", addend: "Vec4i") -> "Vec4i":
+        """Fused `self * multiplier + addend`, without intermediate vectors."""
+        ...
+    @overload
+    def mul_add(self, multiplier: int, addend: "Vec4i") -> "Vec4i":
+        """Fused `self * multiplier + addend` with the same multiplier for all elements, without intermediate vectors."""
+        ...
+    def distance_sqr_to(self, other: "Vec4i", /) -> (float | int):
+        """The squared Euclidean distance between two vectors."""
+        ...
+    def distance_to(self, other: "Vec4i", /) -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    def __or__(self, other: "Vec4i") -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    @staticmethod
+    def hash_many(vectors: Any, /) -> "array":
+        """The hashes of an iterable of vectors, same as `hash()` of each one but in one pass.
+    
+        The vectors are converted to a `Vec4iArray` first, unless they already are one.
+        See Also: `Vec4iArray.hash_many()`
+        """
+        ...
+    @staticmethod
+    def argmax_length_many(vectors: Any, /) -> int:
+        """The index of the longest of an iterable of vectors (the first one on ties).
+    
+        The vectors are converted to a `Vec4iArray` first, unless they already are one.
+        See Also: `Vec4iArray.argmax_length()`
+        """
+        ...
+    @staticmethod
+    def argmin_length_many(vectors: Any, /) -> int:
+        """The index of the shortest of an iterable of vectors (the first one on ties).
+    
+        The vectors are converted to a `Vec4iArray` first, unless they already are one.
+        See Also: `Vec4iArray.argmin_length()`
+        """
+        ...
+    @staticmethod
+    def bounds_many(vectors: Any, /) -> "tuple[Vec4i, Vec4i]":
+        """The axis-aligned bounding box of an iterable of vectors, as the (min, max) corners.
+    
+        The vectors are converted to a `Vec4iArray` first, unless they already are one.
+        See Also: `Vec4iArray.bounds()`
+        """
+        ...
+    @staticmethod
+    def max_many(vectors: Any, /) -> "Vec4i":
+        """The component-wise maximum of an iterable of vectors.
+    
+        The vectors are converted to a `Vec4iArray` first, unless they already are one.
+        See Also: `Vec4iArray.max()`
+        """
+        ...
+    @staticmethod
+    def min_many(vectors: Any, /) -> "Vec4i":
+        """The component-wise minimum of an iterable of vectors.
+    
+        The vectors are converted to a `Vec4iArray` first, unless they already are one.
+        See Also: `Vec4iArray.min()`
+        """
+        ...
+    @staticmethod
+    def mean_many(vectors: Any, /) -> "Vec4":
+        """The mean of an iterable of vectors (the centroid).
+    
+        The vectors are converted to a `Vec4iArray` first, unless they already are one.
+        See Also: `Vec4iArray.mean()`
+        """
+        ...
+    @staticmethod
+    def sum_many(vectors: Any, /) -> "Vec4i":
+        """The sum of an iterable of vectors, the zero vector if it's empty.
+    
+        The vectors are converted to a `Vec4iArray` first, unless they already are one.
+        See Also: `Vec4iArray.sum()`
+        """
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Vec4i]":
+        """Read the vectors of a block written by `Vec4i.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(vectors: Any, /) -> "bytes":
+        """Pack an iterable of vectors into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the vectors one by one.
+        See Also: `Vec4i.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec4i":
+        """Create a vector from the bytes written by `Vec4i.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this vector as raw bytes in native byte order."""
+        ...
+    def __iter__(self) -> "_Vec4iiterator":
+        """Create an iterator that yields all the elements of the vector in sequence.
+    
+        This creates a copy of all the elements of this vector,
+        so modifying the vector won't affect already created iterators.
+        """
+        ...
+    def __setitem__(self, key: int, value: int) -> None:
+        """Set the n-th element of this vector."""
+        ...
+    def __getitem__(self, key: int) -> int:
+        """Get the n-th element of this vector."""
+        ...
+    def __len__(self) -> int:
+        """The number of dimensions (elements) of this vector."""
+        ...
+    def __matmul__(self, other: "Vec4i") -> int:
+        """Dot product."""
+        ...
+    @overload
+    def truediv_into(self, other: "Vec4i", out: "Vec4i") -> "Vec4i":
+        """Element-wise division, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def truediv_into(self, other: int, out: "Vec4i") -> "Vec4i":
+        """Element-wise division with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec4i") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec4i") -> "Vec4i":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec4i":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def mul_into(self, other: "Vec4i", out: "Vec4i") -> "Vec4i":
+        """Element-wise multiplication, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def mul_into(self, other: int, out: "Vec4i") -> "Vec4i":
+        """Element-wise multiplication with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec4i") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec4i") -> "Vec4i":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec4i":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def sub_into(self, other: "Vec4i", out: "Vec4i") -> "Vec4i":
+        """Element-wise subtraction, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def sub_into(self, other: int, out: "Vec4i") -> "Vec4i":
+        """Element-wise subtraction with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec4i") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec4i") -> "Vec4i":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec4i":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def add_into(self, other: "Vec4i", out: "Vec4i") -> "Vec4i":
+        """Element-wise addition, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def add_into(self, other: int, out: "Vec4i") -> "Vec4i":
+        """Element-wise addition with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec4i") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec4i") -> "Vec4i":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec4i":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def neg_ip(self) -> Self:
+        """Inverse this vector inplace."""
+        ...
+    def neg_into(self, out: "Vec4i", /) -> "Vec4i":
+        """Write the inverse of this vector into `out` (which can be `self`) and return it."""
+        ...
+    def copy_into(self, out: "Vec4i", /) -> "Vec4i":
+        """Copy the elements of this vector into `out` and return it, the allocation-free version of `+vec`."""
+        ...
+    def __neg__(self) -> "Vec4i":
+        """Return the inverse vector."""
+        ...
+    def __pos__(self) -> "Vec4i":
+        """Return a copy of this vector."""
+        ...
+    def __hash__(self) -> int: ...
+    def __bool__(self) -> "bool":
+        """If the vector is a zero vector."""
+        ...
+    def is_close(self, other: "Vec4i", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two vectors are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec4i.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec4i.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create a zero vector."""
+        ...
+    @overload
+    def __init__(self, value: int) -> None:
+        """Create a vector with the same value for all elements."""
+        ...
+    @overload
+    def __init__(self, xyzw: "Vec4i") -> None:
+        """Create a 4D vector from a 4D vector."""
+        ...
+    @overload
+    def __init__(self, x: int, yzw: "Vec3i") -> None:
+        """Create a 4D vector from a number and a 3D vector."""
+        ...
+    @overload
+    def __init__(self, xy: "Vec2i", zw: "Vec2i") -> None:
+        """Create a 4D vector from a 2D vector and a 2D vector."""
+        ...
+    @overload
+    def __init__(self, xyz: "Vec3i", w: int) -> None:
+        """Create a 4D vector from a 3D vector and a number."""
+        ...
+    @overload
+    def __init__(self, x: int, y: int, zw: "Vec2i") -> None:
+        """Create a 4D vector from a number, a number and a 2D vector."""
+        ...
+    @overload
+    def __init__(self, x: int, yz: "Vec2i", w: int) -> None:
+        """Create a 4D vector from a number, a 2D vector and a number."""
+        ...
+    @overload
+    def __init__(self, xy: "Vec2i", z: int, w: int) -> None:
+        """Create a 4D vector from a 2D vector, a number and a number."""
+        ...
+    @overload
+    def __init__(self, x: int, y: int, z: int, w: int) -> None:
+        """Create a 4D vector from a number, a number, a number and a number."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec4") -> None:
+        """Convert a floating-point vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec4d") -> None:
+        """Convert a double precision vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec4f") -> None:
+        """Convert a single precision vector to a integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec4i32") -> None:
+        """Convert a 32-bit integer vector to a integer vector."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec4iiterator:
+    """Internal iterator class for Vec4i."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+    @property
+    def w(self) -> int: ...
+    @w.setter
+    def w(self, value: int) -> None: ...
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> int: ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec2i32:
+    """2D integer vector of `int`s."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def length(self) -> (float | int):
+        """The (Euclidean) length of this vector."""
+        ...
+    @property
+    def length_sqr(self) -> (float | int):
+        """The squared Euclidean length of this vector."""
+        ...
+    @property
+    def xy(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the X element of this vector, and the Y element of this vector."""
+        ...
+    @xy.setter
+    def xy(self, value: "Vec2i32") -> None:
+        """Set the value of the X and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yx(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Y element of this vector, and the X element of this vector."""
+        ...
+    @yx.setter
+    def yx(self, value: "Vec2i32") -> None:
+        """Set the value of the Y and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xyo(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyl(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xoy(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+
+    def __getattr__(self, name: "str", /) -> Any:
+        """Resolve the swizzles that aren't compiled into properties, through a plan cached on first use."""
+        ...
+    def swizzle_into(self, swizzle: "str", out: Any, /) -> Any:
+        """Write the elements picked by a swizzle pattern (e.g. "zxy" or "xyol") into the vector `out` of matching size and return it.
+    
+        This is the allocation-free version of swizzle properties, e.g. `vec.swizzle_into("zxy", out)` is equivalent to `out.xyz = vec.zxy`.
+        """
+        ...
+    def angle_to(self, other: "Vec2i32", /) -> (float | int):
+        """The (unsigned) angle between two vectors in radians, in the range [0, pi]."""
+        ...
+    def slide(self, normal: "Vec2i32", /) -> "Vec2d":
+        """Remove the component of this vector along the given normal, same as `v - n * (v @ n)`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def reflect(self, normal: "Vec2i32", /) -> "Vec2d":
+        """Reflect this vector off the plane (or line) with the given normal, same as `v - n * (2 * (v @ n))`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def project_onto(self, other: "Vec2i32", /) -> "Vec2d":
+        """Project this vector onto the other vector, same as `b * ((a @ b) / (b @ b))`."""
+        ...
+    def move_toward(self, to: "Vec2i32", delta: (float | int), /) -> "Vec2d":
+        """Move this vector toward `to` by at most `delta`, without overshooting it."""
+        ...
+    def lerp(self, other: "Vec2i32", weight: (float | int), /) -> "Vec2d":
+        """Linearly interpolate from this vector (weight 0) to the other vector (weight 1), same as `a + (b - a) * weight`."""
+        ...
+    @overload
+    def clamp_ip(self, low: "Vec2i32", high: "Vec2i32") -> Self:
+        """Inplace version of `Vec2i32.clamp()`."""
+        ...
+    @overload
+    def clamp_ip(self, low: int, high: int) -> Self:
+        """Inplace version of `Vec2i32.clamp()` with the same bounds for all elements."""
+        ...
+    @overload
+    def clamp(self, low: "Vec2i32", high: "Vec2i32") -> "Vec2i32":
+        """Clamp every element between the elements of `low` and `high`."""
+        ...
+    @overload
+    def clamp(self, low: int, high: int) -> "Vec2i32":
+        """Clamp every element between `low` and `high`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: "Vec2i32", addend: "Vec2i32") -> Self:
+        """Inplace version of `Vec2i32.mul_add()`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: int, addend: "Vec2i32") -> Self:
+        """Inplace version of `Vec2i32.mul_add()` with the same multiplier for all elements."""
+        ...
+    @overload
+    def mul_add(self, multiplier: "Vec2i32", addend: "Vec2i32") -> "Vec2i32":
+        """Fused `self * multiplier + addend`, without intermediate vectors."""
+        ...
+    @overload
+    def mul_add(self, multiplier: int, addend: "Vec2i32") -> "Vec2i32":
+        """Fused `self * multiplier + addend` with the same multiplier for all elements, without intermediate vectors."""
+        ...
+    def distance_sqr_to(self, other: "Vec2i32", /) -> (float | int):
+        """The squared Euclidean distance between two vectors."""
+        ...
+    def distance_to(self, other: "Vec2i32", /) -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    def __or__(self, other: "Vec2i32") -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Vec2i32]":
+        """Read the vectors of a block written by `Vec2i32.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(vectors: Any, /) -> "bytes":
+        """Pack an iterable of vectors into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the vectors one by one.
+        See Also: `Vec2i32.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec2i32":
+        """Create a vector from the bytes written by `Vec2i32.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this vector as raw bytes in native byte order."""
+        ...
+    def __iter__(self) -> "_Vec2i32iterator":
+        """Create an iterator that yields all the elements of the vector in sequence.
+    
+        This creates a copy of all the elements of this vector,
+        so modifying the vector won't affect already created iterators.
+        """
+        ...
+    def __setitem__(self, key: int, value: int) -> None:
+        """Set the n-th element of this vector."""
+        ...
+    def __getitem__(self, key: int) -> int:
+        """Get the n-th element of this vector."""
+        ...
+    def __len__(self) -> int:
+        """The number of dimensions (elements) of this vector."""
+        ...
+    def __matmul__(self, other: "Vec2i32") -> int:
+        """Dot product."""
+        ...
+    @overload
+    def truediv_into(self, other: "Vec2i32", out: "Vec2i32") -> "Vec2i32":
+        """Element-wise division, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def truediv_into(self, other: int, out: "Vec2i32") -> "Vec2i32":
+        """Element-wise division with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec2i32") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec2i32") -> "Vec2i32":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec2i32":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def mul_into(self, other: "Vec2i32", out: "Vec2i32") -> "Vec2i32":
+        """Element-wise multiplication, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def mul_into(self, other: int, out: "Vec2i32") -> "Vec2i32":
+        """Element-wise multiplication with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec2i32") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec2i32") -> "Vec2i32":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec2i32":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def sub_into(self, other: "Vec2i32", out: "Vec2i32") -> "Vec2i32":
+        """Element-wise subtraction, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def sub_into(self, other: int, out: "Vec2i32") -> "Vec2i32":
+        """Element-wise subtraction with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec2i32") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec2i32") -> "Vec2i32":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec2i32":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def add_into(self, other: "Vec2i32", out: "Vec2i32") -> "Vec2i32":
+        """Element-wise addition, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def add_into(self, other: int, out: "Vec2i32") -> "Vec2i32":
+        """Element-wise addition with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec2i32") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec2i32") -> "Vec2i32":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec2i32":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def neg_ip(self) -> Self:
+        """Inverse this vector inplace."""
+        ...
+    def neg_into(self, out: "Vec2i32", /) -> "Vec2i32":
+        """Write the inverse of this vector into `out` (which can be `self`) and return it."""
+        ...
+    def copy_into(self, out: "Vec2i32", /) -> "Vec2i32":
+        """Copy the elements of this vector into `out` and return it, the allocation-free version of `+vec`."""
+        ...
+    def __neg__(self) -> "Vec2i32":
+        """Return the inverse vector."""
+        ...
+    def __pos__(self) -> "Vec2i32":
+        """Return a copy of this vector."""
+        ...
+    def __hash__(self) -> int: ...
+    def __bool__(self) -> "bool":
+        """If the vector is a zero vector."""
+        ...
+    def is_close(self, other: "Vec2i32", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two vectors are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec2i32.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec2i32.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create a zero vector."""
+        ...
+    @overload
+    def __init__(self, value: int) -> None:
+        """Create a vector with the same value for all elements."""
+        ...
+    @overload
+    def __init__(self, xy: "Vec2i32") -> None:
+        """Create a 2D vector from a 2D vector."""
+        ...
+    @overload
+    def __init__(self, x: int, y: int) -> None:
+        """Create a 2D vector from a number and a number."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec2") -> None:
+        """Convert a floating-point vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec2i") -> None:
+        """Convert a integer vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec2d") -> None:
+        """Convert a double precision vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec2f") -> None:
+        """Convert a single precision vector to a 32-bit integer vector."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec2i32iterator:
+    """Internal iterator class for Vec2i32."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> int: ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec3i32:
+    """3D integer vector of `int`s."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+    @property
+    def length(self) -> (float | int):
+        """The (Euclidean) length of this vector."""
+        ...
+    @property
+    def length_sqr(self) -> (float | int):
+        """The squared Euclidean length of this vector."""
+        ...
+    @property
+    def xy(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xz(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yx(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yz(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zx(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zy(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyz(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @xyz.setter
+    def xyz(self, value: "Vec3i32") -> None:
+        """Set the value of the X, Y and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xyo(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyl(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xzy(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @xzy.setter
+    def xzy(self, value: "Vec3i32") -> None:
+        """Set the value of the X, Z and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xoy(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def yxz(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @yxz.setter
+    def yxz(self, value: "Vec3i32") -> None:
+        """Set the value of the Y, X and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yzx(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @yzx.setter
+    def yzx(self, value: "Vec3i32") -> None:
+        """Set the value of the Y, Z and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zxy(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @zxy.setter
+    def zxy(self, value: "Vec3i32") -> None:
+        """Set the value of the Z, X and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zyx(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @zyx.setter
+    def zyx(self, value: "Vec3i32") -> None:
+        """Set the value of the Z, Y and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xyzo(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xyzl(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+
+    def __getattr__(self, name: "str", /) -> Any:
+        """Resolve the swizzles that aren't compiled into properties, through a plan cached on first use."""
+        ...
+    def swizzle_into(self, swizzle: "str", out: Any, /) -> Any:
+        """Write the elements picked by a swizzle pattern (e.g. "zxy" or "xyol") into the vector `out` of matching size and return it.
+    
+        This is the allocation-free version of swizzle properties, e.g. `vec.swizzle_into("zxy", out)` is equivalent to `out.xyz = vec.zxy`.
+        """
+        ...
+    def angle_to(self, other: "Vec3i32", /) -> (float | int):
+        """The (unsigned) angle between two vectors in radians, in the range [0, pi]."""
+        ...
+    def slide(self, normal: "Vec3i32", /) -> "Vec3d":
+        """Remove the component of this vector along the given normal, same as `v - n * (v @ n)`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def reflect(self, normal: "Vec3i32", /) -> "Vec3d":
+        """Reflect this vector off the plane (or line) with the given normal, same as `v - n * (2 * (v @ n))`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def project_onto(self, other: "Vec3i32", /) -> "Vec3d":
+        """Project this vector onto the other vector, same as `b * ((a @ b) / (b @ b))`."""
+        ...
+    def move_toward(self, to: "Vec3i32", delta: (float | int), /) -> "Vec3d":
+        """Move this vector toward `to` by at most `delta`, without overshooting it."""
+        ...
+    def lerp(self, other: "Vec3i32", weight: (float | int), /) -> "Vec3d":
+        """Linearly interpolate from this vector (weight 0) to the other vector (weight 1), same as `a + (b - a) * weight`."""
+        ...
+    @overload
+    def clamp_ip(self, low: "Vec3i32", high: "Vec3i32") -> Self:
+        """Inplace version of `Vec3i32.clamp()`."""
+        ...
+    @overload
+    def clamp_ip(self, low: int, high: int) -> Self:
+        """Inplace version of `Vec3i32.clamp()` with the same bounds for all elements."""
+        ...
+    @overload
+    def clamp(self, low: "Vec3i32", high: "Vec3i32") -> "Vec3i32":
+        """Clamp every element between the elements of `low` and `high`."""
+        ...
+    @overload
+    def clamp(self, low: int, high: int) -> "Vec3i32":
+        """Clamp every element between `low` and `high`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: "Vec3i32", addend: "Vec3i32") -> Self:
+        """Inplace version of `Vec3i32.mul_add()`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: int, addend: "Vec3i32") -> Self:
+        """Inplace version of `Vec3i32.mul_add()` with the same multiplier for all elements."""
+        ...
+    @overload
+    def mul_add(self, multiplier: "Vec3i32", addend: "Vec3i32") -> "Vec3i32":
+        """Fused `self * multiplier + addend`, without intermediate vectors."""
+        ...
+    @overload
+    def mul_add(self, multiplier: int, addend: "Vec3i32") -> "Vec3i32":
+        """Fused `self * multiplier + addend` with the same multiplier for all elements, without intermediate vectors."""
+        ...
+    def distance_sqr_to(self, other: "Vec3i32", /) -> (float | int):
+        """The squared Euclidean distance between two vectors."""
+        ...
+    def distance_to(self, other: "Vec3i32", /) -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    def __or__(self, other: "Vec3i32") -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Vec3i32]":
+        """Read the vectors of a block written by `Vec3i32.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(vectors: Any, /) -> "bytes":
+        """Pack an iterable of vectors into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the vectors one by one.
+        See Also: `Vec3i32.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec3i32":
+        """Create a vector from the bytes written by `Vec3i32.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this vector as raw bytes in native byte order."""
+        ...
+    def __iter__(self) -> "_Vec3i32iterator":
+        """Create an iterator that yields all the elements of the vector in sequence.
+    
+        This creates a copy of all the elements of this vector,
+        so modifying the vector won't affect already created iterators.
+        """
+        ...
+    def __setitem__(self, key: int, value: int) -> None:
+        """Set the n-th element of this vector."""
+        ...
+    def __getitem__(self, key: int) -> int:
+        """Get the n-th element of this vector."""
+        ...
+    def __len__(self) -> int:
+        """The number of dimensions (elements) of this vector."""
+        ...
+    def __xor__(self, other: "Vec3i32") -> "Vec3i32":
+        """Cross product."""
+        ...
+    def __matmul__(self, other: "Vec3i32") -> int:
+        """Dot product."""
+        ...
+    @overload
+    def truediv_into(self, other: "Vec3i32", out: "Vec3i32") -> "Vec3i32":
+        """Element-wise division, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def truediv_into(self, other: int, out: "Vec3i32") -> "Vec3i32":
+        """Element-wise division with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec3i32") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec3i32") -> "Vec3i32":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec3i32":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def mul_into(self, other: "Vec3i32", out: "Vec3i32") -> "Vec3i32":
+        """Element-wise multiplication, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def mul_into(self, other: int, out: "Vec3i32") -> "Vec3i32":
+        """Element-wise multiplication with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec3i32") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec3i32") -> "Vec3i32":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec3i32":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def sub_into(self, other: "Vec3i32", out: "Vec3i32") -> "Vec3i32":
+        """Element-wise subtraction, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def sub_into(self, other: int, out: "Vec3i32") -> "Vec3i32":
+        """Element-wise subtraction with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec3i32") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec3i32") -> "Vec3i32":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec3i32":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def add_into(self, other: "Vec3i32", out: "Vec3i32") -> "Vec3i32":
+        """Element-wise addition, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def add_into(self, other: int, out: "Vec3i32") -> "Vec3i32":
+        """Element-wise addition with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec3i32") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec3i32") -> "Vec3i32":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec3i32":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def neg_ip(self) -> Self:
+        """Inverse this vector inplace."""
+        ...
+    def neg_into(self, out: "Vec3i32", /) -> "Vec3i32":
+        """Write the inverse of this vector into `out` (which can be `self`) and return it."""
+        ...
+    def copy_into(self, out: "Vec3i32", /) -> "Vec3i32":
+        """Copy the elements of this vector into `out` and return it, the allocation-free version of `+vec`."""
+        ...
+    def __neg__(self) -> "Vec3i32":
+        """Return the inverse vector."""
+        ...
+    def __pos__(self) -> "Vec3i32":
+        """Return a copy of this vector."""
+        ...
+    def __hash__(self) -> int: ...
+    def __bool__(self) -> "bool":
+        """If the vector is a zero vector."""
+        ...
+    def is_close(self, other: "Vec3i32", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two vectors are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec3i32.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec3i32.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create a zero vector."""
+        ...
+    @overload
+    def __init__(self, value: int) -> None:
+        """Create a vector with the same value for all elements."""
+        ...
+    @overload
+    def __init__(self, xyz: "Vec3i32") -> None:
+        """Create a 3D vector from a 3D vector."""
+        ...
+    @overload
+    def __init__(self, x: int, yz: "Vec2i32") -> None:
+        """Create a 3D vector from a number and a 2D vector."""
+        ...
+    @overload
+    def __init__(self, xy: "Vec2i32", z: int) -> None:
+        """Create a 3D vector from a 2D vector and a number."""
+        ...
+    @overload
+    def __init__(self, x: int, y: int, z: int) -> None:
+        """Create a 3D vector from a number, a number and a number."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec3") -> None:
+        """Convert a floating-point vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec3i") -> None:
+        """Convert a integer vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec3d") -> None:
+        """Convert a double precision vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec3f") -> None:
+        """Convert a single precision vector to a 32-bit integer vector."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec3i32iterator:
+    """Internal iterator class for Vec3i32."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> int: ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec4i32:
+    """4D integer vector of `int`s."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+    @property
+    def w(self) -> int: ...
+    @w.setter
+    def w(self, value: int) -> None: ...
+    @property
+    def length(self) -> (float | int):
+        """The (Euclidean) length of this vector."""
+        ...
+    @property
+    def length_sqr(self) -> (float | int):
+        """The squared Euclidean length of this vector."""
+        ...
+    @property
+    def xy(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the X element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xz(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the X element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def yx(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Y element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def yz(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Y element of this vector, and the Z element of this vector."""
+        ...
+    @property
+    def zx(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Z element of this vector, and the X element of this vector."""
+        ...
+    @property
+    def zy(self) -> "Vec2i32":
+        """Create a `Vec2i32` with its elements being the Z element of this vector, and the Y element of this vector."""
+        ...
+    @property
+    def xyo(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, the Y element of this vector, and a zero."""
+        ...
+    @property
+    def xyl(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, the Y element of this vector, and a one."""
+        ...
+    @property
+    def xoy(self) -> "Vec3i32":
+        """Create a `Vec3i32` with its elements being the X element of this vector, a zero, and the Y element of this vector."""
+        ...
+    @property
+    def xyzw(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @xyzw.setter
+    def xyzw(self, value: "Vec4i32") -> None:
+        """Set the value of the X, Y, Z and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xyzo(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and a zero."""
+        ...
+    @property
+    def xyzl(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the Y element of this vector, the Z element of this vector, and a one."""
+        ...
+    @property
+    def xywz(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the Y element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @xywz.setter
+    def xywz(self, value: "Vec4i32") -> None:
+        """Set the value of the X, Y, W and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xzyw(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the Z element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @xzyw.setter
+    def xzyw(self, value: "Vec4i32") -> None:
+        """Set the value of the X, Z, Y and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xzwy(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the Z element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @xzwy.setter
+    def xzwy(self, value: "Vec4i32") -> None:
+        """Set the value of the X, Z, W and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xwyz(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the W element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @xwyz.setter
+    def xwyz(self, value: "Vec4i32") -> None:
+        """Set the value of the X, W, Y and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def xwzy(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the X element of this vector, the W element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @xwzy.setter
+    def xwzy(self, value: "Vec4i32") -> None:
+        """Set the value of the X, W, Z and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yxzw(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Y element of this vector, the X element of this vector, the Z element of this vector, and the W element of this vector."""
+        ...
+    @yxzw.setter
+    def yxzw(self, value: "Vec4i32") -> None:
+        """Set the value of the Y, X, Z and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yxwz(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Y element of this vector, the X element of this vector, the W element of this vector, and the Z element of this vector."""
+        ...
+    @yxwz.setter
+    def yxwz(self, value: "Vec4i32") -> None:
+        """Set the value of the Y, X, W and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yzxw(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Y element of this vector, the Z element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @yzxw.setter
+    def yzxw(self, value: "Vec4i32") -> None:
+        """Set the value of the Y, Z, X and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def yzwx(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Y element of this vector, the Z element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @yzwx.setter
+    def yzwx(self, value: "Vec4i32") -> None:
+        """Set the value of the Y, Z, W and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def ywxz(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Y element of this vector, the W element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @ywxz.setter
+    def ywxz(self, value: "Vec4i32") -> None:
+        """Set the value of the Y, W, X and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def ywzx(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Y element of this vector, the W element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @ywzx.setter
+    def ywzx(self, value: "Vec4i32") -> None:
+        """Set the value of the Y, W, Z and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zxyw(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Z element of this vector, the X element of this vector, the Y element of this vector, and the W element of this vector."""
+        ...
+    @zxyw.setter
+    def zxyw(self, value: "Vec4i32") -> None:
+        """Set the value of the Z, X, Y and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zxwy(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Z element of this vector, the X element of this vector, the W element of this vector, and the Y element of this vector."""
+        ...
+    @zxwy.setter
+    def zxwy(self, value: "Vec4i32") -> None:
+        """Set the value of the Z, X, W and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zyxw(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Z element of this vector, the Y element of this vector, the X element of this vector, and the W element of this vector."""
+        ...
+    @zyxw.setter
+    def zyxw(self, value: "Vec4i32") -> None:
+        """Set the value of the Z, Y, X and W elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zywx(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Z element of this vector, the Y element of this vector, the W element of this vector, and the X element of this vector."""
+        ...
+    @zywx.setter
+    def zywx(self, value: "Vec4i32") -> None:
+        """Set the value of the Z, Y, W and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zwxy(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Z element of this vector, the W element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @zwxy.setter
+    def zwxy(self, value: "Vec4i32") -> None:
+        """Set the value of the Z, W, X and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def zwyx(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the Z element of this vector, the W element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @zwyx.setter
+    def zwyx(self, value: "Vec4i32") -> None:
+        """Set the value of the Z, W, Y and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wxyz(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the W element of this vector, the X element of this vector, the Y element of this vector, and the Z element of this vector."""
+        ...
+    @wxyz.setter
+    def wxyz(self, value: "Vec4i32") -> None:
+        """Set the value of the W, X, Y and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wxzy(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the W element of this vector, the X element of this vector, the Z element of this vector, and the Y element of this vector."""
+        ...
+    @wxzy.setter
+    def wxzy(self, value: "Vec4i32") -> None:
+        """Set the value of the W, X, Z and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wyxz(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the W element of this vector, the Y element of this vector, the X element of this vector, and the Z element of this vector."""
+        ...
+    @wyxz.setter
+    def wyxz(self, value: "Vec4i32") -> None:
+        """Set the value of the W, Y, X and Z elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wyzx(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the W element of this vector, the Y element of this vector, the Z element of this vector, and the X element of this vector."""
+        ...
+    @wyzx.setter
+    def wyzx(self, value: "Vec4i32") -> None:
+        """Set the value of the W, Y, Z and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wzxy(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the W element of this vector, the Z element of this vector, the X element of this vector, and the Y element of this vector."""
+        ...
+    @wzxy.setter
+    def wzxy(self, value: "Vec4i32") -> None:
+        """Set the value of the W, Z, X and Y elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+    @property
+    def wzyx(self) -> "Vec4i32":
+        """Create a `Vec4i32` with its elements being the W element of this vector, the Z element of this vector, the Y element of this vector, and the X element of this vector."""
+        ...
+    @wzyx.setter
+    def wzyx(self, value: "Vec4i32") -> None:
+        """Set the value of the W, Z, Y and X elements of this vector to the value of the elements of the other vector, respectively."""
+        ...
+
+    def __getattr__(self, name: "str", /) -> Any:
+        """Resolve the swizzles that aren't compiled into properties, through a plan cached on first use."""
+        ...
+    def swizzle_into(self, swizzle: "str", out: Any, /) -> Any:
+        """Write the elements picked by a swizzle pattern (e.g. "zxy" or "xyol") into the vector `out` of matching size and return it.
+    
+        This is the allocation-free version of swizzle properties, e.g. `vec.swizzle_into("zxy", out)` is equivalent to `out.xyz = vec.zxy`.
+        """
+        ...
+    def angle_to(self, other: "Vec4i32", /) -> (float | int):
+        """The (unsigned) angle between two vectors in radians, in the range [0, pi]."""
+        ...
+    def slide(self, normal: "Vec4i32", /) -> "Vec4d":
+        """Remove the component of this vector along the given normal, same as `v - n * (v @ n)`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def reflect(self, normal: "Vec4i32", /) -> "Vec4d":
+        """Reflect this vector off the plane (or line) with the given normal, same as `v - n * (2 * (v @ n))`.
+    
+        The normal is expected to be normalized.
+        """
+        ...
+    def project_onto(self, other: "Vec4i32", /) -> "Vec4d":
+        """Project this vector onto the other vector, same as `b * ((a @ b) / (b @ b))`."""
+        ...
+    def move_toward(self, to: "Vec4i32", delta: (float | int), /) -> "Vec4d":
+        """Move this vector toward `to` by at most `delta`, without overshooting it."""
+        ...
+    def lerp(self, other: "Vec4i32", weight: (float | int), /) -> "Vec4d":
+        """Linearly interpolate from this vector (weight 0) to the other vector (weight 1), same as `a + (b - a) * weight`."""
+        ...
+    @overload
+    def clamp_ip(self, low: "Vec4i32", high: "Vec4i32") -> Self:
+        """Inplace version of `Vec4i32.clamp()`."""
+        ...
+    @overload
+    def clamp_ip(self, low: int, high: int) -> Self:
+        """Inplace version of `Vec4i32.clamp()` with the same bounds for all elements."""
+        ...
+    @overload
+    def clamp(self, low: "Vec4i32", high: "Vec4i32") -> "Vec4i32":
+        """Clamp every element between the elements of `low` and `high`."""
+        ...
+    @overload
+    def clamp(self, low: int, high: int) -> "Vec4i32":
+        """Clamp every element between `low` and `high`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: "Vec4i32", addend: "Vec4i32") -> Self:
+        """Inplace version of `Vec4i32.mul_add()`."""
+        ...
+    @overload
+    def mul_add_ip(self, multiplier: int, addend: "Vec4i32") -> Self:
+        """Inplace version of `Vec4i32.mul_add()` with the same multiplier for all elements."""
+        ...
+    @overload
+    def mul_add(self, multiplier: "Vec4i32", addend: "Vec4i32") -> "Vec4i32":
+        """Fused `self * multiplier + addend`, without intermediate vectors."""
+        ...
+    @overload
+    def mul_add(self, multiplier: int, addend: "Vec4i32") -> "Vec4i32":
+        """Fused `self * multiplier + addend` with the same multiplier for all elements, without intermediate vectors."""
+        ...
+    def distance_sqr_to(self, other: "Vec4i32", /) -> (float | int):
+        """The squared Euclidean distance between two vectors."""
+        ...
+    def distance_to(self, other: "Vec4i32", /) -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    def __or__(self, other: "Vec4i32") -> (float | int):
+        """The (Euclidean) distance between two vectors."""
+        ...
+    @staticmethod
+    def unpack_many(data: Any, /) -> "list[Vec4i32]":
+        """Read the vectors of a block written by `Vec4i32.pack_many()`."""
+        ...
+    @staticmethod
+    def pack_many(vectors: Any, /) -> "bytes":
+        """Pack an iterable of vectors into one fixed-stride block with a small header.
+    
+        This is much smaller and faster than pickling the vectors one by one.
+        See Also: `Vec4i32.unpack_many()`
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec4i32":
+        """Create a vector from the bytes written by `Vec4i32.to_bytes()` (or any buffer of the same size)."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """The elements of this vector as raw bytes in native byte order."""
+        ...
+    def __iter__(self) -> "_Vec4i32iterator":
+        """Create an iterator that yields all the elements of the vector in sequence.
+    
+        This creates a copy of all the elements of this vector,
+        so modifying the vector won't affect already created iterators.
+        """
+        ...
+    def __setitem__(self, key: int, value: int) -> None:
+        """Set the n-th element of this vector."""
+        ...
+    def __getitem__(self, key: int) -> int:
+        """Get the n-th element of this vector."""
+        ...
+    def __len__(self) -> int:
+        """The number of dimensions (elements) of this vector."""
+        ...
+    def __matmul__(self, other: "Vec4i32") -> int:
+        """Dot product."""
+        ...
+    @overload
+    def truediv_into(self, other: "Vec4i32", out: "Vec4i32") -> "Vec4i32":
+        """Element-wise division, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def truediv_into(self, other: int, out: "Vec4i32") -> "Vec4i32":
+        """Element-wise division with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec4i32") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec4i32") -> "Vec4i32":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec4i32":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def mul_into(self, other: "Vec4i32", out: "Vec4i32") -> "Vec4i32":
+        """Element-wise multiplication, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def mul_into(self, other: int, out: "Vec4i32") -> "Vec4i32":
+        """Element-wise multiplication with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec4i32") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec4i32") -> "Vec4i32":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec4i32":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def sub_into(self, other: "Vec4i32", out: "Vec4i32") -> "Vec4i32":
+        """Element-wise subtraction, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def sub_into(self, other: int, out: "Vec4i32") -> "Vec4i32":
+        """Element-wise subtraction with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec4i32") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec4i32") -> "Vec4i32":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec4i32":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def add_into(self, other: "Vec4i32", out: "Vec4i32") -> "Vec4i32":
+        """Element-wise addition, written into `out` (which can be `self` or `other`) instead of a new vector."""
+        ...
+    @overload
+    def add_into(self, other: int, out: "Vec4i32") -> "Vec4i32":
+        """Element-wise addition with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec4i32") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec4i32") -> "Vec4i32":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec4i32":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def neg_ip(self) -> Self:
+        """Inverse this vector inplace."""
+        ...
+    def neg_into(self, out: "Vec4i32", /) -> "Vec4i32":
+        """Write the inverse of this vector into `out` (which can be `self`) and return it."""
+        ...
+    def copy_into(self, out: "Vec4i32", /) -> "Vec4i32":
+        """Copy the elements of this vector into `out` and return it, the allocation-free version of `+vec`."""
+        ...
+    def __neg__(self) -> "Vec4i32":
+        """Return the inverse vector."""
+        ...
+    def __pos__(self) -> "Vec4i32":
+        """Return a copy of this vector."""
+        ...
+    def __hash__(self) -> int: ...
+    def __bool__(self) -> "bool":
+        """If the vector is a zero vector."""
+        ...
+    def is_close(self, other: "Vec4i32", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if the two vectors are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec4i32.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec4i32.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create a zero vector."""
+        ...
+    @overload
+    def __init__(self, value: int) -> None:
+        """Create a vector with the same value for all elements."""
+        ...
+    @overload
+    def __init__(self, xyzw: "Vec4i32") -> None:
+        """Create a 4D vector from a 4D vector."""
+        ...
+    @overload
+    def __init__(self, x: int, yzw: "Vec3i32") -> None:
+        """Create a 4D vector from a number and a 3D vector."""
+        ...
+    @overload
+    def __init__(self, xy: "Vec2i32", zw: "Vec2i32") -> None:
+        """Create a 4D vector from a 2D vector and a 2D vector."""
+        ...
+    @overload
+    def __init__(self, xyz: "Vec3i32", w: int) -> None:
+        """Create a 4D vector from a 3D vector and a number."""
+        ...
+    @overload
+    def __init__(self, x: int, y: int, zw: "Vec2i32") -> None:
+        """Create a 4D vector from a number, a number and a 2D vector."""
+        ...
+    @overload
+    def __init__(self, x: int, yz: "Vec2i32", w: int) -> None:
+        """Create a 4D vector from a number, a 2D vector and a number."""
+        ...
+    @overload
+    def __init__(self, xy: "Vec2i32", z: int, w: int) -> None:
+        """Create a 4D vector from a 2D vector, a number and a number."""
+        ...
+    @overload
+    def __init__(self, x: int, y: int, z: int, w: int) -> None:
+        """Create a 4D vector from a number, a number, a number and a number."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec4") -> None:
+        """Convert a floating-point vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec4i") -> None:
+        """Convert a integer vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec4d") -> None:
+        """Convert a double precision vector to a 32-bit integer vector."""
+        ...
+    @overload
+    def __init__(self, vec: "Vec4f") -> None:
+        """Convert a single precision vector to a 32-bit integer vector."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec4i32iterator:
+    """Internal iterator class for Vec4i32."""
+
+    @property
+    def x(self) -> int: ...
+    @x.setter
+    def x(self, value: int) -> None: ...
+    @property
+    def y(self) -> int: ...
+    @y.setter
+    def y(self, value: int) -> None: ...
+    @property
+    def z(self) -> int: ...
+    @z.setter
+    def z(self, value: int) -> None: ...
+    @property
+    def w(self) -> int: ...
+    @w.setter
+    def w(self, value: int) -> None: ...
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> int: ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec2iArray:
+    """Contiguous array of 2D integer vectors."""
+
+    @property
+    def __array_interface__(self) -> "dict":
+        """The vectors as a C-contiguous (len, 2) array of native `long long` numbers, for numpy without copying."""
+        ...
+    @property
+    def length(self) -> "array":
+        """The (Euclidean) lengths of the vectors."""
+        ...
+    @property
+    def length_sqr(self) -> "array":
+        """The squared Euclidean lengths of the vectors."""
+        ...
+
+    def argmax_length(self) -> int:
+        """The index of the longest vector (the first one on ties)."""
+        ...
+    def argmin_length(self) -> int:
+        """The index of the shortest vector (the first one on ties)."""
+        ...
+    def bounds(self) -> "tuple[Vec2i, Vec2i]":
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        ...
+    def max(self) -> "Vec2i":
+        """The component-wise maximum of all the vectors."""
+        ...
+    def min(self) -> "Vec2i":
+        """The component-wise minimum of all the vectors."""
+        ...
+    def mean(self) -> "Vec2":
+        """The mean of all the vectors (the centroid)."""
+        ...
+    def sum(self) -> "Vec2i":
+        """The sum of all the vectors, the zero vector for an empty array."""
+        ...
+    def hash_many(self) -> "array":
+        """The hashes of all the vectors, same as `hash()` of each element but in one pass."""
+        ...
+    def nearest(self, points: "Vec2iArray", /) -> "tuple[array, array]":
+        """For every vector of this array, find the nearest vector of `points`.
+    
+        Returns the indices into `points` (the first one on ties) and the (Euclidean) distances, as two `array`s.
+        """
+        ...
+    def distance_matrix(self, other: "Vec2iArray", /, out: Any = None, squared: bool = False) -> Any:
+        """The (Euclidean) distances between every vector of this array (rows) and every vector of `other` (columns).
+    
+        The results are written to `out`, a contiguous (len(self), len(other)) float or double buffer (e.g. a numpy array),
+        and `out` is returned. If `out` is None, a new (len(self), len(other)) double `memoryview` is returned.
+        """
+        ...
+    def distance_sqr_to(self, other: Any, /) -> "array":
+        """The squared Euclidean distances to another array element-wise or to the same vector."""
+        ...
+    def distance_to(self, other: Any, /) -> "array":
+        """The (Euclidean) distances to another array element-wise or to the same vector."""
+        ...
+    def __or__(self, other: Any) -> "array":
+        """The (Euclidean) distances to another array element-wise or to the same vector."""
+        ...
+    def __dlpack_device__(self) -> "tuple[int, int]": ...
+    def __dlpack__(self, *, stream: Any = None, max_version: Any = None, dl_device: Any = None, copy: Any = None) -> Any:
+        """Export the vectors as a DLPack tensor, same layout as `__array_interface__`, copied only if `copy` is True."""
+        ...
+    @staticmethod
+    def from_buffer(data: Any, /) -> "Vec2iArray":
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, 2)), without copying.
+    
+        The buffer must be C-contiguous, of 2 native `long long` numbers per vector, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec2iArray":
+        """Create an array from a block written by `Vec2iArray.to_bytes()` or `Vec2i.pack_many()`."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """Pack the vectors into one block with a small header, the same as `Vec2i.pack_many()`."""
+        ...
+    def tolist(self) -> "list":
+        """Convert this array to a list of `Vec2i`s."""
+        ...
+    def __iter__(self) -> "_Vec2iArray_iterator":
+        """Create an iterator that yields copies of all the vectors of this array in sequence."""
+        ...
+    def __setitem__(self, key: int, value: "Vec2i") -> None:
+        """Set the n-th vector of this array."""
+        ...
+    def __getitem__(self, key: Any) -> Union["Vec2i", "Vec2iArray"]:
+        """Get a copy of the n-th vector, or a copy of a slice of this array."""
+        ...
+    def __len__(self) -> int:
+        """The number of vectors in this array."""
+        ...
+    def __matmul__(self, other: Any) -> "array":
+        """Dot products of the vectors, against another array element-wise or against the same vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec2iArray") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec2i") -> Self:
+        """Element-wise inplace division with the same vector for all elements."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec2iArray") -> "Vec2iArray":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec2i") -> "Vec2iArray":
+        """Element-wise division with the same vector for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec2iArray":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec2iArray") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec2i") -> Self:
+        """Element-wise inplace multiplication with the same vector for all elements."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec2iArray") -> "Vec2iArray":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec2i") -> "Vec2iArray":
+        """Element-wise multiplication with the same vector for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec2iArray":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec2iArray") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec2i") -> Self:
+        """Element-wise inplace subtraction with the same vector for all elements."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec2iArray") -> "Vec2iArray":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec2i") -> "Vec2iArray":
+        """Element-wise subtraction with the same vector for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec2iArray":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec2iArray") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec2i") -> Self:
+        """Element-wise inplace addition with the same vector for all elements."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec2iArray") -> "Vec2iArray":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: "Vec2i") -> "Vec2iArray":
+        """Element-wise addition with the same vector for all elements."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec2iArray":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def __neg__(self) -> "Vec2iArray":
+        """Return an array of the inverse vectors."""
+        ...
+    def __pos__(self) -> "Vec2iArray":
+        """Return a copy of this array."""
+        ...
+    def __bool__(self) -> "bool":
+        """If the array is not empty."""
+        ...
+    def is_close(self, other: "Vec2iArray", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if all the vectors of the two arrays are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec2iArray.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec2iArray.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create an empty array."""
+        ...
+    @overload
+    def __init__(self, size: int) -> None:
+        """Create an array of `size` zero vectors."""
+        ...
+    @overload
+    def __init__(self, other: "Vec2iArray") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, other: "Vec2Array") -> None:
+        """Convert an array of floating-point vectors to an array of integer vectors."""
+        ...
+    @overload
+    def __init__(self, vectors: Any) -> None:
+        """Create an array from an iterable of `Vec2i`s."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec2iArray_iterator:
+    """Internal iterator class for Vec2iArray."""
+
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "Vec2i": ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec3iArray:
+    """Contiguous array of 3D integer vectors."""
+
+    @property
+    def __array_interface__(self) -> "dict":
+        """The vectors as a C-contiguous (len, 3) array of native `long long` numbers, for numpy without copying."""
+        ...
+    @property
+    def length(self) -> "array":
+        """The (Euclidean) lengths of the vectors."""
+        ...
+    @property
+    def length_sqr(self) -> "array":
+        """The squared Euclidean lengths of the vectors."""
+        ...
+
+    def argmax_length(self) -> int:
+        """The index of the longest vector (the first one on ties)."""
+        ...
+    def argmin_length(self) -> int:
+        """The index of the shortest vector (the first one on ties)."""
+        ...
+    def bounds(self) -> "tuple[Vec3i, Vec3i]":
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        ...
+    def max(self) -> "Vec3i":
+        """The component-wise maximum of all the vectors."""
+        ...
+    def min(self) -> "Vec3i":
+        """The component-wise minimum of all the vectors."""
+        ...
+    def mean(self) -> "Vec3":
+        """The mean of all the vectors (the centroid)."""
+        ...
+    def sum(self) -> "Vec3i":
+        """The sum of all the vectors, the zero vector for an empty array."""
+        ...
+    def hash_many(self) -> "array":
+        """The hashes of all the vectors, same as `hash()` of each element but in one pass."""
+        ...
+    def nearest(self, points: "Vec3iArray", /) -> "tuple[array, array]":
+        """For every vector of this array, find the nearest vector of `points`.
+    
+        Returns the indices into `points` (the first one on ties) and the (Euclidean) distances, as two `array`s.
+        """
+        ...
+    def distance_matrix(self, other: "Vec3iArray", /, out: Any = None, squared: bool = False) -> Any:
+        """The (Euclidean) distances between every vector of this array (rows) and every vector of `other` (columns).
+    
+        The results are written to `out`, a contiguous (len(self), len(other)) float or double buffer (e.g. a numpy array),
+        and `out` is returned. If `out` is None, a new (len(self), len(other)) double `memoryview` is returned.
+        """
+        ...
+    def distance_sqr_to(self, other: Any, /) -> "array":
+        """The squared Euclidean distances to another array element-wise or to the same vector."""
+        ...
+    def distance_to(self, other: Any, /) -> "array":
+        """The (Euclidean) distances to another array element-wise or to the same vector."""
+        ...
+    def __or__(self, other: Any) -> "array":
+        """The (Euclidean) distances to another array element-wise or to the same vector."""
+        ...
+    def __dlpack_device__(self) -> "tuple[int, int]": ...
+    def __dlpack__(self, *, stream: Any = None, max_version: Any = None, dl_device: Any = None, copy: Any = None) -> Any:
+        """Export the vectors as a DLPack tensor, same layout as `__array_interface__`, copied only if `copy` is True."""
+        ...
+    @staticmethod
+    def from_buffer(data: Any, /) -> "Vec3iArray":
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, 3)), without copying.
+    
+        The buffer must be C-contiguous, of 3 native `long long` numbers per vector, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec3iArray":
+        """Create an array from a block written by `Vec3iArray.to_bytes()` or `Vec3i.pack_many()`."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """Pack the vectors into one block with a small header, the same as `Vec3i.pack_many()`."""
+        ...
+    def tolist(self) -> "list":
+        """Convert this array to a list of `Vec3i`s."""
+        ...
+    def __iter__(self) -> "_Vec3iArray_iterator":
+        """Create an iterator that yields copies of all the vectors of this array in sequence."""
+        ...
+    def __setitem__(self, key: int, value: "Vec3i") -> None:
+        """Set the n-th vector of this array."""
+        ...
+    def __getitem__(self, key: Any) -> Union["Vec3i", "Vec3iArray"]:
+        """Get a copy of the n-th vector, or a copy of a slice of this array."""
+        ...
+    def __len__(self) -> int:
+        """The number of vectors in this array."""
+        ...
+    @overload
+    def __xor__(self, other: "Vec3iArray") -> "Vec3iArray":
+        """Element-wise cross product."""
+        ...
+    @overload
+    def __xor__(self, other: "Vec3i") -> "Vec3iArray":
+        """Cross products with the same vector for all elements."""
+        ...
+    def __matmul__(self, other: Any) -> "array":
+        """Dot products of the vectors, against another array element-wise or against the same vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec3iArray") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec3i") -> Self:
+        """Element-wise inplace division with the same vector for all elements."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec3iArray") -> "Vec3iArray":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec3i") -> "Vec3iArray":
+        """Element-wise division with the same vector for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec3iArray":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec3iArray") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec3i") -> Self:
+        """Element-wise inplace multiplication with the same vector for all elements."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec3iArray") -> "Vec3iArray":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec3i") -> "Vec3iArray":
+        """Element-wise multiplication with the same vector for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec3iArray":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec3iArray") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec3i") -> Self:
+        """Element-wise inplace subtraction with the same vector for all elements."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec3iArray") -> "Vec3iArray":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec3i") -> "Vec3iArray":
+        """Element-wise subtraction with the same vector for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec3iArray":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec3iArray") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec3i") -> Self:
+        """Element-wise inplace addition with the same vector for all elements."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec3iArray") -> "Vec3iArray":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: "Vec3i") -> "Vec3iArray":
+        """Element-wise addition with the same vector for all elements."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec3iArray":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def __neg__(self) -> "Vec3iArray":
+        """Return an array of the inverse vectors."""
+        ...
+    def __pos__(self) -> "Vec3iArray":
+        """Return a copy of this array."""
+        ...
+    def __bool__(self) -> "bool":
+        """If the array is not empty."""
+        ...
+    def is_close(self, other: "Vec3iArray", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if all the vectors of the two arrays are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec3iArray.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec3iArray.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create an empty array."""
+        ...
+    @overload
+    def __init__(self, size: int) -> None:
+        """Create an array of `size` zero vectors."""
+        ...
+    @overload
+    def __init__(self, other: "Vec3iArray") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, other: "Vec3Array") -> None:
+        """Convert an array of floating-point vectors to an array of integer vectors."""
+        ...
+    @overload
+    def __init__(self, vectors: Any) -> None:
+        """Create an array from an iterable of `Vec3i`s."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec3iArray_iterator:
+    """Internal iterator class for Vec3iArray."""
+
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "Vec3i": ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class Vec4iArray:
+    """Contiguous array of 4D integer vectors."""
+
+    @property
+    def __array_interface__(self) -> "dict":
+        """The vectors as a C-contiguous (len, 4) array of native `long long` numbers, for numpy without copying."""
+        ...
+    @property
+    def length(self) -> "array":
+        """The (Euclidean) lengths of the vectors."""
+        ...
+    @property
+    def length_sqr(self) -> "array":
+        """The squared Euclidean lengths of the vectors."""
+        ...
+
+    def argmax_length(self) -> int:
+        """The index of the longest vector (the first one on ties)."""
+        ...
+    def argmin_length(self) -> int:
+        """The index of the shortest vector (the first one on ties)."""
+        ...
+    def bounds(self) -> "tuple[Vec4i, Vec4i]":
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        ...
+    def max(self) -> "Vec4i":
+        """The component-wise maximum of all the vectors."""
+        ...
+    def min(self) -> "Vec4i":
+        """The component-wise minimum of all the vectors."""
+        ...
+    def mean(self) -> "Vec4":
+        """The mean of all the vectors (the centroid)."""
+        ...
+    def sum(self) -> "Vec4i":
+        """The sum of all the vectors, the zero vector for an empty array."""
+        ...
+    def hash_many(self) -> "array":
+        """The hashes of all the vectors, same as `hash()` of each element but in one pass."""
+        ...
+    def nearest(self, points: "Vec4iArray", /) -> "tuple[array, array]":
+        """For every vector of this array, find the nearest vector of `points`.
+    
+        Returns the indices into `points` (the first one on ties) and the (Euclidean) distances, as two `array`s.
+        """
+        ...
+    def distance_matrix(self, other: "Vec4iArray", /, out: Any = None, squared: bool = False) -> Any:
+        """The (Euclidean) distances between every vector of this array (rows) and every vector of `other` (columns).
+    
+        The results are written to `out`, a contiguous (len(self), len(other)) float or double buffer (e.g. a numpy array),
+        and `out` is returned. If `out` is None, a new (len(self), len(other)) double `memoryview` is returned.
+        """
+        ...
+    def distance_sqr_to(self, other: Any, /) -> "array":
+        """The squared Euclidean distances to another array element-wise or to the same vector."""
+        ...
+    def distance_to(self, other: Any, /) -> "array":
+        """The (Euclidean) distances to another array element-wise or to the same vector."""
+        ...
+    def __or__(self, other: Any) -> "array":
+        """The (Euclidean) distances to another array element-wise or to the same vector."""
+        ...
+    def __dlpack_device__(self) -> "tuple[int, int]": ...
+    def __dlpack__(self, *, stream: Any = None, max_version: Any = None, dl_device: Any = None, copy: Any = None) -> Any:
+        """Export the vectors as a DLPack tensor, same layout as `__array_interface__`, copied only if `copy` is True."""
+        ...
+    @staticmethod
+    def from_buffer(data: Any, /) -> "Vec4iArray":
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, 4)), without copying.
+    
+        The buffer must be C-contiguous, of 4 native `long long` numbers per vector, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        ...
+    @staticmethod
+    def from_bytes(data: Any, /) -> "Vec4iArray":
+        """Create an array from a block written by `Vec4iArray.to_bytes()` or `Vec4i.pack_many()`."""
+        ...
+    def to_bytes(self) -> "bytes":
+        """Pack the vectors into one block with a small header, the same as `Vec4i.pack_many()`."""
+        ...
+    def tolist(self) -> "list":
+        """Convert this array to a list of `Vec4i`s."""
+        ...
+    def __iter__(self) -> "_Vec4iArray_iterator":
+        """Create an iterator that yields copies of all the vectors of this array in sequence."""
+        ...
+    def __setitem__(self, key: int, value: "Vec4i") -> None:
+        """Set the n-th vector of this array."""
+        ...
+    def __getitem__(self, key: Any) -> Union["Vec4i", "Vec4iArray"]:
+        """Get a copy of the n-th vector, or a copy of a slice of this array."""
+        ...
+    def __len__(self) -> int:
+        """The number of vectors in this array."""
+        ...
+    def __matmul__(self, other: Any) -> "array":
+        """Dot products of the vectors, against another array element-wise or against the same vector."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec4iArray") -> Self:
+        """Element-wise inplace division."""
+        ...
+    @overload
+    def __itruediv__(self, other: "Vec4i") -> Self:
+        """Element-wise inplace division with the same vector for all elements."""
+        ...
+    @overload
+    def __itruediv__(self, other: int) -> Self:
+        """Element-wise inplace division with the same number for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec4iArray") -> "Vec4iArray":
+        """Element-wise division."""
+        ...
+    @overload
+    def __truediv__(self, other: "Vec4i") -> "Vec4iArray":
+        """Element-wise division with the same vector for all elements."""
+        ...
+    @overload
+    def __truediv__(self, other: int) -> "Vec4iArray":
+        """Element-wise division with the same number for all elements."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec4iArray") -> Self:
+        """Element-wise inplace multiplication."""
+        ...
+    @overload
+    def __imul__(self, other: "Vec4i") -> Self:
+        """Element-wise inplace multiplication with the same vector for all elements."""
+        ...
+    @overload
+    def __imul__(self, other: int) -> Self:
+        """Element-wise inplace multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec4iArray") -> "Vec4iArray":
+        """Element-wise multiplication."""
+        ...
+    @overload
+    def __mul__(self, other: "Vec4i") -> "Vec4iArray":
+        """Element-wise multiplication with the same vector for all elements."""
+        ...
+    @overload
+    def __mul__(self, other: int) -> "Vec4iArray":
+        """Element-wise multiplication with the same number for all elements."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec4iArray") -> Self:
+        """Element-wise inplace subtraction."""
+        ...
+    @overload
+    def __isub__(self, other: "Vec4i") -> Self:
+        """Element-wise inplace subtraction with the same vector for all elements."""
+        ...
+    @overload
+    def __isub__(self, other: int) -> Self:
+        """Element-wise inplace subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec4iArray") -> "Vec4iArray":
+        """Element-wise subtraction."""
+        ...
+    @overload
+    def __sub__(self, other: "Vec4i") -> "Vec4iArray":
+        """Element-wise subtraction with the same vector for all elements."""
+        ...
+    @overload
+    def __sub__(self, other: int) -> "Vec4iArray":
+        """Element-wise subtraction with the same number for all elements."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec4iArray") -> Self:
+        """Element-wise inplace addition."""
+        ...
+    @overload
+    def __iadd__(self, other: "Vec4i") -> Self:
+        """Element-wise inplace addition with the same vector for all elements."""
+        ...
+    @overload
+    def __iadd__(self, other: int) -> Self:
+        """Element-wise inplace addition with the same number for all elements."""
+        ...
+    @overload
+    def __add__(self, other: "Vec4iArray") -> "Vec4iArray":
+        """Element-wise addition."""
+        ...
+    @overload
+    def __add__(self, other: "Vec4i") -> "Vec4iArray":
+        """Element-wise addition with the same vector for all elements."""
+        ...
+    @overload
+    def __add__(self, other: int) -> "Vec4iArray":
+        """Element-wise addition with the same number for all elements."""
+        ...
+    def __neg__(self) -> "Vec4iArray":
+        """Return an array of the inverse vectors."""
+        ...
+    def __pos__(self) -> "Vec4iArray":
+        """Return a copy of this array."""
+        ...
+    def __bool__(self) -> "bool":
+        """If the array is not empty."""
+        ...
+    def is_close(self, other: "Vec4iArray", /, rel_tol: (float | int) = 1e-09, abs_tol: (float | int) = 1e-15) -> "bool":
+        """Determine if all the vectors of the two arrays are close enough.
+    
+        See Also: `math.is_close()`
+        """
+        ...
+    def __ne__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec4iArray.is_close()`
+        """
+        ...
+    def __eq__(self, other: Any) -> "bool":
+        """Perform exact comparison.
+    
+        See Also: `Vec4iArray.is_close()`
+        """
+        ...
+    def __repr__(self) -> "str": ...
+    @overload
+    def __init__(self) -> None:
+        """Create an empty array."""
+        ...
+    @overload
+    def __init__(self, size: int) -> None:
+        """Create an array of `size` zero vectors."""
+        ...
+    @overload
+    def __init__(self, other: "Vec4iArray") -> None:
+        """Create a copy."""
+        ...
+    @overload
+    def __init__(self, other: "Vec4Array") -> None:
+        """Convert an array of floating-point vectors to an array of integer vectors."""
+        ...
+    @overload
+    def __init__(self, vectors: Any) -> None:
+        """Create an array from an iterable of `Vec4i`s."""
+        ...
+
+# noinspection SpellCheckingInspection,GrazieInspection
+class _Vec4iArray_iterator:
+    """Internal iterator class for Vec4iArray."""
+
+
+    def __length_hint__(self) -> int: ...
+    def __iter__(self) -> Self: ...
+    def __next__(self) -> "Vec4i": ...
+
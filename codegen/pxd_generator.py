@@ -0,0 +1,68 @@
+import regex
+
+
+def _declaration(signature: str) -> str:
+    """Turn the signature line of a cdef method into its declaration."""
+    signature = regex.sub(r"^(\s*cdef\s+)inline\s+", r"\1", signature)
+    signature = signature.rstrip()
+    assert signature.endswith(":"), signature
+    signature = signature[:-1].rstrip()
+    # Default values are only given in the implementation
+    return regex.sub(r"\s*=\s*[^,()]+(?=[,)])", "=*", signature)
+
+
+def gen_pxd(source: str) -> tuple[str, str]:
+    """Generate the declarations of the extension types in a generated module,
+    so that they can be cimported by the other modules.
+
+    Returns the pxd and the module source with the attribute declarations moved out to the pxd.
+    """
+    source_lines = []
+    cimports = []
+    classes = []
+    decorators = []
+    current_class = None
+
+    print("gen_pxd: reading source...")
+    for line in source.splitlines(keepends=False):
+        source_lines.append(line)
+        # Module level
+        if line and not line[0].isspace():
+            if m := regex.match(r"cdef\s+class\s+(?P<name>\w+)\s*:", line):
+                current_class = []
+                classes.append(current_class)
+                if "cython.final" in decorators:
+                    current_class.append("@cython.final")
+                current_class.append(f"cdef class {m.group('name')}:")
+            elif line.startswith("@"):
+                decorators.append(line[1:].strip())
+                continue
+            else:
+                current_class = None
+                if (
+                    regex.match(r"(?:from\s+\S+\s+)?cimport\s", line)
+                    and line not in cimports
+                ):
+                    cimports.append(line)
+            decorators.clear()
+        # Class attributes and cdef methods, skipping everything nested deeper
+        elif current_class is not None and regex.match(r" {4}cdef\s", line):
+            if "(" in line:
+                current_class.append(_declaration(line))
+            else:
+                current_class.append(line.rstrip())
+                source_lines.pop()
+
+    out_lines = [
+        "# Declarations of the extension types, generated from the module",
+        *cimports,
+        "",
+    ]
+    for cls in classes:
+        if len(cls) == (2 if cls[0].startswith("@") else 1):
+            cls.append("    pass")
+        out_lines.append("")
+        out_lines.extend(cls)
+    return "".join(f"{line}\n" for line in out_lines), "".join(
+        f"{line}\n" for line in source_lines
+    )
@@ -10,8 +10,10 @@ def convert_type(org: str) -> str:
         match raw:
             case "float" | "double" | "py_float":
                 types.append("(float | int)")
-            case "int" | "long" | "py_int":
+            case "int" | "long" | "py_int" | "Py_ssize_t":
                 types.append("int")
+            case "bint":
+                types.append("bool")
             case "None" | "void":
                 types.append("None")
             case "object":
@@ -163,6 +165,7 @@ class StubClass:
 
 def gen_stub(source: str) -> str:
     const_mapping = {}
+    imports = []
     decorators = []
     classes = []
     current_class = None
@@ -171,8 +174,9 @@ def gen_stub(source: str) -> str:
     docstring_dest: Optional[list[str]] = None
 
     def add_docstring_line(doc_line: str):
-        assert docstring_dest is not None
-        docstring_dest.append(doc_line[4:])  # remove one indent level
+        # Strings that don't follow a class or a method (e.g. verbatim C code) aren't docstrings
+        if docstring_dest is not None:
+            docstring_dest.append(doc_line[4:])  # remove one indent level
 
     print("gen_stub: reading source...")
     source_lines = source.splitlines(keepends=False)
@@ -228,7 +232,7 @@ def gen_stub(source: str) -> str:
                 r"(?P<name>\w+)\s*"
                 r"\(\s*"
                 r"(?:(?:self\s*)|(?&_param))?"
-                r"(?:,\s*(?P<_param>(?P<params>\w+\s+\w+(?:\s*=\s*[^,)]+)?)|(?P<params>/))\s*)*"
+                r"(?:,\s*(?P<_param>(?P<params>\w+\s+\w+(?:\s*=\s*[^,)]+)?)|(?P<params>[/*]))\s*)*"
                 r"\)\s*"
                 r"(?:->\s*(?P<return>[^:]+))?\s*"
                 r":",
@@ -238,6 +242,10 @@ def gen_stub(source: str) -> str:
             m = cdef_m or def_m
             is_cdef = cdef_m is not None
             name = m.group("name")
+            if name in ("__cinit__", "__dealloc__"):
+                docstring_dest = None
+                decorators.clear()
+                continue
 
             assert "classmethod" not in decorators
             # property getter
@@ -262,7 +270,7 @@ def gen_stub(source: str) -> str:
 
                 params = []
                 for param in m.captures("params"):
-                    if param == "/":
+                    if param in ("/", "*"):
                         params.append(param)
                         continue
                     if is_cdef:
@@ -300,6 +308,11 @@ def gen_stub(source: str) -> str:
         # Decorator
         elif m := regex.match(r"\s+@\s*(?P<decorator>\w[\w.]*)", line):
             decorators.append(m.group("decorator"))
+        # Classes of the other modules
+        elif m := regex.match(
+            r"from\s+(?P<module>spatium\.\w+)\s+cimport\s+(?P<names>.+)", line
+        ):
+            imports.append(f"from {m.group('module')} import {m.group('names')}")
         # DEF
         elif m := regex.match(r"DEF\s+(?P<name>\w+)\s*=\s*(?P<value>.+)", line):
             const_mapping[m.group("name")] = m.group("value")
@@ -313,7 +326,9 @@ def gen_stub(source: str) -> str:
 
     out_lines = [
         "# noinspection PyUnresolvedReferences",
-        "from typing import overload, Self, Any, Union",
+        "from typing import overload, Self, Any, Union, Iterator",
+        "from array import array",
+        *imports,
         "",
     ]
     for cls in classes:
@@ -324,6 +339,9 @@ def gen_stub(source: str) -> str:
 
 
 if __name__ == "__main__":
-    result = gen_stub(open("output/_spatium.pyx", encoding="utf8").read())
-    with open("output/_spatium.pyi", "w") as f:
+    import sys
+
+    module = sys.argv[1] if len(sys.argv) > 1 else "_vector"
+    result = gen_stub(open(f"output/{module}.pyx", encoding="utf8").read())
+    with open(f"output/{module}.pyi", "w") as f:
         f.write(result)
@@ -0,0 +1,11 @@
+#<TEMPLATE_BEGIN>
+# Types shared by the declarations of all modules
+
+ctypedef long long py_int
+ctypedef long double py_float
+
+ctypedef fused buffer_float:
+    float
+    double
+    py_float
+#<TEMPLATE_END>
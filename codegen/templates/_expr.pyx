@@ -0,0 +1,7 @@
+#<TEMPLATE_BEGIN>
+#<GEN>: step_generate("module_header.pyx")
+
+
+########## expr_vm.pyx ##########
+#<GEN>: step_generate("expr_vm.pyx")
+#<TEMPLATE_END>
@@ -0,0 +1,7 @@
+#<TEMPLATE_BEGIN>
+#<GEN>: step_generate("module_header.pyx")
+
+
+########## point_parsers.pyx ##########
+#<GEN>: step_generate("point_parsers.pyx")
+#<TEMPLATE_END>
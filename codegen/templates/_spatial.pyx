@@ -0,0 +1,38 @@
+#<TEMPLATE_BEGIN>
+#<GEN>: step_generate("module_header.pyx")
+from libc.math cimport sqrtl
+from spatium._vector cimport Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector cimport Vec2Array, Vec3Array, Vec4Array
+from spatium._vector_int cimport Vec2i, Vec3i, Vec4i, Vec2i32, Vec3i32, Vec4i32
+from spatium._vector_int cimport Vec2iArray, Vec3iArray, Vec4iArray
+from spatium._transform cimport Transform2D, Transform3D
+
+import os
+import mmap
+
+
+########## kdtree_class.pyx ##########
+#<GEN>: step_generate("kdtree_class.pyx", params={"Dims": 2}, _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("kdtree_class.pyx", params={"Dims": 3}, _globals=vector_codegen.get_globals(), overload=True)
+
+
+########## spatial_hash_class.pyx ##########
+#<GEN>: step_generate("spatial_hash_class.pyx", params={"Dims": 2}, _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("spatial_hash_class.pyx", params={"Dims": 3}, _globals=vector_codegen.get_globals(), overload=True)
+
+
+########## vec_store_class.pyx ##########
+#<GEN>: step_generate("vec_store_class.pyx", params={"Dims": 2}, _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("vec_store_class.pyx", params={"Dims": 3}, _globals=vector_codegen.get_globals(), overload=True)
+
+
+########## voxel_container_class.pyx ##########
+#<GEN>: step_generate("voxel_common.pyx")
+
+#<GEN>: step_generate("voxel_container_class.pyx", params={"ClassName": "VoxelMap", "IsMap": True}, overload=True)
+
+#<GEN>: step_generate("voxel_container_class.pyx", params={"ClassName": "VoxelSet", "IsMap": False}, overload=True)
+#<TEMPLATE_END>
@@ -0,0 +1,33 @@
+#<TEMPLATE_BEGIN>
+#<GEN>: step_generate("module_header.pyx")
+from spatium._vector cimport Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector cimport Vec2Array, Vec3Array, Vec4Array
+
+
+########## transform_2d.pyx ##########
+#<GEN>: step_generate("transform_2d.pyx", params=vector_codegen.transform_class_params(2, float), _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("transform_2d.pyx", params=vector_codegen.transform_class_params(2, vector_codegen.float64), _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("transform_2d.pyx", params=vector_codegen.transform_class_params(2, vector_codegen.float32), _globals=vector_codegen.get_globals(), overload=True)
+
+
+########## transform_3d.pyx ##########
+#<GEN>: step_generate("transform_3d.pyx", params=vector_codegen.transform_class_params(3, float), _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("transform_3d.pyx", params=vector_codegen.transform_class_params(3, vector_codegen.float64), _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("transform_3d.pyx", params=vector_codegen.transform_class_params(3, vector_codegen.float32), _globals=vector_codegen.get_globals(), overload=True)
+
+
+########## transform_array_class.pyx ##########
+#<GEN>: step_generate("transform_array_class.pyx", params={"Dims": 2, "Columns": 3, "Fields": 6}, _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("transform_array_class.pyx", params={"Dims": 3, "Columns": 4, "Fields": 12}, _globals=vector_codegen.get_globals(), overload=True)
+
+
+########## transform_hierarchy_class.pyx ##########
+#<GEN>: step_generate("transform_hierarchy_class.pyx", params={"Dims": 2, "Fields": 6}, _globals=vector_codegen.get_globals(), overload=True)
+
+#<GEN>: step_generate("transform_hierarchy_class.pyx", params={"Dims": 3, "Fields": 12}, _globals=vector_codegen.get_globals(), overload=True)
+#<TEMPLATE_END>
@@ -0,0 +1,7 @@
+#<TEMPLATE_BEGIN>
+#<GEN>: step_generate("module_header.pyx")
+
+
+########## vector.pyx ##########
+#<GEN>: step_generate("vector.pyx", _globals=vector_codegen.get_globals())
+#<TEMPLATE_END>
@@ -0,0 +1,10 @@
+#<TEMPLATE_BEGIN>
+#<GEN>: step_generate("module_header.pyx")
+from spatium._vector cimport Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector cimport Vec2Array, Vec3Array, Vec4Array
+from spatium._transform cimport Transform2D, Transform3D, Transform2Dd, Transform3Dd, Transform2Df, Transform3Df
+
+
+########## vector_int.pyx ##########
+#<GEN>: step_generate("vector_int.pyx", _globals=vector_codegen.get_globals())
+#<TEMPLATE_END>
@@ -0,0 +1,79 @@
+# Dummy types for the IDE
+cdef class _VecClassName_:
+    pass
+cdef class _VecClassName_Array:
+    pass
+ctypedef _vTypeC_
+
+#<TEMPLATE_BEGIN>
+#<OVERLOAD>
+cdef inline _VecClassName_Array ___OpName___(self, _VecClassName_Array other):
+    """Element-wise _OpReadableName_."""
+    self._check_size(other)
+    cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+    arr._alloc(self.size)
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(self.size * _Dims_):
+            arr.data[i] = self.data[i] _Op_ other.data[i]
+    return arr
+
+#<OVERLOAD>
+cdef inline _VecClassName_Array ___OpName___(self, _VecClassName_ other):
+    """Element-wise _OpReadableName_ with the same vector for all elements."""
+    cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+    arr._alloc(self.size)
+    #<GEN>: gen_for_each_dim("cdef _vTypeC_ o{dim} = other.{dim}", _Dims_)
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(0, self.size * _Dims_, _Dims_):
+            #<GEN>: gen_for_each_dim("arr.data[i + {index}] = self.data[i + {index}] _Op_ o{dim}", _Dims_)
+    return arr
+
+#<OVERLOAD>
+cdef inline _VecClassName_Array ___OpName___(self, _vTypeC_ other):
+    """Element-wise _OpReadableName_ with the same number for all elements."""
+    cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+    arr._alloc(self.size)
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(self.size * _Dims_):
+            arr.data[i] = self.data[i] _Op_ other
+    return arr
+
+#<OVERLOAD_DISPATCHER>:___OpName___
+
+#<OVERLOAD>
+cdef inline _VecClassName_Array __i_OpName___(self, _VecClassName_Array other):
+    #<RETURN_SELF>
+    """Element-wise inplace _OpReadableName_."""
+    self._check_size(other)
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(self.size * _Dims_):
+            self.data[i] _Op_= other.data[i]
+    return self
+
+#<OVERLOAD>
+cdef inline _VecClassName_Array __i_OpName___(self, _VecClassName_ other):
+    #<RETURN_SELF>
+    """Element-wise inplace _OpReadableName_ with the same vector for all elements."""
+    #<GEN>: gen_for_each_dim("cdef _vTypeC_ o{dim} = other.{dim}", _Dims_)
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(0, self.size * _Dims_, _Dims_):
+            #<GEN>: gen_for_each_dim("self.data[i + {index}] _Op_= o{dim}", _Dims_)
+    return self
+
+#<OVERLOAD>
+cdef inline _VecClassName_Array __i_OpName___(self, _vTypeC_ other):
+    #<RETURN_SELF>
+    """Element-wise inplace _OpReadableName_ with the same number for all elements."""
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(self.size * _Dims_):
+            self.data[i] _Op_= other
+    return self
+
+#<OVERLOAD_DISPATCHER>:__i_OpName___
+#<TEMPLATE_END>
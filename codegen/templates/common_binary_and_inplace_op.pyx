@@ -35,4 +35,18 @@ cdef inline _VecClassName_ __i_OpName___(self, _vTypeC_ other):
     return self
 
 #<OVERLOAD_DISPATCHER>:__i_OpName___
+
+#<OVERLOAD>
+cdef inline _VecClassName_ _OpName__into(self, _VecClassName_ other, _VecClassName_ out):
+    """Element-wise _OpReadableName_, written into `out` (which can be `self` or `other`) instead of a new vector."""
+    #<GEN>: gen_for_each_dim("out.{dim} = self.{dim} _Op_ other.{dim}", _Dims_)
+    return out
+
+#<OVERLOAD>
+cdef inline _VecClassName_ _OpName__into(self, _vTypeC_ other, _VecClassName_ out):
+    """Element-wise _OpReadableName_ with the same number for all elements, written into `out` (which can be `self`) instead of a new vector."""
+    #<GEN>: gen_for_each_dim("out.{dim} = self.{dim} _Op_ other", _Dims_)
+    return out
+
+#<OVERLOAD_DISPATCHER>:_OpName__into
 #<TEMPLATE_END>
\ No newline at end of file
@@ -0,0 +1,171 @@
+# Dummy types for the IDE
+ctypedef py_float
+ctypedef py_int
+
+#<TEMPLATE_BEGIN>
+from libc.math cimport sqrtl
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_C_CONTIGUOUS, PyBUF_WRITABLE
+
+# Number of elements processed by each instruction of an expression program at a time,
+# so that the registers stay in the cache no matter how many elements are evaluated
+DEF EXPR_BLOCK_SIZE = 256
+
+# Opcodes of the expression programs, keep in sync with `spatium/expr.py`
+cdef enum:
+    EXPR_LOAD = 0
+    EXPR_CONST = 1
+    EXPR_ADD = 2
+    EXPR_SUB = 3
+    EXPR_MUL = 4
+    EXPR_DIV = 5
+    EXPR_NEG = 6
+    EXPR_SQRT = 7
+    EXPR_MULADD = 8
+    EXPR_STORE = 9
+
+cdef struct ExprBuffer:
+    char* data
+    Py_ssize_t row_stride  # 0 for inputs broadcast to every element
+    Py_ssize_t itemsize
+    char format
+
+cdef inline void _expr_load(ExprBuffer* b, Py_ssize_t start, Py_ssize_t count, Py_ssize_t col, py_float* dst) noexcept nogil:
+    cdef char* p = b.data + start * b.row_stride + col * b.itemsize
+    cdef Py_ssize_t j
+    if b.format == b"g":
+        for j in range(count):
+            dst[j] = (<py_float*> (p + j * b.row_stride))[0]
+    elif b.format == b"d":
+        for j in range(count):
+            dst[j] = (<double*> (p + j * b.row_stride))[0]
+    elif b.format == b"f":
+        for j in range(count):
+            dst[j] = (<float*> (p + j * b.row_stride))[0]
+    elif b.format == b"q":
+        for j in range(count):
+            dst[j] = (<long long*> (p + j * b.row_stride))[0]
+    elif b.format == b"l":
+        for j in range(count):
+            dst[j] = (<long*> (p + j * b.row_stride))[0]
+    elif b.format == b"i":
+        for j in range(count):
+            dst[j] = (<int*> (p + j * b.row_stride))[0]
+
+cdef inline void _expr_store(ExprBuffer* b, Py_ssize_t start, Py_ssize_t count, Py_ssize_t col, py_float* src) noexcept nogil:
+    cdef char* p = b.data + start * b.row_stride + col * b.itemsize
+    cdef Py_ssize_t j
+    if b.format == b"g":
+        for j in range(count):
+            (<py_float*> (p + j * b.row_stride))[0] = src[j]
+    elif b.format == b"d":
+        for j in range(count):
+            (<double*> (p + j * b.row_stride))[0] = <double> src[j]
+    elif b.format == b"f":
+        for j in range(count):
+            (<float*> (p + j * b.row_stride))[0] = <float> src[j]
+    # Only integer expressions are stored into integer outputs, so the values are already integers
+    elif b.format == b"q":
+        for j in range(count):
+            (<long long*> (p + j * b.row_stride))[0] = <long long> src[j]
+    elif b.format == b"l":
+        for j in range(count):
+            (<long*> (p + j * b.row_stride))[0] = <long> src[j]
+    elif b.format == b"i":
+        for j in range(count):
+            (<int*> (p + j * b.row_stride))[0] = <int> src[j]
+
+cdef inline int _expr_get_buffer(object obj, Py_buffer* view, ExprBuffer* b, bint broadcast, bint writable) except -1:
+    PyObject_GetBuffer(obj, view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | (PyBUF_WRITABLE if writable else 0))
+    cdef str fmt = (<bytes> view.format).decode("ascii").lstrip("@=") if view.format != NULL else "B"
+    cdef Py_ssize_t itemsize = 0
+    if fmt == "g":
+        itemsize = sizeof(py_float)
+    elif fmt == "d":
+        itemsize = sizeof(double)
+    elif fmt == "f":
+        itemsize = sizeof(float)
+    elif fmt == "q":
+        itemsize = sizeof(long long)
+    elif fmt == "l":
+        itemsize = sizeof(long)
+    elif fmt == "i":
+        itemsize = sizeof(int)
+    if itemsize == 0 or itemsize != view.itemsize:
+        PyBuffer_Release(view)
+        raise TypeError(f"Unsupported {'output' if writable else 'input'} buffer format: {fmt!r}")
+    b.data = <char*> view.buf
+    b.itemsize = itemsize
+    b.format = ord(fmt)
+    b.row_stride = 0 if broadcast or view.ndim == 0 or view.shape[0] == 0 else view.len // view.shape[0]
+    return 0
+
+def _expr_eval(const int[::1] program, const double[::1] consts, list buffers, list broadcast, Py_ssize_t n, int registers) -> None:
+    # Run an expression program compiled by `spatium.expr` over `n` elements.
+    # Each instruction is (opcode, dst, a, b, c), the last buffer is the (writable) output.
+    cdef Py_ssize_t count = len(buffers)
+    cdef Py_buffer* views = <Py_buffer*> PyMem_Malloc(count * sizeof(Py_buffer))
+    cdef ExprBuffer* bufs = <ExprBuffer*> PyMem_Malloc(count * sizeof(ExprBuffer))
+    cdef py_float* regs = <py_float*> PyMem_Malloc(max(registers, 1) * EXPR_BLOCK_SIZE * sizeof(py_float))
+    cdef Py_ssize_t acquired = 0
+    cdef Py_ssize_t start, size, pc, j
+    cdef int op
+    cdef py_float value
+    cdef py_float* dst
+    cdef py_float* ra
+    cdef py_float* rb
+    cdef py_float* rc
+    cdef const int* prog = &program[0]
+    cdef Py_ssize_t length = program.shape[0]
+    try:
+        if views == NULL or bufs == NULL or regs == NULL:
+            raise MemoryError()
+        for acquired in range(count):
+            _expr_get_buffer(buffers[acquired], &views[acquired], &bufs[acquired], broadcast[acquired], acquired == count - 1)
+        acquired = count
+
+        with nogil:
+            for start in range(0, n, EXPR_BLOCK_SIZE):
+                size = min(EXPR_BLOCK_SIZE, n - start)
+                for pc in range(0, length, 5):
+                    op = prog[pc]
+                    dst = regs + prog[pc + 1] * EXPR_BLOCK_SIZE
+                    ra = regs + prog[pc + 2] * EXPR_BLOCK_SIZE
+                    rb = regs + prog[pc + 3] * EXPR_BLOCK_SIZE
+                    rc = regs + prog[pc + 4] * EXPR_BLOCK_SIZE
+                    if op == EXPR_LOAD:
+                        _expr_load(&bufs[prog[pc + 2]], start, size, prog[pc + 3], dst)
+                    elif op == EXPR_CONST:
+                        value = consts[prog[pc + 2]]
+                        for j in range(size):
+                            dst[j] = value
+                    elif op == EXPR_ADD:
+                        for j in range(size):
+                            dst[j] = ra[j] + rb[j]
+                    elif op == EXPR_SUB:
+                        for j in range(size):
+                            dst[j] = ra[j] - rb[j]
+                    elif op == EXPR_MUL:
+                        for j in range(size):
+                            dst[j] = ra[j] * rb[j]
+                    elif op == EXPR_DIV:
+                        for j in range(size):
+                            dst[j] = ra[j] / rb[j]
+                    elif op == EXPR_NEG:
+                        for j in range(size):
+                            dst[j] = -ra[j]
+                    elif op == EXPR_SQRT:
+                        for j in range(size):
+                            dst[j] = sqrtl(ra[j])
+                    elif op == EXPR_MULADD:
+                        for j in range(size):
+                            dst[j] = ra[j] * rb[j] + rc[j]
+                    elif op == EXPR_STORE:
+                        # dst is the register to store
+                        _expr_store(&bufs[prog[pc + 2]], start, size, prog[pc + 3], dst)
+    finally:
+        for j in range(acquired):
+            PyBuffer_Release(&views[j])
+        PyMem_Free(views)
+        PyMem_Free(bufs)
+        PyMem_Free(regs)
+#<TEMPLATE_END>
@@ -0,0 +1,303 @@
+cimport cython
+
+# Dummy types for the IDE
+ctypedef py_float
+ctypedef py_int
+cdef class Vec_Dims_:
+    pass
+cdef class Vec_Dims_Array:
+    pass
+
+DEF KDTREE_LEAF_SIZE = 0 # Dummy Value
+
+#<TEMPLATE_BEGIN>
+cdef struct _KDTree_Dims_DHeap:
+    # Max-heap of the k best (squared distance, row) pairs found so far
+    py_float* dist
+    Py_ssize_t* rows
+    Py_ssize_t size
+    Py_ssize_t k
+
+cdef inline void _kdtree_Dims_d_heap_sift_down(_KDTree_Dims_DHeap* heap, Py_ssize_t size) noexcept nogil:
+    # Restore the heap order of the first `size` entries after the root has been replaced
+    cdef py_float d = heap.dist[0]
+    cdef Py_ssize_t row = heap.rows[0]
+    cdef Py_ssize_t i = 0, child
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap.dist[child + 1] > heap.dist[child]:
+            child += 1
+        if heap.dist[child] <= d:
+            break
+        heap.dist[i], heap.rows[i] = heap.dist[child], heap.rows[child]
+        i = child
+    heap.dist[i], heap.rows[i] = d, row
+
+cdef inline void _kdtree_Dims_d_heap_push(_KDTree_Dims_DHeap* heap, py_float d, Py_ssize_t row) noexcept nogil:
+    cdef Py_ssize_t i
+    if heap.size < heap.k:
+        i = heap.size
+        heap.size += 1
+        while i > 0 and heap.dist[(i - 1) // 2] < d:
+            heap.dist[i], heap.rows[i] = heap.dist[(i - 1) // 2], heap.rows[(i - 1) // 2]
+            i = (i - 1) // 2
+        heap.dist[i], heap.rows[i] = d, row
+    elif d < heap.dist[0]:
+        heap.dist[0], heap.rows[0] = d, row
+        _kdtree_Dims_d_heap_sift_down(heap, heap.size)
+
+cdef inline void _kdtree_Dims_d_heap_sort(_KDTree_Dims_DHeap* heap) noexcept nogil:
+    # Sort the entries in ascending order of distance, the heap is no longer valid afterwards
+    cdef Py_ssize_t end
+    for end in range(heap.size - 1, 0, -1):
+        heap.dist[0], heap.dist[end] = heap.dist[end], heap.dist[0]
+        heap.rows[0], heap.rows[end] = heap.rows[end], heap.rows[0]
+        _kdtree_Dims_d_heap_sift_down(heap, end)
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class KDTree_Dims_D:
+    """A k-d tree over a set of `Vec_Dims_`s, for nearest neighbour and radius queries.
+
+    The points are copied when the tree is built, query results refer to them by their index in the original sequence.
+    """
+
+    cdef py_float* points
+    cdef Py_ssize_t* indices
+    cdef unsigned char* axes
+    cdef Py_ssize_t size
+
+
+    def __cinit__(self):
+        self.points = NULL
+        self.indices = NULL
+        self.axes = NULL
+        self.size = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.points)
+        PyMem_Free(self.indices)
+        PyMem_Free(self.axes)
+
+    def __init__(self, object points, /):
+        """Build a tree from a `Vec_Dims_Array` or an iterable of `Vec_Dims_`s."""
+        cdef Vec_Dims_Array arr = points if isinstance(points, Vec_Dims_Array) else Vec_Dims_Array(points)
+        self.points = <py_float*> PyMem_Malloc(arr.size * _Dims_ * sizeof(py_float))
+        self.indices = <Py_ssize_t*> PyMem_Malloc(arr.size * sizeof(Py_ssize_t))
+        self.axes = <unsigned char*> PyMem_Malloc(arr.size * sizeof(unsigned char))
+        if self.points == NULL or self.indices == NULL or self.axes == NULL:
+            raise MemoryError()
+        self.size = arr.size
+        memcpy(self.points, arr.data, arr.size * _Dims_ * sizeof(py_float))
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self.indices[i] = i
+            self._build(0, self.size)
+
+    cdef inline void _swap(self, Py_ssize_t a, Py_ssize_t b) noexcept nogil:
+        cdef py_float* p = self.points + a * _Dims_
+        cdef py_float* q = self.points + b * _Dims_
+        #<GEN>: gen_for_each_dim("p[{index}], q[{index}] = q[{index}], p[{index}]", _Dims_)
+        self.indices[a], self.indices[b] = self.indices[b], self.indices[a]
+
+    cdef inline void _select(self, Py_ssize_t lo, Py_ssize_t hi, Py_ssize_t k, int axis) noexcept nogil:
+        # Partially sort the rows [lo, hi] so that row k is the one it would be if they were sorted along the axis
+        cdef Py_ssize_t i, j
+        cdef py_float a, b, c, pivot
+        while lo < hi:
+            a = self.points[lo * _Dims_ + axis]
+            b = self.points[((lo + hi) // 2) * _Dims_ + axis]
+            c = self.points[hi * _Dims_ + axis]
+            pivot = max(min(a, b), min(max(a, b), c))
+            i, j = lo, hi
+            while i <= j:
+                while self.points[i * _Dims_ + axis] < pivot:
+                    i += 1
+                while self.points[j * _Dims_ + axis] > pivot:
+                    j -= 1
+                if i <= j:
+                    self._swap(i, j)
+                    i += 1
+                    j -= 1
+            if k <= j:
+                hi = j
+            elif k >= i:
+                lo = i
+            else:
+                break
+
+    cdef void _build(self, Py_ssize_t lo, Py_ssize_t hi) noexcept nogil:
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            return
+        # Split along the axis with the largest spread
+        cdef py_float[_Dims_] lows, highs
+        cdef Py_ssize_t i
+        cdef int d, axis = 0
+        for d in range(_Dims_):
+            lows[d] = highs[d] = self.points[lo * _Dims_ + d]
+        for i in range(lo + 1, hi):
+            for d in range(_Dims_):
+                lows[d] = min(lows[d], self.points[i * _Dims_ + d])
+                highs[d] = max(highs[d], self.points[i * _Dims_ + d])
+        for d in range(1, _Dims_):
+            if highs[d] - lows[d] > highs[axis] - lows[axis]:
+                axis = d
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        self._select(lo, hi - 1, mid, axis)
+        self.axes[mid] = axis
+        self._build(lo, mid)
+        self._build(mid + 1, hi)
+
+    cdef inline py_float _distance_sqr(self, const py_float* q, Py_ssize_t row) noexcept nogil:
+        cdef py_float* p = self.points + row * _Dims_
+        return #<GEN>: gen_for_each_dim("(p[{index}] - q[{index}]) * (p[{index}] - q[{index}])", _Dims_, join=" + ")
+
+    cdef void _knn(self, const py_float* q, Py_ssize_t lo, Py_ssize_t hi, _KDTree_Dims_DHeap* heap) noexcept nogil:
+        cdef Py_ssize_t i
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            for i in range(lo, hi):
+                _kdtree_Dims_d_heap_push(heap, self._distance_sqr(q, i), i)
+            return
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        cdef py_float diff = q[self.axes[mid]] - self.points[mid * _Dims_ + self.axes[mid]]
+        if diff < 0:
+            self._knn(q, lo, mid, heap)
+        else:
+            self._knn(q, mid + 1, hi, heap)
+        _kdtree_Dims_d_heap_push(heap, self._distance_sqr(q, mid), mid)
+        if heap.size < heap.k or diff * diff < heap.dist[0]:
+            if diff < 0:
+                self._knn(q, mid + 1, hi, heap)
+            else:
+                self._knn(q, lo, mid, heap)
+
+    cdef void _radius(self, const py_float* q, py_float radius_sqr, Py_ssize_t lo, Py_ssize_t hi, IndexList* rows) noexcept nogil:
+        cdef Py_ssize_t i
+        if hi - lo <= KDTREE_LEAF_SIZE:
+            for i in range(lo, hi):
+                if self._distance_sqr(q, i) <= radius_sqr:
+                    index_list_append(rows, i)
+            return
+        cdef Py_ssize_t mid = (lo + hi) // 2
+        cdef py_float diff = q[self.axes[mid]] - self.points[mid * _Dims_ + self.axes[mid]]
+        if diff <= 0 or diff * diff <= radius_sqr:
+            self._radius(q, radius_sqr, lo, mid, rows)
+        if self._distance_sqr(q, mid) <= radius_sqr:
+            index_list_append(rows, mid)
+        if diff >= 0 or diff * diff <= radius_sqr:
+            self._radius(q, radius_sqr, mid + 1, hi, rows)
+
+    cdef inline int _check_k(self, Py_ssize_t k) except -1:
+        if not 0 < k <= self.size:
+            raise ValueError(f"k must be between 1 and the number of points ({self.size}), got {k}")
+        return 0
+
+    cdef inline object _found_indices(self, IndexList* rows):
+        if rows.failed:
+            raise MemoryError()
+        cdef object result = new_scalar_array("q", rows.size)
+        cdef py_int[::1] out = result
+        cdef Py_ssize_t i
+        for i in range(rows.size):
+            out[i] = self.indices[rows.data[i]]
+        return result
+
+
+    def __len__(self) -> int:
+        """The number of points."""
+        return self.size
+
+    def query(self, Vec_Dims_ point, Py_ssize_t k = 1, /) -> tuple[array, array]:
+        """Find the k nearest points.
+
+        Returns their indices and (Euclidean) distances as two `array`s, in ascending order of distance.
+        """
+        self._check_k(k)
+        cdef py_float[_Dims_] q
+        #<GEN>: gen_for_each_dim("q[{index}] = point.{dim}", _Dims_)
+        cdef object indices = new_scalar_array("q", k)
+        cdef object distances = new_scalar_array("d", k)
+        cdef py_int[::1] out_i = indices
+        cdef double[::1] out_d = distances
+        cdef _KDTree_Dims_DHeap heap
+        heap.dist = <py_float*> PyMem_Malloc(k * sizeof(py_float))
+        heap.rows = <Py_ssize_t*> PyMem_Malloc(k * sizeof(Py_ssize_t))
+        heap.size, heap.k = 0, k
+        cdef Py_ssize_t i
+        try:
+            if heap.dist == NULL or heap.rows == NULL:
+                raise MemoryError()
+            with nogil:
+                self._knn(q, 0, self.size, &heap)
+                _kdtree_Dims_d_heap_sort(&heap)
+                for i in range(k):
+                    out_i[i] = self.indices[heap.rows[i]]
+                    out_d[i] = sqrtl(heap.dist[i])
+        finally:
+            PyMem_Free(heap.dist)
+            PyMem_Free(heap.rows)
+        return indices, distances
+
+    def query_many(self, Vec_Dims_Array points, Py_ssize_t k = 1, /) -> tuple[memoryview, memoryview]:
+        """Find the k nearest points for every vector of `points` in one pass.
+
+        Returns their indices and (Euclidean) distances as two (len(points), k) `memoryview`s,
+        every row is in ascending order of distance.
+        """
+        self._check_k(k)
+        cdef object indices = new_float_buffer("q", points.size, k)
+        cdef object distances = new_float_buffer("d", points.size, k)
+        cdef py_int[:, ::1] out_i = indices
+        cdef double[:, ::1] out_d = distances
+        cdef _KDTree_Dims_DHeap heap
+        heap.dist = <py_float*> PyMem_Malloc(k * sizeof(py_float))
+        heap.rows = <Py_ssize_t*> PyMem_Malloc(k * sizeof(Py_ssize_t))
+        cdef Py_ssize_t i, j
+        try:
+            if heap.dist == NULL or heap.rows == NULL:
+                raise MemoryError()
+            with nogil:
+                for i in range(points.size):
+                    heap.size, heap.k = 0, k
+                    self._knn(points.data + i * _Dims_, 0, self.size, &heap)
+                    _kdtree_Dims_d_heap_sort(&heap)
+                    for j in range(k):
+                        out_i[i, j] = self.indices[heap.rows[j]]
+                        out_d[i, j] = sqrtl(heap.dist[j])
+        finally:
+            PyMem_Free(heap.dist)
+            PyMem_Free(heap.rows)
+        return indices, distances
+
+    def query_radius(self, Vec_Dims_ point, py_float radius, /) -> array:
+        """Find the indices of all the points within `radius` (inclusive) of `point`, in no particular order."""
+        cdef py_float[_Dims_] q
+        #<GEN>: gen_for_each_dim("q[{index}] = point.{dim}", _Dims_)
+        cdef IndexList rows = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._radius(q, radius * radius, 0, self.size, &rows)
+            return self._found_indices(&rows)
+        finally:
+            PyMem_RawFree(rows.data)
+
+    def query_radius_many(self, Vec_Dims_Array points, py_float radius, /) -> list[array]:
+        """Find the indices of all the points within `radius` (inclusive) of every vector of `points`."""
+        cdef list results = []
+        cdef IndexList rows = IndexList(NULL, 0, 0, False)
+        cdef Py_ssize_t i
+        try:
+            for i in range(points.size):
+                rows.size = 0
+                with nogil:
+                    self._radius(points.data + i * _Dims_, radius * radius, 0, self.size, &rows)
+                results.append(self._found_indices(&rows))
+        finally:
+            PyMem_RawFree(rows.data)
+        return results
+#<TEMPLATE_END>
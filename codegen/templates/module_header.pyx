@@ -14,16 +14,4 @@ cimport cython
 
 ########## common_utils.pyx ##########
 #<GEN>: step_generate("common_utils.pyx")
-
-
-########## vector.pyx ##########
-#<GEN>: step_generate("vector.pyx", _globals=vector_codegen.get_globals())
-
-
-########## transform_2d.pyx ##########
-#<GEN>: step_generate("transform_2d.pyx", overload=True)
-
-
-########## transform_3d.pyx ##########
-#<GEN>: step_generate("transform_3d.pyx", overload=True)
-#<TEMPLATE_END>
\ No newline at end of file
+#<TEMPLATE_END>
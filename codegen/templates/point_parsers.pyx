@@ -0,0 +1,167 @@
+# Dummy types for the IDE
+ctypedef py_float
+ctypedef py_int
+
+#<TEMPLATE_BEGIN>
+from libc.stdlib cimport strtoll
+from libc cimport errno as c_errno
+
+cdef extern from *:
+    """
+    /* strtold() in the "C" locale, whatever LC_NUMERIC the host application set */
+    #include <locale.h>
+    #include <stdlib.h>
+    #if defined(_WIN32)
+    static _locale_t spatium_c_locale = NULL;
+    static void spatium_init_c_locale(void) { spatium_c_locale = _create_locale(LC_NUMERIC, "C"); }
+    static long double spatium_strtold_c(const char* s, char** end) {
+        return spatium_c_locale != NULL ? _strtold_l(s, end, spatium_c_locale) : strtold(s, end);
+    }
+    #else
+    #if defined(__APPLE__)
+    #include <xlocale.h>
+    #endif
+    static locale_t spatium_c_locale = (locale_t) 0;
+    static void spatium_init_c_locale(void) { spatium_c_locale = newlocale(LC_NUMERIC_MASK, "C", (locale_t) 0); }
+    static long double spatium_strtold_c(const char* s, char** end) {
+        return spatium_c_locale != (locale_t) 0 ? strtold_l(s, end, spatium_c_locale) : strtold(s, end);
+    }
+    #endif
+    """
+    void spatium_init_c_locale()
+    long double spatium_strtold_c(const char* s, char** end) noexcept nogil
+
+spatium_init_c_locale()
+
+ctypedef fused point_value:
+    py_int
+    py_float
+
+cdef inline bint _is_blank(unsigned char c) noexcept nogil:
+    return c == b" " or c == b"\t" or c == b"\r"
+
+def _parse_text(const unsigned char[::1] data, Py_ssize_t pos, point_value[:, ::1] out, Py_ssize_t row, const py_int[::1] field_dims, unsigned char delimiter, unsigned char comment, Py_ssize_t line) -> tuple[int, int, int]:
+    # Parse the lines of `data` from `pos` into the rows of `out` from `row`, until either of them runs out.
+    # `data` must end with a newline, fields are separated by `delimiter` or by blanks if it's 0,
+    # blank lines and lines starting with `comment` are skipped.
+    # The i-th field goes to the column `field_dims[i]` of `out`, or is skipped if it's -1, the ones after are ignored.
+    # Returns the new (pos, row, line).
+    cdef Py_ssize_t size = out.shape[0], fields = field_dims.shape[0], field
+    cdef py_int dim
+    cdef const char* start
+    cdef char* stop
+    cdef bint failed = False, out_of_range = False
+    with nogil:
+        while pos < data.shape[0] and row < size:
+            while _is_blank(data[pos]):
+                pos += 1
+            if data[pos] == b"\n" or (comment != 0 and data[pos] == comment):
+                while data[pos] != b"\n":
+                    pos += 1
+                pos += 1
+                line += 1
+                continue
+            for field in range(fields):
+                if field != 0:
+                    # Move on to the next field
+                    if delimiter == 0:
+                        if not _is_blank(data[pos]):
+                            failed = True
+                            break
+                        while _is_blank(data[pos]):
+                            pos += 1
+                    else:
+                        while _is_blank(data[pos]):
+                            pos += 1
+                        if data[pos] != delimiter:
+                            failed = True
+                            break
+                        pos += 1
+                        while _is_blank(data[pos]):
+                            pos += 1
+                dim = field_dims[field]
+                if dim < 0:
+                    while not (data[pos] == b"\n" or (data[pos] == delimiter if delimiter != 0 else _is_blank(data[pos]))):
+                        pos += 1
+                    continue
+                if data[pos] == b"\n" or data[pos] == delimiter:
+                    failed = True
+                    break
+                start = <const char*> &data[pos]
+                if point_value is py_float:
+                    out[row, dim] = spatium_strtold_c(start, &stop)
+                else:
+                    c_errno.errno = 0
+                    out[row, dim] = strtoll(start, &stop, 10)
+                    if c_errno.errno == c_errno.ERANGE:
+                        out_of_range = True
+                        break
+                if stop == start:
+                    failed = True
+                    break
+                pos += stop - start
+            if failed or out_of_range or not (data[pos] == b"\n" or data[pos] == delimiter or _is_blank(data[pos])):
+                failed = True
+                break
+            while data[pos] != b"\n":
+                pos += 1
+            pos += 1
+            line += 1
+            row += 1
+    if out_of_range:
+        raise ValueError(f"Integer out of range on line {line + 1}")
+    if failed:
+        raise ValueError(f"Invalid point data on line {line + 1}")
+    return pos, row, line
+
+
+cdef inline py_float _read_binary(const unsigned char* p, unsigned char kind, bint swap) noexcept nogil:
+    # Read a value of a `struct` format character from unaligned memory, swapping the bytes if `swap`
+    cdef unsigned char[8] b
+    cdef int i, n = 1 if kind == b"b" or kind == b"B" else 2 if kind == b"h" or kind == b"H" else 8 if kind == b"d" else 4
+    cdef signed char i8
+    cdef short i16
+    cdef unsigned short u16
+    cdef int i32
+    cdef unsigned int u32
+    cdef float f32
+    cdef double f64
+    for i in range(n):
+        b[i] = p[n - 1 - i] if swap else p[i]
+    if kind == b"b":
+        memcpy(&i8, b, 1)
+        return i8
+    elif kind == b"B":
+        return b[0]
+    elif kind == b"h":
+        memcpy(&i16, b, 2)
+        return i16
+    elif kind == b"H":
+        memcpy(&u16, b, 2)
+        return u16
+    elif kind == b"i":
+        memcpy(&i32, b, 4)
+        return i32
+    elif kind == b"I":
+        memcpy(&u32, b, 4)
+        return u32
+    elif kind == b"f":
+        memcpy(&f32, b, 4)
+        return f32
+    else:
+        memcpy(&f64, b, 8)
+        return f64
+
+def _parse_binary(const unsigned char[::1] data, Py_ssize_t pos, point_value[:, ::1] out, Py_ssize_t row, Py_ssize_t stride, const py_int[::1] offsets, const unsigned char[::1] kinds, bint swap) -> tuple[int, int]:
+    # Convert the fixed-size records of `data` from `pos` into the rows of `out` from `row`, until either of them runs out.
+    # Column d is read at `offsets[d]` in each record, as the `struct` format character `kinds[d]`.
+    # Returns the new (pos, row).
+    cdef Py_ssize_t count = min((data.shape[0] - pos) // stride, out.shape[0] - row), i, d
+    cdef const unsigned char* record
+    with nogil:
+        for i in range(count):
+            record = &data[pos + i * stride]
+            for d in range(out.shape[1]):
+                out[row + i, d] = <point_value> _read_binary(record + offsets[d], kinds[d], swap)
+    return pos + count * stride, row + count
+#<TEMPLATE_END>
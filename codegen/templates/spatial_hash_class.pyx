@@ -0,0 +1,341 @@
+cimport cython
+from libc.math cimport floorl
+
+# Dummy types for the IDE
+ctypedef py_float
+ctypedef py_int
+ctypedef uint64_t
+cdef class Vec_Dims_:
+    pass
+cdef class Vec_Dims_i:
+    pass
+
+#<TEMPLATE_BEGIN>
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class SpatialHash_Dims_D:
+    """A uniform grid of cells for broad-phase queries over moving `Vec_Dims_` positions.
+
+    Every inserted position gets an integer handle, which stays valid until it is removed (and may be reused after that).
+    Cells are keyed by their integer coordinates in an open addressing table, so queries never create vector objects.
+    """
+
+    # Cells: keys of `_Dims_` integers, the head of the list of the entries in each cell,
+    # -1 for a cell that has become empty and -2 for an unused slot
+    cdef py_int* cell_keys
+    cdef Py_ssize_t* cell_heads
+    cdef Py_ssize_t cell_capacity
+    cdef Py_ssize_t cell_used
+    # Entries: doubly linked lists per cell, removed entries are chained by `next` in the free list
+    cdef py_float* positions
+    cdef py_int* keys
+    cdef Py_ssize_t* next
+    cdef Py_ssize_t* prev
+    cdef unsigned char* alive
+    cdef Py_ssize_t capacity
+    cdef Py_ssize_t end
+    cdef Py_ssize_t count
+    cdef Py_ssize_t free_head
+    cdef py_float _cell_size
+
+
+    def __cinit__(self):
+        self.cell_keys = NULL
+        self.cell_heads = NULL
+        self.cell_capacity = self.cell_used = 0
+        self.positions = NULL
+        self.keys = NULL
+        self.next = self.prev = NULL
+        self.alive = NULL
+        self.capacity = self.end = self.count = 0
+        self.free_head = -1
+
+    def __dealloc__(self):
+        PyMem_Free(self.cell_keys)
+        PyMem_Free(self.cell_heads)
+        PyMem_Free(self.positions)
+        PyMem_Free(self.keys)
+        PyMem_Free(self.next)
+        PyMem_Free(self.prev)
+        PyMem_Free(self.alive)
+
+    def __init__(self, py_float cell_size, /):
+        """Create an empty spatial hash with cubic cells of the given size."""
+        if not cell_size > 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+        self._cell_size = cell_size
+        self._rehash(16)
+
+    @property
+    def cell_size(self) -> float:
+        """The edge length of the cells."""
+        return self._cell_size
+
+
+    cdef inline void _key_of(self, const py_float* position, py_int* key) noexcept nogil:
+        cdef int d
+        for d in range(_Dims_):
+            key[d] = <py_int> floorl(position[d] / self._cell_size)
+
+    cdef inline Py_ssize_t _probe(self, const py_int* key) noexcept nogil:
+        # The slot of the cell, or the unused slot where it would be inserted
+        cdef uint64_t h = 0
+        cdef int d
+        for d in range(_Dims_):
+            h = hash_combine(h, <uint64_t> key[d])
+        cdef Py_ssize_t mask = self.cell_capacity - 1
+        cdef Py_ssize_t slot = <Py_ssize_t> (h & <uint64_t> mask)
+        cdef py_int* k
+        while self.cell_heads[slot] != -2:
+            k = self.cell_keys + slot * _Dims_
+            if #<GEN>: gen_for_each_dim("k[{index}] == key[{index}]", _Dims_, join=" and ") + ":"
+                return slot
+            slot = (slot + 1) & mask
+        return slot
+
+    cdef int _rehash(self, Py_ssize_t capacity) except -1:
+        # Rebuild the cell table, dropping the cells that have become empty
+        cdef py_int* old_keys = self.cell_keys
+        cdef Py_ssize_t* old_heads = self.cell_heads
+        cdef Py_ssize_t old_capacity = self.cell_capacity
+        self.cell_keys = <py_int*> PyMem_Malloc(capacity * _Dims_ * sizeof(py_int))
+        self.cell_heads = <Py_ssize_t*> PyMem_Malloc(capacity * sizeof(Py_ssize_t))
+        if self.cell_keys == NULL or self.cell_heads == NULL:
+            PyMem_Free(self.cell_keys)
+            PyMem_Free(self.cell_heads)
+            self.cell_keys, self.cell_heads = old_keys, old_heads
+            raise MemoryError()
+        self.cell_capacity = capacity
+        self.cell_used = 0
+        cdef Py_ssize_t i, slot
+        for i in range(capacity):
+            self.cell_heads[i] = -2
+        for i in range(old_capacity):
+            if old_heads[i] >= 0:
+                slot = self._probe(old_keys + i * _Dims_)
+                memcpy(self.cell_keys + slot * _Dims_, old_keys + i * _Dims_, _Dims_ * sizeof(py_int))
+                self.cell_heads[slot] = old_heads[i]
+                self.cell_used += 1
+        PyMem_Free(old_keys)
+        PyMem_Free(old_heads)
+        return 0
+
+    cdef int _reserve(self) except -1:
+        # Make room for one more entry
+        if self.free_head >= 0 or self.end < self.capacity:
+            return 0
+        cdef Py_ssize_t capacity = max(16, self.capacity * 2)
+        cdef void* positions = PyMem_Realloc(self.positions, capacity * _Dims_ * sizeof(py_float))
+        if positions != NULL:
+            self.positions = <py_float*> positions
+        cdef void* keys = PyMem_Realloc(self.keys, capacity * _Dims_ * sizeof(py_int))
+        if keys != NULL:
+            self.keys = <py_int*> keys
+        cdef void* next = PyMem_Realloc(self.next, capacity * sizeof(Py_ssize_t))
+        if next != NULL:
+            self.next = <Py_ssize_t*> next
+        cdef void* prev = PyMem_Realloc(self.prev, capacity * sizeof(Py_ssize_t))
+        if prev != NULL:
+            self.prev = <Py_ssize_t*> prev
+        cdef void* alive = PyMem_Realloc(self.alive, capacity * sizeof(unsigned char))
+        if alive != NULL:
+            self.alive = <unsigned char*> alive
+        if positions == NULL or keys == NULL or next == NULL or prev == NULL or alive == NULL:
+            raise MemoryError()
+        self.capacity = capacity
+        return 0
+
+    cdef int _link(self, Py_ssize_t entry) except -1:
+        cdef py_int* key = self.keys + entry * _Dims_
+        cdef Py_ssize_t slot = self._probe(key)
+        if self.cell_heads[slot] == -2:
+            # Keep the table at most half full, counting the empty cells that are kept for probing
+            if (self.cell_used + 1) * 2 > self.cell_capacity:
+                self._rehash(max(16, self.cell_capacity * 2 if self.count * 4 > self.cell_capacity else self.cell_capacity))
+                slot = self._probe(key)
+            memcpy(self.cell_keys + slot * _Dims_, key, _Dims_ * sizeof(py_int))
+            self.cell_heads[slot] = -1
+            self.cell_used += 1
+        self.next[entry] = self.cell_heads[slot]
+        self.prev[entry] = -1
+        if self.next[entry] >= 0:
+            self.prev[self.next[entry]] = entry
+        self.cell_heads[slot] = entry
+        return 0
+
+    cdef inline void _unlink(self, Py_ssize_t entry) noexcept nogil:
+        if self.prev[entry] >= 0:
+            self.next[self.prev[entry]] = self.next[entry]
+        else:
+            self.cell_heads[self._probe(self.keys + entry * _Dims_)] = self.next[entry]
+        if self.next[entry] >= 0:
+            self.prev[self.next[entry]] = self.prev[entry]
+
+    cdef inline Py_ssize_t _entry(self, Py_ssize_t handle) except -1:
+        if not (0 <= handle < self.end and self.alive[handle]):
+            raise KeyError(handle)
+        return handle
+
+    cdef inline void _check(self, Py_ssize_t entry, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+        cdef py_float* p = self.positions + entry * _Dims_
+        cdef py_float dist
+        if center != NULL:
+            dist = #<GEN>: gen_for_each_dim("(p[{index}] - center[{index}]) * (p[{index}] - center[{index}])", _Dims_, join=" + ")
+            if dist <= radius_sqr:
+                index_list_append(found, entry)
+        elif #<GEN>: gen_for_each_dim("lo[{index}] <= p[{index}] <= hi[{index}]", _Dims_, join=" and ") + ":"
+            index_list_append(found, entry)
+
+    cdef inline void _collect(self, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+        # Entries inside the box [lo, hi], and also within the radius of the center if it's not NULL
+        cdef py_int[_Dims_] klo, khi, key
+        cdef Py_ssize_t slot, entry
+        cdef int d
+        cdef py_float cells = 1
+        self._key_of(lo, klo)
+        self._key_of(hi, khi)
+        for d in range(_Dims_):
+            if klo[d] > khi[d]:
+                return
+            cells *= <py_float> (khi[d] - klo[d] + 1)
+        if cells > self.count:
+            # Visiting the cells of a large range would be slower than checking every entry
+            for entry in range(self.end):
+                if self.alive[entry]:
+                    self._check(entry, lo, hi, center, radius_sqr, found)
+            return
+        memcpy(key, klo, _Dims_ * sizeof(py_int))
+        while True:
+            slot = self._probe(key)
+            entry = self.cell_heads[slot] if self.cell_heads[slot] != -2 else -1
+            while entry >= 0:
+                self._check(entry, lo, hi, center, radius_sqr, found)
+                entry = self.next[entry]
+            # Advance to the next cell of the range, like an odometer
+            d = 0
+            while d < _Dims_ and key[d] == khi[d]:
+                key[d] = klo[d]
+                d += 1
+            if d == _Dims_:
+                break
+            key[d] += 1
+
+    cdef inline object _found(self, IndexList* found):
+        if found.failed:
+            raise MemoryError()
+        cdef object result = new_scalar_array("q", found.size)
+        cdef py_int[::1] out = result
+        cdef Py_ssize_t i
+        for i in range(found.size):
+            out[i] = found.data[i]
+        return result
+
+
+    def insert(self, Vec_Dims_ position, /) -> int:
+        """Insert a position, return its handle."""
+        self._reserve()
+        cdef Py_ssize_t entry = self.free_head if self.free_head >= 0 else self.end
+        cdef Py_ssize_t free_next = self.next[entry] if self.free_head >= 0 else -1
+        cdef py_float* p = self.positions + entry * _Dims_
+        #<GEN>: gen_for_each_dim("p[{index}] = position.{dim}", _Dims_)
+        self._key_of(p, self.keys + entry * _Dims_)
+        self._link(entry)
+        if entry == self.end:
+            self.end += 1
+        else:
+            self.free_head = free_next
+        self.alive[entry] = True
+        self.count += 1
+        return entry
+
+    def move(self, Py_ssize_t handle, Vec_Dims_ position, /) -> None:
+        """Change the position of an entry, relinking it only if it changes cell."""
+        cdef Py_ssize_t entry = self._entry(handle)
+        cdef py_float* p = self.positions + entry * _Dims_
+        #<GEN>: gen_for_each_dim("p[{index}] = position.{dim}", _Dims_)
+        cdef py_int[_Dims_] key
+        self._key_of(p, key)
+        cdef py_int* old = self.keys + entry * _Dims_
+        if #<GEN>: gen_for_each_dim("key[{index}] == old[{index}]", _Dims_, join=" and ") + ":"
+            return
+        self._unlink(entry)
+        memcpy(old, key, _Dims_ * sizeof(py_int))
+        self._link(entry)
+
+    def remove(self, Py_ssize_t handle, /) -> None:
+        """Remove an entry, its handle may be reused by a later `insert()`."""
+        cdef Py_ssize_t entry = self._entry(handle)
+        self._unlink(entry)
+        self.alive[entry] = False
+        self.next[entry] = self.free_head
+        self.free_head = entry
+        self.count -= 1
+
+    def position(self, Py_ssize_t handle, /) -> Vec_Dims_:
+        """Get the position of an entry."""
+        cdef py_float* p = self.positions + self._entry(handle) * _Dims_
+        cdef Vec_Dims_ vec = Vec_Dims_.__new__(Vec_Dims_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = p[{index}]", _Dims_)
+        return vec
+
+    def cell_of(self, Vec_Dims_ position, /) -> Vec_Dims_i:
+        """The integer coordinates of the cell containing the position."""
+        cdef py_float[_Dims_] p
+        #<GEN>: gen_for_each_dim("p[{index}] = position.{dim}", _Dims_)
+        cdef py_int[_Dims_] key
+        self._key_of(p, key)
+        cdef Vec_Dims_i vec = Vec_Dims_i.__new__(Vec_Dims_i)
+        #<GEN>: gen_for_each_dim("vec.{dim} = key[{index}]", _Dims_)
+        return vec
+
+    def __len__(self) -> int:
+        """The number of entries."""
+        return self.count
+
+    def __contains__(self, Py_ssize_t handle) -> bool:
+        """If the handle refers to an entry."""
+        return 0 <= handle < self.end and self.alive[handle]
+
+    def query_radius(self, Vec_Dims_ center, py_float radius, /) -> array:
+        """The handles of all the entries within `radius` (inclusive) of `center`, in no particular order."""
+        cdef py_float[_Dims_] c, lo, hi
+        #<GEN>: gen_for_each_dim("c[{index}] = center.{dim}", _Dims_)
+        #<GEN>: gen_for_each_dim("lo[{index}] = center.{dim} - radius", _Dims_)
+        #<GEN>: gen_for_each_dim("hi[{index}] = center.{dim} + radius", _Dims_)
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._collect(lo, hi, c, radius * radius, &found)
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_box(self, Vec_Dims_ lo, Vec_Dims_ hi, /) -> array:
+        """The handles of all the entries inside the axis-aligned box between the `lo` and `hi` corners (inclusive)."""
+        cdef py_float[_Dims_] l, h
+        #<GEN>: gen_for_each_dim("l[{index}] = lo.{dim}", _Dims_)
+        #<GEN>: gen_for_each_dim("h[{index}] = hi.{dim}", _Dims_)
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            with nogil:
+                self._collect(l, h, NULL, 0, &found)
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_cell(self, Vec_Dims_i cell, /) -> array:
+        """The handles of all the entries in a cell."""
+        cdef py_int[_Dims_] key
+        #<GEN>: gen_for_each_dim("key[{index}] = cell.{dim}", _Dims_)
+        cdef Py_ssize_t slot = self._probe(key)
+        cdef Py_ssize_t entry = self.cell_heads[slot] if self.cell_heads[slot] != -2 else -1
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        try:
+            while entry >= 0:
+                index_list_append(&found, entry)
+                entry = self.next[entry]
+            return self._found(&found)
+        finally:
+            PyMem_RawFree(found.data)
+#<TEMPLATE_END>
@@ -0,0 +1,42 @@
+#<TEMPLATE_BEGIN>
+# Swizzle plans of `__getattr__`: the index of each picked element, 4 for a zero and 5 for a one
+cdef dict _swizzle_plans = {}
+
+# Get the plan of a swizzle pattern, or None if it isn't a valid swizzle for a vector of `dims` elements
+cdef bytes _get_swizzle_plan(str name, int dims):
+    cdef bytes plan = _swizzle_plans.get(name)
+    cdef bytearray indices
+    cdef const unsigned char* p
+    cdef Py_ssize_t n = len(name)
+    cdef Py_ssize_t i
+    cdef Py_UCS4 c
+    if plan is None:
+        if not 2 <= n <= 4:
+            return None
+        indices = bytearray(n)
+        for i in range(n):
+            c = name[i]
+            if c == "x":
+                indices[i] = 0
+            elif c == "y":
+                indices[i] = 1
+            elif c == "z":
+                indices[i] = 2
+            elif c == "w":
+                indices[i] = 3
+            elif c == "o":
+                indices[i] = 4
+            elif c == "l":
+                indices[i] = 5
+            else:
+                return None
+        if min(indices) >= 4:
+            return None
+        plan = bytes(indices)
+        _swizzle_plans[name] = plan
+    p = plan
+    for i in range(n):
+        if dims <= p[i] < 4:
+            return None
+    return plan
+#<TEMPLATE_END>
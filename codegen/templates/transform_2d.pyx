@@ -1,6 +1,9 @@
 cimport cython
 
 # Dummy types for the IDE
+ctypedef _TransformClassName_
+ctypedef _VecClassName_
+ctypedef _tTypeC_
 ctypedef py_float
 ctypedef py_int
 cdef class Vec2:
@@ -8,19 +11,22 @@ cdef class Vec2:
 
 
 #<TEMPLATE_BEGIN>
-from libc.math cimport atan2l, sinl, cosl, sqrtl, NAN
+from libc.math cimport atan2_MathSuffix_, sin_MathSuffix_, cos_MathSuffix_, sqrt_MathSuffix_, NAN
+
+cdef Py_ssize_t[2] __TransformClassName__buffer_shape = [3, 2]
+cdef Py_ssize_t[2] __TransformClassName__buffer_strides = [2 * sizeof(_tTypeC_), sizeof(_tTypeC_)]
 
 
 @cython.auto_pickle(True)
 @cython.freelist(1024)
 @cython.no_gc
 @cython.final
-cdef class Transform2D:
-    """2D linear transformation (2*3 matrix)."""
+cdef class _TransformClassName_:
+    """2D linear transformation (2*3 matrix)_PrecisionDoc_."""
 
-    cdef py_float xx, xy
-    cdef py_float yx, yy
-    cdef py_float ox, oy
+    cdef _tTypeC_ xx, xy
+    cdef _tTypeC_ yx, yy
+    cdef _tTypeC_ ox, oy
 
 
     cdef inline void identity(self) noexcept:
@@ -34,7 +40,7 @@ cdef class Transform2D:
         self.identity()
 
     #<OVERLOAD>
-    cdef inline void __init__(self, py_float xx, py_float xy, py_float yx, py_float yy, py_float ox, py_float oy) noexcept:
+    cdef inline void __init__(self, _tTypeC_ xx, _tTypeC_ xy, _tTypeC_ yx, _tTypeC_ yy, _tTypeC_ ox, _tTypeC_ oy) noexcept:
         """Create a transform from all the matrix elements."""
         self.xx = xx
         self.xy = xy
@@ -44,14 +50,14 @@ cdef class Transform2D:
         self.oy = oy
 
     #<OVERLOAD>
-    cdef inline void __init__(self, Vec2 x, Vec2 y, Vec2 origin) noexcept:
+    cdef inline void __init__(self, _VecClassName_ x, _VecClassName_ y, _VecClassName_ origin) noexcept:
         """Create a transform using two base vectors and the origin vector."""
         self.xx, self.xy = x.x, x.y
         self.yx, self.yy = y.x, y.y
         self.ox, self.oy = origin.x, origin.y
 
     #<OVERLOAD>
-    cdef inline void __init__(self, Transform2D transform) noexcept:
+    cdef inline void __init__(self, _TransformClassName_ transform) noexcept:
         """Create a copy."""
         self.xx = transform.xx
         self.xy = transform.xy
@@ -60,22 +66,24 @@ cdef class Transform2D:
         self.ox = transform.ox
         self.oy = transform.oy
 
+    #<GEN>: gen_transform_conversion_constructors(2, _vFamily_)
+
     #<OVERLOAD_DISPATCHER>:__init__
 
     @staticmethod
-    def translating(Vec2 translation, /) -> Transform2D:
+    def translating(_VecClassName_ translation, /) -> _TransformClassName_:
         """Create a translation transform."""
-        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.identity()
         t.ox, t.oy = translation.x, translation.y
         return t
 
     @staticmethod
-    def rotating(py_float rotation, /, Vec2 origin = None) -> Transform2D:
+    def rotating(_tTypeC_ rotation, /, _VecClassName_ origin = None) -> _TransformClassName_:
         """Create a rotation transform."""
-        cdef py_float c = cosl(rotation)
-        cdef py_float s = sinl(rotation)
-        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        cdef _tTypeC_ c = cos_MathSuffix_(rotation)
+        cdef _tTypeC_ s = sin_MathSuffix_(rotation)
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.xx = c
         t.xy = s
         t.yx = -s
@@ -85,23 +93,26 @@ cdef class Transform2D:
         return t
 
     @staticmethod
-    def scaling(Vec2 scale, /, Vec2 origin = None) -> Transform2D:
+    def scaling(_VecClassName_ scale, /, _VecClassName_ origin = None) -> _TransformClassName_:
         """Create a scale transform."""
-        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.xx = scale.x
         t.yy = scale.y
         if origin is not None:
             t.ox, t.oy = origin.x, origin.y
         return t
 
-    cdef inline Transform2D copy(self):
-        cdef Transform2D t = Transform2D.__new__(Transform2D)
+    cdef inline void _copy_to(self, _TransformClassName_ t) noexcept:
         t.xx = self.xx
         t.xy = self.xy
         t.yx = self.yx
         t.yy = self.yy
         t.ox = self.ox
         t.oy = self.oy
+
+    cdef inline _TransformClassName_ copy(self):
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
+        self._copy_to(t)
         return t
 
     def __repr__(self) -> str:
@@ -110,11 +121,11 @@ cdef class Transform2D:
     def __eq__(self, object other) -> bool:
         """Perform exact comparison.
 
-        See Also: `Transform2D.is_close()`
+        See Also: `_TransformClassName_.is_close()`
         """
-        if not isinstance(other, Transform2D):
+        if not isinstance(other, _TransformClassName_):
             return False
-        cdef Transform2D trans = <Transform2D> other
+        cdef _TransformClassName_ trans = <_TransformClassName_> other
         return self.xx == trans.xx and self.xy == trans.xy and\
                self.yx == trans.yx and self.yy == trans.yy and\
                self.ox == trans.ox and self.oy == trans.oy
@@ -122,16 +133,16 @@ cdef class Transform2D:
     def __ne__(self, object other) -> bool:
         """Perform exact comparison.
 
-        See Also: `Transform2D.is_close()`
+        See Also: `_TransformClassName_.is_close()`
         """
-        if not isinstance(other, Transform2D):
+        if not isinstance(other, _TransformClassName_):
             return True
-        cdef Transform2D trans = <Transform2D> other
+        cdef _TransformClassName_ trans = <_TransformClassName_> other
         return self.xx != trans.xx or self.xy != trans.xy or \
                self.yx != trans.yx or self.yy != trans.yy or \
                self.ox != trans.ox or self.oy != trans.oy
 
-    def is_close(self, Transform2D other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+    def is_close(self, _TransformClassName_ other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
         """Determine if the two transforms are close enough.
 
         See Also: `math.is_close()`
@@ -143,67 +154,66 @@ cdef class Transform2D:
                is_close(self.ox, other.ox, rel_tol, abs_tol) and \
                is_close(self.oy, other.oy, rel_tol, abs_tol)
 
-    #TODO: Better hashing
     def __hash__(self) -> py_int:
-        cdef py_int h = 0
-        h ^= bitcast_float(self.xx)
-        h ^= rotl_ratio(bitcast_float(self.xy), 1, 6)
-        h ^= rotl_ratio(bitcast_float(self.yx), 2, 6)
-        h ^= rotl_ratio(bitcast_float(self.yy), 3, 6)
-        h ^= rotl_ratio(bitcast_float(self.ox), 4, 6)
-        h ^= rotl_ratio(bitcast_float(self.oy), 5, 6)
-        return h
+        cdef uint64_t h = 6
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.ox))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oy))
+        return hash_finish(h)
 
     @property
-    def x(self) -> Vec2:
+    def x(self) -> _VecClassName_:
         """Base vector X."""
-        cdef Vec2 vec = Vec2.__new__(Vec2)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.xx
         vec.y = self.xy
         return vec
 
     @property
-    def y(self) -> Vec2:
+    def y(self) -> _VecClassName_:
         """Base vector Y."""
-        cdef Vec2 vec = Vec2.__new__(Vec2)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.yx
         vec.y = self.yy
         return vec
 
     @property
-    def origin(self) -> Vec2:
+    def origin(self) -> _VecClassName_:
         """Origin vector."""
-        cdef Vec2 vec = Vec2.__new__(Vec2)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.ox
         vec.y = self.oy
         return vec
 
     @x.setter
-    def x(self, Vec2 value) -> None:
+    def x(self, _VecClassName_ value) -> None:
         """Set the X base of the matrix."""
         self.xx = value.x
         self.xy = value.y
 
     @y.setter
-    def y(self, Vec2 value) -> None:
+    def y(self, _VecClassName_ value) -> None:
         """Set the Y base of the matrix."""
         self.yx = value.x
         self.yy = value.y
 
     @origin.setter
-    def origin(self, Vec2 value) -> None:
+    def origin(self, _VecClassName_ value) -> None:
         """Set the origin."""
         self.ox = value.x
         self.oy = value.y
 
-    def __getitem__(self, py_int item) -> Vec2:
+    def __getitem__(self, py_int item) -> _VecClassName_:
         """Get a column of the transformation matrix.
 
         0: Base vector X
         1: Base vector Y
         2: Origin vector
         """
-        cdef Vec2 vec = Vec2.__new__(Vec2)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
 
         if item == 0:
             vec.x = self.xx
@@ -219,7 +229,7 @@ cdef class Transform2D:
 
         return vec
 
-    def __setitem__(self, py_int key, Vec2 value) -> None:
+    def __setitem__(self, py_int key, _VecClassName_ value) -> None:
         """Set a column of the transformation matrix.
 
         0: Base vector X
@@ -240,46 +250,108 @@ cdef class Transform2D:
             raise IndexError(key)
 
     def __len__(self) -> py_int:
-        """The amount of columns. Is always 3 for `Transform2D`s."""
+        """The amount of columns. Is always 3 for `_TransformClassName_`s."""
         return 3
 
-    cdef inline py_float tdotx(self, py_float x, py_float y) noexcept:
+    # Expose the matrix as a writable 3*2 buffer (one row per column vector), without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.xx, sizeof(_tTypeC_), b"_tFormat_", 2, __TransformClassName__buffer_shape, __TransformClassName__buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        return PyBytes_FromStringAndSize(<char*> &self.xx, 6 * sizeof(_tTypeC_))
+
+    @staticmethod
+    def from_bytes(object data, /) -> _TransformClassName_:
+        """Create a transform from the bytes written by `_TransformClassName_.to_bytes()` (or any buffer of the same size)."""
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
+        read_bytes(data, &t.xx, 6 * sizeof(_tTypeC_))
+        return t
+
+    @staticmethod
+    def pack_many(object transforms, /) -> bytes:
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `_TransformClassName_.unpack_many()`
+        """
+        transforms = list(transforms)
+        cdef Py_ssize_t i, count = len(transforms)
+        cdef bytes block = new_pack_block(count, ord("_tFormat_"), sizeof(_tTypeC_), 6)
+        cdef _tTypeC_* p = <_tTypeC_*> pack_block_items(block)
+        cdef _TransformClassName_ t
+        for i in range(count):
+            t = <_TransformClassName_?> transforms[i]
+            memcpy(p + i * 6, &t.xx, 6 * sizeof(_tTypeC_))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[_TransformClassName_]:
+        """Read the transforms of a block written by `_TransformClassName_.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("_tFormat_"), sizeof(_tTypeC_), 6, &items)
+        cdef list result = []
+        cdef _TransformClassName_ t
+        try:
+            for i in range(count):
+                t = _TransformClassName_.__new__(_TransformClassName_)
+                memcpy(&t.xx, items + i * 6 * sizeof(_tTypeC_), 6 * sizeof(_tTypeC_))
+                result.append(t)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+
+    cdef inline _tTypeC_ tdotx(self, _tTypeC_ x, _tTypeC_ y) noexcept nogil:
         return x * self.xx + y * self.yx
 
-    cdef inline py_float mulx(self, py_float x, py_float y) noexcept:
+    cdef inline _tTypeC_ mulx(self, _tTypeC_ x, _tTypeC_ y) noexcept nogil:
         return self.tdotx(x, y) + self.ox
 
-    cdef inline py_float tdoty(self, py_float x, py_float y) noexcept:
+    cdef inline _tTypeC_ tdoty(self, _tTypeC_ x, _tTypeC_ y) noexcept nogil:
         return x * self.xy + y * self.yy
 
-    cdef inline py_float muly(self, py_float x, py_float y) noexcept:
+    cdef inline _tTypeC_ muly(self, _tTypeC_ x, _tTypeC_ y) noexcept nogil:
         return self.tdoty(x, y) + self.oy
 
-    def __mul__(self, Vec2 other) -> Vec2:
+    def __mul__(self, _VecClassName_ other) -> _VecClassName_:
         """Transform a copy of the vector.
 
-        See Also: `Vec2.__mul__()`
+        See Also: `_VecClassName_.__mul__()`
         """
-        cdef Vec2 vec = Vec2.__new__(Vec2)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.mulx(other.x, other.y)
         vec.y = self.muly(other.x, other.y)
         return vec
 
+    def __rmul__(self, _VecClassName_ other) -> _VecClassName_:
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+
+        See Also: `_VecClassName_.__mul__()`
+        """
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        cdef _tTypeC_ x = other.x - self.ox
+        cdef _tTypeC_ y = other.y - self.oy
+        vec.x = self.xx * x + self.xy * y
+        vec.y = self.yx * x + self.yy * y
+        return vec
+
     #<OVERLOAD>
-    cdef inline Vec2 __call__(self, Vec2 other):
+    cdef inline _VecClassName_ __call__(self, _VecClassName_ other):
         """Transform a copy of the vector.
         
-        See Also: `Vec2.__mul__()`
+        See Also: `_VecClassName_.__mul__()`
         """
-        cdef Vec2 vec = Vec2.__new__(Vec2)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.mulx(other.x, other.y)
         vec.y = self.muly(other.x, other.y)
         return vec
 
     #<OVERLOAD>
-    cdef inline Transform2D __call__(self, Transform2D other):
-        """Transform a copy of the passed in `Transform2D`."""
-        cdef Transform2D t = Transform2D.__new__(Transform2D)
+    cdef inline _TransformClassName_ __call__(self, _TransformClassName_ other):
+        """Transform a copy of the passed in `_TransformClassName_`."""
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.xx = self.tdotx(other.xx, other.xy)
         t.xy = self.tdoty(other.xx, other.xy)
         t.yx = self.tdotx(other.yx, other.yy)
@@ -290,9 +362,108 @@ cdef class Transform2D:
 
     #<OVERLOAD_DISPATCHER>:__call__
 
-    def __matmul__(self, Transform2D other) -> Transform2D:
-        """Transform a copy of the `Transform2D` on the right."""
-        cdef Transform2D t = Transform2D.__new__(Transform2D)
+    #<OVERLOAD>
+    cdef inline _VecClassName_ apply_into(self, _VecClassName_ other, _VecClassName_ out):
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+
+        See Also: `_TransformClassName_.__call__()`
+        """
+        cdef _tTypeC_ x = self.mulx(other.x, other.y)
+        cdef _tTypeC_ y = self.muly(other.x, other.y)
+        out.x = x
+        out.y = y
+        return out
+
+    #<OVERLOAD>
+    cdef inline _TransformClassName_ apply_into(self, _TransformClassName_ other, _TransformClassName_ out):
+        """Transform the passed in `_TransformClassName_`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        cdef _tTypeC_ xx = self.tdotx(other.xx, other.xy)
+        cdef _tTypeC_ xy = self.tdoty(other.xx, other.xy)
+        cdef _tTypeC_ yx = self.tdotx(other.yx, other.yy)
+        cdef _tTypeC_ yy = self.tdoty(other.yx, other.yy)
+        cdef _tTypeC_ ox = self.mulx(other.ox, other.oy)
+        cdef _tTypeC_ oy = self.muly(other.ox, other.oy)
+        out.xx = xx
+        out.xy = xy
+        out.yx = yx
+        out.yy = yy
+        out.ox = ox
+        out.oy = oy
+        return out
+
+    #<OVERLOAD_DISPATCHER>:apply_into
+
+    cdef inline int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1:
+        if src.shape[1] != 2 or out.shape[1] != 2:
+            raise ValueError(f"Expected buffers of shape (N, 2), got ({src.shape[0]}, {src.shape[1]}) and ({out.shape[0]}, {out.shape[1]})")
+        if out.shape[0] != src.shape[0]:
+            raise ValueError(f"Buffer size mismatch: {src.shape[0]} and {out.shape[0]}")
+        cdef Py_ssize_t i
+        cdef _tTypeC_ x, y
+        # The branch is taken once rather than for every vector
+        with nogil:
+            if inverse:
+                for i in range(src.shape[0]):
+                    x, y = src[i, 0], src[i, 1]
+                    x, y = x - self.ox, y - self.oy
+                    out[i, 0] = self.xx * x + self.xy * y
+                    out[i, 1] = self.yx * x + self.yy * y
+            else:
+                for i in range(src.shape[0]):
+                    x, y = src[i, 0], src[i, 1]
+                    out[i, 0] = self.mulx(x, y)
+                    out[i, 1] = self.muly(x, y)
+        return 0
+
+    cdef inline object _dispatch_many(self, object src, object out, bint inverse):
+        cdef str fmt = buffer_format(src)
+        if out is None:
+            out = Vec2Array(len(src)) if fmt == "g" else new_float_buffer(fmt, len(src), 2)
+        elif buffer_format(out) != fmt:
+            raise TypeError(f"Buffer format mismatch: {fmt} and {buffer_format(out)}")
+        cdef const float[:, ::1] src_f
+        cdef const double[:, ::1] src_d
+        cdef const py_float[:, ::1] src_g
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            src_f, out_f = src, out
+            self._apply_many(src_f, out_f, inverse)
+        elif fmt == "d":
+            src_d, out_d = src, out
+            self._apply_many(src_d, out_d, inverse)
+        elif fmt == "g":
+            src_g, out_g = src, out
+            self._apply_many(src_g, out_g, inverse)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def apply_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 2) float buffer (e.g. a `Vec2Array`) in one pass.
+
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec2Array` is created for long double buffers,
+        or a new (N, 2) memoryview of the same format for float and double buffers.
+
+        See Also: `_TransformClassName_.__call__()`
+        """
+        return self._dispatch_many(src, out, False)
+
+    def apply_inverse_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 2) float buffer using the *INVERSE* of the transform.
+
+        This is the batched version of `vector * transform`, see `_TransformClassName_.apply_many()` for the buffer semantics.
+
+        See Also: `_VecClassName_.__mul__()`
+        """
+        return self._dispatch_many(src, out, True)
+
+    #<OVERLOAD>
+    cdef inline _TransformClassName_ __matmul__(self, _TransformClassName_ other):
+        """Transform a copy of the `_TransformClassName_` on the right."""
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.xx = self.tdotx(other.xx, other.xy)
         t.xy = self.tdoty(other.xx, other.xy)
         t.yx = self.tdotx(other.yx, other.yy)
@@ -301,35 +472,47 @@ cdef class Transform2D:
         t.oy = self.muly(other.ox, other.oy)
         return t
 
-    def __imatmul__(self, Transform2D other) -> Transform2D:
-        #<RETURN_SELF>
-        """Transform this `Transform2D` inplace with the other `Transform2D`."""
-        cdef py_float xx = other.tdotx(self.xx, self.xy)
-        cdef py_float xy = other.tdoty(self.xx, self.xy)
-        cdef py_float yx = other.tdotx(self.yx, self.yy)
-        cdef py_float yy = other.tdoty(self.yx, self.yy)
-        cdef py_float ox = other.mulx(self.ox, self.oy)
-        cdef py_float oy = other.muly(self.ox, self.oy)
+    #<IF>: _HasArray_
+    #<OVERLOAD>
+    cdef inline Transform2DArray __matmul__(self, Transform2DArray other):
+        """Transform a copy of every transform of the `Transform2DArray` on the right (e.g. `parent @ children`)."""
+        return other._compose_left(self)
+    #<ENDIF>
+
+    #<OVERLOAD_DISPATCHER>:__matmul__
+
+    cdef inline void _transform_ip(self, _TransformClassName_ other) noexcept:
+        cdef _tTypeC_ xx = other.tdotx(self.xx, self.xy)
+        cdef _tTypeC_ xy = other.tdoty(self.xx, self.xy)
+        cdef _tTypeC_ yx = other.tdotx(self.yx, self.yy)
+        cdef _tTypeC_ yy = other.tdoty(self.yx, self.yy)
+        cdef _tTypeC_ ox = other.mulx(self.ox, self.oy)
+        cdef _tTypeC_ oy = other.muly(self.ox, self.oy)
         self.xx, self.xy = xx, xy
         self.yx, self.yy = yx, yy
         self.ox, self.oy = ox, oy
+
+    def __imatmul__(self, _TransformClassName_ other) -> _TransformClassName_:
+        #<RETURN_SELF>
+        """Transform this `_TransformClassName_` inplace with the other `_TransformClassName_`."""
+        self._transform_ip(other)
         return self
 
-    cdef inline py_float _determinant(self) noexcept:
+    cdef inline _tTypeC_ _determinant(self) noexcept:
         return self.xx * self.yy - self.xy * self.yx
 
     @property
-    def determinant(self) -> py_float:
+    def determinant(self) -> _tTypeC_:
         """Compute the determinant of the matrix."""
         return self._determinant()
 
-    def __invert__(self) -> Transform2D:
+    def __invert__(self) -> _TransformClassName_:
         """Get the invert transform.
 
-        See Also: `Vec2.__mul__()`
+        See Also: `_VecClassName_.__mul__()`
         """
-        cdef py_float i_det = 1.0 / self._determinant()
-        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        cdef _tTypeC_ i_det = 1.0 / self._determinant()
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.xx = self.yy * +i_det
         t.xy = self.xy * -i_det
         t.yx = self.yx * -i_det
@@ -339,14 +522,14 @@ cdef class Transform2D:
         return t
 
 
-    cdef inline py_float get_rotation(self) noexcept:
-        return atan2l(self.xy, self.xx)
+    cdef inline _tTypeC_ get_rotation(self) noexcept:
+        return atan2_MathSuffix_(self.xy, self.xx)
 
-    cdef inline void set_rotation(self, py_float rotation) noexcept:
-        cdef py_float scale_x = self.get_scale_x()
-        cdef py_float scale_y = self.get_scale_y()
-        cdef py_float c = cosl(rotation)
-        cdef py_float s = sinl(rotation)
+    cdef inline void set_rotation(self, _tTypeC_ rotation) noexcept:
+        cdef _tTypeC_ scale_x = self.get_scale_x()
+        cdef _tTypeC_ scale_y = self.get_scale_y()
+        cdef _tTypeC_ c = cos_MathSuffix_(rotation)
+        cdef _tTypeC_ s = sin_MathSuffix_(rotation)
         self.xx = c
         self.xy = s
         self.yx = -s
@@ -354,34 +537,34 @@ cdef class Transform2D:
         self.set_scale_x(scale_x)
         self.set_scale_y(scale_y)
 
-    cdef inline py_float get_scale_x(self) noexcept:
-        return sqrtl(self.xx * self.xx + self.xy * self.xy)
+    cdef inline _tTypeC_ get_scale_x(self) noexcept:
+        return sqrt_MathSuffix_(self.xx * self.xx + self.xy * self.xy)
 
-    cdef inline py_float get_scale_y(self) noexcept:
-        cdef py_float det = self._determinant()
-        cdef py_float det_sign = 1.0 if det > 0.0 else -1.0 if det < 0.0 else 0.0 if det == 0.0 else NAN
-        return sqrtl(self.yx * self.yx + self.yy * self.yy) * det_sign
+    cdef inline _tTypeC_ get_scale_y(self) noexcept:
+        cdef _tTypeC_ det = self._determinant()
+        cdef _tTypeC_ det_sign = 1.0 if det > 0.0 else -1.0 if det < 0.0 else 0.0 if det == 0.0 else NAN
+        return sqrt_MathSuffix_(self.yx * self.yx + self.yy * self.yy) * det_sign
 
-    cdef inline void set_scale_x(self, py_float value) noexcept:
-        cdef py_float m = value / sqrtl(self.xx * self.xx + self.xy * self.xy)
+    cdef inline void set_scale_x(self, _tTypeC_ value) noexcept:
+        cdef _tTypeC_ m = value / sqrt_MathSuffix_(self.xx * self.xx + self.xy * self.xy)
         self.xx *= m
         self.xy *= m
 
-    cdef inline void set_scale_y(self, py_float value) noexcept:
-        cdef py_float m = value / sqrtl(self.yx * self.yx + self.yy * self.yy)
+    cdef inline void set_scale_y(self, _tTypeC_ value) noexcept:
+        cdef _tTypeC_ m = value / sqrt_MathSuffix_(self.yx * self.yx + self.yy * self.yy)
         self.yx *= m
         self.yy *= m
 
     @property
-    def rotation(self) -> py_float:
+    def rotation(self) -> _tTypeC_:
         """Get the rotation angle this transform represents."""
         return self.get_rotation()
 
     @rotation.setter
-    def rotation(self, py_float value) -> None:
+    def rotation(self, _tTypeC_ value) -> None:
         """Set the rotation angle this transform represents.
 
-        See Also: `Transform2D.rotating()`
+        See Also: `_TransformClassName_.rotating()`
         """
         self.set_rotation(value)
 
@@ -391,62 +574,91 @@ cdef class Transform2D:
     #     proxy.transform = self
     #     return proxy
     @property
-    def scale(self) -> Vec2:
+    def scale(self) -> _VecClassName_:
         """Get the scaling transformation this transform represents."""
-        cdef Vec2 vec = Vec2.__new__(Vec2)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.get_scale_x()
         vec.y = self.get_scale_y()
         return vec
 
     @scale.setter
-    def scale(self, Vec2 value) -> None:
+    def scale(self, _VecClassName_ value) -> None:
         """Set the scaling transformation this transform represents.
 
-        See Also: `Transform2D.scaling()`
+        See Also: `_TransformClassName_.scaling()`
         """
         self.set_scale_x(value.x)
         self.set_scale_y(value.y)
 
 
-    def translate_ip(self, Vec2 translation, /) -> Transform2D:
-        #<RETURN_SELF>
-        """Apply translation to this transform inplace."""
+    cdef inline void _translate_ip(self, _VecClassName_ translation) noexcept:
         self.ox = translation.x
         self.oy = translation.y
+
+    def translate_ip(self, _VecClassName_ translation, /) -> _TransformClassName_:
+        #<RETURN_SELF>
+        """Apply translation to this transform inplace."""
+        self._translate_ip(translation)
         return self
 
-    def translated(self, Vec2 translation, /) -> Transform2D:
+    def translated(self, _VecClassName_ translation, /) -> _TransformClassName_:
         """Apply translation to a copy of this transform."""
-        cdef Transform2D t = self.copy()
+        cdef _TransformClassName_ t = self.copy()
         t.translate_ip(translation)
         return t
 
-    def rotate_ip(self, py_float rotation, /) -> Transform2D:
+    def translate_into(self, _VecClassName_ translation, _TransformClassName_ out, /) -> _TransformClassName_:
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._translate_ip(translation)
+        return out
+
+    cdef inline void _rotate_ip(self, _tTypeC_ rotation):
+        self._transform_ip(_TransformClassName_.rotating(rotation))
+
+    def rotate_ip(self, _tTypeC_ rotation, /) -> _TransformClassName_:
         #<RETURN_SELF>
         """Apply rotation to this transform inplace."""
-        self.__imatmul__(Transform2D.rotating(rotation))
+        self._rotate_ip(rotation)
         return self
 
-    def rotated(self, py_float rotation, /) -> Transform2D:
+    def rotated(self, _tTypeC_ rotation, /) -> _TransformClassName_:
         """Apply rotation to a copy of this transform."""
-        cdef Transform2D t = self.copy()
+        cdef _TransformClassName_ t = self.copy()
         t.rotate_ip(rotation)
         return t
 
-    def scale_ip(self, Vec2 scale, /) -> Transform2D:
-        #<RETURN_SELF>
-        """Apply scaling to this transform inplace."""
+    def rotate_into(self, _tTypeC_ rotation, _TransformClassName_ out, /) -> _TransformClassName_:
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._rotate_ip(rotation)
+        return out
+
+    cdef inline void _scale_ip(self, _VecClassName_ scale) noexcept:
         self.xx *= scale.x
         self.xy *= scale.y
         self.yx *= scale.x
         self.yy *= scale.y
         self.ox *= scale.x
         self.oy *= scale.y
+
+    def scale_ip(self, _VecClassName_ scale, /) -> _TransformClassName_:
+        #<RETURN_SELF>
+        """Apply scaling to this transform inplace."""
+        self._scale_ip(scale)
         return self
 
-    def scaled(self, Vec2 scale, /) -> Transform2D:
+    def scaled(self, _VecClassName_ scale, /) -> _TransformClassName_:
         """Apply scaling to a copy of this transform."""
-        cdef Transform2D t = self.copy()
+        cdef _TransformClassName_ t = self.copy()
         t.scale_ip(scale)
         return t
+
+    def scale_into(self, _VecClassName_ scale, _TransformClassName_ out, /) -> _TransformClassName_:
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._scale_ip(scale)
+        return out
+
+#<OVERLOAD_VECTORCALL>:__init__:_TransformClassName_
 #<TEMPLATE_END>
\ No newline at end of file
@@ -1,6 +1,9 @@
 cimport cython
 
 # Dummy types for the IDE
+ctypedef _TransformClassName_
+ctypedef _VecClassName_
+ctypedef _tTypeC_
 ctypedef py_float
 ctypedef py_int
 cdef class Vec3:
@@ -8,20 +11,23 @@ cdef class Vec3:
 
 
 #<TEMPLATE_BEGIN>
-from libc.math cimport sinl, cosl
+from libc.math cimport sin_MathSuffix_, cos_MathSuffix_
+
+cdef Py_ssize_t[2] __TransformClassName__buffer_shape = [4, 3]
+cdef Py_ssize_t[2] __TransformClassName__buffer_strides = [3 * sizeof(_tTypeC_), sizeof(_tTypeC_)]
 
 
 @cython.auto_pickle(True)
 @cython.freelist(1024)
 @cython.no_gc
 @cython.final
-cdef class Transform3D:
-    """3D linear transformation (3*4 matrix)."""
+cdef class _TransformClassName_:
+    """3D linear transformation (3*4 matrix)_PrecisionDoc_."""
 
-    cdef py_float xx, xy, xz
-    cdef py_float yx, yy, yz
-    cdef py_float zx, zy, zz
-    cdef py_float ox, oy, oz
+    cdef _tTypeC_ xx, xy, xz
+    cdef _tTypeC_ yx, yy, yz
+    cdef _tTypeC_ zx, zy, zz
+    cdef _tTypeC_ ox, oy, oz
 
 
     cdef inline void identity(self) noexcept:
@@ -36,7 +42,7 @@ cdef class Transform3D:
         self.identity()
 
     #<OVERLOAD>
-    cdef inline void __init__(self, py_float xx, py_float xy, py_float xz, py_float yx, py_float yy, py_float yz, py_float zx, py_float zy, py_float zz, py_float ox, py_float oy, py_float oz) noexcept:
+    cdef inline void __init__(self, _tTypeC_ xx, _tTypeC_ xy, _tTypeC_ xz, _tTypeC_ yx, _tTypeC_ yy, _tTypeC_ yz, _tTypeC_ zx, _tTypeC_ zy, _tTypeC_ zz, _tTypeC_ ox, _tTypeC_ oy, _tTypeC_ oz) noexcept:
         """Create a transform from all the matrix elements."""
         self.xx = xx
         self.xy = xy
@@ -52,7 +58,7 @@ cdef class Transform3D:
         self.oz = oz
 
     #<OVERLOAD>
-    cdef inline void __init__(self, Vec3 x, Vec3 y, Vec3 z, Vec3 origin) noexcept:
+    cdef inline void __init__(self, _VecClassName_ x, _VecClassName_ y, _VecClassName_ z, _VecClassName_ origin) noexcept:
         """Create a transform using three base vectors and the origin vector."""
         self.xx, self.xy, self.xz = x.x, x.y, x.z
         self.yx, self.yy, self.yz = y.x, y.y, y.z
@@ -60,7 +66,7 @@ cdef class Transform3D:
         self.ox, self.oy, self.oz = origin.x, origin.y, origin.z
 
     #<OVERLOAD>
-    cdef inline void __init__(self, Transform3D transform) noexcept:
+    cdef inline void __init__(self, _TransformClassName_ transform) noexcept:
         """Create a copy."""
         self.xx = transform.xx
         self.xy = transform.xy
@@ -75,12 +81,14 @@ cdef class Transform3D:
         self.oy = transform.oy
         self.oz = transform.oz
 
+    #<GEN>: gen_transform_conversion_constructors(3, _vFamily_)
+
     #<OVERLOAD_DISPATCHER>:__init__
 
     @staticmethod
-    def translating(Vec3 translation, /) -> Transform3D:
+    def translating(_VecClassName_ translation, /) -> _TransformClassName_:
         """Create a translation transform."""
-        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.identity()
         t.ox += translation.x
         t.oy += translation.y
@@ -88,20 +96,20 @@ cdef class Transform3D:
         return t
 
     @staticmethod
-    def rotating(Vec3 axis, py_float angle, /, Vec3 origin = None) -> Transform3D:
+    def rotating(_VecClassName_ axis, _tTypeC_ angle, /, _VecClassName_ origin = None) -> _TransformClassName_:
         """Create a rotation transform."""
-        cdef Transform3D trans = Transform3D.__new__(Transform3D)
+        cdef _TransformClassName_ trans = _TransformClassName_.__new__(_TransformClassName_)
 
-        cdef py_float axis_x_sq = axis.x * axis.x
-        cdef py_float axis_y_sq = axis.y * axis.y
-        cdef py_float axis_z_sq = axis.z * axis.z
-        cdef py_float c = cosl(angle)
+        cdef _tTypeC_ axis_x_sq = axis.x * axis.x
+        cdef _tTypeC_ axis_y_sq = axis.y * axis.y
+        cdef _tTypeC_ axis_z_sq = axis.z * axis.z
+        cdef _tTypeC_ c = cos_MathSuffix_(angle)
 
         trans.xx = axis_x_sq + c * (1.0 - axis_x_sq)
         trans.yy = axis_y_sq + c * (1.0 - axis_y_sq)
         trans.zz = axis_z_sq + c * (1.0 - axis_z_sq)
 
-        cdef py_float s = sinl(angle)
+        cdef _tTypeC_ s = sin_MathSuffix_(angle)
         cdef t = 1.0 - c
 
         cdef xyzt = axis.x * axis.y * t
@@ -127,9 +135,9 @@ cdef class Transform3D:
         return trans
 
     @staticmethod
-    def scaling(Vec3 scale, /, Vec3 origin = None) -> Transform3D:
+    def scaling(_VecClassName_ scale, /, _VecClassName_ origin = None) -> _TransformClassName_:
         """Create a scale transform."""
-        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.identity()
         t.xx = scale.x
         t.yy = scale.y
@@ -142,8 +150,7 @@ cdef class Transform3D:
 
         return t
 
-    cdef inline Transform3D copy(self):
-        cdef Transform3D t = Transform3D.__new__(Transform3D)
+    cdef inline void _copy_to(self, _TransformClassName_ t) noexcept:
         t.xx = self.xx
         t.xy = self.xy
         t.xz = self.xz
@@ -156,6 +163,10 @@ cdef class Transform3D:
         t.ox = self.ox
         t.oy = self.oy
         t.oz = self.oz
+
+    cdef inline _TransformClassName_ copy(self):
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
+        self._copy_to(t)
         return t
     
     def __repr__(self) -> str:
@@ -164,11 +175,11 @@ cdef class Transform3D:
     def __eq__(self, object other) -> bool:
         """Perform exact comparison.
 
-        See Also: `Transform3D.is_close()`
+        See Also: `_TransformClassName_.is_close()`
         """
-        if not isinstance(other, Transform3D):
+        if not isinstance(other, _TransformClassName_):
             return False
-        cdef Transform3D trans = <Transform3D> other
+        cdef _TransformClassName_ trans = <_TransformClassName_> other
         return self.xx == trans.xx and self.xy == trans.xy and self.xz == trans.xz and\
                self.yx == trans.yx and self.yy == trans.yy and self.yz == trans.yz and\
                self.zx == trans.zx and self.zy == trans.zy and self.zz == trans.zz and\
@@ -177,17 +188,17 @@ cdef class Transform3D:
     def __ne__(self, object other) -> bool:
         """Perform exact comparison.
 
-        See Also: `Transform3D.is_close()`
+        See Also: `_TransformClassName_.is_close()`
         """
-        if not isinstance(other, Transform3D):
+        if not isinstance(other, _TransformClassName_):
             return True
-        cdef Transform3D trans = <Transform3D> other
+        cdef _TransformClassName_ trans = <_TransformClassName_> other
         return self.xx != trans.xx or self.xy != trans.xy or self.xz != trans.xz or\
                self.yx != trans.yx or self.yy != trans.yy or self.yz != trans.yz or\
                self.zx != trans.zx or self.zy != trans.zy or self.zz != trans.zz or\
                self.ox != trans.ox or self.oy != trans.oy or self.oz != trans.oz
 
-    def is_close(self, Transform3D other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+    def is_close(self, _TransformClassName_ other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
         """Determine if the two transforms are close enough.
 
         See Also: `math.is_close()`
@@ -205,88 +216,87 @@ cdef class Transform3D:
                is_close(self.oy, other.oy, rel_tol, abs_tol) and \
                is_close(self.oz, other.oz, rel_tol, abs_tol)
 
-    #TODO: Better hashing
     def __hash__(self) -> py_int:
-        cdef py_int h = 0
-        h ^= bitcast_float(self.xx)
-        h ^= rotl_ratio(bitcast_float(self.xy), 1, 12)
-        h ^= rotl_ratio(bitcast_float(self.xz), 2, 12)
-        h ^= rotl_ratio(bitcast_float(self.yx), 3, 12)
-        h ^= rotl_ratio(bitcast_float(self.yy), 4, 12)
-        h ^= rotl_ratio(bitcast_float(self.yz), 5, 12)
-        h ^= rotl_ratio(bitcast_float(self.zx), 6, 12)
-        h ^= rotl_ratio(bitcast_float(self.zy), 7, 12)
-        h ^= rotl_ratio(bitcast_float(self.zz), 8, 12)
-        h ^= rotl_ratio(bitcast_float(self.ox), 9, 12)
-        h ^= rotl_ratio(bitcast_float(self.oy), 10, 12)
-        h ^= rotl_ratio(bitcast_float(self.oz), 11, 12)
-        return h
+        cdef uint64_t h = 12
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.ox))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oz))
+        return hash_finish(h)
 
     @property
-    def x(self) -> Vec3:
+    def x(self) -> _VecClassName_:
         """Base vector X."""
-        cdef Vec3 vec = Vec3.__new__(Vec3)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.xx
         vec.y = self.xy
         vec.z = self.xz
         return vec
 
     @property
-    def y(self) -> Vec3:
+    def y(self) -> _VecClassName_:
         """Base vector Y."""
-        cdef Vec3 vec = Vec3.__new__(Vec3)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.yx
         vec.y = self.yy
         vec.z = self.yz
         return vec
 
     @property
-    def z(self) -> Vec3:
+    def z(self) -> _VecClassName_:
         """Base vector Z."""
-        cdef Vec3 vec = Vec3.__new__(Vec3)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.zx
         vec.y = self.zy
         vec.z = self.zz
         return vec
 
     @property
-    def origin(self) -> Vec3:
+    def origin(self) -> _VecClassName_:
         """Origin vector."""
-        cdef Vec3 vec = Vec3.__new__(Vec3)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.ox
         vec.y = self.oy
         vec.z = self.oz
         return vec
 
     @x.setter
-    def x(self, Vec3 value) -> None:
+    def x(self, _VecClassName_ value) -> None:
         """Set the X base of the matrix."""
         self.xx = value.x
         self.xy = value.y
         self.xz = value.z
 
     @y.setter
-    def y(self, Vec3 value) -> None:
+    def y(self, _VecClassName_ value) -> None:
         """Set the Y base of the matrix."""
         self.yx = value.x
         self.yy = value.y
         self.yz = value.z
 
     @z.setter
-    def z(self, Vec3 value) -> None:
+    def z(self, _VecClassName_ value) -> None:
         """Set the Z base of the matrix."""
         self.zx = value.x
         self.zy = value.y
         self.zz = value.z
 
     @origin.setter
-    def origin(self, Vec3 value) -> None:
+    def origin(self, _VecClassName_ value) -> None:
         """Set the origin."""
         self.ox = value.x
         self.oy = value.y
         self.oz = value.z
 
-    def __getitem__(self, py_int item) -> Vec3:
+    def __getitem__(self, py_int item) -> _VecClassName_:
         """Get a column of the transformation matrix.
 
         0: Base vector X
@@ -294,7 +304,7 @@ cdef class Transform3D:
         2: Base vector Z
         3: Origin vector
         """
-        cdef vec = Vec3.__new__(Vec3)
+        cdef vec = _VecClassName_.__new__(_VecClassName_)
 
         if item == 0:
             vec.x = self.xx
@@ -317,7 +327,7 @@ cdef class Transform3D:
 
         return vec
 
-    def __setitem__(self, py_int key, Vec3 value) -> None:
+    def __setitem__(self, py_int key, _VecClassName_ value) -> None:
         """Set a column of the transformation matrix.
 
         0: Base vector X
@@ -345,54 +355,118 @@ cdef class Transform3D:
             raise IndexError(key)
 
     def __len__(self) -> py_int:
-        """The amount of columns. Is always 4 for `Transform3D`s."""
+        """The amount of columns. Is always 4 for `_TransformClassName_`s."""
         return 4
 
-    cdef inline py_float tdotx(self, py_float x, py_float y, py_float z) noexcept:
+    # Expose the matrix as a writable 4*3 buffer (one row per column vector), without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.xx, sizeof(_tTypeC_), b"_tFormat_", 2, __TransformClassName__buffer_shape, __TransformClassName__buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        return PyBytes_FromStringAndSize(<char*> &self.xx, 12 * sizeof(_tTypeC_))
+
+    @staticmethod
+    def from_bytes(object data, /) -> _TransformClassName_:
+        """Create a transform from the bytes written by `_TransformClassName_.to_bytes()` (or any buffer of the same size)."""
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
+        read_bytes(data, &t.xx, 12 * sizeof(_tTypeC_))
+        return t
+
+    @staticmethod
+    def pack_many(object transforms, /) -> bytes:
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `_TransformClassName_.unpack_many()`
+        """
+        transforms = list(transforms)
+        cdef Py_ssize_t i, count = len(transforms)
+        cdef bytes block = new_pack_block(count, ord("_tFormat_"), sizeof(_tTypeC_), 12)
+        cdef _tTypeC_* p = <_tTypeC_*> pack_block_items(block)
+        cdef _TransformClassName_ t
+        for i in range(count):
+            t = <_TransformClassName_?> transforms[i]
+            memcpy(p + i * 12, &t.xx, 12 * sizeof(_tTypeC_))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[_TransformClassName_]:
+        """Read the transforms of a block written by `_TransformClassName_.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("_tFormat_"), sizeof(_tTypeC_), 12, &items)
+        cdef list result = []
+        cdef _TransformClassName_ t
+        try:
+            for i in range(count):
+                t = _TransformClassName_.__new__(_TransformClassName_)
+                memcpy(&t.xx, items + i * 12 * sizeof(_tTypeC_), 12 * sizeof(_tTypeC_))
+                result.append(t)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+
+    cdef inline _tTypeC_ tdotx(self, _tTypeC_ x, _tTypeC_ y, _tTypeC_ z) noexcept nogil:
         return x * self.xx + y * self.yx + z * self.zx
 
-    cdef inline py_float mulx(self, py_float x, py_float y, py_float z) noexcept:
+    cdef inline _tTypeC_ mulx(self, _tTypeC_ x, _tTypeC_ y, _tTypeC_ z) noexcept nogil:
         return self.tdotx(x, y, z) + self.ox
 
-    cdef inline py_float tdoty(self, py_float x, py_float y, py_float z) noexcept:
+    cdef inline _tTypeC_ tdoty(self, _tTypeC_ x, _tTypeC_ y, _tTypeC_ z) noexcept nogil:
         return x * self.xy + y * self.yy + z * self.zy
 
-    cdef inline py_float muly(self, py_float x, py_float y, py_float z) noexcept:
+    cdef inline _tTypeC_ muly(self, _tTypeC_ x, _tTypeC_ y, _tTypeC_ z) noexcept nogil:
         return self.tdoty(x, y, z) + self.oy
 
-    cdef inline py_float tdotz(self, py_float x, py_float y, py_float z) noexcept:
+    cdef inline _tTypeC_ tdotz(self, _tTypeC_ x, _tTypeC_ y, _tTypeC_ z) noexcept nogil:
         return x * self.xz + y * self.yz + z * self.zz
 
-    cdef inline py_float mulz(self, py_float x, py_float y, py_float z) noexcept:
+    cdef inline _tTypeC_ mulz(self, _tTypeC_ x, _tTypeC_ y, _tTypeC_ z) noexcept nogil:
         return self.tdotz(x, y, z) + self.oz
 
-    def __mul__(self, Vec3 other) -> Vec3:
+    def __mul__(self, _VecClassName_ other) -> _VecClassName_:
         """Transform a copy of the vector.
 
-        See Also: `Vec3.__mul__()`
+        See Also: `_VecClassName_.__mul__()`
         """
-        cdef Vec3 vec = Vec3.__new__(Vec3)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.mulx(other.x, other.y, other.z)
         vec.y = self.muly(other.x, other.y, other.z)
         vec.z = self.mulz(other.x, other.y, other.z)
         return vec
 
+    def __rmul__(self, _VecClassName_ other) -> _VecClassName_:
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+
+        See Also: `_VecClassName_.__mul__()`
+        """
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        cdef _tTypeC_ x = other.x - self.ox
+        cdef _tTypeC_ y = other.y - self.oy
+        cdef _tTypeC_ z = other.z - self.oz
+        vec.x = self.xx * x + self.xy * y + self.xz * z
+        vec.y = self.yx * x + self.yy * y + self.yz * z
+        vec.z = self.zx * x + self.zy * y + self.zz * z
+        return vec
+
     #<OVERLOAD>
-    cdef inline Vec3 __call__(self, Vec3 other):
+    cdef inline _VecClassName_ __call__(self, _VecClassName_ other):
         """Transform a copy of the vector.
         
-        See Also: `Vec3.__mul__()`
+        See Also: `_VecClassName_.__mul__()`
         """
-        cdef Vec3 vec = Vec3.__new__(Vec3)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         vec.x = self.mulx(other.x, other.y, other.z)
         vec.y = self.muly(other.x, other.y, other.z)
         vec.z = self.mulz(other.x, other.y, other.z)
         return vec
 
     #<OVERLOAD>
-    cdef inline Transform3D __call__(self, Transform3D other):
-        """Transform a copy of the passed in `Transform3D`."""
-        cdef Transform3D t = Transform3D.__new__(Transform3D)
+    cdef inline _TransformClassName_ __call__(self, _TransformClassName_ other):
+        """Transform a copy of the passed in `_TransformClassName_`."""
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.xx = self.tdotx(other.xx, other.xy, other.xz)
         t.xy = self.tdoty(other.xx, other.xy, other.xz)
         t.xz = self.tdotz(other.xx, other.xy, other.xz)
@@ -409,9 +483,124 @@ cdef class Transform3D:
 
     #<OVERLOAD_DISPATCHER>:__call__
 
-    def __matmul__(self, Transform3D other) -> Transform3D:
-        """Transform a copy of the `Transform3D` on the right."""
-        cdef Transform3D t = Transform3D.__new__(Transform3D)
+    #<OVERLOAD>
+    cdef inline _VecClassName_ apply_into(self, _VecClassName_ other, _VecClassName_ out):
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+
+        See Also: `_TransformClassName_.__call__()`
+        """
+        cdef _tTypeC_ x = self.mulx(other.x, other.y, other.z)
+        cdef _tTypeC_ y = self.muly(other.x, other.y, other.z)
+        cdef _tTypeC_ z = self.mulz(other.x, other.y, other.z)
+        out.x = x
+        out.y = y
+        out.z = z
+        return out
+
+    #<OVERLOAD>
+    cdef inline _TransformClassName_ apply_into(self, _TransformClassName_ other, _TransformClassName_ out):
+        """Transform the passed in `_TransformClassName_`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        cdef _tTypeC_ xx = self.tdotx(other.xx, other.xy, other.xz)
+        cdef _tTypeC_ xy = self.tdoty(other.xx, other.xy, other.xz)
+        cdef _tTypeC_ xz = self.tdotz(other.xx, other.xy, other.xz)
+        cdef _tTypeC_ yx = self.tdotx(other.yx, other.yy, other.yz)
+        cdef _tTypeC_ yy = self.tdoty(other.yx, other.yy, other.yz)
+        cdef _tTypeC_ yz = self.tdotz(other.yx, other.yy, other.yz)
+        cdef _tTypeC_ zx = self.tdotx(other.zx, other.zy, other.zz)
+        cdef _tTypeC_ zy = self.tdoty(other.zx, other.zy, other.zz)
+        cdef _tTypeC_ zz = self.tdotz(other.zx, other.zy, other.zz)
+        cdef _tTypeC_ ox = self.mulx(other.ox, other.oy, other.oz)
+        cdef _tTypeC_ oy = self.muly(other.ox, other.oy, other.oz)
+        cdef _tTypeC_ oz = self.mulz(other.ox, other.oy, other.oz)
+        out.xx = xx
+        out.xy = xy
+        out.xz = xz
+        out.yx = yx
+        out.yy = yy
+        out.yz = yz
+        out.zx = zx
+        out.zy = zy
+        out.zz = zz
+        out.ox = ox
+        out.oy = oy
+        out.oz = oz
+        return out
+
+    #<OVERLOAD_DISPATCHER>:apply_into
+
+    cdef inline int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1:
+        if src.shape[1] != 3 or out.shape[1] != 3:
+            raise ValueError(f"Expected buffers of shape (N, 3), got ({src.shape[0]}, {src.shape[1]}) and ({out.shape[0]}, {out.shape[1]})")
+        if out.shape[0] != src.shape[0]:
+            raise ValueError(f"Buffer size mismatch: {src.shape[0]} and {out.shape[0]}")
+        cdef Py_ssize_t i
+        cdef _tTypeC_ x, y, z
+        # The branch is taken once rather than for every vector
+        with nogil:
+            if inverse:
+                for i in range(src.shape[0]):
+                    x, y, z = src[i, 0], src[i, 1], src[i, 2]
+                    x, y, z = x - self.ox, y - self.oy, z - self.oz
+                    out[i, 0] = self.xx * x + self.xy * y + self.xz * z
+                    out[i, 1] = self.yx * x + self.yy * y + self.yz * z
+                    out[i, 2] = self.zx * x + self.zy * y + self.zz * z
+            else:
+                for i in range(src.shape[0]):
+                    x, y, z = src[i, 0], src[i, 1], src[i, 2]
+                    out[i, 0] = self.mulx(x, y, z)
+                    out[i, 1] = self.muly(x, y, z)
+                    out[i, 2] = self.mulz(x, y, z)
+        return 0
+
+    cdef inline object _dispatch_many(self, object src, object out, bint inverse):
+        cdef str fmt = buffer_format(src)
+        if out is None:
+            out = Vec3Array(len(src)) if fmt == "g" else new_float_buffer(fmt, len(src), 3)
+        elif buffer_format(out) != fmt:
+            raise TypeError(f"Buffer format mismatch: {fmt} and {buffer_format(out)}")
+        cdef const float[:, ::1] src_f
+        cdef const double[:, ::1] src_d
+        cdef const py_float[:, ::1] src_g
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            src_f, out_f = src, out
+            self._apply_many(src_f, out_f, inverse)
+        elif fmt == "d":
+            src_d, out_d = src, out
+            self._apply_many(src_d, out_d, inverse)
+        elif fmt == "g":
+            src_g, out_g = src, out
+            self._apply_many(src_g, out_g, inverse)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def apply_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 3) float buffer (e.g. a `Vec3Array`) in one pass.
+
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec3Array` is created for long double buffers,
+        or a new (N, 3) memoryview of the same format for float and double buffers.
+
+        See Also: `_TransformClassName_.__call__()`
+        """
+        return self._dispatch_many(src, out, False)
+
+    def apply_inverse_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 3) float buffer using the *INVERSE* of the transform.
+
+        This is the batched version of `vector * transform`, see `_TransformClassName_.apply_many()` for the buffer semantics.
+
+        See Also: `_VecClassName_.__mul__()`
+        """
+        return self._dispatch_many(src, out, True)
+
+    #<OVERLOAD>
+    cdef inline _TransformClassName_ __matmul__(self, _TransformClassName_ other):
+        """Transform a copy of the `_TransformClassName_` on the right."""
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.xx = self.tdotx(other.xx, other.xy, other.xz)
         t.xy = self.tdoty(other.xx, other.xy, other.xz)
         t.xz = self.tdotz(other.xx, other.xy, other.xz)
@@ -426,49 +615,61 @@ cdef class Transform3D:
         t.oz = self.mulz(other.ox, other.oy, other.oz)
         return t
 
-    def __imatmul__(self, Transform3D other) -> Transform3D:
-        #<RETURN_SELF>
-        """Transform this `Transform3D` inplace with the other `Transform2D`."""
-        cdef py_float xx = other.tdotx(self.xx, self.xy, self.xz)
-        cdef py_float xy = other.tdoty(self.xx, self.xy, self.xz)
-        cdef py_float xz = other.tdotz(self.xx, self.xy, self.xz)
-        cdef py_float yx = other.tdotx(self.yx, self.yy, self.yz)
-        cdef py_float yy = other.tdoty(self.yx, self.yy, self.yz)
-        cdef py_float yz = other.tdotz(self.yx, self.yy, self.yz)
-        cdef py_float zx = other.tdotx(self.zx, self.zy, self.zz)
-        cdef py_float zy = other.tdoty(self.zx, self.zy, self.zz)
-        cdef py_float zz = other.tdotz(self.zx, self.zy, self.zz)
-        cdef py_float ox = other.mulx(self.ox, self.oy, self.oz)
-        cdef py_float oy = other.muly(self.ox, self.oy, self.oz)
-        cdef py_float oz = other.mulz(self.ox, self.oy, self.oz)
+    #<IF>: _HasArray_
+    #<OVERLOAD>
+    cdef inline Transform3DArray __matmul__(self, Transform3DArray other):
+        """Transform a copy of every transform of the `Transform3DArray` on the right (e.g. `parent @ children`)."""
+        return other._compose_left(self)
+    #<ENDIF>
+
+    #<OVERLOAD_DISPATCHER>:__matmul__
+
+    cdef inline void _transform_ip(self, _TransformClassName_ other) noexcept:
+        cdef _tTypeC_ xx = other.tdotx(self.xx, self.xy, self.xz)
+        cdef _tTypeC_ xy = other.tdoty(self.xx, self.xy, self.xz)
+        cdef _tTypeC_ xz = other.tdotz(self.xx, self.xy, self.xz)
+        cdef _tTypeC_ yx = other.tdotx(self.yx, self.yy, self.yz)
+        cdef _tTypeC_ yy = other.tdoty(self.yx, self.yy, self.yz)
+        cdef _tTypeC_ yz = other.tdotz(self.yx, self.yy, self.yz)
+        cdef _tTypeC_ zx = other.tdotx(self.zx, self.zy, self.zz)
+        cdef _tTypeC_ zy = other.tdoty(self.zx, self.zy, self.zz)
+        cdef _tTypeC_ zz = other.tdotz(self.zx, self.zy, self.zz)
+        cdef _tTypeC_ ox = other.mulx(self.ox, self.oy, self.oz)
+        cdef _tTypeC_ oy = other.muly(self.ox, self.oy, self.oz)
+        cdef _tTypeC_ oz = other.mulz(self.ox, self.oy, self.oz)
         self.xx, self.xy, self.xz = xx, xy, xz
         self.yx, self.yy, self.yz = yx, yy, yz
         self.zx, self.zy, self.zz = zx, zy, zz
         self.ox, self.oy, self.oz = ox, oy, oz
+
+    def __imatmul__(self, _TransformClassName_ other) -> _TransformClassName_:
+        #<RETURN_SELF>
+        """Transform this `_TransformClassName_` inplace with the other `_TransformClassName_`."""
+        self._transform_ip(other)
         return self
 
-    cdef inline py_float _determinant(self) noexcept:
+    cdef inline _tTypeC_ _determinant(self) noexcept:
         return (self.xx * (self.yy * self.zz - self.yz * self.zy) -
                 self.yx * (self.xy * self.zz - self.xz * self.zy) +
                 self.zx * (self.xy * self.yz - self.yy * self.xz))
 
     @property
-    def determinant(self) -> py_float:
+    def determinant(self) -> _tTypeC_:
         """Compute the determinant of the matrix."""
         return self._determinant()
 
-    def __invert__(self) -> Transform3D:
+    def __invert__(self) -> _TransformClassName_:
         """Get the invert transform.
 
-        See Also: `Vec3.__mul__()`
+        See Also: `_VecClassName_.__mul__()`
         """
-        cdef py_float cox = self.yy * self.zz - self.yz * self.zy
-        cdef py_float coy = self.xz * self.zy - self.xy * self.zz
-        cdef py_float coz = self.xy * self.yz - self.yy * self.xz
-        cdef py_float det = self.xx * cox + self.yx * coy + self.zx * coz
-        cdef py_float i_det = 1.0 / det
+        cdef _tTypeC_ cox = self.yy * self.zz - self.yz * self.zy
+        cdef _tTypeC_ coy = self.xz * self.zy - self.xy * self.zz
+        cdef _tTypeC_ coz = self.xy * self.yz - self.yy * self.xz
+        cdef _tTypeC_ det = self.xx * cox + self.yx * coy + self.zx * coz
+        cdef _tTypeC_ i_det = 1.0 / det
 
-        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        cdef _TransformClassName_ t = _TransformClassName_.__new__(_TransformClassName_)
         t.xx = cox * i_det
         t.xy = coy * i_det
         t.xz = coz * i_det
@@ -483,35 +684,51 @@ cdef class Transform3D:
         t.oz = -t.tdotz(self.ox, self.oy, self.oz)
         return t
 
-    def translate_ip(self, Vec3 translation, /) -> Transform3D:
-        #<RETURN_SELF>
-        """Apply translation to this transform inplace."""
+    cdef inline void _translate_ip(self, _VecClassName_ translation) noexcept:
         self.ox += translation.x
         self.oy += translation.y
         self.oz += translation.z
+
+    def translate_ip(self, _VecClassName_ translation, /) -> _TransformClassName_:
+        #<RETURN_SELF>
+        """Apply translation to this transform inplace."""
+        self._translate_ip(translation)
         return self
 
-    def translated(self, Vec3 translation, /) -> Transform3D:
+    def translated(self, _VecClassName_ translation, /) -> _TransformClassName_:
         """Apply translation to a copy of this transform."""
-        cdef Transform3D t = self.copy()
+        cdef _TransformClassName_ t = self.copy()
         t.translate_ip(translation)
         return t
 
-    def rotate_ip(self, Vec3 axis, py_float angle, /) -> Transform3D:
+    def translate_into(self, _VecClassName_ translation, _TransformClassName_ out, /) -> _TransformClassName_:
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._translate_ip(translation)
+        return out
+
+    cdef inline void _rotate_ip(self, _VecClassName_ axis, _tTypeC_ angle):
+        self._transform_ip(_TransformClassName_.rotating(axis, angle))
+
+    def rotate_ip(self, _VecClassName_ axis, _tTypeC_ angle, /) -> _TransformClassName_:
         #<RETURN_SELF>
         """Apply rotation to this transform inplace."""
-        self.__imatmul__(Transform3D.rotating(axis, angle))
+        self._rotate_ip(axis, angle)
         return self
 
-    def rotated(self, Vec3 axis, py_float angle, /) -> Transform3D:
+    def rotated(self, _VecClassName_ axis, _tTypeC_ angle, /) -> _TransformClassName_:
         """Apply rotation to a copy of this transform."""
-        cdef Transform3D t = self.copy()
+        cdef _TransformClassName_ t = self.copy()
         t.rotate_ip(axis, angle)
         return t
 
-    def scale_ip(self, Vec3 scale, /) -> Transform3D:
-        #<RETURN_SELF>
-        """Apply scaling to this transform inplace."""
+    def rotate_into(self, _VecClassName_ axis, _tTypeC_ angle, _TransformClassName_ out, /) -> _TransformClassName_:
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._rotate_ip(axis, angle)
+        return out
+
+    cdef inline void _scale_ip(self, _VecClassName_ scale) noexcept:
         self.xx *= scale.x
         self.yx *= scale.x
         self.zx *= scale.x
@@ -521,11 +738,24 @@ cdef class Transform3D:
         self.xz *= scale.z
         self.yz *= scale.z
         self.zz *= scale.z
+
+    def scale_ip(self, _VecClassName_ scale, /) -> _TransformClassName_:
+        #<RETURN_SELF>
+        """Apply scaling to this transform inplace."""
+        self._scale_ip(scale)
         return self
 
-    def scaled(self, Vec3 scale, /) -> Transform3D:
+    def scaled(self, _VecClassName_ scale, /) -> _TransformClassName_:
         """Apply scaling to a copy of this transform."""
-        cdef Transform3D t = self.copy()
+        cdef _TransformClassName_ t = self.copy()
         t.scale_ip(scale)
         return t
+
+    def scale_into(self, _VecClassName_ scale, _TransformClassName_ out, /) -> _TransformClassName_:
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._scale_ip(scale)
+        return out
+
+#<OVERLOAD_VECTORCALL>:__init__:_TransformClassName_
 #<TEMPLATE_END>
\ No newline at end of file
@@ -0,0 +1,539 @@
+cimport cython
+from libc.math cimport sinl, cosl
+
+# Dummy types for the IDE
+ctypedef py_float
+ctypedef py_int
+cdef class Vec_Dims_:
+    pass
+cdef class Vec_Dims_Array:
+    pass
+cdef class Transform_Dims_D:
+    pass
+
+DEF DEFAULT_RELATIVE_TOLERANCE = 0 # Dummy Value
+DEF DEFAULT_ABSOLUTE_TOLERANCE = 0 # Dummy Value
+
+#<TEMPLATE_BEGIN>
+cdef inline void transform_Dims_d_compose(const py_float* a, const py_float* b, py_float* out) noexcept nogil:
+    # out = a @ b, `out` may alias `a` or `b`
+    cdef py_float[_Fields_] r
+    cdef int c, j, k
+    for c in range(_Columns_):
+        for k in range(_Dims_):
+            r[c * _Dims_ + k] = a[_Dims_ * _Dims_ + k] if c == _Dims_ else 0.0
+            for j in range(_Dims_):
+                r[c * _Dims_ + k] += b[c * _Dims_ + j] * a[j * _Dims_ + k]
+    memcpy(out, r, _Fields_ * sizeof(py_float))
+
+cdef inline py_float transform_Dims_d_determinant(const py_float* t) noexcept nogil:
+    #<IF>: _Dims_ == 2
+    return t[0] * t[3] - t[1] * t[2]
+    #<ENDIF>
+    #<IF>: _Dims_ == 3
+    return (t[0] * (t[4] * t[8] - t[5] * t[7]) -
+            t[3] * (t[1] * t[8] - t[2] * t[7]) +
+            t[6] * (t[1] * t[5] - t[4] * t[2]))
+    #<ENDIF>
+
+cdef inline void transform_Dims_d_invert(const py_float* t, py_float* out) noexcept nogil:
+    # Same as `Transform_Dims_D.__invert__()`, `out` may alias `t`
+    cdef py_float[_Fields_] r
+    cdef py_float i_det = 1.0 / transform_Dims_d_determinant(t)
+    #<IF>: _Dims_ == 2
+    r[0] = t[3] * +i_det
+    r[1] = t[1] * -i_det
+    r[2] = t[2] * -i_det
+    r[3] = t[0] * +i_det
+    r[4] = -(t[4] * r[0] + t[5] * r[2])
+    r[5] = -(t[4] * r[1] + t[5] * r[3])
+    #<ENDIF>
+    #<IF>: _Dims_ == 3
+    r[0] = (t[4] * t[8] - t[5] * t[7]) * i_det
+    r[1] = (t[2] * t[7] - t[1] * t[8]) * i_det
+    r[2] = (t[1] * t[5] - t[4] * t[2]) * i_det
+    r[3] = (t[6] * t[5] - t[3] * t[8]) * i_det
+    r[4] = (t[0] * t[8] - t[6] * t[2]) * i_det
+    r[5] = (t[3] * t[2] - t[0] * t[5]) * i_det
+    r[6] = (t[3] * t[7] - t[6] * t[4]) * i_det
+    r[7] = (t[6] * t[1] - t[0] * t[7]) * i_det
+    r[8] = (t[0] * t[4] - t[3] * t[1]) * i_det
+    r[9] = -(t[9] * r[0] + t[10] * r[3] + t[11] * r[6])
+    r[10] = -(t[9] * r[1] + t[10] * r[4] + t[11] * r[7])
+    r[11] = -(t[9] * r[2] + t[10] * r[5] + t[11] * r[8])
+    #<ENDIF>
+    memcpy(out, r, _Fields_ * sizeof(py_float))
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Transform_Dims_DArray:
+    """Contiguous array of `Transform_Dims_D`s."""
+
+    cdef py_float* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[3] shape
+    cdef Py_ssize_t[3] strides
+    # The buffer of the transforms if they're borrowed by `from_buffer()`
+    cdef Py_buffer view
+    cdef bint is_view
+
+
+    def __cinit__(self):
+        self.data = NULL
+        self.size = 0
+        self.is_view = False
+
+    def __dealloc__(self):
+        if self.is_view:
+            PyBuffer_Release(&self.view)
+        else:
+            PyMem_Free(self.data)
+
+    cdef inline int _alloc(self, Py_ssize_t size) except -1:
+        if size < 0:
+            raise ValueError(f"Negative Transform_Dims_DArray size: {size}")
+        if size > PY_SSIZE_T_MAX // (_Fields_ * sizeof(py_float)):
+            raise MemoryError()
+        self.data = <py_float*> PyMem_Malloc(size * _Fields_ * sizeof(py_float))
+        if self.data == NULL:
+            raise MemoryError()
+        self._set_size(size)
+        return 0
+
+    cdef inline void _set_size(self, Py_ssize_t size) noexcept:
+        self.size = size
+        self.shape[0] = size
+        self.shape[1] = _Columns_
+        self.shape[2] = _Dims_
+        self.strides[0] = _Fields_ * sizeof(py_float)
+        self.strides[1] = _Dims_ * sizeof(py_float)
+        self.strides[2] = sizeof(py_float)
+
+    cdef inline int _check_size(self, Py_ssize_t size) except -1:
+        if size != self.size:
+            raise ValueError(f"Transform_Dims_DArray size mismatch: {self.size} and {size}")
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Transform_Dims_DArray index out of range: {index}")
+        return index
+
+    cdef inline Transform_Dims_D _get(self, Py_ssize_t index):
+        cdef Transform_Dims_D t = Transform_Dims_D.__new__(Transform_Dims_D)
+        memcpy(&t.xx, self.data + index * _Fields_, _Fields_ * sizeof(py_float))
+        return t
+
+    cdef inline void _set(self, Py_ssize_t index, Transform_Dims_D t) noexcept:
+        memcpy(self.data + index * _Fields_, &t.xx, _Fields_ * sizeof(py_float))
+
+    cdef inline Transform_Dims_DArray _new(self):
+        cdef Transform_Dims_DArray arr = Transform_Dims_DArray.__new__(Transform_Dims_DArray)
+        arr._alloc(self.size)
+        return arr
+
+    cdef inline Transform_Dims_DArray _copy(self):
+        cdef Transform_Dims_DArray arr = self._new()
+        memcpy(arr.data, self.data, self.size * _Fields_ * sizeof(py_float))
+        return arr
+
+
+    #<OVERLOAD>
+    cdef inline void __init__(self):
+        """Create an empty array."""
+        self._alloc(0)
+
+    #<OVERLOAD>
+    cdef inline void __init__(self, py_int size):
+        """Create an array of `size` identity transforms."""
+        self._alloc(size)
+        cdef Transform_Dims_D identity = Transform_Dims_D()
+        cdef Py_ssize_t i
+        for i in range(size):
+            self._set(i, identity)
+
+    #<OVERLOAD>
+    cdef inline void __init__(self, Transform_Dims_DArray other):
+        """Create a copy."""
+        self._alloc(other.size)
+        memcpy(self.data, other.data, other.size * _Fields_ * sizeof(py_float))
+
+    #<OVERLOAD>
+    cdef inline void __init__(self, object transforms):
+        """Create an array from an iterable of `Transform_Dims_D`s."""
+        transforms = tuple(transforms)
+        self._alloc(len(transforms))
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            self._set(i, <Transform_Dims_D?> transforms[i])
+
+    #<OVERLOAD_DISPATCHER>:__init__
+
+
+    def __repr__(self) -> str:
+        return f"Transform_Dims_DArray({self.size} transforms)"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform_Dims_DArray.is_close()`
+        """
+        if not isinstance(other, Transform_Dims_DArray):
+            return False
+        cdef Transform_Dims_DArray arr = <Transform_Dims_DArray> other
+        if arr.size != self.size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self.size * _Fields_):
+            if self.data[i] != arr.data[i]:
+                return False
+        return True
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform_Dims_DArray.is_close()`
+        """
+        return not self == other
+
+    def is_close(self, Transform_Dims_DArray other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if all the transforms of the two arrays are close enough.
+
+        See Also: `math.is_close()`
+        """
+        if other.size != self.size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self.size * _Fields_):
+            if not is_close(self.data[i], other.data[i], rel_tol, abs_tol):
+                return False
+        return True
+
+    def __bool__(self) -> bool:
+        """If the array is not empty."""
+        return self.size != 0
+
+    def __len__(self) -> int:
+        """The number of transforms in this array."""
+        return self.size
+
+    def __getitem__(self, object key) -> Transform_Dims_D | Transform_Dims_DArray:
+        """Get a copy of the n-th transform, or a copy of a slice of this array."""
+        if not isinstance(key, slice):
+            return self._get(self._index(key))
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        cdef Transform_Dims_DArray arr = Transform_Dims_DArray.__new__(Transform_Dims_DArray)
+        arr._alloc(len(range(start, stop, step)))
+        for i in range(arr.size):
+            memcpy(arr.data + i * _Fields_, self.data + (start + i * step) * _Fields_, _Fields_ * sizeof(py_float))
+        return arr
+
+    def __setitem__(self, Py_ssize_t key, Transform_Dims_D value) -> None:
+        """Set the n-th transform of this array."""
+        self._set(self._index(key), value)
+
+    def __iter__(self) -> _Transform_Dims_DArray_iterator:
+        """Create an iterator that yields copies of all the transforms of this array in sequence."""
+        cdef _Transform_Dims_DArray_iterator iterator = _Transform_Dims_DArray_iterator.__new__(_Transform_Dims_DArray_iterator)
+        iterator.array = self
+        return iterator
+
+    def tolist(self) -> list:
+        """Convert this array to a list of `Transform_Dims_D`s."""
+        return [self._get(i) for i in range(self.size)]
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, self.data, sizeof(py_float), b"g", 3, self.shape, self.strides)
+
+    def to_bytes(self) -> bytes:
+        """Pack the transforms into one block with a small header, the same as `Transform_Dims_D.pack_many()`."""
+        cdef bytes block = new_pack_block(self.size, ord("g"), sizeof(py_float), _Fields_)
+        memcpy(pack_block_items(block), self.data, self.size * _Fields_ * sizeof(py_float))
+        return block
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform_Dims_DArray:
+        """Create an array from a block written by `Transform_Dims_DArray.to_bytes()` or `Transform_Dims_D.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t count = open_pack_block(data, &view, ord("g"), sizeof(py_float), _Fields_, &items)
+        cdef Transform_Dims_DArray arr = Transform_Dims_DArray.__new__(Transform_Dims_DArray)
+        try:
+            arr._alloc(count)
+            memcpy(arr.data, items, count * _Fields_ * sizeof(py_float))
+        finally:
+            PyBuffer_Release(&view)
+        return arr
+
+    @staticmethod
+    def from_buffer(object data, /) -> Transform_Dims_DArray:
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, _Columns_, _Dims_)), without copying.
+
+        The buffer must be C-contiguous, of _Fields_ native `long double` numbers per transform, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        cdef Transform_Dims_DArray arr = Transform_Dims_DArray.__new__(Transform_Dims_DArray)
+        cdef Py_ssize_t count = open_item_buffer(data, &arr.view, ord("f"), sizeof(py_float), _Fields_)
+        arr.is_view = True
+        arr.data = <py_float*> arr.view.buf
+        arr._set_size(count)
+        return arr
+
+    @property
+    def __array_interface__(self) -> dict:
+        """The transforms as a C-contiguous (len, _Columns_, _Dims_) array of native `long double` numbers, for numpy without copying.
+
+        Each transform is its _Columns_ columns in order: the axes, then the origin.
+        """
+        return array_interface(self.data, ord("f"), sizeof(py_float), 3, self.shape)
+
+    def __dlpack__(self, *, object stream = None, object max_version = None, object dl_device = None, object copy = None) -> object:
+        """Export the transforms as a DLPack tensor, same layout as `__array_interface__`, copied if `copy` is True.
+
+        DLPack has no long double type, so unless it's the same as double they're exported as a copy of doubles,
+        which raises `BufferError` if `copy` is False.
+        """
+        return export_dlpack(self, self.data, ord("f"), sizeof(py_float), 3, self.shape, stream, max_version, dl_device, copy)
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        return dlpack_device()
+
+    def __reduce_ex__(self, protocol) -> tuple:
+        # The elements are pickled as one buffer, which protocol 5 can pass out-of-band without copying
+        if protocol >= 5:
+            from pickle import PickleBuffer
+            return _Transform_Dims_DArray_from_raw, (PickleBuffer(self),)
+        return _Transform_Dims_DArray_from_raw, (PyBytes_FromStringAndSize(<char*> self.data, self.size * _Fields_ * sizeof(py_float)),)
+
+
+    #<OVERLOAD>
+    cdef inline Transform_Dims_DArray __matmul__(self, Transform_Dims_DArray other):
+        """Compose the transforms element-wise, see `Transform_Dims_D.__matmul__()`."""
+        self._check_size(other.size)
+        cdef Transform_Dims_DArray arr = self._new()
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * _Fields_, _Fields_):
+                transform_Dims_d_compose(self.data + i, other.data + i, arr.data + i)
+        return arr
+
+    #<OVERLOAD>
+    cdef inline Transform_Dims_DArray __matmul__(self, Transform_Dims_D other):
+        """Compose every transform with the same `Transform_Dims_D` on the right."""
+        cdef Transform_Dims_DArray arr = self._new()
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * _Fields_, _Fields_):
+                transform_Dims_d_compose(self.data + i, t, arr.data + i)
+        return arr
+
+    #<OVERLOAD_DISPATCHER>:__matmul__
+
+    cdef inline Transform_Dims_DArray _compose_left(self, Transform_Dims_D other):
+        # Implementation of `Transform_Dims_D @ Transform_Dims_DArray`
+        cdef Transform_Dims_DArray arr = self._new()
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * _Fields_, _Fields_):
+                transform_Dims_d_compose(t, self.data + i, arr.data + i)
+        return arr
+
+    #<OVERLOAD>
+    cdef inline Transform_Dims_DArray __imatmul__(self, Transform_Dims_DArray other):
+        #<RETURN_SELF>
+        """Transform every transform inplace with the other transform at the same index, see `Transform_Dims_D.__imatmul__()`."""
+        self._check_size(other.size)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * _Fields_, _Fields_):
+                transform_Dims_d_compose(other.data + i, self.data + i, self.data + i)
+        return self
+
+    #<OVERLOAD>
+    cdef inline Transform_Dims_DArray __imatmul__(self, Transform_Dims_D other):
+        #<RETURN_SELF>
+        """Transform every transform inplace with the same `Transform_Dims_D`, see `Transform_Dims_D.__imatmul__()`."""
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * _Fields_, _Fields_):
+                transform_Dims_d_compose(t, self.data + i, self.data + i)
+        return self
+
+    #<OVERLOAD_DISPATCHER>:__imatmul__
+
+    @property
+    def determinant(self) -> array:
+        """Compute the determinants of the matrices."""
+        cdef object result = new_scalar_array("d", self.size)
+        cdef double[::1] out = result
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                out[i] = transform_Dims_d_determinant(self.data + i * _Fields_)
+        return result
+
+    def __invert__(self) -> Transform_Dims_DArray:
+        """Get the invert transforms.
+
+        See Also: `Transform_Dims_D.__invert__()`
+        """
+        cdef Transform_Dims_DArray arr = self._new()
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * _Fields_, _Fields_):
+                transform_Dims_d_invert(self.data + i, arr.data + i)
+        return arr
+
+    #<OVERLOAD>
+    cdef inline Transform_Dims_DArray translate_ip(self, Vec_Dims_ translation):
+        #<RETURN_SELF>
+        """Apply the same translation to all the transforms inplace, see `Transform_Dims_D.translate_ip()`."""
+        cdef py_float* o
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            o = self.data + i * _Fields_ + _Dims_ * _Dims_
+            #<IF>: _Dims_ == 2
+            o[0], o[1] = translation.x, translation.y
+            #<ENDIF>
+            #<IF>: _Dims_ == 3
+            o[0] += translation.x
+            o[1] += translation.y
+            o[2] += translation.z
+            #<ENDIF>
+        return self
+
+    #<OVERLOAD>
+    cdef inline Transform_Dims_DArray translate_ip(self, Vec_Dims_Array translations):
+        #<RETURN_SELF>
+        """Apply the translation at the same index to each transform inplace, see `Transform_Dims_D.translate_ip()`."""
+        self._check_size(translations.size)
+        cdef py_float* o
+        cdef py_float* v
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                o = self.data + i * _Fields_ + _Dims_ * _Dims_
+                v = translations.data + i * _Dims_
+                #<IF>: _Dims_ == 2
+                o[0], o[1] = v[0], v[1]
+                #<ENDIF>
+                #<IF>: _Dims_ == 3
+                o[0] += v[0]
+                o[1] += v[1]
+                o[2] += v[2]
+                #<ENDIF>
+        return self
+
+    #<OVERLOAD_DISPATCHER>:translate_ip
+
+    def translated(self, object translation, /) -> Transform_Dims_DArray:
+        """Apply translation to a copy of this array, see `Transform_Dims_DArray.translate_ip()`."""
+        return self._copy().translate_ip(translation)
+
+    #<IF>: _Dims_ == 2
+    def rotate_ip(self, py_float rotation, /) -> Transform_Dims_DArray:
+        #<RETURN_SELF>
+        """Apply the same rotation to all the transforms inplace, see `Transform_Dims_D.rotate_ip()`."""
+        return self.__imatmul__(Transform_Dims_D.rotating(rotation))
+
+    def rotated(self, py_float rotation, /) -> Transform_Dims_DArray:
+        """Apply rotation to a copy of this array, see `Transform_Dims_D.rotate_ip()`."""
+        return self._copy().rotate_ip(rotation)
+    #<ENDIF>
+    #<IF>: _Dims_ == 3
+    def rotate_ip(self, Vec_Dims_ axis, py_float angle, /) -> Transform_Dims_DArray:
+        #<RETURN_SELF>
+        """Apply the same rotation to all the transforms inplace, see `Transform_Dims_D.rotate_ip()`."""
+        return self.__imatmul__(Transform_Dims_D.rotating(axis, angle))
+
+    def rotated(self, Vec_Dims_ axis, py_float angle, /) -> Transform_Dims_DArray:
+        """Apply rotation to a copy of this array, see `Transform_Dims_D.rotate_ip()`."""
+        return self._copy().rotate_ip(axis, angle)
+    #<ENDIF>
+
+    cdef inline void _scale(self, Py_ssize_t index, const py_float* scale) noexcept nogil:
+        cdef py_float* t = self.data + index * _Fields_
+        cdef int c, k
+        #<IF>: _Dims_ == 2
+        for c in range(_Columns_):
+        #<ENDIF>
+        #<IF>: _Dims_ == 3
+        for c in range(_Dims_):  # Transform3D.scale_ip() leaves the origin untouched
+        #<ENDIF>
+            for k in range(_Dims_):
+                t[c * _Dims_ + k] *= scale[k]
+
+    #<OVERLOAD>
+    cdef inline Transform_Dims_DArray scale_ip(self, Vec_Dims_ scale):
+        #<RETURN_SELF>
+        """Apply the same scaling to all the transforms inplace, see `Transform_Dims_D.scale_ip()`."""
+        cdef py_float[_Dims_] s
+        #<GEN>: gen_for_each_dim("s[{index}] = scale.{dim}", _Dims_)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self._scale(i, s)
+        return self
+
+    #<OVERLOAD>
+    cdef inline Transform_Dims_DArray scale_ip(self, Vec_Dims_Array scales):
+        #<RETURN_SELF>
+        """Apply the scaling at the same index to each transform inplace, see `Transform_Dims_D.scale_ip()`."""
+        self._check_size(scales.size)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self._scale(i, scales.data + i * _Dims_)
+        return self
+
+    #<OVERLOAD_DISPATCHER>:scale_ip
+
+    def scaled(self, object scale, /) -> Transform_Dims_DArray:
+        """Apply scaling to a copy of this array, see `Transform_Dims_DArray.scale_ip()`."""
+        return self._copy().scale_ip(scale)
+
+
+def _Transform_Dims_DArray_from_raw(object data, /) -> Transform_Dims_DArray:
+    # Unpickle a Transform_Dims_DArray from its raw elements
+    cdef Py_buffer view
+    cdef Py_ssize_t count = open_raw_buffer(data, &view, _Fields_ * sizeof(py_float))
+    cdef Transform_Dims_DArray arr = Transform_Dims_DArray.__new__(Transform_Dims_DArray)
+    try:
+        arr._alloc(count)
+        memcpy(arr.data, view.buf, count * _Fields_ * sizeof(py_float))
+    finally:
+        PyBuffer_Release(&view)
+    return arr
+
+
+@cython.no_gc
+@cython.final
+@cython.freelist(8)
+cdef class _Transform_Dims_DArray_iterator:
+    """Internal iterator class for Transform_Dims_DArray."""
+
+    cdef Transform_Dims_DArray array
+    cdef Py_ssize_t index
+
+
+    def __next__(self) -> Transform_Dims_D:
+        if self.index >= self.array.size:
+            raise StopIteration
+        self.index += 1
+        return self.array._get(self.index - 1)
+
+    def __iter__(self) -> _Transform_Dims_DArray_iterator:
+        #<RETURN_SELF>
+        return self
+
+    def __length_hint__(self) -> int:
+        return self.array.size - self.index
+#<TEMPLATE_END>
@@ -0,0 +1,208 @@
+cimport cython
+
+# Dummy types for the IDE
+ctypedef py_float
+ctypedef py_int
+cdef class Transform_Dims_D:
+    pass
+cdef class Transform_Dims_DArray:
+    pass
+
+#<TEMPLATE_BEGIN>
+from libc.stdlib cimport qsort
+
+cdef int _hierarchy_Dims_d_compare_indices(const void* a, const void* b) noexcept nogil:
+    cdef Py_ssize_t x = (<const Py_ssize_t*> a)[0], y = (<const Py_ssize_t*> b)[0]
+    return (x > y) - (x < y)
+
+cdef bint _hierarchy_Dims_d_grow(void** data, size_t size) noexcept:
+    # Reallocate `data`, leaving it as it is if that fails
+    cdef void* grown = PyMem_Realloc(data[0], size)
+    if grown == NULL:
+        return False
+    data[0] = grown
+    return True
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Transform_Dims_DHierarchy:
+    """A hierarchy of `Transform_Dims_D`s with incrementally updated world transforms.
+
+    Nodes are referred to by their index, and a node's parent must be added before the node itself,
+    so the nodes are always in topological order.
+    Setting a local transform only marks the node dirty, `update()` then recomputes the world transforms
+    of the dirty nodes and their descendants, leaving the rest of the hierarchy alone.
+    """
+
+    cdef py_float* local_data
+    cdef py_float* world_data
+    cdef Py_ssize_t* parents
+    # The children of every node as linked lists, so that only the subtrees of the dirty nodes are visited
+    cdef Py_ssize_t* first_child
+    cdef Py_ssize_t* next_sibling
+    cdef unsigned char* dirty
+    # The nodes marked dirty since the last update, and the stack of the depth-first update pass
+    cdef Py_ssize_t* dirty_nodes
+    cdef Py_ssize_t* stack
+    cdef Py_ssize_t dirty_count
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+
+
+    def __cinit__(self):
+        self.local_data = self.world_data = NULL
+        self.parents = self.first_child = self.next_sibling = self.dirty_nodes = self.stack = NULL
+        self.dirty = NULL
+        self.size = self.capacity = self.dirty_count = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.local_data)
+        PyMem_Free(self.world_data)
+        PyMem_Free(self.parents)
+        PyMem_Free(self.first_child)
+        PyMem_Free(self.next_sibling)
+        PyMem_Free(self.dirty)
+        PyMem_Free(self.dirty_nodes)
+        PyMem_Free(self.stack)
+
+    cdef inline int _reserve(self, Py_ssize_t capacity) except -1:
+        if capacity <= self.capacity:
+            return 0
+        capacity = max(capacity, self.capacity * 2)
+        if capacity > PY_SSIZE_T_MAX // (_Fields_ * sizeof(py_float)):
+            raise MemoryError()
+        cdef size_t transforms = capacity * _Fields_ * sizeof(py_float)
+        cdef size_t indices = capacity * sizeof(Py_ssize_t)
+        if not (
+            _hierarchy_Dims_d_grow(<void**> &self.local_data, transforms)
+            and _hierarchy_Dims_d_grow(<void**> &self.world_data, transforms)
+            and _hierarchy_Dims_d_grow(<void**> &self.parents, indices)
+            and _hierarchy_Dims_d_grow(<void**> &self.first_child, indices)
+            and _hierarchy_Dims_d_grow(<void**> &self.next_sibling, indices)
+            and _hierarchy_Dims_d_grow(<void**> &self.dirty, capacity * sizeof(unsigned char))
+            and _hierarchy_Dims_d_grow(<void**> &self.dirty_nodes, indices)
+            and _hierarchy_Dims_d_grow(<void**> &self.stack, indices)
+        ):
+            raise MemoryError()
+        self.capacity = capacity
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Transform_Dims_DHierarchy index out of range: {index}")
+        return index
+
+    cdef inline void _mark_dirty(self, Py_ssize_t index) noexcept:
+        # Every node is listed at most once, so the list never outgrows the capacity
+        if not self.dirty[index]:
+            self.dirty[index] = True
+            self.dirty_nodes[self.dirty_count] = index
+            self.dirty_count += 1
+
+    cdef inline void _update(self) noexcept nogil:
+        # Ancestors come before their descendants in index order, so the subtree of a dirty node
+        # already recomputed (and cleared) along with a dirty ancestor is skipped
+        qsort(self.dirty_nodes, self.dirty_count, sizeof(Py_ssize_t), _hierarchy_Dims_d_compare_indices)
+        cdef Py_ssize_t i, node, parent, child
+        cdef Py_ssize_t top
+        for i in range(self.dirty_count):
+            if not self.dirty[self.dirty_nodes[i]]:
+                continue
+            self.stack[0] = self.dirty_nodes[i]
+            top = 1
+            while top > 0:
+                top -= 1
+                node = self.stack[top]
+                self.dirty[node] = False
+                parent = self.parents[node]
+                if parent >= 0:
+                    transform_Dims_d_compose(self.world_data + parent * _Fields_, self.local_data + node * _Fields_, self.world_data + node * _Fields_)
+                else:
+                    memcpy(self.world_data + node * _Fields_, self.local_data + node * _Fields_, _Fields_ * sizeof(py_float))
+                child = self.first_child[node]
+                while child >= 0:
+                    self.stack[top] = child
+                    top += 1
+                    child = self.next_sibling[child]
+        self.dirty_count = 0
+
+
+    def add(self, Transform_Dims_D local, Py_ssize_t parent = -1) -> int:
+        """Add a node with the local transform under `parent` (-1 for a root node), return the index of the new node."""
+        if parent != -1:
+            parent = self._index(parent)
+        self._reserve(self.size + 1)
+        cdef Py_ssize_t index = self.size
+        memcpy(self.local_data + index * _Fields_, &local.xx, _Fields_ * sizeof(py_float))
+        self.parents[index] = parent
+        self.first_child[index] = -1
+        if parent >= 0:
+            self.next_sibling[index] = self.first_child[parent]
+            self.first_child[parent] = index
+        else:
+            self.next_sibling[index] = -1
+        self.dirty[index] = False
+        self.size += 1
+        self._mark_dirty(index)
+        return index
+
+    def __len__(self) -> int:
+        """The number of nodes."""
+        return self.size
+
+    def parent(self, Py_ssize_t index, /) -> int:
+        """The index of the parent of a node, -1 for root nodes."""
+        return self.parents[self._index(index)]
+
+    def local(self, Py_ssize_t index, /) -> Transform_Dims_D:
+        """Get a copy of the local transform of a node."""
+        index = self._index(index)
+        cdef Transform_Dims_D t = Transform_Dims_D.__new__(Transform_Dims_D)
+        memcpy(&t.xx, self.local_data + index * _Fields_, _Fields_ * sizeof(py_float))
+        return t
+
+    def set_local(self, Py_ssize_t index, Transform_Dims_D local, /) -> None:
+        """Set the local transform of a node, its world transform and those of its descendants are updated lazily."""
+        index = self._index(index)
+        memcpy(self.local_data + index * _Fields_, &local.xx, _Fields_ * sizeof(py_float))
+        self._mark_dirty(index)
+
+    def world(self, Py_ssize_t index, /) -> Transform_Dims_D:
+        """Get a copy of the world transform of a node, updating the hierarchy first if needed."""
+        index = self._index(index)
+        self._update()
+        cdef Transform_Dims_D t = Transform_Dims_D.__new__(Transform_Dims_D)
+        memcpy(&t.xx, self.world_data + index * _Fields_, _Fields_ * sizeof(py_float))
+        return t
+
+    @property
+    def is_dirty(self) -> bool:
+        """If any world transform is out of date."""
+        return self.dirty_count > 0
+
+    def update(self) -> None:
+        """Recompute the world transforms of the dirty nodes and their descendants."""
+        with nogil:
+            self._update()
+
+    @property
+    def locals(self) -> Transform_Dims_DArray:
+        """A copy of the local transforms of all the nodes."""
+        cdef Transform_Dims_DArray arr = Transform_Dims_DArray.__new__(Transform_Dims_DArray)
+        arr._alloc(self.size)
+        memcpy(arr.data, self.local_data, self.size * _Fields_ * sizeof(py_float))
+        return arr
+
+    @property
+    def worlds(self) -> Transform_Dims_DArray:
+        """A copy of the world transforms of all the nodes, updating the hierarchy first if needed."""
+        self._update()
+        cdef Transform_Dims_DArray arr = Transform_Dims_DArray.__new__(Transform_Dims_DArray)
+        arr._alloc(self.size)
+        memcpy(arr.data, self.world_data, self.size * _Fields_ * sizeof(py_float))
+        return arr
+#<TEMPLATE_END>
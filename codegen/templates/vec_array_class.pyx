@@ -0,0 +1,687 @@
+cimport cython
+from libc.math cimport sqrtl, INFINITY
+
+# Dummy types for the IDE
+ctypedef _VecClassName_
+ctypedef _vTypeC_
+ctypedef _vType_
+ctypedef _vResultC_
+ctypedef _FloatVecClassName_
+ctypedef py_int
+ctypedef py_float
+
+DEF DEFAULT_RELATIVE_TOLERANCE = 0 # Dummy Value
+DEF DEFAULT_ABSOLUTE_TOLERANCE = 0 # Dummy Value
+DEF PAIRWISE_TILE_SIZE = 0 # Dummy Value
+
+#<TEMPLATE_BEGIN>
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class _VecClassName_Array:
+    #<IF>: _vType_ is float
+    """Contiguous array of _Dims_D vectors."""
+    #<ENDIF>
+    #<IF>: _vType_ is int
+    """Contiguous array of _Dims_D integer vectors."""
+    #<ENDIF>
+
+    cdef _vTypeC_* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[2] shape
+    cdef Py_ssize_t[2] strides
+    # The buffer of the vectors if they're borrowed by `from_buffer()`
+    cdef Py_buffer view
+    cdef bint is_view
+
+
+    def __cinit__(self):
+        self.data = NULL
+        self.size = 0
+        self.is_view = False
+
+    def __dealloc__(self):
+        if self.is_view:
+            PyBuffer_Release(&self.view)
+        else:
+            PyMem_Free(self.data)
+
+    cdef inline int _alloc(self, Py_ssize_t size) except -1:
+        if size < 0:
+            raise ValueError(f"Negative _VecClassName_Array size: {size}")
+        if size > PY_SSIZE_T_MAX // (_Dims_ * sizeof(_vTypeC_)):
+            raise MemoryError()
+        self.data = <_vTypeC_*> PyMem_Malloc(size * _Dims_ * sizeof(_vTypeC_))
+        if self.data == NULL:
+            raise MemoryError()
+        self._set_size(size)
+        return 0
+
+    cdef inline void _set_size(self, Py_ssize_t size) noexcept:
+        self.size = size
+        self.shape[0] = size
+        self.shape[1] = _Dims_
+        self.strides[0] = _Dims_ * sizeof(_vTypeC_)
+        self.strides[1] = sizeof(_vTypeC_)
+
+    cdef inline int _check_size(self, _VecClassName_Array other) except -1:
+        if other.size != self.size:
+            raise ValueError(f"_VecClassName_Array size mismatch: {self.size} and {other.size}")
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"_VecClassName_Array index out of range: {index}")
+        return index
+
+    cdef inline _VecClassName_ _get(self, Py_ssize_t index):
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        cdef _vTypeC_* p = self.data + index * _Dims_
+        #<GEN>: gen_for_each_dim("vec.{dim} = p[{index}]", _Dims_)
+        return vec
+
+    cdef inline void _set(self, Py_ssize_t index, _VecClassName_ vec) noexcept:
+        cdef _vTypeC_* p = self.data + index * _Dims_
+        #<GEN>: gen_for_each_dim("p[{index}] = vec.{dim}", _Dims_)
+
+
+    #<OVERLOAD>
+    cdef inline void __init__(self):
+        """Create an empty array."""
+        self._alloc(0)
+
+    #<OVERLOAD>
+    cdef inline void __init__(self, py_int size):
+        """Create an array of `size` zero vectors."""
+        self._alloc(size)
+        memset(self.data, 0, size * _Dims_ * sizeof(_vTypeC_))
+
+    #<OVERLOAD>
+    cdef inline void __init__(self, _VecClassName_Array other):
+        """Create a copy."""
+        self._alloc(other.size)
+        memcpy(self.data, other.data, other.size * _Dims_ * sizeof(_vTypeC_))
+
+    #<GEN>: gen_array_type_conversion_constructor(_Dims_, _vType_)
+
+    #<OVERLOAD>
+    cdef inline void __init__(self, object vectors):
+        """Create an array from an iterable of `_VecClassName_`s."""
+        #<GEN>: gen_array_int_conversion(_Dims_, _vType_)
+        vectors = tuple(vectors)
+        self._alloc(len(vectors))
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            self._set(i, <_VecClassName_?> vectors[i])
+
+    #<OVERLOAD_DISPATCHER>:__init__
+
+
+    def __repr__(self) -> str:
+        return f"_VecClassName_Array([{', '.join(repr(self._get(i)) for i in range(self.size))}])"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `_VecClassName_Array.is_close()`
+        """
+        if not isinstance(other, _VecClassName_Array):
+            return False
+        cdef _VecClassName_Array arr = <_VecClassName_Array> other
+        if arr.size != self.size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self.size * _Dims_):
+            if self.data[i] != arr.data[i]:
+                return False
+        return True
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `_VecClassName_Array.is_close()`
+        """
+        return not self == other
+
+    def is_close(self, _VecClassName_Array other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if all the vectors of the two arrays are close enough.
+
+        See Also: `math.is_close()`
+        """
+        if other.size != self.size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self.size * _Dims_):
+            if not is_close(<py_float> self.data[i], <py_float> other.data[i], rel_tol, abs_tol):
+                return False
+        return True
+
+    def __bool__(self) -> bool:
+        """If the array is not empty."""
+        return self.size != 0
+
+    def __pos__(self) -> _VecClassName_Array:
+        """Return a copy of this array."""
+        cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+        arr._alloc(self.size)
+        memcpy(arr.data, self.data, self.size * _Dims_ * sizeof(_vTypeC_))
+        return arr
+
+    def __neg__(self) -> _VecClassName_Array:
+        """Return an array of the inverse vectors."""
+        cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+        arr._alloc(self.size)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size * _Dims_):
+                arr.data[i] = -self.data[i]
+        return arr
+
+    #<GEN>: gen_common_array_binary_and_inplace_op("+", "add", "addition")
+
+    #<GEN>: gen_common_array_binary_and_inplace_op("-", "sub", "subtraction")
+
+    #<GEN>: gen_common_array_binary_and_inplace_op("*", "mul", "multiplication")
+
+    #<GEN>: gen_common_array_binary_and_inplace_op("/", "truediv", "division")
+
+
+    def __matmul__(self, object other) -> array:
+        """Dot products of the vectors, against another array element-wise or against the same vector."""
+        cdef object result = new_scalar_array("_vResultFormat_", self.size)
+        cdef _vResultC_[::1] out = result
+        cdef _VecClassName_Array arr
+        cdef _VecClassName_ vec
+        cdef Py_ssize_t i
+        cdef _vTypeC_* p
+        cdef _vTypeC_* q
+        cdef _vTypeC_ #<GEN>: gen_for_each_dim("o{dim}", _Dims_, join=", ")
+        if isinstance(other, _VecClassName_Array):
+            arr = <_VecClassName_Array> other
+            self._check_size(arr)
+            with nogil:
+                for i in range(self.size):
+                    p = self.data + i * _Dims_
+                    q = arr.data + i * _Dims_
+                    out[i] = #<GEN>: gen_for_each_dim("p[{index}] * q[{index}]", _Dims_, join=" + ")
+        elif isinstance(other, _VecClassName_):
+            vec = <_VecClassName_> other
+            #<GEN>: gen_for_each_dim("o{dim} = vec.{dim}", _Dims_)
+            with nogil:
+                for i in range(self.size):
+                    p = self.data + i * _Dims_
+                    out[i] = #<GEN>: gen_for_each_dim("p[{index}] * o{dim}", _Dims_, join=" + ")
+        else:
+            return NotImplemented
+        return result
+    #<IF>: _Dims_ == 3
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_Array __xor__(self, _VecClassName_Array other):
+        """Element-wise cross product."""
+        self._check_size(other)
+        cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+        arr._alloc(self.size)
+        cdef Py_ssize_t i
+        cdef _vTypeC_* p
+        cdef _vTypeC_* q
+        cdef _vTypeC_* r
+        with nogil:
+            for i in range(0, self.size * 3, 3):
+                p = self.data + i
+                q = other.data + i
+                r = arr.data + i
+                r[0] = p[1] * q[2] - p[2] * q[1]
+                r[1] = p[2] * q[0] - p[0] * q[2]
+                r[2] = p[0] * q[1] - p[1] * q[0]
+        return arr
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_Array __xor__(self, _VecClassName_ other):
+        """Cross products with the same vector for all elements."""
+        cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+        arr._alloc(self.size)
+        cdef _vTypeC_ ox = other.x, oy = other.y, oz = other.z
+        cdef Py_ssize_t i
+        cdef _vTypeC_* p
+        cdef _vTypeC_* r
+        with nogil:
+            for i in range(0, self.size * 3, 3):
+                p = self.data + i
+                r = arr.data + i
+                r[0] = p[1] * oz - p[2] * oy
+                r[1] = p[2] * ox - p[0] * oz
+                r[2] = p[0] * oy - p[1] * ox
+        return arr
+
+    #<OVERLOAD_DISPATCHER>:__xor__
+    #<ENDIF>
+
+
+    def __len__(self) -> int:
+        """The number of vectors in this array."""
+        return self.size
+
+    def __getitem__(self, object key) -> _VecClassName_ | _VecClassName_Array:
+        """Get a copy of the n-th vector, or a copy of a slice of this array."""
+        if not isinstance(key, slice):
+            return self._get(self._index(key))
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+        arr._alloc(len(range(start, stop, step)))
+        for i in range(arr.size):
+            memcpy(arr.data + i * _Dims_, self.data + (start + i * step) * _Dims_, _Dims_ * sizeof(_vTypeC_))
+        return arr
+
+    def __setitem__(self, Py_ssize_t key, _VecClassName_ value) -> None:
+        """Set the n-th vector of this array."""
+        self._set(self._index(key), value)
+
+    def __iter__(self) -> __VecClassName_Array_iterator:
+        """Create an iterator that yields copies of all the vectors of this array in sequence."""
+        cdef __VecClassName_Array_iterator iterator = __VecClassName_Array_iterator.__new__(__VecClassName_Array_iterator)
+        iterator.array = self
+        return iterator
+
+    def tolist(self) -> list:
+        """Convert this array to a list of `_VecClassName_`s."""
+        return [self._get(i) for i in range(self.size)]
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, self.data, sizeof(_vTypeC_), b"_vFormat_", 2, self.shape, self.strides)
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
+    def to_bytes(self) -> bytes:
+        """Pack the vectors into one block with a small header, the same as `_VecClassName_.pack_many()`."""
+        cdef bytes block = new_pack_block(self.size, ord("_vFormat_"), sizeof(_vTypeC_), _Dims_)
+        memcpy(pack_block_items(block), self.data, self.size * _Dims_ * sizeof(_vTypeC_))
+        return block
+
+    @staticmethod
+    def from_bytes(object data, /) -> _VecClassName_Array:
+        """Create an array from a block written by `_VecClassName_Array.to_bytes()` or `_VecClassName_.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t count = open_pack_block(data, &view, ord("_vFormat_"), sizeof(_vTypeC_), _Dims_, &items)
+        cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+        try:
+            arr._alloc(count)
+            memcpy(arr.data, items, count * _Dims_ * sizeof(_vTypeC_))
+        finally:
+            PyBuffer_Release(&view)
+        return arr
+
+    @staticmethod
+    def from_buffer(object data, /) -> _VecClassName_Array:
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, _Dims_)), without copying.
+
+        The buffer must be C-contiguous, of _Dims_ native `_vTypeDoc_` numbers per vector, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+        cdef Py_ssize_t count = open_item_buffer(data, &arr.view, ord("_vKind_"), sizeof(_vTypeC_), _Dims_)
+        arr.is_view = True
+        arr.data = <_vTypeC_*> arr.view.buf
+        arr._set_size(count)
+        return arr
+
+    @property
+    def __array_interface__(self) -> dict:
+        """The vectors as a C-contiguous (len, _Dims_) array of native `_vTypeDoc_` numbers, for numpy without copying."""
+        return array_interface(self.data, ord("_vKind_"), sizeof(_vTypeC_), 2, self.shape)
+
+    def __dlpack__(self, *, object stream = None, object max_version = None, object dl_device = None, object copy = None) -> object:
+        #<IF>: _vType_ is float
+        """Export the vectors as a DLPack tensor, same layout as `__array_interface__`, copied if `copy` is True.
+
+        DLPack has no long double type, so unless it's the same as double they're exported as a copy of doubles,
+        which raises `BufferError` if `copy` is False.
+        """
+        #<ENDIF>
+        #<IF>: _vType_ is int
+        """Export the vectors as a DLPack tensor, same layout as `__array_interface__`, copied only if `copy` is True."""
+        #<ENDIF>
+        return export_dlpack(self, self.data, ord("_vKind_"), sizeof(_vTypeC_), 2, self.shape, stream, max_version, dl_device, copy)
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        return dlpack_device()
+
+    def __reduce_ex__(self, protocol) -> tuple:
+        # The elements are pickled as one buffer, which protocol 5 can pass out-of-band without copying
+        if protocol >= 5:
+            from pickle import PickleBuffer
+            return __VecClassName_Array_from_raw, (PickleBuffer(self),)
+        return __VecClassName_Array_from_raw, (PyBytes_FromStringAndSize(<char*> self.data, self.size * _Dims_ * sizeof(_vTypeC_)),)
+
+
+    @property
+    def length(self) -> array:
+        """The (Euclidean) lengths of the vectors."""
+        cdef object result = new_scalar_array("d", self.size)
+        cdef double[::1] out = result
+        cdef Py_ssize_t i
+        cdef _vTypeC_* p
+        with nogil:
+            for i in range(self.size):
+                p = self.data + i * _Dims_
+                out[i] = #<GEN>: f"sqrtl({gen_for_each_dim('<py_float> (p[{index}] * p[{index}])', _Dims_, join=' + ')})"
+        return result
+
+    @property
+    def length_sqr(self) -> array:
+        """The squared Euclidean lengths of the vectors."""
+        cdef object result = new_scalar_array("d", self.size)
+        cdef double[::1] out = result
+        cdef Py_ssize_t i
+        cdef _vTypeC_* p
+        with nogil:
+            for i in range(self.size):
+                p = self.data + i * _Dims_
+                out[i] = #<GEN>: f"<py_float> ({gen_for_each_dim('p[{index}] * p[{index}]', _Dims_, join=' + ')})"
+        return result
+
+    cdef inline object _distances(self, object other, bint squared):
+        cdef object result = new_scalar_array("d", self.size)
+        cdef double[::1] out = result
+        cdef _VecClassName_Array arr
+        cdef _VecClassName_ vec
+        cdef Py_ssize_t i
+        cdef _vTypeC_* p
+        cdef _vTypeC_* q
+        cdef _vTypeC_ #<GEN>: gen_for_each_dim("o{dim}", _Dims_, join=", ")
+        cdef py_float d
+        if isinstance(other, _VecClassName_Array):
+            arr = <_VecClassName_Array> other
+            self._check_size(arr)
+            with nogil:
+                for i in range(self.size):
+                    p = self.data + i * _Dims_
+                    q = arr.data + i * _Dims_
+                    d = #<GEN>: f"<py_float> ({gen_for_each_dim('(p[{index}] - q[{index}]) * (p[{index}] - q[{index}])', _Dims_, join=' + ')})"
+                    out[i] = d if squared else sqrtl(d)
+        elif isinstance(other, _VecClassName_):
+            vec = <_VecClassName_> other
+            #<GEN>: gen_for_each_dim("o{dim} = vec.{dim}", _Dims_)
+            with nogil:
+                for i in range(self.size):
+                    p = self.data + i * _Dims_
+                    d = #<GEN>: f"<py_float> ({gen_for_each_dim('(p[{index}] - o{dim}) * (p[{index}] - o{dim})', _Dims_, join=' + ')})"
+                    out[i] = d if squared else sqrtl(d)
+        else:
+            raise TypeError(f"Expected _VecClassName_Array or _VecClassName_, got {type(other).__name__}")
+        return result
+
+    def __or__(self, object other) -> array:
+        """The (Euclidean) distances to another array element-wise or to the same vector."""
+        return self._distances(other, False)
+
+    def distance_to(self, object other, /) -> array:
+        """The (Euclidean) distances to another array element-wise or to the same vector."""
+        return self._distances(other, False)
+
+    def distance_sqr_to(self, object other, /) -> array:
+        """The squared Euclidean distances to another array element-wise or to the same vector."""
+        return self._distances(other, True)
+
+    cdef inline int _distance_matrix(self, _VecClassName_Array other, buffer_float[:, ::1] out, bint squared) except -1:
+        if out.shape[0] != self.size or out.shape[1] != other.size:
+            raise ValueError(f"Expected a ({self.size}, {other.size}) buffer, got ({out.shape[0]}, {out.shape[1]})")
+        cdef Py_ssize_t i, j, tile, tile_end
+        cdef _vTypeC_* p
+        cdef _vTypeC_* q
+        cdef py_float d
+        with nogil:
+            # Tiles of `other` stay in the cache while all the rows are filled
+            for tile in range(0, other.size, PAIRWISE_TILE_SIZE):
+                tile_end = min(tile + PAIRWISE_TILE_SIZE, other.size)
+                for i in range(self.size):
+                    p = self.data + i * _Dims_
+                    for j in range(tile, tile_end):
+                        q = other.data + j * _Dims_
+                        d = #<GEN>: gen_for_each_dim("(<py_float> p[{index}] - q[{index}]) * (<py_float> p[{index}] - q[{index}])", _Dims_, join=" + ")
+                        out[i, j] = d if squared else sqrtl(d)
+        return 0
+
+    def distance_matrix(self, _VecClassName_Array other, /, object out = None, bint squared = False) -> object:
+        """The (Euclidean) distances between every vector of this array (rows) and every vector of `other` (columns).
+
+        The results are written to `out`, a contiguous (len(self), len(other)) float or double buffer (e.g. a numpy array),
+        and `out` is returned. If `out` is None, a new (len(self), len(other)) double `memoryview` is returned.
+        """
+        if out is None:
+            out = new_float_buffer("d", self.size, other.size)
+        cdef str fmt = buffer_format(out)
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            out_f = out
+            self._distance_matrix(other, out_f, squared)
+        elif fmt == "d":
+            out_d = out
+            self._distance_matrix(other, out_d, squared)
+        elif fmt == "g":
+            out_g = out
+            self._distance_matrix(other, out_g, squared)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def nearest(self, _VecClassName_Array points, /) -> tuple[array, array]:
+        """For every vector of this array, find the nearest vector of `points`.
+
+        Returns the indices into `points` (the first one on ties) and the (Euclidean) distances, as two `array`s.
+        """
+        if points.size == 0:
+            raise ValueError("No points to search in")
+        cdef object indices = new_scalar_array("q", self.size)
+        cdef object distances = new_scalar_array("d", self.size)
+        cdef py_int[::1] out_i = indices
+        cdef double[::1] out_d = distances
+        cdef Py_ssize_t i, j, tile, tile_end, best
+        cdef _vTypeC_* p
+        cdef _vTypeC_* q
+        cdef double d, best_d
+        with nogil:
+            out_d[:] = INFINITY
+            # Same tiling as `distance_matrix()`, the running minimums are kept in the output arrays
+            for tile in range(0, points.size, PAIRWISE_TILE_SIZE):
+                tile_end = min(tile + PAIRWISE_TILE_SIZE, points.size)
+                for i in range(self.size):
+                    p = self.data + i * _Dims_
+                    best, best_d = out_i[i], out_d[i]
+                    for j in range(tile, tile_end):
+                        q = points.data + j * _Dims_
+                        d = #<GEN>: gen_for_each_dim("(<py_float> p[{index}] - q[{index}]) * (<py_float> p[{index}] - q[{index}])", _Dims_, join=" + ")
+                        if d < best_d:
+                            best, best_d = j, d
+                    out_i[i], out_d[i] = best, best_d
+            for i in range(self.size):
+                out_d[i] = sqrtl(out_d[i])
+        return indices, distances
+
+
+    def hash_many(self) -> array:
+        """The hashes of all the vectors, same as `hash()` of each element but in one pass."""
+        cdef object result = new_scalar_array("q", self.size)
+        cdef py_int[::1] out = result
+        cdef Py_ssize_t i
+        cdef _vTypeC_* p
+        cdef uint64_t h
+        with nogil:
+            for i in range(self.size):
+                p = self.data + i * _Dims_
+                h = _Dims_
+                #<IF>: _vType_ is int
+                #<GEN>: gen_for_each_dim("h = hash_combine(h, <uint64_t> p[{index}])", _Dims_)
+                #<ENDIF>
+                #<IF>: _vType_ is float
+                #<GEN>: gen_for_each_dim("h = hash_combine(h, <uint64_t> bitcast_float(p[{index}]))", _Dims_)
+                #<ENDIF>
+                out[i] = hash_finish(h)
+        return result
+
+
+    cdef inline int _check_not_empty(self) except -1:
+        if self.size == 0:
+            raise ValueError("Reduction of an empty _VecClassName_Array")
+        return 0
+
+    def sum(self) -> _VecClassName_:
+        """The sum of all the vectors, the zero vector for an empty array."""
+        cdef _vTypeC_ #<GEN>: gen_for_each_dim("s{dim} = 0", _Dims_, join=", ")
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * _Dims_, _Dims_):
+                #<GEN>: gen_for_each_dim("s{dim} += self.data[i + {index}]", _Dims_)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = s{dim}", _Dims_)
+        return vec
+
+    def mean(self) -> _FloatVecClassName_:
+        """The mean of all the vectors (the centroid)."""
+        self._check_not_empty()
+        cdef py_float #<GEN>: gen_for_each_dim("s{dim} = 0", _Dims_, join=", ")
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * _Dims_, _Dims_):
+                #<GEN>: gen_for_each_dim("s{dim} += self.data[i + {index}]", _Dims_)
+        cdef _FloatVecClassName_ vec = _FloatVecClassName_.__new__(_FloatVecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = s{dim} / self.size", _Dims_)
+        return vec
+
+    cdef inline void _bounds(self, _vTypeC_* lo, _vTypeC_* hi) noexcept nogil:
+        cdef Py_ssize_t i
+        cdef int d
+        cdef _vTypeC_ v
+        for d in range(_Dims_):
+            lo[d] = hi[d] = self.data[d]
+        for i in range(_Dims_, self.size * _Dims_, _Dims_):
+            for d in range(_Dims_):
+                v = self.data[i + d]
+                if v < lo[d]:
+                    lo[d] = v
+                elif v > hi[d]:
+                    hi[d] = v
+
+    def min(self) -> _VecClassName_:
+        """The component-wise minimum of all the vectors."""
+        self._check_not_empty()
+        cdef _vTypeC_[_Dims_] lo, hi
+        with nogil:
+            self._bounds(lo, hi)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = lo[{index}]", _Dims_)
+        return vec
+
+    def max(self) -> _VecClassName_:
+        """The component-wise maximum of all the vectors."""
+        self._check_not_empty()
+        cdef _vTypeC_[_Dims_] lo, hi
+        with nogil:
+            self._bounds(lo, hi)
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = hi[{index}]", _Dims_)
+        return vec
+
+    def bounds(self) -> tuple[_VecClassName_, _VecClassName_]:
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        self._check_not_empty()
+        cdef _vTypeC_[_Dims_] lo, hi
+        with nogil:
+            self._bounds(lo, hi)
+        cdef _VecClassName_ vmin = _VecClassName_.__new__(_VecClassName_)
+        cdef _VecClassName_ vmax = _VecClassName_.__new__(_VecClassName_)
+        #<GEN>: gen_for_each_dim("vmin.{dim} = lo[{index}]", _Dims_)
+        #<GEN>: gen_for_each_dim("vmax.{dim} = hi[{index}]", _Dims_)
+        return vmin, vmax
+
+    cdef inline Py_ssize_t _arg_length_sqr(self, bint largest) noexcept nogil:
+        cdef Py_ssize_t i, best = 0
+        cdef _vTypeC_* p
+        cdef py_float l, best_l = 0
+        for i in range(self.size):
+            p = self.data + i * _Dims_
+            l = #<GEN>: f"<py_float> ({gen_for_each_dim('p[{index}] * p[{index}]', _Dims_, join=' + ')})"
+            if i == 0 or (l > best_l if largest else l < best_l):
+                best, best_l = i, l
+        return best
+
+    def argmin_length(self) -> int:
+        """The index of the shortest vector (the first one on ties)."""
+        self._check_not_empty()
+        return self._arg_length_sqr(False)
+
+    def argmax_length(self) -> int:
+        """The index of the longest vector (the first one on ties)."""
+        self._check_not_empty()
+        return self._arg_length_sqr(True)
+    #<IF>: _vType_ is float
+
+    @property
+    def normalized(self) -> _VecClassName_Array:
+        """Get an array of the normalized vectors."""
+        cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+        arr._alloc(self.size)
+        cdef Py_ssize_t i
+        cdef _vTypeC_* p
+        cdef _vTypeC_* r
+        cdef py_float l
+        with nogil:
+            for i in range(0, self.size * _Dims_, _Dims_):
+                p = self.data + i
+                r = arr.data + i
+                l = #<GEN>: f"sqrtl({gen_for_each_dim('p[{index}] * p[{index}]', _Dims_, join=' + ')})"
+                #<GEN>: gen_for_each_dim("r[{index}] = p[{index}] / l", _Dims_)
+        return arr
+    #<ENDIF>
+
+
+cdef inline _VecClassName_Array __VecClassName_Array_of(object vectors):
+    # The vectors as an array for the reductions of `_VecClassName_`, without copying arrays
+    if type(vectors) is _VecClassName_Array:
+        return <_VecClassName_Array> vectors
+    return _VecClassName_Array(vectors)
+
+
+def __VecClassName_Array_from_raw(object data, /) -> _VecClassName_Array:
+    # Unpickle a _VecClassName_Array from its raw elements
+    cdef Py_buffer view
+    cdef Py_ssize_t count = open_raw_buffer(data, &view, _Dims_ * sizeof(_vTypeC_))
+    cdef _VecClassName_Array arr = _VecClassName_Array.__new__(_VecClassName_Array)
+    try:
+        arr._alloc(count)
+        memcpy(arr.data, view.buf, count * _Dims_ * sizeof(_vTypeC_))
+    finally:
+        PyBuffer_Release(&view)
+    return arr
+
+
+@cython.no_gc
+@cython.final
+@cython.freelist(8)
+cdef class __VecClassName_Array_iterator:
+    """Internal iterator class for _VecClassName_Array."""
+
+    cdef _VecClassName_Array array
+    cdef Py_ssize_t index
+
+
+    def __next__(self) -> _VecClassName_:
+        if self.index >= self.array.size:
+            raise StopIteration
+        self.index += 1
+        return self.array._get(self.index - 1)
+
+    def __iter__(self) -> __VecClassName_Array_iterator:
+        #<RETURN_SELF>
+        return self
+
+    def __length_hint__(self) -> int:
+        return self.array.size - self.index
+#<TEMPLATE_END>
@@ -5,6 +5,11 @@ from libc.math cimport sqrtl
 ctypedef _VecClassName_
 ctypedef _vTypeC_
 ctypedef _vType_
+ctypedef _vRealC_
+ctypedef _vRealPy_
+ctypedef _vAtan2_
+ctypedef _FloatVecClassName_
+ctypedef _TransformClassName_
 ctypedef Vec2
 ctypedef Vec3
 ctypedef Vec4
@@ -20,6 +25,10 @@ DEF DEFAULT_RELATIVE_TOLERANCE = 0 # Dummy Value
 DEF DEFAULT_ABSOLUTE_TOLERANCE = 0 # Dummy Value
 
 #<TEMPLATE_BEGIN>
+cdef Py_ssize_t[1] __VecClassName__buffer_shape = [_Dims_]
+cdef Py_ssize_t[1] __VecClassName__buffer_strides = [sizeof(_vTypeC_)]
+
+
 # noinspection SpellCheckingInspection
 @cython.auto_pickle(True)
 @cython.freelist(4096)
@@ -27,10 +36,10 @@ DEF DEFAULT_ABSOLUTE_TOLERANCE = 0 # Dummy Value
 @cython.final
 cdef class _VecClassName_:
     #<IF>: _vType_ is float
-    """_Dims_D vector."""
+    """_Dims_D vector_PrecisionDoc_."""
     #<ENDIF>
     #<IF>: _vType_ is int
-    """_Dims_D integer vector."""
+    """_Dims_D integer vector_PrecisionDoc_."""
     #<ENDIF>
 
     #<GEN>: gen_var_decls(_Dims_, "_vTypeC_")
@@ -39,7 +48,7 @@ cdef class _VecClassName_:
     #<OVERLOAD>
     cdef inline void __init__(self) noexcept:
         """Create a zero vector."""
-        #<GEN>: gen_single_value_constructor(_Dims_, _vType_(0))
+        #<GEN>: gen_single_value_constructor(_Dims_, _vFamily_(0))
         pass #<IGNORE>
 
     #<OVERLOAD>
@@ -48,15 +57,15 @@ cdef class _VecClassName_:
         #<GEN>: gen_single_value_constructor(_Dims_, "value")
         pass #<IGNORE>
 
-    #<GEN>: gen_type_conversion_constructor(_Dims_, _vType_)
+    #<GEN>: gen_combination_constructors(_Dims_, _vFamily_)
 
-    #<GEN>: gen_combination_constructors(_Dims_, _vType_)
+    #<GEN>: gen_type_conversion_constructor(_Dims_, _vFamily_)
 
     #<OVERLOAD_DISPATCHER>:__init__
 
 
     def __repr__(self) -> str:
-        return #<GEN>: gen_repr(_Dims_, _vType_)
+        return #<GEN>: gen_repr(_Dims_, _vFamily_)
 
     def __eq__(self, object other) -> bool:
         """Perform exact comparison.
@@ -89,18 +98,17 @@ cdef class _VecClassName_:
         """If the vector is a zero vector."""
         return #<GEN>: gen_for_each_dim("self.{dim} == 0", _Dims_, join=" and ")
 
-    #TODO: Better hashing
     #<IF>: _vType_ is int
     def __hash__(self) -> py_int:
-        cdef py_int h = 0
-        #<GEN>: gen_for_each_dim("h ^= rotl_ratio(self.{dim}, {index}, _Dims_)", _Dims_, join="\n")
-        return h
+        cdef uint64_t h = _Dims_
+        #<GEN>: gen_for_each_dim("h = hash_combine(h, <uint64_t> self.{dim})", _Dims_)
+        return hash_finish(h)
     #<ENDIF>
     #<IF>: _vType_ is float
     def __hash__(self) -> py_int:
-        cdef py_int h = 0
-        #<GEN>: gen_for_each_dim("h ^= rotl_ratio(bitcast_float(self.{dim}), {index}, _Dims_)", _Dims_, join="\n")
-        return h
+        cdef uint64_t h = _Dims_
+        #<GEN>: gen_for_each_dim("h = hash_combine(h, <uint64_t> bitcast_float(self.{dim}))", _Dims_)
+        return hash_finish(h)
     #<ENDIF>
 
     def __pos__(self) -> _VecClassName_:
@@ -115,47 +123,71 @@ cdef class _VecClassName_:
         #<GEN>: gen_for_each_dim("vec.{dim} = -self.{dim}", _Dims_)
         return vec
 
+    def copy_into(self, _VecClassName_ out, /) -> _VecClassName_:
+        """Copy the elements of this vector into `out` and return it, the allocation-free version of `+vec`."""
+        #<GEN>: gen_for_each_dim("out.{dim} = self.{dim}", _Dims_)
+        return out
+
+    def neg_into(self, _VecClassName_ out, /) -> _VecClassName_:
+        """Write the inverse of this vector into `out` (which can be `self`) and return it."""
+        #<GEN>: gen_for_each_dim("out.{dim} = -self.{dim}", _Dims_)
+        return out
+
+    def neg_ip(self) -> _VecClassName_:
+        #<RETURN_SELF>
+        """Inverse this vector inplace."""
+        #<GEN>: gen_for_each_dim("self.{dim} = -self.{dim}", _Dims_)
+        return self
+
     #<GEN>: gen_common_binary_and_inplace_op("+", "add", "addition")
 
     #<GEN>: gen_common_binary_and_inplace_op("-", "sub", "subtraction")
 
     #<GEN>: gen_common_binary_and_inplace_op("*", "mul", "multiplication")
-    #<IF>: _Dims_ == 2
+    #<IF>: _Dims_ == 2 and _vType_ is int
     #<OVERLOAD>
-    cdef inline Vec2 __mul__(self, Transform2D t):
+    cdef inline _FloatVecClassName_ __mul__(self, _TransformClassName_ t):
         """Transform a copy of this vector using the *INVERSE* of the transform.
         Use `transform * vector` or `transform(vector)` for non-inverse transformation.
         
         See Also:
-            `Transform2D.__mul__()`
-            `Transform2D.__call__()`
+            `_TransformClassName_.__mul__()`
+            `_TransformClassName_.__call__()`
         """
-        cdef Vec2 vec = Vec2.__new__(Vec2)
-        cdef py_float x = self.x - t.ox
-        cdef py_float y = self.y - t.oy
+        cdef _FloatVecClassName_ vec = _FloatVecClassName_.__new__(_FloatVecClassName_)
+        cdef _vRealC_ x = self.x - t.ox
+        cdef _vRealC_ y = self.y - t.oy
         vec.x = t.xx * x + t.xy * y
         vec.y = t.yx * x + t.yy * y
         return vec
     #<ENDIF>
-    #<IF>: _Dims_ == 3
+    #<IF>: _Dims_ == 3 and _vType_ is int
     #<OVERLOAD>
-    cdef inline Vec3 __mul__(self, Transform3D t):
+    cdef inline _FloatVecClassName_ __mul__(self, _TransformClassName_ t):
         """Transform a copy of this vector using the *INVERSE* of the transform.
         Use `transform * vector` or `transform(vector)` for non-inverse transformation.
         
         See Also:
-            `Transform3D.__mul__()`
-            `Transform3D.__call__()`
+            `_TransformClassName_.__mul__()`
+            `_TransformClassName_.__call__()`
         """
-        cdef Vec3 vec = Vec3.__new__(Vec3)
-        cdef py_float x = self.x - t.ox
-        cdef py_float y = self.y - t.oy
-        cdef py_float z = self.z - t.oz
+        cdef _FloatVecClassName_ vec = _FloatVecClassName_.__new__(_FloatVecClassName_)
+        cdef _vRealC_ x = self.x - t.ox
+        cdef _vRealC_ y = self.y - t.oy
+        cdef _vRealC_ z = self.z - t.oz
         vec.x = t.xx * x + t.xy * y + t.xz * z
         vec.y = t.yx * x + t.yy * y + t.yz * z
         vec.z = t.zx * x + t.zy * y + t.zz * z
         return vec
     #<ENDIF>
+    #<IF>: _Dims_ < 4 and _vType_ is float
+    #<OVERLOAD>
+    cdef inline object __mul__(self, object other):
+        """Defer to `other.__rmul__()`, like the inverse transformation of `_TransformClassName_.__rmul__()`.
+        The transforms aren't cimported, since their module depends on this one.
+        """
+        return NotImplemented
+    #<ENDIF>
 
     #<GEN>: gen_common_binary_and_inplace_op("/", "truediv", "division")
 
@@ -201,54 +233,365 @@ cdef class _VecClassName_:
         # iterator.vec = self
         return iterator
 
+    # Expose the elements of this vector as a writable 1D buffer, without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.x, sizeof(_vTypeC_), b"_vFormat_", 1, __VecClassName__buffer_shape, __VecClassName__buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this vector as raw bytes in native byte order."""
+        return PyBytes_FromStringAndSize(<char*> &self.x, _Dims_ * sizeof(_vTypeC_))
+
+    @staticmethod
+    def from_bytes(object data, /) -> _VecClassName_:
+        """Create a vector from the bytes written by `_VecClassName_.to_bytes()` (or any buffer of the same size)."""
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        read_bytes(data, &vec.x, _Dims_ * sizeof(_vTypeC_))
+        return vec
+
+    @staticmethod
+    def pack_many(object vectors, /) -> bytes:
+        """Pack an iterable of vectors into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the vectors one by one.
+        See Also: `_VecClassName_.unpack_many()`
+        """
+        vectors = list(vectors)
+        cdef Py_ssize_t i, count = len(vectors)
+        cdef bytes block = new_pack_block(count, ord("_vFormat_"), sizeof(_vTypeC_), _Dims_)
+        cdef _vTypeC_* p = <_vTypeC_*> pack_block_items(block)
+        cdef _VecClassName_ vec
+        for i in range(count):
+            vec = <_VecClassName_?> vectors[i]
+            memcpy(p + i * _Dims_, &vec.x, _Dims_ * sizeof(_vTypeC_))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[_VecClassName_]:
+        """Read the vectors of a block written by `_VecClassName_.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("_vFormat_"), sizeof(_vTypeC_), _Dims_, &items)
+        cdef list result = []
+        cdef _VecClassName_ vec
+        try:
+            for i in range(count):
+                vec = _VecClassName_.__new__(_VecClassName_)
+                memcpy(&vec.x, items + i * _Dims_ * sizeof(_vTypeC_), _Dims_ * sizeof(_vTypeC_))
+                result.append(vec)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+    #<IF>: _HasArray_
+
+    @staticmethod
+    def sum_many(object vectors, /) -> _VecClassName_:
+        """The sum of an iterable of vectors, the zero vector if it's empty.
+
+        The vectors are converted to a `_VecClassName_Array` first, unless they already are one.
+        See Also: `_VecClassName_Array.sum()`
+        """
+        return __VecClassName_Array_of(vectors).sum()
+
+    @staticmethod
+    def mean_many(object vectors, /) -> _FloatVecClassName_:
+        """The mean of an iterable of vectors (the centroid).
+
+        The vectors are converted to a `_VecClassName_Array` first, unless they already are one.
+        See Also: `_VecClassName_Array.mean()`
+        """
+        return __VecClassName_Array_of(vectors).mean()
+
+    @staticmethod
+    def min_many(object vectors, /) -> _VecClassName_:
+        """The component-wise minimum of an iterable of vectors.
+
+        The vectors are converted to a `_VecClassName_Array` first, unless they already are one.
+        See Also: `_VecClassName_Array.min()`
+        """
+        return __VecClassName_Array_of(vectors).min()
+
+    @staticmethod
+    def max_many(object vectors, /) -> _VecClassName_:
+        """The component-wise maximum of an iterable of vectors.
+
+        The vectors are converted to a `_VecClassName_Array` first, unless they already are one.
+        See Also: `_VecClassName_Array.max()`
+        """
+        return __VecClassName_Array_of(vectors).max()
+
+    @staticmethod
+    def bounds_many(object vectors, /) -> tuple[_VecClassName_, _VecClassName_]:
+        """The axis-aligned bounding box of an iterable of vectors, as the (min, max) corners.
+
+        The vectors are converted to a `_VecClassName_Array` first, unless they already are one.
+        See Also: `_VecClassName_Array.bounds()`
+        """
+        return __VecClassName_Array_of(vectors).bounds()
+
+    @staticmethod
+    def argmin_length_many(object vectors, /) -> int:
+        """The index of the shortest of an iterable of vectors (the first one on ties).
+
+        The vectors are converted to a `_VecClassName_Array` first, unless they already are one.
+        See Also: `_VecClassName_Array.argmin_length()`
+        """
+        return __VecClassName_Array_of(vectors).argmin_length()
+
+    @staticmethod
+    def argmax_length_many(object vectors, /) -> int:
+        """The index of the longest of an iterable of vectors (the first one on ties).
+
+        The vectors are converted to a `_VecClassName_Array` first, unless they already are one.
+        See Also: `_VecClassName_Array.argmax_length()`
+        """
+        return __VecClassName_Array_of(vectors).argmax_length()
+
+    @staticmethod
+    def hash_many(object vectors, /) -> array:
+        """The hashes of an iterable of vectors, same as `hash()` of each one but in one pass.
+
+        The vectors are converted to a `_VecClassName_Array` first, unless they already are one.
+        See Also: `_VecClassName_Array.hash_many()`
+        """
+        return __VecClassName_Array_of(vectors).hash_many()
+    #<ENDIF>
+
 
     #<IGNORE_NEXT>
     # noinspection PyTypeChecker
     @property
-    def length(self) -> py_float:
+    def length(self) -> _vRealPy_:
         """The (Euclidean) length of this vector."""
-        return #<GEN>: f"sqrtl({gen_for_each_dim('<py_float> (self.{dim} * self.{dim})', _Dims_, join=' + ')})"
+        return #<GEN>: f"_vSqrt_({gen_for_each_dim('<_vRealC_> (self.{dim} * self.{dim})', _Dims_, join=' + ')})"
 
     #<IGNORE_NEXT>
     # noinspection PyTypeChecker
     @property
-    def length_sqr(self) -> py_float:
+    def length_sqr(self) -> _vRealPy_:
         """The squared Euclidean length of this vector."""
         return #<GEN>: gen_for_each_dim("self.{dim} * self.{dim}", _Dims_, join=" + ")
 
     #<IGNORE_NEXT>
     # noinspection PyTypeChecker
-    def __or__(self, _VecClassName_ other) -> py_float:
+    def __or__(self, _VecClassName_ other) -> _vRealPy_:
         """The (Euclidean) distance between two vectors."""
         #<GEN>: gen_for_each_dim("cdef _vTypeC_ d{dim} = self.{dim} - other.{dim}", _Dims_)
-        return #<GEN>: f"sqrtl(<py_float> ({gen_for_each_dim('d{dim} * d{dim}', _Dims_, join=' + ')}))"
+        return #<GEN>: f"_vSqrt_(<_vRealC_> ({gen_for_each_dim('d{dim} * d{dim}', _Dims_, join=' + ')}))"
 
     #<IGNORE_NEXT>
     # noinspection PyTypeChecker
-    def distance_to(self, _VecClassName_ other, /) -> py_float:
+    def distance_to(self, _VecClassName_ other, /) -> _vRealPy_:
         """The (Euclidean) distance between two vectors."""
         #<GEN>: gen_for_each_dim("cdef _vTypeC_ d{dim} = self.{dim} - other.{dim}", _Dims_)
-        return #<GEN>: f"sqrtl(<py_float> ({gen_for_each_dim('d{dim} * d{dim}', _Dims_, join=' + ')}))"
+        return #<GEN>: f"_vSqrt_(<_vRealC_> ({gen_for_each_dim('d{dim} * d{dim}', _Dims_, join=' + ')}))"
 
     #<IGNORE_NEXT>
     # noinspection PyTypeChecker
-    def distance_sqr_to(self, _VecClassName_ other, /) -> py_float:
+    def distance_sqr_to(self, _VecClassName_ other, /) -> _vRealPy_:
         """The squared Euclidean distance between two vectors."""
         #<GEN>: gen_for_each_dim("cdef _vTypeC_ d{dim} = self.{dim} - other.{dim}", _Dims_)
-        return #<GEN>: f"<py_float> ({gen_for_each_dim('d{dim} * d{dim}', _Dims_, join=' + ')})"
+        return #<GEN>: f"<_vRealC_> ({gen_for_each_dim('d{dim} * d{dim}', _Dims_, join=' + ')})"
     #<IF>: _vType_ is float
 
     @property
     def normalized(self) -> _VecClassName_:
         """Get a normalized copy of this vector."""
-        cdef py_float l = #<GEN>: f"sqrtl({gen_for_each_dim('self.{dim} * self.{dim}', _Dims_, join=' + ')})"
+        cdef _vRealC_ l = #<GEN>: f"_vSqrt_({gen_for_each_dim('self.{dim} * self.{dim}', _Dims_, join=' + ')})"
         cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
         #<GEN>: gen_for_each_dim("vec.{dim} = self.{dim} / l", _Dims_)
         return vec
+
+    def normalize_into(self, _VecClassName_ out, /) -> _VecClassName_:
+        """Write a normalized copy of this vector into `out` (which can be `self`) and return it."""
+        cdef _vRealC_ l = #<GEN>: f"_vSqrt_({gen_for_each_dim('self.{dim} * self.{dim}', _Dims_, join=' + ')})"
+        #<GEN>: gen_for_each_dim("out.{dim} = self.{dim} / l", _Dims_)
+        return out
+
+    def normalize_ip(self) -> _VecClassName_:
+        #<RETURN_SELF>
+        """Normalize this vector inplace."""
+        cdef _vRealC_ l = #<GEN>: f"_vSqrt_({gen_for_each_dim('self.{dim} * self.{dim}', _Dims_, join=' + ')})"
+        #<GEN>: gen_for_each_dim("self.{dim} /= l", _Dims_)
+        return self
     #<ENDIF>
 
 
-    #<GEN>: gen_swizzle_properties(_Dims_, _vType_)
+    #<OVERLOAD>
+    cdef inline _VecClassName_ mul_add(self, _VecClassName_ multiplier, _VecClassName_ addend):
+        """Fused `self * multiplier + addend`, without intermediate vectors."""
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = self.{dim} * multiplier.{dim} + addend.{dim}", _Dims_)
+        return vec
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_ mul_add(self, _vTypeC_ multiplier, _VecClassName_ addend):
+        """Fused `self * multiplier + addend` with the same multiplier for all elements, without intermediate vectors."""
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = self.{dim} * multiplier + addend.{dim}", _Dims_)
+        return vec
+
+    #<OVERLOAD_DISPATCHER>:mul_add
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_ mul_add_ip(self, _VecClassName_ multiplier, _VecClassName_ addend):
+        #<RETURN_SELF>
+        """Inplace version of `_VecClassName_.mul_add()`."""
+        #<GEN>: gen_for_each_dim("self.{dim} = self.{dim} * multiplier.{dim} + addend.{dim}", _Dims_)
+        return self
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_ mul_add_ip(self, _vTypeC_ multiplier, _VecClassName_ addend):
+        #<RETURN_SELF>
+        """Inplace version of `_VecClassName_.mul_add()` with the same multiplier for all elements."""
+        #<GEN>: gen_for_each_dim("self.{dim} = self.{dim} * multiplier + addend.{dim}", _Dims_)
+        return self
+
+    #<OVERLOAD_DISPATCHER>:mul_add_ip
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_ clamp(self, _VecClassName_ low, _VecClassName_ high):
+        """Clamp every element between the elements of `low` and `high`."""
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = low.{dim} if self.{dim} < low.{dim} else high.{dim} if self.{dim} > high.{dim} else self.{dim}", _Dims_)
+        return vec
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_ clamp(self, _vTypeC_ low, _vTypeC_ high):
+        """Clamp every element between `low` and `high`."""
+        cdef _VecClassName_ vec = _VecClassName_.__new__(_VecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = low if self.{dim} < low else high if self.{dim} > high else self.{dim}", _Dims_)
+        return vec
+
+    #<OVERLOAD_DISPATCHER>:clamp
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_ clamp_ip(self, _VecClassName_ low, _VecClassName_ high):
+        #<RETURN_SELF>
+        """Inplace version of `_VecClassName_.clamp()`."""
+        #<GEN>: gen_for_each_dim("self.{dim} = low.{dim} if self.{dim} < low.{dim} else high.{dim} if self.{dim} > high.{dim} else self.{dim}", _Dims_)
+        return self
+
+    #<OVERLOAD>
+    cdef inline _VecClassName_ clamp_ip(self, _vTypeC_ low, _vTypeC_ high):
+        #<RETURN_SELF>
+        """Inplace version of `_VecClassName_.clamp()` with the same bounds for all elements."""
+        #<GEN>: gen_for_each_dim("self.{dim} = low if self.{dim} < low else high if self.{dim} > high else self.{dim}", _Dims_)
+        return self
+
+    #<OVERLOAD_DISPATCHER>:clamp_ip
+
+    def lerp(self, _VecClassName_ other, _vRealC_ weight, /) -> _FloatVecClassName_:
+        """Linearly interpolate from this vector (weight 0) to the other vector (weight 1), same as `a + (b - a) * weight`."""
+        cdef _FloatVecClassName_ vec = _FloatVecClassName_.__new__(_FloatVecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = self.{dim} + (other.{dim} - self.{dim}) * weight", _Dims_)
+        return vec
+
+    def move_toward(self, _VecClassName_ to, _vRealC_ delta, /) -> _FloatVecClassName_:
+        """Move this vector toward `to` by at most `delta`, without overshooting it."""
+        #<GEN>: gen_for_each_dim("cdef _vRealC_ d{dim} = <_vRealC_> to.{dim} - self.{dim}", _Dims_)
+        cdef _vRealC_ l = #<GEN>: f"_vSqrt_({gen_for_each_dim('d{dim} * d{dim}', _Dims_, join=' + ')})"
+        cdef _FloatVecClassName_ vec = _FloatVecClassName_.__new__(_FloatVecClassName_)
+        if l <= delta or l == 0:
+            #<GEN>: gen_for_each_dim("vec.{dim} = to.{dim}", _Dims_)
+        else:
+            #<GEN>: gen_for_each_dim("vec.{dim} = self.{dim} + d{dim} / l * delta", _Dims_)
+        return vec
+
+    def project_onto(self, _VecClassName_ other, /) -> _FloatVecClassName_:
+        """Project this vector onto the other vector, same as `b * ((a @ b) / (b @ b))`."""
+        cdef _vRealC_ f = #<GEN>: f"({gen_for_each_dim('<_vRealC_> self.{dim} * other.{dim}', _Dims_, join=' + ')}) / ({gen_for_each_dim('<_vRealC_> other.{dim} * other.{dim}', _Dims_, join=' + ')})"
+        cdef _FloatVecClassName_ vec = _FloatVecClassName_.__new__(_FloatVecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = other.{dim} * f", _Dims_)
+        return vec
+
+    def reflect(self, _VecClassName_ normal, /) -> _FloatVecClassName_:
+        """Reflect this vector off the plane (or line) with the given normal, same as `v - n * (2 * (v @ n))`.
+
+        The normal is expected to be normalized.
+        """
+        cdef _vRealC_ d = 2 * (#<GEN>: gen_for_each_dim('<_vRealC_> self.{dim} * normal.{dim}', _Dims_, join=' + ') + ")"
+        cdef _FloatVecClassName_ vec = _FloatVecClassName_.__new__(_FloatVecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = self.{dim} - normal.{dim} * d", _Dims_)
+        return vec
+
+    def slide(self, _VecClassName_ normal, /) -> _FloatVecClassName_:
+        """Remove the component of this vector along the given normal, same as `v - n * (v @ n)`.
+
+        The normal is expected to be normalized.
+        """
+        cdef _vRealC_ d = #<GEN>: gen_for_each_dim('<_vRealC_> self.{dim} * normal.{dim}', _Dims_, join=' + ')
+        cdef _FloatVecClassName_ vec = _FloatVecClassName_.__new__(_FloatVecClassName_)
+        #<GEN>: gen_for_each_dim("vec.{dim} = self.{dim} - normal.{dim} * d", _Dims_)
+        return vec
+    #<IF>: _vType_ is float
+
+    def lerp_ip(self, _VecClassName_ other, _vRealC_ weight, /) -> _VecClassName_:
+        #<RETURN_SELF>
+        """Inplace version of `_VecClassName_.lerp()`."""
+        #<GEN>: gen_for_each_dim("self.{dim} += (other.{dim} - self.{dim}) * weight", _Dims_)
+        return self
+
+    def move_toward_ip(self, _VecClassName_ to, _vRealC_ delta, /) -> _VecClassName_:
+        #<RETURN_SELF>
+        """Inplace version of `_VecClassName_.move_toward()`."""
+        #<GEN>: gen_for_each_dim("cdef _vRealC_ d{dim} = to.{dim} - self.{dim}", _Dims_)
+        cdef _vRealC_ l = #<GEN>: f"_vSqrt_({gen_for_each_dim('d{dim} * d{dim}', _Dims_, join=' + ')})"
+        if l <= delta or l == 0:
+            #<GEN>: gen_for_each_dim("self.{dim} = to.{dim}", _Dims_)
+        else:
+            #<GEN>: gen_for_each_dim("self.{dim} += d{dim} / l * delta", _Dims_)
+        return self
+
+    def reflect_ip(self, _VecClassName_ normal, /) -> _VecClassName_:
+        #<RETURN_SELF>
+        """Inplace version of `_VecClassName_.reflect()`."""
+        cdef _vRealC_ d = 2 * (#<GEN>: gen_for_each_dim('self.{dim} * normal.{dim}', _Dims_, join=' + ') + ")"
+        #<GEN>: gen_for_each_dim("self.{dim} -= normal.{dim} * d", _Dims_)
+        return self
+
+    def slide_ip(self, _VecClassName_ normal, /) -> _VecClassName_:
+        #<RETURN_SELF>
+        """Inplace version of `_VecClassName_.slide()`."""
+        cdef _vRealC_ d = #<GEN>: gen_for_each_dim('self.{dim} * normal.{dim}', _Dims_, join=' + ')
+        #<GEN>: gen_for_each_dim("self.{dim} -= normal.{dim} * d", _Dims_)
+        return self
+    #<ENDIF>
+
+    def angle_to(self, _VecClassName_ other, /) -> _vRealPy_:
+        """The (unsigned) angle between two vectors in radians, in the range [0, pi]."""
+        cdef _vRealC_ dot = #<GEN>: gen_for_each_dim('<_vRealC_> self.{dim} * other.{dim}', _Dims_, join=' + ')
+        #<IF>: _Dims_ == 2
+        cdef _vRealC_ cross = <_vRealC_> self.x * other.y - <_vRealC_> self.y * other.x
+        return _vAtan2_(cross if cross >= 0 else -cross, dot)
+        #<ENDIF>
+        #<IF>: _Dims_ == 3
+        cdef _vRealC_ cx = <_vRealC_> self.y * other.z - <_vRealC_> self.z * other.y
+        cdef _vRealC_ cy = <_vRealC_> self.z * other.x - <_vRealC_> self.x * other.z
+        cdef _vRealC_ cz = <_vRealC_> self.x * other.y - <_vRealC_> self.y * other.x
+        return _vAtan2_(_vSqrt_(cx * cx + cy * cy + cz * cz), dot)
+        #<ENDIF>
+        #<IF>: _Dims_ == 4
+        # |a|^2 * |b|^2 - (a @ b)^2 is the squared length of the 4D wedge product (Lagrange's identity)
+        cdef _vRealC_ wedge_sqr = #<GEN>: f"({gen_for_each_dim('<_vRealC_> self.{dim} * self.{dim}', _Dims_, join=' + ')}) * ({gen_for_each_dim('<_vRealC_> other.{dim} * other.{dim}', _Dims_, join=' + ')}) - dot * dot"
+        return _vAtan2_(_vSqrt_(wedge_sqr if wedge_sqr > 0 else 0), dot)
+        #<ENDIF>
+
+    def swizzle_into(self, str swizzle, object out, /) -> object:
+        """Write the elements picked by a swizzle pattern (e.g. "zxy" or "xyol") into the vector `out` of matching size and return it.
+
+        This is the allocation-free version of swizzle properties, e.g. `vec.swizzle_into("zxy", out)` is equivalent to `out.xyz = vec.zxy`.
+        """
+        #<GEN>: gen_swizzle_into(_Dims_, _vFamily_)
+
+    #<GEN>: gen_swizzle_properties(_Dims_, _vFamily_)
+
+    #<IF>: not _HasAllSwizzles_
+    def __getattr__(self, str name, /) -> object:
+        """Resolve the swizzles that aren't compiled into properties, through a plan cached on first use."""
+        #<GEN>: gen_swizzle_getattr(_Dims_, _vFamily_)
+    #<ENDIF>
+
+#<OVERLOAD_VECTORCALL>:__init__:_VecClassName_
 
 
 @cython.no_gc
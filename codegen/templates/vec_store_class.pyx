@@ -0,0 +1,331 @@
+cimport cython
+
+# Dummy types for the IDE
+ctypedef py_float
+ctypedef py_int
+ctypedef buffer_float
+cdef class Vec_Dims_:
+    pass
+cdef class Vec_Dims_Array:
+    pass
+cdef class Transform_Dims_D:
+    pass
+
+#<TEMPLATE_BEGIN>
+cdef inline void _vec_Dims_d_store_bounds(const buffer_float* p, Py_ssize_t size, py_float* lo, py_float* hi) noexcept nogil:
+    cdef Py_ssize_t i
+    cdef int d
+    cdef py_float v
+    for d in range(_Dims_):
+        lo[d] = hi[d] = p[d]
+    for i in range(_Dims_, size * _Dims_, _Dims_):
+        for d in range(_Dims_):
+            v = p[i + d]
+            if v < lo[d]:
+                lo[d] = v
+            elif v > hi[d]:
+                hi[d] = v
+
+cdef inline void _vec_Dims_d_store_transform(const buffer_float* p, buffer_float* out, Py_ssize_t size, const py_float* t) noexcept nogil:
+    # Same as `Transform_Dims_D.__call__()` for every vector, `out` may alias `p`
+    cdef Py_ssize_t i
+    cdef py_float #<GEN>: gen_for_each_dim("{dim}", _Dims_, join=", ")
+    for i in range(0, size * _Dims_, _Dims_):
+        #<GEN>: gen_for_each_dim("{dim} = p[i + {index}]", _Dims_)
+        #<GEN>: "\n".join(f"out[i + {k}] = <buffer_float> (" + " + ".join(f"{DIMS[j]} * t[{j * _Dims_ + k}]" for j in range(_Dims_)) + f" + t[{_Dims_ * _Dims_ + k}])" for k in range(_Dims_))
+
+cdef inline void _vec_Dims_d_store_select(const buffer_float* p, Py_ssize_t size, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr, IndexList* found) noexcept nogil:
+    # Indices of the vectors inside the box [lo, hi], or within the radius of the center if it's not NULL
+    cdef Py_ssize_t i
+    cdef const buffer_float* q
+    cdef py_float dist
+    for i in range(size):
+        q = p + i * _Dims_
+        if center != NULL:
+            dist = #<GEN>: gen_for_each_dim("(q[{index}] - center[{index}]) * (q[{index}] - center[{index}])", _Dims_, join=" + ")
+            if dist <= radius_sqr:
+                index_list_append(found, i)
+        elif #<GEN>: gen_for_each_dim("lo[{index}] <= q[{index}] <= hi[{index}]", _Dims_, join=" and ") + ":"
+            index_list_append(found, i)
+
+cdef inline int _vec_Dims_d_store_check_format(str format) except -1:
+    if format not in ("d", "f"):
+        raise ValueError(f"Expected format 'd' (float64) or 'f' (float32), got {format!r}")
+    return 0
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Vec_Dims_Store:
+    """A file of float64 or float32 `Vec_Dims_`s mapped into memory with `mmap`, for point sets larger than the memory.
+
+    Nothing is read up front: indexing and slicing copy single vectors or chunks out of the mapping,
+    and the batch operations stream through it without any intermediate copies.
+    """
+
+    cdef object mapping
+    cdef Py_buffer view
+    cdef char* data
+    cdef Py_ssize_t size
+    cdef bint is_double
+    cdef bint is_writable
+    cdef bint is_closed
+
+
+    def __cinit__(self):
+        self.mapping = None
+        self.data = NULL
+        self.size = 0
+        self.is_closed = True
+
+    def __dealloc__(self):
+        if self.data != NULL:
+            PyBuffer_Release(&self.view)
+
+    def __init__(self, str path, /, str format = "d", bint writable = False):
+        """Map an existing file of contiguous `format` ("d" for float64 or "f" for float32) vectors in native byte order.
+
+        The file is only modified through the store if `writable` is True.
+        """
+        _vec_Dims_d_store_check_format(format)
+        self.is_double = format == "d"
+        self.is_writable = writable
+        cdef Py_ssize_t stride = self._stride()
+        with open(path, "r+b" if writable else "rb") as file:
+            length = os.fstat(file.fileno()).st_size
+            if length % stride != 0:
+                raise ValueError(f"File size {length} is not a multiple of the {stride} bytes of a vector")
+            # Empty files can't be mapped
+            if length != 0:
+                self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        if self.mapping is not None:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # Reading ahead of the batch operations matters more than the random access
+                self.mapping.madvise(mmap.MADV_SEQUENTIAL)
+            PyObject_GetBuffer(self.mapping, &self.view, PyBUF_SIMPLE | (PyBUF_WRITABLE if writable else 0))
+            self.data = <char*> self.view.buf
+            self.size = length // stride
+        self.is_closed = False
+
+    @staticmethod
+    def create(str path, Py_ssize_t size, /, str format = "d") -> Vec_Dims_Store:
+        """Create (or overwrite) a file of `size` zero vectors and map it writable."""
+        if size < 0:
+            raise ValueError(f"Negative Vec_Dims_Store size: {size}")
+        _vec_Dims_d_store_check_format(format)
+        with open(path, "wb") as file:
+            file.truncate(size * _Dims_ * (8 if format == "d" else 4))
+        return Vec_Dims_Store(path, format, True)
+
+    cdef inline Py_ssize_t _stride(self) noexcept:
+        return _Dims_ * (sizeof(double) if self.is_double else sizeof(float))
+
+    cdef inline int _check_open(self) except -1:
+        if self.is_closed:
+            raise ValueError("I/O operation on a closed Vec_Dims_Store")
+        return 0
+
+    cdef inline int _check_writable(self) except -1:
+        self._check_open()
+        if not self.is_writable:
+            raise TypeError("Vec_Dims_Store is read-only")
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Vec_Dims_Store index out of range: {index}")
+        return index
+
+    cdef inline void _read(self, Py_ssize_t index, py_float* out) noexcept nogil:
+        cdef const double* pd
+        cdef const float* pf
+        if self.is_double:
+            pd = <const double*> self.data + index * _Dims_
+            #<GEN>: gen_for_each_dim("out[{index}] = pd[{index}]", _Dims_)
+        else:
+            pf = <const float*> self.data + index * _Dims_
+            #<GEN>: gen_for_each_dim("out[{index}] = pf[{index}]", _Dims_)
+
+    cdef inline void _write(self, Py_ssize_t index, const py_float* value) noexcept nogil:
+        cdef double* pd
+        cdef float* pf
+        if self.is_double:
+            pd = <double*> self.data + index * _Dims_
+            #<GEN>: gen_for_each_dim("pd[{index}] = <double> value[{index}]", _Dims_)
+        else:
+            pf = <float*> self.data + index * _Dims_
+            #<GEN>: gen_for_each_dim("pf[{index}] = <float> value[{index}]", _Dims_)
+
+    def close(self) -> None:
+        """Flush the changes and unmap the file, the store can't be used afterwards."""
+        if self.is_closed:
+            return
+        if self.data != NULL:
+            PyBuffer_Release(&self.view)
+            self.data = NULL
+        if self.mapping is not None:
+            if self.is_writable:
+                self.mapping.flush()
+            self.mapping.close()
+            self.mapping = None
+        self.is_closed = True
+
+    def flush(self) -> None:
+        """Write the changes back to the file."""
+        self._check_open()
+        if self.mapping is not None and self.is_writable:
+            self.mapping.flush()
+
+    def __enter__(self) -> Vec_Dims_Store:
+        #<RETURN_SELF>
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Vec_Dims_Store({self.size} vectors, format={self.format!r}{', closed' if self.is_closed else ''})"
+
+    @property
+    def format(self) -> str:
+        """The buffer format of the elements in the file, "d" (float64) or "f" (float32)."""
+        return "d" if self.is_double else "f"
+
+    @property
+    def writable(self) -> bool:
+        """If the file can be modified through this store."""
+        return self.is_writable
+
+    @property
+    def closed(self) -> bool:
+        """If the store has been closed."""
+        return self.is_closed
+
+
+    def __len__(self) -> int:
+        """The number of vectors in the file."""
+        return self.size
+
+    def __getitem__(self, object key) -> Vec_Dims_ | Vec_Dims_Array:
+        """Read the n-th vector, or read a slice of vectors into a `Vec_Dims_Array`."""
+        self._check_open()
+        cdef Vec_Dims_ vec
+        cdef py_float[_Dims_] value
+        if not isinstance(key, slice):
+            self._read(self._index(key), value)
+            vec = Vec_Dims_.__new__(Vec_Dims_)
+            #<GEN>: gen_for_each_dim("vec.{dim} = value[{index}]", _Dims_)
+            return vec
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        cdef Vec_Dims_Array arr = Vec_Dims_Array(len(range(start, stop, step)))
+        with nogil:
+            for i in range(arr.size):
+                self._read(start + i * step, arr.data + i * _Dims_)
+        return arr
+
+    def __setitem__(self, object key, object value) -> None:
+        """Write the n-th vector, or write a `Vec_Dims_Array` to a slice of the same length."""
+        self._check_writable()
+        cdef Vec_Dims_ vec
+        cdef Vec_Dims_Array arr
+        cdef py_float[_Dims_] v
+        if not isinstance(key, slice):
+            vec = <Vec_Dims_?> value
+            #<GEN>: gen_for_each_dim("v[{index}] = vec.{dim}", _Dims_)
+            self._write(self._index(key), v)
+            return
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        arr = <Vec_Dims_Array?> value
+        if arr.size != len(range(start, stop, step)):
+            raise ValueError(f"Vec_Dims_Store slice size mismatch: {len(range(start, stop, step))} and {arr.size}")
+        with nogil:
+            for i in range(arr.size):
+                self._write(start + i * step, arr.data + i * _Dims_)
+
+    def chunks(self, Py_ssize_t size = 65536, /) -> Iterator[Vec_Dims_Array]:
+        """Read the vectors in consecutive `Vec_Dims_Array`s of (up to) `size` vectors."""
+        if size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {size}")
+        self._check_open()
+        return (self[start:start + size] for start in range(0, self.size, size))
+
+
+    def bounds(self) -> tuple[Vec_Dims_, Vec_Dims_]:
+        """The axis-aligned bounding box of all the vectors, as the (min, max) corners."""
+        self._check_open()
+        if self.size == 0:
+            raise ValueError("Reduction of an empty Vec_Dims_Store")
+        cdef py_float[_Dims_] lo, hi
+        with nogil:
+            if self.is_double:
+                _vec_Dims_d_store_bounds(<const double*> self.data, self.size, lo, hi)
+            else:
+                _vec_Dims_d_store_bounds(<const float*> self.data, self.size, lo, hi)
+        cdef Vec_Dims_ vmin = Vec_Dims_.__new__(Vec_Dims_)
+        cdef Vec_Dims_ vmax = Vec_Dims_.__new__(Vec_Dims_)
+        #<GEN>: gen_for_each_dim("vmin.{dim} = lo[{index}]", _Dims_)
+        #<GEN>: gen_for_each_dim("vmax.{dim} = hi[{index}]", _Dims_)
+        return vmin, vmax
+
+    def transform_into(self, Transform_Dims_D transform, Vec_Dims_Store out, /) -> Vec_Dims_Store:
+        """Apply `transform` to every vector and write the results into `out` (which can be `self`), then return `out`.
+
+        Both stores must have the same length and format.
+        """
+        self._check_open()
+        out._check_writable()
+        if out.size != self.size or out.is_double != self.is_double:
+            raise ValueError(f"Vec_Dims_Store mismatch: {self!r} and {out!r}")
+        cdef const py_float* t = &transform.xx
+        with nogil:
+            if self.is_double:
+                _vec_Dims_d_store_transform(<const double*> self.data, <double*> out.data, self.size, t)
+            else:
+                _vec_Dims_d_store_transform(<const float*> self.data, <float*> out.data, self.size, t)
+        return out
+
+    def transform_ip(self, Transform_Dims_D transform, /) -> Vec_Dims_Store:
+        #<RETURN_SELF>
+        """Apply `transform` to every vector inplace."""
+        return self.transform_into(transform, self)
+
+    cdef inline object _select(self, const py_float* lo, const py_float* hi, const py_float* center, py_float radius_sqr):
+        self._check_open()
+        cdef IndexList found = IndexList(NULL, 0, 0, False)
+        cdef object result
+        cdef py_int[::1] out
+        cdef Py_ssize_t i
+        try:
+            with nogil:
+                if self.is_double:
+                    _vec_Dims_d_store_select(<const double*> self.data, self.size, lo, hi, center, radius_sqr, &found)
+                else:
+                    _vec_Dims_d_store_select(<const float*> self.data, self.size, lo, hi, center, radius_sqr, &found)
+            if found.failed:
+                raise MemoryError()
+            result = new_scalar_array("q", found.size)
+            out = result
+            for i in range(found.size):
+                out[i] = found.data[i]
+            return result
+        finally:
+            PyMem_RawFree(found.data)
+
+    def query_box(self, Vec_Dims_ lo, Vec_Dims_ hi, /) -> array:
+        """The indices of all the vectors inside the axis-aligned box between the `lo` and `hi` corners (inclusive), in ascending order."""
+        cdef py_float[_Dims_] l, h
+        #<GEN>: gen_for_each_dim("l[{index}] = lo.{dim}", _Dims_)
+        #<GEN>: gen_for_each_dim("h[{index}] = hi.{dim}", _Dims_)
+        return self._select(l, h, NULL, 0)
+
+    def query_radius(self, Vec_Dims_ center, py_float radius, /) -> array:
+        """The indices of all the vectors within `radius` (inclusive) of `center`, in ascending order."""
+        cdef py_float[_Dims_] c
+        #<GEN>: gen_for_each_dim("c[{index}] = center.{dim}", _Dims_)
+        return self._select(NULL, NULL, c, radius * radius)
+#<TEMPLATE_END>
@@ -1,24 +1,14 @@
 #<GEN>: from_template(open("templates/directives.pyx").read())
 
 #<TEMPLATE_BEGIN>
-from libc.math cimport sqrt
+from libc.math cimport sqrt, sqrtf, sqrtl, atan2, atan2f, atan2l
 
+#<GEN>: step_generate("swizzle_plan.pyx")
 
-#<GEN>: gen_vec_class(2, float)
 
+#<GEN>: gen_vec_classes((2, float), (3, float), (4, float), (2, float64), (3, float64), (4, float64), (2, float32), (3, float32), (4, float32))
 
-#<GEN>: gen_vec_class(3, float)
 
+#<GEN>: gen_vec_array_classes((2, float), (3, float), (4, float))
 
-#<GEN>: gen_vec_class(4, float)
-
-
-#<GEN>: gen_vec_class(2, int)
-
-
-#<GEN>: gen_vec_class(3, int)
-
-
-#<GEN>: gen_vec_class(4, int)
-
-#<TEMPLATE_END>
\ No newline at end of file
+#<TEMPLATE_END>
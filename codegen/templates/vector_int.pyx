@@ -0,0 +1,14 @@
+#<GEN>: from_template(open("templates/directives.pyx").read())
+
+#<TEMPLATE_BEGIN>
+from libc.math cimport sqrt, sqrtf, sqrtl, atan2, atan2f, atan2l
+
+#<GEN>: step_generate("swizzle_plan.pyx")
+
+
+#<GEN>: gen_vec_classes((2, int), (3, int), (4, int), (2, int32), (3, int32), (4, int32))
+
+
+#<GEN>: gen_vec_array_classes((2, int), (3, int), (4, int))
+
+#<TEMPLATE_END>
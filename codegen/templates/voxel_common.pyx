@@ -0,0 +1,55 @@
+# Dummy types for the IDE
+ctypedef py_int
+ctypedef uint64_t
+cdef class Vec3i:
+    pass
+
+#<TEMPLATE_BEGIN>
+# Voxel coordinates are packed into 21 bits per axis, so packed keys never have the highest bit set
+DEF VOXEL_BITS = 21
+DEF VOXEL_OFFSET = 1 << 20
+DEF VOXEL_MASK = (1 << 21) - 1
+# Markers of the unused and the removed slots of the voxel tables, larger than any packed key
+cdef uint64_t VOXEL_EMPTY = 0xFFFFFFFFFFFFFFFFULL
+cdef uint64_t VOXEL_TOMBSTONE = 0xFFFFFFFFFFFFFFFEULL
+
+cdef inline bint voxel_in_range(py_int x, py_int y, py_int z) noexcept nogil:
+    return -VOXEL_OFFSET <= x < VOXEL_OFFSET and -VOXEL_OFFSET <= y < VOXEL_OFFSET and -VOXEL_OFFSET <= z < VOXEL_OFFSET
+
+cdef inline uint64_t pack_voxel_xyz(py_int x, py_int y, py_int z) noexcept nogil:
+    return (<uint64_t> (x + VOXEL_OFFSET) << (2 * VOXEL_BITS)) | (<uint64_t> (y + VOXEL_OFFSET) << VOXEL_BITS) | <uint64_t> (z + VOXEL_OFFSET)
+
+cdef inline py_int unpack_voxel_x(uint64_t key) noexcept nogil:
+    return <py_int> ((key >> (2 * VOXEL_BITS)) & VOXEL_MASK) - VOXEL_OFFSET
+
+cdef inline py_int unpack_voxel_y(uint64_t key) noexcept nogil:
+    return <py_int> ((key >> VOXEL_BITS) & VOXEL_MASK) - VOXEL_OFFSET
+
+cdef inline py_int unpack_voxel_z(uint64_t key) noexcept nogil:
+    return <py_int> (key & VOXEL_MASK) - VOXEL_OFFSET
+
+cdef inline int pack_voxel(object key, uint64_t* out) except -1:
+    # Pack a `Vec3i` or an (x, y, z) sequence of integers
+    cdef py_int x, y, z
+    cdef Vec3i vec
+    cdef object ox, oy, oz
+    if isinstance(key, Vec3i):
+        vec = <Vec3i> key
+        x, y, z = vec.x, vec.y, vec.z
+    else:
+        ox, oy, oz = key
+        if not (PyLong_Check(ox) and PyLong_Check(oy) and PyLong_Check(oz)):
+            raise TypeError(f"Expected a Vec3i or an (x, y, z) sequence of ints, got {key!r}")
+        x, y, z = ox, oy, oz
+    if not voxel_in_range(x, y, z):
+        raise OverflowError(f"Voxel coordinates out of range [-2**20, 2**20): {key!r}")
+    out[0] = pack_voxel_xyz(x, y, z)
+    return 0
+
+cdef inline Vec3i unpack_voxel(uint64_t key):
+    cdef Vec3i vec = Vec3i.__new__(Vec3i)
+    vec.x = unpack_voxel_x(key)
+    vec.y = unpack_voxel_y(key)
+    vec.z = unpack_voxel_z(key)
+    return vec
+#<TEMPLATE_END>
@@ -0,0 +1,384 @@
+cimport cython
+
+# Dummy types for the IDE
+ctypedef py_int
+ctypedef uint64_t
+cdef class Vec3i:
+    pass
+cdef class Vec3iArray:
+    pass
+
+#<TEMPLATE_BEGIN>
+# noinspection SpellCheckingInspection
+@cython.final
+cdef class _ClassName_:
+    #<IF>: _IsMap_
+    """A mapping from `Vec3i` voxel coordinates to objects, stored compactly.
+
+    Coordinates are packed into 64-bit integers (21 bits per axis, so every component must be in [-2**20, 2**20))
+    in an open addressing table, keys can be given as `Vec3i`s or (x, y, z) tuples.
+    """
+    #<ENDIF>
+    #<IF>: not _IsMap_
+    """A set of `Vec3i` voxel coordinates, stored compactly.
+
+    Coordinates are packed into 64-bit integers (21 bits per axis, so every component must be in [-2**20, 2**20))
+    in an open addressing table, keys can be given as `Vec3i`s or (x, y, z) tuples.
+    """
+    #<ENDIF>
+
+    cdef uint64_t* keys
+    #<IF>: _IsMap_
+    cdef list _values
+    #<ENDIF>
+    cdef Py_ssize_t capacity
+    cdef Py_ssize_t size
+    cdef Py_ssize_t used
+    cdef Py_ssize_t version
+
+
+    def __cinit__(self):
+        self.keys = NULL
+        self.capacity = self.size = self.used = self.version = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.keys)
+
+    #<IF>: _IsMap_
+    def __init__(self, object items = None, /):
+        """Create a map, optionally from a mapping or an iterable of (key, value) pairs."""
+        self._rehash(16)
+        if items is not None:
+            if hasattr(items, "items"):
+                items = items.items()
+            for key, value in items:
+                self[key] = value
+    #<ENDIF>
+    #<IF>: not _IsMap_
+    def __init__(self, object keys = None, /):
+        """Create a set, optionally from an iterable of keys."""
+        self._rehash(16)
+        if keys is not None:
+            for key in keys:
+                self.add(key)
+    #<ENDIF>
+
+
+    cdef int _rehash(self, Py_ssize_t capacity) except -1:
+        cdef uint64_t* old_keys = self.keys
+        cdef Py_ssize_t old_capacity = self.capacity
+        self.keys = <uint64_t*> PyMem_Malloc(capacity * sizeof(uint64_t))
+        if self.keys == NULL:
+            self.keys = old_keys
+            raise MemoryError()
+        memset(self.keys, 0xFF, capacity * sizeof(uint64_t))
+        #<IF>: _IsMap_
+        cdef list old_values = self._values
+        self._values = [None] * capacity
+        #<ENDIF>
+        self.capacity = capacity
+        self.used = self.size
+        cdef Py_ssize_t i, slot
+        for i in range(old_capacity):
+            if old_keys[i] < VOXEL_TOMBSTONE:
+                slot = self._probe(old_keys[i], True)
+                self.keys[slot] = old_keys[i]
+                #<IF>: _IsMap_
+                self._values[slot] = old_values[i]
+                #<ENDIF>
+        PyMem_Free(old_keys)
+        return 0
+
+    cdef inline Py_ssize_t _probe(self, uint64_t key, bint insert) noexcept nogil:
+        # The slot of the key, -1 if it's not found (or where to insert it if `insert`)
+        cdef Py_ssize_t mask = self.capacity - 1
+        cdef Py_ssize_t slot = <Py_ssize_t> (mix64(key) & <uint64_t> mask)
+        cdef Py_ssize_t free = -1
+        while self.keys[slot] != VOXEL_EMPTY:
+            if self.keys[slot] == key:
+                return slot
+            if self.keys[slot] == VOXEL_TOMBSTONE and free == -1:
+                free = slot
+            slot = (slot + 1) & mask
+        if not insert:
+            return -1
+        return slot if free == -1 else free
+
+    cdef Py_ssize_t _insert(self, uint64_t key) except -1:
+        # The slot of the key, adding it if needed
+        cdef Py_ssize_t slot = self._probe(key, False)
+        if slot != -1:
+            return slot
+        # Keep the table at most 2/3 full, counting tombstones
+        if (self.used + 1) * 3 > self.capacity * 2:
+            self._rehash(self.capacity * 2 if (self.size + 1) * 3 > self.capacity else self.capacity)
+        slot = self._probe(key, True)
+        if self.keys[slot] == VOXEL_EMPTY:
+            self.used += 1
+        self.keys[slot] = key
+        self.size += 1
+        self.version += 1
+        return slot
+
+    cdef inline void _remove_slot(self, Py_ssize_t slot):
+        self.keys[slot] = VOXEL_TOMBSTONE
+        #<IF>: _IsMap_
+        self._values[slot] = None
+        #<ENDIF>
+        self.size -= 1
+        self.version += 1
+
+    cdef inline Vec3iArray _neighbors(self, object key, int connectivity):
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef py_int x = unpack_voxel_x(packed), y = unpack_voxel_y(packed), z = unpack_voxel_z(packed)
+        cdef int dx, dy, dz, n
+        cdef Py_ssize_t count = 0
+        cdef py_int[26 * 3] found
+        if connectivity != 6 and connectivity != 18 and connectivity != 26:
+            raise ValueError(f"Connectivity must be 6, 18 or 26, got {connectivity}")
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                for dz in range(-1, 2):
+                    n = (dx != 0) + (dy != 0) + (dz != 0)
+                    if n == 0 or (n == 3 and connectivity < 26) or (n == 2 and connectivity < 18):
+                        continue
+                    if not voxel_in_range(x + dx, y + dy, z + dz):
+                        continue
+                    if self._probe(pack_voxel_xyz(x + dx, y + dy, z + dz), False) != -1:
+                        found[count * 3], found[count * 3 + 1], found[count * 3 + 2] = x + dx, y + dy, z + dz
+                        count += 1
+        cdef Vec3iArray arr = Vec3iArray.__new__(Vec3iArray)
+        arr._alloc(count)
+        memcpy(arr.data, found, count * 3 * sizeof(py_int))
+        return arr
+
+
+    def __len__(self) -> int:
+        """The number of keys."""
+        return self.size
+
+    def __bool__(self) -> bool:
+        """If there are any keys."""
+        return self.size != 0
+
+    def __contains__(self, object key) -> bool:
+        """If the key is in this container, out of range keys are never contained."""
+        cdef uint64_t packed
+        try:
+            pack_voxel(key, &packed)
+        except OverflowError:
+            return False
+        return self._probe(packed, False) != -1
+
+    def __iter__(self) -> __ClassName__iterator:
+        """Iterate over the keys as `Vec3i`s, in no particular order."""
+        cdef __ClassName__iterator iterator = __ClassName__iterator.__new__(__ClassName__iterator)
+        iterator.container = self
+        iterator.slot = 0
+        iterator.version = self.version
+        return iterator
+
+    def clear(self) -> None:
+        """Remove all the keys."""
+        PyMem_Free(self.keys)
+        self.keys = NULL
+        self.capacity = self.size = self.used = 0
+        self._rehash(16)
+        self.version += 1
+
+    def chunks(self, Py_ssize_t size = 4096, /) -> __ClassName__chunk_iterator:
+        #<IF>: _IsMap_
+        """Iterate over the entries in chunks of up to `size`, each one as a `Vec3iArray` of keys and a list of the values."""
+        #<ENDIF>
+        #<IF>: not _IsMap_
+        """Iterate over the keys in chunks of up to `size`, each one as a `Vec3iArray`."""
+        #<ENDIF>
+        if size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {size}")
+        cdef __ClassName__chunk_iterator iterator = __ClassName__chunk_iterator.__new__(__ClassName__chunk_iterator)
+        iterator.container = self
+        iterator.slot = 0
+        iterator.chunk_size = size
+        iterator.version = self.version
+        return iterator
+    #<IF>: not _IsMap_
+
+    def neighbors(self, object key, int connectivity = 6, /) -> Vec3iArray:
+        """The neighbors of a voxel (6: faces, 18: faces and edges, 26: faces, edges and corners) that are in the set."""
+        return self._neighbors(key, connectivity)
+
+    def add(self, object key, /) -> None:
+        """Add a key."""
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        self._insert(packed)
+
+    def discard(self, object key, /) -> None:
+        """Remove a key if it is present."""
+        cdef uint64_t packed
+        try:
+            pack_voxel(key, &packed)
+        except OverflowError:
+            return
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot != -1:
+            self._remove_slot(slot)
+
+    def remove(self, object key, /) -> None:
+        """Remove a key, raise `KeyError` if it's not present."""
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot == -1:
+            raise KeyError(key)
+        self._remove_slot(slot)
+    #<ENDIF>
+    #<IF>: _IsMap_
+
+    def neighbors(self, object key, int connectivity = 6, /) -> tuple[Vec3iArray, list]:
+        """The neighbors of a voxel (6: faces, 18: faces and edges, 26: faces, edges and corners) that are in the map.
+
+        Returns their keys as a `Vec3iArray` and a list of their values.
+        """
+        cdef Vec3iArray arr = self._neighbors(key, connectivity)
+        cdef list values = []
+        cdef Py_ssize_t i
+        for i in range(arr.size):
+            values.append(self._values[self._probe(pack_voxel_xyz(arr.data[i * 3], arr.data[i * 3 + 1], arr.data[i * 3 + 2]), False)])
+        return arr, values
+
+    def __getitem__(self, object key) -> object:
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot == -1:
+            raise KeyError(key)
+        return self._values[slot]
+
+    def __setitem__(self, object key, object value) -> None:
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        self._values[self._insert(packed)] = value
+
+    def __delitem__(self, object key) -> None:
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot == -1:
+            raise KeyError(key)
+        self._remove_slot(slot)
+
+    def get(self, object key, object default = None, /) -> object:
+        """Get the value of a key, or `default` if it's not present."""
+        cdef uint64_t packed
+        try:
+            pack_voxel(key, &packed)
+        except OverflowError:
+            return default
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        return default if slot == -1 else self._values[slot]
+
+    def pop(self, object key, /) -> object:
+        """Remove a key and return its value, raise `KeyError` if it's not present."""
+        cdef uint64_t packed
+        pack_voxel(key, &packed)
+        cdef Py_ssize_t slot = self._probe(packed, False)
+        if slot == -1:
+            raise KeyError(key)
+        cdef object value = self._values[slot]
+        self._remove_slot(slot)
+        return value
+
+    def values(self) -> list:
+        """A list of all the values, in the same order as iterating over the keys."""
+        cdef list values = []
+        cdef Py_ssize_t i
+        for i in range(self.capacity):
+            if self.keys[i] < VOXEL_TOMBSTONE:
+                values.append(self._values[i])
+        return values
+
+    def items(self) -> list:
+        """A list of all the (`Vec3i` key, value) pairs."""
+        cdef list items = []
+        cdef Py_ssize_t i
+        for i in range(self.capacity):
+            if self.keys[i] < VOXEL_TOMBSTONE:
+                items.append((unpack_voxel(self.keys[i]), self._values[i]))
+        return items
+    #<ENDIF>
+
+
+@cython.no_gc
+@cython.final
+@cython.freelist(8)
+cdef class __ClassName__iterator:
+    cdef _ClassName_ container
+    cdef Py_ssize_t slot
+    cdef Py_ssize_t version
+
+    def __next__(self) -> Vec3i:
+        if self.version != self.container.version:
+            raise RuntimeError("_ClassName_ changed size during iteration")
+        while self.slot < self.container.capacity:
+            self.slot += 1
+            if self.container.keys[self.slot - 1] < VOXEL_TOMBSTONE:
+                return unpack_voxel(self.container.keys[self.slot - 1])
+        raise StopIteration
+
+    def __iter__(self) -> __ClassName__iterator:
+        #<RETURN_SELF>
+        return self
+
+
+@cython.no_gc
+@cython.final
+cdef class __ClassName__chunk_iterator:
+    cdef _ClassName_ container
+    cdef Py_ssize_t slot
+    cdef Py_ssize_t chunk_size
+    cdef Py_ssize_t version
+
+    #<IF>: _IsMap_
+    def __next__(self) -> tuple[Vec3iArray, list]:
+    #<ENDIF>
+    #<IF>: not _IsMap_
+    def __next__(self) -> Vec3iArray:
+    #<ENDIF>
+        if self.version != self.container.version:
+            raise RuntimeError("_ClassName_ changed size during iteration")
+        cdef Py_ssize_t start = self.slot, count = 0
+        cdef uint64_t* keys = self.container.keys
+        while self.slot < self.container.capacity and count < self.chunk_size:
+            if keys[self.slot] < VOXEL_TOMBSTONE:
+                count += 1
+            self.slot += 1
+        if count == 0:
+            raise StopIteration
+        cdef Vec3iArray arr = Vec3iArray.__new__(Vec3iArray)
+        arr._alloc(count)
+        #<IF>: _IsMap_
+        cdef list values = []
+        #<ENDIF>
+        cdef Py_ssize_t i, j = 0
+        for i in range(start, self.slot):
+            if keys[i] < VOXEL_TOMBSTONE:
+                arr.data[j * 3] = unpack_voxel_x(keys[i])
+                arr.data[j * 3 + 1] = unpack_voxel_y(keys[i])
+                arr.data[j * 3 + 2] = unpack_voxel_z(keys[i])
+                j += 1
+                #<IF>: _IsMap_
+                values.append(self.container._values[i])
+                #<ENDIF>
+        #<IF>: _IsMap_
+        return arr, values
+        #<ENDIF>
+        #<IF>: not _IsMap_
+        return arr
+        #<ENDIF>
+
+    def __iter__(self) -> __ClassName__chunk_iterator:
+        #<RETURN_SELF>
+        return self
+#<TEMPLATE_END>
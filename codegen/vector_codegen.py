@@ -1,7 +1,7 @@
 from itertools import product
 from typing import Type, Any, Iterator
 
-from codegen_helper import from_template, process_overloads
+from codegen_helper import from_template, process_overloads, read_template
 import codegen_helper as codegen
 
 
@@ -9,23 +9,77 @@ DIMS = ("x", "y", "z", "w")
 LENS = (2, 3, 4)
 SPECIAL_SWIZS = ("o", "l")
 
+# Swizzles compiled into properties in a slim build (`gen_all.py --slim`) and for the compact families,
+# permutations of all elements are always compiled since they have setters.
+HOT_SWIZZLES = ("xy", "yx", "xz", "zx", "yz", "zy", "xyo", "xoy", "xyl", "xyzo", "xyzl")
+# Swizzles compiled into properties, None for every swizzle.
+# The others are resolved on first use by `__getattr__`.
+SWIZZLE_SET: set[str] | None = None
+
+
+class float64(float):
+    """Marker type of the `double` backed vector family."""
+
+
+class float32(float):
+    """Marker type of the `float` backed vector family."""
+
+
+class int32(int):
+    """Marker type of the `int` backed vector family."""
+
+
+# The vector families, `float` and `int` being the long double and long long backed base families
+VEC_TYPES = (float, int, float64, float32, int32)
+
+# C type, class name suffix, buffer format and documentation of the element type of every family
+_FAMILIES: dict[Type, tuple[str, str, str, str]] = {
+    float: ("py_float", "", "g", ""),
+    int: ("py_int", "i", "q", ""),
+    float64: ("double", "d", "d", " of `double`s"),
+    float32: ("float", "f", "f", " of `float`s"),
+    int32: ("int", "i32", "i", " of `int`s"),
+}
+
+# The floating-point family used for the results of lengths and transforms of every family
+_REAL_TYPES: dict[Type, Type] = {
+    float: float,
+    int: float,
+    float64: float64,
+    float32: float32,
+    int32: float64,
+}
+
+# Suffix of the libc.math functions of the floating-point families
+_MATH_SUFFIXES: dict[Type, str] = {float: "l", float64: "", float32: "f"}
+
+_TYPE_NAMES: dict[Type, str] = {
+    float: "floating-point",
+    int: "integer",
+    float64: "double precision",
+    float32: "single precision",
+    int32: "32-bit integer",
+}
+
 
 def get_c_type(vtype: Type) -> str:
-    if vtype is float:
-        return f"py_float"
-    elif vtype is int:
-        return f"py_int"
-    else:
-        assert False
+    return _FAMILIES[vtype][0]
 
 
 def get_vec_class_name(dims: int, vtype: Type) -> str:
-    if vtype is float:
-        return f"Vec{dims}"
-    elif vtype is int:
-        return f"Vec{dims}i"
-    else:
-        assert False
+    return f"Vec{dims}{_FAMILIES[vtype][1]}"
+
+
+def get_transform_class_name(dims: int, vtype: Type) -> str:
+    return f"Transform{dims}D{_FAMILIES[_REAL_TYPES[vtype]][1]}"
+
+
+def get_vec_array_class_name(dims: int, vtype: Type) -> str:
+    return f"{get_vec_class_name(dims, vtype)}Array"
+
+
+def get_buffer_format(vtype: Type) -> str:
+    return _FAMILIES[vtype][2]
 
 
 def gen_var_decls(dims: int, vtype_c: str) -> str:
@@ -37,14 +91,82 @@ def gen_single_value_constructor(dims: int, value: Any) -> str:
 
 
 def gen_type_conversion_constructor(dims: int, vtype: Type) -> str:
+    # The floating-point module is cimported by the integer one, so it converts the integer vectors
+    # with a catch-all overload that looks up their classes at runtime instead of cimporting them
+    is_float = issubclass(vtype, float)
+    funcs = []
+    for from_type in VEC_TYPES:
+        if from_type is vtype or (is_float and not issubclass(from_type, float)):
+            continue
+        func = "#<OVERLOAD>\n"
+        func += f"cdef inline void __init__(self, {get_vec_class_name(dims, from_type)} vec) noexcept:\n"
+        func += f'    """Convert a {_TYPE_NAMES[from_type]} vector to a {_TYPE_NAMES[vtype]} vector."""\n'
+        for dim in DIMS[:dims]:
+            func += f"    self.{dim} = <{get_c_type(vtype)}>vec.{dim}\n"
+        funcs.append(func)
+    if is_float:
+        names = [
+            get_vec_class_name(dims, t) for t in VEC_TYPES if not issubclass(t, float)
+        ]
+        func = "#<OVERLOAD>\n"
+        func += "cdef inline void __init__(self, object vec):\n"
+        func += f'    """Convert an integer vector ({" or ".join(f"`{n}`" for n in names)}) to a {_TYPE_NAMES[vtype]} vector."""\n'
+        func += '    cdef object module = sys.modules.get("spatium._vector_int")\n'
+        func += f"    if module is None or type(vec) not in ({', '.join(f'module.{n}' for n in names)}):\n"
+        func += '        raise TypeError(f"Expected a vector or a number, got {vec}")\n'
+        for dim in DIMS[:dims]:
+            func += f"    self.{dim} = <{get_c_type(vtype)}><py_int>vec.{dim}\n"
+        funcs.append(func)
+    return "\n".join(funcs)
+
+
+def gen_transform_conversion_constructors(dims: int, vtype: Type) -> str:
+    fields = [f"{a}{b}" for a in DIMS[:dims] + ("o",) for b in DIMS[:dims]]
+    funcs = []
+    for from_type in _MATH_SUFFIXES:
+        if from_type is vtype:
+            continue
+        func = "#<OVERLOAD>\n"
+        func += f"cdef inline void __init__(self, {get_transform_class_name(dims, from_type)} transform) noexcept:\n"
+        func += f'    """Convert a {_TYPE_NAMES[from_type]} transform to a {_TYPE_NAMES[vtype]} transform."""\n'
+        for field in fields:
+            func += f"    self.{field} = <{get_c_type(vtype)}>transform.{field}\n"
+        funcs.append(func)
+    return "\n".join(funcs)
+
+
+def gen_array_type_conversion_constructor(dims: int, vtype: Type) -> str:
     assert vtype is int or vtype is float
-    from_type = float if vtype is int else int
-    type_str = {int: "integer", float: "floating-point"}
+    if vtype is float:
+        # Converted by the catch-all overload, see `gen_array_int_conversion()`
+        return ""
+    from_type = float
     out = "#<OVERLOAD>\n"
-    out += f"cdef inline void __init__(self, {get_vec_class_name(dims, from_type)} vec) noexcept:\n"
-    out += f'    """Convert a {type_str[from_type]} vector to a {type_str[vtype]} vector."""\n'
-    for dim in DIMS[:dims]:
-        out += f"    self.{dim} = <{get_c_type(vtype)}>vec.{dim}\n"
+    out += f"cdef inline void __init__(self, {get_vec_array_class_name(dims, from_type)} other):\n"
+    out += f'    """Convert an array of {_TYPE_NAMES[from_type]} vectors to an array of {_TYPE_NAMES[vtype]} vectors."""\n'
+    out += "    self._alloc(other.size)\n"
+    out += "    cdef Py_ssize_t i\n"
+    out += f"    for i in range(self.size * {dims}):\n"
+    out += f"        self.data[i] = <{get_c_type(vtype)}>other.data[i]\n"
+    return out
+
+
+def gen_array_int_conversion(dims: int, vtype: Type) -> str:
+    # Like `gen_type_conversion_constructor()`, the integer arrays are looked up at runtime
+    if vtype is not float:
+        return ""
+    name = get_vec_array_class_name(dims, int)
+    out = "# `vectors` can only be an integer array if their module is loaded\n"
+    out += 'cdef object module = sys.modules.get("spatium._vector_int")\n'
+    out += "cdef const py_int[:, ::1] ints\n"
+    out += "cdef Py_ssize_t j, k\n"
+    out += f"if module is not None and type(vectors) is module.{name}:\n"
+    out += "    ints = vectors\n"
+    out += "    self._alloc(ints.shape[0])\n"
+    out += "    for j in range(self.size):\n"
+    out += f"        for k in range({dims}):\n"
+    out += f"            self.data[j * {dims} + k] = <py_float>ints[j, k]\n"
+    out += "    return\n"
     return out
 
 
@@ -188,9 +310,23 @@ def _swizzle_has_setter(swizzle: str, dims: int) -> bool:
     return True
 
 
+def _swizzle_set(vtype: Type) -> set[str] | None:
+    # The compact families only compile the hot swizzles (unless a set is given), swizzles make up most of the extension
+    if SWIZZLE_SET is None and vtype is not float and vtype is not int:
+        return set(HOT_SWIZZLES)
+    return SWIZZLE_SET
+
+
 def gen_swizzle_properties(dims: int, vtype: Type) -> str:
+    swizzle_set = _swizzle_set(vtype)
     out = ""
     for swizzle in _swizzles(dims):
+        if (
+            swizzle_set is not None
+            and swizzle not in swizzle_set
+            and not _swizzle_has_setter(swizzle, dims)
+        ):
+            continue
         out += _gen_swizzle_get(swizzle, vtype)
         out += "\n"
 
@@ -201,6 +337,62 @@ def gen_swizzle_properties(dims: int, vtype: Type) -> str:
     return out
 
 
+def gen_swizzle_into(dims: int, vtype: Type) -> str:
+    out = f"cdef {get_c_type(vtype)}[4] values\n"
+    out += "cdef Py_ssize_t n = len(swizzle)\n"
+    out += "cdef Py_ssize_t i\n"
+    out += "cdef Py_UCS4 c\n"
+    out += "if not 2 <= n <= 4:\n"
+    out += '    raise ValueError(f"Invalid swizzle length: {swizzle!r}")\n'
+    out += "for i in range(n):\n"
+    out += "    c = swizzle[i]\n"
+    for i, dim in enumerate(DIMS[:dims]):
+        out += f"    {'if' if i == 0 else 'elif'} c == {dim!r}:\n"
+        out += f"        values[i] = self.{dim}\n"
+    out += "    elif c == 'o':\n"
+    out += f"        values[i] = {vtype(0)}\n"
+    out += "    elif c == 'l':\n"
+    out += f"        values[i] = {vtype(1)}\n"
+    out += "    else:\n"
+    out += f'        raise ValueError(f"Invalid swizzle for {get_vec_class_name(dims, vtype)}: {{swizzle!r}}")\n'
+    for l in LENS:
+        cls = get_vec_class_name(l, vtype)
+        out += (
+            f"{'if' if l == LENS[0] else 'elif'} n == {l} and isinstance(out, {cls}):\n"
+        )
+        for i in range(l):
+            out += f"    (<{cls}> out).{DIMS[i]} = values[{i}]\n"
+    out += "else:\n"
+    names = ", ".join(repr(get_vec_class_name(l, vtype)) for l in LENS)
+    out += f'    raise TypeError(f"Expected a {{({names})[n - 2]}} to write the swizzle {{swizzle!r}} into, got {{type(out).__name__}}")\n'
+    out += "return out"
+    return out
+
+
+def gen_swizzle_getattr(dims: int, vtype: Type) -> str:
+    c_type = get_c_type(vtype)
+    out = f"cdef bytes plan = _get_swizzle_plan(name, {dims})\n"
+    out += "if plan is None:\n"
+    out += f"    raise AttributeError(f\"'{get_vec_class_name(dims, vtype)}' object has no attribute {{name!r}}\")\n"
+    out += "cdef const unsigned char* p = plan\n"
+    out += f"cdef {c_type}[6] values\n"
+    for l in LENS:
+        cls = get_vec_class_name(l, vtype)
+        out += f"cdef {cls} vec{l}\n"
+    for i, dim in enumerate(DIMS[:dims]):
+        out += f"values[{i}] = self.{dim}\n"
+    out += f"values[4] = {vtype(0)}\n"
+    out += f"values[5] = {vtype(1)}\n"
+    for l in LENS:
+        cls = get_vec_class_name(l, vtype)
+        out += f"{'if' if l == LENS[0] else 'elif'} len(plan) == {l}:\n"
+        out += f"    vec{l} = {cls}.__new__({cls})\n"
+        for i in range(l):
+            out += f"    vec{l}.{DIMS[i]} = values[p[{i}]]\n"
+        out += f"    return vec{l}\n"
+    return out[:-1]
+
+
 def gen_for_each_dim(template: str, dims: int, join="\n") -> str:
     out = ""
     for i, dim in enumerate(range(dims)):
@@ -224,7 +416,16 @@ def gen_repr(dims: int, vtype: Type) -> str:
 
 def gen_common_binary_and_inplace_op(op: str, name: str, readable_name: str) -> str:
     return from_template(
-        open("templates/common_binary_and_inplace_op.pyx").read(),
+        read_template("common_binary_and_inplace_op.pyx"),
+        {"Op": op, "OpName": name, "OpReadableName": readable_name},
+    )
+
+
+def gen_common_array_binary_and_inplace_op(
+    op: str, name: str, readable_name: str
+) -> str:
+    return from_template(
+        read_template("common_array_binary_and_inplace_op.pyx"),
         {"Op": op, "OpName": name, "OpReadableName": readable_name},
     )
 
@@ -251,18 +452,88 @@ def gen_iterator_next(dims: int) -> str:
     return out
 
 
-def gen_vec_class(dims: int, vtype: Type) -> str:
-    params = {
+def _vec_class_params(dims: int, vtype: Type) -> dict[str, Any]:
+    real_type = _REAL_TYPES[vtype]
+    return {
         "Dims": dims,
-        "vType": vtype.__name__,
+        "vType": "float" if issubclass(vtype, float) else "int",
+        "vFamily": vtype.__name__,
         "vTypeC": get_c_type(vtype),
+        "vRealC": get_c_type(real_type),
+        # Cython only knows "double" as a C type, not as a return annotation
+        "vRealPy": "py_float" if real_type is float else "float",
+        "vSqrt": f"sqrt{_MATH_SUFFIXES[real_type]}",
+        "vAtan2": f"atan2{_MATH_SUFFIXES[real_type]}",
         "VecClassName": get_vec_class_name(dims, vtype),
+        "FloatVecClassName": get_vec_class_name(dims, real_type),
+        "TransformClassName": get_transform_class_name(dims, vtype),
+        "vFormat": get_buffer_format(vtype),
+        "PrecisionDoc": _FAMILIES[vtype][3],
+        "HasAllSwizzles": _swizzle_set(vtype) is None,
+        # Only the base families have arrays
+        "HasArray": vtype is float or vtype is int,
     }
 
-    cls = from_template(open("templates/vec_class.pyx").read(), params)
+
+def gen_vec_class(dims: int, vtype: Type) -> str:
+    params = _vec_class_params(dims, vtype)
+
+    cls = from_template(read_template("vec_class.pyx"), params)
+    cls = process_overloads(cls)
+    return cls
+
+
+def gen_vec_array_class(dims: int, vtype: Type) -> str:
+    params = _vec_class_params(dims, vtype)
+    params.update({
+        "vResultC": "double" if vtype is float else get_c_type(vtype),
+        "vResultFormat": "d" if vtype is float else "q",
+        # Kind of the numbers in `__array_interface__` and DLPack
+        "vKind": "f" if vtype is float else "i",
+        "vTypeDoc": "long double" if vtype is float else "long long",
+    })
+
+    cls = from_template(read_template("vec_array_class.pyx"), params)
     cls = process_overloads(cls)
     return cls
 
 
+def _init_worker(swizzle_set: set[str] | None):
+    # Set up the state of the main process in (spawned rather than forked) codegen worker processes,
+    # the generator globals are exposed to the templates like `step_generate(..., _globals=get_globals())` does
+    global SWIZZLE_SET
+    SWIZZLE_SET = swizzle_set
+    vars(codegen).update({k: v for k, v in globals().items() if not k.startswith("__")})
+
+
+def gen_vec_classes(*specs: tuple[int, Type]) -> str:
+    """Generate the vector classes of every (dims, vtype), in parallel."""
+    classes = codegen.parallel_cached_map(
+        gen_vec_class, specs, _init_worker, (SWIZZLE_SET,)
+    )
+    return "\n\n".join(classes)
+
+
+def gen_vec_array_classes(*specs: tuple[int, Type]) -> str:
+    """Generate the vector array classes of every (dims, vtype), in parallel."""
+    classes = codegen.parallel_cached_map(
+        gen_vec_array_class, specs, _init_worker, (SWIZZLE_SET,)
+    )
+    return "\n\n".join(classes)
+
+
+def transform_class_params(dims: int, vtype: Type) -> dict[str, Any]:
+    return {
+        "vFamily": vtype.__name__,
+        "TransformClassName": get_transform_class_name(dims, vtype),
+        "VecClassName": get_vec_class_name(dims, vtype),
+        "tTypeC": get_c_type(vtype),
+        "tFormat": get_buffer_format(vtype),
+        "MathSuffix": _MATH_SUFFIXES[vtype],
+        "PrecisionDoc": _FAMILIES[vtype][3],
+        "HasArray": vtype is float,
+    }
+
+
 def get_globals():
     return globals()
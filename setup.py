@@ -1,19 +1,27 @@
+import os
+
 from setuptools import setup, Extension, find_packages
 from Cython.Compiler import Options
 
 Options.docstrings = True
 # Options.annotate = True
 
+# Separate extension modules, so that they can be compiled in parallel and imported on demand
+MODULES = ("_vector", "_vector_int", "_transform", "_spatial", "_expr", "_loaders")
+
 setup(
     ext_modules=[
         Extension(
-            "spatium._spatium",
-            ["src/spatium/_spatium.pyx"],
+            f"spatium.{module}",
+            [f"src/spatium/{module}.pyx"],
             # extra_compile_args=["-std=c++20", "/std:c++20"],
-        ),
+        )
+        for module in MODULES
     ],
     packages=find_packages(
         where="src", exclude=["tests", "spatium/*.c", "spatium/*.cpp"]
     ),
     package_dir={"": "src"},
+    package_data={"spatium": ["*.pxd"]},
+    options={"build_ext": {"parallel": os.cpu_count()}},
 )
@@ -1,4 +1,47 @@
-from ._spatium import Vec2, Vec3, Vec4, Vec2i, Vec3i, Vec4i, Transform2D, Transform3D
+import importlib
+
+# Every class is loaded from its extension module on first access
+_MODULES = {
+    "Vec2": "_vector",
+    "Vec3": "_vector",
+    "Vec4": "_vector",
+    "Vec2d": "_vector",
+    "Vec3d": "_vector",
+    "Vec4d": "_vector",
+    "Vec2f": "_vector",
+    "Vec3f": "_vector",
+    "Vec4f": "_vector",
+    "Vec2Array": "_vector",
+    "Vec3Array": "_vector",
+    "Vec4Array": "_vector",
+    "Vec2i": "_vector_int",
+    "Vec3i": "_vector_int",
+    "Vec4i": "_vector_int",
+    "Vec2i32": "_vector_int",
+    "Vec3i32": "_vector_int",
+    "Vec4i32": "_vector_int",
+    "Vec2iArray": "_vector_int",
+    "Vec3iArray": "_vector_int",
+    "Vec4iArray": "_vector_int",
+    "Transform2D": "_transform",
+    "Transform3D": "_transform",
+    "Transform2Dd": "_transform",
+    "Transform3Dd": "_transform",
+    "Transform2Df": "_transform",
+    "Transform3Df": "_transform",
+    "Transform2DArray": "_transform",
+    "Transform3DArray": "_transform",
+    "Transform2DHierarchy": "_transform",
+    "Transform3DHierarchy": "_transform",
+    "KDTree2D": "_spatial",
+    "KDTree3D": "_spatial",
+    "SpatialHash2D": "_spatial",
+    "SpatialHash3D": "_spatial",
+    "Vec2Store": "_spatial",
+    "Vec3Store": "_spatial",
+    "VoxelMap": "_spatial",
+    "VoxelSet": "_spatial",
+}
 
 __all__ = (
     "Vec2",
@@ -9,4 +52,48 @@ __all__ = (
     "Vec4i",
     "Transform2D",
     "Transform3D",
+    "Vec2d",
+    "Vec3d",
+    "Vec4d",
+    "Vec2f",
+    "Vec3f",
+    "Vec4f",
+    "Vec2i32",
+    "Vec3i32",
+    "Vec4i32",
+    "Transform2Dd",
+    "Transform3Dd",
+    "Transform2Df",
+    "Transform3Df",
+    "Vec2Array",
+    "Vec3Array",
+    "Vec4Array",
+    "Vec2iArray",
+    "Vec3iArray",
+    "Vec4iArray",
+    "Transform2DArray",
+    "Transform3DArray",
+    "Transform2DHierarchy",
+    "Transform3DHierarchy",
+    "KDTree2D",
+    "KDTree3D",
+    "SpatialHash2D",
+    "SpatialHash3D",
+    "Vec2Store",
+    "Vec3Store",
+    "VoxelMap",
+    "VoxelSet",
 )
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -1,4 +1,50 @@
-from ._spatium import Vec2, Vec3, Vec4, Vec2i, Vec3i, Vec4i, Transform2D, Transform3D
+from ._vector import (
+    Vec2,
+    Vec3,
+    Vec4,
+    Vec2d,
+    Vec3d,
+    Vec4d,
+    Vec2f,
+    Vec3f,
+    Vec4f,
+    Vec2Array,
+    Vec3Array,
+    Vec4Array,
+)
+from ._vector_int import (
+    Vec2i,
+    Vec3i,
+    Vec4i,
+    Vec2i32,
+    Vec3i32,
+    Vec4i32,
+    Vec2iArray,
+    Vec3iArray,
+    Vec4iArray,
+)
+from ._transform import (
+    Transform2D,
+    Transform3D,
+    Transform2Dd,
+    Transform3Dd,
+    Transform2Df,
+    Transform3Df,
+    Transform2DArray,
+    Transform3DArray,
+    Transform2DHierarchy,
+    Transform3DHierarchy,
+)
+from ._spatial import (
+    KDTree2D,
+    KDTree3D,
+    SpatialHash2D,
+    SpatialHash3D,
+    Vec2Store,
+    Vec3Store,
+    VoxelMap,
+    VoxelSet,
+)
 
 __all__ = (
     "Vec2",
@@ -9,4 +55,35 @@ __all__ = (
     "Vec4i",
     "Transform2D",
     "Transform3D",
+    "Vec2d",
+    "Vec3d",
+    "Vec4d",
+    "Vec2f",
+    "Vec3f",
+    "Vec4f",
+    "Vec2i32",
+    "Vec3i32",
+    "Vec4i32",
+    "Transform2Dd",
+    "Transform3Dd",
+    "Transform2Df",
+    "Transform3Df",
+    "Vec2Array",
+    "Vec3Array",
+    "Vec4Array",
+    "Vec2iArray",
+    "Vec3iArray",
+    "Vec4iArray",
+    "Transform2DArray",
+    "Transform3DArray",
+    "Transform2DHierarchy",
+    "Transform3DHierarchy",
+    "KDTree2D",
+    "KDTree3D",
+    "SpatialHash2D",
+    "SpatialHash3D",
+    "Vec2Store",
+    "Vec3Store",
+    "VoxelMap",
+    "VoxelSet",
 )
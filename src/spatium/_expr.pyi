@@ -0,0 +1,5 @@
+# noinspection PyUnresolvedReferences
+from typing import overload, Self, Any, Union, Iterator
+from array import array
+from spatium._common import py_int, py_float, buffer_float
+
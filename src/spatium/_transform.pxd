@@ -0,0 +1,356 @@
+# Declarations of the extension types, generated from the module
+cimport cython
+from libc.math cimport fabsl, floorl, isfinite, INFINITY
+from cpython.float cimport PyFloat_CheckExact, PyFloat_AS_DOUBLE, PyFloat_Check, PyFloat_AsDouble
+from cpython.long cimport PyLong_CheckExact, PyLong_AsLongLong, PyLong_AsDouble, PyLong_Check
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free, PyMem_RawMalloc, PyMem_RawRealloc, PyMem_RawFree
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_SIMPLE, PyBUF_WRITABLE, PyBUF_C_CONTIGUOUS, PyObject_GetBuffer, PyBuffer_Release
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from cpython.bytearray cimport PyByteArray_FromStringAndSize, PyByteArray_AS_STRING
+from cpython.object cimport PyObject
+from cpython.pyport cimport PY_SSIZE_T_MAX
+from cpython.ref cimport Py_INCREF, Py_DECREF
+from cpython.pycapsule cimport PyCapsule_New, PyCapsule_IsValid, PyCapsule_GetPointer
+from libc.string cimport memcpy, memset, memcmp
+from libc.limits cimport INT_MIN, INT_MAX
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t, uint64_t
+from spatium._common cimport py_int, py_float, buffer_float
+from spatium._vector cimport Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector cimport Vec2Array, Vec3Array, Vec4Array
+from libc.math cimport atan2l, sinl, cosl, sqrtl, NAN
+from libc.math cimport atan2, sin, cos, sqrt, NAN
+from libc.math cimport atan2f, sinf, cosf, sqrtf, NAN
+from libc.math cimport sinl, cosl
+from libc.math cimport sin, cos
+from libc.math cimport sinf, cosf
+from libc.stdlib cimport qsort
+
+
+@cython.final
+cdef class Transform2D:
+    cdef py_float xx, xy
+    cdef py_float yx, yy
+    cdef py_float ox, oy
+    cdef void identity(self) noexcept
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, py_float xx, py_float xy, py_float yx, py_float yy, py_float ox, py_float oy) noexcept
+    cdef void ___init___2(self, Vec2 x, Vec2 y, Vec2 origin) noexcept
+    cdef void ___init___3(self, Transform2D transform) noexcept
+    cdef void ___init___4(self, Transform2Dd transform) noexcept
+    cdef void ___init___5(self, Transform2Df transform) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5)
+    cdef void _copy_to(self, Transform2D t) noexcept
+    cdef Transform2D copy(self)
+    cdef py_float tdotx(self, py_float x, py_float y) noexcept nogil
+    cdef py_float mulx(self, py_float x, py_float y) noexcept nogil
+    cdef py_float tdoty(self, py_float x, py_float y) noexcept nogil
+    cdef py_float muly(self, py_float x, py_float y) noexcept nogil
+    cdef Vec2 ___call___0(self, Vec2 other)
+    cdef Transform2D ___call___1(self, Transform2D other)
+    cdef Vec2 _apply_into_0(self, Vec2 other, Vec2 out)
+    cdef Transform2D _apply_into_1(self, Transform2D other, Transform2D out)
+    cdef int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1
+    cdef object _dispatch_many(self, object src, object out, bint inverse)
+    cdef Transform2D ___matmul___0(self, Transform2D other)
+    cdef Transform2DArray ___matmul___1(self, Transform2DArray other)
+    cdef void _transform_ip(self, Transform2D other) noexcept
+    cdef py_float _determinant(self) noexcept
+    cdef py_float get_rotation(self) noexcept
+    cdef void set_rotation(self, py_float rotation) noexcept
+    cdef py_float get_scale_x(self) noexcept
+    cdef py_float get_scale_y(self) noexcept
+    cdef void set_scale_x(self, py_float value) noexcept
+    cdef void set_scale_y(self, py_float value) noexcept
+    cdef void _translate_ip(self, Vec2 translation) noexcept
+    cdef void _rotate_ip(self, py_float rotation)
+    cdef void _scale_ip(self, Vec2 scale) noexcept
+
+@cython.final
+cdef class Transform2Dd:
+    cdef double xx, xy
+    cdef double yx, yy
+    cdef double ox, oy
+    cdef void identity(self) noexcept
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, double xx, double xy, double yx, double yy, double ox, double oy) noexcept
+    cdef void ___init___2(self, Vec2d x, Vec2d y, Vec2d origin) noexcept
+    cdef void ___init___3(self, Transform2Dd transform) noexcept
+    cdef void ___init___4(self, Transform2D transform) noexcept
+    cdef void ___init___5(self, Transform2Df transform) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5)
+    cdef void _copy_to(self, Transform2Dd t) noexcept
+    cdef Transform2Dd copy(self)
+    cdef double tdotx(self, double x, double y) noexcept nogil
+    cdef double mulx(self, double x, double y) noexcept nogil
+    cdef double tdoty(self, double x, double y) noexcept nogil
+    cdef double muly(self, double x, double y) noexcept nogil
+    cdef Vec2d ___call___0(self, Vec2d other)
+    cdef Transform2Dd ___call___1(self, Transform2Dd other)
+    cdef Vec2d _apply_into_0(self, Vec2d other, Vec2d out)
+    cdef Transform2Dd _apply_into_1(self, Transform2Dd other, Transform2Dd out)
+    cdef int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1
+    cdef object _dispatch_many(self, object src, object out, bint inverse)
+    cdef Transform2Dd ___matmul___0(self, Transform2Dd other)
+    cdef void _transform_ip(self, Transform2Dd other) noexcept
+    cdef double _determinant(self) noexcept
+    cdef double get_rotation(self) noexcept
+    cdef void set_rotation(self, double rotation) noexcept
+    cdef double get_scale_x(self) noexcept
+    cdef double get_scale_y(self) noexcept
+    cdef void set_scale_x(self, double value) noexcept
+    cdef void set_scale_y(self, double value) noexcept
+    cdef void _translate_ip(self, Vec2d translation) noexcept
+    cdef void _rotate_ip(self, double rotation)
+    cdef void _scale_ip(self, Vec2d scale) noexcept
+
+@cython.final
+cdef class Transform2Df:
+    cdef float xx, xy
+    cdef float yx, yy
+    cdef float ox, oy
+    cdef void identity(self) noexcept
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, float xx, float xy, float yx, float yy, float ox, float oy) noexcept
+    cdef void ___init___2(self, Vec2f x, Vec2f y, Vec2f origin) noexcept
+    cdef void ___init___3(self, Transform2Df transform) noexcept
+    cdef void ___init___4(self, Transform2D transform) noexcept
+    cdef void ___init___5(self, Transform2Dd transform) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5)
+    cdef void _copy_to(self, Transform2Df t) noexcept
+    cdef Transform2Df copy(self)
+    cdef float tdotx(self, float x, float y) noexcept nogil
+    cdef float mulx(self, float x, float y) noexcept nogil
+    cdef float tdoty(self, float x, float y) noexcept nogil
+    cdef float muly(self, float x, float y) noexcept nogil
+    cdef Vec2f ___call___0(self, Vec2f other)
+    cdef Transform2Df ___call___1(self, Transform2Df other)
+    cdef Vec2f _apply_into_0(self, Vec2f other, Vec2f out)
+    cdef Transform2Df _apply_into_1(self, Transform2Df other, Transform2Df out)
+    cdef int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1
+    cdef object _dispatch_many(self, object src, object out, bint inverse)
+    cdef Transform2Df ___matmul___0(self, Transform2Df other)
+    cdef void _transform_ip(self, Transform2Df other) noexcept
+    cdef float _determinant(self) noexcept
+    cdef float get_rotation(self) noexcept
+    cdef void set_rotation(self, float rotation) noexcept
+    cdef float get_scale_x(self) noexcept
+    cdef float get_scale_y(self) noexcept
+    cdef void set_scale_x(self, float value) noexcept
+    cdef void set_scale_y(self, float value) noexcept
+    cdef void _translate_ip(self, Vec2f translation) noexcept
+    cdef void _rotate_ip(self, float rotation)
+    cdef void _scale_ip(self, Vec2f scale) noexcept
+
+@cython.final
+cdef class Transform3D:
+    cdef py_float xx, xy, xz
+    cdef py_float yx, yy, yz
+    cdef py_float zx, zy, zz
+    cdef py_float ox, oy, oz
+    cdef void identity(self) noexcept
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, py_float xx, py_float xy, py_float xz, py_float yx, py_float yy, py_float yz, py_float zx, py_float zy, py_float zz, py_float ox, py_float oy, py_float oz) noexcept
+    cdef void ___init___2(self, Vec3 x, Vec3 y, Vec3 z, Vec3 origin) noexcept
+    cdef void ___init___3(self, Transform3D transform) noexcept
+    cdef void ___init___4(self, Transform3Dd transform) noexcept
+    cdef void ___init___5(self, Transform3Df transform) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5, object p6, object p7, object p8, object p9, object p10, object p11)
+    cdef void _copy_to(self, Transform3D t) noexcept
+    cdef Transform3D copy(self)
+    cdef py_float tdotx(self, py_float x, py_float y, py_float z) noexcept nogil
+    cdef py_float mulx(self, py_float x, py_float y, py_float z) noexcept nogil
+    cdef py_float tdoty(self, py_float x, py_float y, py_float z) noexcept nogil
+    cdef py_float muly(self, py_float x, py_float y, py_float z) noexcept nogil
+    cdef py_float tdotz(self, py_float x, py_float y, py_float z) noexcept nogil
+    cdef py_float mulz(self, py_float x, py_float y, py_float z) noexcept nogil
+    cdef Vec3 ___call___0(self, Vec3 other)
+    cdef Transform3D ___call___1(self, Transform3D other)
+    cdef Vec3 _apply_into_0(self, Vec3 other, Vec3 out)
+    cdef Transform3D _apply_into_1(self, Transform3D other, Transform3D out)
+    cdef int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1
+    cdef object _dispatch_many(self, object src, object out, bint inverse)
+    cdef Transform3D ___matmul___0(self, Transform3D other)
+    cdef Transform3DArray ___matmul___1(self, Transform3DArray other)
+    cdef void _transform_ip(self, Transform3D other) noexcept
+    cdef py_float _determinant(self) noexcept
+    cdef void _translate_ip(self, Vec3 translation) noexcept
+    cdef void _rotate_ip(self, Vec3 axis, py_float angle)
+    cdef void _scale_ip(self, Vec3 scale) noexcept
+
+@cython.final
+cdef class Transform3Dd:
+    cdef double xx, xy, xz
+    cdef double yx, yy, yz
+    cdef double zx, zy, zz
+    cdef double ox, oy, oz
+    cdef void identity(self) noexcept
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, double xx, double xy, double xz, double yx, double yy, double yz, double zx, double zy, double zz, double ox, double oy, double oz) noexcept
+    cdef void ___init___2(self, Vec3d x, Vec3d y, Vec3d z, Vec3d origin) noexcept
+    cdef void ___init___3(self, Transform3Dd transform) noexcept
+    cdef void ___init___4(self, Transform3D transform) noexcept
+    cdef void ___init___5(self, Transform3Df transform) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5, object p6, object p7, object p8, object p9, object p10, object p11)
+    cdef void _copy_to(self, Transform3Dd t) noexcept
+    cdef Transform3Dd copy(self)
+    cdef double tdotx(self, double x, double y, double z) noexcept nogil
+    cdef double mulx(self, double x, double y, double z) noexcept nogil
+    cdef double tdoty(self, double x, double y, double z) noexcept nogil
+    cdef double muly(self, double x, double y, double z) noexcept nogil
+    cdef double tdotz(self, double x, double y, double z) noexcept nogil
+    cdef double mulz(self, double x, double y, double z) noexcept nogil
+    cdef Vec3d ___call___0(self, Vec3d other)
+    cdef Transform3Dd ___call___1(self, Transform3Dd other)
+    cdef Vec3d _apply_into_0(self, Vec3d other, Vec3d out)
+    cdef Transform3Dd _apply_into_1(self, Transform3Dd other, Transform3Dd out)
+    cdef int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1
+    cdef object _dispatch_many(self, object src, object out, bint inverse)
+    cdef Transform3Dd ___matmul___0(self, Transform3Dd other)
+    cdef void _transform_ip(self, Transform3Dd other) noexcept
+    cdef double _determinant(self) noexcept
+    cdef void _translate_ip(self, Vec3d translation) noexcept
+    cdef void _rotate_ip(self, Vec3d axis, double angle)
+    cdef void _scale_ip(self, Vec3d scale) noexcept
+
+@cython.final
+cdef class Transform3Df:
+    cdef float xx, xy, xz
+    cdef float yx, yy, yz
+    cdef float zx, zy, zz
+    cdef float ox, oy, oz
+    cdef void identity(self) noexcept
+    cdef void ___init___0(self) noexcept
+    cdef void ___init___1(self, float xx, float xy, float xz, float yx, float yy, float yz, float zx, float zy, float zz, float ox, float oy, float oz) noexcept
+    cdef void ___init___2(self, Vec3f x, Vec3f y, Vec3f z, Vec3f origin) noexcept
+    cdef void ___init___3(self, Transform3Df transform) noexcept
+    cdef void ___init___4(self, Transform3D transform) noexcept
+    cdef void ___init___5(self, Transform3Dd transform) noexcept
+    cdef object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5, object p6, object p7, object p8, object p9, object p10, object p11)
+    cdef void _copy_to(self, Transform3Df t) noexcept
+    cdef Transform3Df copy(self)
+    cdef float tdotx(self, float x, float y, float z) noexcept nogil
+    cdef float mulx(self, float x, float y, float z) noexcept nogil
+    cdef float tdoty(self, float x, float y, float z) noexcept nogil
+    cdef float muly(self, float x, float y, float z) noexcept nogil
+    cdef float tdotz(self, float x, float y, float z) noexcept nogil
+    cdef float mulz(self, float x, float y, float z) noexcept nogil
+    cdef Vec3f ___call___0(self, Vec3f other)
+    cdef Transform3Df ___call___1(self, Transform3Df other)
+    cdef Vec3f _apply_into_0(self, Vec3f other, Vec3f out)
+    cdef Transform3Df _apply_into_1(self, Transform3Df other, Transform3Df out)
+    cdef int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1
+    cdef object _dispatch_many(self, object src, object out, bint inverse)
+    cdef Transform3Df ___matmul___0(self, Transform3Df other)
+    cdef void _transform_ip(self, Transform3Df other) noexcept
+    cdef float _determinant(self) noexcept
+    cdef void _translate_ip(self, Vec3f translation) noexcept
+    cdef void _rotate_ip(self, Vec3f axis, float angle)
+    cdef void _scale_ip(self, Vec3f scale) noexcept
+
+@cython.final
+cdef class Transform2DArray:
+    cdef py_float* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[3] shape
+    cdef Py_ssize_t[3] strides
+    cdef Py_buffer view
+    cdef bint is_view
+    cdef int _alloc(self, Py_ssize_t size) except -1
+    cdef void _set_size(self, Py_ssize_t size) noexcept
+    cdef int _check_size(self, Py_ssize_t size) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef Transform2D _get(self, Py_ssize_t index)
+    cdef void _set(self, Py_ssize_t index, Transform2D t) noexcept
+    cdef Transform2DArray _new(self)
+    cdef Transform2DArray _copy(self)
+    cdef void ___init___0(self)
+    cdef void ___init___1(self, py_int size)
+    cdef void ___init___2(self, Transform2DArray other)
+    cdef void ___init___3(self, object transforms)
+    cdef Transform2DArray ___matmul___0(self, Transform2DArray other)
+    cdef Transform2DArray ___matmul___1(self, Transform2D other)
+    cdef Transform2DArray _compose_left(self, Transform2D other)
+    cdef Transform2DArray ___imatmul___0(self, Transform2DArray other)
+    cdef Transform2DArray ___imatmul___1(self, Transform2D other)
+    cdef Transform2DArray _translate_ip_0(self, Vec2 translation)
+    cdef Transform2DArray _translate_ip_1(self, Vec2Array translations)
+    cdef void _scale(self, Py_ssize_t index, const py_float* scale) noexcept nogil
+    cdef Transform2DArray _scale_ip_0(self, Vec2 scale)
+    cdef Transform2DArray _scale_ip_1(self, Vec2Array scales)
+
+@cython.final
+cdef class _Transform2DArray_iterator:
+    cdef Transform2DArray array
+    cdef Py_ssize_t index
+
+@cython.final
+cdef class Transform3DArray:
+    cdef py_float* data
+    cdef Py_ssize_t size
+    cdef Py_ssize_t[3] shape
+    cdef Py_ssize_t[3] strides
+    cdef Py_buffer view
+    cdef bint is_view
+    cdef int _alloc(self, Py_ssize_t size) except -1
+    cdef void _set_size(self, Py_ssize_t size) noexcept
+    cdef int _check_size(self, Py_ssize_t size) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef Transform3D _get(self, Py_ssize_t index)
+    cdef void _set(self, Py_ssize_t index, Transform3D t) noexcept
+    cdef Transform3DArray _new(self)
+    cdef Transform3DArray _copy(self)
+    cdef void ___init___0(self)
+    cdef void ___init___1(self, py_int size)
+    cdef void ___init___2(self, Transform3DArray other)
+    cdef void ___init___3(self, object transforms)
+    cdef Transform3DArray ___matmul___0(self, Transform3DArray other)
+    cdef Transform3DArray ___matmul___1(self, Transform3D other)
+    cdef Transform3DArray _compose_left(self, Transform3D other)
+    cdef Transform3DArray ___imatmul___0(self, Transform3DArray other)
+    cdef Transform3DArray ___imatmul___1(self, Transform3D other)
+    cdef Transform3DArray _translate_ip_0(self, Vec3 translation)
+    cdef Transform3DArray _translate_ip_1(self, Vec3Array translations)
+    cdef void _scale(self, Py_ssize_t index, const py_float* scale) noexcept nogil
+    cdef Transform3DArray _scale_ip_0(self, Vec3 scale)
+    cdef Transform3DArray _scale_ip_1(self, Vec3Array scales)
+
+@cython.final
+cdef class _Transform3DArray_iterator:
+    cdef Transform3DArray array
+    cdef Py_ssize_t index
+
+@cython.final
+cdef class Transform2DHierarchy:
+    cdef py_float* local_data
+    cdef py_float* world_data
+    cdef Py_ssize_t* parents
+    cdef Py_ssize_t* first_child
+    cdef Py_ssize_t* next_sibling
+    cdef unsigned char* dirty
+    cdef Py_ssize_t* dirty_nodes
+    cdef Py_ssize_t* stack
+    cdef Py_ssize_t dirty_count
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+    cdef int _reserve(self, Py_ssize_t capacity) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef void _mark_dirty(self, Py_ssize_t index) noexcept
+    cdef void _update(self) noexcept nogil
+
+@cython.final
+cdef class Transform3DHierarchy:
+    cdef py_float* local_data
+    cdef py_float* world_data
+    cdef Py_ssize_t* parents
+    cdef Py_ssize_t* first_child
+    cdef Py_ssize_t* next_sibling
+    cdef unsigned char* dirty
+    cdef Py_ssize_t* dirty_nodes
+    cdef Py_ssize_t* stack
+    cdef Py_ssize_t dirty_count
+    cdef Py_ssize_t size
+    cdef Py_ssize_t capacity
+    cdef int _reserve(self, Py_ssize_t capacity) except -1
+    cdef Py_ssize_t _index(self, Py_ssize_t index) except -1
+    cdef void _mark_dirty(self, Py_ssize_t index) noexcept
+    cdef void _update(self) noexcept nogil
@@ -0,0 +1,7695 @@
+#cython: language_level=3
+#cython: binding=False
+#cython: boundscheck=False
+#cython: wraparound=False
+#cython: nonecheck=False
+#cython: cdivision=True
+#cython: always_allow_keywords=True
+#cython: optimize.use_switch=True
+#cython: embedsignature=False
+
+cimport cython
+
+
+########## common_utils.pyx ##########
+from libc.math cimport fabsl, floorl, isfinite, INFINITY
+
+from cpython.float cimport PyFloat_CheckExact, PyFloat_AS_DOUBLE, PyFloat_Check, PyFloat_AsDouble
+from cpython.long cimport PyLong_CheckExact, PyLong_AsLongLong, PyLong_AsDouble, PyLong_Check
+from cpython.mem cimport PyMem_Malloc, PyMem_Realloc, PyMem_Free, PyMem_RawMalloc, PyMem_RawRealloc, PyMem_RawFree
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES, PyBUF_SIMPLE, PyBUF_WRITABLE, PyBUF_C_CONTIGUOUS, PyObject_GetBuffer, PyBuffer_Release
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from cpython.bytearray cimport PyByteArray_FromStringAndSize, PyByteArray_AS_STRING
+from cpython.object cimport PyObject
+from cpython.pyport cimport PY_SSIZE_T_MAX
+from cpython.ref cimport Py_INCREF, Py_DECREF
+from cpython.pycapsule cimport PyCapsule_New, PyCapsule_IsValid, PyCapsule_GetPointer
+from libc.string cimport memcpy, memset, memcmp
+from libc.limits cimport INT_MIN, INT_MAX
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t, uint64_t
+from spatium._common cimport py_int, py_float, buffer_float
+
+import sys
+from array import array
+
+cdef extern from "Python.h":
+    # Constructing through the `tp_vectorcall` slot of a type skips the argument tuple and `tp_init`
+    ctypedef object (*vectorcallfunc)(PyObject* callable, PyObject** args, size_t nargsf, PyObject* kwnames)
+    ctypedef struct PyVectorcallTypeObject "PyTypeObject":
+        vectorcallfunc tp_vectorcall
+    Py_ssize_t PyVectorcall_NARGS(size_t nargsf)
+
+DEF DEFAULT_RELATIVE_TOLERANCE = 1e-09
+DEF DEFAULT_ABSOLUTE_TOLERANCE = 1e-15
+
+# Number of points kept hot in the cache by the tiled all-pairs loops
+DEF PAIRWISE_TILE_SIZE = 256
+# Maximum number of points in a k-d tree leaf
+DEF KDTREE_LEAF_SIZE = 8
+
+cdef inline bint is_close(py_float a, py_float b, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) noexcept:
+    cdef py_float diff = fabsl(a - b)
+    if a == b:
+        return True
+    if not isfinite(a) or not isfinite(b):
+        return False
+    return diff <= fabsl(rel_tol * a) or diff <= fabsl(rel_tol * b) or diff <= fabsl(abs_tol)
+
+cdef inline int py_long_as_int(object value) except? -1:
+    # Convert an int for the parameters of the int32 family, raising OverflowError outside of the C int range
+    cdef py_int result = PyLong_AsLongLong(value)
+    if not INT_MIN <= result <= INT_MAX:
+        raise OverflowError(f"Python int out of the C int range: {value}")
+    return <int> result
+
+
+cdef union _bitcaster:
+    double f
+    py_int i
+
+cdef inline py_int bitcast_float(py_float f) noexcept nogil:
+    # Bits of the value as a double, with -0.0 folded into 0.0 since they compare equal
+    return _bitcaster(f=(<double> f) + 0.0).i
+
+cdef inline uint64_t mix64(uint64_t x) noexcept nogil:
+    # The splitmix64 finalizer, every input bit affects every output bit
+    x ^= x >> 30
+    x *= 0xbf58476d1ce4e5b9ULL
+    x ^= x >> 27
+    x *= 0x94d049bb133111ebULL
+    x ^= x >> 31
+    return x
+
+cdef inline uint64_t hash_combine(uint64_t h, uint64_t value) noexcept nogil:
+    return mix64(h + value + 0x9e3779b97f4a7c15ULL)
+
+cdef inline py_int hash_finish(uint64_t h) noexcept nogil:
+    # -1 is reserved for errors by `__hash__()`, same as CPython's own hashes
+    return -2 if <py_int> h == -1 else <py_int> h
+
+
+cdef inline void export_buffer(Py_buffer* buffer, int flags, object obj, void* data, Py_ssize_t itemsize, char* format, int ndim, Py_ssize_t* shape, Py_ssize_t* strides) noexcept:
+    cdef Py_ssize_t length = itemsize
+    cdef int i
+    for i in range(ndim):
+        length *= shape[i]
+    buffer.buf = data
+    buffer.obj = obj
+    buffer.len = length
+    buffer.readonly = 0
+    buffer.itemsize = itemsize
+    buffer.format = format if flags & PyBUF_FORMAT == PyBUF_FORMAT else NULL
+    buffer.ndim = ndim
+    buffer.shape = shape if flags & PyBUF_ND == PyBUF_ND else NULL
+    buffer.strides = strides if flags & PyBUF_STRIDES == PyBUF_STRIDES else NULL
+    buffer.suboffsets = NULL
+    buffer.internal = NULL
+
+cdef struct IndexList:
+    # Growable list of indices that can be appended to without the GIL
+    Py_ssize_t* data
+    Py_ssize_t size
+    Py_ssize_t capacity
+    bint failed
+
+cdef inline void index_list_append(IndexList* lst, Py_ssize_t index) noexcept nogil:
+    cdef void* data
+    if lst.size == lst.capacity:
+        data = PyMem_RawRealloc(lst.data, max(16, lst.capacity * 2) * sizeof(Py_ssize_t))
+        if data == NULL:
+            lst.failed = True
+            return
+        lst.data = <Py_ssize_t*> data
+        lst.capacity = max(16, lst.capacity * 2)
+    lst.data[lst.size] = index
+    lst.size += 1
+
+cdef inline object new_scalar_array(str typecode, Py_ssize_t length):
+    return array(typecode, [0]) * length
+
+cdef inline str buffer_format(object obj):
+    return memoryview(obj).format.lstrip("@=")
+
+cdef inline object new_float_buffer(str typecode, Py_ssize_t rows, Py_ssize_t cols):
+    return memoryview(new_scalar_array(typecode, rows * cols)).cast("B").cast(typecode, (rows, cols))
+
+
+cdef packed struct PackHeader:
+    # Header of the blocks written by `pack_many()`, followed by `count` items in native byte order
+    char magic[4]
+    char format
+    unsigned char itemsize
+    unsigned short elements
+    uint64_t count
+
+cdef inline bytes new_pack_block(Py_ssize_t count, char format, Py_ssize_t itemsize, Py_ssize_t elements):
+    # The items of the returned block are left uninitialized for the caller to fill in
+    cdef bytes block = PyBytes_FromStringAndSize(NULL, sizeof(PackHeader) + count * elements * itemsize)
+    cdef PackHeader header
+    memcpy(header.magic, b"SPTM", 4)
+    header.format = format
+    header.itemsize = <unsigned char> itemsize
+    header.elements = <unsigned short> elements
+    header.count = count
+    memcpy(PyBytes_AS_STRING(block), &header, sizeof(PackHeader))
+    return block
+
+cdef inline char* pack_block_items(bytes block) noexcept:
+    return PyBytes_AS_STRING(block) + sizeof(PackHeader)
+
+cdef inline Py_ssize_t open_pack_block(object data, Py_buffer* view, char format, Py_ssize_t itemsize, Py_ssize_t elements, const char** items) except -1:
+    # Acquire the buffer of a block written by `pack_many()` and check its header, returns the number of items
+    PyObject_GetBuffer(data, view, PyBUF_SIMPLE)
+    cdef PackHeader header
+    try:
+        if view.len < <Py_ssize_t> sizeof(PackHeader):
+            raise ValueError(f"Packed block too short: {view.len} bytes")
+        memcpy(&header, view.buf, sizeof(PackHeader))
+        if memcmp(header.magic, b"SPTM", 4) != 0:
+            raise ValueError("Not a packed block")
+        if header.format != format or header.itemsize != itemsize or header.elements != elements:
+            raise ValueError(f"Packed items have {header.elements} elements of format {chr(header.format)!r} ({header.itemsize} bytes), "
+                             f"expected {elements} elements of format {chr(format)!r} ({itemsize} bytes)")
+        # Divided rather than multiplied, a forged count could overflow the size of the items
+        if (header.count > <uint64_t> (view.len - sizeof(PackHeader)) // (elements * itemsize)
+                or <uint64_t> (view.len - sizeof(PackHeader)) != header.count * elements * itemsize):
+            raise ValueError(f"Packed block size mismatch: {header.count} items in {view.len} bytes")
+    except:
+        PyBuffer_Release(view)
+        raise
+    items[0] = <const char*> view.buf + sizeof(PackHeader)
+    return <Py_ssize_t> header.count
+
+cdef inline Py_ssize_t open_raw_buffer(object data, Py_buffer* view, Py_ssize_t item_size) except -1:
+    # Acquire a buffer of whole items without a header, returns the number of items
+    PyObject_GetBuffer(data, view, PyBUF_SIMPLE)
+    if view.len % item_size != 0:
+        PyBuffer_Release(view)
+        raise ValueError(f"Expected a multiple of {item_size} bytes, got {view.len}")
+    return view.len // item_size
+
+cdef inline int read_bytes(object data, void* out, Py_ssize_t size) except -1:
+    # Copy exactly `size` bytes from a buffer, used by `from_bytes()`
+    cdef Py_buffer view
+    PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+    if view.len != size:
+        PyBuffer_Release(&view)
+        raise ValueError(f"Expected {size} bytes, got {view.len}")
+    memcpy(out, view.buf, size)
+    PyBuffer_Release(&view)
+    return 0
+
+
+# Byte order prefix of the native `struct` and numpy type strings
+NATIVE_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+
+cdef inline dict array_interface(void* data, char kind, Py_ssize_t itemsize, int ndim, Py_ssize_t* shape):
+    # Version 3 of numpy's `__array_interface__`, for C-contiguous writable numbers of `kind` ("f" or "i")
+    return {
+        "version": 3,
+        "shape": tuple([shape[i] for i in range(ndim)]),
+        "typestr": f"{NATIVE_BYTE_ORDER}{chr(kind)}{itemsize}",
+        "data": (<size_t> data, False),
+        "strides": None,
+    }
+
+cdef inline Py_ssize_t open_item_buffer(object data, Py_buffer* view, char kind, Py_ssize_t itemsize, Py_ssize_t elements) except -1:
+    # Acquire a writable C-contiguous buffer of items of `elements` numbers, returns the number of items.
+    # The numbers must be native `kind` ("f" or "i") numbers of `itemsize` bytes, or untyped bytes.
+    # Multidimensional buffers must have `elements` numbers per index of their first dimension.
+    PyObject_GetBuffer(data, view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS | PyBUF_FORMAT)
+    cdef str format = "B" if view.format == NULL else view.format.decode("ascii").lstrip("@=" + NATIVE_BYTE_ORDER)
+    cdef Py_ssize_t per_index = 1
+    cdef int i
+    try:
+        if format not in ("B", "c"):
+            if view.itemsize != itemsize or len(format) != 1 or format not in ("fdg" if kind == b"f" else "bhilqn"):
+                raise ValueError(f"Expected a buffer of {itemsize}-byte {'float' if kind == b'f' else 'signed integer'} numbers "
+                                 f"or untyped bytes, got format {format!r} ({view.itemsize} bytes)")
+            for i in range(1, view.ndim):
+                per_index *= view.shape[i]
+            if view.ndim > 1 and per_index != elements:
+                raise ValueError(f"Expected {elements} numbers per item, got shape {tuple([view.shape[i] for i in range(view.ndim)])}")
+        if view.len % (itemsize * elements) != 0:
+            raise ValueError(f"Expected a multiple of {itemsize * elements} bytes, got {view.len}")
+        if <size_t> view.buf % itemsize != 0:
+            raise ValueError(f"Buffer not aligned to {itemsize} bytes")
+    except:
+        PyBuffer_Release(view)
+        raise
+    return view.len // (itemsize * elements)
+
+
+# DLPack (https://dmlc.github.io/dlpack/latest/) ABI, for `__dlpack__()`
+DEF DLPACK_CPU = 1
+DEF DLPACK_INT = 0
+DEF DLPACK_FLOAT = 2
+DEF DLPACK_FLAG_IS_COPIED = 2
+
+cdef struct DLDevice:
+    int device_type
+    int device_id
+
+cdef struct DLDataType:
+    uint8_t code
+    uint8_t bits
+    uint16_t lanes
+
+cdef struct DLTensor:
+    void* data
+    DLDevice device
+    int ndim
+    DLDataType dtype
+    int64_t* shape
+    int64_t* strides
+    uint64_t byte_offset
+
+cdef struct DLManagedTensor:
+    DLTensor dl_tensor
+    void* manager_ctx
+    void (*deleter)(DLManagedTensor*) noexcept nogil
+
+cdef struct DLPackVersion:
+    uint32_t major
+    uint32_t minor
+
+cdef struct DLManagedTensorVersioned:
+    DLPackVersion version
+    void* manager_ctx
+    void (*deleter)(DLManagedTensorVersioned*) noexcept nogil
+    uint64_t flags
+    DLTensor dl_tensor
+
+cdef struct DLPackExport:
+    # One allocation for the tensor of either version and its shape, the `manager_ctx` of the tensor
+    DLManagedTensor tensor
+    DLManagedTensorVersioned versioned
+    PyObject* owner
+    int64_t[3] shape
+    int64_t[3] strides
+
+cdef void _dlpack_free(DLPackExport* export) noexcept nogil:
+    # Called by the consumer once it's done with the tensor, maybe without the GIL
+    with gil:
+        Py_DECREF(<object> export.owner)
+    PyMem_RawFree(export)
+
+cdef void _dlpack_deleter(DLManagedTensor* tensor) noexcept nogil:
+    _dlpack_free(<DLPackExport*> tensor.manager_ctx)
+
+cdef void _dlpack_versioned_deleter(DLManagedTensorVersioned* tensor) noexcept nogil:
+    _dlpack_free(<DLPackExport*> tensor.manager_ctx)
+
+cdef void _dlpack_capsule_destructor(object capsule) noexcept:
+    # A consumed capsule is renamed to "used_dltensor", and the consumer calls the deleter itself
+    cdef DLManagedTensor* tensor
+    if PyCapsule_IsValid(capsule, b"dltensor"):
+        tensor = <DLManagedTensor*> PyCapsule_GetPointer(capsule, b"dltensor")
+        tensor.deleter(tensor)
+
+cdef void _dlpack_versioned_capsule_destructor(object capsule) noexcept:
+    cdef DLManagedTensorVersioned* tensor
+    if PyCapsule_IsValid(capsule, b"dltensor_versioned"):
+        tensor = <DLManagedTensorVersioned*> PyCapsule_GetPointer(capsule, b"dltensor_versioned")
+        tensor.deleter(tensor)
+
+cdef inline tuple dlpack_device():
+    return DLPACK_CPU, 0
+
+cdef inline object export_dlpack(object owner, void* data, char kind, Py_ssize_t itemsize, int ndim, Py_ssize_t* shape, object stream, object max_version, object dl_device, object copy):
+    # Wrap C-contiguous numbers of `kind` ("f" or "i") in a DLPack capsule, which keeps `owner` alive until it's deleted.
+    # The capsule is of DLPack 1.0 if the consumer supports it (`max_version`), otherwise of the older unversioned ABI.
+    # `copy` follows the array API: always copy if True, never if False, and only when needed if None.
+    if stream is not None:
+        raise BufferError(f"Only stream=None is supported for CPU data, got {stream!r}")
+    if dl_device is not None and tuple(dl_device) != dlpack_device():
+        raise BufferError(f"Can't export to device {dl_device!r}, only to the CPU")
+    cdef Py_ssize_t count = 1
+    cdef int i
+    for i in range(ndim):
+        count *= shape[i]
+    cdef bint copied = False
+    cdef double* doubles
+    cdef Py_ssize_t j
+    if kind == b"f" and itemsize != sizeof(float) and itemsize != sizeof(double):
+        # DLPack has no long double type, so they're exported as a copy of doubles
+        if copy is not None and not copy:
+            raise BufferError(f"DLPack has no {itemsize * 8}-bit long double type, the numbers can only be exported as a copy of doubles")
+        owner = PyByteArray_FromStringAndSize(NULL, count * sizeof(double))
+        doubles = <double*> PyByteArray_AS_STRING(owner)
+        for j in range(count):
+            doubles[j] = <double> (<py_float*> data)[j]
+        data = doubles
+        itemsize = sizeof(double)
+        copied = True
+    elif copy:
+        owner = PyByteArray_FromStringAndSize(<char*> data, count * itemsize)
+        data = PyByteArray_AS_STRING(owner)
+        copied = True
+    cdef bint versioned = max_version is not None and tuple(max_version) >= (1, 0)
+    cdef DLPackExport* export = <DLPackExport*> PyMem_RawMalloc(sizeof(DLPackExport))
+    if export == NULL:
+        raise MemoryError()
+    cdef DLTensor* tensor = &export.versioned.dl_tensor if versioned else &export.tensor.dl_tensor
+    for i in reversed(range(ndim)):
+        export.shape[i] = shape[i]
+        export.strides[i] = 1 if i == ndim - 1 else export.strides[i + 1] * shape[i + 1]
+    tensor.data = data
+    tensor.device.device_type = DLPACK_CPU
+    tensor.device.device_id = 0
+    tensor.ndim = ndim
+    tensor.dtype.code = DLPACK_FLOAT if kind == b"f" else DLPACK_INT
+    tensor.dtype.bits = <uint8_t> (itemsize * 8)
+    tensor.dtype.lanes = 1
+    tensor.shape = export.shape
+    tensor.strides = export.strides
+    tensor.byte_offset = 0
+    Py_INCREF(owner)
+    export.owner = <PyObject*> owner
+    try:
+        if versioned:
+            export.versioned.version.major = 1
+            export.versioned.version.minor = 0
+            export.versioned.manager_ctx = export
+            export.versioned.deleter = _dlpack_versioned_deleter
+            export.versioned.flags = DLPACK_FLAG_IS_COPIED if copied else 0
+            return PyCapsule_New(&export.versioned, b"dltensor_versioned", _dlpack_versioned_capsule_destructor)
+        export.tensor.manager_ctx = export
+        export.tensor.deleter = _dlpack_deleter
+        return PyCapsule_New(&export.tensor, b"dltensor", _dlpack_capsule_destructor)
+    except:
+        _dlpack_free(export)
+        raise
+from spatium._vector cimport Vec2, Vec3, Vec4, Vec2d, Vec3d, Vec4d, Vec2f, Vec3f, Vec4f
+from spatium._vector cimport Vec2Array, Vec3Array, Vec4Array
+
+
+########## transform_2d.pyx ##########
+from libc.math cimport atan2l, sinl, cosl, sqrtl, NAN
+
+cdef Py_ssize_t[2] _Transform2D_buffer_shape = [3, 2]
+cdef Py_ssize_t[2] _Transform2D_buffer_strides = [2 * sizeof(py_float), sizeof(py_float)]
+
+
+@cython.auto_pickle(True)
+@cython.freelist(1024)
+@cython.no_gc
+@cython.final
+cdef class Transform2D:
+    """2D linear transformation (2*3 matrix)."""
+
+
+
+    cdef inline void identity(self) noexcept:
+        self.xx, self.xy = 1.0, 0.0
+        self.yx, self.yy = 0.0, 1.0
+        self.ox = self.oy = 0.0
+
+    cdef inline void ___init___0(self) noexcept:
+        """Create an identity transform."""
+        self.identity()
+
+    cdef inline void ___init___1(self, py_float xx, py_float xy, py_float yx, py_float yy, py_float ox, py_float oy) noexcept:
+        """Create a transform from all the matrix elements."""
+        self.xx = xx
+        self.xy = xy
+        self.yx = yx
+        self.yy = yy
+        self.ox = ox
+        self.oy = oy
+
+    cdef inline void ___init___2(self, Vec2 x, Vec2 y, Vec2 origin) noexcept:
+        """Create a transform using two base vectors and the origin vector."""
+        self.xx, self.xy = x.x, x.y
+        self.yx, self.yy = y.x, y.y
+        self.ox, self.oy = origin.x, origin.y
+
+    cdef inline void ___init___3(self, Transform2D transform) noexcept:
+        """Create a copy."""
+        self.xx = transform.xx
+        self.xy = transform.xy
+        self.yx = transform.yx
+        self.yy = transform.yy
+        self.ox = transform.ox
+        self.oy = transform.oy
+
+    cdef inline void ___init___4(self, Transform2Dd transform) noexcept:
+        """Convert a double precision transform to a floating-point transform."""
+        self.xx = <py_float>transform.xx
+        self.xy = <py_float>transform.xy
+        self.yx = <py_float>transform.yx
+        self.yy = <py_float>transform.yy
+        self.ox = <py_float>transform.ox
+        self.oy = <py_float>transform.oy
+    
+    cdef inline void ___init___5(self, Transform2Df transform) noexcept:
+        """Convert a single precision transform to a floating-point transform."""
+        self.xx = <py_float>transform.xx
+        self.xy = <py_float>transform.xy
+        self.yx = <py_float>transform.yx
+        self.yy = <py_float>transform.yy
+        self.ox = <py_float>transform.ox
+        self.oy = <py_float>transform.oy
+
+    cdef inline object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5):
+        if (PyFloat_CheckExact(p0) or PyLong_CheckExact(p0)):
+            if (PyFloat_CheckExact(p1) or PyLong_CheckExact(p1)):
+                if (PyFloat_CheckExact(p2) or PyLong_CheckExact(p2)):
+                    if (PyFloat_CheckExact(p3) or PyLong_CheckExact(p3)):
+                        if (PyFloat_CheckExact(p4) or PyLong_CheckExact(p4)):
+                            if (PyFloat_CheckExact(p5) or PyLong_CheckExact(p5)):
+                                self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5))
+                                return
+        elif type(p0) is Vec2:
+            if type(p1) is Vec2:
+                if type(p2) is Vec2:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___2(<Vec2> p0, <Vec2> p1, <Vec2> p2)
+                                return
+        elif type(p0) is Transform2D:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___3(<Transform2D> p0)
+                                return
+        elif type(p0) is Transform2Dd:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___4(<Transform2Dd> p0)
+                                return
+        elif type(p0) is Transform2Df:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___5(<Transform2Df> p0)
+                                return
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___0()
+                                return
+        if (PyFloat_Check(p0) or PyLong_Check(p0)):
+            if (PyFloat_Check(p1) or PyLong_Check(p1)):
+                if (PyFloat_Check(p2) or PyLong_Check(p2)):
+                    if (PyFloat_Check(p3) or PyLong_Check(p3)):
+                        if (PyFloat_Check(p4) or PyLong_Check(p4)):
+                            if (PyFloat_Check(p5) or PyLong_Check(p5)):
+                                self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5))
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2 | None, got {p1}")
+        elif isinstance(p0, Vec2):
+            if isinstance(p1, Vec2):
+                if isinstance(p2, Vec2):
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___2(<Vec2> p0, <Vec2> p1, <Vec2> p2)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2 | None, got {p1}")
+        elif isinstance(p0, Transform2D):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___3(<Transform2D> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2 | None, got {p1}")
+        elif isinstance(p0, Transform2Dd):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___4(<Transform2Dd> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2 | None, got {p1}")
+        elif isinstance(p0, Transform2Df):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___5(<Transform2Df> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2 | None, got {p1}")
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___0()
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2 | None, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected float | int | Vec2 | Transform2D | Transform2Dd | Transform2Df | None, got {p0}")
+    
+    def __init__(self, object p0=None, object p1=None, object p2=None, object p3=None, object p4=None, object p5=None, /) -> None:
+        self.___init___dispatch(p0, p1, p2, p3, p4, p5)
+
+    @staticmethod
+    def translating(Vec2 translation, /) -> Transform2D:
+        """Create a translation transform."""
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        t.identity()
+        t.ox, t.oy = translation.x, translation.y
+        return t
+
+    @staticmethod
+    def rotating(py_float rotation, /, Vec2 origin = None) -> Transform2D:
+        """Create a rotation transform."""
+        cdef py_float c = cosl(rotation)
+        cdef py_float s = sinl(rotation)
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        t.xx = c
+        t.xy = s
+        t.yx = -s
+        t.yy = c
+        if origin is not None:
+            t.ox, t.oy = origin.x, origin.y
+        return t
+
+    @staticmethod
+    def scaling(Vec2 scale, /, Vec2 origin = None) -> Transform2D:
+        """Create a scale transform."""
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        t.xx = scale.x
+        t.yy = scale.y
+        if origin is not None:
+            t.ox, t.oy = origin.x, origin.y
+        return t
+
+    cdef inline void _copy_to(self, Transform2D t) noexcept:
+        t.xx = self.xx
+        t.xy = self.xy
+        t.yx = self.yx
+        t.yy = self.yy
+        t.ox = self.ox
+        t.oy = self.oy
+
+    cdef inline Transform2D copy(self):
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        self._copy_to(t)
+        return t
+
+    def __repr__(self) -> str:
+        return f"⎡X: ({self.xx}, {self.xy})\n⎢Y: ({self.yx}, {self.yy})\n⎣O: ({self.ox}, {self.oy})"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform2D.is_close()`
+        """
+        if not isinstance(other, Transform2D):
+            return False
+        cdef Transform2D trans = <Transform2D> other
+        return self.xx == trans.xx and self.xy == trans.xy and\
+               self.yx == trans.yx and self.yy == trans.yy and\
+               self.ox == trans.ox and self.oy == trans.oy
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform2D.is_close()`
+        """
+        if not isinstance(other, Transform2D):
+            return True
+        cdef Transform2D trans = <Transform2D> other
+        return self.xx != trans.xx or self.xy != trans.xy or \
+               self.yx != trans.yx or self.yy != trans.yy or \
+               self.ox != trans.ox or self.oy != trans.oy
+
+    def is_close(self, Transform2D other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if the two transforms are close enough.
+
+        See Also: `math.is_close()`
+        """
+        return is_close(self.xx, other.xx, rel_tol, abs_tol) and \
+               is_close(self.xy, other.xy, rel_tol, abs_tol) and \
+               is_close(self.yx, other.yx, rel_tol, abs_tol) and \
+               is_close(self.yy, other.yy, rel_tol, abs_tol) and \
+               is_close(self.ox, other.ox, rel_tol, abs_tol) and \
+               is_close(self.oy, other.oy, rel_tol, abs_tol)
+
+    def __hash__(self) -> py_int:
+        cdef uint64_t h = 6
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.ox))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oy))
+        return hash_finish(h)
+
+    @property
+    def x(self) -> Vec2:
+        """Base vector X."""
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+        vec.x = self.xx
+        vec.y = self.xy
+        return vec
+
+    @property
+    def y(self) -> Vec2:
+        """Base vector Y."""
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+        vec.x = self.yx
+        vec.y = self.yy
+        return vec
+
+    @property
+    def origin(self) -> Vec2:
+        """Origin vector."""
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+        vec.x = self.ox
+        vec.y = self.oy
+        return vec
+
+    @x.setter
+    def x(self, Vec2 value) -> None:
+        """Set the X base of the matrix."""
+        self.xx = value.x
+        self.xy = value.y
+
+    @y.setter
+    def y(self, Vec2 value) -> None:
+        """Set the Y base of the matrix."""
+        self.yx = value.x
+        self.yy = value.y
+
+    @origin.setter
+    def origin(self, Vec2 value) -> None:
+        """Set the origin."""
+        self.ox = value.x
+        self.oy = value.y
+
+    def __getitem__(self, py_int item) -> Vec2:
+        """Get a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+
+        if item == 0:
+            vec.x = self.xx
+            vec.y = self.xy
+        elif item == 1:
+            vec.x = self.yx
+            vec.y = self.yy
+        elif item == 2:
+            vec.x = self.ox
+            vec.y = self.oy
+        else:
+            raise IndexError(item)
+
+        return vec
+
+    def __setitem__(self, py_int key, Vec2 value) -> None:
+        """Set a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+
+        if key == 0:
+            self.xx = value.x
+            self.xy = value.y
+        elif key == 1:
+            self.yx = value.x
+            self.yy = value.y
+        elif key == 2:
+            self.ox = value.x
+            self.oy = value.y
+        else:
+            raise IndexError(key)
+
+    def __len__(self) -> py_int:
+        """The amount of columns. Is always 3 for `Transform2D`s."""
+        return 3
+
+    # Expose the matrix as a writable 3*2 buffer (one row per column vector), without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.xx, sizeof(py_float), b"g", 2, _Transform2D_buffer_shape, _Transform2D_buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        return PyBytes_FromStringAndSize(<char*> &self.xx, 6 * sizeof(py_float))
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform2D:
+        """Create a transform from the bytes written by `Transform2D.to_bytes()` (or any buffer of the same size)."""
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        read_bytes(data, &t.xx, 6 * sizeof(py_float))
+        return t
+
+    @staticmethod
+    def pack_many(object transforms, /) -> bytes:
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform2D.unpack_many()`
+        """
+        transforms = list(transforms)
+        cdef Py_ssize_t i, count = len(transforms)
+        cdef bytes block = new_pack_block(count, ord("g"), sizeof(py_float), 6)
+        cdef py_float* p = <py_float*> pack_block_items(block)
+        cdef Transform2D t
+        for i in range(count):
+            t = <Transform2D?> transforms[i]
+            memcpy(p + i * 6, &t.xx, 6 * sizeof(py_float))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[Transform2D]:
+        """Read the transforms of a block written by `Transform2D.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("g"), sizeof(py_float), 6, &items)
+        cdef list result = []
+        cdef Transform2D t
+        try:
+            for i in range(count):
+                t = Transform2D.__new__(Transform2D)
+                memcpy(&t.xx, items + i * 6 * sizeof(py_float), 6 * sizeof(py_float))
+                result.append(t)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+
+    cdef inline py_float tdotx(self, py_float x, py_float y) noexcept nogil:
+        return x * self.xx + y * self.yx
+
+    cdef inline py_float mulx(self, py_float x, py_float y) noexcept nogil:
+        return self.tdotx(x, y) + self.ox
+
+    cdef inline py_float tdoty(self, py_float x, py_float y) noexcept nogil:
+        return x * self.xy + y * self.yy
+
+    cdef inline py_float muly(self, py_float x, py_float y) noexcept nogil:
+        return self.tdoty(x, y) + self.oy
+
+    def __mul__(self, Vec2 other) -> Vec2:
+        """Transform a copy of the vector.
+
+        See Also: `Vec2.__mul__()`
+        """
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+        vec.x = self.mulx(other.x, other.y)
+        vec.y = self.muly(other.x, other.y)
+        return vec
+
+    def __rmul__(self, Vec2 other) -> Vec2:
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+
+        See Also: `Vec2.__mul__()`
+        """
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+        cdef py_float x = other.x - self.ox
+        cdef py_float y = other.y - self.oy
+        vec.x = self.xx * x + self.xy * y
+        vec.y = self.yx * x + self.yy * y
+        return vec
+
+    cdef inline Vec2 ___call___0(self, Vec2 other):
+        """Transform a copy of the vector.
+        
+        See Also: `Vec2.__mul__()`
+        """
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+        vec.x = self.mulx(other.x, other.y)
+        vec.y = self.muly(other.x, other.y)
+        return vec
+
+    cdef inline Transform2D ___call___1(self, Transform2D other):
+        """Transform a copy of the passed in `Transform2D`."""
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        t.xx = self.tdotx(other.xx, other.xy)
+        t.xy = self.tdoty(other.xx, other.xy)
+        t.yx = self.tdotx(other.yx, other.yy)
+        t.yy = self.tdoty(other.yx, other.yy)
+        t.ox = self.mulx(other.ox, other.oy)
+        t.oy = self.muly(other.ox, other.oy)
+        return t
+
+    def __call__(self, object p0, /) -> Vec2 | Transform2D:
+        if type(p0) is Vec2:
+            return self.___call___0(<Vec2> p0)
+        elif type(p0) is Transform2D:
+            return self.___call___1(<Transform2D> p0)
+        if isinstance(p0, Vec2):
+            return self.___call___0(<Vec2> p0)
+        elif isinstance(p0, Transform2D):
+            return self.___call___1(<Transform2D> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec2 | Transform2D, got {p0}")
+
+    cdef inline Vec2 _apply_into_0(self, Vec2 other, Vec2 out):
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+
+        See Also: `Transform2D.__call__()`
+        """
+        cdef py_float x = self.mulx(other.x, other.y)
+        cdef py_float y = self.muly(other.x, other.y)
+        out.x = x
+        out.y = y
+        return out
+
+    cdef inline Transform2D _apply_into_1(self, Transform2D other, Transform2D out):
+        """Transform the passed in `Transform2D`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        cdef py_float xx = self.tdotx(other.xx, other.xy)
+        cdef py_float xy = self.tdoty(other.xx, other.xy)
+        cdef py_float yx = self.tdotx(other.yx, other.yy)
+        cdef py_float yy = self.tdoty(other.yx, other.yy)
+        cdef py_float ox = self.mulx(other.ox, other.oy)
+        cdef py_float oy = self.muly(other.ox, other.oy)
+        out.xx = xx
+        out.xy = xy
+        out.yx = yx
+        out.yy = yy
+        out.ox = ox
+        out.oy = oy
+        return out
+
+    def apply_into(self, object p0, object p1, /) -> Vec2 | Transform2D:
+        if type(p0) is Vec2:
+            if type(p1) is Vec2:
+                return self._apply_into_0(<Vec2> p0, <Vec2> p1)
+        elif type(p0) is Transform2D:
+            if type(p1) is Transform2D:
+                return self._apply_into_1(<Transform2D> p0, <Transform2D> p1)
+        if isinstance(p0, Vec2):
+            if isinstance(p1, Vec2):
+                return self._apply_into_0(<Vec2> p0, <Vec2> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec2 | Transform2D, got {p1}")
+        elif isinstance(p0, Transform2D):
+            if isinstance(p1, Transform2D):
+                return self._apply_into_1(<Transform2D> p0, <Transform2D> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec2 | Transform2D, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected Vec2 | Transform2D, got {p0}")
+
+    cdef inline int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1:
+        if src.shape[1] != 2 or out.shape[1] != 2:
+            raise ValueError(f"Expected buffers of shape (N, 2), got ({src.shape[0]}, {src.shape[1]}) and ({out.shape[0]}, {out.shape[1]})")
+        if out.shape[0] != src.shape[0]:
+            raise ValueError(f"Buffer size mismatch: {src.shape[0]} and {out.shape[0]}")
+        cdef Py_ssize_t i
+        cdef py_float x, y
+        # The branch is taken once rather than for every vector
+        with nogil:
+            if inverse:
+                for i in range(src.shape[0]):
+                    x, y = src[i, 0], src[i, 1]
+                    x, y = x - self.ox, y - self.oy
+                    out[i, 0] = self.xx * x + self.xy * y
+                    out[i, 1] = self.yx * x + self.yy * y
+            else:
+                for i in range(src.shape[0]):
+                    x, y = src[i, 0], src[i, 1]
+                    out[i, 0] = self.mulx(x, y)
+                    out[i, 1] = self.muly(x, y)
+        return 0
+
+    cdef inline object _dispatch_many(self, object src, object out, bint inverse):
+        cdef str fmt = buffer_format(src)
+        if out is None:
+            out = Vec2Array(len(src)) if fmt == "g" else new_float_buffer(fmt, len(src), 2)
+        elif buffer_format(out) != fmt:
+            raise TypeError(f"Buffer format mismatch: {fmt} and {buffer_format(out)}")
+        cdef const float[:, ::1] src_f
+        cdef const double[:, ::1] src_d
+        cdef const py_float[:, ::1] src_g
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            src_f, out_f = src, out
+            self._apply_many(src_f, out_f, inverse)
+        elif fmt == "d":
+            src_d, out_d = src, out
+            self._apply_many(src_d, out_d, inverse)
+        elif fmt == "g":
+            src_g, out_g = src, out
+            self._apply_many(src_g, out_g, inverse)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def apply_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 2) float buffer (e.g. a `Vec2Array`) in one pass.
+
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec2Array` is created for long double buffers,
+        or a new (N, 2) memoryview of the same format for float and double buffers.
+
+        See Also: `Transform2D.__call__()`
+        """
+        return self._dispatch_many(src, out, False)
+
+    def apply_inverse_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 2) float buffer using the *INVERSE* of the transform.
+
+        This is the batched version of `vector * transform`, see `Transform2D.apply_many()` for the buffer semantics.
+
+        See Also: `Vec2.__mul__()`
+        """
+        return self._dispatch_many(src, out, True)
+
+    cdef inline Transform2D ___matmul___0(self, Transform2D other):
+        """Transform a copy of the `Transform2D` on the right."""
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        t.xx = self.tdotx(other.xx, other.xy)
+        t.xy = self.tdoty(other.xx, other.xy)
+        t.yx = self.tdotx(other.yx, other.yy)
+        t.yy = self.tdoty(other.yx, other.yy)
+        t.ox = self.mulx(other.ox, other.oy)
+        t.oy = self.muly(other.ox, other.oy)
+        return t
+
+    cdef inline Transform2DArray ___matmul___1(self, Transform2DArray other):
+        """Transform a copy of every transform of the `Transform2DArray` on the right (e.g. `parent @ children`)."""
+        return other._compose_left(self)
+
+    def __matmul__(self, object p0, /) -> Transform2D | Transform2DArray:
+        if type(p0) is Transform2D:
+            return self.___matmul___0(<Transform2D> p0)
+        elif type(p0) is Transform2DArray:
+            return self.___matmul___1(<Transform2DArray> p0)
+        if isinstance(p0, Transform2D):
+            return self.___matmul___0(<Transform2D> p0)
+        elif isinstance(p0, Transform2DArray):
+            return self.___matmul___1(<Transform2DArray> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform2D | Transform2DArray, got {p0}")
+
+    cdef inline void _transform_ip(self, Transform2D other) noexcept:
+        cdef py_float xx = other.tdotx(self.xx, self.xy)
+        cdef py_float xy = other.tdoty(self.xx, self.xy)
+        cdef py_float yx = other.tdotx(self.yx, self.yy)
+        cdef py_float yy = other.tdoty(self.yx, self.yy)
+        cdef py_float ox = other.mulx(self.ox, self.oy)
+        cdef py_float oy = other.muly(self.ox, self.oy)
+        self.xx, self.xy = xx, xy
+        self.yx, self.yy = yx, yy
+        self.ox, self.oy = ox, oy
+
+    def __imatmul__(self, Transform2D other) -> Transform2D:
+        #<RETURN_SELF>
+        """Transform this `Transform2D` inplace with the other `Transform2D`."""
+        self._transform_ip(other)
+        return self
+
+    cdef inline py_float _determinant(self) noexcept:
+        return self.xx * self.yy - self.xy * self.yx
+
+    @property
+    def determinant(self) -> py_float:
+        """Compute the determinant of the matrix."""
+        return self._determinant()
+
+    def __invert__(self) -> Transform2D:
+        """Get the invert transform.
+
+        See Also: `Vec2.__mul__()`
+        """
+        cdef py_float i_det = 1.0 / self._determinant()
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        t.xx = self.yy * +i_det
+        t.xy = self.xy * -i_det
+        t.yx = self.yx * -i_det
+        t.yy = self.xx * +i_det
+        t.ox = -t.tdotx(self.ox, self.oy)
+        t.oy = -t.tdoty(self.ox, self.oy)
+        return t
+
+
+    cdef inline py_float get_rotation(self) noexcept:
+        return atan2l(self.xy, self.xx)
+
+    cdef inline void set_rotation(self, py_float rotation) noexcept:
+        cdef py_float scale_x = self.get_scale_x()
+        cdef py_float scale_y = self.get_scale_y()
+        cdef py_float c = cosl(rotation)
+        cdef py_float s = sinl(rotation)
+        self.xx = c
+        self.xy = s
+        self.yx = -s
+        self.yy = c
+        self.set_scale_x(scale_x)
+        self.set_scale_y(scale_y)
+
+    cdef inline py_float get_scale_x(self) noexcept:
+        return sqrtl(self.xx * self.xx + self.xy * self.xy)
+
+    cdef inline py_float get_scale_y(self) noexcept:
+        cdef py_float det = self._determinant()
+        cdef py_float det_sign = 1.0 if det > 0.0 else -1.0 if det < 0.0 else 0.0 if det == 0.0 else NAN
+        return sqrtl(self.yx * self.yx + self.yy * self.yy) * det_sign
+
+    cdef inline void set_scale_x(self, py_float value) noexcept:
+        cdef py_float m = value / sqrtl(self.xx * self.xx + self.xy * self.xy)
+        self.xx *= m
+        self.xy *= m
+
+    cdef inline void set_scale_y(self, py_float value) noexcept:
+        cdef py_float m = value / sqrtl(self.yx * self.yx + self.yy * self.yy)
+        self.yx *= m
+        self.yy *= m
+
+    @property
+    def rotation(self) -> py_float:
+        """Get the rotation angle this transform represents."""
+        return self.get_rotation()
+
+    @rotation.setter
+    def rotation(self, py_float value) -> None:
+        """Set the rotation angle this transform represents.
+
+        See Also: `Transform2D.rotating()`
+        """
+        self.set_rotation(value)
+
+    # @property
+    # def scale(self) -> _T2ScaleProxy:
+    #     cdef _T2ScaleProxy proxy = _T2ScaleProxy.__new__(_T2ScaleProxy)
+    #     proxy.transform = self
+    #     return proxy
+    @property
+    def scale(self) -> Vec2:
+        """Get the scaling transformation this transform represents."""
+        cdef Vec2 vec = Vec2.__new__(Vec2)
+        vec.x = self.get_scale_x()
+        vec.y = self.get_scale_y()
+        return vec
+
+    @scale.setter
+    def scale(self, Vec2 value) -> None:
+        """Set the scaling transformation this transform represents.
+
+        See Also: `Transform2D.scaling()`
+        """
+        self.set_scale_x(value.x)
+        self.set_scale_y(value.y)
+
+
+    cdef inline void _translate_ip(self, Vec2 translation) noexcept:
+        self.ox = translation.x
+        self.oy = translation.y
+
+    def translate_ip(self, Vec2 translation, /) -> Transform2D:
+        #<RETURN_SELF>
+        """Apply translation to this transform inplace."""
+        self._translate_ip(translation)
+        return self
+
+    def translated(self, Vec2 translation, /) -> Transform2D:
+        """Apply translation to a copy of this transform."""
+        cdef Transform2D t = self.copy()
+        t.translate_ip(translation)
+        return t
+
+    def translate_into(self, Vec2 translation, Transform2D out, /) -> Transform2D:
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._translate_ip(translation)
+        return out
+
+    cdef inline void _rotate_ip(self, py_float rotation):
+        self._transform_ip(Transform2D.rotating(rotation))
+
+    def rotate_ip(self, py_float rotation, /) -> Transform2D:
+        #<RETURN_SELF>
+        """Apply rotation to this transform inplace."""
+        self._rotate_ip(rotation)
+        return self
+
+    def rotated(self, py_float rotation, /) -> Transform2D:
+        """Apply rotation to a copy of this transform."""
+        cdef Transform2D t = self.copy()
+        t.rotate_ip(rotation)
+        return t
+
+    def rotate_into(self, py_float rotation, Transform2D out, /) -> Transform2D:
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._rotate_ip(rotation)
+        return out
+
+    cdef inline void _scale_ip(self, Vec2 scale) noexcept:
+        self.xx *= scale.x
+        self.xy *= scale.y
+        self.yx *= scale.x
+        self.yy *= scale.y
+        self.ox *= scale.x
+        self.oy *= scale.y
+
+    def scale_ip(self, Vec2 scale, /) -> Transform2D:
+        #<RETURN_SELF>
+        """Apply scaling to this transform inplace."""
+        self._scale_ip(scale)
+        return self
+
+    def scaled(self, Vec2 scale, /) -> Transform2D:
+        """Apply scaling to a copy of this transform."""
+        cdef Transform2D t = self.copy()
+        t.scale_ip(scale)
+        return t
+
+    def scale_into(self, Vec2 scale, Transform2D out, /) -> Transform2D:
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._scale_ip(scale)
+        return out
+
+cdef object _Transform2D_vectorcall(PyObject* cls, PyObject** args, size_t nargsf, PyObject* kwnames):
+    cdef Py_ssize_t nargs = PyVectorcall_NARGS(nargsf)
+    if kwnames != NULL and len(<tuple> kwnames) != 0:
+        raise TypeError("Transform2D() takes no keyword arguments")
+    if nargs > 6:
+        raise TypeError(f"Transform2D() takes from 0 to 6 positional arguments but {nargs} were given")
+    cdef Transform2D self = Transform2D.__new__(Transform2D)
+    self.___init___dispatch(<object> args[0] if nargs > 0 else None, <object> args[1] if nargs > 1 else None, <object> args[2] if nargs > 2 else None, <object> args[3] if nargs > 3 else None, <object> args[4] if nargs > 4 else None, <object> args[5] if nargs > 5 else None)
+    return self
+
+(<PyVectorcallTypeObject*> Transform2D).tp_vectorcall = <vectorcallfunc> _Transform2D_vectorcall
+
+from libc.math cimport atan2, sin, cos, sqrt, NAN
+
+cdef Py_ssize_t[2] _Transform2Dd_buffer_shape = [3, 2]
+cdef Py_ssize_t[2] _Transform2Dd_buffer_strides = [2 * sizeof(double), sizeof(double)]
+
+
+@cython.auto_pickle(True)
+@cython.freelist(1024)
+@cython.no_gc
+@cython.final
+cdef class Transform2Dd:
+    """2D linear transformation (2*3 matrix) of `double`s."""
+
+
+
+    cdef inline void identity(self) noexcept:
+        self.xx, self.xy = 1.0, 0.0
+        self.yx, self.yy = 0.0, 1.0
+        self.ox = self.oy = 0.0
+
+    cdef inline void ___init___0(self) noexcept:
+        """Create an identity transform."""
+        self.identity()
+
+    cdef inline void ___init___1(self, double xx, double xy, double yx, double yy, double ox, double oy) noexcept:
+        """Create a transform from all the matrix elements."""
+        self.xx = xx
+        self.xy = xy
+        self.yx = yx
+        self.yy = yy
+        self.ox = ox
+        self.oy = oy
+
+    cdef inline void ___init___2(self, Vec2d x, Vec2d y, Vec2d origin) noexcept:
+        """Create a transform using two base vectors and the origin vector."""
+        self.xx, self.xy = x.x, x.y
+        self.yx, self.yy = y.x, y.y
+        self.ox, self.oy = origin.x, origin.y
+
+    cdef inline void ___init___3(self, Transform2Dd transform) noexcept:
+        """Create a copy."""
+        self.xx = transform.xx
+        self.xy = transform.xy
+        self.yx = transform.yx
+        self.yy = transform.yy
+        self.ox = transform.ox
+        self.oy = transform.oy
+
+    cdef inline void ___init___4(self, Transform2D transform) noexcept:
+        """Convert a floating-point transform to a double precision transform."""
+        self.xx = <double>transform.xx
+        self.xy = <double>transform.xy
+        self.yx = <double>transform.yx
+        self.yy = <double>transform.yy
+        self.ox = <double>transform.ox
+        self.oy = <double>transform.oy
+    
+    cdef inline void ___init___5(self, Transform2Df transform) noexcept:
+        """Convert a single precision transform to a double precision transform."""
+        self.xx = <double>transform.xx
+        self.xy = <double>transform.xy
+        self.yx = <double>transform.yx
+        self.yy = <double>transform.yy
+        self.ox = <double>transform.ox
+        self.oy = <double>transform.oy
+
+    cdef inline object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5):
+        if (PyFloat_CheckExact(p0) or PyLong_CheckExact(p0)):
+            if (PyFloat_CheckExact(p1) or PyLong_CheckExact(p1)):
+                if (PyFloat_CheckExact(p2) or PyLong_CheckExact(p2)):
+                    if (PyFloat_CheckExact(p3) or PyLong_CheckExact(p3)):
+                        if (PyFloat_CheckExact(p4) or PyLong_CheckExact(p4)):
+                            if (PyFloat_CheckExact(p5) or PyLong_CheckExact(p5)):
+                                self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5))
+                                return
+        elif type(p0) is Vec2d:
+            if type(p1) is Vec2d:
+                if type(p2) is Vec2d:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___2(<Vec2d> p0, <Vec2d> p1, <Vec2d> p2)
+                                return
+        elif type(p0) is Transform2Dd:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___3(<Transform2Dd> p0)
+                                return
+        elif type(p0) is Transform2D:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___4(<Transform2D> p0)
+                                return
+        elif type(p0) is Transform2Df:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___5(<Transform2Df> p0)
+                                return
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___0()
+                                return
+        if (PyFloat_Check(p0) or PyLong_Check(p0)):
+            if (PyFloat_Check(p1) or PyLong_Check(p1)):
+                if (PyFloat_Check(p2) or PyLong_Check(p2)):
+                    if (PyFloat_Check(p3) or PyLong_Check(p3)):
+                        if (PyFloat_Check(p4) or PyLong_Check(p4)):
+                            if (PyFloat_Check(p5) or PyLong_Check(p5)):
+                                self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5))
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2d | None, got {p1}")
+        elif isinstance(p0, Vec2d):
+            if isinstance(p1, Vec2d):
+                if isinstance(p2, Vec2d):
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___2(<Vec2d> p0, <Vec2d> p1, <Vec2d> p2)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2d | None, got {p1}")
+        elif isinstance(p0, Transform2Dd):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___3(<Transform2Dd> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2d | None, got {p1}")
+        elif isinstance(p0, Transform2D):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___4(<Transform2D> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2d | None, got {p1}")
+        elif isinstance(p0, Transform2Df):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___5(<Transform2Df> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2d | None, got {p1}")
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___0()
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2d | None, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected float | int | Vec2d | Transform2Dd | Transform2D | Transform2Df | None, got {p0}")
+    
+    def __init__(self, object p0=None, object p1=None, object p2=None, object p3=None, object p4=None, object p5=None, /) -> None:
+        self.___init___dispatch(p0, p1, p2, p3, p4, p5)
+
+    @staticmethod
+    def translating(Vec2d translation, /) -> Transform2Dd:
+        """Create a translation transform."""
+        cdef Transform2Dd t = Transform2Dd.__new__(Transform2Dd)
+        t.identity()
+        t.ox, t.oy = translation.x, translation.y
+        return t
+
+    @staticmethod
+    def rotating(double rotation, /, Vec2d origin = None) -> Transform2Dd:
+        """Create a rotation transform."""
+        cdef double c = cos(rotation)
+        cdef double s = sin(rotation)
+        cdef Transform2Dd t = Transform2Dd.__new__(Transform2Dd)
+        t.xx = c
+        t.xy = s
+        t.yx = -s
+        t.yy = c
+        if origin is not None:
+            t.ox, t.oy = origin.x, origin.y
+        return t
+
+    @staticmethod
+    def scaling(Vec2d scale, /, Vec2d origin = None) -> Transform2Dd:
+        """Create a scale transform."""
+        cdef Transform2Dd t = Transform2Dd.__new__(Transform2Dd)
+        t.xx = scale.x
+        t.yy = scale.y
+        if origin is not None:
+            t.ox, t.oy = origin.x, origin.y
+        return t
+
+    cdef inline void _copy_to(self, Transform2Dd t) noexcept:
+        t.xx = self.xx
+        t.xy = self.xy
+        t.yx = self.yx
+        t.yy = self.yy
+        t.ox = self.ox
+        t.oy = self.oy
+
+    cdef inline Transform2Dd copy(self):
+        cdef Transform2Dd t = Transform2Dd.__new__(Transform2Dd)
+        self._copy_to(t)
+        return t
+
+    def __repr__(self) -> str:
+        return f"⎡X: ({self.xx}, {self.xy})\n⎢Y: ({self.yx}, {self.yy})\n⎣O: ({self.ox}, {self.oy})"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform2Dd.is_close()`
+        """
+        if not isinstance(other, Transform2Dd):
+            return False
+        cdef Transform2Dd trans = <Transform2Dd> other
+        return self.xx == trans.xx and self.xy == trans.xy and\
+               self.yx == trans.yx and self.yy == trans.yy and\
+               self.ox == trans.ox and self.oy == trans.oy
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform2Dd.is_close()`
+        """
+        if not isinstance(other, Transform2Dd):
+            return True
+        cdef Transform2Dd trans = <Transform2Dd> other
+        return self.xx != trans.xx or self.xy != trans.xy or \
+               self.yx != trans.yx or self.yy != trans.yy or \
+               self.ox != trans.ox or self.oy != trans.oy
+
+    def is_close(self, Transform2Dd other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if the two transforms are close enough.
+
+        See Also: `math.is_close()`
+        """
+        return is_close(self.xx, other.xx, rel_tol, abs_tol) and \
+               is_close(self.xy, other.xy, rel_tol, abs_tol) and \
+               is_close(self.yx, other.yx, rel_tol, abs_tol) and \
+               is_close(self.yy, other.yy, rel_tol, abs_tol) and \
+               is_close(self.ox, other.ox, rel_tol, abs_tol) and \
+               is_close(self.oy, other.oy, rel_tol, abs_tol)
+
+    def __hash__(self) -> py_int:
+        cdef uint64_t h = 6
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.ox))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oy))
+        return hash_finish(h)
+
+    @property
+    def x(self) -> Vec2d:
+        """Base vector X."""
+        cdef Vec2d vec = Vec2d.__new__(Vec2d)
+        vec.x = self.xx
+        vec.y = self.xy
+        return vec
+
+    @property
+    def y(self) -> Vec2d:
+        """Base vector Y."""
+        cdef Vec2d vec = Vec2d.__new__(Vec2d)
+        vec.x = self.yx
+        vec.y = self.yy
+        return vec
+
+    @property
+    def origin(self) -> Vec2d:
+        """Origin vector."""
+        cdef Vec2d vec = Vec2d.__new__(Vec2d)
+        vec.x = self.ox
+        vec.y = self.oy
+        return vec
+
+    @x.setter
+    def x(self, Vec2d value) -> None:
+        """Set the X base of the matrix."""
+        self.xx = value.x
+        self.xy = value.y
+
+    @y.setter
+    def y(self, Vec2d value) -> None:
+        """Set the Y base of the matrix."""
+        self.yx = value.x
+        self.yy = value.y
+
+    @origin.setter
+    def origin(self, Vec2d value) -> None:
+        """Set the origin."""
+        self.ox = value.x
+        self.oy = value.y
+
+    def __getitem__(self, py_int item) -> Vec2d:
+        """Get a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        cdef Vec2d vec = Vec2d.__new__(Vec2d)
+
+        if item == 0:
+            vec.x = self.xx
+            vec.y = self.xy
+        elif item == 1:
+            vec.x = self.yx
+            vec.y = self.yy
+        elif item == 2:
+            vec.x = self.ox
+            vec.y = self.oy
+        else:
+            raise IndexError(item)
+
+        return vec
+
+    def __setitem__(self, py_int key, Vec2d value) -> None:
+        """Set a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+
+        if key == 0:
+            self.xx = value.x
+            self.xy = value.y
+        elif key == 1:
+            self.yx = value.x
+            self.yy = value.y
+        elif key == 2:
+            self.ox = value.x
+            self.oy = value.y
+        else:
+            raise IndexError(key)
+
+    def __len__(self) -> py_int:
+        """The amount of columns. Is always 3 for `Transform2Dd`s."""
+        return 3
+
+    # Expose the matrix as a writable 3*2 buffer (one row per column vector), without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.xx, sizeof(double), b"d", 2, _Transform2Dd_buffer_shape, _Transform2Dd_buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        return PyBytes_FromStringAndSize(<char*> &self.xx, 6 * sizeof(double))
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform2Dd:
+        """Create a transform from the bytes written by `Transform2Dd.to_bytes()` (or any buffer of the same size)."""
+        cdef Transform2Dd t = Transform2Dd.__new__(Transform2Dd)
+        read_bytes(data, &t.xx, 6 * sizeof(double))
+        return t
+
+    @staticmethod
+    def pack_many(object transforms, /) -> bytes:
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform2Dd.unpack_many()`
+        """
+        transforms = list(transforms)
+        cdef Py_ssize_t i, count = len(transforms)
+        cdef bytes block = new_pack_block(count, ord("d"), sizeof(double), 6)
+        cdef double* p = <double*> pack_block_items(block)
+        cdef Transform2Dd t
+        for i in range(count):
+            t = <Transform2Dd?> transforms[i]
+            memcpy(p + i * 6, &t.xx, 6 * sizeof(double))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[Transform2Dd]:
+        """Read the transforms of a block written by `Transform2Dd.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("d"), sizeof(double), 6, &items)
+        cdef list result = []
+        cdef Transform2Dd t
+        try:
+            for i in range(count):
+                t = Transform2Dd.__new__(Transform2Dd)
+                memcpy(&t.xx, items + i * 6 * sizeof(double), 6 * sizeof(double))
+                result.append(t)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+
+    cdef inline double tdotx(self, double x, double y) noexcept nogil:
+        return x * self.xx + y * self.yx
+
+    cdef inline double mulx(self, double x, double y) noexcept nogil:
+        return self.tdotx(x, y) + self.ox
+
+    cdef inline double tdoty(self, double x, double y) noexcept nogil:
+        return x * self.xy + y * self.yy
+
+    cdef inline double muly(self, double x, double y) noexcept nogil:
+        return self.tdoty(x, y) + self.oy
+
+    def __mul__(self, Vec2d other) -> Vec2d:
+        """Transform a copy of the vector.
+
+        See Also: `Vec2d.__mul__()`
+        """
+        cdef Vec2d vec = Vec2d.__new__(Vec2d)
+        vec.x = self.mulx(other.x, other.y)
+        vec.y = self.muly(other.x, other.y)
+        return vec
+
+    def __rmul__(self, Vec2d other) -> Vec2d:
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+
+        See Also: `Vec2d.__mul__()`
+        """
+        cdef Vec2d vec = Vec2d.__new__(Vec2d)
+        cdef double x = other.x - self.ox
+        cdef double y = other.y - self.oy
+        vec.x = self.xx * x + self.xy * y
+        vec.y = self.yx * x + self.yy * y
+        return vec
+
+    cdef inline Vec2d ___call___0(self, Vec2d other):
+        """Transform a copy of the vector.
+        
+        See Also: `Vec2d.__mul__()`
+        """
+        cdef Vec2d vec = Vec2d.__new__(Vec2d)
+        vec.x = self.mulx(other.x, other.y)
+        vec.y = self.muly(other.x, other.y)
+        return vec
+
+    cdef inline Transform2Dd ___call___1(self, Transform2Dd other):
+        """Transform a copy of the passed in `Transform2Dd`."""
+        cdef Transform2Dd t = Transform2Dd.__new__(Transform2Dd)
+        t.xx = self.tdotx(other.xx, other.xy)
+        t.xy = self.tdoty(other.xx, other.xy)
+        t.yx = self.tdotx(other.yx, other.yy)
+        t.yy = self.tdoty(other.yx, other.yy)
+        t.ox = self.mulx(other.ox, other.oy)
+        t.oy = self.muly(other.ox, other.oy)
+        return t
+
+    def __call__(self, object p0, /) -> Vec2d | Transform2Dd:
+        if type(p0) is Vec2d:
+            return self.___call___0(<Vec2d> p0)
+        elif type(p0) is Transform2Dd:
+            return self.___call___1(<Transform2Dd> p0)
+        if isinstance(p0, Vec2d):
+            return self.___call___0(<Vec2d> p0)
+        elif isinstance(p0, Transform2Dd):
+            return self.___call___1(<Transform2Dd> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec2d | Transform2Dd, got {p0}")
+
+    cdef inline Vec2d _apply_into_0(self, Vec2d other, Vec2d out):
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+
+        See Also: `Transform2Dd.__call__()`
+        """
+        cdef double x = self.mulx(other.x, other.y)
+        cdef double y = self.muly(other.x, other.y)
+        out.x = x
+        out.y = y
+        return out
+
+    cdef inline Transform2Dd _apply_into_1(self, Transform2Dd other, Transform2Dd out):
+        """Transform the passed in `Transform2Dd`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        cdef double xx = self.tdotx(other.xx, other.xy)
+        cdef double xy = self.tdoty(other.xx, other.xy)
+        cdef double yx = self.tdotx(other.yx, other.yy)
+        cdef double yy = self.tdoty(other.yx, other.yy)
+        cdef double ox = self.mulx(other.ox, other.oy)
+        cdef double oy = self.muly(other.ox, other.oy)
+        out.xx = xx
+        out.xy = xy
+        out.yx = yx
+        out.yy = yy
+        out.ox = ox
+        out.oy = oy
+        return out
+
+    def apply_into(self, object p0, object p1, /) -> Vec2d | Transform2Dd:
+        if type(p0) is Vec2d:
+            if type(p1) is Vec2d:
+                return self._apply_into_0(<Vec2d> p0, <Vec2d> p1)
+        elif type(p0) is Transform2Dd:
+            if type(p1) is Transform2Dd:
+                return self._apply_into_1(<Transform2Dd> p0, <Transform2Dd> p1)
+        if isinstance(p0, Vec2d):
+            if isinstance(p1, Vec2d):
+                return self._apply_into_0(<Vec2d> p0, <Vec2d> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec2d | Transform2Dd, got {p1}")
+        elif isinstance(p0, Transform2Dd):
+            if isinstance(p1, Transform2Dd):
+                return self._apply_into_1(<Transform2Dd> p0, <Transform2Dd> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec2d | Transform2Dd, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected Vec2d | Transform2Dd, got {p0}")
+
+    cdef inline int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1:
+        if src.shape[1] != 2 or out.shape[1] != 2:
+            raise ValueError(f"Expected buffers of shape (N, 2), got ({src.shape[0]}, {src.shape[1]}) and ({out.shape[0]}, {out.shape[1]})")
+        if out.shape[0] != src.shape[0]:
+            raise ValueError(f"Buffer size mismatch: {src.shape[0]} and {out.shape[0]}")
+        cdef Py_ssize_t i
+        cdef double x, y
+        # The branch is taken once rather than for every vector
+        with nogil:
+            if inverse:
+                for i in range(src.shape[0]):
+                    x, y = src[i, 0], src[i, 1]
+                    x, y = x - self.ox, y - self.oy
+                    out[i, 0] = self.xx * x + self.xy * y
+                    out[i, 1] = self.yx * x + self.yy * y
+            else:
+                for i in range(src.shape[0]):
+                    x, y = src[i, 0], src[i, 1]
+                    out[i, 0] = self.mulx(x, y)
+                    out[i, 1] = self.muly(x, y)
+        return 0
+
+    cdef inline object _dispatch_many(self, object src, object out, bint inverse):
+        cdef str fmt = buffer_format(src)
+        if out is None:
+            out = Vec2Array(len(src)) if fmt == "g" else new_float_buffer(fmt, len(src), 2)
+        elif buffer_format(out) != fmt:
+            raise TypeError(f"Buffer format mismatch: {fmt} and {buffer_format(out)}")
+        cdef const float[:, ::1] src_f
+        cdef const double[:, ::1] src_d
+        cdef const py_float[:, ::1] src_g
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            src_f, out_f = src, out
+            self._apply_many(src_f, out_f, inverse)
+        elif fmt == "d":
+            src_d, out_d = src, out
+            self._apply_many(src_d, out_d, inverse)
+        elif fmt == "g":
+            src_g, out_g = src, out
+            self._apply_many(src_g, out_g, inverse)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def apply_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 2) float buffer (e.g. a `Vec2Array`) in one pass.
+
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec2Array` is created for long double buffers,
+        or a new (N, 2) memoryview of the same format for float and double buffers.
+
+        See Also: `Transform2Dd.__call__()`
+        """
+        return self._dispatch_many(src, out, False)
+
+    def apply_inverse_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 2) float buffer using the *INVERSE* of the transform.
+
+        This is the batched version of `vector * transform`, see `Transform2Dd.apply_many()` for the buffer semantics.
+
+        See Also: `Vec2d.__mul__()`
+        """
+        return self._dispatch_many(src, out, True)
+
+    cdef inline Transform2Dd ___matmul___0(self, Transform2Dd other):
+        """Transform a copy of the `Transform2Dd` on the right."""
+        cdef Transform2Dd t = Transform2Dd.__new__(Transform2Dd)
+        t.xx = self.tdotx(other.xx, other.xy)
+        t.xy = self.tdoty(other.xx, other.xy)
+        t.yx = self.tdotx(other.yx, other.yy)
+        t.yy = self.tdoty(other.yx, other.yy)
+        t.ox = self.mulx(other.ox, other.oy)
+        t.oy = self.muly(other.ox, other.oy)
+        return t
+
+
+    def __matmul__(self, object p0, /) -> Transform2Dd:
+        if type(p0) is Transform2Dd:
+            return self.___matmul___0(<Transform2Dd> p0)
+        if isinstance(p0, Transform2Dd):
+            return self.___matmul___0(<Transform2Dd> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform2Dd, got {p0}")
+
+    cdef inline void _transform_ip(self, Transform2Dd other) noexcept:
+        cdef double xx = other.tdotx(self.xx, self.xy)
+        cdef double xy = other.tdoty(self.xx, self.xy)
+        cdef double yx = other.tdotx(self.yx, self.yy)
+        cdef double yy = other.tdoty(self.yx, self.yy)
+        cdef double ox = other.mulx(self.ox, self.oy)
+        cdef double oy = other.muly(self.ox, self.oy)
+        self.xx, self.xy = xx, xy
+        self.yx, self.yy = yx, yy
+        self.ox, self.oy = ox, oy
+
+    def __imatmul__(self, Transform2Dd other) -> Transform2Dd:
+        #<RETURN_SELF>
+        """Transform this `Transform2Dd` inplace with the other `Transform2Dd`."""
+        self._transform_ip(other)
+        return self
+
+    cdef inline double _determinant(self) noexcept:
+        return self.xx * self.yy - self.xy * self.yx
+
+    @property
+    def determinant(self) -> double:
+        """Compute the determinant of the matrix."""
+        return self._determinant()
+
+    def __invert__(self) -> Transform2Dd:
+        """Get the invert transform.
+
+        See Also: `Vec2d.__mul__()`
+        """
+        cdef double i_det = 1.0 / self._determinant()
+        cdef Transform2Dd t = Transform2Dd.__new__(Transform2Dd)
+        t.xx = self.yy * +i_det
+        t.xy = self.xy * -i_det
+        t.yx = self.yx * -i_det
+        t.yy = self.xx * +i_det
+        t.ox = -t.tdotx(self.ox, self.oy)
+        t.oy = -t.tdoty(self.ox, self.oy)
+        return t
+
+
+    cdef inline double get_rotation(self) noexcept:
+        return atan2(self.xy, self.xx)
+
+    cdef inline void set_rotation(self, double rotation) noexcept:
+        cdef double scale_x = self.get_scale_x()
+        cdef double scale_y = self.get_scale_y()
+        cdef double c = cos(rotation)
+        cdef double s = sin(rotation)
+        self.xx = c
+        self.xy = s
+        self.yx = -s
+        self.yy = c
+        self.set_scale_x(scale_x)
+        self.set_scale_y(scale_y)
+
+    cdef inline double get_scale_x(self) noexcept:
+        return sqrt(self.xx * self.xx + self.xy * self.xy)
+
+    cdef inline double get_scale_y(self) noexcept:
+        cdef double det = self._determinant()
+        cdef double det_sign = 1.0 if det > 0.0 else -1.0 if det < 0.0 else 0.0 if det == 0.0 else NAN
+        return sqrt(self.yx * self.yx + self.yy * self.yy) * det_sign
+
+    cdef inline void set_scale_x(self, double value) noexcept:
+        cdef double m = value / sqrt(self.xx * self.xx + self.xy * self.xy)
+        self.xx *= m
+        self.xy *= m
+
+    cdef inline void set_scale_y(self, double value) noexcept:
+        cdef double m = value / sqrt(self.yx * self.yx + self.yy * self.yy)
+        self.yx *= m
+        self.yy *= m
+
+    @property
+    def rotation(self) -> double:
+        """Get the rotation angle this transform represents."""
+        return self.get_rotation()
+
+    @rotation.setter
+    def rotation(self, double value) -> None:
+        """Set the rotation angle this transform represents.
+
+        See Also: `Transform2Dd.rotating()`
+        """
+        self.set_rotation(value)
+
+    # @property
+    # def scale(self) -> _T2ScaleProxy:
+    #     cdef _T2ScaleProxy proxy = _T2ScaleProxy.__new__(_T2ScaleProxy)
+    #     proxy.transform = self
+    #     return proxy
+    @property
+    def scale(self) -> Vec2d:
+        """Get the scaling transformation this transform represents."""
+        cdef Vec2d vec = Vec2d.__new__(Vec2d)
+        vec.x = self.get_scale_x()
+        vec.y = self.get_scale_y()
+        return vec
+
+    @scale.setter
+    def scale(self, Vec2d value) -> None:
+        """Set the scaling transformation this transform represents.
+
+        See Also: `Transform2Dd.scaling()`
+        """
+        self.set_scale_x(value.x)
+        self.set_scale_y(value.y)
+
+
+    cdef inline void _translate_ip(self, Vec2d translation) noexcept:
+        self.ox = translation.x
+        self.oy = translation.y
+
+    def translate_ip(self, Vec2d translation, /) -> Transform2Dd:
+        #<RETURN_SELF>
+        """Apply translation to this transform inplace."""
+        self._translate_ip(translation)
+        return self
+
+    def translated(self, Vec2d translation, /) -> Transform2Dd:
+        """Apply translation to a copy of this transform."""
+        cdef Transform2Dd t = self.copy()
+        t.translate_ip(translation)
+        return t
+
+    def translate_into(self, Vec2d translation, Transform2Dd out, /) -> Transform2Dd:
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._translate_ip(translation)
+        return out
+
+    cdef inline void _rotate_ip(self, double rotation):
+        self._transform_ip(Transform2Dd.rotating(rotation))
+
+    def rotate_ip(self, double rotation, /) -> Transform2Dd:
+        #<RETURN_SELF>
+        """Apply rotation to this transform inplace."""
+        self._rotate_ip(rotation)
+        return self
+
+    def rotated(self, double rotation, /) -> Transform2Dd:
+        """Apply rotation to a copy of this transform."""
+        cdef Transform2Dd t = self.copy()
+        t.rotate_ip(rotation)
+        return t
+
+    def rotate_into(self, double rotation, Transform2Dd out, /) -> Transform2Dd:
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._rotate_ip(rotation)
+        return out
+
+    cdef inline void _scale_ip(self, Vec2d scale) noexcept:
+        self.xx *= scale.x
+        self.xy *= scale.y
+        self.yx *= scale.x
+        self.yy *= scale.y
+        self.ox *= scale.x
+        self.oy *= scale.y
+
+    def scale_ip(self, Vec2d scale, /) -> Transform2Dd:
+        #<RETURN_SELF>
+        """Apply scaling to this transform inplace."""
+        self._scale_ip(scale)
+        return self
+
+    def scaled(self, Vec2d scale, /) -> Transform2Dd:
+        """Apply scaling to a copy of this transform."""
+        cdef Transform2Dd t = self.copy()
+        t.scale_ip(scale)
+        return t
+
+    def scale_into(self, Vec2d scale, Transform2Dd out, /) -> Transform2Dd:
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._scale_ip(scale)
+        return out
+
+cdef object _Transform2Dd_vectorcall(PyObject* cls, PyObject** args, size_t nargsf, PyObject* kwnames):
+    cdef Py_ssize_t nargs = PyVectorcall_NARGS(nargsf)
+    if kwnames != NULL and len(<tuple> kwnames) != 0:
+        raise TypeError("Transform2Dd() takes no keyword arguments")
+    if nargs > 6:
+        raise TypeError(f"Transform2Dd() takes from 0 to 6 positional arguments but {nargs} were given")
+    cdef Transform2Dd self = Transform2Dd.__new__(Transform2Dd)
+    self.___init___dispatch(<object> args[0] if nargs > 0 else None, <object> args[1] if nargs > 1 else None, <object> args[2] if nargs > 2 else None, <object> args[3] if nargs > 3 else None, <object> args[4] if nargs > 4 else None, <object> args[5] if nargs > 5 else None)
+    return self
+
+(<PyVectorcallTypeObject*> Transform2Dd).tp_vectorcall = <vectorcallfunc> _Transform2Dd_vectorcall
+
+from libc.math cimport atan2f, sinf, cosf, sqrtf, NAN
+
+cdef Py_ssize_t[2] _Transform2Df_buffer_shape = [3, 2]
+cdef Py_ssize_t[2] _Transform2Df_buffer_strides = [2 * sizeof(float), sizeof(float)]
+
+
+@cython.auto_pickle(True)
+@cython.freelist(1024)
+@cython.no_gc
+@cython.final
+cdef class Transform2Df:
+    """2D linear transformation (2*3 matrix) of `float`s."""
+
+
+
+    cdef inline void identity(self) noexcept:
+        self.xx, self.xy = 1.0, 0.0
+        self.yx, self.yy = 0.0, 1.0
+        self.ox = self.oy = 0.0
+
+    cdef inline void ___init___0(self) noexcept:
+        """Create an identity transform."""
+        self.identity()
+
+    cdef inline void ___init___1(self, float xx, float xy, float yx, float yy, float ox, float oy) noexcept:
+        """Create a transform from all the matrix elements."""
+        self.xx = xx
+        self.xy = xy
+        self.yx = yx
+        self.yy = yy
+        self.ox = ox
+        self.oy = oy
+
+    cdef inline void ___init___2(self, Vec2f x, Vec2f y, Vec2f origin) noexcept:
+        """Create a transform using two base vectors and the origin vector."""
+        self.xx, self.xy = x.x, x.y
+        self.yx, self.yy = y.x, y.y
+        self.ox, self.oy = origin.x, origin.y
+
+    cdef inline void ___init___3(self, Transform2Df transform) noexcept:
+        """Create a copy."""
+        self.xx = transform.xx
+        self.xy = transform.xy
+        self.yx = transform.yx
+        self.yy = transform.yy
+        self.ox = transform.ox
+        self.oy = transform.oy
+
+    cdef inline void ___init___4(self, Transform2D transform) noexcept:
+        """Convert a floating-point transform to a single precision transform."""
+        self.xx = <float>transform.xx
+        self.xy = <float>transform.xy
+        self.yx = <float>transform.yx
+        self.yy = <float>transform.yy
+        self.ox = <float>transform.ox
+        self.oy = <float>transform.oy
+    
+    cdef inline void ___init___5(self, Transform2Dd transform) noexcept:
+        """Convert a double precision transform to a single precision transform."""
+        self.xx = <float>transform.xx
+        self.xy = <float>transform.xy
+        self.yx = <float>transform.yx
+        self.yy = <float>transform.yy
+        self.ox = <float>transform.ox
+        self.oy = <float>transform.oy
+
+    cdef inline object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5):
+        if (PyFloat_CheckExact(p0) or PyLong_CheckExact(p0)):
+            if (PyFloat_CheckExact(p1) or PyLong_CheckExact(p1)):
+                if (PyFloat_CheckExact(p2) or PyLong_CheckExact(p2)):
+                    if (PyFloat_CheckExact(p3) or PyLong_CheckExact(p3)):
+                        if (PyFloat_CheckExact(p4) or PyLong_CheckExact(p4)):
+                            if (PyFloat_CheckExact(p5) or PyLong_CheckExact(p5)):
+                                self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5))
+                                return
+        elif type(p0) is Vec2f:
+            if type(p1) is Vec2f:
+                if type(p2) is Vec2f:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___2(<Vec2f> p0, <Vec2f> p1, <Vec2f> p2)
+                                return
+        elif type(p0) is Transform2Df:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___3(<Transform2Df> p0)
+                                return
+        elif type(p0) is Transform2D:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___4(<Transform2D> p0)
+                                return
+        elif type(p0) is Transform2Dd:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___5(<Transform2Dd> p0)
+                                return
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___0()
+                                return
+        if (PyFloat_Check(p0) or PyLong_Check(p0)):
+            if (PyFloat_Check(p1) or PyLong_Check(p1)):
+                if (PyFloat_Check(p2) or PyLong_Check(p2)):
+                    if (PyFloat_Check(p3) or PyLong_Check(p3)):
+                        if (PyFloat_Check(p4) or PyLong_Check(p4)):
+                            if (PyFloat_Check(p5) or PyLong_Check(p5)):
+                                self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5))
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2f | None, got {p1}")
+        elif isinstance(p0, Vec2f):
+            if isinstance(p1, Vec2f):
+                if isinstance(p2, Vec2f):
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___2(<Vec2f> p0, <Vec2f> p1, <Vec2f> p2)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2f | None, got {p1}")
+        elif isinstance(p0, Transform2Df):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___3(<Transform2Df> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2f | None, got {p1}")
+        elif isinstance(p0, Transform2D):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___4(<Transform2D> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2f | None, got {p1}")
+        elif isinstance(p0, Transform2Dd):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___5(<Transform2Dd> p0)
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2f | None, got {p1}")
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                self.___init___0()
+                                return
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec2f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec2f | None, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected float | int | Vec2f | Transform2Df | Transform2D | Transform2Dd | None, got {p0}")
+    
+    def __init__(self, object p0=None, object p1=None, object p2=None, object p3=None, object p4=None, object p5=None, /) -> None:
+        self.___init___dispatch(p0, p1, p2, p3, p4, p5)
+
+    @staticmethod
+    def translating(Vec2f translation, /) -> Transform2Df:
+        """Create a translation transform."""
+        cdef Transform2Df t = Transform2Df.__new__(Transform2Df)
+        t.identity()
+        t.ox, t.oy = translation.x, translation.y
+        return t
+
+    @staticmethod
+    def rotating(float rotation, /, Vec2f origin = None) -> Transform2Df:
+        """Create a rotation transform."""
+        cdef float c = cosf(rotation)
+        cdef float s = sinf(rotation)
+        cdef Transform2Df t = Transform2Df.__new__(Transform2Df)
+        t.xx = c
+        t.xy = s
+        t.yx = -s
+        t.yy = c
+        if origin is not None:
+            t.ox, t.oy = origin.x, origin.y
+        return t
+
+    @staticmethod
+    def scaling(Vec2f scale, /, Vec2f origin = None) -> Transform2Df:
+        """Create a scale transform."""
+        cdef Transform2Df t = Transform2Df.__new__(Transform2Df)
+        t.xx = scale.x
+        t.yy = scale.y
+        if origin is not None:
+            t.ox, t.oy = origin.x, origin.y
+        return t
+
+    cdef inline void _copy_to(self, Transform2Df t) noexcept:
+        t.xx = self.xx
+        t.xy = self.xy
+        t.yx = self.yx
+        t.yy = self.yy
+        t.ox = self.ox
+        t.oy = self.oy
+
+    cdef inline Transform2Df copy(self):
+        cdef Transform2Df t = Transform2Df.__new__(Transform2Df)
+        self._copy_to(t)
+        return t
+
+    def __repr__(self) -> str:
+        return f"⎡X: ({self.xx}, {self.xy})\n⎢Y: ({self.yx}, {self.yy})\n⎣O: ({self.ox}, {self.oy})"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform2Df.is_close()`
+        """
+        if not isinstance(other, Transform2Df):
+            return False
+        cdef Transform2Df trans = <Transform2Df> other
+        return self.xx == trans.xx and self.xy == trans.xy and\
+               self.yx == trans.yx and self.yy == trans.yy and\
+               self.ox == trans.ox and self.oy == trans.oy
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform2Df.is_close()`
+        """
+        if not isinstance(other, Transform2Df):
+            return True
+        cdef Transform2Df trans = <Transform2Df> other
+        return self.xx != trans.xx or self.xy != trans.xy or \
+               self.yx != trans.yx or self.yy != trans.yy or \
+               self.ox != trans.ox or self.oy != trans.oy
+
+    def is_close(self, Transform2Df other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if the two transforms are close enough.
+
+        See Also: `math.is_close()`
+        """
+        return is_close(self.xx, other.xx, rel_tol, abs_tol) and \
+               is_close(self.xy, other.xy, rel_tol, abs_tol) and \
+               is_close(self.yx, other.yx, rel_tol, abs_tol) and \
+               is_close(self.yy, other.yy, rel_tol, abs_tol) and \
+               is_close(self.ox, other.ox, rel_tol, abs_tol) and \
+               is_close(self.oy, other.oy, rel_tol, abs_tol)
+
+    def __hash__(self) -> py_int:
+        cdef uint64_t h = 6
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.ox))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oy))
+        return hash_finish(h)
+
+    @property
+    def x(self) -> Vec2f:
+        """Base vector X."""
+        cdef Vec2f vec = Vec2f.__new__(Vec2f)
+        vec.x = self.xx
+        vec.y = self.xy
+        return vec
+
+    @property
+    def y(self) -> Vec2f:
+        """Base vector Y."""
+        cdef Vec2f vec = Vec2f.__new__(Vec2f)
+        vec.x = self.yx
+        vec.y = self.yy
+        return vec
+
+    @property
+    def origin(self) -> Vec2f:
+        """Origin vector."""
+        cdef Vec2f vec = Vec2f.__new__(Vec2f)
+        vec.x = self.ox
+        vec.y = self.oy
+        return vec
+
+    @x.setter
+    def x(self, Vec2f value) -> None:
+        """Set the X base of the matrix."""
+        self.xx = value.x
+        self.xy = value.y
+
+    @y.setter
+    def y(self, Vec2f value) -> None:
+        """Set the Y base of the matrix."""
+        self.yx = value.x
+        self.yy = value.y
+
+    @origin.setter
+    def origin(self, Vec2f value) -> None:
+        """Set the origin."""
+        self.ox = value.x
+        self.oy = value.y
+
+    def __getitem__(self, py_int item) -> Vec2f:
+        """Get a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+        cdef Vec2f vec = Vec2f.__new__(Vec2f)
+
+        if item == 0:
+            vec.x = self.xx
+            vec.y = self.xy
+        elif item == 1:
+            vec.x = self.yx
+            vec.y = self.yy
+        elif item == 2:
+            vec.x = self.ox
+            vec.y = self.oy
+        else:
+            raise IndexError(item)
+
+        return vec
+
+    def __setitem__(self, py_int key, Vec2f value) -> None:
+        """Set a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Origin vector
+        """
+
+        if key == 0:
+            self.xx = value.x
+            self.xy = value.y
+        elif key == 1:
+            self.yx = value.x
+            self.yy = value.y
+        elif key == 2:
+            self.ox = value.x
+            self.oy = value.y
+        else:
+            raise IndexError(key)
+
+    def __len__(self) -> py_int:
+        """The amount of columns. Is always 3 for `Transform2Df`s."""
+        return 3
+
+    # Expose the matrix as a writable 3*2 buffer (one row per column vector), without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.xx, sizeof(float), b"f", 2, _Transform2Df_buffer_shape, _Transform2Df_buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        return PyBytes_FromStringAndSize(<char*> &self.xx, 6 * sizeof(float))
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform2Df:
+        """Create a transform from the bytes written by `Transform2Df.to_bytes()` (or any buffer of the same size)."""
+        cdef Transform2Df t = Transform2Df.__new__(Transform2Df)
+        read_bytes(data, &t.xx, 6 * sizeof(float))
+        return t
+
+    @staticmethod
+    def pack_many(object transforms, /) -> bytes:
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform2Df.unpack_many()`
+        """
+        transforms = list(transforms)
+        cdef Py_ssize_t i, count = len(transforms)
+        cdef bytes block = new_pack_block(count, ord("f"), sizeof(float), 6)
+        cdef float* p = <float*> pack_block_items(block)
+        cdef Transform2Df t
+        for i in range(count):
+            t = <Transform2Df?> transforms[i]
+            memcpy(p + i * 6, &t.xx, 6 * sizeof(float))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[Transform2Df]:
+        """Read the transforms of a block written by `Transform2Df.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("f"), sizeof(float), 6, &items)
+        cdef list result = []
+        cdef Transform2Df t
+        try:
+            for i in range(count):
+                t = Transform2Df.__new__(Transform2Df)
+                memcpy(&t.xx, items + i * 6 * sizeof(float), 6 * sizeof(float))
+                result.append(t)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+
+    cdef inline float tdotx(self, float x, float y) noexcept nogil:
+        return x * self.xx + y * self.yx
+
+    cdef inline float mulx(self, float x, float y) noexcept nogil:
+        return self.tdotx(x, y) + self.ox
+
+    cdef inline float tdoty(self, float x, float y) noexcept nogil:
+        return x * self.xy + y * self.yy
+
+    cdef inline float muly(self, float x, float y) noexcept nogil:
+        return self.tdoty(x, y) + self.oy
+
+    def __mul__(self, Vec2f other) -> Vec2f:
+        """Transform a copy of the vector.
+
+        See Also: `Vec2f.__mul__()`
+        """
+        cdef Vec2f vec = Vec2f.__new__(Vec2f)
+        vec.x = self.mulx(other.x, other.y)
+        vec.y = self.muly(other.x, other.y)
+        return vec
+
+    def __rmul__(self, Vec2f other) -> Vec2f:
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+
+        See Also: `Vec2f.__mul__()`
+        """
+        cdef Vec2f vec = Vec2f.__new__(Vec2f)
+        cdef float x = other.x - self.ox
+        cdef float y = other.y - self.oy
+        vec.x = self.xx * x + self.xy * y
+        vec.y = self.yx * x + self.yy * y
+        return vec
+
+    cdef inline Vec2f ___call___0(self, Vec2f other):
+        """Transform a copy of the vector.
+        
+        See Also: `Vec2f.__mul__()`
+        """
+        cdef Vec2f vec = Vec2f.__new__(Vec2f)
+        vec.x = self.mulx(other.x, other.y)
+        vec.y = self.muly(other.x, other.y)
+        return vec
+
+    cdef inline Transform2Df ___call___1(self, Transform2Df other):
+        """Transform a copy of the passed in `Transform2Df`."""
+        cdef Transform2Df t = Transform2Df.__new__(Transform2Df)
+        t.xx = self.tdotx(other.xx, other.xy)
+        t.xy = self.tdoty(other.xx, other.xy)
+        t.yx = self.tdotx(other.yx, other.yy)
+        t.yy = self.tdoty(other.yx, other.yy)
+        t.ox = self.mulx(other.ox, other.oy)
+        t.oy = self.muly(other.ox, other.oy)
+        return t
+
+    def __call__(self, object p0, /) -> Vec2f | Transform2Df:
+        if type(p0) is Vec2f:
+            return self.___call___0(<Vec2f> p0)
+        elif type(p0) is Transform2Df:
+            return self.___call___1(<Transform2Df> p0)
+        if isinstance(p0, Vec2f):
+            return self.___call___0(<Vec2f> p0)
+        elif isinstance(p0, Transform2Df):
+            return self.___call___1(<Transform2Df> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec2f | Transform2Df, got {p0}")
+
+    cdef inline Vec2f _apply_into_0(self, Vec2f other, Vec2f out):
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+
+        See Also: `Transform2Df.__call__()`
+        """
+        cdef float x = self.mulx(other.x, other.y)
+        cdef float y = self.muly(other.x, other.y)
+        out.x = x
+        out.y = y
+        return out
+
+    cdef inline Transform2Df _apply_into_1(self, Transform2Df other, Transform2Df out):
+        """Transform the passed in `Transform2Df`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        cdef float xx = self.tdotx(other.xx, other.xy)
+        cdef float xy = self.tdoty(other.xx, other.xy)
+        cdef float yx = self.tdotx(other.yx, other.yy)
+        cdef float yy = self.tdoty(other.yx, other.yy)
+        cdef float ox = self.mulx(other.ox, other.oy)
+        cdef float oy = self.muly(other.ox, other.oy)
+        out.xx = xx
+        out.xy = xy
+        out.yx = yx
+        out.yy = yy
+        out.ox = ox
+        out.oy = oy
+        return out
+
+    def apply_into(self, object p0, object p1, /) -> Vec2f | Transform2Df:
+        if type(p0) is Vec2f:
+            if type(p1) is Vec2f:
+                return self._apply_into_0(<Vec2f> p0, <Vec2f> p1)
+        elif type(p0) is Transform2Df:
+            if type(p1) is Transform2Df:
+                return self._apply_into_1(<Transform2Df> p0, <Transform2Df> p1)
+        if isinstance(p0, Vec2f):
+            if isinstance(p1, Vec2f):
+                return self._apply_into_0(<Vec2f> p0, <Vec2f> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec2f | Transform2Df, got {p1}")
+        elif isinstance(p0, Transform2Df):
+            if isinstance(p1, Transform2Df):
+                return self._apply_into_1(<Transform2Df> p0, <Transform2Df> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec2f | Transform2Df, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected Vec2f | Transform2Df, got {p0}")
+
+    cdef inline int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1:
+        if src.shape[1] != 2 or out.shape[1] != 2:
+            raise ValueError(f"Expected buffers of shape (N, 2), got ({src.shape[0]}, {src.shape[1]}) and ({out.shape[0]}, {out.shape[1]})")
+        if out.shape[0] != src.shape[0]:
+            raise ValueError(f"Buffer size mismatch: {src.shape[0]} and {out.shape[0]}")
+        cdef Py_ssize_t i
+        cdef float x, y
+        # The branch is taken once rather than for every vector
+        with nogil:
+            if inverse:
+                for i in range(src.shape[0]):
+                    x, y = src[i, 0], src[i, 1]
+                    x, y = x - self.ox, y - self.oy
+                    out[i, 0] = self.xx * x + self.xy * y
+                    out[i, 1] = self.yx * x + self.yy * y
+            else:
+                for i in range(src.shape[0]):
+                    x, y = src[i, 0], src[i, 1]
+                    out[i, 0] = self.mulx(x, y)
+                    out[i, 1] = self.muly(x, y)
+        return 0
+
+    cdef inline object _dispatch_many(self, object src, object out, bint inverse):
+        cdef str fmt = buffer_format(src)
+        if out is None:
+            out = Vec2Array(len(src)) if fmt == "g" else new_float_buffer(fmt, len(src), 2)
+        elif buffer_format(out) != fmt:
+            raise TypeError(f"Buffer format mismatch: {fmt} and {buffer_format(out)}")
+        cdef const float[:, ::1] src_f
+        cdef const double[:, ::1] src_d
+        cdef const py_float[:, ::1] src_g
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            src_f, out_f = src, out
+            self._apply_many(src_f, out_f, inverse)
+        elif fmt == "d":
+            src_d, out_d = src, out
+            self._apply_many(src_d, out_d, inverse)
+        elif fmt == "g":
+            src_g, out_g = src, out
+            self._apply_many(src_g, out_g, inverse)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def apply_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 2) float buffer (e.g. a `Vec2Array`) in one pass.
+
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec2Array` is created for long double buffers,
+        or a new (N, 2) memoryview of the same format for float and double buffers.
+
+        See Also: `Transform2Df.__call__()`
+        """
+        return self._dispatch_many(src, out, False)
+
+    def apply_inverse_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 2) float buffer using the *INVERSE* of the transform.
+
+        This is the batched version of `vector * transform`, see `Transform2Df.apply_many()` for the buffer semantics.
+
+        See Also: `Vec2f.__mul__()`
+        """
+        return self._dispatch_many(src, out, True)
+
+    cdef inline Transform2Df ___matmul___0(self, Transform2Df other):
+        """Transform a copy of the `Transform2Df` on the right."""
+        cdef Transform2Df t = Transform2Df.__new__(Transform2Df)
+        t.xx = self.tdotx(other.xx, other.xy)
+        t.xy = self.tdoty(other.xx, other.xy)
+        t.yx = self.tdotx(other.yx, other.yy)
+        t.yy = self.tdoty(other.yx, other.yy)
+        t.ox = self.mulx(other.ox, other.oy)
+        t.oy = self.muly(other.ox, other.oy)
+        return t
+
+
+    def __matmul__(self, object p0, /) -> Transform2Df:
+        if type(p0) is Transform2Df:
+            return self.___matmul___0(<Transform2Df> p0)
+        if isinstance(p0, Transform2Df):
+            return self.___matmul___0(<Transform2Df> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform2Df, got {p0}")
+
+    cdef inline void _transform_ip(self, Transform2Df other) noexcept:
+        cdef float xx = other.tdotx(self.xx, self.xy)
+        cdef float xy = other.tdoty(self.xx, self.xy)
+        cdef float yx = other.tdotx(self.yx, self.yy)
+        cdef float yy = other.tdoty(self.yx, self.yy)
+        cdef float ox = other.mulx(self.ox, self.oy)
+        cdef float oy = other.muly(self.ox, self.oy)
+        self.xx, self.xy = xx, xy
+        self.yx, self.yy = yx, yy
+        self.ox, self.oy = ox, oy
+
+    def __imatmul__(self, Transform2Df other) -> Transform2Df:
+        #<RETURN_SELF>
+        """Transform this `Transform2Df` inplace with the other `Transform2Df`."""
+        self._transform_ip(other)
+        return self
+
+    cdef inline float _determinant(self) noexcept:
+        return self.xx * self.yy - self.xy * self.yx
+
+    @property
+    def determinant(self) -> float:
+        """Compute the determinant of the matrix."""
+        return self._determinant()
+
+    def __invert__(self) -> Transform2Df:
+        """Get the invert transform.
+
+        See Also: `Vec2f.__mul__()`
+        """
+        cdef float i_det = 1.0 / self._determinant()
+        cdef Transform2Df t = Transform2Df.__new__(Transform2Df)
+        t.xx = self.yy * +i_det
+        t.xy = self.xy * -i_det
+        t.yx = self.yx * -i_det
+        t.yy = self.xx * +i_det
+        t.ox = -t.tdotx(self.ox, self.oy)
+        t.oy = -t.tdoty(self.ox, self.oy)
+        return t
+
+
+    cdef inline float get_rotation(self) noexcept:
+        return atan2f(self.xy, self.xx)
+
+    cdef inline void set_rotation(self, float rotation) noexcept:
+        cdef float scale_x = self.get_scale_x()
+        cdef float scale_y = self.get_scale_y()
+        cdef float c = cosf(rotation)
+        cdef float s = sinf(rotation)
+        self.xx = c
+        self.xy = s
+        self.yx = -s
+        self.yy = c
+        self.set_scale_x(scale_x)
+        self.set_scale_y(scale_y)
+
+    cdef inline float get_scale_x(self) noexcept:
+        return sqrtf(self.xx * self.xx + self.xy * self.xy)
+
+    cdef inline float get_scale_y(self) noexcept:
+        cdef float det = self._determinant()
+        cdef float det_sign = 1.0 if det > 0.0 else -1.0 if det < 0.0 else 0.0 if det == 0.0 else NAN
+        return sqrtf(self.yx * self.yx + self.yy * self.yy) * det_sign
+
+    cdef inline void set_scale_x(self, float value) noexcept:
+        cdef float m = value / sqrtf(self.xx * self.xx + self.xy * self.xy)
+        self.xx *= m
+        self.xy *= m
+
+    cdef inline void set_scale_y(self, float value) noexcept:
+        cdef float m = value / sqrtf(self.yx * self.yx + self.yy * self.yy)
+        self.yx *= m
+        self.yy *= m
+
+    @property
+    def rotation(self) -> float:
+        """Get the rotation angle this transform represents."""
+        return self.get_rotation()
+
+    @rotation.setter
+    def rotation(self, float value) -> None:
+        """Set the rotation angle this transform represents.
+
+        See Also: `Transform2Df.rotating()`
+        """
+        self.set_rotation(value)
+
+    # @property
+    # def scale(self) -> _T2ScaleProxy:
+    #     cdef _T2ScaleProxy proxy = _T2ScaleProxy.__new__(_T2ScaleProxy)
+    #     proxy.transform = self
+    #     return proxy
+    @property
+    def scale(self) -> Vec2f:
+        """Get the scaling transformation this transform represents."""
+        cdef Vec2f vec = Vec2f.__new__(Vec2f)
+        vec.x = self.get_scale_x()
+        vec.y = self.get_scale_y()
+        return vec
+
+    @scale.setter
+    def scale(self, Vec2f value) -> None:
+        """Set the scaling transformation this transform represents.
+
+        See Also: `Transform2Df.scaling()`
+        """
+        self.set_scale_x(value.x)
+        self.set_scale_y(value.y)
+
+
+    cdef inline void _translate_ip(self, Vec2f translation) noexcept:
+        self.ox = translation.x
+        self.oy = translation.y
+
+    def translate_ip(self, Vec2f translation, /) -> Transform2Df:
+        #<RETURN_SELF>
+        """Apply translation to this transform inplace."""
+        self._translate_ip(translation)
+        return self
+
+    def translated(self, Vec2f translation, /) -> Transform2Df:
+        """Apply translation to a copy of this transform."""
+        cdef Transform2Df t = self.copy()
+        t.translate_ip(translation)
+        return t
+
+    def translate_into(self, Vec2f translation, Transform2Df out, /) -> Transform2Df:
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._translate_ip(translation)
+        return out
+
+    cdef inline void _rotate_ip(self, float rotation):
+        self._transform_ip(Transform2Df.rotating(rotation))
+
+    def rotate_ip(self, float rotation, /) -> Transform2Df:
+        #<RETURN_SELF>
+        """Apply rotation to this transform inplace."""
+        self._rotate_ip(rotation)
+        return self
+
+    def rotated(self, float rotation, /) -> Transform2Df:
+        """Apply rotation to a copy of this transform."""
+        cdef Transform2Df t = self.copy()
+        t.rotate_ip(rotation)
+        return t
+
+    def rotate_into(self, float rotation, Transform2Df out, /) -> Transform2Df:
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._rotate_ip(rotation)
+        return out
+
+    cdef inline void _scale_ip(self, Vec2f scale) noexcept:
+        self.xx *= scale.x
+        self.xy *= scale.y
+        self.yx *= scale.x
+        self.yy *= scale.y
+        self.ox *= scale.x
+        self.oy *= scale.y
+
+    def scale_ip(self, Vec2f scale, /) -> Transform2Df:
+        #<RETURN_SELF>
+        """Apply scaling to this transform inplace."""
+        self._scale_ip(scale)
+        return self
+
+    def scaled(self, Vec2f scale, /) -> Transform2Df:
+        """Apply scaling to a copy of this transform."""
+        cdef Transform2Df t = self.copy()
+        t.scale_ip(scale)
+        return t
+
+    def scale_into(self, Vec2f scale, Transform2Df out, /) -> Transform2Df:
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._scale_ip(scale)
+        return out
+
+cdef object _Transform2Df_vectorcall(PyObject* cls, PyObject** args, size_t nargsf, PyObject* kwnames):
+    cdef Py_ssize_t nargs = PyVectorcall_NARGS(nargsf)
+    if kwnames != NULL and len(<tuple> kwnames) != 0:
+        raise TypeError("Transform2Df() takes no keyword arguments")
+    if nargs > 6:
+        raise TypeError(f"Transform2Df() takes from 0 to 6 positional arguments but {nargs} were given")
+    cdef Transform2Df self = Transform2Df.__new__(Transform2Df)
+    self.___init___dispatch(<object> args[0] if nargs > 0 else None, <object> args[1] if nargs > 1 else None, <object> args[2] if nargs > 2 else None, <object> args[3] if nargs > 3 else None, <object> args[4] if nargs > 4 else None, <object> args[5] if nargs > 5 else None)
+    return self
+
+(<PyVectorcallTypeObject*> Transform2Df).tp_vectorcall = <vectorcallfunc> _Transform2Df_vectorcall
+
+
+########## transform_3d.pyx ##########
+from libc.math cimport sinl, cosl
+
+cdef Py_ssize_t[2] _Transform3D_buffer_shape = [4, 3]
+cdef Py_ssize_t[2] _Transform3D_buffer_strides = [3 * sizeof(py_float), sizeof(py_float)]
+
+
+@cython.auto_pickle(True)
+@cython.freelist(1024)
+@cython.no_gc
+@cython.final
+cdef class Transform3D:
+    """3D linear transformation (3*4 matrix)."""
+
+
+
+    cdef inline void identity(self) noexcept:
+        self.xx, self.xy, self.xz = 1.0, 0.0, 0.0
+        self.yx, self.yy, self.yz = 0.0, 1.0, 0.0
+        self.zx, self.zy, self.zz = 0.0, 0.0, 1.0
+        self.ox = self.oy = self.oz = 0.0
+
+    cdef inline void ___init___0(self) noexcept:
+        """Create an identity transform."""
+        self.identity()
+
+    cdef inline void ___init___1(self, py_float xx, py_float xy, py_float xz, py_float yx, py_float yy, py_float yz, py_float zx, py_float zy, py_float zz, py_float ox, py_float oy, py_float oz) noexcept:
+        """Create a transform from all the matrix elements."""
+        self.xx = xx
+        self.xy = xy
+        self.xz = xz
+        self.yx = yx
+        self.yy = yy
+        self.yz = yz
+        self.zx = zx
+        self.zy = zy
+        self.zz = zz
+        self.ox = ox
+        self.oy = oy
+        self.oz = oz
+
+    cdef inline void ___init___2(self, Vec3 x, Vec3 y, Vec3 z, Vec3 origin) noexcept:
+        """Create a transform using three base vectors and the origin vector."""
+        self.xx, self.xy, self.xz = x.x, x.y, x.z
+        self.yx, self.yy, self.yz = y.x, y.y, y.z
+        self.zx, self.zy, self.zz = z.x, z.y, z.z
+        self.ox, self.oy, self.oz = origin.x, origin.y, origin.z
+
+    cdef inline void ___init___3(self, Transform3D transform) noexcept:
+        """Create a copy."""
+        self.xx = transform.xx
+        self.xy = transform.xy
+        self.xz = transform.xz
+        self.yx = transform.yx
+        self.yy = transform.yy
+        self.yz = transform.yz
+        self.zx = transform.zx
+        self.zy = transform.zy
+        self.zz = transform.zz
+        self.ox = transform.ox
+        self.oy = transform.oy
+        self.oz = transform.oz
+
+    cdef inline void ___init___4(self, Transform3Dd transform) noexcept:
+        """Convert a double precision transform to a floating-point transform."""
+        self.xx = <py_float>transform.xx
+        self.xy = <py_float>transform.xy
+        self.xz = <py_float>transform.xz
+        self.yx = <py_float>transform.yx
+        self.yy = <py_float>transform.yy
+        self.yz = <py_float>transform.yz
+        self.zx = <py_float>transform.zx
+        self.zy = <py_float>transform.zy
+        self.zz = <py_float>transform.zz
+        self.ox = <py_float>transform.ox
+        self.oy = <py_float>transform.oy
+        self.oz = <py_float>transform.oz
+    
+    cdef inline void ___init___5(self, Transform3Df transform) noexcept:
+        """Convert a single precision transform to a floating-point transform."""
+        self.xx = <py_float>transform.xx
+        self.xy = <py_float>transform.xy
+        self.xz = <py_float>transform.xz
+        self.yx = <py_float>transform.yx
+        self.yy = <py_float>transform.yy
+        self.yz = <py_float>transform.yz
+        self.zx = <py_float>transform.zx
+        self.zy = <py_float>transform.zy
+        self.zz = <py_float>transform.zz
+        self.ox = <py_float>transform.ox
+        self.oy = <py_float>transform.oy
+        self.oz = <py_float>transform.oz
+
+    cdef inline object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5, object p6, object p7, object p8, object p9, object p10, object p11):
+        if (PyFloat_CheckExact(p0) or PyLong_CheckExact(p0)):
+            if (PyFloat_CheckExact(p1) or PyLong_CheckExact(p1)):
+                if (PyFloat_CheckExact(p2) or PyLong_CheckExact(p2)):
+                    if (PyFloat_CheckExact(p3) or PyLong_CheckExact(p3)):
+                        if (PyFloat_CheckExact(p4) or PyLong_CheckExact(p4)):
+                            if (PyFloat_CheckExact(p5) or PyLong_CheckExact(p5)):
+                                if (PyFloat_CheckExact(p6) or PyLong_CheckExact(p6)):
+                                    if (PyFloat_CheckExact(p7) or PyLong_CheckExact(p7)):
+                                        if (PyFloat_CheckExact(p8) or PyLong_CheckExact(p8)):
+                                            if (PyFloat_CheckExact(p9) or PyLong_CheckExact(p9)):
+                                                if (PyFloat_CheckExact(p10) or PyLong_CheckExact(p10)):
+                                                    if (PyFloat_CheckExact(p11) or PyLong_CheckExact(p11)):
+                                                        self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5), PyFloat_AsDouble(p6), PyFloat_AsDouble(p7), PyFloat_AsDouble(p8), PyFloat_AsDouble(p9), PyFloat_AsDouble(p10), PyFloat_AsDouble(p11))
+                                                        return
+        elif type(p0) is Vec3:
+            if type(p1) is Vec3:
+                if type(p2) is Vec3:
+                    if type(p3) is Vec3:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___2(<Vec3> p0, <Vec3> p1, <Vec3> p2, <Vec3> p3)
+                                                        return
+        elif type(p0) is Transform3D:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___3(<Transform3D> p0)
+                                                        return
+        elif type(p0) is Transform3Dd:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___4(<Transform3Dd> p0)
+                                                        return
+        elif type(p0) is Transform3Df:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___5(<Transform3Df> p0)
+                                                        return
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___0()
+                                                        return
+        if (PyFloat_Check(p0) or PyLong_Check(p0)):
+            if (PyFloat_Check(p1) or PyLong_Check(p1)):
+                if (PyFloat_Check(p2) or PyLong_Check(p2)):
+                    if (PyFloat_Check(p3) or PyLong_Check(p3)):
+                        if (PyFloat_Check(p4) or PyLong_Check(p4)):
+                            if (PyFloat_Check(p5) or PyLong_Check(p5)):
+                                if (PyFloat_Check(p6) or PyLong_Check(p6)):
+                                    if (PyFloat_Check(p7) or PyLong_Check(p7)):
+                                        if (PyFloat_Check(p8) or PyLong_Check(p8)):
+                                            if (PyFloat_Check(p9) or PyLong_Check(p9)):
+                                                if (PyFloat_Check(p10) or PyLong_Check(p10)):
+                                                    if (PyFloat_Check(p11) or PyLong_Check(p11)):
+                                                        self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5), PyFloat_AsDouble(p6), PyFloat_AsDouble(p7), PyFloat_AsDouble(p8), PyFloat_AsDouble(p9), PyFloat_AsDouble(p10), PyFloat_AsDouble(p11))
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3 | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3 | None, got {p1}")
+        elif isinstance(p0, Vec3):
+            if isinstance(p1, Vec3):
+                if isinstance(p2, Vec3):
+                    if isinstance(p3, Vec3):
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___2(<Vec3> p0, <Vec3> p1, <Vec3> p2, <Vec3> p3)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3 | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3 | None, got {p1}")
+        elif isinstance(p0, Transform3D):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___3(<Transform3D> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3 | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3 | None, got {p1}")
+        elif isinstance(p0, Transform3Dd):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___4(<Transform3Dd> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3 | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3 | None, got {p1}")
+        elif isinstance(p0, Transform3Df):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___5(<Transform3Df> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3 | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3 | None, got {p1}")
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___0()
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3 | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3 | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3 | None, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected float | int | Vec3 | Transform3D | Transform3Dd | Transform3Df | None, got {p0}")
+    
+    def __init__(self, object p0=None, object p1=None, object p2=None, object p3=None, object p4=None, object p5=None, object p6=None, object p7=None, object p8=None, object p9=None, object p10=None, object p11=None, /) -> None:
+        self.___init___dispatch(p0, p1, p2, p3, p4, p5, p6, p7, p8, p9, p10, p11)
+
+    @staticmethod
+    def translating(Vec3 translation, /) -> Transform3D:
+        """Create a translation transform."""
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        t.identity()
+        t.ox += translation.x
+        t.oy += translation.y
+        t.oz += translation.z
+        return t
+
+    @staticmethod
+    def rotating(Vec3 axis, py_float angle, /, Vec3 origin = None) -> Transform3D:
+        """Create a rotation transform."""
+        cdef Transform3D trans = Transform3D.__new__(Transform3D)
+
+        cdef py_float axis_x_sq = axis.x * axis.x
+        cdef py_float axis_y_sq = axis.y * axis.y
+        cdef py_float axis_z_sq = axis.z * axis.z
+        cdef py_float c = cosl(angle)
+
+        trans.xx = axis_x_sq + c * (1.0 - axis_x_sq)
+        trans.yy = axis_y_sq + c * (1.0 - axis_y_sq)
+        trans.zz = axis_z_sq + c * (1.0 - axis_z_sq)
+
+        cdef py_float s = sinl(angle)
+        cdef t = 1.0 - c
+
+        cdef xyzt = axis.x * axis.y * t
+        cdef zyxs = axis.z * s
+        trans.yx = xyzt - zyxs
+        trans.xy = xyzt + zyxs
+
+        xyzt = axis.x * axis.z * t
+        zyxs = axis.y * s
+        trans.zx = xyzt + zyxs
+        trans.xz = xyzt - zyxs
+
+        xyzt = axis.y * axis.z * t
+        zyxs = axis.x * s
+        trans.zy = xyzt - zyxs
+        trans.yz = xyzt + zyxs
+
+        if origin is not None:
+            trans.ox = origin.x
+            trans.oy = origin.y
+            trans.oz = origin.z
+
+        return trans
+
+    @staticmethod
+    def scaling(Vec3 scale, /, Vec3 origin = None) -> Transform3D:
+        """Create a scale transform."""
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        t.identity()
+        t.xx = scale.x
+        t.yy = scale.y
+        t.zz = scale.z
+
+        if origin is not None:
+            t.ox = origin.x
+            t.oy = origin.y
+            t.oz = origin.z
+
+        return t
+
+    cdef inline void _copy_to(self, Transform3D t) noexcept:
+        t.xx = self.xx
+        t.xy = self.xy
+        t.xz = self.xz
+        t.yx = self.yx
+        t.yy = self.yy
+        t.yz = self.yz
+        t.zx = self.zx
+        t.zy = self.zy
+        t.zz = self.zz
+        t.ox = self.ox
+        t.oy = self.oy
+        t.oz = self.oz
+
+    cdef inline Transform3D copy(self):
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        self._copy_to(t)
+        return t
+    
+    def __repr__(self) -> str:
+        return f"⎡X: ({self.xx}, {self.xy}, {self.xz})\n⎢Y: ({self.yx}, {self.yy}, {self.yz})\n⎢Z: ({self.zx}, {self.zy}, {self.zz})\n⎣O: ({self.ox}, {self.oy}, {self.oz})"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform3D.is_close()`
+        """
+        if not isinstance(other, Transform3D):
+            return False
+        cdef Transform3D trans = <Transform3D> other
+        return self.xx == trans.xx and self.xy == trans.xy and self.xz == trans.xz and\
+               self.yx == trans.yx and self.yy == trans.yy and self.yz == trans.yz and\
+               self.zx == trans.zx and self.zy == trans.zy and self.zz == trans.zz and\
+               self.ox == trans.ox and self.oy == trans.oy and self.oz == trans.oz
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform3D.is_close()`
+        """
+        if not isinstance(other, Transform3D):
+            return True
+        cdef Transform3D trans = <Transform3D> other
+        return self.xx != trans.xx or self.xy != trans.xy or self.xz != trans.xz or\
+               self.yx != trans.yx or self.yy != trans.yy or self.yz != trans.yz or\
+               self.zx != trans.zx or self.zy != trans.zy or self.zz != trans.zz or\
+               self.ox != trans.ox or self.oy != trans.oy or self.oz != trans.oz
+
+    def is_close(self, Transform3D other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if the two transforms are close enough.
+
+        See Also: `math.is_close()`
+        """
+        return is_close(self.xx, other.xx, rel_tol, abs_tol) and \
+               is_close(self.xy, other.xy, rel_tol, abs_tol) and \
+               is_close(self.xz, other.xz, rel_tol, abs_tol) and \
+               is_close(self.yx, other.yx, rel_tol, abs_tol) and \
+               is_close(self.yy, other.yy, rel_tol, abs_tol) and \
+               is_close(self.yz, other.yz, rel_tol, abs_tol) and \
+               is_close(self.zx, other.zx, rel_tol, abs_tol) and \
+               is_close(self.zy, other.zy, rel_tol, abs_tol) and \
+               is_close(self.zz, other.zz, rel_tol, abs_tol) and \
+               is_close(self.ox, other.ox, rel_tol, abs_tol) and \
+               is_close(self.oy, other.oy, rel_tol, abs_tol) and \
+               is_close(self.oz, other.oz, rel_tol, abs_tol)
+
+    def __hash__(self) -> py_int:
+        cdef uint64_t h = 12
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.ox))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oz))
+        return hash_finish(h)
+
+    @property
+    def x(self) -> Vec3:
+        """Base vector X."""
+        cdef Vec3 vec = Vec3.__new__(Vec3)
+        vec.x = self.xx
+        vec.y = self.xy
+        vec.z = self.xz
+        return vec
+
+    @property
+    def y(self) -> Vec3:
+        """Base vector Y."""
+        cdef Vec3 vec = Vec3.__new__(Vec3)
+        vec.x = self.yx
+        vec.y = self.yy
+        vec.z = self.yz
+        return vec
+
+    @property
+    def z(self) -> Vec3:
+        """Base vector Z."""
+        cdef Vec3 vec = Vec3.__new__(Vec3)
+        vec.x = self.zx
+        vec.y = self.zy
+        vec.z = self.zz
+        return vec
+
+    @property
+    def origin(self) -> Vec3:
+        """Origin vector."""
+        cdef Vec3 vec = Vec3.__new__(Vec3)
+        vec.x = self.ox
+        vec.y = self.oy
+        vec.z = self.oz
+        return vec
+
+    @x.setter
+    def x(self, Vec3 value) -> None:
+        """Set the X base of the matrix."""
+        self.xx = value.x
+        self.xy = value.y
+        self.xz = value.z
+
+    @y.setter
+    def y(self, Vec3 value) -> None:
+        """Set the Y base of the matrix."""
+        self.yx = value.x
+        self.yy = value.y
+        self.yz = value.z
+
+    @z.setter
+    def z(self, Vec3 value) -> None:
+        """Set the Z base of the matrix."""
+        self.zx = value.x
+        self.zy = value.y
+        self.zz = value.z
+
+    @origin.setter
+    def origin(self, Vec3 value) -> None:
+        """Set the origin."""
+        self.ox = value.x
+        self.oy = value.y
+        self.oz = value.z
+
+    def __getitem__(self, py_int item) -> Vec3:
+        """Get a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        cdef vec = Vec3.__new__(Vec3)
+
+        if item == 0:
+            vec.x = self.xx
+            vec.y = self.xy
+            vec.z = self.xz
+        elif item == 1:
+            vec.x = self.yx
+            vec.y = self.yy
+            vec.z = self.yz
+        elif item == 2:
+            vec.x = self.zx
+            vec.y = self.zy
+            vec.z = self.zz
+        elif item == 3:
+            vec.x = self.ox
+            vec.y = self.oy
+            vec.z = self.oz
+        else:
+            raise IndexError(item)
+
+        return vec
+
+    def __setitem__(self, py_int key, Vec3 value) -> None:
+        """Set a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        if key == 0:
+            self.xx = value.x
+            self.xy = value.y
+            self.xz = value.z
+        elif key == 1:
+            self.yx = value.x
+            self.yy = value.y
+            self.yz = value.z
+        elif key == 2:
+            self.zx = value.x
+            self.zy = value.y
+            self.zz = value.z
+        elif key == 3:
+            self.ox = value.x
+            self.oy = value.y
+            self.oz = value.z
+        else:
+            raise IndexError(key)
+
+    def __len__(self) -> py_int:
+        """The amount of columns. Is always 4 for `Transform3D`s."""
+        return 4
+
+    # Expose the matrix as a writable 4*3 buffer (one row per column vector), without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.xx, sizeof(py_float), b"g", 2, _Transform3D_buffer_shape, _Transform3D_buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        return PyBytes_FromStringAndSize(<char*> &self.xx, 12 * sizeof(py_float))
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform3D:
+        """Create a transform from the bytes written by `Transform3D.to_bytes()` (or any buffer of the same size)."""
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        read_bytes(data, &t.xx, 12 * sizeof(py_float))
+        return t
+
+    @staticmethod
+    def pack_many(object transforms, /) -> bytes:
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform3D.unpack_many()`
+        """
+        transforms = list(transforms)
+        cdef Py_ssize_t i, count = len(transforms)
+        cdef bytes block = new_pack_block(count, ord("g"), sizeof(py_float), 12)
+        cdef py_float* p = <py_float*> pack_block_items(block)
+        cdef Transform3D t
+        for i in range(count):
+            t = <Transform3D?> transforms[i]
+            memcpy(p + i * 12, &t.xx, 12 * sizeof(py_float))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[Transform3D]:
+        """Read the transforms of a block written by `Transform3D.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("g"), sizeof(py_float), 12, &items)
+        cdef list result = []
+        cdef Transform3D t
+        try:
+            for i in range(count):
+                t = Transform3D.__new__(Transform3D)
+                memcpy(&t.xx, items + i * 12 * sizeof(py_float), 12 * sizeof(py_float))
+                result.append(t)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+
+    cdef inline py_float tdotx(self, py_float x, py_float y, py_float z) noexcept nogil:
+        return x * self.xx + y * self.yx + z * self.zx
+
+    cdef inline py_float mulx(self, py_float x, py_float y, py_float z) noexcept nogil:
+        return self.tdotx(x, y, z) + self.ox
+
+    cdef inline py_float tdoty(self, py_float x, py_float y, py_float z) noexcept nogil:
+        return x * self.xy + y * self.yy + z * self.zy
+
+    cdef inline py_float muly(self, py_float x, py_float y, py_float z) noexcept nogil:
+        return self.tdoty(x, y, z) + self.oy
+
+    cdef inline py_float tdotz(self, py_float x, py_float y, py_float z) noexcept nogil:
+        return x * self.xz + y * self.yz + z * self.zz
+
+    cdef inline py_float mulz(self, py_float x, py_float y, py_float z) noexcept nogil:
+        return self.tdotz(x, y, z) + self.oz
+
+    def __mul__(self, Vec3 other) -> Vec3:
+        """Transform a copy of the vector.
+
+        See Also: `Vec3.__mul__()`
+        """
+        cdef Vec3 vec = Vec3.__new__(Vec3)
+        vec.x = self.mulx(other.x, other.y, other.z)
+        vec.y = self.muly(other.x, other.y, other.z)
+        vec.z = self.mulz(other.x, other.y, other.z)
+        return vec
+
+    def __rmul__(self, Vec3 other) -> Vec3:
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+
+        See Also: `Vec3.__mul__()`
+        """
+        cdef Vec3 vec = Vec3.__new__(Vec3)
+        cdef py_float x = other.x - self.ox
+        cdef py_float y = other.y - self.oy
+        cdef py_float z = other.z - self.oz
+        vec.x = self.xx * x + self.xy * y + self.xz * z
+        vec.y = self.yx * x + self.yy * y + self.yz * z
+        vec.z = self.zx * x + self.zy * y + self.zz * z
+        return vec
+
+    cdef inline Vec3 ___call___0(self, Vec3 other):
+        """Transform a copy of the vector.
+        
+        See Also: `Vec3.__mul__()`
+        """
+        cdef Vec3 vec = Vec3.__new__(Vec3)
+        vec.x = self.mulx(other.x, other.y, other.z)
+        vec.y = self.muly(other.x, other.y, other.z)
+        vec.z = self.mulz(other.x, other.y, other.z)
+        return vec
+
+    cdef inline Transform3D ___call___1(self, Transform3D other):
+        """Transform a copy of the passed in `Transform3D`."""
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        t.xx = self.tdotx(other.xx, other.xy, other.xz)
+        t.xy = self.tdoty(other.xx, other.xy, other.xz)
+        t.xz = self.tdotz(other.xx, other.xy, other.xz)
+        t.yx = self.tdotx(other.yx, other.yy, other.yz)
+        t.yy = self.tdoty(other.yx, other.yy, other.yz)
+        t.yz = self.tdotz(other.yx, other.yy, other.yz)
+        t.zx = self.tdotx(other.zx, other.zy, other.zz)
+        t.zy = self.tdoty(other.zx, other.zy, other.zz)
+        t.zz = self.tdotz(other.zx, other.zy, other.zz)
+        t.ox = self.mulx(other.ox, other.oy, other.oz)
+        t.oy = self.muly(other.ox, other.oy, other.oz)
+        t.oz = self.mulz(other.ox, other.oy, other.oz)
+        return t
+
+    def __call__(self, object p0, /) -> Vec3 | Transform3D:
+        if type(p0) is Vec3:
+            return self.___call___0(<Vec3> p0)
+        elif type(p0) is Transform3D:
+            return self.___call___1(<Transform3D> p0)
+        if isinstance(p0, Vec3):
+            return self.___call___0(<Vec3> p0)
+        elif isinstance(p0, Transform3D):
+            return self.___call___1(<Transform3D> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec3 | Transform3D, got {p0}")
+
+    cdef inline Vec3 _apply_into_0(self, Vec3 other, Vec3 out):
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+
+        See Also: `Transform3D.__call__()`
+        """
+        cdef py_float x = self.mulx(other.x, other.y, other.z)
+        cdef py_float y = self.muly(other.x, other.y, other.z)
+        cdef py_float z = self.mulz(other.x, other.y, other.z)
+        out.x = x
+        out.y = y
+        out.z = z
+        return out
+
+    cdef inline Transform3D _apply_into_1(self, Transform3D other, Transform3D out):
+        """Transform the passed in `Transform3D`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        cdef py_float xx = self.tdotx(other.xx, other.xy, other.xz)
+        cdef py_float xy = self.tdoty(other.xx, other.xy, other.xz)
+        cdef py_float xz = self.tdotz(other.xx, other.xy, other.xz)
+        cdef py_float yx = self.tdotx(other.yx, other.yy, other.yz)
+        cdef py_float yy = self.tdoty(other.yx, other.yy, other.yz)
+        cdef py_float yz = self.tdotz(other.yx, other.yy, other.yz)
+        cdef py_float zx = self.tdotx(other.zx, other.zy, other.zz)
+        cdef py_float zy = self.tdoty(other.zx, other.zy, other.zz)
+        cdef py_float zz = self.tdotz(other.zx, other.zy, other.zz)
+        cdef py_float ox = self.mulx(other.ox, other.oy, other.oz)
+        cdef py_float oy = self.muly(other.ox, other.oy, other.oz)
+        cdef py_float oz = self.mulz(other.ox, other.oy, other.oz)
+        out.xx = xx
+        out.xy = xy
+        out.xz = xz
+        out.yx = yx
+        out.yy = yy
+        out.yz = yz
+        out.zx = zx
+        out.zy = zy
+        out.zz = zz
+        out.ox = ox
+        out.oy = oy
+        out.oz = oz
+        return out
+
+    def apply_into(self, object p0, object p1, /) -> Vec3 | Transform3D:
+        if type(p0) is Vec3:
+            if type(p1) is Vec3:
+                return self._apply_into_0(<Vec3> p0, <Vec3> p1)
+        elif type(p0) is Transform3D:
+            if type(p1) is Transform3D:
+                return self._apply_into_1(<Transform3D> p0, <Transform3D> p1)
+        if isinstance(p0, Vec3):
+            if isinstance(p1, Vec3):
+                return self._apply_into_0(<Vec3> p0, <Vec3> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec3 | Transform3D, got {p1}")
+        elif isinstance(p0, Transform3D):
+            if isinstance(p1, Transform3D):
+                return self._apply_into_1(<Transform3D> p0, <Transform3D> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec3 | Transform3D, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected Vec3 | Transform3D, got {p0}")
+
+    cdef inline int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1:
+        if src.shape[1] != 3 or out.shape[1] != 3:
+            raise ValueError(f"Expected buffers of shape (N, 3), got ({src.shape[0]}, {src.shape[1]}) and ({out.shape[0]}, {out.shape[1]})")
+        if out.shape[0] != src.shape[0]:
+            raise ValueError(f"Buffer size mismatch: {src.shape[0]} and {out.shape[0]}")
+        cdef Py_ssize_t i
+        cdef py_float x, y, z
+        # The branch is taken once rather than for every vector
+        with nogil:
+            if inverse:
+                for i in range(src.shape[0]):
+                    x, y, z = src[i, 0], src[i, 1], src[i, 2]
+                    x, y, z = x - self.ox, y - self.oy, z - self.oz
+                    out[i, 0] = self.xx * x + self.xy * y + self.xz * z
+                    out[i, 1] = self.yx * x + self.yy * y + self.yz * z
+                    out[i, 2] = self.zx * x + self.zy * y + self.zz * z
+            else:
+                for i in range(src.shape[0]):
+                    x, y, z = src[i, 0], src[i, 1], src[i, 2]
+                    out[i, 0] = self.mulx(x, y, z)
+                    out[i, 1] = self.muly(x, y, z)
+                    out[i, 2] = self.mulz(x, y, z)
+        return 0
+
+    cdef inline object _dispatch_many(self, object src, object out, bint inverse):
+        cdef str fmt = buffer_format(src)
+        if out is None:
+            out = Vec3Array(len(src)) if fmt == "g" else new_float_buffer(fmt, len(src), 3)
+        elif buffer_format(out) != fmt:
+            raise TypeError(f"Buffer format mismatch: {fmt} and {buffer_format(out)}")
+        cdef const float[:, ::1] src_f
+        cdef const double[:, ::1] src_d
+        cdef const py_float[:, ::1] src_g
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            src_f, out_f = src, out
+            self._apply_many(src_f, out_f, inverse)
+        elif fmt == "d":
+            src_d, out_d = src, out
+            self._apply_many(src_d, out_d, inverse)
+        elif fmt == "g":
+            src_g, out_g = src, out
+            self._apply_many(src_g, out_g, inverse)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def apply_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 3) float buffer (e.g. a `Vec3Array`) in one pass.
+
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec3Array` is created for long double buffers,
+        or a new (N, 3) memoryview of the same format for float and double buffers.
+
+        See Also: `Transform3D.__call__()`
+        """
+        return self._dispatch_many(src, out, False)
+
+    def apply_inverse_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 3) float buffer using the *INVERSE* of the transform.
+
+        This is the batched version of `vector * transform`, see `Transform3D.apply_many()` for the buffer semantics.
+
+        See Also: `Vec3.__mul__()`
+        """
+        return self._dispatch_many(src, out, True)
+
+    cdef inline Transform3D ___matmul___0(self, Transform3D other):
+        """Transform a copy of the `Transform3D` on the right."""
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        t.xx = self.tdotx(other.xx, other.xy, other.xz)
+        t.xy = self.tdoty(other.xx, other.xy, other.xz)
+        t.xz = self.tdotz(other.xx, other.xy, other.xz)
+        t.yx = self.tdotx(other.yx, other.yy, other.yz)
+        t.yy = self.tdoty(other.yx, other.yy, other.yz)
+        t.yz = self.tdotz(other.yx, other.yy, other.yz)
+        t.zx = self.tdotx(other.zx, other.zy, other.zz)
+        t.zy = self.tdoty(other.zx, other.zy, other.zz)
+        t.zz = self.tdotz(other.zx, other.zy, other.zz)
+        t.ox = self.mulx(other.ox, other.oy, other.oz)
+        t.oy = self.muly(other.ox, other.oy, other.oz)
+        t.oz = self.mulz(other.ox, other.oy, other.oz)
+        return t
+
+    cdef inline Transform3DArray ___matmul___1(self, Transform3DArray other):
+        """Transform a copy of every transform of the `Transform3DArray` on the right (e.g. `parent @ children`)."""
+        return other._compose_left(self)
+
+    def __matmul__(self, object p0, /) -> Transform3D | Transform3DArray:
+        if type(p0) is Transform3D:
+            return self.___matmul___0(<Transform3D> p0)
+        elif type(p0) is Transform3DArray:
+            return self.___matmul___1(<Transform3DArray> p0)
+        if isinstance(p0, Transform3D):
+            return self.___matmul___0(<Transform3D> p0)
+        elif isinstance(p0, Transform3DArray):
+            return self.___matmul___1(<Transform3DArray> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform3D | Transform3DArray, got {p0}")
+
+    cdef inline void _transform_ip(self, Transform3D other) noexcept:
+        cdef py_float xx = other.tdotx(self.xx, self.xy, self.xz)
+        cdef py_float xy = other.tdoty(self.xx, self.xy, self.xz)
+        cdef py_float xz = other.tdotz(self.xx, self.xy, self.xz)
+        cdef py_float yx = other.tdotx(self.yx, self.yy, self.yz)
+        cdef py_float yy = other.tdoty(self.yx, self.yy, self.yz)
+        cdef py_float yz = other.tdotz(self.yx, self.yy, self.yz)
+        cdef py_float zx = other.tdotx(self.zx, self.zy, self.zz)
+        cdef py_float zy = other.tdoty(self.zx, self.zy, self.zz)
+        cdef py_float zz = other.tdotz(self.zx, self.zy, self.zz)
+        cdef py_float ox = other.mulx(self.ox, self.oy, self.oz)
+        cdef py_float oy = other.muly(self.ox, self.oy, self.oz)
+        cdef py_float oz = other.mulz(self.ox, self.oy, self.oz)
+        self.xx, self.xy, self.xz = xx, xy, xz
+        self.yx, self.yy, self.yz = yx, yy, yz
+        self.zx, self.zy, self.zz = zx, zy, zz
+        self.ox, self.oy, self.oz = ox, oy, oz
+
+    def __imatmul__(self, Transform3D other) -> Transform3D:
+        #<RETURN_SELF>
+        """Transform this `Transform3D` inplace with the other `Transform3D`."""
+        self._transform_ip(other)
+        return self
+
+    cdef inline py_float _determinant(self) noexcept:
+        return (self.xx * (self.yy * self.zz - self.yz * self.zy) -
+                self.yx * (self.xy * self.zz - self.xz * self.zy) +
+                self.zx * (self.xy * self.yz - self.yy * self.xz))
+
+    @property
+    def determinant(self) -> py_float:
+        """Compute the determinant of the matrix."""
+        return self._determinant()
+
+    def __invert__(self) -> Transform3D:
+        """Get the invert transform.
+
+        See Also: `Vec3.__mul__()`
+        """
+        cdef py_float cox = self.yy * self.zz - self.yz * self.zy
+        cdef py_float coy = self.xz * self.zy - self.xy * self.zz
+        cdef py_float coz = self.xy * self.yz - self.yy * self.xz
+        cdef py_float det = self.xx * cox + self.yx * coy + self.zx * coz
+        cdef py_float i_det = 1.0 / det
+
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        t.xx = cox * i_det
+        t.xy = coy * i_det
+        t.xz = coz * i_det
+        t.yx = (self.zx * self.yz - self.yx * self.zz) * i_det
+        t.yy = (self.xx * self.zz - self.zx * self.xz) * i_det
+        t.yz = (self.yx * self.xz - self.xx * self.yz) * i_det
+        t.zx = (self.yx * self.zy - self.zx * self.yy) * i_det
+        t.zy = (self.zx * self.xy - self.xx * self.zy) * i_det
+        t.zz = (self.xx * self.yy - self.yx * self.xy) * i_det
+        t.ox = -t.tdotx(self.ox, self.oy, self.oz)
+        t.oy = -t.tdoty(self.ox, self.oy, self.oz)
+        t.oz = -t.tdotz(self.ox, self.oy, self.oz)
+        return t
+
+    cdef inline void _translate_ip(self, Vec3 translation) noexcept:
+        self.ox += translation.x
+        self.oy += translation.y
+        self.oz += translation.z
+
+    def translate_ip(self, Vec3 translation, /) -> Transform3D:
+        #<RETURN_SELF>
+        """Apply translation to this transform inplace."""
+        self._translate_ip(translation)
+        return self
+
+    def translated(self, Vec3 translation, /) -> Transform3D:
+        """Apply translation to a copy of this transform."""
+        cdef Transform3D t = self.copy()
+        t.translate_ip(translation)
+        return t
+
+    def translate_into(self, Vec3 translation, Transform3D out, /) -> Transform3D:
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._translate_ip(translation)
+        return out
+
+    cdef inline void _rotate_ip(self, Vec3 axis, py_float angle):
+        self._transform_ip(Transform3D.rotating(axis, angle))
+
+    def rotate_ip(self, Vec3 axis, py_float angle, /) -> Transform3D:
+        #<RETURN_SELF>
+        """Apply rotation to this transform inplace."""
+        self._rotate_ip(axis, angle)
+        return self
+
+    def rotated(self, Vec3 axis, py_float angle, /) -> Transform3D:
+        """Apply rotation to a copy of this transform."""
+        cdef Transform3D t = self.copy()
+        t.rotate_ip(axis, angle)
+        return t
+
+    def rotate_into(self, Vec3 axis, py_float angle, Transform3D out, /) -> Transform3D:
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._rotate_ip(axis, angle)
+        return out
+
+    cdef inline void _scale_ip(self, Vec3 scale) noexcept:
+        self.xx *= scale.x
+        self.yx *= scale.x
+        self.zx *= scale.x
+        self.xy *= scale.y
+        self.yy *= scale.y
+        self.zy *= scale.y
+        self.xz *= scale.z
+        self.yz *= scale.z
+        self.zz *= scale.z
+
+    def scale_ip(self, Vec3 scale, /) -> Transform3D:
+        #<RETURN_SELF>
+        """Apply scaling to this transform inplace."""
+        self._scale_ip(scale)
+        return self
+
+    def scaled(self, Vec3 scale, /) -> Transform3D:
+        """Apply scaling to a copy of this transform."""
+        cdef Transform3D t = self.copy()
+        t.scale_ip(scale)
+        return t
+
+    def scale_into(self, Vec3 scale, Transform3D out, /) -> Transform3D:
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._scale_ip(scale)
+        return out
+
+cdef object _Transform3D_vectorcall(PyObject* cls, PyObject** args, size_t nargsf, PyObject* kwnames):
+    cdef Py_ssize_t nargs = PyVectorcall_NARGS(nargsf)
+    if kwnames != NULL and len(<tuple> kwnames) != 0:
+        raise TypeError("Transform3D() takes no keyword arguments")
+    if nargs > 12:
+        raise TypeError(f"Transform3D() takes from 0 to 12 positional arguments but {nargs} were given")
+    cdef Transform3D self = Transform3D.__new__(Transform3D)
+    self.___init___dispatch(<object> args[0] if nargs > 0 else None, <object> args[1] if nargs > 1 else None, <object> args[2] if nargs > 2 else None, <object> args[3] if nargs > 3 else None, <object> args[4] if nargs > 4 else None, <object> args[5] if nargs > 5 else None, <object> args[6] if nargs > 6 else None, <object> args[7] if nargs > 7 else None, <object> args[8] if nargs > 8 else None, <object> args[9] if nargs > 9 else None, <object> args[10] if nargs > 10 else None, <object> args[11] if nargs > 11 else None)
+    return self
+
+(<PyVectorcallTypeObject*> Transform3D).tp_vectorcall = <vectorcallfunc> _Transform3D_vectorcall
+
+from libc.math cimport sin, cos
+
+cdef Py_ssize_t[2] _Transform3Dd_buffer_shape = [4, 3]
+cdef Py_ssize_t[2] _Transform3Dd_buffer_strides = [3 * sizeof(double), sizeof(double)]
+
+
+@cython.auto_pickle(True)
+@cython.freelist(1024)
+@cython.no_gc
+@cython.final
+cdef class Transform3Dd:
+    """3D linear transformation (3*4 matrix) of `double`s."""
+
+
+
+    cdef inline void identity(self) noexcept:
+        self.xx, self.xy, self.xz = 1.0, 0.0, 0.0
+        self.yx, self.yy, self.yz = 0.0, 1.0, 0.0
+        self.zx, self.zy, self.zz = 0.0, 0.0, 1.0
+        self.ox = self.oy = self.oz = 0.0
+
+    cdef inline void ___init___0(self) noexcept:
+        """Create an identity transform."""
+        self.identity()
+
+    cdef inline void ___init___1(self, double xx, double xy, double xz, double yx, double yy, double yz, double zx, double zy, double zz, double ox, double oy, double oz) noexcept:
+        """Create a transform from all the matrix elements."""
+        self.xx = xx
+        self.xy = xy
+        self.xz = xz
+        self.yx = yx
+        self.yy = yy
+        self.yz = yz
+        self.zx = zx
+        self.zy = zy
+        self.zz = zz
+        self.ox = ox
+        self.oy = oy
+        self.oz = oz
+
+    cdef inline void ___init___2(self, Vec3d x, Vec3d y, Vec3d z, Vec3d origin) noexcept:
+        """Create a transform using three base vectors and the origin vector."""
+        self.xx, self.xy, self.xz = x.x, x.y, x.z
+        self.yx, self.yy, self.yz = y.x, y.y, y.z
+        self.zx, self.zy, self.zz = z.x, z.y, z.z
+        self.ox, self.oy, self.oz = origin.x, origin.y, origin.z
+
+    cdef inline void ___init___3(self, Transform3Dd transform) noexcept:
+        """Create a copy."""
+        self.xx = transform.xx
+        self.xy = transform.xy
+        self.xz = transform.xz
+        self.yx = transform.yx
+        self.yy = transform.yy
+        self.yz = transform.yz
+        self.zx = transform.zx
+        self.zy = transform.zy
+        self.zz = transform.zz
+        self.ox = transform.ox
+        self.oy = transform.oy
+        self.oz = transform.oz
+
+    cdef inline void ___init___4(self, Transform3D transform) noexcept:
+        """Convert a floating-point transform to a double precision transform."""
+        self.xx = <double>transform.xx
+        self.xy = <double>transform.xy
+        self.xz = <double>transform.xz
+        self.yx = <double>transform.yx
+        self.yy = <double>transform.yy
+        self.yz = <double>transform.yz
+        self.zx = <double>transform.zx
+        self.zy = <double>transform.zy
+        self.zz = <double>transform.zz
+        self.ox = <double>transform.ox
+        self.oy = <double>transform.oy
+        self.oz = <double>transform.oz
+    
+    cdef inline void ___init___5(self, Transform3Df transform) noexcept:
+        """Convert a single precision transform to a double precision transform."""
+        self.xx = <double>transform.xx
+        self.xy = <double>transform.xy
+        self.xz = <double>transform.xz
+        self.yx = <double>transform.yx
+        self.yy = <double>transform.yy
+        self.yz = <double>transform.yz
+        self.zx = <double>transform.zx
+        self.zy = <double>transform.zy
+        self.zz = <double>transform.zz
+        self.ox = <double>transform.ox
+        self.oy = <double>transform.oy
+        self.oz = <double>transform.oz
+
+    cdef inline object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5, object p6, object p7, object p8, object p9, object p10, object p11):
+        if (PyFloat_CheckExact(p0) or PyLong_CheckExact(p0)):
+            if (PyFloat_CheckExact(p1) or PyLong_CheckExact(p1)):
+                if (PyFloat_CheckExact(p2) or PyLong_CheckExact(p2)):
+                    if (PyFloat_CheckExact(p3) or PyLong_CheckExact(p3)):
+                        if (PyFloat_CheckExact(p4) or PyLong_CheckExact(p4)):
+                            if (PyFloat_CheckExact(p5) or PyLong_CheckExact(p5)):
+                                if (PyFloat_CheckExact(p6) or PyLong_CheckExact(p6)):
+                                    if (PyFloat_CheckExact(p7) or PyLong_CheckExact(p7)):
+                                        if (PyFloat_CheckExact(p8) or PyLong_CheckExact(p8)):
+                                            if (PyFloat_CheckExact(p9) or PyLong_CheckExact(p9)):
+                                                if (PyFloat_CheckExact(p10) or PyLong_CheckExact(p10)):
+                                                    if (PyFloat_CheckExact(p11) or PyLong_CheckExact(p11)):
+                                                        self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5), PyFloat_AsDouble(p6), PyFloat_AsDouble(p7), PyFloat_AsDouble(p8), PyFloat_AsDouble(p9), PyFloat_AsDouble(p10), PyFloat_AsDouble(p11))
+                                                        return
+        elif type(p0) is Vec3d:
+            if type(p1) is Vec3d:
+                if type(p2) is Vec3d:
+                    if type(p3) is Vec3d:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___2(<Vec3d> p0, <Vec3d> p1, <Vec3d> p2, <Vec3d> p3)
+                                                        return
+        elif type(p0) is Transform3Dd:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___3(<Transform3Dd> p0)
+                                                        return
+        elif type(p0) is Transform3D:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___4(<Transform3D> p0)
+                                                        return
+        elif type(p0) is Transform3Df:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___5(<Transform3Df> p0)
+                                                        return
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___0()
+                                                        return
+        if (PyFloat_Check(p0) or PyLong_Check(p0)):
+            if (PyFloat_Check(p1) or PyLong_Check(p1)):
+                if (PyFloat_Check(p2) or PyLong_Check(p2)):
+                    if (PyFloat_Check(p3) or PyLong_Check(p3)):
+                        if (PyFloat_Check(p4) or PyLong_Check(p4)):
+                            if (PyFloat_Check(p5) or PyLong_Check(p5)):
+                                if (PyFloat_Check(p6) or PyLong_Check(p6)):
+                                    if (PyFloat_Check(p7) or PyLong_Check(p7)):
+                                        if (PyFloat_Check(p8) or PyLong_Check(p8)):
+                                            if (PyFloat_Check(p9) or PyLong_Check(p9)):
+                                                if (PyFloat_Check(p10) or PyLong_Check(p10)):
+                                                    if (PyFloat_Check(p11) or PyLong_Check(p11)):
+                                                        self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5), PyFloat_AsDouble(p6), PyFloat_AsDouble(p7), PyFloat_AsDouble(p8), PyFloat_AsDouble(p9), PyFloat_AsDouble(p10), PyFloat_AsDouble(p11))
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3d | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3d | None, got {p1}")
+        elif isinstance(p0, Vec3d):
+            if isinstance(p1, Vec3d):
+                if isinstance(p2, Vec3d):
+                    if isinstance(p3, Vec3d):
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___2(<Vec3d> p0, <Vec3d> p1, <Vec3d> p2, <Vec3d> p3)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3d | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3d | None, got {p1}")
+        elif isinstance(p0, Transform3Dd):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___3(<Transform3Dd> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3d | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3d | None, got {p1}")
+        elif isinstance(p0, Transform3D):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___4(<Transform3D> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3d | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3d | None, got {p1}")
+        elif isinstance(p0, Transform3Df):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___5(<Transform3Df> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3d | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3d | None, got {p1}")
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___0()
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3d | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3d | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3d | None, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected float | int | Vec3d | Transform3Dd | Transform3D | Transform3Df | None, got {p0}")
+    
+    def __init__(self, object p0=None, object p1=None, object p2=None, object p3=None, object p4=None, object p5=None, object p6=None, object p7=None, object p8=None, object p9=None, object p10=None, object p11=None, /) -> None:
+        self.___init___dispatch(p0, p1, p2, p3, p4, p5, p6, p7, p8, p9, p10, p11)
+
+    @staticmethod
+    def translating(Vec3d translation, /) -> Transform3Dd:
+        """Create a translation transform."""
+        cdef Transform3Dd t = Transform3Dd.__new__(Transform3Dd)
+        t.identity()
+        t.ox += translation.x
+        t.oy += translation.y
+        t.oz += translation.z
+        return t
+
+    @staticmethod
+    def rotating(Vec3d axis, double angle, /, Vec3d origin = None) -> Transform3Dd:
+        """Create a rotation transform."""
+        cdef Transform3Dd trans = Transform3Dd.__new__(Transform3Dd)
+
+        cdef double axis_x_sq = axis.x * axis.x
+        cdef double axis_y_sq = axis.y * axis.y
+        cdef double axis_z_sq = axis.z * axis.z
+        cdef double c = cos(angle)
+
+        trans.xx = axis_x_sq + c * (1.0 - axis_x_sq)
+        trans.yy = axis_y_sq + c * (1.0 - axis_y_sq)
+        trans.zz = axis_z_sq + c * (1.0 - axis_z_sq)
+
+        cdef double s = sin(angle)
+        cdef t = 1.0 - c
+
+        cdef xyzt = axis.x * axis.y * t
+        cdef zyxs = axis.z * s
+        trans.yx = xyzt - zyxs
+        trans.xy = xyzt + zyxs
+
+        xyzt = axis.x * axis.z * t
+        zyxs = axis.y * s
+        trans.zx = xyzt + zyxs
+        trans.xz = xyzt - zyxs
+
+        xyzt = axis.y * axis.z * t
+        zyxs = axis.x * s
+        trans.zy = xyzt - zyxs
+        trans.yz = xyzt + zyxs
+
+        if origin is not None:
+            trans.ox = origin.x
+            trans.oy = origin.y
+            trans.oz = origin.z
+
+        return trans
+
+    @staticmethod
+    def scaling(Vec3d scale, /, Vec3d origin = None) -> Transform3Dd:
+        """Create a scale transform."""
+        cdef Transform3Dd t = Transform3Dd.__new__(Transform3Dd)
+        t.identity()
+        t.xx = scale.x
+        t.yy = scale.y
+        t.zz = scale.z
+
+        if origin is not None:
+            t.ox = origin.x
+            t.oy = origin.y
+            t.oz = origin.z
+
+        return t
+
+    cdef inline void _copy_to(self, Transform3Dd t) noexcept:
+        t.xx = self.xx
+        t.xy = self.xy
+        t.xz = self.xz
+        t.yx = self.yx
+        t.yy = self.yy
+        t.yz = self.yz
+        t.zx = self.zx
+        t.zy = self.zy
+        t.zz = self.zz
+        t.ox = self.ox
+        t.oy = self.oy
+        t.oz = self.oz
+
+    cdef inline Transform3Dd copy(self):
+        cdef Transform3Dd t = Transform3Dd.__new__(Transform3Dd)
+        self._copy_to(t)
+        return t
+    
+    def __repr__(self) -> str:
+        return f"⎡X: ({self.xx}, {self.xy}, {self.xz})\n⎢Y: ({self.yx}, {self.yy}, {self.yz})\n⎢Z: ({self.zx}, {self.zy}, {self.zz})\n⎣O: ({self.ox}, {self.oy}, {self.oz})"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform3Dd.is_close()`
+        """
+        if not isinstance(other, Transform3Dd):
+            return False
+        cdef Transform3Dd trans = <Transform3Dd> other
+        return self.xx == trans.xx and self.xy == trans.xy and self.xz == trans.xz and\
+               self.yx == trans.yx and self.yy == trans.yy and self.yz == trans.yz and\
+               self.zx == trans.zx and self.zy == trans.zy and self.zz == trans.zz and\
+               self.ox == trans.ox and self.oy == trans.oy and self.oz == trans.oz
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform3Dd.is_close()`
+        """
+        if not isinstance(other, Transform3Dd):
+            return True
+        cdef Transform3Dd trans = <Transform3Dd> other
+        return self.xx != trans.xx or self.xy != trans.xy or self.xz != trans.xz or\
+               self.yx != trans.yx or self.yy != trans.yy or self.yz != trans.yz or\
+               self.zx != trans.zx or self.zy != trans.zy or self.zz != trans.zz or\
+               self.ox != trans.ox or self.oy != trans.oy or self.oz != trans.oz
+
+    def is_close(self, Transform3Dd other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if the two transforms are close enough.
+
+        See Also: `math.is_close()`
+        """
+        return is_close(self.xx, other.xx, rel_tol, abs_tol) and \
+               is_close(self.xy, other.xy, rel_tol, abs_tol) and \
+               is_close(self.xz, other.xz, rel_tol, abs_tol) and \
+               is_close(self.yx, other.yx, rel_tol, abs_tol) and \
+               is_close(self.yy, other.yy, rel_tol, abs_tol) and \
+               is_close(self.yz, other.yz, rel_tol, abs_tol) and \
+               is_close(self.zx, other.zx, rel_tol, abs_tol) and \
+               is_close(self.zy, other.zy, rel_tol, abs_tol) and \
+               is_close(self.zz, other.zz, rel_tol, abs_tol) and \
+               is_close(self.ox, other.ox, rel_tol, abs_tol) and \
+               is_close(self.oy, other.oy, rel_tol, abs_tol) and \
+               is_close(self.oz, other.oz, rel_tol, abs_tol)
+
+    def __hash__(self) -> py_int:
+        cdef uint64_t h = 12
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.ox))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oz))
+        return hash_finish(h)
+
+    @property
+    def x(self) -> Vec3d:
+        """Base vector X."""
+        cdef Vec3d vec = Vec3d.__new__(Vec3d)
+        vec.x = self.xx
+        vec.y = self.xy
+        vec.z = self.xz
+        return vec
+
+    @property
+    def y(self) -> Vec3d:
+        """Base vector Y."""
+        cdef Vec3d vec = Vec3d.__new__(Vec3d)
+        vec.x = self.yx
+        vec.y = self.yy
+        vec.z = self.yz
+        return vec
+
+    @property
+    def z(self) -> Vec3d:
+        """Base vector Z."""
+        cdef Vec3d vec = Vec3d.__new__(Vec3d)
+        vec.x = self.zx
+        vec.y = self.zy
+        vec.z = self.zz
+        return vec
+
+    @property
+    def origin(self) -> Vec3d:
+        """Origin vector."""
+        cdef Vec3d vec = Vec3d.__new__(Vec3d)
+        vec.x = self.ox
+        vec.y = self.oy
+        vec.z = self.oz
+        return vec
+
+    @x.setter
+    def x(self, Vec3d value) -> None:
+        """Set the X base of the matrix."""
+        self.xx = value.x
+        self.xy = value.y
+        self.xz = value.z
+
+    @y.setter
+    def y(self, Vec3d value) -> None:
+        """Set the Y base of the matrix."""
+        self.yx = value.x
+        self.yy = value.y
+        self.yz = value.z
+
+    @z.setter
+    def z(self, Vec3d value) -> None:
+        """Set the Z base of the matrix."""
+        self.zx = value.x
+        self.zy = value.y
+        self.zz = value.z
+
+    @origin.setter
+    def origin(self, Vec3d value) -> None:
+        """Set the origin."""
+        self.ox = value.x
+        self.oy = value.y
+        self.oz = value.z
+
+    def __getitem__(self, py_int item) -> Vec3d:
+        """Get a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        cdef vec = Vec3d.__new__(Vec3d)
+
+        if item == 0:
+            vec.x = self.xx
+            vec.y = self.xy
+            vec.z = self.xz
+        elif item == 1:
+            vec.x = self.yx
+            vec.y = self.yy
+            vec.z = self.yz
+        elif item == 2:
+            vec.x = self.zx
+            vec.y = self.zy
+            vec.z = self.zz
+        elif item == 3:
+            vec.x = self.ox
+            vec.y = self.oy
+            vec.z = self.oz
+        else:
+            raise IndexError(item)
+
+        return vec
+
+    def __setitem__(self, py_int key, Vec3d value) -> None:
+        """Set a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        if key == 0:
+            self.xx = value.x
+            self.xy = value.y
+            self.xz = value.z
+        elif key == 1:
+            self.yx = value.x
+            self.yy = value.y
+            self.yz = value.z
+        elif key == 2:
+            self.zx = value.x
+            self.zy = value.y
+            self.zz = value.z
+        elif key == 3:
+            self.ox = value.x
+            self.oy = value.y
+            self.oz = value.z
+        else:
+            raise IndexError(key)
+
+    def __len__(self) -> py_int:
+        """The amount of columns. Is always 4 for `Transform3Dd`s."""
+        return 4
+
+    # Expose the matrix as a writable 4*3 buffer (one row per column vector), without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.xx, sizeof(double), b"d", 2, _Transform3Dd_buffer_shape, _Transform3Dd_buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        return PyBytes_FromStringAndSize(<char*> &self.xx, 12 * sizeof(double))
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform3Dd:
+        """Create a transform from the bytes written by `Transform3Dd.to_bytes()` (or any buffer of the same size)."""
+        cdef Transform3Dd t = Transform3Dd.__new__(Transform3Dd)
+        read_bytes(data, &t.xx, 12 * sizeof(double))
+        return t
+
+    @staticmethod
+    def pack_many(object transforms, /) -> bytes:
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform3Dd.unpack_many()`
+        """
+        transforms = list(transforms)
+        cdef Py_ssize_t i, count = len(transforms)
+        cdef bytes block = new_pack_block(count, ord("d"), sizeof(double), 12)
+        cdef double* p = <double*> pack_block_items(block)
+        cdef Transform3Dd t
+        for i in range(count):
+            t = <Transform3Dd?> transforms[i]
+            memcpy(p + i * 12, &t.xx, 12 * sizeof(double))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[Transform3Dd]:
+        """Read the transforms of a block written by `Transform3Dd.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("d"), sizeof(double), 12, &items)
+        cdef list result = []
+        cdef Transform3Dd t
+        try:
+            for i in range(count):
+                t = Transform3Dd.__new__(Transform3Dd)
+                memcpy(&t.xx, items + i * 12 * sizeof(double), 12 * sizeof(double))
+                result.append(t)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+
+    cdef inline double tdotx(self, double x, double y, double z) noexcept nogil:
+        return x * self.xx + y * self.yx + z * self.zx
+
+    cdef inline double mulx(self, double x, double y, double z) noexcept nogil:
+        return self.tdotx(x, y, z) + self.ox
+
+    cdef inline double tdoty(self, double x, double y, double z) noexcept nogil:
+        return x * self.xy + y * self.yy + z * self.zy
+
+    cdef inline double muly(self, double x, double y, double z) noexcept nogil:
+        return self.tdoty(x, y, z) + self.oy
+
+    cdef inline double tdotz(self, double x, double y, double z) noexcept nogil:
+        return x * self.xz + y * self.yz + z * self.zz
+
+    cdef inline double mulz(self, double x, double y, double z) noexcept nogil:
+        return self.tdotz(x, y, z) + self.oz
+
+    def __mul__(self, Vec3d other) -> Vec3d:
+        """Transform a copy of the vector.
+
+        See Also: `Vec3d.__mul__()`
+        """
+        cdef Vec3d vec = Vec3d.__new__(Vec3d)
+        vec.x = self.mulx(other.x, other.y, other.z)
+        vec.y = self.muly(other.x, other.y, other.z)
+        vec.z = self.mulz(other.x, other.y, other.z)
+        return vec
+
+    def __rmul__(self, Vec3d other) -> Vec3d:
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+
+        See Also: `Vec3d.__mul__()`
+        """
+        cdef Vec3d vec = Vec3d.__new__(Vec3d)
+        cdef double x = other.x - self.ox
+        cdef double y = other.y - self.oy
+        cdef double z = other.z - self.oz
+        vec.x = self.xx * x + self.xy * y + self.xz * z
+        vec.y = self.yx * x + self.yy * y + self.yz * z
+        vec.z = self.zx * x + self.zy * y + self.zz * z
+        return vec
+
+    cdef inline Vec3d ___call___0(self, Vec3d other):
+        """Transform a copy of the vector.
+        
+        See Also: `Vec3d.__mul__()`
+        """
+        cdef Vec3d vec = Vec3d.__new__(Vec3d)
+        vec.x = self.mulx(other.x, other.y, other.z)
+        vec.y = self.muly(other.x, other.y, other.z)
+        vec.z = self.mulz(other.x, other.y, other.z)
+        return vec
+
+    cdef inline Transform3Dd ___call___1(self, Transform3Dd other):
+        """Transform a copy of the passed in `Transform3Dd`."""
+        cdef Transform3Dd t = Transform3Dd.__new__(Transform3Dd)
+        t.xx = self.tdotx(other.xx, other.xy, other.xz)
+        t.xy = self.tdoty(other.xx, other.xy, other.xz)
+        t.xz = self.tdotz(other.xx, other.xy, other.xz)
+        t.yx = self.tdotx(other.yx, other.yy, other.yz)
+        t.yy = self.tdoty(other.yx, other.yy, other.yz)
+        t.yz = self.tdotz(other.yx, other.yy, other.yz)
+        t.zx = self.tdotx(other.zx, other.zy, other.zz)
+        t.zy = self.tdoty(other.zx, other.zy, other.zz)
+        t.zz = self.tdotz(other.zx, other.zy, other.zz)
+        t.ox = self.mulx(other.ox, other.oy, other.oz)
+        t.oy = self.muly(other.ox, other.oy, other.oz)
+        t.oz = self.mulz(other.ox, other.oy, other.oz)
+        return t
+
+    def __call__(self, object p0, /) -> Vec3d | Transform3Dd:
+        if type(p0) is Vec3d:
+            return self.___call___0(<Vec3d> p0)
+        elif type(p0) is Transform3Dd:
+            return self.___call___1(<Transform3Dd> p0)
+        if isinstance(p0, Vec3d):
+            return self.___call___0(<Vec3d> p0)
+        elif isinstance(p0, Transform3Dd):
+            return self.___call___1(<Transform3Dd> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec3d | Transform3Dd, got {p0}")
+
+    cdef inline Vec3d _apply_into_0(self, Vec3d other, Vec3d out):
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+
+        See Also: `Transform3Dd.__call__()`
+        """
+        cdef double x = self.mulx(other.x, other.y, other.z)
+        cdef double y = self.muly(other.x, other.y, other.z)
+        cdef double z = self.mulz(other.x, other.y, other.z)
+        out.x = x
+        out.y = y
+        out.z = z
+        return out
+
+    cdef inline Transform3Dd _apply_into_1(self, Transform3Dd other, Transform3Dd out):
+        """Transform the passed in `Transform3Dd`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        cdef double xx = self.tdotx(other.xx, other.xy, other.xz)
+        cdef double xy = self.tdoty(other.xx, other.xy, other.xz)
+        cdef double xz = self.tdotz(other.xx, other.xy, other.xz)
+        cdef double yx = self.tdotx(other.yx, other.yy, other.yz)
+        cdef double yy = self.tdoty(other.yx, other.yy, other.yz)
+        cdef double yz = self.tdotz(other.yx, other.yy, other.yz)
+        cdef double zx = self.tdotx(other.zx, other.zy, other.zz)
+        cdef double zy = self.tdoty(other.zx, other.zy, other.zz)
+        cdef double zz = self.tdotz(other.zx, other.zy, other.zz)
+        cdef double ox = self.mulx(other.ox, other.oy, other.oz)
+        cdef double oy = self.muly(other.ox, other.oy, other.oz)
+        cdef double oz = self.mulz(other.ox, other.oy, other.oz)
+        out.xx = xx
+        out.xy = xy
+        out.xz = xz
+        out.yx = yx
+        out.yy = yy
+        out.yz = yz
+        out.zx = zx
+        out.zy = zy
+        out.zz = zz
+        out.ox = ox
+        out.oy = oy
+        out.oz = oz
+        return out
+
+    def apply_into(self, object p0, object p1, /) -> Vec3d | Transform3Dd:
+        if type(p0) is Vec3d:
+            if type(p1) is Vec3d:
+                return self._apply_into_0(<Vec3d> p0, <Vec3d> p1)
+        elif type(p0) is Transform3Dd:
+            if type(p1) is Transform3Dd:
+                return self._apply_into_1(<Transform3Dd> p0, <Transform3Dd> p1)
+        if isinstance(p0, Vec3d):
+            if isinstance(p1, Vec3d):
+                return self._apply_into_0(<Vec3d> p0, <Vec3d> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec3d | Transform3Dd, got {p1}")
+        elif isinstance(p0, Transform3Dd):
+            if isinstance(p1, Transform3Dd):
+                return self._apply_into_1(<Transform3Dd> p0, <Transform3Dd> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec3d | Transform3Dd, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected Vec3d | Transform3Dd, got {p0}")
+
+    cdef inline int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1:
+        if src.shape[1] != 3 or out.shape[1] != 3:
+            raise ValueError(f"Expected buffers of shape (N, 3), got ({src.shape[0]}, {src.shape[1]}) and ({out.shape[0]}, {out.shape[1]})")
+        if out.shape[0] != src.shape[0]:
+            raise ValueError(f"Buffer size mismatch: {src.shape[0]} and {out.shape[0]}")
+        cdef Py_ssize_t i
+        cdef double x, y, z
+        # The branch is taken once rather than for every vector
+        with nogil:
+            if inverse:
+                for i in range(src.shape[0]):
+                    x, y, z = src[i, 0], src[i, 1], src[i, 2]
+                    x, y, z = x - self.ox, y - self.oy, z - self.oz
+                    out[i, 0] = self.xx * x + self.xy * y + self.xz * z
+                    out[i, 1] = self.yx * x + self.yy * y + self.yz * z
+                    out[i, 2] = self.zx * x + self.zy * y + self.zz * z
+            else:
+                for i in range(src.shape[0]):
+                    x, y, z = src[i, 0], src[i, 1], src[i, 2]
+                    out[i, 0] = self.mulx(x, y, z)
+                    out[i, 1] = self.muly(x, y, z)
+                    out[i, 2] = self.mulz(x, y, z)
+        return 0
+
+    cdef inline object _dispatch_many(self, object src, object out, bint inverse):
+        cdef str fmt = buffer_format(src)
+        if out is None:
+            out = Vec3Array(len(src)) if fmt == "g" else new_float_buffer(fmt, len(src), 3)
+        elif buffer_format(out) != fmt:
+            raise TypeError(f"Buffer format mismatch: {fmt} and {buffer_format(out)}")
+        cdef const float[:, ::1] src_f
+        cdef const double[:, ::1] src_d
+        cdef const py_float[:, ::1] src_g
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            src_f, out_f = src, out
+            self._apply_many(src_f, out_f, inverse)
+        elif fmt == "d":
+            src_d, out_d = src, out
+            self._apply_many(src_d, out_d, inverse)
+        elif fmt == "g":
+            src_g, out_g = src, out
+            self._apply_many(src_g, out_g, inverse)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def apply_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 3) float buffer (e.g. a `Vec3Array`) in one pass.
+
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec3Array` is created for long double buffers,
+        or a new (N, 3) memoryview of the same format for float and double buffers.
+
+        See Also: `Transform3Dd.__call__()`
+        """
+        return self._dispatch_many(src, out, False)
+
+    def apply_inverse_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 3) float buffer using the *INVERSE* of the transform.
+
+        This is the batched version of `vector * transform`, see `Transform3Dd.apply_many()` for the buffer semantics.
+
+        See Also: `Vec3d.__mul__()`
+        """
+        return self._dispatch_many(src, out, True)
+
+    cdef inline Transform3Dd ___matmul___0(self, Transform3Dd other):
+        """Transform a copy of the `Transform3Dd` on the right."""
+        cdef Transform3Dd t = Transform3Dd.__new__(Transform3Dd)
+        t.xx = self.tdotx(other.xx, other.xy, other.xz)
+        t.xy = self.tdoty(other.xx, other.xy, other.xz)
+        t.xz = self.tdotz(other.xx, other.xy, other.xz)
+        t.yx = self.tdotx(other.yx, other.yy, other.yz)
+        t.yy = self.tdoty(other.yx, other.yy, other.yz)
+        t.yz = self.tdotz(other.yx, other.yy, other.yz)
+        t.zx = self.tdotx(other.zx, other.zy, other.zz)
+        t.zy = self.tdoty(other.zx, other.zy, other.zz)
+        t.zz = self.tdotz(other.zx, other.zy, other.zz)
+        t.ox = self.mulx(other.ox, other.oy, other.oz)
+        t.oy = self.muly(other.ox, other.oy, other.oz)
+        t.oz = self.mulz(other.ox, other.oy, other.oz)
+        return t
+
+
+    def __matmul__(self, object p0, /) -> Transform3Dd:
+        if type(p0) is Transform3Dd:
+            return self.___matmul___0(<Transform3Dd> p0)
+        if isinstance(p0, Transform3Dd):
+            return self.___matmul___0(<Transform3Dd> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform3Dd, got {p0}")
+
+    cdef inline void _transform_ip(self, Transform3Dd other) noexcept:
+        cdef double xx = other.tdotx(self.xx, self.xy, self.xz)
+        cdef double xy = other.tdoty(self.xx, self.xy, self.xz)
+        cdef double xz = other.tdotz(self.xx, self.xy, self.xz)
+        cdef double yx = other.tdotx(self.yx, self.yy, self.yz)
+        cdef double yy = other.tdoty(self.yx, self.yy, self.yz)
+        cdef double yz = other.tdotz(self.yx, self.yy, self.yz)
+        cdef double zx = other.tdotx(self.zx, self.zy, self.zz)
+        cdef double zy = other.tdoty(self.zx, self.zy, self.zz)
+        cdef double zz = other.tdotz(self.zx, self.zy, self.zz)
+        cdef double ox = other.mulx(self.ox, self.oy, self.oz)
+        cdef double oy = other.muly(self.ox, self.oy, self.oz)
+        cdef double oz = other.mulz(self.ox, self.oy, self.oz)
+        self.xx, self.xy, self.xz = xx, xy, xz
+        self.yx, self.yy, self.yz = yx, yy, yz
+        self.zx, self.zy, self.zz = zx, zy, zz
+        self.ox, self.oy, self.oz = ox, oy, oz
+
+    def __imatmul__(self, Transform3Dd other) -> Transform3Dd:
+        #<RETURN_SELF>
+        """Transform this `Transform3Dd` inplace with the other `Transform3Dd`."""
+        self._transform_ip(other)
+        return self
+
+    cdef inline double _determinant(self) noexcept:
+        return (self.xx * (self.yy * self.zz - self.yz * self.zy) -
+                self.yx * (self.xy * self.zz - self.xz * self.zy) +
+                self.zx * (self.xy * self.yz - self.yy * self.xz))
+
+    @property
+    def determinant(self) -> double:
+        """Compute the determinant of the matrix."""
+        return self._determinant()
+
+    def __invert__(self) -> Transform3Dd:
+        """Get the invert transform.
+
+        See Also: `Vec3d.__mul__()`
+        """
+        cdef double cox = self.yy * self.zz - self.yz * self.zy
+        cdef double coy = self.xz * self.zy - self.xy * self.zz
+        cdef double coz = self.xy * self.yz - self.yy * self.xz
+        cdef double det = self.xx * cox + self.yx * coy + self.zx * coz
+        cdef double i_det = 1.0 / det
+
+        cdef Transform3Dd t = Transform3Dd.__new__(Transform3Dd)
+        t.xx = cox * i_det
+        t.xy = coy * i_det
+        t.xz = coz * i_det
+        t.yx = (self.zx * self.yz - self.yx * self.zz) * i_det
+        t.yy = (self.xx * self.zz - self.zx * self.xz) * i_det
+        t.yz = (self.yx * self.xz - self.xx * self.yz) * i_det
+        t.zx = (self.yx * self.zy - self.zx * self.yy) * i_det
+        t.zy = (self.zx * self.xy - self.xx * self.zy) * i_det
+        t.zz = (self.xx * self.yy - self.yx * self.xy) * i_det
+        t.ox = -t.tdotx(self.ox, self.oy, self.oz)
+        t.oy = -t.tdoty(self.ox, self.oy, self.oz)
+        t.oz = -t.tdotz(self.ox, self.oy, self.oz)
+        return t
+
+    cdef inline void _translate_ip(self, Vec3d translation) noexcept:
+        self.ox += translation.x
+        self.oy += translation.y
+        self.oz += translation.z
+
+    def translate_ip(self, Vec3d translation, /) -> Transform3Dd:
+        #<RETURN_SELF>
+        """Apply translation to this transform inplace."""
+        self._translate_ip(translation)
+        return self
+
+    def translated(self, Vec3d translation, /) -> Transform3Dd:
+        """Apply translation to a copy of this transform."""
+        cdef Transform3Dd t = self.copy()
+        t.translate_ip(translation)
+        return t
+
+    def translate_into(self, Vec3d translation, Transform3Dd out, /) -> Transform3Dd:
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._translate_ip(translation)
+        return out
+
+    cdef inline void _rotate_ip(self, Vec3d axis, double angle):
+        self._transform_ip(Transform3Dd.rotating(axis, angle))
+
+    def rotate_ip(self, Vec3d axis, double angle, /) -> Transform3Dd:
+        #<RETURN_SELF>
+        """Apply rotation to this transform inplace."""
+        self._rotate_ip(axis, angle)
+        return self
+
+    def rotated(self, Vec3d axis, double angle, /) -> Transform3Dd:
+        """Apply rotation to a copy of this transform."""
+        cdef Transform3Dd t = self.copy()
+        t.rotate_ip(axis, angle)
+        return t
+
+    def rotate_into(self, Vec3d axis, double angle, Transform3Dd out, /) -> Transform3Dd:
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._rotate_ip(axis, angle)
+        return out
+
+    cdef inline void _scale_ip(self, Vec3d scale) noexcept:
+        self.xx *= scale.x
+        self.yx *= scale.x
+        self.zx *= scale.x
+        self.xy *= scale.y
+        self.yy *= scale.y
+        self.zy *= scale.y
+        self.xz *= scale.z
+        self.yz *= scale.z
+        self.zz *= scale.z
+
+    def scale_ip(self, Vec3d scale, /) -> Transform3Dd:
+        #<RETURN_SELF>
+        """Apply scaling to this transform inplace."""
+        self._scale_ip(scale)
+        return self
+
+    def scaled(self, Vec3d scale, /) -> Transform3Dd:
+        """Apply scaling to a copy of this transform."""
+        cdef Transform3Dd t = self.copy()
+        t.scale_ip(scale)
+        return t
+
+    def scale_into(self, Vec3d scale, Transform3Dd out, /) -> Transform3Dd:
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._scale_ip(scale)
+        return out
+
+cdef object _Transform3Dd_vectorcall(PyObject* cls, PyObject** args, size_t nargsf, PyObject* kwnames):
+    cdef Py_ssize_t nargs = PyVectorcall_NARGS(nargsf)
+    if kwnames != NULL and len(<tuple> kwnames) != 0:
+        raise TypeError("Transform3Dd() takes no keyword arguments")
+    if nargs > 12:
+        raise TypeError(f"Transform3Dd() takes from 0 to 12 positional arguments but {nargs} were given")
+    cdef Transform3Dd self = Transform3Dd.__new__(Transform3Dd)
+    self.___init___dispatch(<object> args[0] if nargs > 0 else None, <object> args[1] if nargs > 1 else None, <object> args[2] if nargs > 2 else None, <object> args[3] if nargs > 3 else None, <object> args[4] if nargs > 4 else None, <object> args[5] if nargs > 5 else None, <object> args[6] if nargs > 6 else None, <object> args[7] if nargs > 7 else None, <object> args[8] if nargs > 8 else None, <object> args[9] if nargs > 9 else None, <object> args[10] if nargs > 10 else None, <object> args[11] if nargs > 11 else None)
+    return self
+
+(<PyVectorcallTypeObject*> Transform3Dd).tp_vectorcall = <vectorcallfunc> _Transform3Dd_vectorcall
+
+from libc.math cimport sinf, cosf
+
+cdef Py_ssize_t[2] _Transform3Df_buffer_shape = [4, 3]
+cdef Py_ssize_t[2] _Transform3Df_buffer_strides = [3 * sizeof(float), sizeof(float)]
+
+
+@cython.auto_pickle(True)
+@cython.freelist(1024)
+@cython.no_gc
+@cython.final
+cdef class Transform3Df:
+    """3D linear transformation (3*4 matrix) of `float`s."""
+
+
+
+    cdef inline void identity(self) noexcept:
+        self.xx, self.xy, self.xz = 1.0, 0.0, 0.0
+        self.yx, self.yy, self.yz = 0.0, 1.0, 0.0
+        self.zx, self.zy, self.zz = 0.0, 0.0, 1.0
+        self.ox = self.oy = self.oz = 0.0
+
+    cdef inline void ___init___0(self) noexcept:
+        """Create an identity transform."""
+        self.identity()
+
+    cdef inline void ___init___1(self, float xx, float xy, float xz, float yx, float yy, float yz, float zx, float zy, float zz, float ox, float oy, float oz) noexcept:
+        """Create a transform from all the matrix elements."""
+        self.xx = xx
+        self.xy = xy
+        self.xz = xz
+        self.yx = yx
+        self.yy = yy
+        self.yz = yz
+        self.zx = zx
+        self.zy = zy
+        self.zz = zz
+        self.ox = ox
+        self.oy = oy
+        self.oz = oz
+
+    cdef inline void ___init___2(self, Vec3f x, Vec3f y, Vec3f z, Vec3f origin) noexcept:
+        """Create a transform using three base vectors and the origin vector."""
+        self.xx, self.xy, self.xz = x.x, x.y, x.z
+        self.yx, self.yy, self.yz = y.x, y.y, y.z
+        self.zx, self.zy, self.zz = z.x, z.y, z.z
+        self.ox, self.oy, self.oz = origin.x, origin.y, origin.z
+
+    cdef inline void ___init___3(self, Transform3Df transform) noexcept:
+        """Create a copy."""
+        self.xx = transform.xx
+        self.xy = transform.xy
+        self.xz = transform.xz
+        self.yx = transform.yx
+        self.yy = transform.yy
+        self.yz = transform.yz
+        self.zx = transform.zx
+        self.zy = transform.zy
+        self.zz = transform.zz
+        self.ox = transform.ox
+        self.oy = transform.oy
+        self.oz = transform.oz
+
+    cdef inline void ___init___4(self, Transform3D transform) noexcept:
+        """Convert a floating-point transform to a single precision transform."""
+        self.xx = <float>transform.xx
+        self.xy = <float>transform.xy
+        self.xz = <float>transform.xz
+        self.yx = <float>transform.yx
+        self.yy = <float>transform.yy
+        self.yz = <float>transform.yz
+        self.zx = <float>transform.zx
+        self.zy = <float>transform.zy
+        self.zz = <float>transform.zz
+        self.ox = <float>transform.ox
+        self.oy = <float>transform.oy
+        self.oz = <float>transform.oz
+    
+    cdef inline void ___init___5(self, Transform3Dd transform) noexcept:
+        """Convert a double precision transform to a single precision transform."""
+        self.xx = <float>transform.xx
+        self.xy = <float>transform.xy
+        self.xz = <float>transform.xz
+        self.yx = <float>transform.yx
+        self.yy = <float>transform.yy
+        self.yz = <float>transform.yz
+        self.zx = <float>transform.zx
+        self.zy = <float>transform.zy
+        self.zz = <float>transform.zz
+        self.ox = <float>transform.ox
+        self.oy = <float>transform.oy
+        self.oz = <float>transform.oz
+
+    cdef inline object ___init___dispatch(self, object p0, object p1, object p2, object p3, object p4, object p5, object p6, object p7, object p8, object p9, object p10, object p11):
+        if (PyFloat_CheckExact(p0) or PyLong_CheckExact(p0)):
+            if (PyFloat_CheckExact(p1) or PyLong_CheckExact(p1)):
+                if (PyFloat_CheckExact(p2) or PyLong_CheckExact(p2)):
+                    if (PyFloat_CheckExact(p3) or PyLong_CheckExact(p3)):
+                        if (PyFloat_CheckExact(p4) or PyLong_CheckExact(p4)):
+                            if (PyFloat_CheckExact(p5) or PyLong_CheckExact(p5)):
+                                if (PyFloat_CheckExact(p6) or PyLong_CheckExact(p6)):
+                                    if (PyFloat_CheckExact(p7) or PyLong_CheckExact(p7)):
+                                        if (PyFloat_CheckExact(p8) or PyLong_CheckExact(p8)):
+                                            if (PyFloat_CheckExact(p9) or PyLong_CheckExact(p9)):
+                                                if (PyFloat_CheckExact(p10) or PyLong_CheckExact(p10)):
+                                                    if (PyFloat_CheckExact(p11) or PyLong_CheckExact(p11)):
+                                                        self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5), PyFloat_AsDouble(p6), PyFloat_AsDouble(p7), PyFloat_AsDouble(p8), PyFloat_AsDouble(p9), PyFloat_AsDouble(p10), PyFloat_AsDouble(p11))
+                                                        return
+        elif type(p0) is Vec3f:
+            if type(p1) is Vec3f:
+                if type(p2) is Vec3f:
+                    if type(p3) is Vec3f:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___2(<Vec3f> p0, <Vec3f> p1, <Vec3f> p2, <Vec3f> p3)
+                                                        return
+        elif type(p0) is Transform3Df:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___3(<Transform3Df> p0)
+                                                        return
+        elif type(p0) is Transform3D:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___4(<Transform3D> p0)
+                                                        return
+        elif type(p0) is Transform3Dd:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___5(<Transform3Dd> p0)
+                                                        return
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___0()
+                                                        return
+        if (PyFloat_Check(p0) or PyLong_Check(p0)):
+            if (PyFloat_Check(p1) or PyLong_Check(p1)):
+                if (PyFloat_Check(p2) or PyLong_Check(p2)):
+                    if (PyFloat_Check(p3) or PyLong_Check(p3)):
+                        if (PyFloat_Check(p4) or PyLong_Check(p4)):
+                            if (PyFloat_Check(p5) or PyLong_Check(p5)):
+                                if (PyFloat_Check(p6) or PyLong_Check(p6)):
+                                    if (PyFloat_Check(p7) or PyLong_Check(p7)):
+                                        if (PyFloat_Check(p8) or PyLong_Check(p8)):
+                                            if (PyFloat_Check(p9) or PyLong_Check(p9)):
+                                                if (PyFloat_Check(p10) or PyLong_Check(p10)):
+                                                    if (PyFloat_Check(p11) or PyLong_Check(p11)):
+                                                        self.___init___1(PyFloat_AsDouble(p0), PyFloat_AsDouble(p1), PyFloat_AsDouble(p2), PyFloat_AsDouble(p3), PyFloat_AsDouble(p4), PyFloat_AsDouble(p5), PyFloat_AsDouble(p6), PyFloat_AsDouble(p7), PyFloat_AsDouble(p8), PyFloat_AsDouble(p9), PyFloat_AsDouble(p10), PyFloat_AsDouble(p11))
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3f | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3f | None, got {p1}")
+        elif isinstance(p0, Vec3f):
+            if isinstance(p1, Vec3f):
+                if isinstance(p2, Vec3f):
+                    if isinstance(p3, Vec3f):
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___2(<Vec3f> p0, <Vec3f> p1, <Vec3f> p2, <Vec3f> p3)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3f | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3f | None, got {p1}")
+        elif isinstance(p0, Transform3Df):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___3(<Transform3Df> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3f | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3f | None, got {p1}")
+        elif isinstance(p0, Transform3D):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___4(<Transform3D> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3f | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3f | None, got {p1}")
+        elif isinstance(p0, Transform3Dd):
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___5(<Transform3Dd> p0)
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3f | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3f | None, got {p1}")
+        elif p0 is None:
+            if p1 is None:
+                if p2 is None:
+                    if p3 is None:
+                        if p4 is None:
+                            if p5 is None:
+                                if p6 is None:
+                                    if p7 is None:
+                                        if p8 is None:
+                                            if p9 is None:
+                                                if p10 is None:
+                                                    if p11 is None:
+                                                        self.___init___0()
+                                                        return
+                                                    else:
+                                                        raise TypeError(f"The 13th parameter expected float | int | None, got {p11}")
+                                                else:
+                                                    raise TypeError(f"The 12th parameter expected float | int | None, got {p10}")
+                                            else:
+                                                raise TypeError(f"The 11th parameter expected float | int | None, got {p9}")
+                                        else:
+                                            raise TypeError(f"The 10th parameter expected float | int | None, got {p8}")
+                                    else:
+                                        raise TypeError(f"The 9th parameter expected float | int | None, got {p7}")
+                                else:
+                                    raise TypeError(f"The 8th parameter expected float | int | None, got {p6}")
+                            else:
+                                raise TypeError(f"The 7th parameter expected float | int | None, got {p5}")
+                        else:
+                            raise TypeError(f"The 6th parameter expected float | int | None, got {p4}")
+                    else:
+                        raise TypeError(f"The 5th parameter expected float | int | Vec3f | None, got {p3}")
+                else:
+                    raise TypeError(f"The 4th parameter expected float | int | Vec3f | None, got {p2}")
+            else:
+                raise TypeError(f"The 3th parameter expected float | int | Vec3f | None, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected float | int | Vec3f | Transform3Df | Transform3D | Transform3Dd | None, got {p0}")
+    
+    def __init__(self, object p0=None, object p1=None, object p2=None, object p3=None, object p4=None, object p5=None, object p6=None, object p7=None, object p8=None, object p9=None, object p10=None, object p11=None, /) -> None:
+        self.___init___dispatch(p0, p1, p2, p3, p4, p5, p6, p7, p8, p9, p10, p11)
+
+    @staticmethod
+    def translating(Vec3f translation, /) -> Transform3Df:
+        """Create a translation transform."""
+        cdef Transform3Df t = Transform3Df.__new__(Transform3Df)
+        t.identity()
+        t.ox += translation.x
+        t.oy += translation.y
+        t.oz += translation.z
+        return t
+
+    @staticmethod
+    def rotating(Vec3f axis, float angle, /, Vec3f origin = None) -> Transform3Df:
+        """Create a rotation transform."""
+        cdef Transform3Df trans = Transform3Df.__new__(Transform3Df)
+
+        cdef float axis_x_sq = axis.x * axis.x
+        cdef float axis_y_sq = axis.y * axis.y
+        cdef float axis_z_sq = axis.z * axis.z
+        cdef float c = cosf(angle)
+
+        trans.xx = axis_x_sq + c * (1.0 - axis_x_sq)
+        trans.yy = axis_y_sq + c * (1.0 - axis_y_sq)
+        trans.zz = axis_z_sq + c * (1.0 - axis_z_sq)
+
+        cdef float s = sinf(angle)
+        cdef t = 1.0 - c
+
+        cdef xyzt = axis.x * axis.y * t
+        cdef zyxs = axis.z * s
+        trans.yx = xyzt - zyxs
+        trans.xy = xyzt + zyxs
+
+        xyzt = axis.x * axis.z * t
+        zyxs = axis.y * s
+        trans.zx = xyzt + zyxs
+        trans.xz = xyzt - zyxs
+
+        xyzt = axis.y * axis.z * t
+        zyxs = axis.x * s
+        trans.zy = xyzt - zyxs
+        trans.yz = xyzt + zyxs
+
+        if origin is not None:
+            trans.ox = origin.x
+            trans.oy = origin.y
+            trans.oz = origin.z
+
+        return trans
+
+    @staticmethod
+    def scaling(Vec3f scale, /, Vec3f origin = None) -> Transform3Df:
+        """Create a scale transform."""
+        cdef Transform3Df t = Transform3Df.__new__(Transform3Df)
+        t.identity()
+        t.xx = scale.x
+        t.yy = scale.y
+        t.zz = scale.z
+
+        if origin is not None:
+            t.ox = origin.x
+            t.oy = origin.y
+            t.oz = origin.z
+
+        return t
+
+    cdef inline void _copy_to(self, Transform3Df t) noexcept:
+        t.xx = self.xx
+        t.xy = self.xy
+        t.xz = self.xz
+        t.yx = self.yx
+        t.yy = self.yy
+        t.yz = self.yz
+        t.zx = self.zx
+        t.zy = self.zy
+        t.zz = self.zz
+        t.ox = self.ox
+        t.oy = self.oy
+        t.oz = self.oz
+
+    cdef inline Transform3Df copy(self):
+        cdef Transform3Df t = Transform3Df.__new__(Transform3Df)
+        self._copy_to(t)
+        return t
+    
+    def __repr__(self) -> str:
+        return f"⎡X: ({self.xx}, {self.xy}, {self.xz})\n⎢Y: ({self.yx}, {self.yy}, {self.yz})\n⎢Z: ({self.zx}, {self.zy}, {self.zz})\n⎣O: ({self.ox}, {self.oy}, {self.oz})"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform3Df.is_close()`
+        """
+        if not isinstance(other, Transform3Df):
+            return False
+        cdef Transform3Df trans = <Transform3Df> other
+        return self.xx == trans.xx and self.xy == trans.xy and self.xz == trans.xz and\
+               self.yx == trans.yx and self.yy == trans.yy and self.yz == trans.yz and\
+               self.zx == trans.zx and self.zy == trans.zy and self.zz == trans.zz and\
+               self.ox == trans.ox and self.oy == trans.oy and self.oz == trans.oz
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform3Df.is_close()`
+        """
+        if not isinstance(other, Transform3Df):
+            return True
+        cdef Transform3Df trans = <Transform3Df> other
+        return self.xx != trans.xx or self.xy != trans.xy or self.xz != trans.xz or\
+               self.yx != trans.yx or self.yy != trans.yy or self.yz != trans.yz or\
+               self.zx != trans.zx or self.zy != trans.zy or self.zz != trans.zz or\
+               self.ox != trans.ox or self.oy != trans.oy or self.oz != trans.oz
+
+    def is_close(self, Transform3Df other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if the two transforms are close enough.
+
+        See Also: `math.is_close()`
+        """
+        return is_close(self.xx, other.xx, rel_tol, abs_tol) and \
+               is_close(self.xy, other.xy, rel_tol, abs_tol) and \
+               is_close(self.xz, other.xz, rel_tol, abs_tol) and \
+               is_close(self.yx, other.yx, rel_tol, abs_tol) and \
+               is_close(self.yy, other.yy, rel_tol, abs_tol) and \
+               is_close(self.yz, other.yz, rel_tol, abs_tol) and \
+               is_close(self.zx, other.zx, rel_tol, abs_tol) and \
+               is_close(self.zy, other.zy, rel_tol, abs_tol) and \
+               is_close(self.zz, other.zz, rel_tol, abs_tol) and \
+               is_close(self.ox, other.ox, rel_tol, abs_tol) and \
+               is_close(self.oy, other.oy, rel_tol, abs_tol) and \
+               is_close(self.oz, other.oz, rel_tol, abs_tol)
+
+    def __hash__(self) -> py_int:
+        cdef uint64_t h = 12
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.xz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.yz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zx))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.zz))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.ox))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oy))
+        h = hash_combine(h, <uint64_t> bitcast_float(self.oz))
+        return hash_finish(h)
+
+    @property
+    def x(self) -> Vec3f:
+        """Base vector X."""
+        cdef Vec3f vec = Vec3f.__new__(Vec3f)
+        vec.x = self.xx
+        vec.y = self.xy
+        vec.z = self.xz
+        return vec
+
+    @property
+    def y(self) -> Vec3f:
+        """Base vector Y."""
+        cdef Vec3f vec = Vec3f.__new__(Vec3f)
+        vec.x = self.yx
+        vec.y = self.yy
+        vec.z = self.yz
+        return vec
+
+    @property
+    def z(self) -> Vec3f:
+        """Base vector Z."""
+        cdef Vec3f vec = Vec3f.__new__(Vec3f)
+        vec.x = self.zx
+        vec.y = self.zy
+        vec.z = self.zz
+        return vec
+
+    @property
+    def origin(self) -> Vec3f:
+        """Origin vector."""
+        cdef Vec3f vec = Vec3f.__new__(Vec3f)
+        vec.x = self.ox
+        vec.y = self.oy
+        vec.z = self.oz
+        return vec
+
+    @x.setter
+    def x(self, Vec3f value) -> None:
+        """Set the X base of the matrix."""
+        self.xx = value.x
+        self.xy = value.y
+        self.xz = value.z
+
+    @y.setter
+    def y(self, Vec3f value) -> None:
+        """Set the Y base of the matrix."""
+        self.yx = value.x
+        self.yy = value.y
+        self.yz = value.z
+
+    @z.setter
+    def z(self, Vec3f value) -> None:
+        """Set the Z base of the matrix."""
+        self.zx = value.x
+        self.zy = value.y
+        self.zz = value.z
+
+    @origin.setter
+    def origin(self, Vec3f value) -> None:
+        """Set the origin."""
+        self.ox = value.x
+        self.oy = value.y
+        self.oz = value.z
+
+    def __getitem__(self, py_int item) -> Vec3f:
+        """Get a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        cdef vec = Vec3f.__new__(Vec3f)
+
+        if item == 0:
+            vec.x = self.xx
+            vec.y = self.xy
+            vec.z = self.xz
+        elif item == 1:
+            vec.x = self.yx
+            vec.y = self.yy
+            vec.z = self.yz
+        elif item == 2:
+            vec.x = self.zx
+            vec.y = self.zy
+            vec.z = self.zz
+        elif item == 3:
+            vec.x = self.ox
+            vec.y = self.oy
+            vec.z = self.oz
+        else:
+            raise IndexError(item)
+
+        return vec
+
+    def __setitem__(self, py_int key, Vec3f value) -> None:
+        """Set a column of the transformation matrix.
+
+        0: Base vector X
+        1: Base vector Y
+        2: Base vector Z
+        3: Origin vector
+        """
+        if key == 0:
+            self.xx = value.x
+            self.xy = value.y
+            self.xz = value.z
+        elif key == 1:
+            self.yx = value.x
+            self.yy = value.y
+            self.yz = value.z
+        elif key == 2:
+            self.zx = value.x
+            self.zy = value.y
+            self.zz = value.z
+        elif key == 3:
+            self.ox = value.x
+            self.oy = value.y
+            self.oz = value.z
+        else:
+            raise IndexError(key)
+
+    def __len__(self) -> py_int:
+        """The amount of columns. Is always 4 for `Transform3Df`s."""
+        return 4
+
+    # Expose the matrix as a writable 4*3 buffer (one row per column vector), without copying.
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, &self.xx, sizeof(float), b"f", 2, _Transform3Df_buffer_shape, _Transform3Df_buffer_strides)
+
+    def to_bytes(self) -> bytes:
+        """The elements of this transform as raw bytes in native byte order (column by column, like the buffer)."""
+        return PyBytes_FromStringAndSize(<char*> &self.xx, 12 * sizeof(float))
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform3Df:
+        """Create a transform from the bytes written by `Transform3Df.to_bytes()` (or any buffer of the same size)."""
+        cdef Transform3Df t = Transform3Df.__new__(Transform3Df)
+        read_bytes(data, &t.xx, 12 * sizeof(float))
+        return t
+
+    @staticmethod
+    def pack_many(object transforms, /) -> bytes:
+        """Pack an iterable of transforms into one fixed-stride block with a small header.
+
+        This is much smaller and faster than pickling the transforms one by one.
+        See Also: `Transform3Df.unpack_many()`
+        """
+        transforms = list(transforms)
+        cdef Py_ssize_t i, count = len(transforms)
+        cdef bytes block = new_pack_block(count, ord("f"), sizeof(float), 12)
+        cdef float* p = <float*> pack_block_items(block)
+        cdef Transform3Df t
+        for i in range(count):
+            t = <Transform3Df?> transforms[i]
+            memcpy(p + i * 12, &t.xx, 12 * sizeof(float))
+        return block
+
+    @staticmethod
+    def unpack_many(object data, /) -> list[Transform3Df]:
+        """Read the transforms of a block written by `Transform3Df.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t i, count = open_pack_block(data, &view, ord("f"), sizeof(float), 12, &items)
+        cdef list result = []
+        cdef Transform3Df t
+        try:
+            for i in range(count):
+                t = Transform3Df.__new__(Transform3Df)
+                memcpy(&t.xx, items + i * 12 * sizeof(float), 12 * sizeof(float))
+                result.append(t)
+        finally:
+            PyBuffer_Release(&view)
+        return result
+
+    cdef inline float tdotx(self, float x, float y, float z) noexcept nogil:
+        return x * self.xx + y * self.yx + z * self.zx
+
+    cdef inline float mulx(self, float x, float y, float z) noexcept nogil:
+        return self.tdotx(x, y, z) + self.ox
+
+    cdef inline float tdoty(self, float x, float y, float z) noexcept nogil:
+        return x * self.xy + y * self.yy + z * self.zy
+
+    cdef inline float muly(self, float x, float y, float z) noexcept nogil:
+        return self.tdoty(x, y, z) + self.oy
+
+    cdef inline float tdotz(self, float x, float y, float z) noexcept nogil:
+        return x * self.xz + y * self.yz + z * self.zz
+
+    cdef inline float mulz(self, float x, float y, float z) noexcept nogil:
+        return self.tdotz(x, y, z) + self.oz
+
+    def __mul__(self, Vec3f other) -> Vec3f:
+        """Transform a copy of the vector.
+
+        See Also: `Vec3f.__mul__()`
+        """
+        cdef Vec3f vec = Vec3f.__new__(Vec3f)
+        vec.x = self.mulx(other.x, other.y, other.z)
+        vec.y = self.muly(other.x, other.y, other.z)
+        vec.z = self.mulz(other.x, other.y, other.z)
+        return vec
+
+    def __rmul__(self, Vec3f other) -> Vec3f:
+        """Transform a copy of the vector using the *INVERSE* of this transform, for `vector * transform`.
+        Use `transform * vector` or `transform(vector)` for non-inverse transformation.
+
+        See Also: `Vec3f.__mul__()`
+        """
+        cdef Vec3f vec = Vec3f.__new__(Vec3f)
+        cdef float x = other.x - self.ox
+        cdef float y = other.y - self.oy
+        cdef float z = other.z - self.oz
+        vec.x = self.xx * x + self.xy * y + self.xz * z
+        vec.y = self.yx * x + self.yy * y + self.yz * z
+        vec.z = self.zx * x + self.zy * y + self.zz * z
+        return vec
+
+    cdef inline Vec3f ___call___0(self, Vec3f other):
+        """Transform a copy of the vector.
+        
+        See Also: `Vec3f.__mul__()`
+        """
+        cdef Vec3f vec = Vec3f.__new__(Vec3f)
+        vec.x = self.mulx(other.x, other.y, other.z)
+        vec.y = self.muly(other.x, other.y, other.z)
+        vec.z = self.mulz(other.x, other.y, other.z)
+        return vec
+
+    cdef inline Transform3Df ___call___1(self, Transform3Df other):
+        """Transform a copy of the passed in `Transform3Df`."""
+        cdef Transform3Df t = Transform3Df.__new__(Transform3Df)
+        t.xx = self.tdotx(other.xx, other.xy, other.xz)
+        t.xy = self.tdoty(other.xx, other.xy, other.xz)
+        t.xz = self.tdotz(other.xx, other.xy, other.xz)
+        t.yx = self.tdotx(other.yx, other.yy, other.yz)
+        t.yy = self.tdoty(other.yx, other.yy, other.yz)
+        t.yz = self.tdotz(other.yx, other.yy, other.yz)
+        t.zx = self.tdotx(other.zx, other.zy, other.zz)
+        t.zy = self.tdoty(other.zx, other.zy, other.zz)
+        t.zz = self.tdotz(other.zx, other.zy, other.zz)
+        t.ox = self.mulx(other.ox, other.oy, other.oz)
+        t.oy = self.muly(other.ox, other.oy, other.oz)
+        t.oz = self.mulz(other.ox, other.oy, other.oz)
+        return t
+
+    def __call__(self, object p0, /) -> Vec3f | Transform3Df:
+        if type(p0) is Vec3f:
+            return self.___call___0(<Vec3f> p0)
+        elif type(p0) is Transform3Df:
+            return self.___call___1(<Transform3Df> p0)
+        if isinstance(p0, Vec3f):
+            return self.___call___0(<Vec3f> p0)
+        elif isinstance(p0, Transform3Df):
+            return self.___call___1(<Transform3Df> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec3f | Transform3Df, got {p0}")
+
+    cdef inline Vec3f _apply_into_0(self, Vec3f other, Vec3f out):
+        """Transform the vector, writing the result into `out` (which can be `other`) instead of a new vector.
+
+        See Also: `Transform3Df.__call__()`
+        """
+        cdef float x = self.mulx(other.x, other.y, other.z)
+        cdef float y = self.muly(other.x, other.y, other.z)
+        cdef float z = self.mulz(other.x, other.y, other.z)
+        out.x = x
+        out.y = y
+        out.z = z
+        return out
+
+    cdef inline Transform3Df _apply_into_1(self, Transform3Df other, Transform3Df out):
+        """Transform the passed in `Transform3Df`, writing the result into `out` (which can be `other` or `self`) instead of a new transform."""
+        cdef float xx = self.tdotx(other.xx, other.xy, other.xz)
+        cdef float xy = self.tdoty(other.xx, other.xy, other.xz)
+        cdef float xz = self.tdotz(other.xx, other.xy, other.xz)
+        cdef float yx = self.tdotx(other.yx, other.yy, other.yz)
+        cdef float yy = self.tdoty(other.yx, other.yy, other.yz)
+        cdef float yz = self.tdotz(other.yx, other.yy, other.yz)
+        cdef float zx = self.tdotx(other.zx, other.zy, other.zz)
+        cdef float zy = self.tdoty(other.zx, other.zy, other.zz)
+        cdef float zz = self.tdotz(other.zx, other.zy, other.zz)
+        cdef float ox = self.mulx(other.ox, other.oy, other.oz)
+        cdef float oy = self.muly(other.ox, other.oy, other.oz)
+        cdef float oz = self.mulz(other.ox, other.oy, other.oz)
+        out.xx = xx
+        out.xy = xy
+        out.xz = xz
+        out.yx = yx
+        out.yy = yy
+        out.yz = yz
+        out.zx = zx
+        out.zy = zy
+        out.zz = zz
+        out.ox = ox
+        out.oy = oy
+        out.oz = oz
+        return out
+
+    def apply_into(self, object p0, object p1, /) -> Vec3f | Transform3Df:
+        if type(p0) is Vec3f:
+            if type(p1) is Vec3f:
+                return self._apply_into_0(<Vec3f> p0, <Vec3f> p1)
+        elif type(p0) is Transform3Df:
+            if type(p1) is Transform3Df:
+                return self._apply_into_1(<Transform3Df> p0, <Transform3Df> p1)
+        if isinstance(p0, Vec3f):
+            if isinstance(p1, Vec3f):
+                return self._apply_into_0(<Vec3f> p0, <Vec3f> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec3f | Transform3Df, got {p1}")
+        elif isinstance(p0, Transform3Df):
+            if isinstance(p1, Transform3Df):
+                return self._apply_into_1(<Transform3Df> p0, <Transform3Df> p1)
+            else:
+                raise TypeError(f"The 3th parameter expected Vec3f | Transform3Df, got {p1}")
+        else:
+            raise TypeError(f"The 2th parameter expected Vec3f | Transform3Df, got {p0}")
+
+    cdef inline int _apply_many(self, const buffer_float[:, ::1] src, buffer_float[:, ::1] out, bint inverse) except -1:
+        if src.shape[1] != 3 or out.shape[1] != 3:
+            raise ValueError(f"Expected buffers of shape (N, 3), got ({src.shape[0]}, {src.shape[1]}) and ({out.shape[0]}, {out.shape[1]})")
+        if out.shape[0] != src.shape[0]:
+            raise ValueError(f"Buffer size mismatch: {src.shape[0]} and {out.shape[0]}")
+        cdef Py_ssize_t i
+        cdef float x, y, z
+        # The branch is taken once rather than for every vector
+        with nogil:
+            if inverse:
+                for i in range(src.shape[0]):
+                    x, y, z = src[i, 0], src[i, 1], src[i, 2]
+                    x, y, z = x - self.ox, y - self.oy, z - self.oz
+                    out[i, 0] = self.xx * x + self.xy * y + self.xz * z
+                    out[i, 1] = self.yx * x + self.yy * y + self.yz * z
+                    out[i, 2] = self.zx * x + self.zy * y + self.zz * z
+            else:
+                for i in range(src.shape[0]):
+                    x, y, z = src[i, 0], src[i, 1], src[i, 2]
+                    out[i, 0] = self.mulx(x, y, z)
+                    out[i, 1] = self.muly(x, y, z)
+                    out[i, 2] = self.mulz(x, y, z)
+        return 0
+
+    cdef inline object _dispatch_many(self, object src, object out, bint inverse):
+        cdef str fmt = buffer_format(src)
+        if out is None:
+            out = Vec3Array(len(src)) if fmt == "g" else new_float_buffer(fmt, len(src), 3)
+        elif buffer_format(out) != fmt:
+            raise TypeError(f"Buffer format mismatch: {fmt} and {buffer_format(out)}")
+        cdef const float[:, ::1] src_f
+        cdef const double[:, ::1] src_d
+        cdef const py_float[:, ::1] src_g
+        cdef float[:, ::1] out_f
+        cdef double[:, ::1] out_d
+        cdef py_float[:, ::1] out_g
+        if fmt == "f":
+            src_f, out_f = src, out
+            self._apply_many(src_f, out_f, inverse)
+        elif fmt == "d":
+            src_d, out_d = src, out
+            self._apply_many(src_d, out_d, inverse)
+        elif fmt == "g":
+            src_g, out_g = src, out
+            self._apply_many(src_g, out_g, inverse)
+        else:
+            raise TypeError(f"Expected a buffer of float, double or long double, got format {fmt!r}")
+        return out
+
+    def apply_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 3) float buffer (e.g. a `Vec3Array`) in one pass.
+
+        The results are written to `out` (which can be `src` itself) and `out` is returned.
+        If `out` is None, a new `Vec3Array` is created for long double buffers,
+        or a new (N, 3) memoryview of the same format for float and double buffers.
+
+        See Also: `Transform3Df.__call__()`
+        """
+        return self._dispatch_many(src, out, False)
+
+    def apply_inverse_many(self, object src, /, object out = None) -> object:
+        """Transform every vector of a contiguous (N, 3) float buffer using the *INVERSE* of the transform.
+
+        This is the batched version of `vector * transform`, see `Transform3Df.apply_many()` for the buffer semantics.
+
+        See Also: `Vec3f.__mul__()`
+        """
+        return self._dispatch_many(src, out, True)
+
+    cdef inline Transform3Df ___matmul___0(self, Transform3Df other):
+        """Transform a copy of the `Transform3Df` on the right."""
+        cdef Transform3Df t = Transform3Df.__new__(Transform3Df)
+        t.xx = self.tdotx(other.xx, other.xy, other.xz)
+        t.xy = self.tdoty(other.xx, other.xy, other.xz)
+        t.xz = self.tdotz(other.xx, other.xy, other.xz)
+        t.yx = self.tdotx(other.yx, other.yy, other.yz)
+        t.yy = self.tdoty(other.yx, other.yy, other.yz)
+        t.yz = self.tdotz(other.yx, other.yy, other.yz)
+        t.zx = self.tdotx(other.zx, other.zy, other.zz)
+        t.zy = self.tdoty(other.zx, other.zy, other.zz)
+        t.zz = self.tdotz(other.zx, other.zy, other.zz)
+        t.ox = self.mulx(other.ox, other.oy, other.oz)
+        t.oy = self.muly(other.ox, other.oy, other.oz)
+        t.oz = self.mulz(other.ox, other.oy, other.oz)
+        return t
+
+
+    def __matmul__(self, object p0, /) -> Transform3Df:
+        if type(p0) is Transform3Df:
+            return self.___matmul___0(<Transform3Df> p0)
+        if isinstance(p0, Transform3Df):
+            return self.___matmul___0(<Transform3Df> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform3Df, got {p0}")
+
+    cdef inline void _transform_ip(self, Transform3Df other) noexcept:
+        cdef float xx = other.tdotx(self.xx, self.xy, self.xz)
+        cdef float xy = other.tdoty(self.xx, self.xy, self.xz)
+        cdef float xz = other.tdotz(self.xx, self.xy, self.xz)
+        cdef float yx = other.tdotx(self.yx, self.yy, self.yz)
+        cdef float yy = other.tdoty(self.yx, self.yy, self.yz)
+        cdef float yz = other.tdotz(self.yx, self.yy, self.yz)
+        cdef float zx = other.tdotx(self.zx, self.zy, self.zz)
+        cdef float zy = other.tdoty(self.zx, self.zy, self.zz)
+        cdef float zz = other.tdotz(self.zx, self.zy, self.zz)
+        cdef float ox = other.mulx(self.ox, self.oy, self.oz)
+        cdef float oy = other.muly(self.ox, self.oy, self.oz)
+        cdef float oz = other.mulz(self.ox, self.oy, self.oz)
+        self.xx, self.xy, self.xz = xx, xy, xz
+        self.yx, self.yy, self.yz = yx, yy, yz
+        self.zx, self.zy, self.zz = zx, zy, zz
+        self.ox, self.oy, self.oz = ox, oy, oz
+
+    def __imatmul__(self, Transform3Df other) -> Transform3Df:
+        #<RETURN_SELF>
+        """Transform this `Transform3Df` inplace with the other `Transform3Df`."""
+        self._transform_ip(other)
+        return self
+
+    cdef inline float _determinant(self) noexcept:
+        return (self.xx * (self.yy * self.zz - self.yz * self.zy) -
+                self.yx * (self.xy * self.zz - self.xz * self.zy) +
+                self.zx * (self.xy * self.yz - self.yy * self.xz))
+
+    @property
+    def determinant(self) -> float:
+        """Compute the determinant of the matrix."""
+        return self._determinant()
+
+    def __invert__(self) -> Transform3Df:
+        """Get the invert transform.
+
+        See Also: `Vec3f.__mul__()`
+        """
+        cdef float cox = self.yy * self.zz - self.yz * self.zy
+        cdef float coy = self.xz * self.zy - self.xy * self.zz
+        cdef float coz = self.xy * self.yz - self.yy * self.xz
+        cdef float det = self.xx * cox + self.yx * coy + self.zx * coz
+        cdef float i_det = 1.0 / det
+
+        cdef Transform3Df t = Transform3Df.__new__(Transform3Df)
+        t.xx = cox * i_det
+        t.xy = coy * i_det
+        t.xz = coz * i_det
+        t.yx = (self.zx * self.yz - self.yx * self.zz) * i_det
+        t.yy = (self.xx * self.zz - self.zx * self.xz) * i_det
+        t.yz = (self.yx * self.xz - self.xx * self.yz) * i_det
+        t.zx = (self.yx * self.zy - self.zx * self.yy) * i_det
+        t.zy = (self.zx * self.xy - self.xx * self.zy) * i_det
+        t.zz = (self.xx * self.yy - self.yx * self.xy) * i_det
+        t.ox = -t.tdotx(self.ox, self.oy, self.oz)
+        t.oy = -t.tdoty(self.ox, self.oy, self.oz)
+        t.oz = -t.tdotz(self.ox, self.oy, self.oz)
+        return t
+
+    cdef inline void _translate_ip(self, Vec3f translation) noexcept:
+        self.ox += translation.x
+        self.oy += translation.y
+        self.oz += translation.z
+
+    def translate_ip(self, Vec3f translation, /) -> Transform3Df:
+        #<RETURN_SELF>
+        """Apply translation to this transform inplace."""
+        self._translate_ip(translation)
+        return self
+
+    def translated(self, Vec3f translation, /) -> Transform3Df:
+        """Apply translation to a copy of this transform."""
+        cdef Transform3Df t = self.copy()
+        t.translate_ip(translation)
+        return t
+
+    def translate_into(self, Vec3f translation, Transform3Df out, /) -> Transform3Df:
+        """Apply translation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._translate_ip(translation)
+        return out
+
+    cdef inline void _rotate_ip(self, Vec3f axis, float angle):
+        self._transform_ip(Transform3Df.rotating(axis, angle))
+
+    def rotate_ip(self, Vec3f axis, float angle, /) -> Transform3Df:
+        #<RETURN_SELF>
+        """Apply rotation to this transform inplace."""
+        self._rotate_ip(axis, angle)
+        return self
+
+    def rotated(self, Vec3f axis, float angle, /) -> Transform3Df:
+        """Apply rotation to a copy of this transform."""
+        cdef Transform3Df t = self.copy()
+        t.rotate_ip(axis, angle)
+        return t
+
+    def rotate_into(self, Vec3f axis, float angle, Transform3Df out, /) -> Transform3Df:
+        """Apply rotation to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._rotate_ip(axis, angle)
+        return out
+
+    cdef inline void _scale_ip(self, Vec3f scale) noexcept:
+        self.xx *= scale.x
+        self.yx *= scale.x
+        self.zx *= scale.x
+        self.xy *= scale.y
+        self.yy *= scale.y
+        self.zy *= scale.y
+        self.xz *= scale.z
+        self.yz *= scale.z
+        self.zz *= scale.z
+
+    def scale_ip(self, Vec3f scale, /) -> Transform3Df:
+        #<RETURN_SELF>
+        """Apply scaling to this transform inplace."""
+        self._scale_ip(scale)
+        return self
+
+    def scaled(self, Vec3f scale, /) -> Transform3Df:
+        """Apply scaling to a copy of this transform."""
+        cdef Transform3Df t = self.copy()
+        t.scale_ip(scale)
+        return t
+
+    def scale_into(self, Vec3f scale, Transform3Df out, /) -> Transform3Df:
+        """Apply scaling to a copy of this transform written into `out` (which can be `self`), and return `out`."""
+        self._copy_to(out)
+        out._scale_ip(scale)
+        return out
+
+cdef object _Transform3Df_vectorcall(PyObject* cls, PyObject** args, size_t nargsf, PyObject* kwnames):
+    cdef Py_ssize_t nargs = PyVectorcall_NARGS(nargsf)
+    if kwnames != NULL and len(<tuple> kwnames) != 0:
+        raise TypeError("Transform3Df() takes no keyword arguments")
+    if nargs > 12:
+        raise TypeError(f"Transform3Df() takes from 0 to 12 positional arguments but {nargs} were given")
+    cdef Transform3Df self = Transform3Df.__new__(Transform3Df)
+    self.___init___dispatch(<object> args[0] if nargs > 0 else None, <object> args[1] if nargs > 1 else None, <object> args[2] if nargs > 2 else None, <object> args[3] if nargs > 3 else None, <object> args[4] if nargs > 4 else None, <object> args[5] if nargs > 5 else None, <object> args[6] if nargs > 6 else None, <object> args[7] if nargs > 7 else None, <object> args[8] if nargs > 8 else None, <object> args[9] if nargs > 9 else None, <object> args[10] if nargs > 10 else None, <object> args[11] if nargs > 11 else None)
+    return self
+
+(<PyVectorcallTypeObject*> Transform3Df).tp_vectorcall = <vectorcallfunc> _Transform3Df_vectorcall
+
+
+########## transform_array_class.pyx ##########
+cdef inline void transform2d_compose(const py_float* a, const py_float* b, py_float* out) noexcept nogil:
+    # out = a @ b, `out` may alias `a` or `b`
+    cdef py_float[6] r
+    cdef int c, j, k
+    for c in range(3):
+        for k in range(2):
+            r[c * 2 + k] = a[2 * 2 + k] if c == 2 else 0.0
+            for j in range(2):
+                r[c * 2 + k] += b[c * 2 + j] * a[j * 2 + k]
+    memcpy(out, r, 6 * sizeof(py_float))
+
+cdef inline py_float transform2d_determinant(const py_float* t) noexcept nogil:
+    return t[0] * t[3] - t[1] * t[2]
+
+cdef inline void transform2d_invert(const py_float* t, py_float* out) noexcept nogil:
+    # Same as `Transform2D.__invert__()`, `out` may alias `t`
+    cdef py_float[6] r
+    cdef py_float i_det = 1.0 / transform2d_determinant(t)
+    r[0] = t[3] * +i_det
+    r[1] = t[1] * -i_det
+    r[2] = t[2] * -i_det
+    r[3] = t[0] * +i_det
+    r[4] = -(t[4] * r[0] + t[5] * r[2])
+    r[5] = -(t[4] * r[1] + t[5] * r[3])
+    memcpy(out, r, 6 * sizeof(py_float))
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Transform2DArray:
+    """Contiguous array of `Transform2D`s."""
+
+    # The buffer of the transforms if they're borrowed by `from_buffer()`
+
+
+    def __cinit__(self):
+        self.data = NULL
+        self.size = 0
+        self.is_view = False
+
+    def __dealloc__(self):
+        if self.is_view:
+            PyBuffer_Release(&self.view)
+        else:
+            PyMem_Free(self.data)
+
+    cdef inline int _alloc(self, Py_ssize_t size) except -1:
+        if size < 0:
+            raise ValueError(f"Negative Transform2DArray size: {size}")
+        if size > PY_SSIZE_T_MAX // (6 * sizeof(py_float)):
+            raise MemoryError()
+        self.data = <py_float*> PyMem_Malloc(size * 6 * sizeof(py_float))
+        if self.data == NULL:
+            raise MemoryError()
+        self._set_size(size)
+        return 0
+
+    cdef inline void _set_size(self, Py_ssize_t size) noexcept:
+        self.size = size
+        self.shape[0] = size
+        self.shape[1] = 3
+        self.shape[2] = 2
+        self.strides[0] = 6 * sizeof(py_float)
+        self.strides[1] = 2 * sizeof(py_float)
+        self.strides[2] = sizeof(py_float)
+
+    cdef inline int _check_size(self, Py_ssize_t size) except -1:
+        if size != self.size:
+            raise ValueError(f"Transform2DArray size mismatch: {self.size} and {size}")
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Transform2DArray index out of range: {index}")
+        return index
+
+    cdef inline Transform2D _get(self, Py_ssize_t index):
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        memcpy(&t.xx, self.data + index * 6, 6 * sizeof(py_float))
+        return t
+
+    cdef inline void _set(self, Py_ssize_t index, Transform2D t) noexcept:
+        memcpy(self.data + index * 6, &t.xx, 6 * sizeof(py_float))
+
+    cdef inline Transform2DArray _new(self):
+        cdef Transform2DArray arr = Transform2DArray.__new__(Transform2DArray)
+        arr._alloc(self.size)
+        return arr
+
+    cdef inline Transform2DArray _copy(self):
+        cdef Transform2DArray arr = self._new()
+        memcpy(arr.data, self.data, self.size * 6 * sizeof(py_float))
+        return arr
+
+
+    cdef inline void ___init___0(self):
+        """Create an empty array."""
+        self._alloc(0)
+
+    cdef inline void ___init___1(self, py_int size):
+        """Create an array of `size` identity transforms."""
+        self._alloc(size)
+        cdef Transform2D identity = Transform2D()
+        cdef Py_ssize_t i
+        for i in range(size):
+            self._set(i, identity)
+
+    cdef inline void ___init___2(self, Transform2DArray other):
+        """Create a copy."""
+        self._alloc(other.size)
+        memcpy(self.data, other.data, other.size * 6 * sizeof(py_float))
+
+    cdef inline void ___init___3(self, object transforms):
+        """Create an array from an iterable of `Transform2D`s."""
+        transforms = tuple(transforms)
+        self._alloc(len(transforms))
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            self._set(i, <Transform2D?> transforms[i])
+
+    def __init__(self, object p0=None, /) -> None:
+        if PyLong_CheckExact(p0):
+            self.___init___1(PyLong_AsLongLong(p0))
+            return
+        elif type(p0) is Transform2DArray:
+            self.___init___2(<Transform2DArray> p0)
+            return
+        elif p0 is None:
+            self.___init___0()
+            return
+        if PyLong_Check(p0):
+            self.___init___1(PyLong_AsLongLong(p0))
+            return
+        elif isinstance(p0, Transform2DArray):
+            self.___init___2(<Transform2DArray> p0)
+            return
+        elif p0 is None:
+            self.___init___0()
+            return
+        elif isinstance(p0, object):
+            self.___init___3(<object> p0)
+            return
+        else:
+            raise TypeError(f"The 2th parameter expected int | Transform2DArray | object | None, got {p0}")
+
+
+    def __repr__(self) -> str:
+        return f"Transform2DArray({self.size} transforms)"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform2DArray.is_close()`
+        """
+        if not isinstance(other, Transform2DArray):
+            return False
+        cdef Transform2DArray arr = <Transform2DArray> other
+        if arr.size != self.size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self.size * 6):
+            if self.data[i] != arr.data[i]:
+                return False
+        return True
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform2DArray.is_close()`
+        """
+        return not self == other
+
+    def is_close(self, Transform2DArray other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if all the transforms of the two arrays are close enough.
+
+        See Also: `math.is_close()`
+        """
+        if other.size != self.size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self.size * 6):
+            if not is_close(self.data[i], other.data[i], rel_tol, abs_tol):
+                return False
+        return True
+
+    def __bool__(self) -> bool:
+        """If the array is not empty."""
+        return self.size != 0
+
+    def __len__(self) -> int:
+        """The number of transforms in this array."""
+        return self.size
+
+    def __getitem__(self, object key) -> Transform2D | Transform2DArray:
+        """Get a copy of the n-th transform, or a copy of a slice of this array."""
+        if not isinstance(key, slice):
+            return self._get(self._index(key))
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        cdef Transform2DArray arr = Transform2DArray.__new__(Transform2DArray)
+        arr._alloc(len(range(start, stop, step)))
+        for i in range(arr.size):
+            memcpy(arr.data + i * 6, self.data + (start + i * step) * 6, 6 * sizeof(py_float))
+        return arr
+
+    def __setitem__(self, Py_ssize_t key, Transform2D value) -> None:
+        """Set the n-th transform of this array."""
+        self._set(self._index(key), value)
+
+    def __iter__(self) -> _Transform2DArray_iterator:
+        """Create an iterator that yields copies of all the transforms of this array in sequence."""
+        cdef _Transform2DArray_iterator iterator = _Transform2DArray_iterator.__new__(_Transform2DArray_iterator)
+        iterator.array = self
+        return iterator
+
+    def tolist(self) -> list:
+        """Convert this array to a list of `Transform2D`s."""
+        return [self._get(i) for i in range(self.size)]
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, self.data, sizeof(py_float), b"g", 3, self.shape, self.strides)
+
+    def to_bytes(self) -> bytes:
+        """Pack the transforms into one block with a small header, the same as `Transform2D.pack_many()`."""
+        cdef bytes block = new_pack_block(self.size, ord("g"), sizeof(py_float), 6)
+        memcpy(pack_block_items(block), self.data, self.size * 6 * sizeof(py_float))
+        return block
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform2DArray:
+        """Create an array from a block written by `Transform2DArray.to_bytes()` or `Transform2D.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t count = open_pack_block(data, &view, ord("g"), sizeof(py_float), 6, &items)
+        cdef Transform2DArray arr = Transform2DArray.__new__(Transform2DArray)
+        try:
+            arr._alloc(count)
+            memcpy(arr.data, items, count * 6 * sizeof(py_float))
+        finally:
+            PyBuffer_Release(&view)
+        return arr
+
+    @staticmethod
+    def from_buffer(object data, /) -> Transform2DArray:
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, 3, 2)), without copying.
+
+        The buffer must be C-contiguous, of 6 native `long double` numbers per transform, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        cdef Transform2DArray arr = Transform2DArray.__new__(Transform2DArray)
+        cdef Py_ssize_t count = open_item_buffer(data, &arr.view, ord("f"), sizeof(py_float), 6)
+        arr.is_view = True
+        arr.data = <py_float*> arr.view.buf
+        arr._set_size(count)
+        return arr
+
+    @property
+    def __array_interface__(self) -> dict:
+        """The transforms as a C-contiguous (len, 3, 2) array of native `long double` numbers, for numpy without copying.
+
+        Each transform is its 3 columns in order: the axes, then the origin.
+        """
+        return array_interface(self.data, ord("f"), sizeof(py_float), 3, self.shape)
+
+    def __dlpack__(self, *, object stream = None, object max_version = None, object dl_device = None, object copy = None) -> object:
+        """Export the transforms as a DLPack tensor, same layout as `__array_interface__`, copied if `copy` is True.
+
+        DLPack has no long double type, so unless it's the same as double they're exported as a copy of doubles,
+        which raises `BufferError` if `copy` is False.
+        """
+        return export_dlpack(self, self.data, ord("f"), sizeof(py_float), 3, self.shape, stream, max_version, dl_device, copy)
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        return dlpack_device()
+
+    def __reduce_ex__(self, protocol) -> tuple:
+        # The elements are pickled as one buffer, which protocol 5 can pass out-of-band without copying
+        if protocol >= 5:
+            from pickle import PickleBuffer
+            return _Transform2DArray_from_raw, (PickleBuffer(self),)
+        return _Transform2DArray_from_raw, (PyBytes_FromStringAndSize(<char*> self.data, self.size * 6 * sizeof(py_float)),)
+
+
+    cdef inline Transform2DArray ___matmul___0(self, Transform2DArray other):
+        """Compose the transforms element-wise, see `Transform2D.__matmul__()`."""
+        self._check_size(other.size)
+        cdef Transform2DArray arr = self._new()
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 6, 6):
+                transform2d_compose(self.data + i, other.data + i, arr.data + i)
+        return arr
+
+    cdef inline Transform2DArray ___matmul___1(self, Transform2D other):
+        """Compose every transform with the same `Transform2D` on the right."""
+        cdef Transform2DArray arr = self._new()
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 6, 6):
+                transform2d_compose(self.data + i, t, arr.data + i)
+        return arr
+
+    def __matmul__(self, object p0, /) -> Transform2DArray:
+        if type(p0) is Transform2DArray:
+            return self.___matmul___0(<Transform2DArray> p0)
+        elif type(p0) is Transform2D:
+            return self.___matmul___1(<Transform2D> p0)
+        if isinstance(p0, Transform2DArray):
+            return self.___matmul___0(<Transform2DArray> p0)
+        elif isinstance(p0, Transform2D):
+            return self.___matmul___1(<Transform2D> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform2DArray | Transform2D, got {p0}")
+
+    cdef inline Transform2DArray _compose_left(self, Transform2D other):
+        # Implementation of `Transform2D @ Transform2DArray`
+        cdef Transform2DArray arr = self._new()
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 6, 6):
+                transform2d_compose(t, self.data + i, arr.data + i)
+        return arr
+
+    cdef inline Transform2DArray ___imatmul___0(self, Transform2DArray other):
+        #<RETURN_SELF>
+        """Transform every transform inplace with the other transform at the same index, see `Transform2D.__imatmul__()`."""
+        self._check_size(other.size)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 6, 6):
+                transform2d_compose(other.data + i, self.data + i, self.data + i)
+        return self
+
+    cdef inline Transform2DArray ___imatmul___1(self, Transform2D other):
+        #<RETURN_SELF>
+        """Transform every transform inplace with the same `Transform2D`, see `Transform2D.__imatmul__()`."""
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 6, 6):
+                transform2d_compose(t, self.data + i, self.data + i)
+        return self
+
+    def __imatmul__(self, object p0, /) -> Transform2DArray:
+        if type(p0) is Transform2DArray:
+            return self.___imatmul___0(<Transform2DArray> p0)
+        elif type(p0) is Transform2D:
+            return self.___imatmul___1(<Transform2D> p0)
+        if isinstance(p0, Transform2DArray):
+            return self.___imatmul___0(<Transform2DArray> p0)
+        elif isinstance(p0, Transform2D):
+            return self.___imatmul___1(<Transform2D> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform2DArray | Transform2D, got {p0}")
+
+    @property
+    def determinant(self) -> array:
+        """Compute the determinants of the matrices."""
+        cdef object result = new_scalar_array("d", self.size)
+        cdef double[::1] out = result
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                out[i] = transform2d_determinant(self.data + i * 6)
+        return result
+
+    def __invert__(self) -> Transform2DArray:
+        """Get the invert transforms.
+
+        See Also: `Transform2D.__invert__()`
+        """
+        cdef Transform2DArray arr = self._new()
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 6, 6):
+                transform2d_invert(self.data + i, arr.data + i)
+        return arr
+
+    cdef inline Transform2DArray _translate_ip_0(self, Vec2 translation):
+        #<RETURN_SELF>
+        """Apply the same translation to all the transforms inplace, see `Transform2D.translate_ip()`."""
+        cdef py_float* o
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            o = self.data + i * 6 + 2 * 2
+            o[0], o[1] = translation.x, translation.y
+        return self
+
+    cdef inline Transform2DArray _translate_ip_1(self, Vec2Array translations):
+        #<RETURN_SELF>
+        """Apply the translation at the same index to each transform inplace, see `Transform2D.translate_ip()`."""
+        self._check_size(translations.size)
+        cdef py_float* o
+        cdef py_float* v
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                o = self.data + i * 6 + 2 * 2
+                v = translations.data + i * 2
+                o[0], o[1] = v[0], v[1]
+        return self
+
+    def translate_ip(self, object p0, /) -> Transform2DArray:
+        if type(p0) is Vec2:
+            return self._translate_ip_0(<Vec2> p0)
+        elif type(p0) is Vec2Array:
+            return self._translate_ip_1(<Vec2Array> p0)
+        if isinstance(p0, Vec2):
+            return self._translate_ip_0(<Vec2> p0)
+        elif isinstance(p0, Vec2Array):
+            return self._translate_ip_1(<Vec2Array> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec2 | Vec2Array, got {p0}")
+
+    def translated(self, object translation, /) -> Transform2DArray:
+        """Apply translation to a copy of this array, see `Transform2DArray.translate_ip()`."""
+        return self._copy().translate_ip(translation)
+
+    def rotate_ip(self, py_float rotation, /) -> Transform2DArray:
+        #<RETURN_SELF>
+        """Apply the same rotation to all the transforms inplace, see `Transform2D.rotate_ip()`."""
+        return self.__imatmul__(Transform2D.rotating(rotation))
+
+    def rotated(self, py_float rotation, /) -> Transform2DArray:
+        """Apply rotation to a copy of this array, see `Transform2D.rotate_ip()`."""
+        return self._copy().rotate_ip(rotation)
+
+    cdef inline void _scale(self, Py_ssize_t index, const py_float* scale) noexcept nogil:
+        cdef py_float* t = self.data + index * 6
+        cdef int c, k
+        for c in range(3):
+            for k in range(2):
+                t[c * 2 + k] *= scale[k]
+
+    cdef inline Transform2DArray _scale_ip_0(self, Vec2 scale):
+        #<RETURN_SELF>
+        """Apply the same scaling to all the transforms inplace, see `Transform2D.scale_ip()`."""
+        cdef py_float[2] s
+        s[0] = scale.x
+        s[1] = scale.y
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self._scale(i, s)
+        return self
+
+    cdef inline Transform2DArray _scale_ip_1(self, Vec2Array scales):
+        #<RETURN_SELF>
+        """Apply the scaling at the same index to each transform inplace, see `Transform2D.scale_ip()`."""
+        self._check_size(scales.size)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self._scale(i, scales.data + i * 2)
+        return self
+
+    def scale_ip(self, object p0, /) -> Transform2DArray:
+        if type(p0) is Vec2:
+            return self._scale_ip_0(<Vec2> p0)
+        elif type(p0) is Vec2Array:
+            return self._scale_ip_1(<Vec2Array> p0)
+        if isinstance(p0, Vec2):
+            return self._scale_ip_0(<Vec2> p0)
+        elif isinstance(p0, Vec2Array):
+            return self._scale_ip_1(<Vec2Array> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec2 | Vec2Array, got {p0}")
+
+    def scaled(self, object scale, /) -> Transform2DArray:
+        """Apply scaling to a copy of this array, see `Transform2DArray.scale_ip()`."""
+        return self._copy().scale_ip(scale)
+
+
+def _Transform2DArray_from_raw(object data, /) -> Transform2DArray:
+    # Unpickle a Transform2DArray from its raw elements
+    cdef Py_buffer view
+    cdef Py_ssize_t count = open_raw_buffer(data, &view, 6 * sizeof(py_float))
+    cdef Transform2DArray arr = Transform2DArray.__new__(Transform2DArray)
+    try:
+        arr._alloc(count)
+        memcpy(arr.data, view.buf, count * 6 * sizeof(py_float))
+    finally:
+        PyBuffer_Release(&view)
+    return arr
+
+
+@cython.no_gc
+@cython.final
+@cython.freelist(8)
+cdef class _Transform2DArray_iterator:
+    """Internal iterator class for Transform2DArray."""
+
+
+
+    def __next__(self) -> Transform2D:
+        if self.index >= self.array.size:
+            raise StopIteration
+        self.index += 1
+        return self.array._get(self.index - 1)
+
+    def __iter__(self) -> _Transform2DArray_iterator:
+        #<RETURN_SELF>
+        return self
+
+    def __length_hint__(self) -> int:
+        return self.array.size - self.index
+
+cdef inline void transform3d_compose(const py_float* a, const py_float* b, py_float* out) noexcept nogil:
+    # out = a @ b, `out` may alias `a` or `b`
+    cdef py_float[12] r
+    cdef int c, j, k
+    for c in range(4):
+        for k in range(3):
+            r[c * 3 + k] = a[3 * 3 + k] if c == 3 else 0.0
+            for j in range(3):
+                r[c * 3 + k] += b[c * 3 + j] * a[j * 3 + k]
+    memcpy(out, r, 12 * sizeof(py_float))
+
+cdef inline py_float transform3d_determinant(const py_float* t) noexcept nogil:
+    return (t[0] * (t[4] * t[8] - t[5] * t[7]) -
+            t[3] * (t[1] * t[8] - t[2] * t[7]) +
+            t[6] * (t[1] * t[5] - t[4] * t[2]))
+
+cdef inline void transform3d_invert(const py_float* t, py_float* out) noexcept nogil:
+    # Same as `Transform3D.__invert__()`, `out` may alias `t`
+    cdef py_float[12] r
+    cdef py_float i_det = 1.0 / transform3d_determinant(t)
+    r[0] = (t[4] * t[8] - t[5] * t[7]) * i_det
+    r[1] = (t[2] * t[7] - t[1] * t[8]) * i_det
+    r[2] = (t[1] * t[5] - t[4] * t[2]) * i_det
+    r[3] = (t[6] * t[5] - t[3] * t[8]) * i_det
+    r[4] = (t[0] * t[8] - t[6] * t[2]) * i_det
+    r[5] = (t[3] * t[2] - t[0] * t[5]) * i_det
+    r[6] = (t[3] * t[7] - t[6] * t[4]) * i_det
+    r[7] = (t[6] * t[1] - t[0] * t[7]) * i_det
+    r[8] = (t[0] * t[4] - t[3] * t[1]) * i_det
+    r[9] = -(t[9] * r[0] + t[10] * r[3] + t[11] * r[6])
+    r[10] = -(t[9] * r[1] + t[10] * r[4] + t[11] * r[7])
+    r[11] = -(t[9] * r[2] + t[10] * r[5] + t[11] * r[8])
+    memcpy(out, r, 12 * sizeof(py_float))
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Transform3DArray:
+    """Contiguous array of `Transform3D`s."""
+
+    # The buffer of the transforms if they're borrowed by `from_buffer()`
+
+
+    def __cinit__(self):
+        self.data = NULL
+        self.size = 0
+        self.is_view = False
+
+    def __dealloc__(self):
+        if self.is_view:
+            PyBuffer_Release(&self.view)
+        else:
+            PyMem_Free(self.data)
+
+    cdef inline int _alloc(self, Py_ssize_t size) except -1:
+        if size < 0:
+            raise ValueError(f"Negative Transform3DArray size: {size}")
+        if size > PY_SSIZE_T_MAX // (12 * sizeof(py_float)):
+            raise MemoryError()
+        self.data = <py_float*> PyMem_Malloc(size * 12 * sizeof(py_float))
+        if self.data == NULL:
+            raise MemoryError()
+        self._set_size(size)
+        return 0
+
+    cdef inline void _set_size(self, Py_ssize_t size) noexcept:
+        self.size = size
+        self.shape[0] = size
+        self.shape[1] = 4
+        self.shape[2] = 3
+        self.strides[0] = 12 * sizeof(py_float)
+        self.strides[1] = 3 * sizeof(py_float)
+        self.strides[2] = sizeof(py_float)
+
+    cdef inline int _check_size(self, Py_ssize_t size) except -1:
+        if size != self.size:
+            raise ValueError(f"Transform3DArray size mismatch: {self.size} and {size}")
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Transform3DArray index out of range: {index}")
+        return index
+
+    cdef inline Transform3D _get(self, Py_ssize_t index):
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        memcpy(&t.xx, self.data + index * 12, 12 * sizeof(py_float))
+        return t
+
+    cdef inline void _set(self, Py_ssize_t index, Transform3D t) noexcept:
+        memcpy(self.data + index * 12, &t.xx, 12 * sizeof(py_float))
+
+    cdef inline Transform3DArray _new(self):
+        cdef Transform3DArray arr = Transform3DArray.__new__(Transform3DArray)
+        arr._alloc(self.size)
+        return arr
+
+    cdef inline Transform3DArray _copy(self):
+        cdef Transform3DArray arr = self._new()
+        memcpy(arr.data, self.data, self.size * 12 * sizeof(py_float))
+        return arr
+
+
+    cdef inline void ___init___0(self):
+        """Create an empty array."""
+        self._alloc(0)
+
+    cdef inline void ___init___1(self, py_int size):
+        """Create an array of `size` identity transforms."""
+        self._alloc(size)
+        cdef Transform3D identity = Transform3D()
+        cdef Py_ssize_t i
+        for i in range(size):
+            self._set(i, identity)
+
+    cdef inline void ___init___2(self, Transform3DArray other):
+        """Create a copy."""
+        self._alloc(other.size)
+        memcpy(self.data, other.data, other.size * 12 * sizeof(py_float))
+
+    cdef inline void ___init___3(self, object transforms):
+        """Create an array from an iterable of `Transform3D`s."""
+        transforms = tuple(transforms)
+        self._alloc(len(transforms))
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            self._set(i, <Transform3D?> transforms[i])
+
+    def __init__(self, object p0=None, /) -> None:
+        if PyLong_CheckExact(p0):
+            self.___init___1(PyLong_AsLongLong(p0))
+            return
+        elif type(p0) is Transform3DArray:
+            self.___init___2(<Transform3DArray> p0)
+            return
+        elif p0 is None:
+            self.___init___0()
+            return
+        if PyLong_Check(p0):
+            self.___init___1(PyLong_AsLongLong(p0))
+            return
+        elif isinstance(p0, Transform3DArray):
+            self.___init___2(<Transform3DArray> p0)
+            return
+        elif p0 is None:
+            self.___init___0()
+            return
+        elif isinstance(p0, object):
+            self.___init___3(<object> p0)
+            return
+        else:
+            raise TypeError(f"The 2th parameter expected int | Transform3DArray | object | None, got {p0}")
+
+
+    def __repr__(self) -> str:
+        return f"Transform3DArray({self.size} transforms)"
+
+    def __eq__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform3DArray.is_close()`
+        """
+        if not isinstance(other, Transform3DArray):
+            return False
+        cdef Transform3DArray arr = <Transform3DArray> other
+        if arr.size != self.size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self.size * 12):
+            if self.data[i] != arr.data[i]:
+                return False
+        return True
+
+    def __ne__(self, object other) -> bool:
+        """Perform exact comparison.
+
+        See Also: `Transform3DArray.is_close()`
+        """
+        return not self == other
+
+    def is_close(self, Transform3DArray other, /, py_float rel_tol = DEFAULT_RELATIVE_TOLERANCE, py_float abs_tol = DEFAULT_ABSOLUTE_TOLERANCE) -> bool:
+        """Determine if all the transforms of the two arrays are close enough.
+
+        See Also: `math.is_close()`
+        """
+        if other.size != self.size:
+            return False
+        cdef Py_ssize_t i
+        for i in range(self.size * 12):
+            if not is_close(self.data[i], other.data[i], rel_tol, abs_tol):
+                return False
+        return True
+
+    def __bool__(self) -> bool:
+        """If the array is not empty."""
+        return self.size != 0
+
+    def __len__(self) -> int:
+        """The number of transforms in this array."""
+        return self.size
+
+    def __getitem__(self, object key) -> Transform3D | Transform3DArray:
+        """Get a copy of the n-th transform, or a copy of a slice of this array."""
+        if not isinstance(key, slice):
+            return self._get(self._index(key))
+        cdef Py_ssize_t start, stop, step, i
+        start, stop, step = (<slice> key).indices(self.size)
+        cdef Transform3DArray arr = Transform3DArray.__new__(Transform3DArray)
+        arr._alloc(len(range(start, stop, step)))
+        for i in range(arr.size):
+            memcpy(arr.data + i * 12, self.data + (start + i * step) * 12, 12 * sizeof(py_float))
+        return arr
+
+    def __setitem__(self, Py_ssize_t key, Transform3D value) -> None:
+        """Set the n-th transform of this array."""
+        self._set(self._index(key), value)
+
+    def __iter__(self) -> _Transform3DArray_iterator:
+        """Create an iterator that yields copies of all the transforms of this array in sequence."""
+        cdef _Transform3DArray_iterator iterator = _Transform3DArray_iterator.__new__(_Transform3DArray_iterator)
+        iterator.array = self
+        return iterator
+
+    def tolist(self) -> list:
+        """Convert this array to a list of `Transform3D`s."""
+        return [self._get(i) for i in range(self.size)]
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        export_buffer(buffer, flags, self, self.data, sizeof(py_float), b"g", 3, self.shape, self.strides)
+
+    def to_bytes(self) -> bytes:
+        """Pack the transforms into one block with a small header, the same as `Transform3D.pack_many()`."""
+        cdef bytes block = new_pack_block(self.size, ord("g"), sizeof(py_float), 12)
+        memcpy(pack_block_items(block), self.data, self.size * 12 * sizeof(py_float))
+        return block
+
+    @staticmethod
+    def from_bytes(object data, /) -> Transform3DArray:
+        """Create an array from a block written by `Transform3DArray.to_bytes()` or `Transform3D.pack_many()`."""
+        cdef Py_buffer view
+        cdef const char* items
+        cdef Py_ssize_t count = open_pack_block(data, &view, ord("g"), sizeof(py_float), 12, &items)
+        cdef Transform3DArray arr = Transform3DArray.__new__(Transform3DArray)
+        try:
+            arr._alloc(count)
+            memcpy(arr.data, items, count * 12 * sizeof(py_float))
+        finally:
+            PyBuffer_Release(&view)
+        return arr
+
+    @staticmethod
+    def from_buffer(object data, /) -> Transform3DArray:
+        """Create an array sharing the memory of a writable buffer (e.g. a numpy array of shape (n, 4, 3)), without copying.
+
+        The buffer must be C-contiguous, of 12 native `long double` numbers per transform, or untyped bytes.
+        It's kept locked until the array is deleted.
+        """
+        cdef Transform3DArray arr = Transform3DArray.__new__(Transform3DArray)
+        cdef Py_ssize_t count = open_item_buffer(data, &arr.view, ord("f"), sizeof(py_float), 12)
+        arr.is_view = True
+        arr.data = <py_float*> arr.view.buf
+        arr._set_size(count)
+        return arr
+
+    @property
+    def __array_interface__(self) -> dict:
+        """The transforms as a C-contiguous (len, 4, 3) array of native `long double` numbers, for numpy without copying.
+
+        Each transform is its 4 columns in order: the axes, then the origin.
+        """
+        return array_interface(self.data, ord("f"), sizeof(py_float), 3, self.shape)
+
+    def __dlpack__(self, *, object stream = None, object max_version = None, object dl_device = None, object copy = None) -> object:
+        """Export the transforms as a DLPack tensor, same layout as `__array_interface__`, copied if `copy` is True.
+
+        DLPack has no long double type, so unless it's the same as double they're exported as a copy of doubles,
+        which raises `BufferError` if `copy` is False.
+        """
+        return export_dlpack(self, self.data, ord("f"), sizeof(py_float), 3, self.shape, stream, max_version, dl_device, copy)
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        return dlpack_device()
+
+    def __reduce_ex__(self, protocol) -> tuple:
+        # The elements are pickled as one buffer, which protocol 5 can pass out-of-band without copying
+        if protocol >= 5:
+            from pickle import PickleBuffer
+            return _Transform3DArray_from_raw, (PickleBuffer(self),)
+        return _Transform3DArray_from_raw, (PyBytes_FromStringAndSize(<char*> self.data, self.size * 12 * sizeof(py_float)),)
+
+
+    cdef inline Transform3DArray ___matmul___0(self, Transform3DArray other):
+        """Compose the transforms element-wise, see `Transform3D.__matmul__()`."""
+        self._check_size(other.size)
+        cdef Transform3DArray arr = self._new()
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 12, 12):
+                transform3d_compose(self.data + i, other.data + i, arr.data + i)
+        return arr
+
+    cdef inline Transform3DArray ___matmul___1(self, Transform3D other):
+        """Compose every transform with the same `Transform3D` on the right."""
+        cdef Transform3DArray arr = self._new()
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 12, 12):
+                transform3d_compose(self.data + i, t, arr.data + i)
+        return arr
+
+    def __matmul__(self, object p0, /) -> Transform3DArray:
+        if type(p0) is Transform3DArray:
+            return self.___matmul___0(<Transform3DArray> p0)
+        elif type(p0) is Transform3D:
+            return self.___matmul___1(<Transform3D> p0)
+        if isinstance(p0, Transform3DArray):
+            return self.___matmul___0(<Transform3DArray> p0)
+        elif isinstance(p0, Transform3D):
+            return self.___matmul___1(<Transform3D> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform3DArray | Transform3D, got {p0}")
+
+    cdef inline Transform3DArray _compose_left(self, Transform3D other):
+        # Implementation of `Transform3D @ Transform3DArray`
+        cdef Transform3DArray arr = self._new()
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 12, 12):
+                transform3d_compose(t, self.data + i, arr.data + i)
+        return arr
+
+    cdef inline Transform3DArray ___imatmul___0(self, Transform3DArray other):
+        #<RETURN_SELF>
+        """Transform every transform inplace with the other transform at the same index, see `Transform3D.__imatmul__()`."""
+        self._check_size(other.size)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 12, 12):
+                transform3d_compose(other.data + i, self.data + i, self.data + i)
+        return self
+
+    cdef inline Transform3DArray ___imatmul___1(self, Transform3D other):
+        #<RETURN_SELF>
+        """Transform every transform inplace with the same `Transform3D`, see `Transform3D.__imatmul__()`."""
+        cdef py_float* t = &other.xx
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 12, 12):
+                transform3d_compose(t, self.data + i, self.data + i)
+        return self
+
+    def __imatmul__(self, object p0, /) -> Transform3DArray:
+        if type(p0) is Transform3DArray:
+            return self.___imatmul___0(<Transform3DArray> p0)
+        elif type(p0) is Transform3D:
+            return self.___imatmul___1(<Transform3D> p0)
+        if isinstance(p0, Transform3DArray):
+            return self.___imatmul___0(<Transform3DArray> p0)
+        elif isinstance(p0, Transform3D):
+            return self.___imatmul___1(<Transform3D> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Transform3DArray | Transform3D, got {p0}")
+
+    @property
+    def determinant(self) -> array:
+        """Compute the determinants of the matrices."""
+        cdef object result = new_scalar_array("d", self.size)
+        cdef double[::1] out = result
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                out[i] = transform3d_determinant(self.data + i * 12)
+        return result
+
+    def __invert__(self) -> Transform3DArray:
+        """Get the invert transforms.
+
+        See Also: `Transform3D.__invert__()`
+        """
+        cdef Transform3DArray arr = self._new()
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(0, self.size * 12, 12):
+                transform3d_invert(self.data + i, arr.data + i)
+        return arr
+
+    cdef inline Transform3DArray _translate_ip_0(self, Vec3 translation):
+        #<RETURN_SELF>
+        """Apply the same translation to all the transforms inplace, see `Transform3D.translate_ip()`."""
+        cdef py_float* o
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            o = self.data + i * 12 + 3 * 3
+            o[0] += translation.x
+            o[1] += translation.y
+            o[2] += translation.z
+        return self
+
+    cdef inline Transform3DArray _translate_ip_1(self, Vec3Array translations):
+        #<RETURN_SELF>
+        """Apply the translation at the same index to each transform inplace, see `Transform3D.translate_ip()`."""
+        self._check_size(translations.size)
+        cdef py_float* o
+        cdef py_float* v
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                o = self.data + i * 12 + 3 * 3
+                v = translations.data + i * 3
+                o[0] += v[0]
+                o[1] += v[1]
+                o[2] += v[2]
+        return self
+
+    def translate_ip(self, object p0, /) -> Transform3DArray:
+        if type(p0) is Vec3:
+            return self._translate_ip_0(<Vec3> p0)
+        elif type(p0) is Vec3Array:
+            return self._translate_ip_1(<Vec3Array> p0)
+        if isinstance(p0, Vec3):
+            return self._translate_ip_0(<Vec3> p0)
+        elif isinstance(p0, Vec3Array):
+            return self._translate_ip_1(<Vec3Array> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec3 | Vec3Array, got {p0}")
+
+    def translated(self, object translation, /) -> Transform3DArray:
+        """Apply translation to a copy of this array, see `Transform3DArray.translate_ip()`."""
+        return self._copy().translate_ip(translation)
+
+    def rotate_ip(self, Vec3 axis, py_float angle, /) -> Transform3DArray:
+        #<RETURN_SELF>
+        """Apply the same rotation to all the transforms inplace, see `Transform3D.rotate_ip()`."""
+        return self.__imatmul__(Transform3D.rotating(axis, angle))
+
+    def rotated(self, Vec3 axis, py_float angle, /) -> Transform3DArray:
+        """Apply rotation to a copy of this array, see `Transform3D.rotate_ip()`."""
+        return self._copy().rotate_ip(axis, angle)
+
+    cdef inline void _scale(self, Py_ssize_t index, const py_float* scale) noexcept nogil:
+        cdef py_float* t = self.data + index * 12
+        cdef int c, k
+        for c in range(3):  # Transform3D.scale_ip() leaves the origin untouched
+            for k in range(3):
+                t[c * 3 + k] *= scale[k]
+
+    cdef inline Transform3DArray _scale_ip_0(self, Vec3 scale):
+        #<RETURN_SELF>
+        """Apply the same scaling to all the transforms inplace, see `Transform3D.scale_ip()`."""
+        cdef py_float[3] s
+        s[0] = scale.x
+        s[1] = scale.y
+        s[2] = scale.z
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self._scale(i, s)
+        return self
+
+    cdef inline Transform3DArray _scale_ip_1(self, Vec3Array scales):
+        #<RETURN_SELF>
+        """Apply the scaling at the same index to each transform inplace, see `Transform3D.scale_ip()`."""
+        self._check_size(scales.size)
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(self.size):
+                self._scale(i, scales.data + i * 3)
+        return self
+
+    def scale_ip(self, object p0, /) -> Transform3DArray:
+        if type(p0) is Vec3:
+            return self._scale_ip_0(<Vec3> p0)
+        elif type(p0) is Vec3Array:
+            return self._scale_ip_1(<Vec3Array> p0)
+        if isinstance(p0, Vec3):
+            return self._scale_ip_0(<Vec3> p0)
+        elif isinstance(p0, Vec3Array):
+            return self._scale_ip_1(<Vec3Array> p0)
+        else:
+            raise TypeError(f"The 2th parameter expected Vec3 | Vec3Array, got {p0}")
+
+    def scaled(self, object scale, /) -> Transform3DArray:
+        """Apply scaling to a copy of this array, see `Transform3DArray.scale_ip()`."""
+        return self._copy().scale_ip(scale)
+
+
+def _Transform3DArray_from_raw(object data, /) -> Transform3DArray:
+    # Unpickle a Transform3DArray from its raw elements
+    cdef Py_buffer view
+    cdef Py_ssize_t count = open_raw_buffer(data, &view, 12 * sizeof(py_float))
+    cdef Transform3DArray arr = Transform3DArray.__new__(Transform3DArray)
+    try:
+        arr._alloc(count)
+        memcpy(arr.data, view.buf, count * 12 * sizeof(py_float))
+    finally:
+        PyBuffer_Release(&view)
+    return arr
+
+
+@cython.no_gc
+@cython.final
+@cython.freelist(8)
+cdef class _Transform3DArray_iterator:
+    """Internal iterator class for Transform3DArray."""
+
+
+
+    def __next__(self) -> Transform3D:
+        if self.index >= self.array.size:
+            raise StopIteration
+        self.index += 1
+        return self.array._get(self.index - 1)
+
+    def __iter__(self) -> _Transform3DArray_iterator:
+        #<RETURN_SELF>
+        return self
+
+    def __length_hint__(self) -> int:
+        return self.array.size - self.index
+
+
+########## transform_hierarchy_class.pyx ##########
+from libc.stdlib cimport qsort
+
+cdef int _hierarchy2d_compare_indices(const void* a, const void* b) noexcept nogil:
+    cdef Py_ssize_t x = (<const Py_ssize_t*> a)[0], y = (<const Py_ssize_t*> b)[0]
+    return (x > y) - (x < y)
+
+cdef bint _hierarchy2d_grow(void** data, size_t size) noexcept:
+    # Reallocate `data`, leaving it as it is if that fails
+    cdef void* grown = PyMem_Realloc(data[0], size)
+    if grown == NULL:
+        return False
+    data[0] = grown
+    return True
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Transform2DHierarchy:
+    """A hierarchy of `Transform2D`s with incrementally updated world transforms.
+
+    Nodes are referred to by their index, and a node's parent must be added before the node itself,
+    so the nodes are always in topological order.
+    Setting a local transform only marks the node dirty, `update()` then recomputes the world transforms
+    of the dirty nodes and their descendants, leaving the rest of the hierarchy alone.
+    """
+
+    # The children of every node as linked lists, so that only the subtrees of the dirty nodes are visited
+    # The nodes marked dirty since the last update, and the stack of the depth-first update pass
+
+
+    def __cinit__(self):
+        self.local_data = self.world_data = NULL
+        self.parents = self.first_child = self.next_sibling = self.dirty_nodes = self.stack = NULL
+        self.dirty = NULL
+        self.size = self.capacity = self.dirty_count = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.local_data)
+        PyMem_Free(self.world_data)
+        PyMem_Free(self.parents)
+        PyMem_Free(self.first_child)
+        PyMem_Free(self.next_sibling)
+        PyMem_Free(self.dirty)
+        PyMem_Free(self.dirty_nodes)
+        PyMem_Free(self.stack)
+
+    cdef inline int _reserve(self, Py_ssize_t capacity) except -1:
+        if capacity <= self.capacity:
+            return 0
+        capacity = max(capacity, self.capacity * 2)
+        if capacity > PY_SSIZE_T_MAX // (6 * sizeof(py_float)):
+            raise MemoryError()
+        cdef size_t transforms = capacity * 6 * sizeof(py_float)
+        cdef size_t indices = capacity * sizeof(Py_ssize_t)
+        if not (
+            _hierarchy2d_grow(<void**> &self.local_data, transforms)
+            and _hierarchy2d_grow(<void**> &self.world_data, transforms)
+            and _hierarchy2d_grow(<void**> &self.parents, indices)
+            and _hierarchy2d_grow(<void**> &self.first_child, indices)
+            and _hierarchy2d_grow(<void**> &self.next_sibling, indices)
+            and _hierarchy2d_grow(<void**> &self.dirty, capacity * sizeof(unsigned char))
+            and _hierarchy2d_grow(<void**> &self.dirty_nodes, indices)
+            and _hierarchy2d_grow(<void**> &self.stack, indices)
+        ):
+            raise MemoryError()
+        self.capacity = capacity
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Transform2DHierarchy index out of range: {index}")
+        return index
+
+    cdef inline void _mark_dirty(self, Py_ssize_t index) noexcept:
+        # Every node is listed at most once, so the list never outgrows the capacity
+        if not self.dirty[index]:
+            self.dirty[index] = True
+            self.dirty_nodes[self.dirty_count] = index
+            self.dirty_count += 1
+
+    cdef inline void _update(self) noexcept nogil:
+        # Ancestors come before their descendants in index order, so the subtree of a dirty node
+        # already recomputed (and cleared) along with a dirty ancestor is skipped
+        qsort(self.dirty_nodes, self.dirty_count, sizeof(Py_ssize_t), _hierarchy2d_compare_indices)
+        cdef Py_ssize_t i, node, parent, child
+        cdef Py_ssize_t top
+        for i in range(self.dirty_count):
+            if not self.dirty[self.dirty_nodes[i]]:
+                continue
+            self.stack[0] = self.dirty_nodes[i]
+            top = 1
+            while top > 0:
+                top -= 1
+                node = self.stack[top]
+                self.dirty[node] = False
+                parent = self.parents[node]
+                if parent >= 0:
+                    transform2d_compose(self.world_data + parent * 6, self.local_data + node * 6, self.world_data + node * 6)
+                else:
+                    memcpy(self.world_data + node * 6, self.local_data + node * 6, 6 * sizeof(py_float))
+                child = self.first_child[node]
+                while child >= 0:
+                    self.stack[top] = child
+                    top += 1
+                    child = self.next_sibling[child]
+        self.dirty_count = 0
+
+
+    def add(self, Transform2D local, Py_ssize_t parent = -1) -> int:
+        """Add a node with the local transform under `parent` (-1 for a root node), return the index of the new node."""
+        if parent != -1:
+            parent = self._index(parent)
+        self._reserve(self.size + 1)
+        cdef Py_ssize_t index = self.size
+        memcpy(self.local_data + index * 6, &local.xx, 6 * sizeof(py_float))
+        self.parents[index] = parent
+        self.first_child[index] = -1
+        if parent >= 0:
+            self.next_sibling[index] = self.first_child[parent]
+            self.first_child[parent] = index
+        else:
+            self.next_sibling[index] = -1
+        self.dirty[index] = False
+        self.size += 1
+        self._mark_dirty(index)
+        return index
+
+    def __len__(self) -> int:
+        """The number of nodes."""
+        return self.size
+
+    def parent(self, Py_ssize_t index, /) -> int:
+        """The index of the parent of a node, -1 for root nodes."""
+        return self.parents[self._index(index)]
+
+    def local(self, Py_ssize_t index, /) -> Transform2D:
+        """Get a copy of the local transform of a node."""
+        index = self._index(index)
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        memcpy(&t.xx, self.local_data + index * 6, 6 * sizeof(py_float))
+        return t
+
+    def set_local(self, Py_ssize_t index, Transform2D local, /) -> None:
+        """Set the local transform of a node, its world transform and those of its descendants are updated lazily."""
+        index = self._index(index)
+        memcpy(self.local_data + index * 6, &local.xx, 6 * sizeof(py_float))
+        self._mark_dirty(index)
+
+    def world(self, Py_ssize_t index, /) -> Transform2D:
+        """Get a copy of the world transform of a node, updating the hierarchy first if needed."""
+        index = self._index(index)
+        self._update()
+        cdef Transform2D t = Transform2D.__new__(Transform2D)
+        memcpy(&t.xx, self.world_data + index * 6, 6 * sizeof(py_float))
+        return t
+
+    @property
+    def is_dirty(self) -> bool:
+        """If any world transform is out of date."""
+        return self.dirty_count > 0
+
+    def update(self) -> None:
+        """Recompute the world transforms of the dirty nodes and their descendants."""
+        with nogil:
+            self._update()
+
+    @property
+    def locals(self) -> Transform2DArray:
+        """A copy of the local transforms of all the nodes."""
+        cdef Transform2DArray arr = Transform2DArray.__new__(Transform2DArray)
+        arr._alloc(self.size)
+        memcpy(arr.data, self.local_data, self.size * 6 * sizeof(py_float))
+        return arr
+
+    @property
+    def worlds(self) -> Transform2DArray:
+        """A copy of the world transforms of all the nodes, updating the hierarchy first if needed."""
+        self._update()
+        cdef Transform2DArray arr = Transform2DArray.__new__(Transform2DArray)
+        arr._alloc(self.size)
+        memcpy(arr.data, self.world_data, self.size * 6 * sizeof(py_float))
+        return arr
+
+from libc.stdlib cimport qsort
+
+cdef int _hierarchy3d_compare_indices(const void* a, const void* b) noexcept nogil:
+    cdef Py_ssize_t x = (<const Py_ssize_t*> a)[0], y = (<const Py_ssize_t*> b)[0]
+    return (x > y) - (x < y)
+
+cdef bint _hierarchy3d_grow(void** data, size_t size) noexcept:
+    # Reallocate `data`, leaving it as it is if that fails
+    cdef void* grown = PyMem_Realloc(data[0], size)
+    if grown == NULL:
+        return False
+    data[0] = grown
+    return True
+
+
+# noinspection SpellCheckingInspection
+@cython.no_gc
+@cython.final
+cdef class Transform3DHierarchy:
+    """A hierarchy of `Transform3D`s with incrementally updated world transforms.
+
+    Nodes are referred to by their index, and a node's parent must be added before the node itself,
+    so the nodes are always in topological order.
+    Setting a local transform only marks the node dirty, `update()` then recomputes the world transforms
+    of the dirty nodes and their descendants, leaving the rest of the hierarchy alone.
+    """
+
+    # The children of every node as linked lists, so that only the subtrees of the dirty nodes are visited
+    # The nodes marked dirty since the last update, and the stack of the depth-first update pass
+
+
+    def __cinit__(self):
+        self.local_data = self.world_data = NULL
+        self.parents = self.first_child = self.next_sibling = self.dirty_nodes = self.stack = NULL
+        self.dirty = NULL
+        self.size = self.capacity = self.dirty_count = 0
+
+    def __dealloc__(self):
+        PyMem_Free(self.local_data)
+        PyMem_Free(self.world_data)
+        PyMem_Free(self.parents)
+        PyMem_Free(self.first_child)
+        PyMem_Free(self.next_sibling)
+        PyMem_Free(self.dirty)
+        PyMem_Free(self.dirty_nodes)
+        PyMem_Free(self.stack)
+
+    cdef inline int _reserve(self, Py_ssize_t capacity) except -1:
+        if capacity <= self.capacity:
+            return 0
+        capacity = max(capacity, self.capacity * 2)
+        if capacity > PY_SSIZE_T_MAX // (12 * sizeof(py_float)):
+            raise MemoryError()
+        cdef size_t transforms = capacity * 12 * sizeof(py_float)
+        cdef size_t indices = capacity * sizeof(Py_ssize_t)
+        if not (
+            _hierarchy3d_grow(<void**> &self.local_data, transforms)
+            and _hierarchy3d_grow(<void**> &self.world_data, transforms)
+            and _hierarchy3d_grow(<void**> &self.parents, indices)
+            and _hierarchy3d_grow(<void**> &self.first_child, indices)
+            and _hierarchy3d_grow(<void**> &self.next_sibling, indices)
+            and _hierarchy3d_grow(<void**> &self.dirty, capacity * sizeof(unsigned char))
+            and _hierarchy3d_grow(<void**> &self.dirty_nodes, indices)
+            and _hierarchy3d_grow(<void**> &self.stack, indices)
+        ):
+            raise MemoryError()
+        self.capacity = capacity
+        return 0
+
+    cdef inline Py_ssize_t _index(self, Py_ssize_t index) except -1:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"Transform3DHierarchy index out of range: {index}")
+        return index
+
+    cdef inline void _mark_dirty(self, Py_ssize_t index) noexcept:
+        # Every node is listed at most once, so the list never outgrows the capacity
+        if not self.dirty[index]:
+            self.dirty[index] = True
+            self.dirty_nodes[self.dirty_count] = index
+            self.dirty_count += 1
+
+    cdef inline void _update(self) noexcept nogil:
+        # Ancestors come before their descendants in index order, so the subtree of a dirty node
+        # already recomputed (and cleared) along with a dirty ancestor is skipped
+        qsort(self.dirty_nodes, self.dirty_count, sizeof(Py_ssize_t), _hierarchy3d_compare_indices)
+        cdef Py_ssize_t i, node, parent, child
+        cdef Py_ssize_t top
+        for i in range(self.dirty_count):
+            if not self.dirty[self.dirty_nodes[i]]:
+                continue
+            self.stack[0] = self.dirty_nodes[i]
+            top = 1
+            while top > 0:
+                top -= 1
+                node = self.stack[top]
+                self.dirty[node] = False
+                parent = self.parents[node]
+                if parent >= 0:
+                    transform3d_compose(self.world_data + parent * 12, self.local_data + node * 12, self.world_data + node * 12)
+                else:
+                    memcpy(self.world_data + node * 12, self.local_data + node * 12, 12 * sizeof(py_float))
+                child = self.first_child[node]
+                while child >= 0:
+                    self.stack[top] = child
+                    top += 1
+                    child = self.next_sibling[child]
+        self.dirty_count = 0
+
+
+    def add(self, Transform3D local, Py_ssize_t parent = -1) -> int:
+        """Add a node with the local transform under `parent` (-1 for a root node), return the index of the new node."""
+        if parent != -1:
+            parent = self._index(parent)
+        self._reserve(self.size + 1)
+        cdef Py_ssize_t index = self.size
+        memcpy(self.local_data + index * 12, &local.xx, 12 * sizeof(py_float))
+        self.parents[index] = parent
+        self.first_child[index] = -1
+        if parent >= 0:
+            self.next_sibling[index] = self.first_child[parent]
+            self.first_child[parent] = index
+        else:
+            self.next_sibling[index] = -1
+        self.dirty[index] = False
+        self.size += 1
+        self._mark_dirty(index)
+        return index
+
+    def __len__(self) -> int:
+        """The number of nodes."""
+        return self.size
+
+    def parent(self, Py_ssize_t index, /) -> int:
+        """The index of the parent of a node, -1 for root nodes."""
+        return self.parents[self._index(index)]
+
+    def local(self, Py_ssize_t index, /) -> Transform3D:
+        """Get a copy of the local transform of a node."""
+        index = self._index(index)
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        memcpy(&t.xx, self.local_data + index * 12, 12 * sizeof(py_float))
+        return t
+
+    def set_local(self, Py_ssize_t index, Transform3D local, /) -> None:
+        """Set the local transform of a node, its world transform and those of its descendants are updated lazily."""
+        index = self._index(index)
+        memcpy(self.local_data + index * 12, &local.xx, 12 * sizeof(py_float))
+        self._mark_dirty(index)
+
+    def world(self, Py_ssize_t index, /) -> Transform3D:
+        """Get a copy of the world transform of a node, updating the hierarchy first if needed."""
+        index = self._index(index)
+        self._update()
+        cdef Transform3D t = Transform3D.__new__(Transform3D)
+        memcpy(&t.xx, self.world_data + index * 12, 12 * sizeof(py_float))
+        return t
+
+    @property
+    def is_dirty(self) -> bool:
+        """If any world transform is out of date."""
+        return self.dirty_count > 0
+
+    def update(self) -> None:
+        """Recompute the world transforms of the dirty nodes and their descendants."""
+        with nogil:
+            self._update()
+
+    @property
+    def locals(self) -> Transform3DArray:
+        """A copy of the local transforms of all the nodes."""
+        cdef Transform3DArray arr = Transform3DArray.__new__(Transform3DArray)
+        arr._alloc(self.size)
+        memcpy(arr.data, self.local_data, self.size * 12 * sizeof(py_float))
+        return arr
+
+    @property
+    def worlds(self) -> Transform3DArray:
+        """A copy of the world transforms of all the nodes, updating the hierarchy first if needed."""
+        self._update()
+        cdef Transform3DArray arr = Transform3DArray.__new__(Transform3DArray)
+        arr._alloc(self.size)
+        memcpy(arr.data, self.world_data, self.size * 12 * sizeof(py_float))
+        return arr